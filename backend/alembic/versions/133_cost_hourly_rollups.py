@@ -0,0 +1,141 @@
+# Layer: L6 — Platform Substrate
+# Product: system-wide
+# Temporal:
+#   Trigger: migration
+#   Execution: sync
+# Role: Incremental hourly cost rollups maintained on cost_records insert
+# Reference: M27 Cost Snapshots
+
+"""Incremental hourly cost rollups
+
+Revision ID: 133_cost_hourly_rollups
+Revises: 132_monitoring_logs_replay_mode_fields
+Create Date: 2026-10-18
+
+THE PROBLEM:
+  Daily snapshots and baselines re-scan a full day (or week) of raw
+  cost_records per tenant, four times over (tenant, user, feature, model).
+
+THE SOLUTION:
+  cost_hourly_rollups keeps per-(tenant, entity, hour) totals, updated by a
+  statement-level trigger on cost_records as records arrive. Daily
+  snapshots and baselines sum at most 24 rows per entity per day instead
+  of scanning raw records.
+
+DESIGN INVARIANTS:
+  1. cost_records stays append-only and remains the source of truth
+  2. Rollups are additive (ON CONFLICT ... + EXCLUDED), so concurrent and
+     bulk inserts are safe; one trigger call per INSERT statement
+  3. entity_key is '' for the tenant-level row (primary keys cannot be NULL)
+  4. The last 35 days are backfilled so 30-day baselines work immediately
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = "133_cost_hourly_rollups"
+down_revision = "132_monitoring_logs_replay_mode_fields"
+branch_labels = None
+depends_on = None
+
+
+# One GROUPING SETS pass yields tenant, user, feature and model rows.
+# GROUPING(user_id, feature_tag, model): 3 = user, 5 = feature, 6 = model, 7 = tenant
+ROLLUP_SELECT = """
+    SELECT
+        tenant_id,
+        CASE GROUPING(user_id, feature_tag, model)
+            WHEN 3 THEN 'user' WHEN 5 THEN 'feature' WHEN 6 THEN 'model' ELSE 'tenant'
+        END AS entity_type,
+        COALESCE(
+            CASE GROUPING(user_id, feature_tag, model)
+                WHEN 3 THEN user_id WHEN 5 THEN feature_tag WHEN 6 THEN model
+            END,
+            ''
+        ) AS entity_key,
+        date_trunc('hour', created_at, 'UTC') AS hour_start,
+        SUM(cost_cents) AS total_cost_cents,
+        COUNT(*) AS request_count,
+        COALESCE(SUM(input_tokens), 0) AS input_tokens,
+        COALESCE(SUM(output_tokens), 0) AS output_tokens,
+        NOW() AS updated_at
+    FROM {source}
+    {where}
+    GROUP BY tenant_id, date_trunc('hour', created_at, 'UTC'),
+        GROUPING SETS ((), (user_id), (feature_tag), (model))
+    HAVING NOT (GROUPING(user_id) = 0 AND user_id IS NULL)
+       AND NOT (GROUPING(feature_tag) = 0 AND feature_tag IS NULL)
+"""
+
+ROLLUP_COLUMNS = (
+    "tenant_id, entity_type, entity_key, hour_start, "
+    "total_cost_cents, request_count, input_tokens, output_tokens, updated_at"
+)
+
+
+def upgrade() -> None:
+    """Create cost_hourly_rollups, its maintenance trigger, and backfill."""
+
+    op.create_table(
+        "cost_hourly_rollups",
+        sa.Column("tenant_id", sa.String(64), nullable=False),
+        sa.Column("entity_type", sa.String(16), nullable=False),  # 'tenant', 'user', 'feature', 'model'
+        sa.Column("entity_key", sa.String(128), nullable=False),  # '' for tenant-level
+        sa.Column("hour_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("total_cost_cents", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("request_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("input_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("output_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.PrimaryKeyConstraint("tenant_id", "entity_type", "entity_key", "hour_start", name="pk_cost_hourly_rollups"),
+    )
+    # Window scans: all entities of a tenant for a range of hours
+    op.create_index("ix_cost_hourly_rollups_tenant_hour", "cost_hourly_rollups", ["tenant_id", "hour_start"])
+
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION cost_hourly_rollup_apply()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            INSERT INTO cost_hourly_rollups AS r ({ROLLUP_COLUMNS})
+            {ROLLUP_SELECT.format(source="new_rows", where="")}
+            ON CONFLICT (tenant_id, entity_type, entity_key, hour_start) DO UPDATE SET
+                total_cost_cents = r.total_cost_cents + EXCLUDED.total_cost_cents,
+                request_count = r.request_count + EXCLUDED.request_count,
+                input_tokens = r.input_tokens + EXCLUDED.input_tokens,
+                output_tokens = r.output_tokens + EXCLUDED.output_tokens,
+                updated_at = EXCLUDED.updated_at;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER trg_cost_records_hourly_rollup
+        AFTER INSERT ON cost_records
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION cost_hourly_rollup_apply();
+        """
+    )
+
+    # Backfill recent history (baselines look back at most 30 days).
+    # CREATE TRIGGER holds a lock on cost_records until this migration commits,
+    # so no row is counted by both the trigger and the backfill.
+    op.execute(
+        f"""
+        INSERT INTO cost_hourly_rollups ({ROLLUP_COLUMNS})
+        {ROLLUP_SELECT.format(source="cost_records", where="WHERE created_at >= date_trunc('day', NOW()) - INTERVAL '35 days'")}
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop rollup trigger, function and table."""
+    op.execute("DROP TRIGGER IF EXISTS trg_cost_records_hourly_rollup ON cost_records;")
+    op.execute("DROP FUNCTION IF EXISTS cost_hourly_rollup_apply;")
+    op.drop_index("ix_cost_hourly_rollups_tenant_hour", table_name="cost_hourly_rollups")
+    op.drop_table("cost_hourly_rollups")
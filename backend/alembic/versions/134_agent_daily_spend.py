@@ -0,0 +1,94 @@
+# Layer: L6 — Platform Substrate
+# Product: system-wide
+# Temporal:
+#   Trigger: migration
+#   Execution: sync
+# Role: Per-agent daily spend counters for budget enforcement
+# Reference: Phase 5 Budget Protection Layer
+
+"""Per-agent daily spend counters
+
+Revision ID: 134_agent_daily_spend
+Revises: 133_cost_hourly_rollups
+Create Date: 2026-10-18
+
+THE PROBLEM:
+  BudgetTracker.get_status() (every enforce_budget/check_budget call) ran
+  SELECT SUM(cost_cents) over the agent's llm_costs rows for today, so each
+  check scanned every cost row the agent had written that day.
+
+THE SOLUTION:
+  agent_daily_spend keeps one row per (agent, UTC day). BudgetTracker adds
+  each cost to it in the same statement as the llm_costs insert, reads it
+  with the agent row in one query, and checks it in the same UPDATE that
+  deducts. A periodic reconciler rewrites drifted counters from
+  SUM(llm_costs).
+
+DESIGN INVARIANTS:
+  1. llm_costs remains the source of truth; counters are derived
+  2. Counter updates are additive (ON CONFLICT ... + EXCLUDED)
+  3. tenant_id is denormalised from agents for per-tenant daily totals
+  4. llm_costs is created if missing (BudgetTracker previously only wrote
+     to it when it happened to exist); downgrade leaves it in place
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = "134_agent_daily_spend"
+down_revision = "133_cost_hourly_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create agent_daily_spend (and llm_costs if missing), backfill recent days."""
+
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_costs (
+            id VARCHAR(64) PRIMARY KEY,
+            run_id VARCHAR(64),
+            agent_id VARCHAR(64) NOT NULL,
+            provider VARCHAR(64),
+            model VARCHAR(128),
+            input_tokens INTEGER NOT NULL DEFAULT 0,
+            output_tokens INTEGER NOT NULL DEFAULT 0,
+            cost_cents INTEGER NOT NULL,
+            created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+        );
+        CREATE INDEX IF NOT EXISTS ix_llm_costs_created_at ON llm_costs (created_at);
+        """
+    )
+
+    op.create_table(
+        "agent_daily_spend",
+        sa.Column("agent_id", sa.String(64), nullable=False),
+        sa.Column("spend_date", sa.Date(), nullable=False),  # UTC day
+        sa.Column("tenant_id", sa.String(64), nullable=True),
+        sa.Column("spent_cents", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.PrimaryKeyConstraint("agent_id", "spend_date", name="pk_agent_daily_spend"),
+    )
+    # Per-tenant daily totals
+    op.create_index("ix_agent_daily_spend_tenant_date", "agent_daily_spend", ["tenant_id", "spend_date"])
+
+    # Backfill today and yesterday; the reconciler keeps them exact afterwards
+    op.execute(
+        """
+        INSERT INTO agent_daily_spend (agent_id, spend_date, tenant_id, spent_cents, updated_at)
+        SELECT c.agent_id, (c.created_at AT TIME ZONE 'UTC')::date, MAX(a.tenant_id), SUM(c.cost_cents), NOW()
+        FROM llm_costs c
+        LEFT JOIN agents a ON a.id = c.agent_id
+        WHERE c.created_at >= date_trunc('day', NOW() AT TIME ZONE 'UTC') AT TIME ZONE 'UTC' - INTERVAL '1 day'
+        GROUP BY c.agent_id, (c.created_at AT TIME ZONE 'UTC')::date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Drop agent_daily_spend (llm_costs is left in place)."""
+    op.drop_index("ix_agent_daily_spend_tenant_date", table_name="agent_daily_spend")
+    op.drop_table("agent_daily_spend")
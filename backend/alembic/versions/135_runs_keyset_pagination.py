@@ -0,0 +1,194 @@
+# Layer: L6 — Platform Substrate
+# Product: ai-console
+# Temporal:
+#   Trigger: migration
+#   Execution: sync
+# Role: Keyset pagination support for activity run listings
+# Reference: ACTIVITY_DOMAIN_V2_MIGRATION_PLAN.md
+
+"""Keyset pagination indexes and created_at on v_runs_o2
+
+Revision ID: 135_runs_keyset_pagination
+Revises: 134_agent_daily_spend
+Create Date: 2026-10-18
+
+THE PROBLEM:
+  Activity listings page v_runs_o2 with LIMIT/OFFSET, so page N reads and
+  discards N * limit rows first, and no index matches their sort keys.
+  started_at (the default sort) is nullable, so it cannot anchor a cursor.
+
+THE SOLUTION:
+  Listings can page by keyset on (created_at, run_id) - created_at is NOT
+  NULL and run_id breaks ties. v_runs_o2 now projects created_at, and
+  composite indexes serve the tenant-wide and per-state (LIVE/COMPLETED)
+  listings as a single index range scan at any depth.
+
+DESIGN INVARIANTS:
+  1. created_at is appended as the last view column (CREATE OR REPLACE
+     VIEW only allows new trailing columns); the view is otherwise the
+     107_v_runs_o2_policy_context definition
+  2. Offset pagination is unchanged; the indexes are purely additive
+"""
+
+from alembic import op
+
+# revision identifiers
+revision = "135_runs_keyset_pagination"
+down_revision = "134_agent_daily_spend"
+branch_labels = None
+depends_on = None
+
+
+# v_runs_o2 as defined by 107_v_runs_o2_policy_context
+V_RUNS_O2_SQL = """
+        CREATE OR REPLACE VIEW v_runs_o2 AS
+        WITH run_limits AS (
+            -- Find the most relevant limit for each run (by scope priority)
+            SELECT DISTINCT ON (r.id)
+                r.id AS run_id,
+                l.id AS policy_id,
+                l.name AS policy_name,
+                l.scope AS policy_scope,
+                l.limit_type,
+                l.max_value AS threshold_value,
+                CASE l.limit_type
+                    WHEN 'COST_USD' THEN 'USD'
+                    WHEN 'COST_CENTS' THEN 'cents'
+                    WHEN 'TOKENS_INPUT' THEN 'tokens'
+                    WHEN 'TOKENS_OUTPUT' THEN 'tokens'
+                    WHEN 'TOKENS_TOTAL' THEN 'tokens'
+                    WHEN 'TIME_MS' THEN 'ms'
+                    WHEN 'REQUESTS_PM' THEN 'requests/min'
+                    WHEN 'REQUESTS_PH' THEN 'requests/hour'
+                    ELSE 'units'
+                END AS threshold_unit,
+                CASE l.scope
+                    WHEN 'GLOBAL' THEN 'SYSTEM_DEFAULT'
+                    ELSE 'TENANT_OVERRIDE'
+                END AS threshold_source,
+                -- Determine risk_type for panel grouping
+                CASE
+                    WHEN l.limit_type LIKE 'COST%' THEN 'COST'
+                    WHEN l.limit_type LIKE 'TOKEN%' THEN 'TOKENS'
+                    WHEN l.limit_type LIKE 'TIME%' THEN 'TIME'
+                    WHEN l.limit_type LIKE 'REQUEST%' THEN 'RATE'
+                    ELSE 'OTHER'
+                END AS risk_type
+            FROM runs r
+            LEFT JOIN limits l ON (
+                l.tenant_id = r.tenant_id
+                AND l.status = 'ACTIVE'
+                AND l.limit_category = 'THRESHOLD'
+            )
+            ORDER BY r.id,
+                CASE l.scope
+                    WHEN 'TENANT' THEN 1
+                    WHEN 'PROJECT' THEN 2
+                    WHEN 'AGENT' THEN 3
+                    WHEN 'PROVIDER' THEN 4
+                    WHEN 'GLOBAL' THEN 5
+                    ELSE 6
+                END
+        ),
+        run_evaluations AS (
+            -- Evaluate runs against their limits
+            SELECT
+                r.id AS run_id,
+                rl.policy_id,
+                rl.policy_name,
+                rl.policy_scope,
+                rl.limit_type,
+                rl.threshold_value,
+                rl.threshold_unit,
+                rl.threshold_source,
+                rl.risk_type,
+                -- Determine actual value based on limit type
+                CASE
+                    WHEN rl.limit_type LIKE 'COST%' THEN r.estimated_cost_usd
+                    WHEN rl.limit_type LIKE 'TOKEN%' THEN (COALESCE(r.input_tokens, 0) + COALESCE(r.output_tokens, 0))::numeric
+                    WHEN rl.limit_type LIKE 'TIME%' THEN r.duration_ms::numeric
+                    ELSE NULL
+                END AS actual_value,
+                -- Check for existing breach
+                lb.breach_type AS breach_type
+            FROM runs r
+            LEFT JOIN run_limits rl ON r.id = rl.run_id
+            LEFT JOIN limit_breaches lb ON r.id = lb.run_id AND rl.policy_id = lb.limit_id
+        )
+        SELECT
+            r.id AS run_id,
+            r.tenant_id,
+            r.project_id,
+            r.is_synthetic,
+            r.source,
+            r.provider_type,
+            r.state,
+            r.status,
+            r.started_at,
+            r.last_seen_at,
+            r.completed_at,
+            r.duration_ms,
+            r.risk_level,
+            r.latency_bucket,
+            r.evidence_health,
+            r.integrity_status,
+            r.incident_count,
+            r.policy_draft_count,
+            r.policy_violation,
+            r.input_tokens,
+            r.output_tokens,
+            r.estimated_cost_usd,
+            r.expected_latency_ms,
+            r.synthetic_scenario_id,
+            -- Policy context fields (advisory)
+            COALESCE(re.policy_id, 'SYSTEM_DEFAULT') AS policy_id,
+            COALESCE(re.policy_name, 'Default Safety Thresholds') AS policy_name,
+            COALESCE(re.policy_scope, 'GLOBAL') AS policy_scope,
+            re.limit_type,
+            re.threshold_value,
+            re.threshold_unit,
+            COALESCE(re.threshold_source, 'SYSTEM_DEFAULT') AS threshold_source,
+            re.risk_type,
+            re.actual_value,
+            -- Evaluation outcome (computed)
+            CASE
+                WHEN re.breach_type IS NOT NULL THEN
+                    CASE re.breach_type
+                        WHEN 'OVERRIDDEN' THEN 'OVERRIDDEN'
+                        ELSE 'BREACH'
+                    END
+                WHEN re.threshold_value IS NULL THEN 'ADVISORY'
+                WHEN re.actual_value IS NULL THEN 'ADVISORY'
+                WHEN re.actual_value >= re.threshold_value THEN 'BREACH'
+                WHEN re.actual_value >= re.threshold_value * 0.8 THEN 'NEAR_THRESHOLD'
+                ELSE 'OK'
+            END AS evaluation_outcome,
+            -- Proximity percentage for NEAR_THRESHOLD panels
+            CASE
+                WHEN re.threshold_value IS NOT NULL AND re.threshold_value > 0 AND re.actual_value IS NOT NULL
+                THEN ROUND((re.actual_value / re.threshold_value * 100)::numeric, 1)
+                ELSE NULL
+            END AS proximity_pct{extra_columns}
+        FROM runs r
+        LEFT JOIN run_evaluations re ON r.id = re.run_id
+"""
+
+
+def upgrade() -> None:
+    """Project created_at through v_runs_o2 and add keyset indexes on runs."""
+    op.execute(V_RUNS_O2_SQL.format(extra_columns=",\n            r.created_at"))
+
+    # Tenant-wide listings (/activity/runs, signals, threshold signals)
+    op.create_index("idx_runs_tenant_created_id", "runs", ["tenant_id", "created_at", "id"])
+    # Topic listings (/activity/live, /activity/completed)
+    op.create_index("idx_runs_tenant_state_created_id", "runs", ["tenant_id", "state", "created_at", "id"])
+
+
+def downgrade() -> None:
+    """Drop the keyset indexes and restore v_runs_o2 without created_at."""
+    op.drop_index("idx_runs_tenant_state_created_id", table_name="runs")
+    op.drop_index("idx_runs_tenant_created_id", table_name="runs")
+
+    # CREATE OR REPLACE VIEW cannot drop a column
+    op.execute("DROP VIEW IF EXISTS v_runs_o2")
+    op.execute(V_RUNS_O2_SQL.format(extra_columns=""))
@@ -0,0 +1,168 @@
+# Layer: L6 — Platform Substrate
+# Product: ai-console
+# Temporal:
+#   Trigger: migration
+#   Execution: sync
+# Role: Per-tenant daily run-count buckets for activity summaries, maintained on runs writes
+# Reference: PIN-470, Activity Domain
+
+"""Run summary buckets for activity summaries
+
+Revision ID: 136_run_summary_buckets
+Revises: 135_runs_keyset_pagination
+Create Date: 2026-10-18
+
+THE PROBLEM:
+  The activity status summary, metrics and dimension breakdowns ran
+  COUNT(*) FILTER (...) over every run of the tenant in v_runs_o2 on each
+  dashboard refresh, so their latency grew with the tenant's run history.
+
+THE SOLUTION:
+  run_summary_buckets keeps run counts per (tenant, UTC day of created_at,
+  project, state, status, risk_level, latency_bucket, evidence_health,
+  integrity_status, source, provider_type). Statement-level triggers on
+  runs add new rows, subtract deleted rows, and move updated rows between
+  buckets. Summaries sum the tenant's buckets instead of scanning runs;
+  a periodic reconciler compares recent buckets with the live aggregate
+  and rewrites drifted ones.
+
+DESIGN INVARIANTS:
+  1. runs remains the source of truth; buckets are derived
+  2. Bucket updates are additive (ON CONFLICT ... + EXCLUDED) and net out
+     per statement, so heartbeat updates that touch no bucket column write
+     nothing; rows are upserted in key order to avoid deadlocks
+  3. project_id is '' for runs without a project (primary keys cannot be
+     NULL); runs without a tenant are not bucketed
+  4. Buckets may reach run_count = 0; readers ignore them
+  5. Full history is backfilled (summaries are all-time)
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers
+revision = "136_run_summary_buckets"
+down_revision = "135_runs_keyset_pagination"
+branch_labels = None
+depends_on = None
+
+
+DIMENSIONS = (
+    "project_id",
+    "state",
+    "status",
+    "risk_level",
+    "latency_bucket",
+    "evidence_health",
+    "integrity_status",
+    "source",
+    "provider_type",
+)
+
+BUCKET_KEY = "tenant_id, bucket_date, " + ", ".join(DIMENSIONS)
+
+# Bucket key of a runs row
+BUCKET_KEY_SELECT = (
+    "tenant_id, (created_at AT TIME ZONE 'UTC')::date AS bucket_date, "
+    "COALESCE(project_id, '') AS project_id, " + ", ".join(DIMENSIONS[1:])
+)
+
+# Net per-bucket change of one statement; {deltas} yields (key..., delta)
+APPLY_SQL = f"""
+            INSERT INTO run_summary_buckets AS b ({BUCKET_KEY}, run_count, updated_at)
+            SELECT {BUCKET_KEY}, SUM(delta), NOW()
+            FROM ({{deltas}}) d
+            GROUP BY {BUCKET_KEY}
+            HAVING SUM(delta) <> 0
+            ORDER BY {BUCKET_KEY}
+            ON CONFLICT ({BUCKET_KEY}) DO UPDATE SET
+                run_count = b.run_count + EXCLUDED.run_count,
+                updated_at = EXCLUDED.updated_at;"""
+
+ADDED = f"SELECT {BUCKET_KEY_SELECT}, 1 AS delta FROM new_rows WHERE tenant_id IS NOT NULL"
+REMOVED = f"SELECT {BUCKET_KEY_SELECT}, -1 AS delta FROM old_rows WHERE tenant_id IS NOT NULL"
+
+APPLY_FUNCTION_SQL = f"""
+        CREATE OR REPLACE FUNCTION run_summary_buckets_apply()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+{APPLY_SQL.format(deltas=ADDED)}
+            ELSIF TG_OP = 'DELETE' THEN
+{APPLY_SQL.format(deltas=REMOVED)}
+            ELSE
+{APPLY_SQL.format(deltas=ADDED + " UNION ALL " + REMOVED)}
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+"""
+
+# Transition tables allow one event per trigger
+TRIGGERS_SQL = """
+        CREATE TRIGGER trg_runs_summary_insert
+        AFTER INSERT ON runs
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION run_summary_buckets_apply();
+
+        CREATE TRIGGER trg_runs_summary_update
+        AFTER UPDATE ON runs
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION run_summary_buckets_apply();
+
+        CREATE TRIGGER trg_runs_summary_delete
+        AFTER DELETE ON runs
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT
+        EXECUTE FUNCTION run_summary_buckets_apply();
+"""
+
+BACKFILL_SQL = f"""
+        INSERT INTO run_summary_buckets ({BUCKET_KEY}, run_count, updated_at)
+        SELECT {BUCKET_KEY}, COUNT(*), NOW()
+        FROM (SELECT {BUCKET_KEY_SELECT} FROM runs WHERE tenant_id IS NOT NULL) r
+        GROUP BY {BUCKET_KEY}
+"""
+
+
+def upgrade() -> None:
+    """Create run_summary_buckets, its maintenance triggers, and backfill."""
+
+    op.create_table(
+        "run_summary_buckets",
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("bucket_date", sa.Date(), nullable=False),  # UTC day of runs.created_at
+        sa.Column("project_id", sa.String(36), nullable=False),  # '' when the run has none
+        sa.Column("state", sa.String(20), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("risk_level", sa.String(20), nullable=False),
+        sa.Column("latency_bucket", sa.String(20), nullable=False),
+        sa.Column("evidence_health", sa.String(20), nullable=False),
+        sa.Column("integrity_status", sa.String(20), nullable=False),
+        sa.Column("source", sa.String(20), nullable=False),
+        sa.Column("provider_type", sa.String(30), nullable=False),
+        sa.Column("run_count", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        # Key columns match the widths of their runs columns, so no run fails to bucket.
+        # Leading (tenant_id, bucket_date) serves tenant summaries and day-range reconciles
+        sa.PrimaryKeyConstraint("tenant_id", "bucket_date", *DIMENSIONS, name="pk_run_summary_buckets"),
+    )
+
+    op.execute(APPLY_FUNCTION_SQL)
+    op.execute(TRIGGERS_SQL)
+
+    # CREATE TRIGGER holds a lock on runs until this migration commits,
+    # so no run is counted by both the triggers and the backfill.
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop bucket triggers, function and table."""
+    op.execute("DROP TRIGGER IF EXISTS trg_runs_summary_insert ON runs;")
+    op.execute("DROP TRIGGER IF EXISTS trg_runs_summary_update ON runs;")
+    op.execute("DROP TRIGGER IF EXISTS trg_runs_summary_delete ON runs;")
+    op.execute("DROP FUNCTION IF EXISTS run_summary_buckets_apply;")
+    op.drop_table("run_summary_buckets")
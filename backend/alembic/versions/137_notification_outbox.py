@@ -0,0 +1,81 @@
+# Layer: L6 — Platform Substrate
+# Product: system-wide
+# Temporal:
+#   Trigger: migration
+#   Execution: sync
+# Role: Durable notification outbox drained by the channel delivery worker
+# Reference: GAP-017 (Notify Channels)
+
+"""Notification outbox
+
+Revision ID: 137_notification_outbox
+Revises: 136_run_summary_buckets
+Create Date: 2026-10-19
+
+THE PROBLEM:
+  NotifyChannelService.send delivered to every target channel inline in
+  the request path, one channel after another. A slow webhook delayed
+  every other channel and the caller, and a crash between the caller's
+  commit and delivery lost the notification.
+
+THE SOLUTION:
+  Callers write one notification_outbox row per target channel in their
+  own transaction. A delivery worker claims due rows, coalesces bursts
+  for the same (tenant, channel) into one digest, fans channels out
+  concurrently and reschedules failures with exponential backoff.
+
+DESIGN INVARIANTS:
+  1. A row is claimed by pushing next_attempt_at forward by a lease, so a
+     worker that dies mid-delivery releases its rows when the lease ends
+  2. attempts counts failed deliveries only; deferral for coalescing does
+     not consume retries
+  3. Rows end as 'delivered' or 'dead'; only 'pending' rows are indexed
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers
+revision = "137_notification_outbox"
+down_revision = "136_run_summary_buckets"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Create notification_outbox and its due-row index."""
+
+    op.create_table(
+        "notification_outbox",
+        sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column("tenant_id", sa.String(), nullable=False),
+        sa.Column("channel", sa.String(20), nullable=False),
+        sa.Column("event_type", sa.String(50), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=False, server_default=sa.text("'{}'::jsonb")),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),  # pending, delivered, dead
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("next_attempt_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("NOW()"), nullable=False),
+        sa.Column("delivered_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.CheckConstraint(
+            "status IN ('pending', 'delivered', 'dead')",
+            name="ck_notification_outbox_status",
+        ),
+    )
+
+    # Serves the worker's claim (due pending rows, oldest first) and the depth gauge
+    op.create_index(
+        "ix_notification_outbox_due",
+        "notification_outbox",
+        ["next_attempt_at"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    """Drop notification_outbox."""
+    op.drop_index("ix_notification_outbox_due", table_name="notification_outbox")
+    op.drop_table("notification_outbox")
@@ -0,0 +1,49 @@
+# Layer: L6 — Platform Substrate
+# Product: system-wide
+# Temporal:
+#   Trigger: migration
+#   Execution: sync
+# Role: Carry the resolved channel config on notification_outbox rows
+# Reference: GAP-017 (Notify Channels), 137_notification_outbox
+
+"""Notification outbox channel config
+
+Revision ID: 138_notification_outbox_channel_config
+Revises: 137_notification_outbox
+Create Date: 2026-10-19
+
+THE PROBLEM:
+  Channel configs live in the enqueuing process's NotifyChannelService.
+  A row claimed by another pod, or delivered after a restart, found no
+  config and was dead-lettered as "not configured".
+
+THE SOLUTION:
+  enqueue() stores the delivery settings of the channel config it resolved
+  (endpoint, recipients, retry and timeout settings) on the row. The
+  worker rebuilds the config from the row when its own process has none.
+  NULL means the default UI channel, which needs no config.
+"""
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers
+revision = "138_notification_outbox_channel_config"
+down_revision = "137_notification_outbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Add notification_outbox.channel_config."""
+    op.add_column(
+        "notification_outbox",
+        sa.Column("channel_config", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Drop notification_outbox.channel_config."""
+    op.drop_column("notification_outbox", "channel_config")
@@ -20,13 +20,28 @@ Returns raw facts: key data, validity status, usage counts.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+from sqlalchemy import text
 from sqlmodel import Session, select
 
 from app.db import engine as default_engine
 from app.models.tenant import APIKey
 
+# One statement for a whole usage batch: per-key request counts are added,
+# last_used_at only moves forward (GREATEST ignores NULL)
+RECORD_USAGE_BULK_SQL = """
+    UPDATE api_keys AS k
+    SET total_requests = COALESCE(k.total_requests, 0) + u.requests,
+        last_used_at = GREATEST(k.last_used_at, u.last_used_at)
+    FROM unnest(
+        CAST(:key_hashes AS text[]),
+        CAST(:requests AS integer[]),
+        CAST(:last_used_at AS timestamptz[])
+    ) AS u(key_hash, requests, last_used_at)
+    WHERE k.key_hash = u.key_hash
+"""
+
 
 @dataclass(frozen=True)
 class KeyRow:
@@ -161,6 +176,30 @@ class ApiKeyDriver:
             session.commit()
             return True
 
+    def record_usage_bulk(self, usage: Dict[str, Tuple[int, datetime]]) -> int:
+        """Record aggregated API key usage in one statement.
+
+        Args:
+            usage: key_hash -> (requests, last used at)
+
+        Returns:
+            Number of keys updated
+        """
+        if not usage:
+            return 0
+        key_hashes = list(usage)
+        with Session(self._engine) as session:
+            result = session.execute(
+                text(RECORD_USAGE_BULK_SQL),
+                {
+                    "key_hashes": key_hashes,
+                    "requests": [usage[h][0] for h in key_hashes],
+                    "last_used_at": [usage[h][1] for h in key_hashes],
+                },
+            )
+            session.commit()
+            return result.rowcount
+
     def revoke_key(self, key_id: str, reason: str) -> bool:
         """Revoke an API key.
 
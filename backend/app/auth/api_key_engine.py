@@ -22,6 +22,20 @@ INVARIANTS:
 2. Revoked/expired keys are rejected immediately
 3. Key usage is recorded for audit trail
 4. Scopes are extracted from key permissions
+
+CACHING:
+Validated key records are cached in-process by key hash for at most
+API_KEY_CACHE_TTL_SECONDS (and never past the key's expires_at), so a
+machine request costs no DB round trip on a hit. Revocation bound:
+- the revoking process evicts the key immediately;
+- other processes evict on the API_KEY_REVOKE_CHANNEL Redis message
+  (their whole cache is dropped if the subscription was interrupted);
+- without Redis, a revoked key is accepted for at most the TTL.
+
+USAGE ACCOUNTING:
+last_used_at / total_requests are aggregated in memory per key and
+written in one bulk UPDATE by flush_usage() (every
+API_KEY_USAGE_FLUSH_SECONDS from main.py, and at shutdown).
 """
 
 from __future__ import annotations
@@ -30,15 +44,48 @@ import asyncio
 import hashlib
 import json
 import logging
-from typing import TYPE_CHECKING, Optional
+import os
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple
 
 from app.auth.api_key_driver import ApiKeyDriver, get_api_key_driver
 
+from ..utils.metrics_helpers import get_or_create_counter, get_or_create_histogram
+
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger("nova.auth.api_key_engine")
 
+# Configuration
+API_KEY_CACHE_TTL_SECONDS = float(os.getenv("API_KEY_CACHE_TTL_SECONDS", "5"))  # 0 disables the cache
+API_KEY_CACHE_MAX_ENTRIES = int(os.getenv("API_KEY_CACHE_MAX_ENTRIES", "10000"))
+API_KEY_USAGE_FLUSH_SECONDS = float(os.getenv("API_KEY_USAGE_FLUSH_SECONDS", "10"))
+API_KEY_REVOKE_CHANNEL = "auth:api_key:revoked"
+
+# Metrics - using idempotent registration (PIN-120 PREV-1)
+API_KEY_CACHE_LOOKUPS = get_or_create_counter(
+    "aos_api_key_cache_lookups_total",
+    "API key validations by cache outcome",
+    ["outcome"],  # hit, miss
+)
+
+API_KEY_CACHE_INVALIDATIONS = get_or_create_counter(
+    "aos_api_key_cache_invalidations_total",
+    "API key cache evictions on revocation",
+    ["source"],  # local, remote, resubscribe
+)
+
+API_KEY_USAGE_FLUSH_SECONDS_HIST = get_or_create_histogram(
+    "aos_api_key_usage_flush_seconds",
+    "Duration of the bulk API key usage write",
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0],
+)
+
+# key_hash -> (requests since last flush, last used at)
+UsageBatch = Dict[str, Tuple[int, datetime]]
+
 
 class ApiKeyEngine:
     """L4 engine for API key validation decisions.
@@ -53,6 +100,9 @@ class ApiKeyEngine:
         if key_info:
             # key_info contains: key_id, tenant_id, scopes, rate_limit
             pass
+
+        # After a key is revoked outside this engine
+        await engine.invalidate_key(key_id)
     """
 
     # Default rate limit if not specified per-key
@@ -61,13 +111,35 @@ class ApiKeyEngine:
     # Default scope if no permissions specified
     DEFAULT_SCOPE = ["*"]
 
-    def __init__(self, driver: Optional[ApiKeyDriver] = None):
+    def __init__(
+        self,
+        driver: Optional[ApiKeyDriver] = None,
+        redis_client=None,
+        cache_ttl: float = API_KEY_CACHE_TTL_SECONDS,
+        cache_max_entries: int = API_KEY_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """Initialize engine with driver.
 
         Args:
             driver: ApiKeyDriver instance (lazy-created if not provided)
+            redis_client: Redis client for revocation fan-out (from REDIS_URL if not provided)
+            cache_ttl: Seconds a validated key record is served from cache
+            cache_max_entries: Cached key records kept before the oldest is dropped
+            clock: Monotonic clock for cache expiry
         """
         self._driver = driver
+        self._redis = redis_client
+        self._cache_ttl = cache_ttl
+        self._cache_max_entries = cache_max_entries
+        self._clock = clock
+        # key_hash -> (key info, expires at); key_id -> key_hash, for revocation
+        self._cache: Dict[str, Tuple[dict, float]] = {}
+        self._hash_by_key_id: Dict[str, str] = {}
+        # Bumped on every eviction so lookups already in flight don't repopulate the cache
+        self._generation = 0
+        self._usage: UsageBatch = {}
+        self._listener: Optional[asyncio.Task] = None
 
     def _get_driver(self) -> ApiKeyDriver:
         """Get or create driver."""
@@ -84,11 +156,11 @@ class ApiKeyEngine:
 
         DECISION LOGIC:
         1. Hash the key for lookup
-        2. Fetch key data from driver
+        2. Serve a cached record if fresh, else fetch key data from driver
         3. Check validity (revoked, expired)
         4. Parse scopes from permissions
         5. Apply rate limit defaults
-        6. Record usage
+        6. Record usage (in memory, written by flush_usage)
 
         Args:
             api_key: The full API key string (e.g., "aos_xxxxx")
@@ -111,6 +183,17 @@ class ApiKeyEngine:
         # Hash the key for lookup
         key_hash = hashlib.sha256(api_key.encode()).hexdigest()
 
+        cached = self._cache_get(key_hash)
+        if cached is not None:
+            API_KEY_CACHE_LOOKUPS.labels(outcome="hit").inc()
+            if not cached["revoked"]:
+                self._record_usage(key_hash)
+            return dict(cached)
+        API_KEY_CACHE_LOOKUPS.labels(outcome="miss").inc()
+
+        await self._ensure_listener()
+        generation = self._generation
+
         try:
             # Run sync driver operation in thread pool
             loop = asyncio.get_event_loop()
@@ -123,7 +206,7 @@ class ApiKeyEngine:
 
             # DECISION: Check validity
             if not key_row.is_valid:
-                return {
+                key_info = {
                     "key_id": key_row.id,
                     "key_name": key_row.name,
                     "tenant_id": key_row.tenant_id,
@@ -131,31 +214,191 @@ class ApiKeyEngine:
                     "rate_limit": 0,
                     "revoked": True,
                 }
+            else:
+                # DECISION: Parse scopes
+                scopes = self._parse_scopes(key_row.permissions_json)
 
-            # DECISION: Parse scopes
-            scopes = self._parse_scopes(key_row.permissions_json)
+                # DECISION: Apply rate limit defaults
+                rate_limit = key_row.rate_limit_rpm or self.DEFAULT_RATE_LIMIT_RPM
 
-            # DECISION: Apply rate limit defaults
-            rate_limit = key_row.rate_limit_rpm or self.DEFAULT_RATE_LIMIT_RPM
+                key_info = {
+                    "key_id": key_row.id,
+                    "key_name": key_row.name,
+                    "tenant_id": key_row.tenant_id,
+                    "scopes": scopes,
+                    "rate_limit": rate_limit,
+                    "revoked": False,
+                }
 
-            # Record usage
-            await loop.run_in_executor(
-                None, self._get_driver().record_usage, key_hash
-            )
+                # Record usage (written in bulk by flush_usage)
+                self._record_usage(key_hash)
 
-            return {
-                "key_id": key_row.id,
-                "key_name": key_row.name,
-                "tenant_id": key_row.tenant_id,
-                "scopes": scopes,
-                "rate_limit": rate_limit,
-                "revoked": False,
-            }
+            if generation == self._generation:
+                self._cache_put(key_hash, key_info, key_row.expires_at)
+            return dict(key_info)
 
         except Exception as e:
             logger.error(f"API key lookup failed: {e}")
             return None
 
+    # =========================================================================
+    # VALIDATED KEY CACHE
+    # =========================================================================
+
+    def _cache_get(self, key_hash: str) -> Optional[dict]:
+        entry = self._cache.get(key_hash)
+        if entry is None:
+            return None
+        if entry[1] <= self._clock():
+            self._cache.pop(key_hash, None)
+            return None
+        return entry[0]
+
+    def _cache_put(self, key_hash: str, key_info: dict, key_expires_at: Optional[datetime]) -> None:
+        ttl = self._cache_ttl
+        if ttl <= 0:
+            return
+        if key_expires_at is not None:
+            # Never serve a key from cache past its own expiry
+            now = datetime.now(timezone.utc) if key_expires_at.tzinfo else datetime.utcnow()
+            ttl = min(ttl, (key_expires_at - now).total_seconds())
+            if ttl <= 0:
+                return
+        self._cache.pop(key_hash, None)
+        while len(self._cache) >= self._cache_max_entries:
+            oldest = next(iter(self._cache))
+            self._hash_by_key_id.pop(self._cache.pop(oldest)[0]["key_id"], None)
+        self._cache[key_hash] = (key_info, self._clock() + ttl)
+        self._hash_by_key_id[key_info["key_id"]] = key_hash
+
+    def _evict_local(self, key_id: str) -> None:
+        """Drop a key's cached record and fence off lookups already running."""
+        self._generation += 1
+        key_hash = self._hash_by_key_id.pop(key_id, None)
+        if key_hash is not None:
+            self._cache.pop(key_hash, None)
+
+    def _evict_all(self) -> None:
+        self._generation += 1
+        self._cache.clear()
+        self._hash_by_key_id.clear()
+
+    async def invalidate_key(self, key_id: str) -> None:
+        """Evict a revoked key here and in every process subscribed to API_KEY_REVOKE_CHANNEL.
+
+        Call after the revocation is committed.
+        """
+        self._evict_local(key_id)
+        API_KEY_CACHE_INVALIDATIONS.labels(source="local").inc()
+
+        redis = await self._get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.publish(API_KEY_REVOKE_CHANNEL, key_id)
+        except Exception as e:
+            # Other processes fall back to the cache TTL
+            logger.warning(f"API key revocation publish failed for {key_id}: {e}")
+
+    async def _get_redis(self):
+        """Get Redis client, initializing if needed."""
+        if self._redis is not None:
+            return self._redis
+
+        redis_url = os.getenv("REDIS_URL", "")
+        if not redis_url:
+            return None
+
+        try:
+            import redis.asyncio as aioredis
+
+            self._redis = aioredis.from_url(redis_url, decode_responses=True)
+            return self._redis
+        except ImportError:
+            logger.warning("redis package not installed")
+            return None
+        except Exception as e:
+            logger.error(f"Failed to connect to Redis: {e}")
+            return None
+
+    async def _ensure_listener(self) -> None:
+        if self._listener is None and self._cache_ttl > 0:
+            redis = await self._get_redis()
+            if redis is not None and self._listener is None:
+                self._listener = asyncio.ensure_future(self._listen(redis))
+
+    async def _listen(self, redis) -> None:
+        """Evict keys revoked by any process."""
+        while True:
+            try:
+                pubsub = redis.pubsub()
+                try:
+                    await pubsub.subscribe(API_KEY_REVOKE_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._evict_local(message["data"])
+                            API_KEY_CACHE_INVALIDATIONS.labels(source="remote").inc()
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"API key revocation listener error: {e}")
+            # Revocations may have been missed while unsubscribed
+            self._evict_all()
+            API_KEY_CACHE_INVALIDATIONS.labels(source="resubscribe").inc()
+            await asyncio.sleep(1.0)
+
+    # =========================================================================
+    # USAGE ACCOUNTING
+    # =========================================================================
+
+    def _record_usage(self, key_hash: str) -> None:
+        count, _ = self._usage.get(key_hash, (0, None))
+        self._usage[key_hash] = (count + 1, datetime.now(timezone.utc))
+
+    async def flush_usage(self) -> int:
+        """Write usage aggregated since the last flush in one bulk update.
+
+        On failure the batch is merged back and retried on the next flush.
+
+        Returns:
+            Number of keys updated
+        """
+        if not self._usage:
+            return 0
+        batch, self._usage = self._usage, {}
+
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_event_loop()
+            updated = await loop.run_in_executor(
+                None, self._get_driver().record_usage_bulk, batch
+            )
+        except Exception as e:
+            logger.warning(f"API key usage flush failed ({len(batch)} keys): {e}")
+            for key_hash, (count, last_used_at) in batch.items():
+                pending, pending_last_used = self._usage.get(key_hash, (0, last_used_at))
+                self._usage[key_hash] = (count + pending, max(last_used_at, pending_last_used))
+            return 0
+        finally:
+            API_KEY_USAGE_FLUSH_SECONDS_HIST.observe(time.perf_counter() - start)
+        return updated
+
+    async def run_usage_flusher(self, interval: float = API_KEY_USAGE_FLUSH_SECONDS) -> None:
+        """Flush usage every interval seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush_usage()
+
+    async def close(self) -> None:
+        """Flush pending usage and stop the revocation listener."""
+        await self.flush_usage()
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+
     def _parse_scopes(self, permissions_json: Optional[str]) -> list[str]:
         """Parse scopes from permissions JSON.
 
@@ -201,6 +444,7 @@ class ApiKeyEngine:
 
         if result:
             logger.info(f"API key revoked: {key_id} reason={reason}")
+            await self.invalidate_key(key_id)
 
         return result
 
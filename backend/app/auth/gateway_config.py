@@ -11,8 +11,8 @@
 Gateway Configuration — Shim
 
 Public-path policy is defined in app.hoc.cus.hoc_spine.authority.gateway_policy.
-This module provides startup orchestration (configure_auth_gateway, setup_auth_middleware)
-and re-exports the policy constants.
+This module provides startup orchestration (configure_auth_gateway, setup_auth_middleware,
+setup_request_pipeline) and re-exports the policy constants.
 """
 
 from __future__ import annotations
@@ -90,3 +90,17 @@ def setup_auth_middleware(app: "FastAPI") -> None:
     config = get_gateway_middleware_config()
     app.add_middleware(AuthGatewayMiddleware, **config)
     logger.info("auth_gateway_middleware_added")
+
+
+def setup_request_pipeline(app: "FastAPI") -> None:
+    """Add the auth gateway → onboarding gate → RBAC → tenant pipeline to FastAPI app."""
+    from .request_pipeline import RequestPipelineMiddleware
+
+    gateway_config = None
+    if AUTH_GATEWAY_ENABLED:
+        gateway_config = get_gateway_middleware_config()
+    else:
+        logger.info("auth_gateway_disabled", extra={"reason": "AUTH_GATEWAY_ENABLED=false"})
+
+    app.add_middleware(RequestPipelineMiddleware, gateway_config=gateway_config)
+    logger.info("request_pipeline_middleware_added", extra={"auth_gateway": gateway_config is not None})
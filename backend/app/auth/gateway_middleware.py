@@ -36,12 +36,11 @@ import asyncio
 import logging
 import os
 import re
-from typing import Callable, Optional, Sequence
+from typing import Optional, Sequence
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .contexts import AuthPlane, GatewayContext
 from .gateway import AuthGateway, get_auth_gateway
@@ -76,10 +75,13 @@ def _get_default_public_paths() -> list[str]:
 # PIN-391: Schema-driven public paths (loaded at module import)
 DEFAULT_PUBLIC_PATHS = _get_default_public_paths()
 
+# Strong references to in-flight auth audit writes (the event loop keeps only weak ones)
+_audit_tasks: set[asyncio.Task] = set()
 
-class AuthGatewayMiddleware(BaseHTTPMiddleware):
+
+class AuthGatewayMiddleware:
     """
-    Middleware that enforces authentication via the AuthGateway.
+    Pure ASGI middleware that enforces authentication via the AuthGateway.
 
     Usage in main.py:
         from app.auth.gateway_middleware import AuthGatewayMiddleware
@@ -91,6 +93,9 @@ class AuthGatewayMiddleware(BaseHTTPMiddleware):
 
     After this middleware runs, protected routes can access:
         request.state.auth_context  # HumanAuthContext or MachineCapabilityContext
+
+    check() is the authentication stage on its own, so the request pipeline
+    (app.auth.request_pipeline) can run it without another ASGI layer.
     """
 
     def __init__(
@@ -112,7 +117,7 @@ class AuthGatewayMiddleware(BaseHTTPMiddleware):
         NOTE: If gateway is None, the singleton is looked up at request time.
         This allows configure_auth_gateway() to be called after middleware setup.
         """
-        super().__init__(app)
+        self.app = app
         # Store explicit gateway, or None to use singleton at request time
         self._explicit_gateway = gateway
         self._public_paths = set(public_paths or DEFAULT_PUBLIC_PATHS)
@@ -124,19 +129,29 @@ class AuthGatewayMiddleware(BaseHTTPMiddleware):
             return self._explicit_gateway
         return get_auth_gateway()
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response = await self.check(Request(scope, receive))
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    async def check(self, request: Request) -> Optional[Response]:
         """
-        Process each request through the auth gateway.
+        Process the request through the auth gateway.
+
+        Returns the error response, or None once request.state.auth_context
+        is set (or the path is public) and the request may continue.
         """
         path = request.url.path
 
         # Check if path is public
         if self._is_public_path(path):
-            return await call_next(request)
+            return None
 
         # =================================================================
         # PIN-439: Customer Sandbox Auth (local/test mode only)
@@ -152,7 +167,7 @@ class AuthGatewayMiddleware(BaseHTTPMiddleware):
                 request.state.auth_context = sandbox_principal
                 request.state.is_sandbox = True
                 # Continue to route handler (skip normal auth)
-                return await call_next(request)
+                return None
 
         # Extract auth headers
         authorization = request.headers.get("Authorization")
@@ -206,13 +221,13 @@ class AuthGatewayMiddleware(BaseHTTPMiddleware):
         # PIN-399: Trigger onboarding state transition on first human auth
         await self._maybe_advance_onboarding(result)
 
-        # Emit audit event
-        await self._emit_audit(request, result)
+        # Emit audit event (background: the audit DB write must not hold the response)
+        task = asyncio.create_task(self._emit_audit(request, result))
+        _audit_tasks.add(task)
+        task.add_done_callback(_audit_tasks.discard)
 
         # Continue to route handler
-        response = await call_next(request)
-
-        return response
+        return None
 
     def _is_public_path(self, path: str) -> bool:
         """Check if path is public (no auth required)."""
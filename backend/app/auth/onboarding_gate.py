@@ -18,12 +18,11 @@ This module provides the middleware class that uses that policy.
 from __future__ import annotations
 
 import logging
-from typing import Callable
+from typing import Optional
 
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.hoc.cus.account.L5_schemas.onboarding_state import OnboardingState
 from app.hoc.cus.hoc_spine.authority.onboarding_policy import get_required_state  # noqa: F401
@@ -31,40 +30,48 @@ from app.hoc.cus.hoc_spine.authority.onboarding_policy import get_required_state
 logger = logging.getLogger("nova.auth.onboarding_gate")
 
 
-class OnboardingGateMiddleware(BaseHTTPMiddleware):
+class OnboardingGateMiddleware:
     """
-    Middleware that enforces onboarding state requirements.
+    Pure ASGI middleware that enforces onboarding state requirements.
 
     MUST run AFTER AuthGatewayMiddleware (needs tenant context).
     Policy tables are in hoc_spine/authority/onboarding_policy.py.
     """
 
     def __init__(self, app: ASGIApp):
-        super().__init__(app)
+        self.app = app
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable,
-    ) -> Response:
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response = await self.check(Request(scope, receive))
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    async def check(self, request: Request) -> Optional[Response]:
+        """Return a 403 response if the tenant is behind the endpoint's required state, else None."""
         path = request.url.path
         required_state = get_required_state(path)
 
         if required_state is None:
-            return await call_next(request)
+            return None
 
         auth_context = getattr(request.state, "auth_context", None)
         if auth_context is None:
-            return await call_next(request)
+            return None
 
         tenant_id = getattr(auth_context, "tenant_id", None)
         if tenant_id is None:
-            return await call_next(request)
+            return None
 
         current_state = await self._get_tenant_state(tenant_id)
 
         if current_state >= required_state:
-            return await call_next(request)
+            return None
 
         logger.warning(
             "Onboarding state violation: tenant=%s current=%s required=%s endpoint=%s",
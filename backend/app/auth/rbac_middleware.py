@@ -21,16 +21,18 @@ Usage:
     app.add_middleware(RBACMiddleware)
 """
 
+import asyncio
 import logging
 import os
+import random
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 import jwt
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from ..utils.metrics_helpers import get_or_create_counter, get_or_create_histogram
 from .contexts import (
@@ -86,6 +88,9 @@ from app.hoc.cus.hoc_spine.authority.rbac_policy import (  # noqa: F401
 RBAC_V2_SHADOW_ENABLED = os.getenv("NEW_AUTH_SHADOW_ENABLED", "true").lower() == "true"
 # Backward compat alias
 NEW_AUTH_ENABLED = RBAC_V2_SHADOW_ENABLED
+# Fraction of protected requests compared against RBACv2 (1.0 = every request).
+# The comparison runs in a background task, never on the response path.
+RBAC_V2_SHADOW_SAMPLE_RATE = float(os.getenv("RBAC_V2_SHADOW_SAMPLE_RATE", "1.0"))
 
 logger = logging.getLogger("nova.auth.rbac_middleware")
 
@@ -477,19 +482,34 @@ def enforce(policy: PolicyObject, request: Request) -> Decision:
 # ============================================================================
 
 
-class RBACMiddleware(BaseHTTPMiddleware):
+class RBACMiddleware:
     """
-    Starlette middleware for RBAC enforcement.
+    Pure ASGI middleware for RBAC enforcement.
 
     Evaluates policies for protected paths and returns 403 if denied.
     Controlled by RBAC_ENFORCE environment variable.
+
+    check() is the enforcement stage on its own, so the request pipeline
+    (app.auth.request_pipeline) can run it without another ASGI layer.
     """
 
     def __init__(self, app: ASGIApp, enforce_rbac: Optional[bool] = None):
-        super().__init__(app)
+        self.app = app
         self.enforce_rbac = enforce_rbac if enforce_rbac is not None else RBAC_ENFORCE
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response = await self.check(Request(scope, receive))
+        if response is not None:
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    async def check(self, request: Request) -> Optional[Response]:
+        """Evaluate RBAC for the request. Returns the denial response, or None to continue."""
         start_time = time.time()
 
         # Get policy for this path (needed for shadow audit even if RBAC disabled)
@@ -499,7 +519,7 @@ class RBACMiddleware(BaseHTTPMiddleware):
 
         # No policy = no RBAC required (public path)
         if policy is None:
-            return await call_next(request)
+            return None
 
         # Evaluate policy (always, for shadow audit)
         decision = enforce(policy, request)
@@ -557,107 +577,18 @@ class RBACMiddleware(BaseHTTPMiddleware):
             would_block=would_block,
         )
 
-        # =====================================================================
-        # PIN-271/273: RBACv1 ↔ RBACv2 REFERENCE MODE COMPARISON
-        #
-        # INVARIANTS (enforced here):
-        # - RBACv1 (this block above) is Enforcement Authority
-        # - RBACv2 (this block) is Reference Authority only
-        # - RBACv2 result is NEVER used for enforcement decisions
-        # - All discrepancies are logged + metriced
-        # - v2_more_permissive is a security alert
-        # =====================================================================
-        if RBAC_V2_SHADOW_ENABLED:
-            try:
-                v2_start = time.time()
-
-                # Import here to avoid circular imports
-                from .rbac_integration import (
-                    authorize_with_v2_engine,
-                    build_fallback_actor_from_v1_roles,
-                    compare_decisions,
-                    extract_actor_from_request,
-                    log_decision_comparison,
-                )
-
-                # Extract actor using RBACv2 identity chain
-                actor = await extract_actor_from_request(request)
-
-                # Fallback: use RBACv1 roles if RBACv2 chain didn't extract
-                if actor is None and decision.roles:
-                    actor = build_fallback_actor_from_v1_roles(decision.roles, request)
-                    if actor:
-                        from .authorization import get_authorization_engine
-
-                        engine = get_authorization_engine()
-                        actor = engine.compute_permissions(actor)
-
-                # Get RBACv2 authorization decision (Reference Mode only)
-                v2_result = authorize_with_v2_engine(actor, policy)
-                v2_latency_ms = (time.time() - v2_start) * 1000
-
-                # Compare RBACv1 vs RBACv2 decisions
-                comparison = compare_decisions(decision, v2_result, policy)
-
-                # Log comparison for analysis
-                log_decision_comparison(comparison, path, method)
-
-                # Get actor type for metrics
-                actor_type = actor.actor_type.value if actor else "anonymous"
-
-                # Record comparison metrics
-                RBAC_V1_V2_COMPARISON.labels(
-                    resource=policy.resource,
-                    action=policy.action,
-                    match="yes" if comparison.match else "no",
-                    discrepancy_type=comparison.discrepancy_type or "none",
-                    actor_type=actor_type,
-                ).inc()
-                RBAC_V2_LATENCY.observe(v2_latency_ms / 1000)
-
-                # Log detailed comparison for mismatch debugging
-                # CRITICAL: v2_more_permissive is a security risk
-                if not comparison.match:
-                    log_level = logging.WARNING if comparison.discrepancy_type == "v2_more_permissive" else logging.INFO
-                    logger.log(
-                        log_level,
-                        "rbac_v1_v2_discrepancy",
-                        extra={
-                            "path": path,
-                            "method": method,
-                            "v1_allowed": comparison.v1_allowed,
-                            "v2_allowed": comparison.v2_allowed,
-                            "v1_reason": comparison.v1_reason,
-                            "v2_reason": comparison.v2_reason,
-                            "discrepancy_type": comparison.discrepancy_type,
-                            "actor_id": comparison.actor_id,
-                            "actor_type": actor_type,
-                            "resource": comparison.resource,
-                            "action": comparison.action,
-                            "roles": decision.roles,
-                            # Security flag for v2_more_permissive
-                            "security_alert": comparison.discrepancy_type == "v2_more_permissive",
-                        },
-                    )
-
-            except Exception as e:
-                # RBACv2 errors must not affect RBACv1 enforcement flow
-                logger.warning(
-                    "rbac_v2_shadow_error",
-                    extra={
-                        "path": path,
-                        "method": method,
-                        "error": str(e),
-                    },
-                    exc_info=True,
-                )
+        # PIN-271/273: RBACv2 reference comparison, off the response path
+        if RBAC_V2_SHADOW_ENABLED and random.random() < RBAC_V2_SHADOW_SAMPLE_RATE:
+            task = asyncio.create_task(_compare_with_v2(request, policy, decision))
+            _shadow_tasks.add(task)
+            task.add_done_callback(_shadow_tasks.discard)
 
         # =====================================================================
         # ENFORCEMENT - Only if RBAC_ENFORCE=true
         # =====================================================================
         if not self.enforce_rbac:
             # Shadow mode: log but allow
-            return await call_next(request)
+            return None
 
         # Record enforcement metrics
         RBAC_DECISIONS.labels(
@@ -712,7 +643,112 @@ class RBACMiddleware(BaseHTTPMiddleware):
             },
         )
 
-        return await call_next(request)
+        return None
+
+
+# Strong references to in-flight RBACv2 comparisons (the event loop keeps only weak ones)
+_shadow_tasks: Set[asyncio.Task] = set()
+
+
+async def _compare_with_v2(request: Request, policy: PolicyObject, decision: Decision) -> None:
+    """
+    PIN-271/273: RBACv1 ↔ RBACv2 REFERENCE MODE COMPARISON
+
+    INVARIANTS (enforced here):
+    - RBACv1 (RBACMiddleware.check) is Enforcement Authority
+    - RBACv2 (this function) is Reference Authority only
+    - RBACv2 result is NEVER used for enforcement decisions
+    - All discrepancies are logged + metriced
+    - v2_more_permissive is a security alert
+
+    Runs as a background task: the RBACv1 decision has already been
+    returned, so nothing here can delay or change the response.
+    """
+    path = request.url.path
+    method = request.method
+    try:
+        v2_start = time.time()
+
+        # Import here to avoid circular imports
+        from .rbac_integration import (
+            authorize_with_v2_engine,
+            build_fallback_actor_from_v1_roles,
+            compare_decisions,
+            extract_actor_from_request,
+            log_decision_comparison,
+        )
+
+        # Extract actor using RBACv2 identity chain
+        actor = await extract_actor_from_request(request)
+
+        # Fallback: use RBACv1 roles if RBACv2 chain didn't extract
+        if actor is None and decision.roles:
+            actor = build_fallback_actor_from_v1_roles(decision.roles, request)
+            if actor:
+                from .authorization import get_authorization_engine
+
+                engine = get_authorization_engine()
+                actor = engine.compute_permissions(actor)
+
+        # Get RBACv2 authorization decision (Reference Mode only)
+        v2_result = authorize_with_v2_engine(actor, policy)
+        v2_latency_ms = (time.time() - v2_start) * 1000
+
+        # Compare RBACv1 vs RBACv2 decisions
+        comparison = compare_decisions(decision, v2_result, policy)
+
+        # Log comparison for analysis
+        log_decision_comparison(comparison, path, method)
+
+        # Get actor type for metrics
+        actor_type = actor.actor_type.value if actor else "anonymous"
+
+        # Record comparison metrics
+        RBAC_V1_V2_COMPARISON.labels(
+            resource=policy.resource,
+            action=policy.action,
+            match="yes" if comparison.match else "no",
+            discrepancy_type=comparison.discrepancy_type or "none",
+            actor_type=actor_type,
+        ).inc()
+        RBAC_V2_LATENCY.observe(v2_latency_ms / 1000)
+
+        # Log detailed comparison for mismatch debugging
+        # CRITICAL: v2_more_permissive is a security risk
+        if not comparison.match:
+            log_level = logging.WARNING if comparison.discrepancy_type == "v2_more_permissive" else logging.INFO
+            logger.log(
+                log_level,
+                "rbac_v1_v2_discrepancy",
+                extra={
+                    "path": path,
+                    "method": method,
+                    "v1_allowed": comparison.v1_allowed,
+                    "v2_allowed": comparison.v2_allowed,
+                    "v1_reason": comparison.v1_reason,
+                    "v2_reason": comparison.v2_reason,
+                    "discrepancy_type": comparison.discrepancy_type,
+                    "actor_id": comparison.actor_id,
+                    "actor_type": actor_type,
+                    "resource": comparison.resource,
+                    "action": comparison.action,
+                    "roles": decision.roles,
+                    # Security flag for v2_more_permissive
+                    "security_alert": comparison.discrepancy_type == "v2_more_permissive",
+                },
+            )
+
+    except Exception as e:
+        # RBACv2 errors must not affect RBACv1 enforcement flow
+        logger.warning(
+            "rbac_v2_shadow_error",
+            extra={
+                "path": path,
+                "method": method,
+                "error": str(e),
+            },
+            exc_info=True,
+        )
 
 
 # ============================================================================
@@ -0,0 +1,87 @@
+# Layer: L3 — Boundary Adapter
+# Product: system-wide
+# Temporal:
+#   Trigger: external (HTTP)
+#   Execution: async
+# Role: Single pure-ASGI request pipeline: auth gateway → onboarding gate → RBAC → tenant context
+# Callers: FastAPI app (main.py) via gateway_config.setup_request_pipeline
+# Allowed Imports: L4, L6
+# Forbidden Imports: L1, L2, L5
+# Reference: CAP-006, PIN-399, M7, M6
+
+"""
+Request Pipeline Middleware
+
+Runs the per-request auth stages as one ASGI layer instead of four stacked
+middlewares:
+
+1. AuthGateway (authenticates, sets request.state.auth_context)
+2. OnboardingGate (checks tenant.onboarding_state)
+3. RBAC (checks permissions)
+4. Tenant (propagates tenant context, adds correlation headers)
+
+Every stage reads the same scope and request.state, so the auth context is
+resolved once and the RBAC decision is made once. The first stage that
+returns a response ends the request. Tenant context wraps the route
+handler itself; its headers are added to the response start message, so
+streaming responses are passed through chunk by chunk, never buffered.
+
+Each stage is still usable as a standalone middleware class.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from fastapi import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.middleware.tenant import TenantMiddleware
+
+from .gateway_middleware import AuthGatewayMiddleware
+from .onboarding_gate import OnboardingGateMiddleware
+from .rbac_middleware import RBACMiddleware
+
+
+class RequestPipelineMiddleware:
+    """
+    Auth gateway → onboarding gate → RBAC → tenant context in one pass.
+
+    Usage in main.py:
+        app.add_middleware(RequestPipelineMiddleware, gateway_config=get_gateway_policy_config())
+
+    Args:
+        app: The ASGI app to call once every stage lets the request through
+        gateway_config: AuthGatewayMiddleware keyword arguments; None disables
+            the authentication stage (AUTH_GATEWAY_ENABLED=false)
+        enforce_rbac: Passed to RBACMiddleware (defaults to RBAC_ENFORCE)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        gateway_config: Optional[Dict[str, Any]] = None,
+        enforce_rbac: Optional[bool] = None,
+    ):
+        self.app = app
+        # Tenant stage wraps the app: context must span the route handler
+        self._inner = TenantMiddleware(app)
+        self._stages = []
+        if gateway_config is not None:
+            self._stages.append(AuthGatewayMiddleware(self._inner, **gateway_config))
+        self._stages.append(OnboardingGateMiddleware(self._inner))
+        self._stages.append(RBACMiddleware(self._inner, enforce_rbac=enforce_rbac))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
+        for stage in self._stages:
+            response = await stage.check(request)
+            if response is not None:
+                await response(scope, receive, send)
+                return
+
+        await self._inner(scope, receive, send)
@@ -2,7 +2,7 @@
 # Product: system-wide
 # Temporal:
 #   Trigger: api|worker
-#   Execution: sync
+#   Execution: sync (records written by a background flush thread)
 # Role: Decision contract enforcement
 # Callers: API routes, workers
 # Allowed Imports: L6
@@ -18,19 +18,44 @@ Contract-mandated fields:
 - decision_trigger: explicit | autonomous | reactive
 
 Rule: Emit records where decisions already happen. No logic changes.
+
+Emission never does I/O on the caller's thread: emit_sync() hands the
+record to the process-wide DecisionSink, whose background thread writes
+queued records (and their governance taxonomy mirror) in batched INSERTs
+over one shared connection pool. Idempotency guards consult in-memory keys
+before the database. The sink drains on shutdown (lifespan and atexit).
+
+Configuration (environment):
+    DECISION_SINK_QUEUE_SIZE: Max queued records; newer ones are dropped (default 10000)
+    DECISION_SINK_BATCH_SIZE: Max records per batched INSERT (default 200)
+    DECISION_SINK_FLUSH_INTERVAL_MS: Max wait before a partial flush (default 50)
+    DECISION_SINK_IDEMPOTENCY_KEYS: Idempotency keys remembered in memory (default 100000)
 """
 
+import atexit
 import json
 import logging
 import os
+import threading
+import time
 import uuid
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Tuple
 
 from pydantic import BaseModel, Field
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import column, create_engine, insert, table, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DataError, IntegrityError, SQLAlchemyError
+
+from app.metrics import (
+    aos_decision_sink_batch_size,
+    aos_decision_sink_flush_seconds,
+    aos_decision_sink_queue_depth,
+    aos_decision_sink_records_total,
+)
 
 logger = logging.getLogger("nova.contracts.decisions")
 
@@ -163,228 +188,436 @@ class DecisionRecord(BaseModel):
 
 
 # =============================================================================
-# Decision Record Service (Append-Only Sink)
+# Decision Sink (Buffered, Batched Writes)
 # =============================================================================
 
+# Identity of an idempotent decision, e.g. ("budget_enforcement", run_id)
+IdempotencyKey = Tuple[str, ...]
+
+DECISION_RECORD_COLUMNS = (
+    "decision_id",
+    "decision_type",
+    "decision_source",
+    "decision_trigger",
+    "decision_inputs",
+    "decision_outcome",
+    "decision_reason",
+    "run_id",
+    "workflow_id",
+    "tenant_id",
+    "request_id",
+    "causal_role",
+    "decided_at",
+    "details",
+)
 
-class DecisionRecordService:
+POLICY_DECISION_COLUMNS = (
+    "id",
+    "run_id",
+    "policy_type",
+    "decision",
+    "rationale",
+    "is_synthetic",
+    "synthetic_scenario_id",
+    "capture_confidence_score",
+    "created_at",
+)
+
+# Evidence Architecture v1.0: only policy-related decisions are bridged to the taxonomy
+TAXONOMY_DECISION_TYPES = frozenset(
+    {
+        DecisionType.POLICY,
+        DecisionType.POLICY_PRE_CHECK,
+        DecisionType.BUDGET,
+        DecisionType.BUDGET_ENFORCEMENT,
+    }
+)
+
+_engines: Dict[str, Engine] = {}
+_engines_lock = threading.Lock()
+
+
+def _get_engine(db_url: str) -> Engine:
+    """Process-wide pooled engine for db_url (created once, never disposed per call)."""
+    with _engines_lock:
+        engine = _engines.get(db_url)
+        if engine is None:
+            engine = create_engine(db_url, pool_pre_ping=True, pool_recycle=1800)
+            _engines[db_url] = engine
+        return engine
+
+
+def _record_row(record: DecisionRecord) -> Dict[str, Any]:
+    """contracts.decision_records row for a record."""
+    return {
+        "decision_id": record.decision_id,
+        "decision_type": record.decision_type.value,
+        "decision_source": record.decision_source.value,
+        "decision_trigger": record.decision_trigger.value,
+        "decision_inputs": json.dumps(record.decision_inputs),
+        "decision_outcome": record.decision_outcome.value,
+        "decision_reason": record.decision_reason,
+        "run_id": record.run_id,
+        "workflow_id": record.workflow_id,
+        "tenant_id": record.tenant_id,
+        "request_id": record.request_id,
+        "causal_role": record.causal_role.value,
+        "decided_at": record.decided_at,
+        "details": json.dumps(record.details),
+    }
+
+
+def _taxonomy_row(record: DecisionRecord) -> Optional[Dict[str, Any]]:
     """
-    Append-only sink for decision records.
+    Evidence Architecture v1.0: governance.policy_decisions row for a record.
 
-    Emits to contracts.decision_records table.
-    Non-blocking - failures are logged but don't affect callers.
+    Mirrors operational decisions to the governance taxonomy for cross-domain
+    evidence correlation. This is the D (Decision) evidence bridge.
+    None for decisions that are not policy-related.
+    """
+    if record.decision_type not in TAXONOMY_DECISION_TYPES:
+        return None
 
-    Evidence Architecture v1.0: Also bridges to governance.policy_decisions for taxonomy evidence.
+    allowed = record.decision_outcome in {DecisionOutcome.SELECTED, DecisionOutcome.NONE}
+    return {
+        "id": record.decision_id,
+        "run_id": record.run_id,
+        "policy_type": record.decision_type.value,
+        "decision": "allowed" if allowed else "denied",
+        "rationale": record.decision_reason or "",
+        "is_synthetic": False,  # Operational decisions are never synthetic
+        "synthetic_scenario_id": None,
+        "capture_confidence_score": 1.0,
+        "created_at": record.decided_at,
+    }
+
+
+# executemany on these is sent as multi-row INSERT ... VALUES pages (SQLAlchemy insertmanyvalues)
+DECISION_RECORD_INSERT = insert(
+    table("decision_records", *(column(name) for name in DECISION_RECORD_COLUMNS), schema="contracts")
+)
+POLICY_DECISION_INSERT = pg_insert(
+    table("policy_decisions", *(column(name) for name in POLICY_DECISION_COLUMNS), schema="governance")
+).on_conflict_do_nothing(index_elements=["id"])
+
+
+class QueuedDecision(NamedTuple):
+    """A decision record, serialised when it was queued."""
+
+    row: Dict[str, Any]
+    taxonomy_row: Optional[Dict[str, Any]]
+    idempotency_key: Optional[IdempotencyKey]
+
+
+class DecisionSink:
     """
+    Bounded decision record queue drained by a background flush thread.
 
-    def __init__(self, db_url: Optional[str] = None):
-        self._db_url = db_url or os.environ.get("DATABASE_URL")
-        self._enabled = self._db_url is not None
+    Usage:
+        sink = DecisionSink(db_url)
+        sink.put(record)    # O(1), never does I/O; starts the flush thread
+        sink.flush()        # wait until everything queued so far is written
+        sink.close()        # drains, then stops
 
-    def _bridge_to_taxonomy(self, record: DecisionRecord) -> None:
+    A failed write is logged and counted, not retried; the idempotency keys
+    of the failed records are released so a later emission can record them.
+    After close(), put() writes inline so late decisions are not lost.
+    """
+
+    def __init__(
+        self,
+        db_url: str,
+        max_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_keys: Optional[int] = None,
+    ):
+        self.db_url = db_url
+        self.max_size = max_size or int(os.getenv("DECISION_SINK_QUEUE_SIZE", "10000"))
+        self.batch_size = batch_size or int(os.getenv("DECISION_SINK_BATCH_SIZE", "200"))
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else int(os.getenv("DECISION_SINK_FLUSH_INTERVAL_MS", "50")) / 1000.0
+        )
+        self.max_keys = max_keys or int(os.getenv("DECISION_SINK_IDEMPOTENCY_KEYS", "100000"))
+
+        self._queue: Deque[QueuedDecision] = deque()
+        self._keys: "OrderedDict[IdempotencyKey, None]" = OrderedDict()
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._flush_waiters = 0
+        self._running = False
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+
+    # =========================================================================
+    # Producer side
+    # =========================================================================
+
+    def put(self, record: DecisionRecord, idempotency_key: Optional[IdempotencyKey] = None) -> bool:
         """
-        Evidence Architecture v1.0: Bridge decision to governance taxonomy.
+        Queue a record without blocking on I/O.
 
-        Mirrors operational decisions to governance.policy_decisions table for
-        cross-domain evidence correlation. This is the D (Decision) evidence bridge.
+        Returns:
+            True if queued, False if its idempotency key was already emitted
+            by this process or the queue is full.
+        """
+        item = QueuedDecision(_record_row(record), _taxonomy_row(record), idempotency_key)
+        start_thread = False
+        with self._cond:
+            if idempotency_key is not None and idempotency_key in self._keys:
+                aos_decision_sink_records_total.labels(outcome="duplicate").inc()
+                return False
+            if not self._closed and len(self._queue) >= self.max_size:
+                aos_decision_sink_records_total.labels(outcome="dropped").inc()
+                return False
+            if idempotency_key is not None:
+                self._remember(idempotency_key)
+            closed = self._closed
+            if not closed:
+                self._queue.append(item)
+                depth = len(self._queue)
+                if depth >= self.batch_size:
+                    self._cond.notify_all()
+                if not self._running:
+                    self._running = start_thread = True
+
+        if closed:
+            self._write([item])
+            return True
+        if start_thread:
+            self._start()
+        aos_decision_sink_queue_depth.set(depth)
+        return True
+
+    def seen(self, idempotency_key: IdempotencyKey) -> bool:
+        """Whether this process already emitted (or found) a decision with this key."""
+        with self._cond:
+            return idempotency_key in self._keys
+
+    def remember(self, idempotency_key: IdempotencyKey) -> None:
+        """Record a key found in the database, so the next check skips the query."""
+        with self._cond:
+            self._remember(idempotency_key)
+
+    def _remember(self, idempotency_key: IdempotencyKey) -> None:
+        self._keys[idempotency_key] = None
+        self._keys.move_to_end(idempotency_key)
+        if len(self._keys) > self.max_keys:
+            self._keys.popitem(last=False)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every record queued so far has been written.
 
-        Note: This is best-effort and non-blocking.
+        Returns:
+            True if the queue drained within timeout.
         """
-        # Only bridge policy-related decisions
-        policy_types = {
-            DecisionType.POLICY,
-            DecisionType.POLICY_PRE_CHECK,
-            DecisionType.BUDGET,
-            DecisionType.BUDGET_ENFORCEMENT,
-        }
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            # Waiters make the flush thread write partial batches without waiting
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                while self._queue or self._inflight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self._flush_waiters -= 1
+        return True
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def _start(self) -> None:
+        self._thread = threading.Thread(target=self._flush_loop, name="DecisionSink", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+        logger.info(
+            "decision_sink_started",
+            extra={"max_size": self.max_size, "batch_size": self.batch_size},
+        )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write all queued records, then stop the flush thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread:
+            thread.join(timeout=timeout)
+            self._thread = None
+            atexit.unregister(self.close)
+        if self._queue:
+            logger.warning("decision_sink_closed_with_unwritten_records", extra={"unwritten": len(self._queue)})
+
+    # =========================================================================
+    # Consumer side
+    # =========================================================================
+
+    def _flush_loop(self) -> None:
+        """Drain the queue in batches until closed and empty."""
+        while True:
+            with self._cond:
+                if not self._closed and not self._flush_waiters and len(self._queue) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                if not self._queue:
+                    if self._closed:
+                        self._running = False
+                        return
+                    continue
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._inflight = len(batch)
+                depth = len(self._queue)
+
+            aos_decision_sink_queue_depth.set(depth)
+            self._write(batch)
+
+            with self._cond:
+                self._inflight = 0
+                self._cond.notify_all()
+
+    def _write(self, batch: List[QueuedDecision]) -> None:
+        start = time.perf_counter()
+        failed: List[QueuedDecision] = []
+        try:
+            self._insert_records(batch)
+        except (IntegrityError, DataError) as e:
+            # One bad row fails the whole batch: isolate it row by row
+            logger.warning(
+                "decision_sink_batch_rejected",
+                extra={"batch_size": len(batch), "error": str(e)},
+            )
+            for item in batch:
+                try:
+                    self._insert_records([item])
+                except Exception as row_error:
+                    failed.append(item)
+                    logger.warning(
+                        "decision_record_write_failed",
+                        extra={"decision_id": item.row["decision_id"], "error": str(row_error)},
+                    )
+        except Exception as e:
+            failed = list(batch)
+            logger.warning(
+                "decision_sink_flush_failed",
+                extra={"batch_size": len(batch), "error": str(e)},
+            )
+
+        if failed:
+            with self._cond:
+                for item in failed:
+                    if item.idempotency_key is not None:
+                        self._keys.pop(item.idempotency_key, None)
+            aos_decision_sink_records_total.labels(outcome="failed").inc(len(failed))
+
+        failed_ids = {id(item) for item in failed}
+        written = [item for item in batch if id(item) not in failed_ids]
+        if written:
+            # Evidence Architecture v1.0: Bridge to governance taxonomy
+            self._bridge_to_taxonomy([item.taxonomy_row for item in written if item.taxonomy_row])
+            aos_decision_sink_records_total.labels(outcome="written").inc(len(written))
+            logger.debug("decision_records_flushed", extra={"records": len(written)})
+
+        aos_decision_sink_flush_seconds.observe(time.perf_counter() - start)
+        aos_decision_sink_batch_size.observe(len(batch))
 
-        if record.decision_type not in policy_types:
+    def _insert_records(self, batch: List[QueuedDecision]) -> None:
+        with _get_engine(self.db_url).connect() as conn:
+            conn.execute(DECISION_RECORD_INSERT, [item.row for item in batch])
+            conn.commit()
+
+    def _bridge_to_taxonomy(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Mirror written policy-related decisions to governance.policy_decisions.
+
+        Note: This is best-effort; a failure never fails the decision records.
+        """
+        if not rows:
             return
 
         try:
-            engine = create_engine(self._db_url)
-            with engine.connect() as conn:
-                # Map operational decision to taxonomy format
-                policy_type = record.decision_type.value
-                decision = "allowed" if record.decision_outcome in {
-                    DecisionOutcome.SELECTED,
-                    DecisionOutcome.NONE,
-                } else "denied"
-
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO governance.policy_decisions (
-                            id, run_id, policy_type, decision, rationale,
-                            is_synthetic, synthetic_scenario_id, capture_confidence_score, created_at
-                        ) VALUES (
-                            :id, :run_id, :policy_type, :decision, :rationale,
-                            :is_synthetic, :synthetic_scenario_id, :capture_confidence_score, :created_at
-                        ) ON CONFLICT (id) DO NOTHING
-                        """
-                    ),
-                    {
-                        "id": record.decision_id,
-                        "run_id": record.run_id,
-                        "policy_type": policy_type,
-                        "decision": decision,
-                        "rationale": record.decision_reason or "",
-                        "is_synthetic": False,  # Operational decisions are never synthetic
-                        "synthetic_scenario_id": None,
-                        "capture_confidence_score": 1.0,
-                        "created_at": record.decided_at,
-                    },
-                )
+            with _get_engine(self.db_url).connect() as conn:
+                conn.execute(POLICY_DECISION_INSERT, rows)
                 conn.commit()
-            engine.dispose()
-            logger.debug(
-                "decision_bridged_to_taxonomy",
-                extra={"decision_id": record.decision_id, "policy_type": policy_type},
-            )
+            logger.debug("decisions_bridged_to_taxonomy", extra={"records": len(rows)})
         except Exception as e:
-            # Non-blocking - log and continue
             logger.debug(
                 "taxonomy_bridge_failed",
-                extra={"decision_id": record.decision_id, "error": str(e)},
+                extra={"decision_ids": [row["id"] for row in rows], "error": str(e)},
             )
 
+
+# =============================================================================
+# Decision Record Service (Append-Only Sink)
+# =============================================================================
+
+
+class DecisionRecordService:
+    """
+    Append-only sink for decision records.
+
+    Emits to contracts.decision_records table through a DecisionSink.
+    Non-blocking - records are queued and written in batches by a background
+    thread; failures are logged but don't affect callers.
+
+    Evidence Architecture v1.0: Also bridges to governance.policy_decisions for taxonomy evidence.
+    """
+
+    def __init__(self, db_url: Optional[str] = None):
+        self._db_url = db_url or os.environ.get("DATABASE_URL")
+        self._enabled = self._db_url is not None
+        self._sink = DecisionSink(self._db_url) if self._enabled else None
+
     async def emit(self, record: DecisionRecord) -> bool:
         """
         Emit a decision record to the sink.
 
-        Returns True if emission succeeded, False otherwise.
+        Returns True if the record was queued, False otherwise.
         Non-blocking - failures don't propagate.
         """
-        if not self._enabled:
+        return self.emit_sync(record)
+
+    def emit_sync(self, record: DecisionRecord, idempotency_key: Optional[IdempotencyKey] = None) -> bool:
+        """
+        Queue a decision record; safe to call from sync and async contexts.
+
+        With an idempotency_key, a record whose key this process already
+        emitted is not queued again.
+        """
+        if self._sink is None:
             logger.debug(f"Decision record emission disabled: {record.decision_id}")
             return False
 
         try:
-            engine = create_engine(self._db_url)
-            with engine.connect() as conn:
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO contracts.decision_records (
-                            decision_id, decision_type, decision_source, decision_trigger,
-                            decision_inputs, decision_outcome, decision_reason,
-                            run_id, workflow_id, tenant_id, request_id, causal_role,
-                            decided_at, details
-                        ) VALUES (
-                            :decision_id, :decision_type, :decision_source, :decision_trigger,
-                            :decision_inputs, :decision_outcome, :decision_reason,
-                            :run_id, :workflow_id, :tenant_id, :request_id, :causal_role,
-                            :decided_at, :details
-                        )
-                    """
-                    ),
-                    {
-                        "decision_id": record.decision_id,
-                        "decision_type": record.decision_type.value,
-                        "decision_source": record.decision_source.value,
-                        "decision_trigger": record.decision_trigger.value,
-                        "decision_inputs": json.dumps(record.decision_inputs),
-                        "decision_outcome": record.decision_outcome.value,
-                        "decision_reason": record.decision_reason,
-                        "run_id": record.run_id,
-                        "workflow_id": record.workflow_id,
-                        "tenant_id": record.tenant_id,
-                        "request_id": record.request_id,
-                        "causal_role": record.causal_role.value,
-                        "decided_at": record.decided_at,
-                        "details": json.dumps(record.details),
-                    },
-                )
-                conn.commit()
-            engine.dispose()
-
-            logger.debug(
-                "decision_record_emitted",
-                extra={
-                    "decision_id": record.decision_id,
-                    "decision_type": record.decision_type.value,
-                    "decision_outcome": record.decision_outcome.value,
-                    "causal_role": record.causal_role.value,
-                },
-            )
-
-            # Evidence Architecture v1.0: Bridge to governance taxonomy
-            self._bridge_to_taxonomy(record)
-
-            return True
-
-        except SQLAlchemyError as e:
-            logger.warning(f"Failed to emit decision record: {e}")
-            return False
+            return self._sink.put(record, idempotency_key)
         except Exception as e:
-            logger.warning(f"Unexpected error emitting decision record: {e}")
+            logger.warning(f"Failed to queue decision record: {e}")
             return False
 
-    def emit_sync(self, record: DecisionRecord) -> bool:
-        """Synchronous version of emit for non-async contexts."""
-        import asyncio
+    def has_emitted(self, idempotency_key: IdempotencyKey) -> bool:
+        """Whether a decision with this key was emitted (or found) by this process."""
+        return self._sink is not None and self._sink.seen(idempotency_key)
 
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Already in async context - can't use run_until_complete
-                # Fall back to sync implementation
-                return self._emit_sync_impl(record)
-            return loop.run_until_complete(self.emit(record))
-        except RuntimeError:
-            return self._emit_sync_impl(record)
-
-    def _emit_sync_impl(self, record: DecisionRecord) -> bool:
-        """Synchronous implementation of emit."""
-        if not self._enabled:
-            return False
+    def mark_emitted(self, idempotency_key: IdempotencyKey) -> None:
+        """Remember a key whose decision already exists in the database."""
+        if self._sink is not None:
+            self._sink.remember(idempotency_key)
 
-        try:
-            engine = create_engine(self._db_url)
-            with engine.connect() as conn:
-                conn.execute(
-                    text(
-                        """
-                        INSERT INTO contracts.decision_records (
-                            decision_id, decision_type, decision_source, decision_trigger,
-                            decision_inputs, decision_outcome, decision_reason,
-                            run_id, workflow_id, tenant_id, request_id, causal_role,
-                            decided_at, details
-                        ) VALUES (
-                            :decision_id, :decision_type, :decision_source, :decision_trigger,
-                            :decision_inputs, :decision_outcome, :decision_reason,
-                            :run_id, :workflow_id, :tenant_id, :request_id, :causal_role,
-                            :decided_at, :details
-                        )
-                    """
-                    ),
-                    {
-                        "decision_id": record.decision_id,
-                        "decision_type": record.decision_type.value,
-                        "decision_source": record.decision_source.value,
-                        "decision_trigger": record.decision_trigger.value,
-                        "decision_inputs": json.dumps(record.decision_inputs),
-                        "decision_outcome": record.decision_outcome.value,
-                        "decision_reason": record.decision_reason,
-                        "run_id": record.run_id,
-                        "workflow_id": record.workflow_id,
-                        "tenant_id": record.tenant_id,
-                        "request_id": record.request_id,
-                        "causal_role": record.causal_role.value,
-                        "decided_at": record.decided_at,
-                        "details": json.dumps(record.details),
-                    },
-                )
-                conn.commit()
-            engine.dispose()
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until every record queued so far is written. True if drained in time."""
+        return self._sink.flush(timeout) if self._sink is not None else True
 
-            # Evidence Architecture v1.0: Bridge to governance taxonomy
-            self._bridge_to_taxonomy(record)
-
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to emit decision record (sync): {e}")
-            return False
+    def close(self, timeout: float = 5.0) -> None:
+        """Write queued records and stop the flush thread (shutdown)."""
+        if self._sink is not None:
+            self._sink.close(timeout)
 
 
 # =============================================================================
@@ -657,40 +890,51 @@ def emit_budget_decision(
     return record
 
 
-def _check_budget_enforcement_exists(run_id: str) -> bool:
+def _decision_exists(idempotency_key: IdempotencyKey, query: str, params: Dict[str, Any]) -> bool:
     """
-    Check if a budget_enforcement decision already exists for this run.
+    Idempotency guard shared by the emit_*_decision helpers.
 
-    Idempotency guard: prevents double emission on retry/restart.
+    Keys this process emitted (including records still queued) or already
+    found are answered from memory; otherwise the database is queried over
+    the shared pool and a hit is remembered.
     """
+    service = get_decision_service()
+    if service.has_emitted(idempotency_key):
+        return True
+
     db_url = os.environ.get("DATABASE_URL")
     if not db_url:
         return False  # Can't check, allow emission
 
     try:
-        engine = create_engine(db_url)
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    """
-                    SELECT 1 FROM contracts.decision_records
-                    WHERE run_id = :run_id
-                      AND decision_type = :decision_type
-                    LIMIT 1
-                """
-                ),
-                {
-                    "run_id": run_id,
-                    "decision_type": DecisionType.BUDGET_ENFORCEMENT.value,
-                },
-            )
-            exists = result.fetchone() is not None
-        engine.dispose()
-        return exists
+        with _get_engine(db_url).connect() as conn:
+            exists = conn.execute(text(query), params).fetchone() is not None
     except Exception as e:
-        logger.warning(f"Failed to check budget_enforcement existence: {e}")
+        logger.warning(f"Failed to check {idempotency_key[0]} existence: {e}")
         return False  # On error, allow emission (fail-open for observability)
 
+    if exists:
+        service.mark_emitted(idempotency_key)
+    return exists
+
+
+def _check_budget_enforcement_exists(run_id: str) -> bool:
+    """
+    Check if a budget_enforcement decision already exists for this run.
+
+    Idempotency guard: prevents double emission on retry/restart.
+    """
+    return _decision_exists(
+        (DecisionType.BUDGET_ENFORCEMENT.value, run_id),
+        """
+        SELECT 1 FROM contracts.decision_records
+        WHERE run_id = :run_id
+          AND decision_type = :decision_type
+        LIMIT 1
+        """,
+        {"run_id": run_id, "decision_type": DecisionType.BUDGET_ENFORCEMENT.value},
+    )
+
 
 def emit_budget_enforcement_decision(
     run_id: str,
@@ -746,7 +990,10 @@ def emit_budget_enforcement_decision(
         },
     )
 
-    get_decision_service().emit_sync(record)
+    get_decision_service().emit_sync(
+        record,
+        idempotency_key=(DecisionType.BUDGET_ENFORCEMENT.value, run_id),
+    )
     return record
 
 
@@ -761,35 +1008,17 @@ def _check_policy_precheck_exists(request_id: str, outcome: str) -> bool:
 
     Idempotency guard: prevents double emission on retry/restart.
     """
-    db_url = os.environ.get("DATABASE_URL")
-    if not db_url:
-        return False  # Can't check, allow emission
-
-    try:
-        engine = create_engine(db_url)
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    """
-                    SELECT 1 FROM contracts.decision_records
-                    WHERE request_id = :request_id
-                      AND decision_type = :decision_type
-                      AND decision_outcome = :outcome
-                    LIMIT 1
-                """
-                ),
-                {
-                    "request_id": request_id,
-                    "decision_type": DecisionType.POLICY_PRE_CHECK.value,
-                    "outcome": outcome,
-                },
-            )
-            exists = result.fetchone() is not None
-        engine.dispose()
-        return exists
-    except Exception as e:
-        logger.warning(f"Failed to check policy_pre_check existence: {e}")
-        return False  # On error, allow emission (fail-open for observability)
+    return _decision_exists(
+        (DecisionType.POLICY_PRE_CHECK.value, request_id, outcome),
+        """
+        SELECT 1 FROM contracts.decision_records
+        WHERE request_id = :request_id
+          AND decision_type = :decision_type
+          AND decision_outcome = :outcome
+        LIMIT 1
+        """,
+        {"request_id": request_id, "decision_type": DecisionType.POLICY_PRE_CHECK.value, "outcome": outcome},
+    )
 
 
 def emit_policy_precheck_decision(
@@ -873,7 +1102,10 @@ def emit_policy_precheck_decision(
         },
     )
 
-    get_decision_service().emit_sync(record)
+    get_decision_service().emit_sync(
+        record,
+        idempotency_key=(DecisionType.POLICY_PRE_CHECK.value, request_id, outcome.value),
+    )
 
     logger.info(
         "policy_precheck_decision_emitted",
@@ -899,35 +1131,21 @@ def _check_recovery_evaluation_exists(run_id: str, failure_type: str) -> bool:
 
     Idempotency guard: prevents double emission on retry/restart.
     """
-    db_url = os.environ.get("DATABASE_URL")
-    if not db_url:
-        return False  # Can't check, allow emission
-
-    try:
-        engine = create_engine(db_url)
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    """
-                    SELECT 1 FROM contracts.decision_records
-                    WHERE run_id = :run_id
-                      AND decision_type = :decision_type
-                      AND decision_inputs::text LIKE :failure_pattern
-                    LIMIT 1
-                """
-                ),
-                {
-                    "run_id": run_id,
-                    "decision_type": DecisionType.RECOVERY_EVALUATION.value,
-                    "failure_pattern": f'%"failure_type": "{failure_type}"%',
-                },
-            )
-            exists = result.fetchone() is not None
-        engine.dispose()
-        return exists
-    except Exception as e:
-        logger.warning(f"Failed to check recovery_evaluation existence: {e}")
-        return False  # On error, allow emission (fail-open for observability)
+    return _decision_exists(
+        (DecisionType.RECOVERY_EVALUATION.value, run_id, failure_type),
+        """
+        SELECT 1 FROM contracts.decision_records
+        WHERE run_id = :run_id
+          AND decision_type = :decision_type
+          AND decision_inputs::text LIKE :failure_pattern
+        LIMIT 1
+        """,
+        {
+            "run_id": run_id,
+            "decision_type": DecisionType.RECOVERY_EVALUATION.value,
+            "failure_pattern": f'%"failure_type": "{failure_type}"%',
+        },
+    )
 
 
 def emit_recovery_evaluation_decision(
@@ -1003,7 +1221,10 @@ def emit_recovery_evaluation_decision(
         },
     )
 
-    get_decision_service().emit_sync(record)
+    get_decision_service().emit_sync(
+        record,
+        idempotency_key=(DecisionType.RECOVERY_EVALUATION.value, run_id, failure_type),
+    )
 
     logger.info(
         "recovery_evaluation_decision_emitted",
@@ -1040,9 +1261,11 @@ def backfill_run_id_for_request(request_id: str, run_id: str) -> int:
         logger.debug("backfill_run_id skipped: DATABASE_URL not set")
         return 0
 
+    # Pre-run decisions may still be queued in the sink
+    get_decision_service().flush()
+
     try:
-        engine = create_engine(db_url)
-        with engine.connect() as conn:
+        with _get_engine(db_url).connect() as conn:
             result = conn.execute(
                 text(
                     """
@@ -1057,7 +1280,6 @@ def backfill_run_id_for_request(request_id: str, run_id: str) -> int:
             )
             conn.commit()
             updated = result.rowcount
-        engine.dispose()
 
         if updated > 0:
             logger.debug(
@@ -1185,33 +1407,16 @@ def _check_care_optimization_exists(request_id: str) -> bool:
 
     Idempotency guard: prevents double emission.
     """
-    db_url = os.environ.get("DATABASE_URL")
-    if not db_url:
-        return False
-
-    try:
-        engine = create_engine(db_url)
-        with engine.connect() as conn:
-            result = conn.execute(
-                text(
-                    """
-                    SELECT 1 FROM contracts.decision_records
-                    WHERE request_id = :request_id
-                      AND decision_type = :decision_type
-                    LIMIT 1
-                """
-                ),
-                {
-                    "request_id": request_id,
-                    "decision_type": DecisionType.CARE_ROUTING_OPTIMIZED.value,
-                },
-            )
-            exists = result.fetchone() is not None
-        engine.dispose()
-        return exists
-    except Exception as e:
-        logger.warning(f"Failed to check care_routing_optimized existence: {e}")
-        return False
+    return _decision_exists(
+        (DecisionType.CARE_ROUTING_OPTIMIZED.value, request_id),
+        """
+        SELECT 1 FROM contracts.decision_records
+        WHERE request_id = :request_id
+          AND decision_type = :decision_type
+        LIMIT 1
+        """,
+        {"request_id": request_id, "decision_type": DecisionType.CARE_ROUTING_OPTIMIZED.value},
+    )
 
 
 def emit_care_optimization_decision(
@@ -1335,7 +1540,10 @@ def emit_care_optimization_decision(
         },
     )
 
-    get_decision_service().emit_sync(record)
+    get_decision_service().emit_sync(
+        record,
+        idempotency_key=(DecisionType.CARE_ROUTING_OPTIMIZED.value, request_id),
+    )
 
     logger.info(
         "care_optimization_decision_emitted",
@@ -20,6 +20,7 @@ from .subscribers import (
     EventEnvelope,
     EventReactor,
     EventReactorStats,
+    HandlerStats,
     ReactorState,
     get_event_reactor,
     reset_event_reactor,
@@ -45,6 +46,7 @@ __all__ = [
     "reset_event_reactor",
     "EventEnvelope",
     "EventReactorStats",
+    "HandlerStats",
     "ReactorState",
     "EVENT_REACTOR_ENABLED",
     # Audit Handlers (PIN-454 Phase 5)
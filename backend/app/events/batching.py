@@ -0,0 +1,305 @@
+# Layer: L3 — Boundary Adapter
+# Product: system-wide
+# Temporal:
+#   Trigger: api|worker
+#   Execution: async (background flush thread)
+# Role: Bounded event buffer with batched background flushing
+# Callers: RedisPublisher, NatsAdapter
+# Allowed Imports: L4, L6
+# Forbidden Imports: L1, L2, L5
+# Reference: Event System
+
+"""
+Bounded event buffer for publisher adapters.
+
+publish() on a batching adapter serializes the event and appends the
+message to an in-memory buffer; a background thread drains the buffer in
+batches and hands each batch to the adapter's transport (Redis pipeline,
+NATS flush). Callers never pay a network round trip, and because the
+message is serialized before publish() returns, a caller may reuse or
+mutate its payload dict afterwards.
+
+DESIGN CONSTRAINTS:
+1. Fire-and-forget semantics are unchanged (events may be dropped on overflow)
+2. Bounded memory: the buffer never exceeds max_size events
+3. Overflow policy is explicit and observable (drop_newest, drop_oldest, block)
+4. close() drains the buffer before returning (flush on shutdown)
+
+Configuration (environment):
+    EVENT_PUBLISHER_BATCHING: "true" (default) / "false" for synchronous publish
+    EVENT_PUBLISHER_QUEUE_SIZE: Max buffered events (default 10000)
+    EVENT_PUBLISHER_BATCH_SIZE: Max events per flush (default 500)
+    EVENT_PUBLISHER_FLUSH_INTERVAL_MS: Max wait before a partial flush (default 20)
+    EVENT_PUBLISHER_OVERFLOW: drop_newest (default) | drop_oldest | block
+"""
+
+import atexit
+import logging
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..metrics import (
+    aos_event_publisher_batch_size,
+    aos_event_publisher_events_total,
+    aos_event_publisher_flush_seconds,
+    aos_event_publisher_queue_depth,
+)
+
+logger = logging.getLogger("nova.events.batching")
+
+# (topic, serialized message) pairs; adapters serialize in publish(), never on the flush thread
+BufferedEvent = Tuple[str, str]
+
+# Flush callback: sends a batch, returns the number of events that failed
+FlushFn = Callable[[List[BufferedEvent]], int]
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when the buffer is full."""
+
+    DROP_NEWEST = "drop_newest"  # Reject the incoming event
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest buffered event
+    BLOCK = "block"  # Wait up to block_timeout for space, then drop newest
+
+
+def batching_enabled() -> bool:
+    """Whether adapters should use the buffered publish path."""
+    return os.getenv("EVENT_PUBLISHER_BATCHING", "true").lower() == "true"
+
+
+@dataclass
+class EventBufferStats:
+    """Counters for observability."""
+
+    enqueued: int = 0
+    published: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    last_flush_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "published": self.published,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+        }
+
+
+class EventBuffer:
+    """
+    Bounded buffer drained by a background flush thread.
+
+    Usage:
+        buffer = EventBuffer("redis", flush_fn=send_batch)
+        buffer.start()
+        buffer.put("INCIDENT_CREATED", message)  # O(1), never does I/O
+        buffer.close()                          # drains, then stops
+    """
+
+    def __init__(
+        self,
+        adapter: str,
+        flush_fn: FlushFn,
+        max_size: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        overflow_policy: Optional[OverflowPolicy] = None,
+        block_timeout: float = 0.1,
+    ):
+        self.adapter = adapter
+        self._flush_fn = flush_fn
+        self.max_size = max_size or int(os.getenv("EVENT_PUBLISHER_QUEUE_SIZE", "10000"))
+        self.batch_size = batch_size or int(os.getenv("EVENT_PUBLISHER_BATCH_SIZE", "500"))
+        self.flush_interval = (
+            flush_interval
+            if flush_interval is not None
+            else int(os.getenv("EVENT_PUBLISHER_FLUSH_INTERVAL_MS", "20")) / 1000.0
+        )
+        self.overflow_policy = overflow_policy or OverflowPolicy(
+            os.getenv("EVENT_PUBLISHER_OVERFLOW", OverflowPolicy.DROP_NEWEST.value).lower()
+        )
+        self.block_timeout = block_timeout
+
+        self._queue: Deque[BufferedEvent] = deque()
+        self._cond = threading.Condition()
+        self._inflight = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._stats = EventBufferStats()
+
+    # =========================================================================
+    # Lifecycle
+    # =========================================================================
+
+    def start(self) -> None:
+        """Start the background flush thread."""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(
+            target=self._flush_loop,
+            name=f"EventBuffer-{self.adapter}",
+            daemon=True,
+        )
+        self._thread.start()
+        atexit.register(self.close)
+        logger.info(
+            "event_buffer_started",
+            extra={
+                "adapter": self.adapter,
+                "max_size": self.max_size,
+                "batch_size": self.batch_size,
+                "overflow_policy": self.overflow_policy.value,
+            },
+        )
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush all buffered events, then stop the flush thread."""
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        atexit.unregister(self.close)
+        logger.info("event_buffer_stopped", extra={"adapter": self.adapter, **self._stats.to_dict()})
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    # =========================================================================
+    # Producer side
+    # =========================================================================
+
+    def put(self, topic: str, message: str) -> bool:
+        """
+        Enqueue a serialized event without blocking on I/O.
+
+        Returns:
+            True if buffered, False if dropped by the overflow policy.
+        """
+        with self._cond:
+            if len(self._queue) >= self.max_size:
+                if self.overflow_policy == OverflowPolicy.DROP_OLDEST:
+                    self._queue.popleft()
+                    self._record_drop()
+                elif self.overflow_policy == OverflowPolicy.BLOCK:
+                    deadline = time.monotonic() + self.block_timeout
+                    while len(self._queue) >= self.max_size:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._running:
+                            break
+                        self._cond.wait(remaining)
+                    if len(self._queue) >= self.max_size:
+                        self._record_drop()
+                        return False
+                else:
+                    self._record_drop()
+                    return False
+
+            self._queue.append((topic, message))
+            self._stats.enqueued += 1
+            depth = len(self._queue)
+            self._stats.queue_depth = depth
+            self._stats.max_queue_depth = max(self._stats.max_queue_depth, depth)
+            if depth >= self.batch_size:
+                self._cond.notify_all()
+
+        aos_event_publisher_queue_depth.labels(adapter=self.adapter).set(depth)
+        return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every event buffered so far has been handed to the transport.
+
+        Returns:
+            True if the buffer drained within timeout.
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._cond.notify_all()
+            while self._queue or self._inflight:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _record_drop(self) -> None:
+        self._stats.dropped += 1
+        aos_event_publisher_events_total.labels(adapter=self.adapter, outcome="dropped").inc()
+
+    # =========================================================================
+    # Consumer side
+    # =========================================================================
+
+    def _flush_loop(self) -> None:
+        """Drain the buffer in batches until closed and empty."""
+        while True:
+            with self._cond:
+                if self._running and len(self._queue) < self.batch_size:
+                    self._cond.wait(self.flush_interval)
+                if not self._queue:
+                    if not self._running:
+                        return
+                    continue
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._inflight = len(batch)
+                depth = len(self._queue)
+                self._stats.queue_depth = depth
+                # Wake producers blocked on a full buffer
+                self._cond.notify_all()
+
+            aos_event_publisher_queue_depth.labels(adapter=self.adapter).set(depth)
+            self._send(batch)
+
+            with self._cond:
+                self._inflight = 0
+                self._cond.notify_all()
+
+    def _send(self, batch: List[BufferedEvent]) -> None:
+        start = time.perf_counter()
+        try:
+            failed = self._flush_fn(batch)
+        except Exception as e:
+            failed = len(batch)
+            logger.error(
+                "event_buffer_flush_failed",
+                extra={"adapter": self.adapter, "batch_size": len(batch), "error": str(e)},
+            )
+        elapsed = time.perf_counter() - start
+
+        published = len(batch) - failed
+        self._stats.batches += 1
+        self._stats.published += published
+        self._stats.failed += failed
+        self._stats.last_flush_ms = elapsed * 1000
+
+        aos_event_publisher_flush_seconds.labels(adapter=self.adapter).observe(elapsed)
+        aos_event_publisher_batch_size.labels(adapter=self.adapter).observe(len(batch))
+        if published:
+            aos_event_publisher_events_total.labels(adapter=self.adapter, outcome="published").inc(published)
+        if failed:
+            aos_event_publisher_events_total.labels(adapter=self.adapter, outcome="failed").inc(failed)
+
+    def get_stats(self) -> EventBufferStats:
+        with self._cond:
+            self._stats.queue_depth = len(self._queue)
+            return EventBufferStats(**self._stats.to_dict())
@@ -13,12 +13,19 @@
 NATS adapter stub. Does not actually require a NATS server by default.
 If NATS is configured in env (NATS_URL), this adapter will attempt a connect.
 In many test/dev setups this remains a logging stub.
+
+When connected, publishing is buffered like RedisPublisher: publish()
+serializes and enqueues the message, and a background thread publishes each batch on the adapter's
+event loop followed by a single flush. EVENT_PUBLISHER_BATCHING=false
+restores synchronous publishing.
 """
 
 import json
 import logging
 import os
+from typing import List, Optional
 
+from .batching import BufferedEvent, EventBuffer, EventBufferStats, batching_enabled
 from .publisher import BasePublisher
 
 logger = logging.getLogger("nova.events.nats")
@@ -27,10 +34,11 @@ logger = logging.getLogger("nova.events.nats")
 class NatsAdapter(BasePublisher):
     """NATS event publisher adapter."""
 
-    def __init__(self):
+    def __init__(self, batching: Optional[bool] = None):
         self.nats_url = os.getenv("NATS_URL", "")
         self.nc = None
         self.loop = None
+        self._buffer: Optional[EventBuffer] = None
 
         if not self.nats_url:
             logger.info("NatsAdapter initialized in stub mode (no NATS_URL)")
@@ -49,8 +57,24 @@ class NatsAdapter(BasePublisher):
                 logger.exception("NatsAdapter_connect_failed; operating as logging stub")
                 self.nc = None
 
+        if self.nc and (batching if batching is not None else batching_enabled()):
+            # The flush thread becomes the only user of self.loop
+            self._buffer = EventBuffer("nats", flush_fn=self._publish_batch)
+            self._buffer.start()
+
     def publish(self, topic: str, payload: dict):
         """Publish event to NATS or log if stub mode."""
+        if self._buffer is not None and self._buffer.is_running:
+            # Serialized now, the caller may reuse payload after return
+            try:
+                message = json.dumps(payload, default=str)
+            except Exception:
+                logger.exception("nats_publish_failed", extra={"topic": topic})
+                return
+            if not self._buffer.put(topic, message):
+                logger.warning("nats_publish_dropped", extra={"topic": topic})
+            return
+
         if self.nc and self.loop:
             try:
                 data = json.dumps(payload).encode()
@@ -60,3 +84,42 @@ class NatsAdapter(BasePublisher):
                 logger.exception("nats_publish_failed", extra={"topic": topic})
         else:
             logger.info("nats_stub_publish", extra={"topic": topic, "payload": payload})
+
+    def _publish_batch(self, batch: List[BufferedEvent]) -> int:
+        """Publish a batch on the adapter loop and flush once. Returns failures."""
+        return self.loop.run_until_complete(self._publish_batch_async(batch))
+
+    async def _publish_batch_async(self, batch: List[BufferedEvent]) -> int:
+        failed = 0
+        for topic, message in batch:
+            try:
+                await self.nc.publish(topic, message.encode())
+            except Exception:
+                failed += 1
+                logger.exception("nats_publish_failed", extra={"topic": topic})
+        try:
+            await self.nc.flush()
+        except Exception:
+            logger.exception("nats_flush_failed", extra={"batch_size": len(batch)})
+            return len(batch)
+        return failed
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until buffered events have been sent (no-op when unbuffered)."""
+        if self._buffer is None:
+            return True
+        return self._buffer.flush(timeout)
+
+    def get_buffer_stats(self) -> Optional[EventBufferStats]:
+        """Queue depth / drop / flush counters, or None when unbuffered."""
+        return self._buffer.get_stats() if self._buffer else None
+
+    def close(self) -> None:
+        """Flush buffered events and drain the NATS connection."""
+        if self._buffer is not None:
+            self._buffer.close()
+        if self.nc and self.loop:
+            try:
+                self.loop.run_until_complete(self.nc.drain())
+            except Exception:
+                logger.exception("nats_close_failed")
@@ -39,6 +39,10 @@ class BasePublisher:
     def publish(self, topic: str, payload: Dict[str, Any]) -> None:
         raise NotImplementedError
 
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for buffered events to be sent. Override in buffering subclasses."""
+        return True
+
     def close(self) -> None:
         """Close any connections. Override in subclasses."""
         pass
@@ -21,17 +21,25 @@ DESIGN CONSTRAINTS (Non-Negotiable):
 3. Schema-stable events (standard envelope)
 4. Observable at runtime
 
+Publishing is buffered by default: publish() stamps the envelope and
+enqueues it; a background thread serializes and sends batches through a
+non-transactional Redis pipeline (one round trip per batch). Set
+EVENT_PUBLISHER_BATCHING=false to publish synchronously. See batching.py
+for queue sizing and overflow policy.
+
 Usage:
     publisher = RedisPublisher()
     publisher.publish("INCIDENT_CREATED", {"incident_id": "123", ...})
+    publisher.close()  # flushes buffered events
 """
 
 import json
 import logging
 import os
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
+from .batching import BufferedEvent, EventBuffer, EventBufferStats, batching_enabled
 from .publisher import BasePublisher
 
 logger = logging.getLogger("nova.events.redis")
@@ -39,6 +47,16 @@ logger = logging.getLogger("nova.events.redis")
 # Channel for all AOS events
 AOS_EVENTS_CHANNEL = "aos.events"
 
+# Durable stream consumed by EventReactor in EVENT_REACTOR_MODE=streams
+AOS_EVENTS_STREAM = os.getenv("AOS_EVENTS_STREAM", "aos:events:stream")
+EVENT_STREAM_MAX_LEN = int(os.getenv("EVENT_STREAM_MAX_LEN", "100000"))
+
+
+def stream_enabled() -> bool:
+    """Whether events are also appended to the durable stream (defaults on in streams mode)."""
+    default = "true" if os.getenv("EVENT_REACTOR_MODE", "pubsub").lower() == "streams" else "false"
+    return os.getenv("EVENT_STREAM_ENABLED", default).lower() == "true"
+
 
 class RedisPublisher(BasePublisher):
     """
@@ -48,10 +66,12 @@ class RedisPublisher(BasePublisher):
     Fails fast if REDIS_URL is not configured.
     """
 
-    def __init__(self):
+    def __init__(self, batching: Optional[bool] = None):
         self.redis_url = os.getenv("REDIS_URL", "")
         self.channel = AOS_EVENTS_CHANNEL
+        self.stream = AOS_EVENTS_STREAM if stream_enabled() else None
         self._client: Optional[Any] = None
+        self._buffer: Optional[EventBuffer] = None
 
         if not self.redis_url:
             raise RuntimeError(
@@ -85,6 +105,10 @@ class RedisPublisher(BasePublisher):
         except Exception as e:
             raise RuntimeError(f"Failed to connect to Redis at {self._sanitize_url(self.redis_url)}: {e}")
 
+        if batching if batching is not None else batching_enabled():
+            self._buffer = EventBuffer("redis", flush_fn=self._publish_batch)
+            self._buffer.start()
+
     def _sanitize_url(self, url: str) -> str:
         """Remove password from URL for logging."""
         if "@" in url:
@@ -109,6 +133,11 @@ class RedisPublisher(BasePublisher):
             "payload": { ...original payload... }
         }
 
+        When batching is enabled this serializes the envelope and only
+        enqueues the message; the timestamp is taken at enqueue time so
+        ordering reflects the caller, and later changes to payload are not
+        published.
+
         Args:
             event_type: Type of event (e.g., INCIDENT_CREATED, RECOVERY_SUGGESTED)
             payload: Event payload dictionary
@@ -117,17 +146,28 @@ class RedisPublisher(BasePublisher):
             logger.error("redis_publish_failed: client not initialized")
             return
 
-        # Build event envelope
-        event = {
-            "event_type": event_type,
-            "timestamp": payload.get("timestamp") or datetime.now(timezone.utc).isoformat(),
-            "source": payload.get("source", "aos"),
-            "payload": payload,
-        }
+        # Build event envelope; serialized now, the caller may reuse payload after return
+        try:
+            message = json.dumps(self._build_envelope(event_type, payload), default=str)
+        except Exception as e:
+            logger.error(
+                "redis_publish_failed",
+                extra={"event_type": event_type, "channel": self.channel, "error": str(e)},
+            )
+            return
+
+        if self._buffer is not None and self._buffer.is_running:
+            if not self._buffer.put(event_type, message):
+                logger.warning(
+                    "redis_publish_dropped",
+                    extra={"event_type": event_type, "channel": self.channel},
+                )
+            return
 
         try:
-            message = json.dumps(event, default=str)
             subscriber_count = self._client.publish(self.channel, message)
+            if self.stream:
+                self._client.xadd(self.stream, {"data": message}, maxlen=EVENT_STREAM_MAX_LEN, approximate=True)
 
             logger.info(
                 "redis_publish_ok",
@@ -148,8 +188,62 @@ class RedisPublisher(BasePublisher):
                 },
             )
 
+    def _build_envelope(self, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "event_type": event_type,
+            "timestamp": payload.get("timestamp") or datetime.now(timezone.utc).isoformat(),
+            "source": payload.get("source", "aos"),
+            "payload": payload,
+        }
+
+    def _publish_batch(self, batch: List[BufferedEvent]) -> int:
+        """
+        Send a batch of envelopes in one pipelined round trip.
+
+        Runs on the buffer's flush thread. Returns the number of events
+        that could not be published.
+        """
+        failed_events = set()
+        owners: List[int] = []  # pipeline command index -> batch index
+        pipe = self._client.pipeline(transaction=False)
+        for index, (_event_type, message) in enumerate(batch):
+            pipe.publish(self.channel, message)
+            owners.append(index)
+            if self.stream:
+                pipe.xadd(self.stream, {"data": message}, maxlen=EVENT_STREAM_MAX_LEN, approximate=True)
+                owners.append(index)
+
+        if owners:
+            try:
+                results = pipe.execute(raise_on_error=False)
+                failed_events.update(owners[i] for i, r in enumerate(results) if isinstance(r, Exception))
+            except Exception as e:
+                failed_events.update(owners)
+                logger.error(
+                    "redis_publish_batch_failed",
+                    extra={"channel": self.channel, "batch_size": len(batch), "error": str(e)},
+                )
+
+        logger.debug(
+            "redis_publish_batch",
+            extra={"channel": self.channel, "batch_size": len(batch), "failed": len(failed_events)},
+        )
+        return len(failed_events)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until buffered events have been sent (no-op when unbuffered)."""
+        if self._buffer is None:
+            return True
+        return self._buffer.flush(timeout)
+
+    def get_buffer_stats(self) -> Optional[EventBufferStats]:
+        """Queue depth / drop / flush counters, or None when unbuffered."""
+        return self._buffer.get_stats() if self._buffer else None
+
     def close(self) -> None:
-        """Close Redis connection."""
+        """Flush buffered events and close Redis connection."""
+        if self._buffer is not None:
+            self._buffer.close()
         if self._client:
             self._client.close()
             logger.info("RedisPublisher connection closed")
@@ -22,6 +22,30 @@ DESIGN CONSTRAINTS:
 4. Prometheus metrics for observability
 5. Graceful shutdown support
 
+Transport modes (EVENT_REACTOR_MODE):
+- pubsub (default): SUBSCRIBE to 'aos.events'. Events published while the
+  reactor is down are lost.
+- streams: XREADGROUP from the 'aos:events:stream' Redis Stream (written by
+  RedisPublisher when EVENT_STREAM_ENABLED). Messages are ACKed only after
+  every handler succeeded; failed or orphaned messages are reclaimed after
+  EVENT_REACTOR_CLAIM_IDLE_MS and dead-lettered after
+  EVENT_REACTOR_MAX_DELIVERIES attempts. Delivery is at-least-once; handlers
+  that already succeeded for a message are skipped on redelivery via
+  per-handler completion markers (see idempotency_key on register_handler).
+  A reactor never reclaims messages still queued or running in its own
+  pools; other consumers can, so keep EVENT_REACTOR_CLAIM_IDLE_MS above the
+  worst-case pool queue wait when several reactors share the group.
+
+Dispatch (EVENT_REACTOR_WORKERS):
+- 0: handlers run inline on the reader thread (original behaviour).
+- N > 0: each event type with dedicated handlers gets its own pool of N
+  worker threads and a bounded queue (EVENT_REACTOR_QUEUE_SIZE), so a slow
+  handler only delays its own event type. Wildcard-only events share one
+  pool. A full queue blocks the reader (back-pressure).
+
+Handlers may be plain functions or ``async def`` coroutines; coroutines run
+on a per-worker event loop.
+
 Usage:
     from app.events.subscribers import EventReactor, get_event_reactor
 
@@ -36,15 +60,18 @@ Usage:
     reactor.start()
 """
 
+import asyncio
+import inspect
 import json
 import logging
 import os
+import queue
 import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 
 logger = logging.getLogger("nova.events.subscribers")
 
@@ -52,6 +79,25 @@ logger = logging.getLogger("nova.events.subscribers")
 EVENT_REACTOR_ENABLED = os.getenv("EVENT_REACTOR_ENABLED", "false").lower() == "true"
 AOS_EVENTS_CHANNEL = "aos.events"
 
+# Transport / dispatch configuration
+EVENT_REACTOR_MODE = os.getenv("EVENT_REACTOR_MODE", "pubsub").lower()  # pubsub | streams
+EVENT_REACTOR_WORKERS = int(os.getenv("EVENT_REACTOR_WORKERS", "0"))  # per event type, 0 = inline
+EVENT_REACTOR_QUEUE_SIZE = int(os.getenv("EVENT_REACTOR_QUEUE_SIZE", "1000"))
+
+# Redis Streams configuration (streams mode)
+AOS_EVENTS_STREAM = os.getenv("AOS_EVENTS_STREAM", "aos:events:stream")
+REACTOR_CONSUMER_GROUP = os.getenv("EVENT_REACTOR_CONSUMER_GROUP", "aos:events:reactor")
+REACTOR_CONSUMER_NAME = os.getenv("HOSTNAME", f"reactor-{os.getpid()}")
+REACTOR_STREAM_BATCH_SIZE = int(os.getenv("EVENT_REACTOR_STREAM_BATCH_SIZE", "100"))
+REACTOR_STREAM_BLOCK_MS = int(os.getenv("EVENT_REACTOR_STREAM_BLOCK_MS", "1000"))
+REACTOR_CLAIM_IDLE_MS = int(os.getenv("EVENT_REACTOR_CLAIM_IDLE_MS", "60000"))
+REACTOR_CLAIM_INTERVAL_SECONDS = float(os.getenv("EVENT_REACTOR_CLAIM_INTERVAL_SECONDS", "30"))
+REACTOR_MAX_DELIVERIES = int(os.getenv("EVENT_REACTOR_MAX_DELIVERIES", "5"))
+REACTOR_DEAD_LETTER_STREAM = os.getenv("EVENT_REACTOR_DEAD_LETTER_STREAM", "aos:events:dead-letter")
+REACTOR_DEAD_LETTER_MAX_LEN = int(os.getenv("EVENT_REACTOR_DEAD_LETTER_MAX_LEN", "10000"))
+REACTOR_IDEMPOTENCY_TTL_SECONDS = int(os.getenv("EVENT_REACTOR_IDEMPOTENCY_TTL_SECONDS", "86400"))
+REACTOR_IDEMPOTENCY_PREFIX = "aos:events:done"
+
 # Heartbeat configuration
 REACTOR_HEARTBEAT_INTERVAL_SECONDS = int(
     os.getenv("REACTOR_HEARTBEAT_INTERVAL_SECONDS", "30")
@@ -62,7 +108,7 @@ REACTOR_HEARTBEAT_MISS_THRESHOLD = int(
 
 # Prometheus metrics (optional)
 try:
-    from prometheus_client import Counter, Histogram
+    from prometheus_client import Counter, Gauge, Histogram
 
     EVENTS_RECEIVED = Counter(
         "aos_events_received_total",
@@ -92,6 +138,30 @@ try:
         "aos_reactor_heartbeat_missed_total",
         "Total missed heartbeats (reactor unhealthy)",
     )
+    HANDLER_LAG = Histogram(
+        "aos_event_handler_lag_seconds",
+        "Delay between event publication and handler start",
+        ["event_type", "handler"],
+        buckets=(0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0, 600.0),
+    )
+    DISPATCH_QUEUE_DEPTH = Gauge(
+        "aos_event_dispatch_queue_depth",
+        "Events waiting in a reactor worker pool queue",
+        ["pool"],
+    )
+    EVENTS_REDELIVERED = Counter(
+        "aos_events_redelivered_total",
+        "Stream messages reclaimed for redelivery",
+    )
+    EVENTS_DEAD_LETTERED = Counter(
+        "aos_events_dead_lettered_total",
+        "Stream messages moved to the dead-letter stream",
+    )
+    EVENTS_DUPLICATE_SKIPPED = Counter(
+        "aos_events_duplicate_skipped_total",
+        "Handler invocations skipped because the event was already handled",
+        ["handler"],
+    )
     METRICS_ENABLED = True
 except ImportError:
     METRICS_ENABLED = False
@@ -159,9 +229,29 @@ class HandlerRegistration:
     """Registration info for an event handler."""
 
     event_type: str
-    handler: Callable[[Dict[str, Any]], None]
+    handler: Callable[[Dict[str, Any]], Any]
     name: str
     priority: int = 0  # Higher priority handlers run first
+    # Returns a dedup key for an event; None falls back to the stream message ID
+    idempotency_key: Optional[Callable[["EventEnvelope"], Optional[str]]] = None
+    is_async: bool = False
+
+
+@dataclass
+class HandlerStats:
+    """Per-handler latency and lag statistics."""
+
+    invocations: int = 0
+    failures: int = 0
+    duplicates_skipped: int = 0
+    total_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+    last_lag_ms: float = 0.0
+    max_lag_ms: float = 0.0
+
+    @property
+    def avg_duration_ms(self) -> float:
+        return self.total_duration_ms / self.invocations if self.invocations else 0.0
 
 
 @dataclass
@@ -180,6 +270,96 @@ class EventReactorStats:
     heartbeats_missed: int = 0
     last_heartbeat_time: Optional[datetime] = None
     consecutive_missed_heartbeats: int = 0
+    # Streams mode delivery tracking
+    events_acked: int = 0
+    events_redelivered: int = 0
+    events_dead_lettered: int = 0
+    # Worker pool tracking
+    queue_depths: Dict[str, int] = field(default_factory=dict)
+    handler_stats: Dict[str, HandlerStats] = field(default_factory=dict)
+
+
+@dataclass
+class _DispatchItem:
+    """Unit of work handed to a worker pool."""
+
+    envelope: EventEnvelope
+    message_id: Optional[str] = None  # Stream message ID (streams mode)
+
+
+class _HandlerPool:
+    """Bounded queue drained by a fixed set of worker threads."""
+
+    _STOP = object()
+
+    def __init__(self, name: str, workers: int, queue_size: int, run: Callable[[_DispatchItem], None]):
+        self.name = name
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._run = run
+        self._threads = [
+            threading.Thread(target=self._worker, daemon=True, name=f"EventReactor-{name}-{i}")
+            for i in range(workers)
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, item: _DispatchItem, stop_event: threading.Event) -> bool:
+        """Enqueue, blocking while the queue is full (back-pressure)."""
+        while not stop_event.is_set():
+            try:
+                self._queue.put(item, timeout=0.5)
+                self._report_depth()
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def depth(self) -> int:
+        return self._queue.qsize()
+
+    def _report_depth(self) -> None:
+        if METRICS_ENABLED:
+            DISPATCH_QUEUE_DEPTH.labels(pool=self.name).set(self._queue.qsize())
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            try:
+                self._run(item)
+            except Exception as e:
+                logger.error("event_pool_worker_error", extra={"pool": self.name, "error": str(e)})
+            finally:
+                self._report_depth()
+
+    def shutdown(self, timeout: float) -> None:
+        """Drain queued work until the deadline, then stop workers.
+
+        Never blocks past the deadline on a full queue: work still queued
+        then is discarded to make room for the stop sentinels (un-ACKed
+        stream messages are redelivered later).
+        """
+        deadline = time.monotonic() + timeout
+        stops = len(self._threads)
+        dropped = 0
+        while stops:
+            try:
+                self._queue.put(self._STOP, timeout=max(0.0, deadline - time.monotonic()))
+                stops -= 1
+            except queue.Full:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    continue
+                if item is self._STOP:
+                    stops += 1  # still owed to a worker
+                else:
+                    dropped += 1
+        if dropped:
+            logger.warning("event_pool_shutdown_dropped", extra={"pool": self.name, "dropped": dropped})
+        for t in self._threads:
+            t.join(timeout=max(0.0, deadline - time.monotonic()))
 
 
 class EventReactor:
@@ -197,14 +377,37 @@ class EventReactor:
     - start() is blocking; use start_background() for async
     """
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        mode: Optional[str] = None,
+        workers_per_type: Optional[int] = None,
+        queue_size: Optional[int] = None,
+    ):
         """
         Initialize event reactor.
 
         Args:
             redis_url: Redis connection URL (defaults to REDIS_URL env var)
+            mode: "pubsub" or "streams" (defaults to EVENT_REACTOR_MODE)
+            workers_per_type: Worker threads per event-type pool, 0 for inline
+                dispatch (defaults to EVENT_REACTOR_WORKERS)
+            queue_size: Bound of each pool queue (defaults to EVENT_REACTOR_QUEUE_SIZE)
         """
         self._redis_url = redis_url or os.getenv("REDIS_URL", "")
+        self._mode = (mode or EVENT_REACTOR_MODE).lower()
+        if self._mode not in ("pubsub", "streams"):
+            raise ValueError(f"Unknown EVENT_REACTOR_MODE={self._mode}. Valid: pubsub, streams")
+        self._workers_per_type = EVENT_REACTOR_WORKERS if workers_per_type is None else workers_per_type
+        self._queue_size = queue_size or EVENT_REACTOR_QUEUE_SIZE
+        self._pools: Dict[str, _HandlerPool] = {}
+        self._pools_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._thread_local = threading.local()
+        self._last_claim_check = 0.0
+        # Stream message IDs queued or running locally; never reclaimed by this reactor
+        self._in_flight: Set[str] = set()
+        self._in_flight_lock = threading.Lock()
         self._handlers: Dict[str, List[HandlerRegistration]] = {}
         self._wildcard_handlers: List[HandlerRegistration] = []
         self._state = ReactorState.STOPPED
@@ -224,6 +427,11 @@ class EventReactor:
         """Current reactor state."""
         return self._state
 
+    @property
+    def mode(self) -> str:
+        """Transport mode ("pubsub" or "streams")."""
+        return self._mode
+
     @property
     def stats(self) -> EventReactorStats:
         """Current reactor statistics."""
@@ -231,6 +439,8 @@ class EventReactor:
             self._stats.uptime_seconds = (
                 datetime.now(timezone.utc) - self._stats.start_time
             ).total_seconds()
+        with self._pools_lock:
+            self._stats.queue_depths = {name: pool.depth() for name, pool in self._pools.items()}
         return self._stats
 
     def on(
@@ -265,18 +475,23 @@ class EventReactor:
     def register_handler(
         self,
         event_type: str,
-        handler: Callable[[Dict[str, Any]], None],
+        handler: Callable[[Dict[str, Any]], Any],
         name: Optional[str] = None,
         priority: int = 0,
+        idempotency_key: Optional[Callable[[EventEnvelope], Optional[str]]] = None,
     ) -> None:
         """
         Register an event handler.
 
         Args:
             event_type: Event type to handle ("*" for all events)
-            handler: Handler function (receives payload dict)
+            handler: Handler function or coroutine function (receives payload dict)
             name: Handler name for logging (defaults to function name)
             priority: Handler priority (higher runs first)
+            idempotency_key: Optional function deriving a dedup key from the
+                envelope. In streams mode a successful invocation is recorded
+                under this key (default: stream message ID) and skipped when
+                the event is delivered again.
         """
         handler_name = name or handler.__name__
         registration = HandlerRegistration(
@@ -284,6 +499,8 @@ class EventReactor:
             handler=handler,
             name=handler_name,
             priority=priority,
+            idempotency_key=idempotency_key,
+            is_async=inspect.iscoroutinefunction(handler),
         )
 
         if event_type == "*":
@@ -349,18 +566,28 @@ class EventReactor:
             self._state = ReactorState.STOPPED
             raise RuntimeError(f"Failed to connect to Redis: {e}")
 
-        # Subscribe to events channel
-        self._pubsub = self._client.pubsub()
-        assert self._pubsub is not None  # Type narrowing for Pyright
-        self._pubsub.subscribe(AOS_EVENTS_CHANNEL)
+        if self._mode == "streams":
+            # Durable consumer group on the events stream
+            try:
+                self._ensure_consumer_group()
+            except Exception as e:
+                self._state = ReactorState.STOPPED
+                raise RuntimeError(f"Failed to create consumer group {REACTOR_CONSUMER_GROUP}: {e}")
+        else:
+            # Subscribe to events channel
+            self._pubsub = self._client.pubsub()
+            assert self._pubsub is not None  # Type narrowing for Pyright
+            self._pubsub.subscribe(AOS_EVENTS_CHANNEL)
 
         self._state = ReactorState.RUNNING
         self._stats.start_time = datetime.now(timezone.utc)
         logger.info(
             "event_reactor_started",
             extra={
-                "channel": AOS_EVENTS_CHANNEL,
+                "mode": self._mode,
+                "channel": AOS_EVENTS_STREAM if self._mode == "streams" else AOS_EVENTS_CHANNEL,
                 "handlers": self._stats.handlers_registered,
+                "workers_per_type": self._workers_per_type,
             },
         )
 
@@ -368,7 +595,10 @@ class EventReactor:
         self._start_heartbeat_thread()
 
         # Main event loop
-        self._event_loop()
+        if self._mode == "streams":
+            self._stream_loop()
+        else:
+            self._event_loop()
 
     def start_background(self) -> threading.Thread:
         """
@@ -417,6 +647,8 @@ class EventReactor:
 
         Publishes heartbeat events and checks for reactor health.
         If the reactor misses too many heartbeats, triggers unhealthy callback.
+        In pubsub mode the published heartbeat keeps last_event_time fresh; in
+        streams mode the XREADGROUP loop refreshes it after every read.
         """
         while not self._stop_event.is_set():
             try:
@@ -535,6 +767,13 @@ class EventReactor:
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=timeout / 2)
 
+        # Drain worker pools (un-ACKed stream messages are redelivered later)
+        with self._pools_lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.shutdown(timeout=timeout / 2)
+
         # Cleanup
         if self._pubsub:
             try:
@@ -590,20 +829,263 @@ class EventReactor:
                 if METRICS_ENABLED:
                     EVENTS_RECEIVED.labels(event_type=envelope.event_type).inc()
 
-                # Dispatch to handlers
-                self._dispatch_event(envelope)
+                # Dispatch to handlers (inline or via worker pool)
+                self._submit(envelope)
 
             except Exception as e:
                 logger.error("event_loop_error", extra={"error": str(e)})
                 # Brief pause on error to avoid tight loop
                 time.sleep(0.1)
 
-    def _dispatch_event(self, envelope: EventEnvelope) -> None:
+    # =========================================================================
+    # Streams mode
+    # =========================================================================
+
+    def _ensure_consumer_group(self) -> None:
+        """Create the consumer group (and stream) if missing."""
+        try:
+            self._client.xgroup_create(  # type: ignore[union-attr]
+                AOS_EVENTS_STREAM,
+                REACTOR_CONSUMER_GROUP,
+                id="$",
+                mkstream=True,
+            )
+            logger.info(
+                "event_reactor_consumer_group_created",
+                extra={"stream": AOS_EVENTS_STREAM, "group": REACTOR_CONSUMER_GROUP},
+            )
+        except Exception as e:
+            # BUSYGROUP means group already exists - that's OK
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    def _stream_loop(self) -> None:
+        """Main loop for streams mode: reclaim stalled, then read new messages."""
+        while not self._stop_event.is_set():
+            try:
+                now = time.monotonic()
+                if now - self._last_claim_check >= REACTOR_CLAIM_INTERVAL_SECONDS:
+                    self._last_claim_check = now
+                    self._reclaim_stalled()
+
+                response = self._client.xreadgroup(  # type: ignore[union-attr]
+                    REACTOR_CONSUMER_GROUP,
+                    REACTOR_CONSUMER_NAME,
+                    {AOS_EVENTS_STREAM: ">"},
+                    count=REACTOR_STREAM_BATCH_SIZE,
+                    block=REACTOR_STREAM_BLOCK_MS,
+                )
+                # The heartbeat goes to the pub/sub channel, which this loop never
+                # reads: every completed XREADGROUP, empty or not, is the liveness signal
+                with self._stats_lock:
+                    self._stats.last_event_time = datetime.now(timezone.utc)
+                for _stream, messages in response or []:
+                    for message_id, fields in messages:
+                        self._handle_stream_message(message_id, fields)
+
+            except Exception as e:
+                logger.error("event_stream_loop_error", extra={"error": str(e)})
+                # Brief pause on error to avoid tight loop
+                time.sleep(0.1)
+
+    def _handle_stream_message(self, message_id: str, fields: Dict[str, Any]) -> None:
+        """Parse a stream entry and dispatch it; unparseable entries are ACKed."""
+        envelope = EventEnvelope.from_message(fields.get("data", ""))
+        if envelope is None:
+            self._ack(message_id)
+            return
+
+        with self._stats_lock:
+            self._stats.events_received += 1
+            self._stats.last_event_time = datetime.now(timezone.utc)
+
+        if METRICS_ENABLED:
+            EVENTS_RECEIVED.labels(event_type=envelope.event_type).inc()
+
+        self._submit(envelope, message_id)
+
+    def _reclaim_stalled(self) -> None:
+        """
+        Reclaim messages pending longer than REACTOR_CLAIM_IDLE_MS.
+
+        Covers consumers that crashed before ACK and handlers that failed.
+        Messages delivered REACTOR_MAX_DELIVERIES times are dead-lettered.
+        Messages still queued or running in this reactor's pools are skipped.
+        """
+        with self._in_flight_lock:
+            in_flight = set(self._in_flight)
+        pending = self._client.xpending_range(  # type: ignore[union-attr]
+            AOS_EVENTS_STREAM,
+            REACTOR_CONSUMER_GROUP,
+            min="-",
+            max="+",
+            count=REACTOR_STREAM_BATCH_SIZE + len(in_flight),
+            idle=REACTOR_CLAIM_IDLE_MS,
+        )
+        if not pending:
+            return
+
+        to_claim = []
+        for entry in pending:
+            message_id = entry["message_id"]
+            if message_id in in_flight:
+                # Still waiting in a local pool queue; reclaiming would run it twice
+                continue
+            if entry.get("times_delivered", 0) >= REACTOR_MAX_DELIVERIES:
+                self._dead_letter(message_id, entry.get("times_delivered", 0))
+            else:
+                to_claim.append(message_id)
+
+        if not to_claim:
+            return
+
+        claimed = self._client.xclaim(  # type: ignore[union-attr]
+            AOS_EVENTS_STREAM,
+            REACTOR_CONSUMER_GROUP,
+            REACTOR_CONSUMER_NAME,
+            min_idle_time=REACTOR_CLAIM_IDLE_MS,
+            message_ids=to_claim,
+        )
+        for message_id, fields in claimed or []:
+            if fields is None:
+                # Entry was trimmed from the stream; nothing left to deliver
+                self._ack(message_id)
+                continue
+            with self._stats_lock:
+                self._stats.events_redelivered += 1
+            if METRICS_ENABLED:
+                EVENTS_REDELIVERED.inc()
+            self._handle_stream_message(message_id, fields)
+
+    def _dead_letter(self, message_id: str, times_delivered: int) -> None:
+        """Copy a poison message to the dead-letter stream and ACK it."""
+        try:
+            entries = self._client.xrange(AOS_EVENTS_STREAM, min=message_id, max=message_id)  # type: ignore[union-attr]
+            fields = dict(entries[0][1]) if entries else {}
+            fields.update(
+                {
+                    "original_id": message_id,
+                    "times_delivered": str(times_delivered),
+                    "dead_lettered_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            self._client.xadd(  # type: ignore[union-attr]
+                REACTOR_DEAD_LETTER_STREAM,
+                fields,
+                maxlen=REACTOR_DEAD_LETTER_MAX_LEN,
+                approximate=True,
+            )
+            self._ack(message_id)
+            with self._stats_lock:
+                self._stats.events_dead_lettered += 1
+            if METRICS_ENABLED:
+                EVENTS_DEAD_LETTERED.inc()
+            logger.warning(
+                "event_dead_lettered",
+                extra={"message_id": message_id, "times_delivered": times_delivered},
+            )
+        except Exception as e:
+            logger.error("event_dead_letter_failed", extra={"message_id": message_id, "error": str(e)})
+
+    def _ack(self, message_id: str) -> None:
+        try:
+            if self._client.xack(AOS_EVENTS_STREAM, REACTOR_CONSUMER_GROUP, message_id):  # type: ignore[union-attr]
+                with self._stats_lock:
+                    self._stats.events_acked += 1
+        except Exception as e:
+            logger.error("event_ack_failed", extra={"message_id": message_id, "error": str(e)})
+
+    # =========================================================================
+    # Idempotency
+    # =========================================================================
+
+    def _idempotency_marker(
+        self, registration: HandlerRegistration, envelope: EventEnvelope, message_id: Optional[str]
+    ) -> Optional[str]:
+        """Redis key recording that a handler completed this event, if dedup applies."""
+        key = registration.idempotency_key(envelope) if registration.idempotency_key else None
+        key = key or message_id
+        if key is None or self._client is None:
+            return None
+        return f"{REACTOR_IDEMPOTENCY_PREFIX}:{registration.name}:{key}"
+
+    def _already_handled(self, marker: Optional[str]) -> bool:
+        if marker is None:
+            return False
+        try:
+            return bool(self._client.exists(marker))  # type: ignore[union-attr]
+        except Exception:
+            # Fail open: at-least-once allows re-running the handler
+            return False
+
+    def _mark_handled(self, marker: Optional[str]) -> None:
+        if marker is None:
+            return
+        try:
+            self._client.set(marker, "1", ex=REACTOR_IDEMPOTENCY_TTL_SECONDS)  # type: ignore[union-attr]
+        except Exception as e:
+            logger.warning("event_idempotency_mark_failed", extra={"marker": marker, "error": str(e)})
+
+    # =========================================================================
+    # Dispatch
+    # =========================================================================
+
+    def _submit(self, envelope: EventEnvelope, message_id: Optional[str] = None) -> None:
+        """Route an event to its worker pool, or dispatch inline when pools are disabled."""
+        if self._workers_per_type <= 0:
+            self._run_item(_DispatchItem(envelope=envelope, message_id=message_id))
+            return
+
+        if not self._handlers.get(envelope.event_type) and not self._wildcard_handlers:
+            logger.debug("event_no_handlers", extra={"event_type": envelope.event_type})
+            if message_id is not None:
+                self._ack(message_id)
+            return
+
+        if message_id is not None:
+            with self._in_flight_lock:
+                if message_id in self._in_flight:
+                    return
+                self._in_flight.add(message_id)
+        pool = self._get_pool(envelope.event_type)
+        if not pool.submit(_DispatchItem(envelope=envelope, message_id=message_id), self._stop_event):
+            self._release(message_id)
+
+    def _get_pool(self, event_type: str) -> _HandlerPool:
+        """Pool for an event type; wildcard-only types share the "*" pool."""
+        pool_name = event_type if event_type in self._handlers else "*"
+        with self._pools_lock:
+            pool = self._pools.get(pool_name)
+            if pool is None:
+                pool = _HandlerPool(pool_name, self._workers_per_type, self._queue_size, self._run_item)
+                self._pools[pool_name] = pool
+            return pool
+
+    def _run_item(self, item: _DispatchItem) -> None:
+        """Run all handlers for an item and ACK it if every handler succeeded."""
+        try:
+            succeeded = self._dispatch_event(item.envelope, item.message_id)
+            if item.message_id is not None and succeeded:
+                self._ack(item.message_id)
+        finally:
+            self._release(item.message_id)
+
+    def _release(self, message_id: Optional[str]) -> None:
+        """Make a stream message reclaimable again (no longer in a local pool)."""
+        if message_id is not None:
+            with self._in_flight_lock:
+                self._in_flight.discard(message_id)
+
+    def _dispatch_event(self, envelope: EventEnvelope, message_id: Optional[str] = None) -> bool:
         """
         Dispatch event to registered handlers.
 
         Args:
             envelope: Parsed event envelope
+            message_id: Stream message ID (streams mode), used for idempotency
+
+        Returns:
+            True if every handler succeeded (or was skipped as a duplicate)
         """
         # Get handlers for this event type + wildcard handlers
         handlers = list(self._handlers.get(envelope.event_type, []))
@@ -615,15 +1097,23 @@ class EventReactor:
                 "event_no_handlers",
                 extra={"event_type": envelope.event_type},
             )
-            return
+            return True
 
+        all_succeeded = True
         for registration in handlers:
+            marker = self._idempotency_marker(registration, envelope, message_id)
+            if self._already_handled(marker):
+                self._record_duplicate(registration)
+                continue
+
+            lag = max(0.0, (datetime.now(timezone.utc) - envelope.timestamp).total_seconds())
             try:
                 start_time = time.time()
-                registration.handler(envelope.payload)
+                self._invoke(registration, envelope.payload)
                 duration = time.time() - start_time
 
-                self._stats.events_handled += 1
+                self._mark_handled(marker)
+                self._record_handler(registration, duration, lag, failed=False)
 
                 if METRICS_ENABLED:
                     EVENTS_HANDLED.labels(
@@ -634,6 +1124,10 @@ class EventReactor:
                         event_type=envelope.event_type,
                         handler=registration.name,
                     ).observe(duration)
+                    HANDLER_LAG.labels(
+                        event_type=envelope.event_type,
+                        handler=registration.name,
+                    ).observe(lag)
 
                 logger.debug(
                     "event_handled",
@@ -645,7 +1139,8 @@ class EventReactor:
                 )
 
             except Exception as e:
-                self._stats.events_failed += 1
+                all_succeeded = False
+                self._record_handler(registration, time.time() - start_time, lag, failed=True)
 
                 if METRICS_ENABLED:
                     EVENTS_FAILED.labels(
@@ -662,6 +1157,44 @@ class EventReactor:
                     },
                 )
 
+        return all_succeeded
+
+    def _invoke(self, registration: HandlerRegistration, payload: Dict[str, Any]) -> None:
+        """Call a handler; coroutine handlers run on this thread's event loop."""
+        if not registration.is_async:
+            registration.handler(payload)
+            return
+
+        loop = getattr(self._thread_local, "loop", None)
+        if loop is None:
+            loop = asyncio.new_event_loop()
+            self._thread_local.loop = loop
+        loop.run_until_complete(registration.handler(payload))
+
+    def _record_handler(self, registration: HandlerRegistration, duration: float, lag: float, failed: bool) -> None:
+        duration_ms = duration * 1000
+        lag_ms = lag * 1000
+        with self._stats_lock:
+            if failed:
+                self._stats.events_failed += 1
+            else:
+                self._stats.events_handled += 1
+            hs = self._stats.handler_stats.setdefault(registration.name, HandlerStats())
+            hs.invocations += 1
+            hs.failures += int(failed)
+            hs.total_duration_ms += duration_ms
+            hs.max_duration_ms = max(hs.max_duration_ms, duration_ms)
+            hs.last_lag_ms = lag_ms
+            hs.max_lag_ms = max(hs.max_lag_ms, lag_ms)
+
+    def _record_duplicate(self, registration: HandlerRegistration) -> None:
+        with self._stats_lock:
+            hs = self._stats.handler_stats.setdefault(registration.name, HandlerStats())
+            hs.duplicates_skipped += 1
+        if METRICS_ENABLED:
+            EVENTS_DUPLICATE_SKIPPED.labels(handler=registration.name).inc()
+        logger.debug("event_duplicate_skipped", extra={"handler": registration.name})
+
 
 # Singleton instance
 _reactor_instance: Optional[EventReactor] = None
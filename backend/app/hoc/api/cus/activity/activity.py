@@ -41,6 +41,12 @@ V1 Endpoints (Legacy):
 - GET /activity/attention-queue   → SIG-O5 attention ranking
 - GET /activity/risk-signals      → Risk signal aggregates
 
+Pagination (/runs, /live, /completed, /signals, /threshold-signals):
+- offset (default): LIMIT/OFFSET in the endpoint's sort order
+- cursor: pagination=cursor for the first page, then cursor=<next_cursor>;
+  ordered by (created_at, run_id), constant cost at any depth
+- count_mode: exact (default) | estimated | cached, for `total`
+
 Architecture:
 - ONE facade for all ACTIVITY needs
 - Uses v_runs_o2 view (pre-computed risk, latency, evidence, policy context)
@@ -184,6 +190,21 @@ class SortOrder(str, Enum):
     DESC = "desc"
 
 
+class PaginationMode(str, Enum):
+    """Listing pagination mode."""
+
+    OFFSET = "offset"
+    CURSOR = "cursor"
+
+
+class CountMode(str, Enum):
+    """How `total` is computed."""
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"  # planner estimate for large result sets
+    CACHED = "cached"  # exact, reused for a few seconds
+
+
 class EvaluationOutcome(str, Enum):
     """Policy evaluation outcome."""
 
@@ -312,6 +333,8 @@ class Pagination(BaseModel):
     limit: int
     offset: int
     next_offset: int | None = None
+    next_cursor: str | None = None
+    count_mode: str = CountMode.EXACT.value
 
 
 class LiveRunsResponse(BaseModel):
@@ -398,6 +421,8 @@ class SignalsResponse(BaseModel):
     signals: list[SignalProjection]
     total: int
     generated_at: datetime
+    next_cursor: str | None = None
+    count_mode: str = CountMode.EXACT.value
 
 
 class MetricsResponse(BaseModel):
@@ -460,6 +485,8 @@ class ThresholdSignalsResponse(BaseModel):
     total: int
     risk_type_filter: str | None
     generated_at: datetime
+    next_cursor: str | None = None
+    count_mode: str = CountMode.EXACT.value
 
 
 # =============================================================================
@@ -793,6 +820,51 @@ def _normalize_as_of(as_of: str | None) -> str:
     return datetime.utcnow().isoformat() + "Z"
 
 
+# =============================================================================
+# Pagination
+# =============================================================================
+
+PaginationQuery = Annotated[
+    PaginationMode,
+    Query(description="offset, or cursor for keyset pagination ordered by (created_at, run_id)"),
+]
+CursorQuery = Annotated[
+    str | None,
+    Query(max_length=512, description="next_cursor from the previous page (implies pagination=cursor)"),
+]
+CountModeQuery = Annotated[CountMode, Query(description="How total is computed")]
+
+
+def _page_params(pagination: PaginationMode, cursor: str | None, offset: int, count_mode: CountMode) -> dict[str, Any]:
+    """Registry params for the pagination query parameters."""
+    if (pagination == PaginationMode.CURSOR or cursor) and offset:
+        raise HTTPException(
+            status_code=400,
+            detail={"error": "invalid_pagination", "message": "offset cannot be combined with cursor pagination"},
+        )
+    return {"pagination": pagination.value, "cursor": cursor, "count_mode": count_mode.value}
+
+
+def _raise_for_listing(op: Any) -> None:
+    """Map a failed listing operation to an HTTP error."""
+    if op.error_code == "INVALID_CURSOR":
+        raise HTTPException(status_code=400, detail={"error": "invalid_cursor", "message": op.error})
+    raise HTTPException(status_code=500, detail={"error": "operation_failed", "message": op.error})
+
+
+def _pagination(limit: int, offset: int, result: Any) -> Pagination:
+    """Pagination metadata for a run listing result."""
+    next_cursor = getattr(result, "next_cursor", None)
+    next_offset = offset + limit if result.has_more and next_cursor is None else None
+    return Pagination(
+        limit=limit,
+        offset=offset,
+        next_offset=next_offset,
+        next_cursor=next_cursor,
+        count_mode=getattr(result, "count_mode", CountMode.EXACT.value),
+    )
+
+
 # =============================================================================
 # GET /runs - O2 List
 # =============================================================================
@@ -850,11 +922,15 @@ async def list_runs(
     # Sorting
     sort_by: Annotated[SortField, Query(description="Field to sort by")] = SortField.STARTED_AT,
     sort_order: Annotated[SortOrder, Query(description="Sort direction")] = SortOrder.DESC,
+    pagination: PaginationQuery = PaginationMode.OFFSET,
+    cursor: CursorQuery = None,
+    count_mode: CountModeQuery = CountMode.EXACT,
     # Dependencies
     session = Depends(get_session_dep),
 ) -> RunListResponse:
     """List runs with unified query filters. READ-ONLY from v_runs_o2 view."""
 
+    page_params = _page_params(pagination, cursor, offset, count_mode)
     tenant_id = get_tenant_id_from_auth(request)
 
     # DEPRECATION: Use /activity/live or /activity/completed instead
@@ -894,11 +970,12 @@ async def list_runs(
                 "offset": offset,
                 "sort_by": sort_by.value,
                 "sort_order": sort_order.value,
+                **page_params,
             },
         ),
     )
     if not op.success:
-        raise HTTPException(status_code=500, detail={"error": "operation_failed", "message": op.error})
+        _raise_for_listing(op)
 
     result = op.data
     items = [
@@ -929,15 +1006,12 @@ async def list_runs(
         for item in result.items
     ]
 
-    has_more = result.has_more
-    next_offset = offset + limit if has_more else None
-
     return RunListResponse(
         items=items,
         total=result.total,
-        has_more=has_more,
+        has_more=result.has_more,
         filters_applied=result.filters_applied,
-        pagination=Pagination(limit=limit, offset=offset, next_offset=next_offset),
+        pagination=_pagination(limit, offset, result),
     )
 
 
@@ -1744,6 +1818,9 @@ async def list_live_runs(
     # Pagination
     limit: Annotated[int, Query(ge=1, le=200, description="Max runs to return")] = 50,
     offset: Annotated[int, Query(ge=0, description="Number of runs to skip")] = 0,
+    pagination: PaginationQuery = PaginationMode.OFFSET,
+    cursor: CursorQuery = None,
+    count_mode: CountModeQuery = CountMode.EXACT,
     # UC-MON Determinism
     as_of: Annotated[str | None, Query(description="Deterministic read watermark (ISO-8601 UTC)")] = None,
     # Dependencies
@@ -1756,6 +1833,7 @@ async def list_live_runs(
     This is the canonical endpoint for the LIVE topic.
     """
 
+    page_params = _page_params(pagination, cursor, offset, count_mode)
     tenant_id = get_tenant_id_from_auth(request)
     effective_as_of = _normalize_as_of(as_of)
 
@@ -1776,23 +1854,21 @@ async def list_live_runs(
                 "provider_type": [p.value for p in provider_type] if provider_type else None,
                 "limit": limit,
                 "offset": offset,
+                **page_params,
             },
         ),
     )
     if not op.success:
-        raise HTTPException(status_code=500, detail={"error": "operation_failed", "message": op.error})
+        _raise_for_listing(op)
 
     result = op.data
     items = [_run_summary_v2_from_l5(item) for item in result.items]
 
-    has_more = result.has_more
-    next_offset = offset + limit if has_more else None
-
     return LiveRunsResponse(
         items=items,
         total=result.total,
-        has_more=has_more,
-        pagination=Pagination(limit=limit, offset=offset, next_offset=next_offset),
+        has_more=result.has_more,
+        pagination=_pagination(limit, offset, result),
         generated_at=datetime.utcnow(),
     )
 
@@ -1834,6 +1910,9 @@ async def list_completed_runs(
     # Sort
     sort_by: Annotated[SortField, Query(description="Field to sort by")] = SortField.COMPLETED_AT,
     sort_order: Annotated[SortOrder, Query(description="Sort direction")] = SortOrder.DESC,
+    pagination: PaginationQuery = PaginationMode.OFFSET,
+    cursor: CursorQuery = None,
+    count_mode: CountModeQuery = CountMode.EXACT,
     # UC-MON Determinism
     as_of: Annotated[str | None, Query(description="Deterministic read watermark (ISO-8601 UTC)")] = None,
     # Dependencies
@@ -1846,6 +1925,7 @@ async def list_completed_runs(
     This is the canonical endpoint for the COMPLETED topic.
     """
 
+    page_params = _page_params(pagination, cursor, offset, count_mode)
     tenant_id = get_tenant_id_from_auth(request)
     effective_as_of = _normalize_as_of(as_of)
 
@@ -1868,23 +1948,21 @@ async def list_completed_runs(
                 "offset": offset,
                 "sort_by": sort_by.value,
                 "sort_order": sort_order.value,
+                **page_params,
             },
         ),
     )
     if not op.success:
-        raise HTTPException(status_code=500, detail={"error": "operation_failed", "message": op.error})
+        _raise_for_listing(op)
 
     result = op.data
     items = [_run_summary_v2_from_l5(item) for item in result.items]
 
-    has_more = result.has_more
-    next_offset = offset + limit if has_more else None
-
     return CompletedRunsResponse(
         items=items,
         total=result.total,
-        has_more=has_more,
-        pagination=Pagination(limit=limit, offset=offset, next_offset=next_offset),
+        has_more=result.has_more,
+        pagination=_pagination(limit, offset, result),
         generated_at=datetime.utcnow(),
     )
 
@@ -1919,6 +1997,9 @@ async def list_signals(
     severity: Annotated[str | None, Query(description="Filter by severity (HIGH, MEDIUM, LOW)")] = None,
     # Pagination
     limit: Annotated[int, Query(ge=1, le=100, description="Max signals to return")] = 20,
+    pagination: PaginationQuery = PaginationMode.OFFSET,
+    cursor: CursorQuery = None,
+    count_mode: CountModeQuery = CountMode.EXACT,
     # UC-MON Determinism
     as_of: Annotated[str | None, Query(description="Deterministic read watermark (ISO-8601 UTC)")] = None,
     # Dependencies
@@ -1931,6 +2012,7 @@ async def list_signals(
     SIGNALS is NOT a run state - it's a computed projection.
     """
 
+    page_params = _page_params(pagination, cursor, 0, count_mode)
     tenant_id = get_tenant_id_from_auth(request)
     effective_as_of = _normalize_as_of(as_of)
 
@@ -1948,11 +2030,12 @@ async def list_signals(
                 "signal_type": signal_type,
                 "severity": severity,
                 "limit": limit,
+                **page_params,
             },
         ),
     )
     if not op.success:
-        raise HTTPException(status_code=500, detail={"error": "operation_failed", "message": op.error})
+        _raise_for_listing(op)
 
     result = op.data
     signals = []
@@ -1982,6 +2065,8 @@ async def list_signals(
         signals=signals,
         total=result.total,
         generated_at=datetime.utcnow(),
+        next_cursor=result.next_cursor,
+        count_mode=result.count_mode,
     )
 
 
@@ -2075,6 +2160,9 @@ async def get_threshold_signals(
     state: Annotated[RunState | None, Query(description="Filter by run state")] = None,
     # Pagination
     limit: Annotated[int, Query(ge=1, le=100, description="Max signals to return")] = 20,
+    pagination: PaginationQuery = PaginationMode.OFFSET,
+    cursor: CursorQuery = None,
+    count_mode: CountModeQuery = CountMode.EXACT,
     # Dependencies
     session = Depends(get_session_dep),
 ) -> ThresholdSignalsResponse:
@@ -2085,6 +2173,7 @@ async def get_threshold_signals(
     Can be filtered by risk_type (COST, TIME, TOKENS, RATE).
     """
 
+    page_params = _page_params(pagination, cursor, 0, count_mode)
     tenant_id = get_tenant_id_from_auth(request)
 
     # Route through L4 registry
@@ -2100,11 +2189,12 @@ async def get_threshold_signals(
                 "evaluation_outcome": evaluation_outcome.value if evaluation_outcome else None,
                 "state": state.value if state else None,
                 "limit": limit,
+                **page_params,
             },
         ),
     )
     if not op.success:
-        raise HTTPException(status_code=500, detail={"error": "operation_failed", "message": op.error})
+        _raise_for_listing(op)
 
     result = op.data
     signals = [
@@ -2123,6 +2213,8 @@ async def get_threshold_signals(
         total=result.total,
         risk_type_filter=risk_type.value if risk_type else None,
         generated_at=datetime.utcnow(),
+        next_cursor=result.next_cursor,
+        count_mode=result.count_mode,
     )
 
 
@@ -18,7 +18,9 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, ValidationError
 
 from app.hoc.api.cus.activity.activity import (
+    CountMode,
     EvidenceHealth,
+    PaginationMode,
     ProviderType,
     RiskLevel,
     RunSource,
@@ -42,6 +44,8 @@ class RunsPagination(BaseModel):
     limit: int
     offset: int
     next_offset: int | None = None
+    next_cursor: str | None = None
+    count_mode: str = CountMode.EXACT.value
 
 
 class RunsMeta(BaseModel):
@@ -72,6 +76,9 @@ _LIVE_ALLOWED = {
     "provider_type",
     "limit",
     "offset",
+    "pagination",
+    "cursor",
+    "count_mode",
 }
 
 _COMPLETED_ALLOWED = {
@@ -83,8 +90,13 @@ _COMPLETED_ALLOWED = {
     "completed_before",
     "limit",
     "offset",
+    "pagination",
+    "cursor",
+    "count_mode",
 }
 
+_MAX_CURSOR_LENGTH = 512
+
 
 def _to_rfc3339z(value: datetime | None) -> str:
     if value is None:
@@ -177,6 +189,18 @@ def _dedupe(values: list[str]) -> list[str]:
     return deduped
 
 
+def _parse_enum(query_params, name: str, enum_cls: type[Enum], default: Enum, field_errors: list[dict[str, str]]) -> Enum:
+    raw = _single_value(query_params, name, field_errors)
+    if raw is None:
+        return default
+    try:
+        return enum_cls(raw)
+    except ValueError:
+        allowed = ", ".join([member.value for member in enum_cls])
+        field_errors.append({"field": name, "reason": f"invalid value '{raw}'. Allowed: {allowed}"})
+        return default
+
+
 def _parse_enum_list(query_params, name: str, enum_cls: type[Enum], field_errors: list[dict[str, str]]) -> list[str] | None:
     raw_values = query_params.getlist(name)
     if not raw_values:
@@ -251,6 +275,14 @@ async def list_runs_facade(
         field_errors=field_errors,
     )
 
+    pagination = _parse_enum(query_params, "pagination", PaginationMode, PaginationMode.OFFSET, field_errors)
+    count_mode = _parse_enum(query_params, "count_mode", CountMode, CountMode.EXACT, field_errors)
+    cursor = _single_value(query_params, "cursor", field_errors)
+    if cursor is not None and not 0 < len(cursor) <= _MAX_CURSOR_LENGTH:
+        field_errors.append({"field": "cursor", "reason": f"must be 1..{_MAX_CURSOR_LENGTH} characters"})
+    if (pagination == PaginationMode.CURSOR or cursor) and offset:
+        field_errors.append({"field": "offset", "reason": "cannot be combined with cursor pagination"})
+
     project_id = _single_value(query_params, "project_id", field_errors)
 
     risk_level = _parse_enum_list(query_params, "risk_level", RiskLevel, field_errors)
@@ -285,6 +317,9 @@ async def list_runs_facade(
             "offset": offset,
             "sort_by": "started_at",
             "sort_order": "desc",
+            "pagination": pagination.value,
+            "cursor": cursor,
+            "count_mode": count_mode.value,
         }
     else:
         params = {
@@ -298,6 +333,9 @@ async def list_runs_facade(
             "offset": offset,
             "sort_by": "completed_at",
             "sort_order": "desc",
+            "pagination": pagination.value,
+            "cursor": cursor,
+            "count_mode": count_mode.value,
         }
 
     registry = get_operation_registry()
@@ -311,6 +349,8 @@ async def list_runs_facade(
     )
 
     if not op.success:
+        if op.error_code == "INVALID_CURSOR":
+            _invalid_query([{"field": "cursor", "reason": op.error or "invalid cursor"}])
         raise HTTPException(
             status_code=500,
             detail={
@@ -334,9 +374,15 @@ async def list_runs_facade(
         )
 
     total = int(getattr(result, "total", 0))
-    # PR-1 contract: derive has_more from page math, not backend-provided flags.
-    has_more = (offset + len(runs)) < total
-    next_offset = offset + len(runs) if has_more else None
+    next_cursor = getattr(result, "next_cursor", None)
+    if pagination == PaginationMode.CURSOR or cursor:
+        # Keyset pages: another page exists exactly when a cursor was issued
+        has_more = next_cursor is not None
+        next_offset = None
+    else:
+        # PR-1 contract: derive has_more from page math, not backend-provided flags.
+        has_more = (offset + len(runs)) < total
+        next_offset = offset + len(runs) if has_more else None
 
     request_id = getattr(request.state, "request_id", None)
     if not request_id:
@@ -356,7 +402,13 @@ async def list_runs_facade(
         runs=runs,
         total=total,
         has_more=has_more,
-        pagination=RunsPagination(limit=limit, offset=offset, next_offset=next_offset),
+        pagination=RunsPagination(
+            limit=limit,
+            offset=offset,
+            next_offset=next_offset,
+            next_cursor=next_cursor,
+            count_mode=count_mode.value,
+        ),
         generated_at=generated_at,
         meta=RunsMeta(request_id=request_id, correlation_id=correlation_id, as_of=None),
     )
@@ -45,6 +45,7 @@ from enum import Enum
 from typing import Annotated, Any, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from app.auth.gateway_middleware import get_auth_context
@@ -1682,6 +1683,30 @@ class ExportRequest(BaseModel):
     prepared_for: Optional[str] = None  # For executive debrief
 
 
+def _pdf_response(pdf_op: Any, filename: str) -> StreamingResponse:
+    """Stream a logs.pdf RenderedReport; a full render queue is 503."""
+    if not pdf_op.success:
+        if pdf_op.error_code == "RENDER_QUEUE_FULL":
+            raise HTTPException(
+                status_code=503,
+                detail={"error": "render_queue_full", "message": pdf_op.error},
+                headers={"Retry-After": "5"},
+            )
+        raise HTTPException(
+            status_code=500,
+            detail={"error": "operation_failed", "message": pdf_op.error},
+        )
+    report = pdf_op.data
+    return StreamingResponse(
+        report.stream(),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(report.size),
+        },
+    )
+
+
 @router.post(
     "/{incident_id}/export/evidence",
     summary="Export evidence bundle",
@@ -1701,8 +1726,6 @@ async def export_evidence(
     export_request: ExportRequest,
 ) -> Any:
     """Export incident evidence bundle."""
-    from fastapi.responses import Response
-
     tenant_id = get_tenant_id_from_auth(request)
     auth_ctx = get_auth_context(request)
     exported_by = getattr(auth_ctx, "user_id", "system") if auth_ctx else "system"
@@ -1751,19 +1774,7 @@ async def export_evidence(
                     params={"method": "render_evidence_pdf", "bundle": bundle},
                 ),
             )
-            if not pdf_op.success:
-                raise HTTPException(
-                    status_code=500,
-                    detail={"error": "operation_failed", "message": pdf_op.error},
-                )
-            pdf_bytes = pdf_op.data
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={
-                    "Content-Disposition": f'attachment; filename="evidence_{incident_id}.pdf"'
-                },
-            )
+            return _pdf_response(pdf_op, f"evidence_{incident_id}.pdf")
 
         return wrap_dict(bundle.model_dump(mode="json"))
 
@@ -1794,8 +1805,6 @@ async def export_soc2(
     export_request: ExportRequest,
 ) -> Any:
     """Export SOC2-compliant bundle as PDF."""
-    from fastapi.responses import Response
-
     tenant_id = get_tenant_id_from_auth(request)
     auth_ctx = get_auth_context(request)
     exported_by = getattr(auth_ctx, "user_id", "system") if auth_ctx else "system"
@@ -1843,19 +1852,7 @@ async def export_soc2(
                     params={"method": "render_soc2_pdf", "bundle": bundle},
                 ),
             )
-            if not pdf_op.success:
-                raise HTTPException(
-                    status_code=500,
-                    detail={"error": "operation_failed", "message": pdf_op.error},
-                )
-            pdf_bytes = pdf_op.data
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={
-                    "Content-Disposition": f'attachment; filename="soc2_{incident_id}.pdf"'
-                },
-            )
+            return _pdf_response(pdf_op, f"soc2_{incident_id}.pdf")
 
         return wrap_dict(bundle.model_dump(mode="json"))
 
@@ -1887,8 +1884,6 @@ async def export_executive_debrief(
     export_request: ExportRequest,
 ) -> Any:
     """Export executive debrief as PDF."""
-    from fastapi.responses import Response
-
     tenant_id = get_tenant_id_from_auth(request)
     auth_ctx = get_auth_context(request)
     prepared_by = getattr(auth_ctx, "user_id", "system") if auth_ctx else "system"
@@ -1937,19 +1932,7 @@ async def export_executive_debrief(
                     params={"method": "render_executive_debrief_pdf", "bundle": bundle},
                 ),
             )
-            if not pdf_op.success:
-                raise HTTPException(
-                    status_code=500,
-                    detail={"error": "operation_failed", "message": pdf_op.error},
-                )
-            pdf_bytes = pdf_op.data
-            return Response(
-                content=pdf_bytes,
-                media_type="application/pdf",
-                headers={
-                    "Content-Disposition": f'attachment; filename="debrief_{incident_id}.pdf"'
-                },
-            )
+            return _pdf_response(pdf_op, f"debrief_{incident_id}.pdf")
 
         return wrap_dict(bundle.model_dump(mode="json"))
 
@@ -0,0 +1,249 @@
+# Layer: L2 — Product APIs
+# Product: ai-console (Customer Console)
+# Temporal:
+#   Trigger: external (HTTP)
+#   Execution: async (request-response)
+# Role: Batched console reads (many read operations, one request, one snapshot)
+# Callers: Customer Console frontend (dashboard pages)
+# Allowed Imports: L3, L4
+# Forbidden Imports: L1, L5, L6 (direct)
+
+"""
+Console batch read endpoint.
+
+A console page issues a dozen or more small reads on load. POST
+/cus/overview/batch runs them in one request through
+OperationRegistry.execute_many(): one auth/tenant resolution, one
+authority check, one read-only snapshot shared by up to
+BATCH_SESSION_LANES sessions, and the operations run concurrently. Each
+item gets its own result; one failing read does not fail the others.
+
+Only the read methods in BATCHABLE_READS can be batched. Each distinct
+(resource, action) permission they need is checked once per request.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, Field
+
+from app.auth.authorization_choke import check_permission_request
+from app.hoc.api.cus.overview.overview import get_tenant_id_from_auth
+from app.hoc.cus.hoc_spine.orchestrator.operation_registry import (
+    BatchOperation,
+    get_operation_registry,
+    get_read_session_factory,
+    get_session_dep,
+)
+
+MAX_BATCH_ITEMS = 25
+MAX_ITEM_LIMIT = 200
+# Sessions (pool connections) one batch may read through
+BATCH_SESSION_LANES = 4
+
+# operation -> (resource, action, read methods that may be batched)
+BATCHABLE_READS: dict[str, tuple[str, str, frozenset[str]]] = {
+    "overview.query": (
+        "runtime",
+        "query",
+        frozenset({"get_highlights", "get_decisions", "get_costs", "get_decisions_count", "get_recovery_stats"}),
+    ),
+    "activity.query": (
+        "runtime",
+        "query",
+        frozenset(
+            {
+                "get_runs",
+                "get_live_runs",
+                "get_completed_runs",
+                "get_run_detail",
+                "get_status_summary",
+                "get_signals",
+                "get_metrics",
+                "get_risk_signals",
+                "get_attention_queue",
+                "get_threshold_signals",
+                "get_cost_analysis",
+                "get_patterns",
+                "get_dimension_breakdown",
+            }
+        ),
+    ),
+    "incidents.query": (
+        "incident",
+        "read",
+        frozenset(
+            {
+                "list_incidents",
+                "list_active_incidents",
+                "list_resolved_incidents",
+                "list_historical_incidents",
+                "get_incident_detail",
+                "get_incidents_for_run",
+                "get_metrics",
+                "get_historical_trend",
+                "get_historical_distribution",
+                "get_historical_cost_trend",
+            }
+        ),
+    ),
+    "policies.query": (
+        "runtime",
+        "query",
+        frozenset(
+            {
+                "get_policy_state",
+                "get_policy_metrics",
+                "list_policy_rules",
+                "get_policy_rule_detail",
+                "list_limits",
+                "get_limit_detail",
+                "list_violations",
+                "list_requests",
+                "list_conflicts",
+                "list_lessons",
+                "get_lesson_stats",
+                "list_budgets",
+            }
+        ),
+    ),
+    "controls.query": (
+        "runtime",
+        "query",
+        frozenset({"list_controls", "list_controls_page", "get_status", "get_control"}),
+    ),
+    "analytics.query": (
+        "runtime",
+        "query",
+        frozenset({"get_usage_statistics", "get_cost_statistics", "get_status"}),
+    ),
+    "integrations.query": (
+        "integration",
+        "read",
+        frozenset({"list_integrations", "get_integration", "get_health_status", "get_limits_status"}),
+    ),
+    "logs.query": (
+        "runtime",
+        "query",
+        frozenset({"list_llm_run_records", "list_system_records", "list_audit_entries"}),
+    ),
+    "api_keys.query": (
+        "runtime",
+        "query",
+        frozenset({"list_api_keys"}),
+    ),
+}
+
+# Set by the endpoint, never by the caller
+_RESERVED_PARAMS = frozenset({"method", "tenant_id", "session"})
+
+
+class BatchReadItem(BaseModel):
+    id: str | None = Field(default=None, max_length=64, description="Client key echoed in the result")
+    operation: str
+    method: str
+    params: dict[str, Any] = Field(default_factory=dict)
+
+
+class BatchReadRequest(BaseModel):
+    items: list[BatchReadItem] = Field(min_length=1, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchReadItemResult(BaseModel):
+    id: str | None = None
+    operation: str
+    method: str
+    success: bool
+    data: Any = None
+    error: str | None = None
+    error_code: str | None = None
+    duration_ms: float
+
+
+class BatchReadResponse(BaseModel):
+    results: list[BatchReadItemResult]
+    succeeded: int
+    failed: int
+    duration_ms: float
+
+
+router = APIRouter(prefix="/cus/overview", tags=["cus-overview-batch"])
+
+
+def _invalid_item(index: int, field: str, reason: str) -> None:
+    raise HTTPException(
+        status_code=400,
+        detail={
+            "code": "INVALID_BATCH_ITEM",
+            "message": "Invalid batch item",
+            "field_errors": [{"field": f"items[{index}].{field}", "reason": reason}],
+        },
+    )
+
+
+def _validate_item(index: int, item: BatchReadItem) -> tuple[str, str]:
+    """Check one item against BATCHABLE_READS; returns its (resource, action)."""
+    entry = BATCHABLE_READS.get(item.operation)
+    if entry is None:
+        _invalid_item(index, "operation", f"'{item.operation}' cannot be batched")
+    resource, action, methods = entry
+    if item.method not in methods:
+        _invalid_item(index, "method", f"'{item.method}' is not a batchable read of {item.operation}")
+    for key in item.params:
+        if key in _RESERVED_PARAMS or key.startswith("_"):
+            _invalid_item(index, f"params.{key}", "reserved parameter")
+    limit = item.params.get("limit")
+    if limit is not None and (not isinstance(limit, int) or not 0 < limit <= MAX_ITEM_LIMIT):
+        _invalid_item(index, "params.limit", f"must be an integer in 1..{MAX_ITEM_LIMIT}")
+    return resource, action
+
+
+@router.post(
+    "/batch",
+    response_model=BatchReadResponse,
+    summary="Run several console read operations in one request",
+)
+async def batch_read(
+    body: BatchReadRequest,
+    request: Request,
+    session=Depends(get_session_dep),
+) -> BatchReadResponse:
+    permissions = {_validate_item(i, item) for i, item in enumerate(body.items)}
+
+    tenant_id = get_tenant_id_from_auth(request)
+
+    for resource, action in sorted(permissions):
+        decision = await check_permission_request(resource, action, request)
+        if not decision.allowed:
+            raise HTTPException(status_code=403, detail=decision.reason)
+
+    registry = get_operation_registry()
+    batch = await registry.execute_many(
+        [BatchOperation(item.operation, {**item.params, "method": item.method}) for item in body.items],
+        tenant_id=tenant_id,
+        session=session,
+        session_factory=get_read_session_factory(),
+        lanes=BATCH_SESSION_LANES,
+    )
+
+    return BatchReadResponse(
+        results=[
+            BatchReadItemResult(
+                id=item.id,
+                operation=item.operation,
+                method=item.method,
+                success=result.success,
+                data=jsonable_encoder(result.data) if result.success else None,
+                error=result.error,
+                error_code=result.error_code,
+                duration_ms=round(result.duration_ms, 2),
+            )
+            for item, result in zip(body.items, batch.results)
+        ],
+        succeeded=batch.succeeded,
+        failed=batch.failed,
+        duration_ms=round(batch.duration_ms, 2),
+    )
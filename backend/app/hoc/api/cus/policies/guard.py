@@ -85,7 +85,12 @@ from app.hoc.cus.logs.L5_schemas.determinism_types import (
 )
 
 # Guard Cache for latency optimization (EU server -> Singapore DB)
-from app.utils.guard_cache import get_guard_cache
+from app.utils.guard_cache import (
+    GUARD_INCIDENTS_TTL,
+    GUARD_SNAPSHOT_TTL,
+    GUARD_STATUS_TTL,
+    get_guard_cache,
+)
 
 # =============================================================================
 # Router - GA Lock: Customer-only access (tenant-scoped)
@@ -291,6 +296,25 @@ async def get_tenant_from_auth(session, tenant_id: str) -> dict:
     return tenant
 
 
+def _with_own_session(fn, *args):
+    """
+    Bind a cache compute to a session of its own.
+
+    Background cache refreshes outlive the request, so they cannot use the
+    request's session.
+    """
+
+    async def run():
+        sessions = get_sync_session_dep()
+        session = next(sessions)
+        try:
+            return await fn(session, *args)
+        finally:
+            sessions.close()
+
+    return run
+
+
 # =============================================================================
 # Status Endpoints
 # =============================================================================
@@ -310,14 +334,21 @@ async def get_guard_status(
     - 24h incident count
     - Last incident time
 
-    Cached for 5 seconds to reduce cross-region DB latency.
+    Cached for 5 seconds to reduce cross-region DB latency (served stale
+    while refreshing, invalidated on killswitch and incident changes).
     """
-    # Check cache first
-    cache = get_guard_cache()
-    cached = await cache.get_status(tenant_id)
-    if cached:
-        return wrap_dict(GuardStatus(**cached).model_dump())
+    data = await get_guard_cache().get_or_compute(
+        "status",
+        tenant_id,
+        lambda: _compute_guard_status(session, tenant_id),
+        GUARD_STATUS_TTL,
+        refresh=_with_own_session(_compute_guard_status, tenant_id),
+    )
+    return wrap_dict(GuardStatus(**data).model_dump())
+
 
+async def _compute_guard_status(session, tenant_id: str) -> dict:
+    """Read guard status from the DB (cache miss path)."""
     # L4 registry dispatch for L2 first-principles purity (no session.execute in L2)
     registry = get_operation_registry()
 
@@ -383,10 +414,7 @@ async def get_guard_status(
         last_incident_time=last_incident_time.isoformat() if last_incident_time else None,
     )
 
-    # Cache result
-    await cache.set_status(tenant_id, result.model_dump())
-
-    return wrap_dict(result.model_dump())
+    return result.model_dump()
 
 
 @router.get("/snapshot/today", response_model=TodaySnapshot)
@@ -397,14 +425,21 @@ async def get_today_snapshot(
     """
     Get today's metrics - "What did it cost/save me?"
 
-    Cached for 10 seconds to reduce cross-region DB latency.
+    Cached for 10 seconds to reduce cross-region DB latency (served stale
+    while refreshing, invalidated on killswitch and incident changes).
     """
-    # Check cache first
-    cache = get_guard_cache()
-    cached = await cache.get_snapshot(tenant_id)
-    if cached:
-        return wrap_dict(TodaySnapshot(**cached).model_dump())
+    data = await get_guard_cache().get_or_compute(
+        "snapshot",
+        tenant_id,
+        lambda: _compute_today_snapshot(session, tenant_id),
+        GUARD_SNAPSHOT_TTL,
+        refresh=_with_own_session(_compute_today_snapshot, tenant_id),
+    )
+    return wrap_dict(TodaySnapshot(**data).model_dump())
 
+
+async def _compute_today_snapshot(session, tenant_id: str) -> dict:
+    """Read today's metrics from the DB (cache miss path)."""
     today_start = utc_now().replace(hour=0, minute=0, second=0, microsecond=0)
 
     # L4 registry dispatch for L2 first-principles purity (no session.execute in L2)
@@ -457,10 +492,7 @@ async def get_today_snapshot(
         cost_avoided_cents=int(cost_avoided),
     )
 
-    # Cache result
-    await cache.set_snapshot(tenant_id, result.model_dump())
-
-    return wrap_dict(result.model_dump())
+    return result.model_dump()
 
 
 # =============================================================================
@@ -541,7 +573,22 @@ async def list_incidents(
     Human narrative, not logs.
 
     PIN-281: Uses L3 CustomerIncidentsAdapter for tenant-scoped operations.
+
+    Cached for 5 seconds per page, invalidated on incident changes.
     """
+    data = await get_guard_cache().get_or_compute(
+        "incidents",
+        tenant_id,
+        lambda: _compute_incident_page(session, tenant_id, limit, offset),
+        GUARD_INCIDENTS_TTL,
+        extra=f"{limit}:{offset}",
+        refresh=_with_own_session(_compute_incident_page, tenant_id, limit, offset),
+    )
+    return wrap_dict({**data, "items": [IncidentSummary(**item) for item in data["items"]]})
+
+
+async def _compute_incident_page(session, tenant_id: str, limit: int, offset: int) -> dict:
+    """Read one page of incidents from the DB (cache miss path)."""
     # PIN-281: Use L3 adapter for tenant-scoped incident operations
     adapter = get_customer_incidents_adapter(session)
     result = adapter.list_incidents(tenant_id, limit=limit, offset=offset)
@@ -566,12 +613,12 @@ async def list_incidents(
         for inc in result.items
     ]
 
-    return wrap_dict({
-        "items": items,
+    return {
+        "items": [item.model_dump() for item in items],
         "total": result.total,
         "page": result.page,
         "page_size": result.page_size,
-    })
+    }
 
 
 @router.get("/incidents/{incident_id}", response_model=IncidentDetailResponse)
@@ -646,6 +693,9 @@ async def acknowledge_incident(
     if result is None:
         raise HTTPException(status_code=404, detail="Incident not found")
 
+    # Invalidate cache on mutation
+    await get_guard_cache().invalidate_tenant(tenant_id)
+
     return wrap_dict({"status": result.status})
 
 
@@ -667,6 +717,9 @@ async def resolve_incident(
     if result is None:
         raise HTTPException(status_code=404, detail="Incident not found")
 
+    # Invalidate cache on mutation
+    await get_guard_cache().invalidate_tenant(tenant_id)
+
     return wrap_dict({"status": result.status})
 
 
@@ -2050,7 +2103,7 @@ async def export_incident_evidence(
 
     Returns: PDF file with Content-Disposition header
     """
-    from fastapi.responses import Response
+    from fastapi.responses import StreamingResponse
 
     # L4 registry dispatch for L2 first-principles purity (no session.execute in L2)
     registry = get_operation_registry()
@@ -2244,17 +2297,24 @@ async def export_incident_evidence(
         ),
     )
     if not report_op.success:
+        if report_op.error_code == "RENDER_QUEUE_FULL":
+            raise HTTPException(
+                status_code=503,
+                detail={"error": "render_queue_full", "message": report_op.error},
+                headers={"Retry-After": "5"},
+            )
         raise HTTPException(status_code=500, detail={"error": "operation_failed", "message": report_op.error})
-    pdf_bytes = report_op.data
+    report = report_op.data
 
-    # Return PDF with proper headers
+    # Stream the cached PDF with proper headers
     filename = f"evidence_report_{incident_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}.pdf"
 
-    return Response(
-        content=pdf_bytes,
+    return StreamingResponse(
+        report.stream(),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
+            "Content-Length": str(report.size),
             "X-Incident-ID": incident_id,
             "X-Generated-At": datetime.now(timezone.utc).isoformat(),
         },
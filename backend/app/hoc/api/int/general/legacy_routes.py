@@ -187,7 +187,13 @@ async def legacy_api_operator(path: str = ""):
 # =============================================================================
 
 
-@router.api_route("/api/v1/{path:path}", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
+# Explicit operation_id: the generated one takes an arbitrary method from the
+# methods set, which changes between processes and breaks the schema artifact.
+@router.api_route(
+    "/api/v1/{path:path}",
+    methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
+    operation_id="legacy_api_v1",
+)
 async def legacy_api_v1(path: str = ""):
     """410 Gone - /api/v1/* prefix removed.
 
@@ -6,61 +6,58 @@ Single HOC wiring node for entrypoints.
 Contract:
 - Imports facades (L2.1) only.
 - Includes routers only (no endpoint definitions).
+
+Facades are imported when routers are first requested, not when this module
+is imported, and include_hoc() adds them to the app directly: every
+include_router() re-creates each route, so going through an intermediate
+router would build all ~700 routes twice on every cold start.
 """
 
 from __future__ import annotations
 
 from fastapi import APIRouter, FastAPI
 
-from app.hoc.api.facades.apis import ROUTERS as APIS_ROUTERS
-from app.hoc.api.facades.cus import ALL_CUS_ROUTERS
-from app.hoc.api.facades.fdr.account import ROUTERS as FDR_ACCOUNT_ROUTERS
-from app.hoc.api.facades.fdr.agent import ROUTERS as FDR_AGENT_ROUTERS
-from app.hoc.api.facades.fdr.incidents import ROUTERS as FDR_INCIDENTS_ROUTERS
-from app.hoc.api.facades.fdr.logs import ROUTERS as FDR_LOGS_ROUTERS
-from app.hoc.api.facades.fdr.ops import ROUTERS as FDR_OPS_ROUTERS
-from app.hoc.api.facades.int.agent import ROUTERS as INT_AGENT_ROUTERS
-from app.hoc.api.facades.int.general import ROUTERS as INT_GENERAL_ROUTERS
-from app.hoc.api.facades.int.recovery import ROUTERS as INT_RECOVERY_ROUTERS
+
+def hoc_routers() -> list[APIRouter]:
+    """Return the canonical HOC routers, in inclusion order."""
+    from app.hoc.api.facades.apis import ROUTERS as APIS_ROUTERS
+    from app.hoc.api.facades.cus import ALL_CUS_ROUTERS
+    from app.hoc.api.facades.fdr.account import ROUTERS as FDR_ACCOUNT_ROUTERS
+    from app.hoc.api.facades.fdr.agent import ROUTERS as FDR_AGENT_ROUTERS
+    from app.hoc.api.facades.fdr.incidents import ROUTERS as FDR_INCIDENTS_ROUTERS
+    from app.hoc.api.facades.fdr.logs import ROUTERS as FDR_LOGS_ROUTERS
+    from app.hoc.api.facades.fdr.ops import ROUTERS as FDR_OPS_ROUTERS
+    from app.hoc.api.facades.int.agent import ROUTERS as INT_AGENT_ROUTERS
+    from app.hoc.api.facades.int.general import ROUTERS as INT_GENERAL_ROUTERS
+    from app.hoc.api.facades.int.recovery import ROUTERS as INT_RECOVERY_ROUTERS
+
+    return [
+        # Canonical CUS domains (non-optional)
+        *ALL_CUS_ROUTERS,
+        # Internal surfaces (INT)
+        *INT_GENERAL_ROUTERS,
+        *INT_AGENT_ROUTERS,
+        *INT_RECOVERY_ROUTERS,
+        # APIs publication surfaces (L2.1 facade)
+        *APIS_ROUTERS,
+        # Founder surfaces (FDR)
+        *FDR_ACCOUNT_ROUTERS,
+        *FDR_AGENT_ROUTERS,
+        *FDR_INCIDENTS_ROUTERS,
+        *FDR_LOGS_ROUTERS,
+        *FDR_OPS_ROUTERS,
+    ]
 
 
 def build_hoc_router() -> APIRouter:
+    """Build a standalone router holding the full HOC surface."""
     router = APIRouter()
-
-    # Canonical CUS domains (non-optional)
-    for r in ALL_CUS_ROUTERS:
-        router.include_router(r)
-
-    # Internal surfaces (INT)
-    for r in INT_GENERAL_ROUTERS:
-        router.include_router(r)
-    for r in INT_AGENT_ROUTERS:
-        router.include_router(r)
-    for r in INT_RECOVERY_ROUTERS:
-        router.include_router(r)
-
-    # APIs publication surfaces (L2.1 facade)
-    for r in APIS_ROUTERS:
+    for r in hoc_routers():
         router.include_router(r)
-
-    # Founder surfaces (FDR)
-    for r in FDR_ACCOUNT_ROUTERS:
-        router.include_router(r)
-    for r in FDR_AGENT_ROUTERS:
-        router.include_router(r)
-    for r in FDR_INCIDENTS_ROUTERS:
-        router.include_router(r)
-    for r in FDR_LOGS_ROUTERS:
-        router.include_router(r)
-    for r in FDR_OPS_ROUTERS:
-        router.include_router(r)
-
     return router
 
 
-hoc_router: APIRouter = build_hoc_router()
-
-
 def include_hoc(app: FastAPI) -> None:
     """Entrypoint API: include the canonical HOC router surface into `app`."""
-    app.include_router(hoc_router)
+    for r in hoc_routers():
+        app.include_router(r)
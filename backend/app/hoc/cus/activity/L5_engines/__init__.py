@@ -20,7 +20,7 @@ Decision engines for activity domain. Pure business logic, no DB access.
 Exports:
 - threshold_engine: Threshold resolution and evaluation logic
 - signal_feedback_engine: Signal feedback engine (stub)
-- attention_ranking: Attention ranking (stub, demoted from _engine 2026-02-08)
+- attention_ranking: Attention ranking (per-tenant top-K queue, demoted from _engine 2026-02-08)
 - pattern_detection: Pattern detection (stub, demoted from _engine 2026-02-08)
 - cost_analysis: Cost analysis (stub, demoted from _engine 2026-02-08)
 - signal_identity: Signal identity utilities
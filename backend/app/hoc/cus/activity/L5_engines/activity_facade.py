@@ -63,12 +63,22 @@ Operations:
 - acknowledge_signal: Acknowledge a signal
 - suppress_signal: Suppress a signal
 
+Run listings (get_runs, get_live_runs, get_completed_runs, get_signals,
+get_threshold_signals) page by offset (default) or by opaque keyset cursor
+(pagination="cursor" / cursor=...), ordered by (created_at, run_id); the
+total is exact, planner-estimated or briefly cached per count_mode.
+
+get_attention_queue serves the tenant's in-process top-K attention queue
+(attention_ranking.py); get_signals offers the signals it synthesizes to
+that queue as they are read.
+
 Reference: ACTIVITY_DOMAIN_V2_MIGRATION_PLAN.md
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Protocol
@@ -80,9 +90,19 @@ from app.hoc.cus.activity.L6_drivers.activity_read_driver import (
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
     from app.hoc.cus.activity.L6_drivers.activity_read_driver import ActivityReadDriver
-from app.hoc.cus.activity.L5_engines.attention_ranking import AttentionRankingService
+from app.hoc.cus.activity.L5_engines.attention_ranking import (
+    ATTENTION_WORTHY_SQL,
+    AttentionCandidate,
+    AttentionRankingService,
+    get_attention_engine,
+)
 from app.hoc.cus.activity.L5_engines.cost_analysis import CostAnalysisService
 from app.hoc.cus.activity.L5_engines.pattern_detection import PatternDetectionService
+from app.hoc.cus.activity.L5_engines.run_cursor import (
+    cursor_scope,
+    decode_run_cursor,
+    encode_run_cursor,
+)
 from app.hoc.cus.activity.L5_engines.signal_feedback_engine import (
     SignalFeedbackService,
     AcknowledgeResult,
@@ -204,6 +224,8 @@ class RunListResult:
     total: int
     has_more: bool
     filters_applied: dict[str, Any] = field(default_factory=dict)
+    next_cursor: str | None = None
+    count_mode: str = "exact"
 
 
 @dataclass
@@ -222,6 +244,8 @@ class RunsResult:
     total: int
     has_more: bool
     generated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    next_cursor: str | None = None
+    count_mode: str = "exact"
 
 
 # Type aliases for backward compatibility during migration
@@ -308,6 +332,8 @@ class SignalsResult:
     signals: list[SignalProjectionResult]
     total: int
     generated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    next_cursor: str | None = None
+    count_mode: str = "exact"
 
 
 @dataclass
@@ -349,6 +375,8 @@ class ThresholdSignalsResult:
     total: int
     risk_type_filter: str | None
     generated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    next_cursor: str | None = None
+    count_mode: str = "exact"
 
 
 @dataclass
@@ -389,6 +417,16 @@ class DimensionBreakdownResult:
     state_filter: str | None
 
 
+@dataclass
+class _RunPage:
+    """One page of a v_runs_o2 listing (see ActivityFacade._fetch_page)."""
+
+    rows: list[dict[str, Any]]
+    total: int
+    has_more: bool
+    next_cursor: str | None
+
+
 # Import service result types for pass-through
 from app.hoc.cus.activity.L5_engines.pattern_detection import (
     PatternDetectionResult,
@@ -456,12 +494,56 @@ class ActivityFacade:
 
     def _get_attention_service(self, session: AsyncSession) -> AttentionRankingService:
         """Get attention ranking service for this session."""
-        return AttentionRankingService(session)
+        return AttentionRankingService(session, to_candidate=self._to_attention_candidate)
 
     def _get_feedback_service(self, session: AsyncSession) -> SignalFeedbackService:
         """Get signal feedback service for this session."""
         return SignalFeedbackService(session)
 
+    async def _fetch_page(
+        self,
+        driver: ActivityReadDriver,
+        fetch: Callable[..., Awaitable[list[dict[str, Any]]]],
+        listing: str,
+        where_sql: str,
+        params: dict[str, Any],
+        *,
+        limit: int,
+        offset: int,
+        sort_dir: str,
+        pagination: str,
+        cursor: str | None,
+        count_mode: str,
+    ) -> _RunPage:
+        """
+        Fetch one page of a listing plus its total.
+
+        Offset mode keeps the listing's own ORDER BY with LIMIT/OFFSET.
+        Cursor mode (pagination="cursor", or any cursor given) orders by
+        (created_at, run_id) and resumes after the cursor, so deep pages
+        cost the same as the first. One extra row is fetched to tell
+        whether another page exists.
+
+        Raises:
+            InvalidCursorError: cursor is malformed or from another query
+        """
+        if pagination not in ("offset", "cursor"):
+            raise ValueError(f"Unknown pagination mode: {pagination!r}")
+        keyset = pagination == "cursor" or cursor is not None
+        scope = cursor_scope(listing, where_sql, params, sort_dir)
+        after = decode_run_cursor(cursor, scope) if cursor else None
+
+        rows = await fetch(limit + 1, 0 if keyset else offset, keyset=keyset, after=after)
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        total = await driver.count_runs(where_sql, params, count_mode)
+
+        next_cursor = None
+        if keyset and has_more:
+            last = rows[-1]
+            next_cursor = encode_run_cursor(last["created_at"], last["run_id"], scope)
+        return _RunPage(rows=rows, total=total, has_more=has_more, next_cursor=next_cursor)
+
     # =========================================================================
     # V1 Run Operations
     # =========================================================================
@@ -490,6 +572,9 @@ class ActivityFacade:
         offset: int = 0,
         sort_by: str = "started_at",
         sort_order: str = "desc",
+        pagination: str = "offset",
+        cursor: str | None = None,
+        count_mode: str = "exact",
     ) -> RunListResult:
         """
         List runs with filters.
@@ -513,9 +598,12 @@ class ActivityFacade:
             completed_after: Filter by completion time
             completed_before: Filter by completion time
             limit: Max items to return
-            offset: Items to skip
-            sort_by: Field to sort by
+            offset: Items to skip (offset pagination)
+            sort_by: Field to sort by (offset pagination)
             sort_order: asc or desc
+            pagination: offset or cursor
+            cursor: next_cursor of the previous page (implies cursor)
+            count_mode: exact, estimated or cached
 
         Returns:
             RunListResult with items and pagination info
@@ -606,8 +694,22 @@ class ActivityFacade:
 
         # L6: Delegate data access to driver
         driver = self._get_driver(session)
-        total = await driver.count_runs(where_sql, params)
-        rows = await driver.fetch_runs(where_sql, params, sort_by, sort_dir, limit, offset)
+        page = await self._fetch_page(
+            driver,
+            lambda limit, offset, **keyset: driver.fetch_runs(
+                where_sql, params, sort_by, sort_dir, limit, offset, **keyset
+            ),
+            "runs",
+            where_sql,
+            params,
+            limit=limit,
+            offset=offset,
+            sort_dir=sort_dir,
+            pagination=pagination,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
+        rows = page.rows
 
         items = [
             RunSummaryResult(
@@ -639,13 +741,13 @@ class ActivityFacade:
             for row in rows
         ]
 
-        has_more = offset + len(items) < total
-
         return RunListResult(
             items=items,
-            total=total,
-            has_more=has_more,
+            total=page.total,
+            has_more=page.has_more,
             filters_applied=filters_applied,
+            next_cursor=page.next_cursor,
+            count_mode=count_mode,
         )
 
     async def get_run_detail(
@@ -866,6 +968,9 @@ class ActivityFacade:
         offset: int = 0,
         sort_by: str = "started_at",
         sort_order: str = "desc",
+        pagination: str = "offset",
+        cursor: str | None = None,
+        count_mode: str = "exact",
     ) -> LiveRunsResult:
         """
         Get live runs with policy context (V2).
@@ -879,9 +984,12 @@ class ActivityFacade:
             source: Filter by run source
             provider_type: Filter by LLM provider
             limit: Max items to return
-            offset: Items to skip
-            sort_by: Field to sort by
+            offset: Items to skip (offset pagination)
+            sort_by: Field to sort by (offset pagination)
             sort_order: asc or desc
+            pagination: offset or cursor
+            cursor: next_cursor of the previous page (implies cursor)
+            count_mode: exact, estimated or cached
 
         Returns:
             LiveRunsResult with items and pagination
@@ -899,6 +1007,9 @@ class ActivityFacade:
             offset=offset,
             sort_by=sort_by,
             sort_order=sort_order,
+            pagination=pagination,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
         return RunsResult(
@@ -906,6 +1017,8 @@ class ActivityFacade:
             items=result["items"],
             total=result["total"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
+            count_mode=count_mode,
         )
 
     async def get_completed_runs(
@@ -922,6 +1035,9 @@ class ActivityFacade:
         offset: int = 0,
         sort_by: str = "started_at",
         sort_order: str = "desc",
+        pagination: str = "offset",
+        cursor: str | None = None,
+        count_mode: str = "exact",
     ) -> CompletedRunsResult:
         """
         Get completed runs with policy context (V2).
@@ -935,9 +1051,12 @@ class ActivityFacade:
             completed_after: Filter by completion time
             completed_before: Filter by completion time
             limit: Max items to return
-            offset: Items to skip
-            sort_by: Field to sort by
+            offset: Items to skip (offset pagination)
+            sort_by: Field to sort by (offset pagination)
             sort_order: asc or desc
+            pagination: offset or cursor
+            cursor: next_cursor of the previous page (implies cursor)
+            count_mode: exact, estimated or cached
 
         Returns:
             CompletedRunsResult with items and pagination
@@ -955,6 +1074,9 @@ class ActivityFacade:
             offset=offset,
             sort_by=sort_by,
             sort_order=sort_order,
+            pagination=pagination,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
         return RunsResult(
@@ -962,6 +1084,8 @@ class ActivityFacade:
             items=result["items"],
             total=result["total"],
             has_more=result["has_more"],
+            next_cursor=result["next_cursor"],
+            count_mode=count_mode,
         )
 
     async def _get_runs_with_policy_context(
@@ -982,6 +1106,9 @@ class ActivityFacade:
         offset: int = 0,
         sort_by: str = "started_at",
         sort_order: str = "desc",
+        pagination: str = "offset",
+        cursor: str | None = None,
+        count_mode: str = "exact",
     ) -> dict[str, Any]:
         """Internal helper to get runs with policy context."""
         where_clauses = ["tenant_id = :tenant_id", "state = :state"]
@@ -1024,13 +1151,24 @@ class ActivityFacade:
 
         # L6: Delegate data access to driver
         driver = self._get_driver(session)
-        total = await driver.count_runs(where_sql, params)
-        rows = await driver.fetch_runs_with_policy_context(
-            where_sql, params, sort_by, sort_dir, limit, offset
+        page = await self._fetch_page(
+            driver,
+            lambda limit, offset, **keyset: driver.fetch_runs_with_policy_context(
+                where_sql, params, sort_by, sort_dir, limit, offset, **keyset
+            ),
+            "runs_with_policy_context",
+            where_sql,
+            params,
+            limit=limit,
+            offset=offset,
+            sort_dir=sort_dir,
+            pagination=pagination,
+            cursor=cursor,
+            count_mode=count_mode,
         )
 
         items = []
-        for row in rows:
+        for row in page.rows:
             policy_context = PolicyContextResult(
                 policy_id=row["policy_id"],
                 policy_name=row["policy_name"],
@@ -1083,9 +1221,12 @@ class ActivityFacade:
                 )
             )
 
-        has_more = offset + len(items) < total
-
-        return {"items": items, "total": total, "has_more": has_more}
+        return {
+            "items": items,
+            "total": page.total,
+            "has_more": page.has_more,
+            "next_cursor": page.next_cursor,
+        }
 
     async def get_signals(
         self,
@@ -1097,6 +1238,9 @@ class ActivityFacade:
         severity: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        pagination: str = "offset",
+        cursor: str | None = None,
+        count_mode: str = "exact",
     ) -> SignalsResult:
         """
         Get synthesized attention signals (V2).
@@ -1107,17 +1251,17 @@ class ActivityFacade:
             project_id: Optional project filter
             signal_type: Filter by signal type (COST_RISK, TIME_RISK, etc.)
             severity: Filter by severity (HIGH, MEDIUM, LOW)
-            limit: Max items to return
-            offset: Items to skip
+            limit: Max runs to examine (signal filters apply within the page)
+            offset: Items to skip (offset pagination)
+            pagination: offset or cursor
+            cursor: next_cursor of the previous page (implies cursor)
+            count_mode: exact, estimated or cached
 
         Returns:
             SignalsResult with synthesized signals
         """
         # Build query for at-risk runs to synthesize signals
-        where_clauses = [
-            "tenant_id = :tenant_id",
-            "(risk_level != 'NORMAL' OR incident_count > 0 OR policy_violation = true)",
-        ]
+        where_clauses = ["tenant_id = :tenant_id", ATTENTION_WORTHY_SQL]
         params: dict[str, Any] = {"tenant_id": tenant_id}
 
         if project_id:
@@ -1128,16 +1272,28 @@ class ActivityFacade:
 
         # L6: Delegate data access to driver
         driver = self._get_driver(session)
-        rows = await driver.fetch_at_risk_runs(where_sql, params, limit, offset)
-
-        # Count total
-        count_params = {k: v for k, v in params.items()}
-        total = await driver.count_runs(where_sql, count_params)
+        page = await self._fetch_page(
+            driver,
+            lambda limit, offset, **keyset: driver.fetch_at_risk_runs(
+                where_sql, params, limit, offset, **keyset
+            ),
+            "signals",
+            where_sql,
+            params,
+            limit=limit,
+            offset=offset,
+            sort_dir="DESC",
+            pagination=pagination,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
 
+        attention = get_attention_engine()
         signals = []
-        for row_mapping in rows:
+        for row_mapping in page.rows:
             # Convert RowMapping to dict for type safety
             row = dict(row_mapping)
+            attention.observe(tenant_id, self._to_attention_candidate(row))
 
             # Compute signal type from run data
             computed_signal_type = self._compute_signal_type(row)
@@ -1191,7 +1347,12 @@ class ActivityFacade:
                 )
             )
 
-        return SignalsResult(signals=signals, total=total)
+        return SignalsResult(
+            signals=signals,
+            total=page.total,
+            next_cursor=page.next_cursor,
+            count_mode=count_mode,
+        )
 
     async def _get_signal_feedback(
         self,
@@ -1280,6 +1441,21 @@ class ActivityFacade:
         risk_level = row.get("risk_level", "NORMAL")
         return f"Run {run_id} has {signal_type} signal ({risk_level})"
 
+    def _to_attention_candidate(self, row: dict[str, Any]) -> AttentionCandidate:
+        """Project an at-risk run row into an attention queue candidate."""
+        signal_type = self._compute_signal_type(row)
+        return AttentionCandidate(
+            run_id=row["run_id"],
+            signal_id=f"sig-{row['run_id'][:8]}",
+            fingerprint=compute_signal_fingerprint_from_row(row),
+            signal_type=signal_type,
+            dimension=row.get("risk_type") or "RISK",
+            title=f"{signal_type} ({self._compute_severity(row)})",
+            description=self._compute_signal_summary(row, signal_type),
+            risk_level=row.get("risk_level") or "NORMAL",
+            created_at=row.get("created_at") or row.get("started_at") or datetime.now(timezone.utc),
+        )
+
     async def get_metrics(
         self,
         session: AsyncSession,
@@ -1355,6 +1531,9 @@ class ActivityFacade:
         state: str | None = None,
         limit: int = 50,
         offset: int = 0,
+        pagination: str = "offset",
+        cursor: str | None = None,
+        count_mode: str = "exact",
     ) -> ThresholdSignalsResult:
         """
         Get threshold proximity signals (V2).
@@ -1367,7 +1546,10 @@ class ActivityFacade:
             evaluation_outcome: Filter by evaluation outcome
             state: Filter by run state (LIVE, COMPLETED)
             limit: Max items to return
-            offset: Items to skip
+            offset: Items to skip (offset pagination)
+            pagination: offset or cursor
+            cursor: next_cursor of the previous page (implies cursor)
+            count_mode: exact, estimated or cached
 
         Returns:
             ThresholdSignalsResult with threshold signals
@@ -1400,14 +1582,24 @@ class ActivityFacade:
 
         # L6: Delegate data access to driver
         driver = self._get_driver(session)
-        rows = await driver.fetch_threshold_signals(where_sql, params, limit, offset)
-
-        # Count total
-        count_params = {k: v for k, v in params.items()}
-        total = await driver.count_runs(where_sql, count_params)
+        page = await self._fetch_page(
+            driver,
+            lambda limit, offset, **keyset: driver.fetch_threshold_signals(
+                where_sql, params, limit, offset, **keyset
+            ),
+            "threshold_signals",
+            where_sql,
+            params,
+            limit=limit,
+            offset=offset,
+            sort_dir="DESC",
+            pagination=pagination,
+            cursor=cursor,
+            count_mode=count_mode,
+        )
 
         signals = []
-        for row in rows:
+        for row in page.rows:
             policy_context = PolicyContextResult(
                 policy_id=row["policy_id"],
                 policy_name=row["policy_name"],
@@ -1438,8 +1630,10 @@ class ActivityFacade:
 
         return ThresholdSignalsResult(
             signals=signals,
-            total=total,
+            total=page.total,
             risk_type_filter=risk_type,
+            next_cursor=page.next_cursor,
+            count_mode=count_mode,
         )
 
     async def get_risk_signals(
@@ -3,30 +3,123 @@
 # Product: ai-console
 # Temporal:
 #   Trigger: api
-#   Execution: sync
+#   Execution: async
 # Lifecycle:
 #   Emits: none
 #   Subscribes: none
 # Data Access:
-#   Reads: none (in-memory ranking)
+#   Reads: v_runs_o2, signal_feedback (via L6 drivers, on rebuild/refresh)
 #   Writes: none
-# Role: Attention ranking engine for activity signals
-# Callers: activity_facade.py
+# Role: Attention ranking engine for activity signals (per-tenant top-K queue)
+# Callers: activity_facade.py, activity_handler.py (L4, feedback updates)
 # Allowed Imports: L5, L6
 # Forbidden Imports: L1, L2, L3, sqlalchemy (runtime)
-# Reference: PIN-470, Activity Domain
+# Reference: PIN-470, Activity Domain, ATTENTION_FEEDBACK_LOOP.md
 # NOTE: Renamed attention_ranking_service.py → attention_ranking_engine.py (2026-01-24)
 #       per BANNED_NAMING rule (*_service.py → *_engine.py)
 # NOTE: Demoted attention_ranking_engine.py → attention_ranking.py (2026-02-08)
 #       Orphan demotion — not an entry module, remove _engine suffix
-"""Attention ranking engine for prioritizing signals."""
+"""
+Attention ranking engine for prioritizing signals.
 
+Each tenant's attention queue holds, in process, the top signals by
+
+    attention_score = severity × feedback × 2^(-age / half_life)
+
+Every signal decays at the same rate, so decay never reorders them. The
+heap orders by the time-invariant key (forward decay)
+
+    rank_key = ln(severity × feedback) + created_at × ln2 / half_life
+
+and the score is exp(rank_key − now × ln2 / half_life). A new signal, an
+acknowledgement or a suppression is one O(log K) heap operation; nothing
+is re-scored as time passes.
+
+Feedback (signal_feedback_engine.py):
+- ACKNOWLEDGED: score × ACK_DAMPENER, applied once (ATTN-DAMP-001)
+- SUPPRESSED: out of the queue until expires_at
+- REOPENED, EVALUATED: full score again
+
+A tenant heap keeps ATTENTION_TOP_K × ATTENTION_HEAP_SLACK signals. Every
+signal it turned away or evicted ranks at or below its floor, so the top K
+is exact while the K-th key is at or above the floor. When it is not
+(after suppressions), when lifting feedback (a reopen, an expired
+suppression) could bring back a signal that makes the top K, or every
+ATTENTION_REBUILD_SECONDS, the queue is rebuilt from v_runs_o2 and
+signal_feedback; in between, every ATTENTION_REFRESH_SECONDS, recently
+created at-risk runs and newer feedback are offered to it. A restarted
+process starts cold and rebuilds each tenant on its first read.
+"""
+
+import logging
+import math
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Any, Optional
 
+from app.hoc.cus.activity.L6_drivers.activity_read_driver import get_activity_read_driver
+from app.hoc.cus.activity.L6_drivers.signal_feedback_driver import SignalFeedbackDriver
 from app.hoc.cus.hoc_spine.services.time import utc_now
 
+logger = logging.getLogger("nova.hoc.activity.attention_ranking")
+
+ATTENTION_TOP_K = int(os.getenv("ATTENTION_TOP_K", "100"))
+ATTENTION_HEAP_SLACK = 2  # heap capacity = ATTENTION_TOP_K × slack, headroom for suppressions
+ATTENTION_HALF_LIFE_HOURS = float(os.getenv("ATTENTION_HALF_LIFE_HOURS", "24"))
+ATTENTION_HORIZON_HOURS = float(os.getenv("ATTENTION_HORIZON_HOURS", "168"))  # 7 days
+ATTENTION_REFRESH_SECONDS = float(os.getenv("ATTENTION_REFRESH_SECONDS", "30"))
+# Runs become at-risk when they complete, so a refresh re-reads this far back
+ATTENTION_REFRESH_LOOKBACK_SECONDS = float(os.getenv("ATTENTION_REFRESH_LOOKBACK_SECONDS", "3600"))
+ATTENTION_REBUILD_SECONDS = float(os.getenv("ATTENTION_REBUILD_SECONDS", "3600"))
+ATTENTION_REBUILD_MAX_ROWS = 10_000
+ATTENTION_MAX_TENANTS = int(os.getenv("ATTENTION_MAX_TENANTS", "10000"))
+
+ACK_DAMPENER = 0.6  # ATTN-DAMP-001 (FROZEN)
+
+# Numeric severity by risk level (SeverityLevel.from_score: >= 0.7 HIGH, >= 0.4 MEDIUM)
+SEVERITY_WEIGHTS = {
+    "VIOLATED": 1.0,
+    "AT_RISK": 0.7,
+    "NEAR_THRESHOLD": 0.4,
+}
+DEFAULT_SEVERITY_WEIGHT = 0.2  # NORMAL runs with incidents or policy violations
+
+# Runs that synthesize signals (GET /signals, attention queue)
+ATTENTION_WORTHY_SQL = "(risk_level != 'NORMAL' OR incident_count > 0 OR policy_violation = true)"
+
+_feedback_driver = SignalFeedbackDriver()
+
+
+def severity_weight(risk_level: Optional[str]) -> float:
+    """Numeric severity (0.0-1.0] of a run's risk level."""
+    return SEVERITY_WEIGHTS.get(risk_level or "", DEFAULT_SEVERITY_WEIGHT)
+
+
+def decay_rate(half_life_hours: float) -> float:
+    """Forward-decay rate (ln2 / half-life) per second."""
+    return math.log(2) / (half_life_hours * 3600)
+
+
+def _feedback_multiplier(state: Optional[str]) -> float:
+    if state == "SUPPRESSED":
+        return 0.0
+    if state == "ACKNOWLEDGED":
+        return ACK_DAMPENER
+    return 1.0
+
+
+def rank_sql(half_life_hours: float = ATTENTION_HALF_LIFE_HOURS) -> tuple[str, dict[str, Any]]:
+    """rank_key of a v_runs_o2 row without feedback, as SQL, and its params."""
+    cases = " ".join(f"WHEN '{level}' THEN {weight!r}" for level, weight in SEVERITY_WEIGHTS.items())
+    sql = (
+        f"LN((CASE risk_level {cases} ELSE {DEFAULT_SEVERITY_WEIGHT!r} END)::float8)"
+        " + EXTRACT(EPOCH FROM created_at)::float8 * :decay_rate"
+    )
+    return sql, {"decay_rate": decay_rate(half_life_hours)}
+
 
 @dataclass
 class AttentionSignal:
@@ -55,19 +148,413 @@ class AttentionQueueResult:
     generated_at: datetime
 
 
+@dataclass
+class AttentionCandidate:
+    """A signal offered to the attention queue (one per at-risk run)."""
+
+    run_id: str
+    signal_id: str
+    fingerprint: str
+    signal_type: str
+    dimension: str
+    title: str
+    description: str
+    risk_level: str
+    created_at: datetime
+
+
+class TopKAttentionHeap:
+    """
+    Bounded indexed min-heap of (rank_key, signal_id).
+
+    The root is the lowest-ranked signal kept, so offer, remove and rekey
+    are O(log capacity). `floor` is the highest key turned away or
+    evicted: every signal offered but not kept ranks at or below it.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.floor = -math.inf
+        self._keys: list[float] = []
+        self._ids: list[str] = []
+        self._pos: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, signal_id: str) -> bool:
+        return signal_id in self._pos
+
+    def key(self, signal_id: str) -> float:
+        return self._keys[self._pos[signal_id]]
+
+    def raise_floor(self, key: float) -> None:
+        if key > self.floor:
+            self.floor = key
+
+    def offer(self, signal_id: str, key: float) -> Optional[str]:
+        """
+        Insert or rekey a signal.
+
+        Returns the signal_id that left the heap or was turned away, if any.
+        """
+        if signal_id in self._pos:
+            self.rekey(signal_id, key)
+            return None
+        if len(self._ids) < self.capacity:
+            self._ids.append(signal_id)
+            self._keys.append(key)
+            self._sift_up(len(self._ids) - 1)
+            return None
+        if self.capacity == 0 or key <= self._keys[0]:
+            self.raise_floor(key)
+            return signal_id
+        evicted = self._ids[0]
+        self.raise_floor(self._keys[0])
+        del self._pos[evicted]
+        self._ids[0], self._keys[0] = signal_id, key
+        self._sift_down(0)
+        return evicted
+
+    def remove(self, signal_id: str) -> bool:
+        i = self._pos.pop(signal_id, None)
+        if i is None:
+            return False
+        last_id, last_key = self._ids.pop(), self._keys.pop()
+        if i < len(self._ids):
+            self._ids[i], self._keys[i] = last_id, last_key
+            self._sift_up(i)
+            self._sift_down(self._pos[last_id])
+        return True
+
+    def rekey(self, signal_id: str, key: float) -> None:
+        i = self._pos[signal_id]
+        old = self._keys[i]
+        self._keys[i] = key
+        if key < old:
+            self._sift_up(i)
+        else:
+            self._sift_down(i)
+
+    def ranked(self) -> list[tuple[float, str]]:
+        """(key, signal_id) pairs, highest key first."""
+        return sorted(zip(self._keys, self._ids), key=lambda entry: (-entry[0], entry[1]))
+
+    def is_exact(self, k: int) -> bool:
+        """True when the k highest keys kept are the k highest offered."""
+        if self.floor == -math.inf:
+            return True
+        return sum(1 for key in self._keys if key >= self.floor) >= k
+
+    def _sift_up(self, i: int) -> None:
+        keys, ids, pos = self._keys, self._ids, self._pos
+        key, signal_id = keys[i], ids[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if keys[parent] <= key:
+                break
+            keys[i], ids[i] = keys[parent], ids[parent]
+            pos[ids[i]] = i
+            i = parent
+        keys[i], ids[i] = key, signal_id
+        pos[signal_id] = i
+
+    def _sift_down(self, i: int) -> None:
+        keys, ids, pos = self._keys, self._ids, self._pos
+        n = len(keys)
+        key, signal_id = keys[i], ids[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if keys[child] >= key:
+                break
+            keys[i], ids[i] = keys[child], ids[child]
+            pos[ids[i]] = i
+            i = child
+        keys[i], ids[i] = key, signal_id
+        pos[signal_id] = i
+
+
+class TenantAttentionQueue:
+    """One tenant's attention queue: top-K heap plus feedback overlay."""
+
+    def __init__(
+        self,
+        top_k: int = ATTENTION_TOP_K,
+        half_life_hours: float = ATTENTION_HALF_LIFE_HOURS,
+        horizon_hours: float = ATTENTION_HORIZON_HOURS,
+    ) -> None:
+        self.top_k = top_k
+        self.horizon = timedelta(hours=horizon_hours)
+        self.rebuilt_at: Optional[datetime] = None
+        self.refreshed_at: Optional[datetime] = None
+        # A rebuild that hit ATTENTION_REBUILD_MAX_ROWS before the top K was
+        # exact; serve it until the next scheduled rebuild
+        self.best_effort = False
+        self._decay = decay_rate(half_life_hours)
+        self._heap = TopKAttentionHeap(top_k * ATTENTION_HEAP_SLACK)
+        self._signals: dict[str, AttentionCandidate] = {}
+        self._by_fingerprint: dict[str, set[str]] = {}
+        # fingerprint -> (ACKNOWLEDGED | SUPPRESSED, expires_at)
+        self._feedback: dict[str, tuple[str, Optional[datetime]]] = {}
+        # fingerprint -> highest base key of its signals not kept (turned
+        # away, evicted or suppressed); bounds what lifting feedback can bring back
+        self._hidden: dict[str, float] = {}
+        self._stale = False
+        self._ranked: Optional[list[tuple[float, str]]] = None
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def base_key(self, candidate: AttentionCandidate) -> float:
+        """rank_key without feedback."""
+        return math.log(severity_weight(candidate.risk_level)) + candidate.created_at.timestamp() * self._decay
+
+    def raise_floor(self, key: float) -> None:
+        """Record that signals ranking at or below key were not offered."""
+        self._heap.raise_floor(key)
+        self._ranked = None
+
+    def is_exact(self) -> bool:
+        return self._heap.is_exact(self.top_k)
+
+    def needs_rebuild(self, now: datetime) -> bool:
+        self._lift_expired(now)
+        if self.rebuilt_at is None or self._stale:
+            return True
+        if (now - self.rebuilt_at).total_seconds() >= ATTENTION_REBUILD_SECONDS:
+            return True
+        return not self.best_effort and not self.is_exact()
+
+    def needs_refresh(self, now: datetime) -> bool:
+        return (
+            self.refreshed_at is None
+            or (now - self.refreshed_at).total_seconds() >= ATTENTION_REFRESH_SECONDS
+        )
+
+    def observe(self, candidate: AttentionCandidate, now: datetime) -> None:
+        """Offer a new or updated signal. O(log K)."""
+        self._ranked = None
+        state = self._feedback_state(candidate.fingerprint, now)
+        if state == "SUPPRESSED":
+            self._drop(candidate.run_id)
+            self._hide(candidate)
+            return
+        key = self.base_key(candidate) + math.log(_feedback_multiplier(state))
+        previous = self._signals.get(candidate.run_id)
+        if previous is not None and previous.fingerprint != candidate.fingerprint:
+            self._unindex(previous)
+        left = self._heap.offer(candidate.run_id, key)
+        if left == candidate.run_id:
+            self._hide(candidate)
+            return
+        self._signals[candidate.run_id] = candidate
+        self._by_fingerprint.setdefault(candidate.fingerprint, set()).add(candidate.run_id)
+        if left is not None:
+            evicted = self._signals.pop(left)
+            self._unindex(evicted)
+            self._hide(evicted)
+
+    def apply_feedback(
+        self,
+        fingerprint: str,
+        state: str,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        """Apply the latest feedback state of a fingerprint. O(log K) per signal."""
+        prior = self._feedback.get(fingerprint)
+        if state in ("ACKNOWLEDGED", "SUPPRESSED"):
+            self._feedback[fingerprint] = (state, expires_at)
+        else:
+            self._feedback.pop(fingerprint, None)
+        multiplier = _feedback_multiplier(state)
+        for run_id in list(self._by_fingerprint.get(fingerprint, ())):
+            if state == "SUPPRESSED":
+                self._hide(self._signals[run_id])
+                self._drop(run_id)
+            else:
+                candidate = self._signals[run_id]
+                self._heap.rekey(run_id, self.base_key(candidate) + math.log(multiplier))
+        self._ranked = None
+        if prior is not None and multiplier > _feedback_multiplier(prior[0]):
+            self._check_hidden(fingerprint, multiplier)
+
+    def load_feedback(self, rows: Iterable[dict[str, Any]], now: datetime) -> None:
+        """Apply signal_feedback rows (latest per fingerprint); expired suppressions lift."""
+        for row in rows:
+            state, expires_at = row["feedback_state"], row.get("expires_at")
+            if state == "SUPPRESSED" and expires_at is not None and expires_at <= now:
+                state, expires_at = "EVALUATED", None
+            self.apply_feedback(row["signal_fingerprint"], state, expires_at)
+
+    def snapshot(
+        self,
+        now: datetime,
+        *,
+        limit: int,
+        offset: int = 0,
+        min_score: float = 0.0,
+    ) -> tuple[list[AttentionSignal], int]:
+        """
+        Ranked signals with their current scores.
+
+        Returns (page, total): total counts the top-K signals that are
+        within the horizon and score at least min_score.
+        """
+        if self._ranked is None:
+            self._ranked = self._heap.ranked()[: self.top_k]
+        oldest = now - self.horizon
+        shift = now.timestamp() * self._decay
+        visible: list[AttentionSignal] = []
+        for key, run_id in self._ranked:
+            candidate = self._signals[run_id]
+            score = math.exp(key - shift)
+            if score < min_score or candidate.created_at < oldest:
+                continue
+            visible.append(self._to_signal(candidate, score, now))
+        return visible[offset : offset + limit], len(visible)
+
+    def _to_signal(self, candidate: AttentionCandidate, score: float, now: datetime) -> AttentionSignal:
+        acknowledged = self._feedback_state(candidate.fingerprint, now) == "ACKNOWLEDGED"
+        reason = candidate.risk_level + (", acknowledged" if acknowledged else "")
+        return AttentionSignal(
+            signal_id=candidate.signal_id,
+            signal_type=candidate.signal_type,
+            dimension=candidate.dimension,
+            title=candidate.title,
+            description=candidate.description,
+            severity=severity_weight(candidate.risk_level),
+            attention_score=round(score, 6),
+            attention_reason=reason,
+            created_at=candidate.created_at,
+            source_run_id=candidate.run_id,
+            acknowledged=acknowledged,
+        )
+
+    def _feedback_state(self, fingerprint: str, now: datetime) -> Optional[str]:
+        feedback = self._feedback.get(fingerprint)
+        if feedback is None:
+            return None
+        state, expires_at = feedback
+        if expires_at is not None and expires_at <= now:
+            return None
+        return state
+
+    def _lift_expired(self, now: datetime) -> None:
+        expired = [
+            fingerprint
+            for fingerprint, (state, expires_at) in self._feedback.items()
+            if state == "SUPPRESSED" and expires_at is not None and expires_at <= now
+        ]
+        for fingerprint in expired:
+            del self._feedback[fingerprint]
+            self._check_hidden(fingerprint, 1.0)
+
+    def _check_hidden(self, fingerprint: str, multiplier: float) -> None:
+        """Mark stale if a signal not kept could now make the top K."""
+        hidden = self._hidden.get(fingerprint)
+        if hidden is None:
+            return
+        if self._ranked is None:
+            self._ranked = self._heap.ranked()[: self.top_k]
+        kth_key = self._ranked[-1][0] if len(self._ranked) >= self.top_k else -math.inf
+        if hidden + math.log(multiplier) > kth_key:
+            self._stale = True
+
+    def _hide(self, candidate: AttentionCandidate) -> None:
+        key = self.base_key(candidate)
+        if key > self._hidden.get(candidate.fingerprint, -math.inf):
+            self._hidden[candidate.fingerprint] = key
+
+    def _drop(self, run_id: str) -> None:
+        if self._heap.remove(run_id):
+            self._unindex(self._signals.pop(run_id))
+
+    def _unindex(self, candidate: AttentionCandidate) -> None:
+        run_ids = self._by_fingerprint.get(candidate.fingerprint)
+        if run_ids is not None:
+            run_ids.discard(candidate.run_id)
+            if not run_ids:
+                del self._by_fingerprint[candidate.fingerprint]
+
+
+class AttentionQueueEngine:
+    """Attention queues of this process, least recently read tenants evicted first."""
+
+    def __init__(self, max_tenants: int = ATTENTION_MAX_TENANTS) -> None:
+        self._max_tenants = max_tenants
+        self._queues: OrderedDict[str, TenantAttentionQueue] = OrderedDict()
+
+    def get(self, tenant_id: str) -> Optional[TenantAttentionQueue]:
+        queue = self._queues.get(tenant_id)
+        if queue is not None:
+            self._queues.move_to_end(tenant_id)
+        return queue
+
+    def put(self, tenant_id: str, queue: TenantAttentionQueue) -> None:
+        self._queues[tenant_id] = queue
+        self._queues.move_to_end(tenant_id)
+        while len(self._queues) > self._max_tenants:
+            self._queues.popitem(last=False)
+
+    def observe(self, tenant_id: str, candidate: AttentionCandidate) -> None:
+        """Offer a signal to the tenant's queue, if it is loaded."""
+        queue = self._queues.get(tenant_id)
+        if queue is not None:
+            queue.observe(candidate, utc_now())
+
+    def apply_feedback(
+        self,
+        tenant_id: str,
+        fingerprint: str,
+        state: str,
+        expires_at: Optional[datetime] = None,
+    ) -> None:
+        """Apply committed feedback to the tenant's queue, if it is loaded."""
+        queue = self._queues.get(tenant_id)
+        if queue is not None:
+            queue.apply_feedback(fingerprint, state, expires_at)
+
+    def clear(self) -> None:
+        self._queues.clear()
+
+
+_engine = AttentionQueueEngine()
+
+
+def get_attention_engine() -> AttentionQueueEngine:
+    """Get the process-wide attention queue engine."""
+    return _engine
+
+
 class AttentionRankingService:
     """
     Service for ranking and prioritizing activity signals.
 
-    Computes attention scores based on:
-    - Signal severity
-    - Recency
-    - Pattern frequency
-    - User acknowledgment status
+    Serves the tenant's in-process attention queue (see module docstring),
+    rebuilding or refreshing it from the database first when due. Without
+    a session and a row converter the queue is served as is.
     """
 
-    def __init__(self) -> None:
-        pass  # Stub - no DB dependency
+    def __init__(
+        self,
+        session: Any = None,
+        *,
+        to_candidate: Optional[Callable[[dict[str, Any]], AttentionCandidate]] = None,
+        engine: Optional[AttentionQueueEngine] = None,
+    ) -> None:
+        """
+        Args:
+            session: Async database session (rebuild/refresh reads)
+            to_candidate: Converts a v_runs_o2 row to an AttentionCandidate
+            engine: Queue registry (default: process-wide engine)
+        """
+        self._session = session
+        self._to_candidate = to_candidate
+        self._engine = engine or _engine
 
     async def get_attention_queue(
         self,
@@ -82,18 +569,85 @@ class AttentionRankingService:
         Args:
             tenant_id: Tenant identifier
             limit: Max items to return
-            offset: Pagination offset
+            offset: Pagination offset (within the top ATTENTION_TOP_K)
             min_score: Minimum attention score threshold (0.0-1.0)
         """
-        # Stub implementation - returns empty queue
-        # min_score would filter items with score >= min_score when implemented
-        _ = min_score  # Reserved for filtering when driver is wired
-        return AttentionQueueResult(
-            items=[],
-            total=0,
-            generated_at=utc_now(),
+        now = utc_now()
+        queue = self._engine.get(tenant_id)
+        if self._session is not None and self._to_candidate is not None:
+            if queue is None or queue.needs_rebuild(now):
+                queue = await self.rebuild(tenant_id, now)
+            elif queue.needs_refresh(now):
+                await self.refresh(tenant_id, queue, now)
+        if queue is None:
+            return AttentionQueueResult(items=[], total=0, generated_at=now)
+        items, total = queue.snapshot(now, limit=limit, offset=offset, min_score=min_score)
+        return AttentionQueueResult(items=items, total=total, generated_at=now)
+
+    async def rebuild(self, tenant_id: str, now: datetime) -> TenantAttentionQueue:
+        """
+        Rebuild the tenant's queue from v_runs_o2 and signal_feedback.
+
+        Reads the highest-ranked at-risk runs within the horizon, widening
+        the read while feedback leaves the top K inexact.
+        """
+        feedback = await _feedback_driver.list_latest_feedback(self._session, tenant_id=tenant_id)
+        limit = ATTENTION_TOP_K * ATTENTION_HEAP_SLACK
+        while True:
+            queue = TenantAttentionQueue()
+            queue.load_feedback(feedback, now)
+            rows = await self._fetch_candidates(tenant_id, now - queue.horizon, limit)
+            self._offer_rows(queue, rows, limit, now)
+            if len(rows) < limit or queue.is_exact():
+                break
+            if limit >= ATTENTION_REBUILD_MAX_ROWS:
+                queue.best_effort = True
+                logger.warning(
+                    "attention_queue.rebuild_inexact",
+                    extra={"tenant_id": tenant_id, "rows": limit},
+                )
+                break
+            limit = min(limit * 4, ATTENTION_REBUILD_MAX_ROWS)
+        queue.rebuilt_at = queue.refreshed_at = now
+        self._engine.put(tenant_id, queue)
+        return queue
+
+    async def refresh(self, tenant_id: str, queue: TenantAttentionQueue, now: datetime) -> None:
+        """Offer runs created and feedback recorded since the last refresh (minus lookback)."""
+        since = (queue.refreshed_at or now) - timedelta(seconds=ATTENTION_REFRESH_LOOKBACK_SECONDS)
+        queue.load_feedback(
+            await _feedback_driver.list_latest_feedback(
+                self._session, tenant_id=tenant_id, since=since
+            ),
+            now,
+        )
+        rows = await self._fetch_candidates(tenant_id, since, ATTENTION_REBUILD_MAX_ROWS)
+        self._offer_rows(queue, rows, ATTENTION_REBUILD_MAX_ROWS, now)
+        queue.refreshed_at = now
+
+    async def _fetch_candidates(self, tenant_id: str, since: datetime, limit: int) -> list[dict[str, Any]]:
+        sql, params = rank_sql()
+        return await get_activity_read_driver(self._session).fetch_attention_candidates(
+            f"tenant_id = :tenant_id AND created_at >= :since AND {ATTENTION_WORTHY_SQL}",
+            {**params, "tenant_id": tenant_id, "since": since},
+            sql,
+            limit,
         )
 
+    def _offer_rows(
+        self,
+        queue: TenantAttentionQueue,
+        rows: list[dict[str, Any]],
+        limit: int,
+        now: datetime,
+    ) -> None:
+        candidates = [self._to_candidate(row) for row in rows]
+        for candidate in candidates:
+            queue.observe(candidate, now)
+        # Rows past the limit rank at or below the last one read
+        if len(rows) >= limit and candidates:
+            queue.raise_floor(queue.base_key(candidates[-1]))
+
     async def compute_attention_score(
         self,
         signal_type: str,
@@ -0,0 +1,80 @@
+# Layer: L5 — Domain Engine
+# AUDIENCE: CUSTOMER
+# Product: ai-console
+# Location: hoc/cus/activity/L5_engines/run_cursor.py
+# Temporal:
+#   Trigger: api
+#   Execution: sync
+# Lifecycle:
+#   Emits: none
+#   Subscribes: none
+# Data Access:
+#   Reads: none (pure computation)
+#   Writes: none
+# Role: Opaque keyset cursors for activity run listings
+# Callers: activity_facade.py, activity_handler.py (L4, error mapping)
+# Allowed Imports: L5
+# Forbidden Imports: L1, L2, L3, L6, sqlalchemy (runtime)
+# Reference: PIN-470, PHASE3_DIRECTORY_RESTRUCTURE_PLAN.md
+"""
+Opaque cursors for keyset pagination of activity listings.
+
+A cursor carries the (created_at, run_id) of the last row of a page and a
+short fingerprint of the query it came from (listing, filters, direction).
+A cursor from one listing or filter set is rejected by another instead of
+silently paging the wrong result set. Cursors are not secrets: the tenant
+filter is always applied, so a forged cursor only moves within the caller's
+own runs.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from datetime import datetime
+from typing import Any
+
+CURSOR_VERSION = 1
+
+
+class InvalidCursorError(ValueError):
+    """Cursor is malformed or belongs to a different query."""
+
+
+def cursor_scope(listing: str, where_sql: str, params: dict[str, Any], sort_dir: str) -> str:
+    """Fingerprint of the query a cursor is valid for."""
+    canonical = json.dumps([listing, where_sql, params, sort_dir], sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def encode_run_cursor(created_at: datetime, run_id: str, scope: str) -> str:
+    """Encode the position after (created_at, run_id) as an opaque token."""
+    payload = json.dumps(
+        {"v": CURSOR_VERSION, "c": created_at.isoformat(), "r": run_id, "s": scope},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_run_cursor(token: str, scope: str) -> tuple[datetime, str]:
+    """
+    Decode a cursor issued for `scope`.
+
+    Returns:
+        (created_at, run_id) of the last row already returned
+
+    Raises:
+        InvalidCursorError: malformed token, or issued for another query
+    """
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        payload = json.loads(raw)
+        version, created_at, run_id, token_scope = payload["v"], payload["c"], payload["r"], payload["s"]
+        created_at = datetime.fromisoformat(created_at)
+    except (binascii.Error, UnicodeDecodeError, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if version != CURSOR_VERSION or not isinstance(run_id, str):
+        raise InvalidCursorError("Malformed cursor")
+    if token_scope != scope:
+        raise InvalidCursorError("Cursor does not match this query; restart pagination without a cursor")
+    return created_at, run_id
@@ -7,10 +7,10 @@
 #   Emits: none
 #   Subscribes: none
 # Data Access:
-#   Reads: v_runs_o2, runs
+#   Reads: v_runs_o2, runs, run_summary_buckets, limits
 #   Writes: none
 # Role: Activity read data access operations
-# Callers: activity_facade.py (L5 engine)
+# Callers: activity_facade.py, attention_ranking.py (L5 engines)
 # Allowed Imports: L7 (models), sqlalchemy
 # Forbidden Imports: L1, L2, L3, L4, L5
 # Reference: PIN-470, Phase-3B SQLAlchemy Extraction
@@ -19,9 +19,11 @@
 # L6 DRIVER INVARIANT — ACTIVITY READ
 # ============================================================================
 # This driver handles PERSISTENCE only:
-# - Query runs (v_runs_o2 view)
-# - Query metrics aggregates
+# - Query runs (v_runs_o2 view), by offset or by (created_at, run_id) keyset
+# - Count runs (exact, planner-estimated, or cached for a few seconds)
+# - Query summaries and metrics aggregates (run_summary_buckets)
 # - Query threshold signals
+# - Query attention queue candidates (ranked by an L5-supplied expression)
 #
 # NO BUSINESS LOGIC. Signal computation, risk evaluation, and
 # summary generation stay in L5 engine.
@@ -36,14 +38,118 @@ Handles database operations for activity queries:
 - Fetching metrics aggregates
 - Fetching threshold signals
 
+Summaries (status summary, metrics, dimension breakdown) sum
+run_summary_buckets (migration 136), per-tenant daily run counts kept
+current by triggers on runs, instead of counting the tenant's runs; their
+cost grows with days of history, not with runs. Their where_sql may only
+use tenant_id, project_id and the bucket dimensions (BUCKET_DIMENSIONS in
+run_summary_driver).
+
+Listings page either by LIMIT/OFFSET (legacy) or by keyset: with
+keyset=True rows are ordered by (created_at, run_id) and `after` is the
+(created_at, run_id) of the last row of the previous page, so page 1000
+costs the same index range scan as page 1 (idx_runs_tenant_created_id,
+migration 135).
+
+count_runs() modes:
+- exact:     SELECT COUNT(*)
+- estimated: planner row estimate (EXPLAIN); exact when the estimate is
+             below COUNT_ESTIMATE_EXACT_BELOW, where counting is cheap
+- cached:    exact count, reused per (filters, params) for
+             COUNT_CACHE_TTL_SECONDS within this process
+
 Reference: PIN-470, Phase-3B SQLAlchemy Extraction
 """
 
+import json
+import os
+import time
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+COUNT_MODES = ("exact", "estimated", "cached")
+COUNT_CACHE_TTL_SECONDS = float(os.getenv("ACTIVITY_COUNT_CACHE_TTL_SECONDS", "30"))
+COUNT_CACHE_MAX_ENTRIES = 4096
+# Below this many estimated rows an exact COUNT(*) is cheap enough to run
+COUNT_ESTIMATE_EXACT_BELOW = 10_000
+
+# (where_sql, params) -> (expires_at, count); process-local, insertion ordered
+_COUNT_CACHE: dict[str, tuple[float, int]] = {}
+
+
+def _count_cache_key(where_sql: str, params: dict[str, Any]) -> str:
+    return json.dumps([where_sql, params], sort_keys=True, default=str)
+
+
+def clear_count_cache() -> None:
+    """Drop all cached counts."""
+    _COUNT_CACHE.clear()
+
+
+# risk_type in v_runs_o2 comes from the tenant's highest-priority active
+# threshold limit, so it is the same for every run of the tenant
+_TENANT_RISK_TYPE_SQL = """
+    SELECT
+        CASE
+            WHEN limit_type LIKE 'COST%' THEN 'COST'
+            WHEN limit_type LIKE 'TOKEN%' THEN 'TOKENS'
+            WHEN limit_type LIKE 'TIME%' THEN 'TIME'
+            WHEN limit_type LIKE 'REQUEST%' THEN 'RATE'
+            ELSE 'OTHER'
+        END AS risk_type
+    FROM limits
+    WHERE tenant_id = :tenant_id
+      AND status = 'ACTIVE'
+      AND limit_category = 'THRESHOLD'
+    ORDER BY
+        CASE scope
+            WHEN 'TENANT' THEN 1
+            WHEN 'PROJECT' THEN 2
+            WHEN 'AGENT' THEN 3
+            WHEN 'PROVIDER' THEN 4
+            WHEN 'GLOBAL' THEN 5
+            ELSE 6
+        END,
+        id
+    LIMIT 1
+"""
+
+
+def _bucket_count(condition: str) -> str:
+    """Runs in the matching buckets that satisfy condition."""
+    return f"COALESCE(SUM(run_count) FILTER (WHERE {condition}), 0)::bigint"
+
+
+def _page_sql(
+    order_sql: str,
+    params: dict[str, Any],
+    limit: int,
+    offset: int,
+    keyset: bool,
+    after: tuple[datetime, str] | None,
+    sort_dir: str = "DESC",
+) -> tuple[str, str, dict[str, Any]]:
+    """
+    Build the keyset predicate and ORDER BY/LIMIT tail of a listing query.
+
+    Returns (extra_where, tail_sql, query_params). Offset mode keeps
+    order_sql and LIMIT/OFFSET; keyset mode orders by (created_at, run_id)
+    in sort_dir and starts strictly after `after`.
+    """
+    if not keyset:
+        return "", f"ORDER BY {order_sql} LIMIT :limit OFFSET :offset", {**params, "limit": limit, "offset": offset}
+
+    query_params = {**params, "limit": limit}
+    extra_where = ""
+    if after is not None:
+        op = "<" if sort_dir == "DESC" else ">"
+        extra_where = f" AND (created_at, run_id) {op} (:after_created_at, :after_run_id)"
+        query_params["after_created_at"], query_params["after_run_id"] = after
+    return extra_where, f"ORDER BY created_at {sort_dir}, run_id {sort_dir} LIMIT :limit", query_params
+
 
 class ActivityReadDriver:
     """
@@ -61,6 +167,7 @@ class ActivityReadDriver:
         self,
         where_sql: str,
         params: dict[str, Any],
+        mode: str = "exact",
     ) -> int:
         """
         Count runs matching filters.
@@ -68,14 +175,46 @@ class ActivityReadDriver:
         Args:
             where_sql: WHERE clause SQL
             params: Query parameters
+            mode: exact, estimated or cached (see module docstring)
 
         Returns:
             Total count
         """
+        if mode == "exact":
+            return await self._count_exact(where_sql, params)
+        if mode == "estimated":
+            estimate = await self._count_estimate(where_sql, params)
+            if estimate < COUNT_ESTIMATE_EXACT_BELOW:
+                return await self._count_exact(where_sql, params)
+            return estimate
+        if mode == "cached":
+            key = _count_cache_key(where_sql, params)
+            now = time.monotonic()
+            hit = _COUNT_CACHE.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            total = await self._count_exact(where_sql, params)
+            _COUNT_CACHE.pop(key, None)
+            if len(_COUNT_CACHE) >= COUNT_CACHE_MAX_ENTRIES:
+                _COUNT_CACHE.pop(next(iter(_COUNT_CACHE)))
+            _COUNT_CACHE[key] = (now + COUNT_CACHE_TTL_SECONDS, total)
+            return total
+        raise ValueError(f"Unknown count mode: {mode!r} (expected one of {', '.join(COUNT_MODES)})")
+
+    async def _count_exact(self, where_sql: str, params: dict[str, Any]) -> int:
         count_sql = f"SELECT COUNT(*) as total FROM v_runs_o2 WHERE {where_sql}"
         result = await self._session.execute(text(count_sql), params)
         return result.scalar() or 0
 
+    async def _count_estimate(self, where_sql: str, params: dict[str, Any]) -> int:
+        """Planner row estimate for the filter; no rows are read."""
+        sql = f"EXPLAIN (FORMAT JSON) SELECT 1 FROM v_runs_o2 WHERE {where_sql}"
+        result = await self._session.execute(text(sql), params)
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     async def fetch_runs(
         self,
         where_sql: str,
@@ -84,6 +223,9 @@ class ActivityReadDriver:
         sort_dir: str,
         limit: int,
         offset: int,
+        *,
+        keyset: bool = False,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch runs matching filters.
@@ -91,27 +233,30 @@ class ActivityReadDriver:
         Args:
             where_sql: WHERE clause SQL
             params: Query parameters
-            sort_by: Field to sort by
+            sort_by: Field to sort by (offset mode)
             sort_dir: Sort direction (ASC/DESC)
             limit: Max rows
-            offset: Rows to skip
+            offset: Rows to skip (offset mode)
+            keyset: Order by (created_at, run_id) and page with `after`
+            after: (created_at, run_id) of the previous page's last row
 
         Returns:
             List of run dicts
         """
+        extra_where, tail_sql, query_params = _page_sql(
+            f"{sort_by} {sort_dir}", params, limit, offset, keyset, after, sort_dir
+        )
         data_sql = f"""
             SELECT
                 run_id, tenant_id, project_id, is_synthetic, source, provider_type,
                 state, status, started_at, last_seen_at, completed_at, duration_ms,
                 risk_level, latency_bucket, evidence_health, integrity_status,
                 incident_count, policy_draft_count, policy_violation,
-                input_tokens, output_tokens, estimated_cost_usd
+                input_tokens, output_tokens, estimated_cost_usd, created_at
             FROM v_runs_o2
-            WHERE {where_sql}
-            ORDER BY {sort_by} {sort_dir}
-            LIMIT :limit OFFSET :offset
+            WHERE {where_sql}{extra_where}
+            {tail_sql}
         """
-        query_params = {**params, "limit": limit, "offset": offset}
         result = await self._session.execute(text(data_sql), query_params)
         return [dict(row) for row in result.mappings().all()]
 
@@ -147,20 +292,21 @@ class ActivityReadDriver:
         params: dict[str, Any],
     ) -> list[dict[str, Any]]:
         """
-        Fetch runs grouped by status.
+        Fetch runs grouped by status, from run_summary_buckets.
 
         Args:
-            where_sql: WHERE clause SQL
+            where_sql: WHERE clause SQL over bucket columns
             params: Query parameters
 
         Returns:
             List of {status, count} dicts
         """
         sql = f"""
-            SELECT status, COUNT(*) as count
-            FROM v_runs_o2
+            SELECT status, SUM(run_count)::bigint as count
+            FROM run_summary_buckets
             WHERE {where_sql}
             GROUP BY status
+            HAVING SUM(run_count) > 0
             ORDER BY count DESC
         """
         result = await self._session.execute(text(sql), params)
@@ -174,6 +320,9 @@ class ActivityReadDriver:
         sort_dir: str,
         limit: int,
         offset: int,
+        *,
+        keyset: bool = False,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch runs with policy context columns.
@@ -181,14 +330,19 @@ class ActivityReadDriver:
         Args:
             where_sql: WHERE clause SQL
             params: Query parameters
-            sort_by: Field to sort by
+            sort_by: Field to sort by (offset mode)
             sort_dir: Sort direction (ASC/DESC)
             limit: Max rows
-            offset: Rows to skip
+            offset: Rows to skip (offset mode)
+            keyset: Order by (created_at, run_id) and page with `after`
+            after: (created_at, run_id) of the previous page's last row
 
         Returns:
             List of run dicts with policy context
         """
+        extra_where, tail_sql, query_params = _page_sql(
+            f"{sort_by} {sort_dir}", params, limit, offset, keyset, after, sort_dir
+        )
         data_sql = f"""
             SELECT
                 run_id, tenant_id, project_id, is_synthetic, source, provider_type,
@@ -206,13 +360,12 @@ class ActivityReadDriver:
                 COALESCE(evaluation_outcome, 'OK') as evaluation_outcome,
                 actual_value,
                 risk_type,
-                proximity_pct
+                proximity_pct,
+                created_at
             FROM v_runs_o2
-            WHERE {where_sql}
-            ORDER BY {sort_by} {sort_dir}
-            LIMIT :limit OFFSET :offset
+            WHERE {where_sql}{extra_where}
+            {tail_sql}
         """
-        query_params = {**params, "limit": limit, "offset": offset}
         result = await self._session.execute(text(data_sql), query_params)
         return [dict(row) for row in result.mappings().all()]
 
@@ -222,6 +375,9 @@ class ActivityReadDriver:
         params: dict[str, Any],
         limit: int,
         offset: int,
+        *,
+        keyset: bool = False,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch at-risk runs for signal synthesis.
@@ -230,11 +386,16 @@ class ActivityReadDriver:
             where_sql: WHERE clause SQL
             params: Query parameters
             limit: Max rows
-            offset: Rows to skip
+            offset: Rows to skip (offset mode)
+            keyset: Order by (created_at, run_id) and page with `after`
+            after: (created_at, run_id) of the previous page's last row
 
         Returns:
             List of at-risk run dicts
         """
+        extra_where, tail_sql, query_params = _page_sql(
+            "started_at DESC", params, limit, offset, keyset, after
+        )
         sql = f"""
             SELECT
                 run_id, tenant_id, project_id, is_synthetic, source, provider_type,
@@ -249,47 +410,82 @@ class ActivityReadDriver:
                 COALESCE(evaluation_outcome, 'OK') as evaluation_outcome,
                 actual_value,
                 risk_type,
-                proximity_pct
+                proximity_pct,
+                created_at
             FROM v_runs_o2
-            WHERE {where_sql}
-            ORDER BY started_at DESC
-            LIMIT :limit OFFSET :offset
+            WHERE {where_sql}{extra_where}
+            {tail_sql}
         """
-        query_params = {**params, "limit": limit, "offset": offset}
         result = await self._session.execute(text(sql), query_params)
         return [dict(row) for row in result.mappings().all()]
 
+    async def fetch_attention_candidates(
+        self,
+        where_sql: str,
+        params: dict[str, Any],
+        rank_sql: str,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch the highest-ranked at-risk runs for the attention queue.
+
+        Args:
+            where_sql: WHERE clause SQL
+            params: Query parameters (for both where_sql and rank_sql)
+            rank_sql: Ranking expression over v_runs_o2 columns, highest first
+            limit: Max rows
+
+        Returns:
+            List of run dicts with their rank_key, highest rank first
+        """
+        sql = f"""
+            SELECT
+                run_id, tenant_id, project_id, source, state, status,
+                started_at, created_at, risk_level, risk_type, evidence_health,
+                {rank_sql} AS rank_key
+            FROM v_runs_o2
+            WHERE {where_sql}
+            ORDER BY rank_key DESC, run_id
+            LIMIT :limit
+        """
+        result = await self._session.execute(text(sql), {**params, "limit": limit})
+        return [dict(row) for row in result.mappings().all()]
+
     async def fetch_metrics(
         self,
         where_sql: str,
         params: dict[str, Any],
     ) -> dict[str, Any]:
         """
-        Fetch aggregated metrics.
+        Fetch aggregated metrics, from run_summary_buckets.
+
+        Risk-type counts attribute every matching run to the tenant's
+        current risk type, as v_runs_o2 does.
 
         Args:
-            where_sql: WHERE clause SQL
-            params: Query parameters
+            where_sql: WHERE clause SQL over bucket columns
+            params: Query parameters (must include tenant_id)
 
         Returns:
             Dict with metric counts
         """
         sql = f"""
+            WITH tenant_risk AS ({_TENANT_RISK_TYPE_SQL})
             SELECT
-                COUNT(*) FILTER (WHERE risk_level = 'AT_RISK') as at_risk_count,
-                COUNT(*) FILTER (WHERE risk_level = 'VIOLATED') as violated_count,
-                COUNT(*) FILTER (WHERE risk_level = 'NEAR_THRESHOLD') as near_threshold_count,
-                COUNT(*) FILTER (WHERE risk_level != 'NORMAL') as total_at_risk,
-                COUNT(*) FILTER (WHERE state = 'LIVE') as live_count,
-                COUNT(*) FILTER (WHERE state = 'COMPLETED') as completed_count,
-                COUNT(*) FILTER (WHERE evidence_health = 'FLOWING') as evidence_flowing_count,
-                COUNT(*) FILTER (WHERE evidence_health = 'DEGRADED') as evidence_degraded_count,
-                COUNT(*) FILTER (WHERE evidence_health = 'MISSING') as evidence_missing_count,
-                COUNT(*) FILTER (WHERE risk_type = 'COST') as cost_risk_count,
-                COUNT(*) FILTER (WHERE risk_type = 'TIME') as time_risk_count,
-                COUNT(*) FILTER (WHERE risk_type = 'TOKENS') as token_risk_count,
-                COUNT(*) FILTER (WHERE risk_type = 'RATE') as rate_risk_count
-            FROM v_runs_o2
+                {_bucket_count("risk_level = 'AT_RISK'")} as at_risk_count,
+                {_bucket_count("risk_level = 'VIOLATED'")} as violated_count,
+                {_bucket_count("risk_level = 'NEAR_THRESHOLD'")} as near_threshold_count,
+                {_bucket_count("risk_level != 'NORMAL'")} as total_at_risk,
+                {_bucket_count("state = 'LIVE'")} as live_count,
+                {_bucket_count("state = 'COMPLETED'")} as completed_count,
+                {_bucket_count("evidence_health = 'FLOWING'")} as evidence_flowing_count,
+                {_bucket_count("evidence_health = 'DEGRADED'")} as evidence_degraded_count,
+                {_bucket_count("evidence_health = 'MISSING'")} as evidence_missing_count,
+                {_bucket_count("(SELECT risk_type FROM tenant_risk) = 'COST'")} as cost_risk_count,
+                {_bucket_count("(SELECT risk_type FROM tenant_risk) = 'TIME'")} as time_risk_count,
+                {_bucket_count("(SELECT risk_type FROM tenant_risk) = 'TOKENS'")} as token_risk_count,
+                {_bucket_count("(SELECT risk_type FROM tenant_risk) = 'RATE'")} as rate_risk_count
+            FROM run_summary_buckets
             WHERE {where_sql}
         """
         result = await self._session.execute(text(sql), params)
@@ -302,6 +498,9 @@ class ActivityReadDriver:
         params: dict[str, Any],
         limit: int,
         offset: int,
+        *,
+        keyset: bool = False,
+        after: tuple[datetime, str] | None = None,
     ) -> list[dict[str, Any]]:
         """
         Fetch threshold proximity signals.
@@ -310,11 +509,16 @@ class ActivityReadDriver:
             where_sql: WHERE clause SQL
             params: Query parameters
             limit: Max rows
-            offset: Rows to skip
+            offset: Rows to skip (offset mode)
+            keyset: Order by (created_at, run_id) and page with `after`
+            after: (created_at, run_id) of the previous page's last row
 
         Returns:
             List of threshold signal dicts
         """
+        extra_where, tail_sql, query_params = _page_sql(
+            "proximity_pct DESC", params, limit, offset, keyset, after
+        )
         sql = f"""
             SELECT
                 run_id,
@@ -328,13 +532,12 @@ class ActivityReadDriver:
                 threshold_unit,
                 COALESCE(threshold_source, 'DEFAULT') as threshold_source,
                 actual_value,
-                risk_type
+                risk_type,
+                created_at
             FROM v_runs_o2
-            WHERE {where_sql}
-            ORDER BY proximity_pct DESC
-            LIMIT :limit OFFSET :offset
+            WHERE {where_sql}{extra_where}
+            {tail_sql}
         """
-        query_params = {**params, "limit": limit, "offset": offset}
         result = await self._session.execute(text(sql), query_params)
         return [dict(row) for row in result.mappings().all()]
 
@@ -346,11 +549,11 @@ class ActivityReadDriver:
         limit: int,
     ) -> list[dict[str, Any]]:
         """
-        Fetch dimension breakdown (GROUP BY dimension).
+        Fetch dimension breakdown (GROUP BY dimension), from run_summary_buckets.
 
         Args:
-            dimension: Column to group by (must be a valid v_runs_o2 column)
-            where_sql: WHERE clause SQL
+            dimension: Column to group by (must be a bucket dimension)
+            where_sql: WHERE clause SQL over bucket columns
             params: Query parameters
             limit: Max groups
 
@@ -368,10 +571,11 @@ class ActivityReadDriver:
         sql = f"""
             SELECT
                 COALESCE({dimension}::text, 'unknown') as value,
-                COUNT(*) as count
-            FROM v_runs_o2
+                SUM(run_count)::bigint as count
+            FROM run_summary_buckets
             WHERE {where_sql}
             GROUP BY {dimension}
+            HAVING SUM(run_count) > 0
             ORDER BY count DESC
             LIMIT :limit
         """
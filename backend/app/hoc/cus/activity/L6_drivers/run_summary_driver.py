@@ -0,0 +1,178 @@
+# Layer: L6 — Data Access Driver
+# AUDIENCE: INTERNAL
+# Temporal:
+#   Trigger: scheduler (main.py reconcile loop), benchmark
+#   Execution: async
+# Lifecycle:
+#   Emits: none
+#   Subscribes: none
+# Data Access:
+#   Reads: runs, run_summary_buckets
+#   Writes: run_summary_buckets (reconcile only)
+# Role: Consistency check and repair of run_summary_buckets against runs
+# Callers: main.py (reconcile_run_summary_buckets), scripts/benchmark_activity_summaries.py
+# Allowed Imports: sqlalchemy
+# Forbidden Imports: L1, L2, L3, L4, L5
+# Reference: PIN-470, migration 136_run_summary_buckets
+
+"""
+Run Summary Driver (L6 Data Access)
+
+run_summary_buckets (migration 136) holds per-tenant, per-UTC-day run
+counts for each combination of the summary dimensions. Triggers on runs
+keep it current; ActivityReadDriver sums it for dashboard summaries.
+
+This driver compares buckets with the live GROUP BY over runs, and
+rewrites buckets that drifted. Both work on a range of days, so a
+reconcile pass costs the runs created in that range, not the whole
+history. The caller owns the transaction.
+"""
+
+import os
+from datetime import date, datetime, time, timezone
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Reconcile loop (main.py)
+RUN_SUMMARY_RECONCILE_INTERVAL_SECONDS = int(os.getenv("RUN_SUMMARY_RECONCILE_INTERVAL_SECONDS", "600"))
+RUN_SUMMARY_RECONCILE_DAYS = int(os.getenv("RUN_SUMMARY_RECONCILE_DAYS", "2"))  # today and yesterday
+
+BUCKET_DIMENSIONS = (
+    "project_id",
+    "state",
+    "status",
+    "risk_level",
+    "latency_bucket",
+    "evidence_health",
+    "integrity_status",
+    "source",
+    "provider_type",
+)
+
+_BUCKET_KEY = "tenant_id, bucket_date, " + ", ".join(BUCKET_DIMENSIONS)
+
+# Live bucket counts vs stored buckets, for buckets on or after :since
+DRIFT_SQL = f"""
+    WITH live AS (
+        SELECT {_BUCKET_KEY}, COUNT(*) AS run_count
+        FROM (
+            SELECT
+                tenant_id,
+                (created_at AT TIME ZONE 'UTC')::date AS bucket_date,
+                COALESCE(project_id, '') AS project_id,
+                {", ".join(BUCKET_DIMENSIONS[1:])}
+            FROM runs
+            WHERE tenant_id IS NOT NULL AND created_at >= :since_start{{tenant_filter}}
+        ) r
+        GROUP BY {_BUCKET_KEY}
+    ),
+    stored AS (
+        SELECT {_BUCKET_KEY}, run_count
+        FROM run_summary_buckets
+        WHERE bucket_date >= :since AND run_count <> 0{{tenant_filter}}
+    )
+    SELECT
+        {_BUCKET_KEY},
+        COALESCE(live.run_count, 0) AS live_count,
+        COALESCE(stored.run_count, 0) AS bucket_count
+    FROM live FULL OUTER JOIN stored USING ({_BUCKET_KEY})
+    WHERE COALESCE(live.run_count, 0) <> COALESCE(stored.run_count, 0)
+"""
+
+REPAIR_SQL = f"""
+    WITH drift AS ({DRIFT_SQL}),
+    corrected AS (
+        INSERT INTO run_summary_buckets AS b ({_BUCKET_KEY}, run_count, updated_at)
+        SELECT {_BUCKET_KEY}, live_count, NOW()
+        FROM drift
+        ORDER BY {_BUCKET_KEY}
+        ON CONFLICT ({_BUCKET_KEY}) DO UPDATE SET
+            run_count = EXCLUDED.run_count,
+            updated_at = EXCLUDED.updated_at
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM corrected
+"""
+
+PRUNE_SQL = """
+    DELETE FROM run_summary_buckets
+    WHERE bucket_date >= :since AND run_count = 0{tenant_filter}
+"""
+
+
+def _range_params(since: date, tenant_id: str | None) -> tuple[str, dict[str, Any]]:
+    params: dict[str, Any] = {
+        "since": since,
+        "since_start": datetime.combine(since, time.min, tzinfo=timezone.utc),
+    }
+    if tenant_id is None:
+        return "", params
+    params["tenant_id"] = tenant_id
+    return " AND tenant_id = :tenant_id", params
+
+
+class RunSummaryDriver:
+    """Consistency check and repair for run_summary_buckets."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def check_buckets(
+        self,
+        since: date,
+        tenant_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Compare buckets from `since` (UTC day) onwards with the live aggregate.
+
+        Runs as one statement, so runs and buckets are read from the same
+        snapshot and in-flight writes never show up as drift.
+
+        Args:
+            since: First bucket day to check
+            tenant_id: Limit to one tenant (default: all tenants)
+
+        Returns:
+            One dict per drifted bucket: its key, live_count and bucket_count
+        """
+        tenant_filter, params = _range_params(since, tenant_id)
+        result = await self._session.execute(
+            text(DRIFT_SQL.format(tenant_filter=tenant_filter)), params
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    async def repair_buckets(
+        self,
+        since: date,
+        tenant_id: str | None = None,
+    ) -> int:
+        """
+        Rewrite drifted buckets from `since` (UTC day) onwards from runs.
+
+        Takes a SHARE ROW EXCLUSIVE lock on run_summary_buckets, which holds
+        back run writes (their triggers upsert buckets) until the caller
+        commits, so no delta lands between the count and the rewrite.
+        Zero-count buckets in the range are deleted.
+
+        Args:
+            since: First bucket day to repair
+            tenant_id: Limit to one tenant (default: all tenants)
+
+        Returns:
+            Number of buckets corrected
+        """
+        tenant_filter, params = _range_params(since, tenant_id)
+        await self._session.execute(text("LOCK TABLE run_summary_buckets IN SHARE ROW EXCLUSIVE MODE"))
+        result = await self._session.execute(
+            text(REPAIR_SQL.format(tenant_filter=tenant_filter)), params
+        )
+        corrected = int(result.scalar() or 0)
+        await self._session.execute(text(PRUNE_SQL.format(tenant_filter=tenant_filter)), params)
+        return corrected
+
+
+def get_run_summary_driver(session: AsyncSession) -> RunSummaryDriver:
+    """Get a RunSummaryDriver instance."""
+    return RunSummaryDriver(session)
@@ -10,7 +10,7 @@
 #   Reads: signal_feedback
 #   Writes: signal_feedback
 # Role: Signal feedback persistence operations
-# Callers: signal_feedback_engine.py (L5 engine), activity_handler.py (L4)
+# Callers: signal_feedback_engine.py, attention_ranking.py (L5 engines), activity_handler.py (L4)
 # Allowed Imports: L7 (models), sqlalchemy
 # Forbidden Imports: L1, L2, L3, L4, L5
 # Reference: UC-010 Activity Feedback Lifecycle
@@ -23,12 +23,14 @@ Handles database operations for signal feedback lifecycle:
 - Insert ack/suppress/reopen records
 - Query current feedback state
 - List active suppressions
+- List latest feedback per fingerprint (attention queue rebuild)
 - Cleanup expired feedback
 - Bulk operations with target_set_hash
 
 L6 INVARIANT: Never commit/rollback — L4 owns transaction boundaries.
 """
 
+from datetime import datetime
 from typing import Any, Optional
 
 from sqlalchemy import text
@@ -151,6 +153,32 @@ class SignalFeedbackDriver:
         )
         return [dict(row) for row in result.mappings().all()]
 
+    async def list_latest_feedback(
+        self,
+        session: AsyncSession,
+        *,
+        tenant_id: str,
+        since: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Latest feedback record per fingerprint (tenant-scoped).
+
+        With `since`, only fingerprints whose latest record was created
+        at or after it.
+        """
+        since_filter = " AND created_at >= :since" if since else ""
+        result = await session.execute(
+            text(f"""
+                SELECT DISTINCT ON (signal_fingerprint)
+                       signal_fingerprint, feedback_state, expires_at, created_at
+                FROM signal_feedback
+                WHERE tenant_id = :tenant_id{since_filter}
+                ORDER BY signal_fingerprint, created_at DESC
+            """),
+            {"tenant_id": tenant_id, "since": since},
+        )
+        return [dict(row) for row in result.mappings().all()]
+
     async def count_expired(
         self,
         session: AsyncSession,
@@ -8,7 +8,7 @@
 #   Emits: none
 #   Subscribes: none
 # Data Access:
-#   Reads: via cost_anomaly_driver (L6)
+#   Reads: via cost_anomaly_driver, cost_record_stream_driver (L6)
 #   Writes: via cost_anomaly_driver (L6)
 # Role: Cost anomaly detection business logic (System Truth)
 # Callers: tests, future background job
@@ -33,19 +33,29 @@ Detection Types:
 - SUSTAINED_DRIFT: Rolling average above baseline for multiple days
 - BUDGET_WARNING: Projected overrun (warn threshold)
 - BUDGET_EXCEEDED: Hard stop (budget exhausted)
+
+Detectors:
+- CostAnomalyDetector: re-aggregates cost_records through the sync
+  cost_anomaly_driver on every run.
+- StreamingCostAnomalyDetector: same rules from rolling per-entity state,
+  fed through the async cost_record_stream_driver. AnomalyIncidentCoordinator
+  (L4) runs it unless COST_ANOMALY_STREAMING=false.
 """
 
 from __future__ import annotations
 
 import logging
+import math
+import os
 import uuid
 from dataclasses import dataclass, field
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional, Sequence
 
 from app.hoc.cus.hoc_spine.services.time import utc_now
 from app.hoc.cus.analytics.L5_schemas.cost_anomaly_dtos import PersistedAnomaly
+from app.hoc.cus.analytics.L5_schemas.cost_anomaly_schemas import CostRecordStreamProtocol
 # R1 Resolution: Cross-domain incident write REMOVED.
 # Analytics emits CostAnomalyFact; incidents domain decides incident creation.
 # See: app/hoc/cus/incidents/L5_engines/anomaly_bridge.py
@@ -159,6 +169,67 @@ def classify_severity(deviation_pct: float) -> AnomalySeverity:
         return AnomalySeverity.LOW
 
 
+def check_budget_threshold(
+    budget_type: str,
+    entity_id: Optional[str],
+    period: str,
+    current_cents: float,
+    limit_cents: int,
+    warn_threshold_pct: int,
+) -> Optional[DetectedAnomaly]:
+    """Check if budget threshold is breached."""
+    if limit_cents <= 0:
+        return None
+
+    usage_pct = current_cents / limit_cents * 100
+
+    entity_desc = f"{budget_type}" if not entity_id else f"{budget_type} '{entity_id}'"
+
+    if usage_pct >= 100:
+        return DetectedAnomaly(
+            anomaly_type=AnomalyType.BUDGET_EXCEEDED,
+            severity=AnomalySeverity.HIGH,  # Budget exceeded is always HIGH
+            entity_type=budget_type,
+            entity_id=entity_id,
+            current_value_cents=current_cents,
+            expected_value_cents=float(limit_cents),
+            deviation_pct=usage_pct,
+            message=f"{period.title()} budget EXCEEDED for {entity_desc}: {usage_pct:.1f}%",
+            derived_cause=DerivedCause.UNKNOWN,
+            metadata={"period": period, "limit_cents": limit_cents},
+        )
+    elif usage_pct >= warn_threshold_pct:
+        severity = AnomalySeverity.MEDIUM if usage_pct < 90 else AnomalySeverity.HIGH
+        return DetectedAnomaly(
+            anomaly_type=AnomalyType.BUDGET_WARNING,
+            severity=severity,
+            entity_type=budget_type,
+            entity_id=entity_id,
+            current_value_cents=current_cents,
+            expected_value_cents=float(limit_cents),
+            deviation_pct=usage_pct,
+            message=f"{period.title()} budget WARNING for {entity_desc}: {usage_pct:.1f}%",
+            derived_cause=DerivedCause.UNKNOWN,
+            metadata={"period": period, "limit_cents": limit_cents, "warn_threshold_pct": warn_threshold_pct},
+        )
+
+    return None
+
+
+def format_spike_message(
+    entity_type: str,
+    entity_id: str,
+    deviation_pct: float,
+    breach_count: int,
+) -> str:
+    """Format human-readable spike message."""
+    entity_desc = f"{entity_type.title()} {entity_id}"
+    return (
+        f"{entity_desc} spending {deviation_pct:.1f}% above baseline "
+        f"for {breach_count} consecutive day{'s' if breach_count > 1 else ''}"
+    )
+
+
 # =============================================================================
 # DETECTOR CLASS
 # =============================================================================
@@ -577,43 +648,9 @@ class CostAnomalyDetector:
         warn_threshold_pct: int,
     ) -> Optional[DetectedAnomaly]:
         """Check if budget threshold is breached."""
-        if limit_cents <= 0:
-            return None
-
-        usage_pct = current_cents / limit_cents * 100
-        deviation_pct = usage_pct - 100  # Deviation from 100%
-
-        entity_desc = f"{budget_type}" if not entity_id else f"{budget_type} '{entity_id}'"
-
-        if usage_pct >= 100:
-            return DetectedAnomaly(
-                anomaly_type=AnomalyType.BUDGET_EXCEEDED,
-                severity=AnomalySeverity.HIGH,  # Budget exceeded is always HIGH
-                entity_type=budget_type,
-                entity_id=entity_id,
-                current_value_cents=current_cents,
-                expected_value_cents=float(limit_cents),
-                deviation_pct=usage_pct,
-                message=f"{period.title()} budget EXCEEDED for {entity_desc}: {usage_pct:.1f}%",
-                derived_cause=DerivedCause.UNKNOWN,
-                metadata={"period": period, "limit_cents": limit_cents},
-            )
-        elif usage_pct >= warn_threshold_pct:
-            severity = AnomalySeverity.MEDIUM if usage_pct < 90 else AnomalySeverity.HIGH
-            return DetectedAnomaly(
-                anomaly_type=AnomalyType.BUDGET_WARNING,
-                severity=severity,
-                entity_type=budget_type,
-                entity_id=entity_id,
-                current_value_cents=current_cents,
-                expected_value_cents=float(limit_cents),
-                deviation_pct=usage_pct,
-                message=f"{period.title()} budget WARNING for {entity_desc}: {usage_pct:.1f}%",
-                derived_cause=DerivedCause.UNKNOWN,
-                metadata={"period": period, "limit_cents": limit_cents, "warn_threshold_pct": warn_threshold_pct},
-            )
-
-        return None
+        return check_budget_threshold(
+            budget_type, entity_id, period, current_cents, limit_cents, warn_threshold_pct
+        )
 
     # =========================================================================
     # HELPER METHODS
@@ -848,11 +885,7 @@ class CostAnomalyDetector:
         breach_count: int,
     ) -> str:
         """Format human-readable spike message."""
-        entity_desc = f"{entity_type.title()} {entity_id}"
-        return (
-            f"{entity_desc} spending {deviation_pct:.1f}% above baseline "
-            f"for {breach_count} consecutive day{'s' if breach_count > 1 else ''}"
-        )
+        return format_spike_message(entity_type, entity_id, deviation_pct, breach_count)
 
     # =========================================================================
     # PERSISTENCE
@@ -897,6 +930,615 @@ class CostAnomalyDetector:
         return created
 
 
+# =============================================================================
+# STREAMING DETECTOR: CONFIGURATION
+# =============================================================================
+
+
+# Retained daily buckets: drift baseline reaches back 28 days, monthly budgets 31
+HISTORY_DAYS = 35
+
+# Days replayed by bootstrap() to rebuild breach / drift counters
+REPLAY_DAYS = 8
+
+# fetch_consecutive_breaches counts breaches in [today - 7 days, today]
+MAX_CONSECUTIVE_BREACHES = 8
+
+# EWMA span for per-entity daily spend statistics
+EWMA_SPAN_DAYS = int(os.getenv("COST_ANOMALY_EWMA_SPAN_DAYS", "14"))
+EWMA_ALPHA = 2.0 / (EWMA_SPAN_DAYS + 1)
+
+# Rows fetched per poll() query
+POLL_BATCH_SIZE = int(os.getenv("COST_ANOMALY_POLL_BATCH_SIZE", "5000"))
+
+# poll() only reads records older than this, so rows from transactions that
+# commit slightly out of created_at order are not skipped by the watermark
+POLL_SAFETY_LAG = timedelta(seconds=int(os.getenv("COST_ANOMALY_POLL_LAG_SECONDS", "5")))
+
+# Entity types checked for absolute spikes besides the tenant itself
+SPIKE_ENTITY_TYPES = ("user", "feature")
+
+
+def use_streaming_detector() -> bool:
+    """AnomalyIncidentCoordinator runs StreamingCostAnomalyDetector (read per call)."""
+    return os.getenv("COST_ANOMALY_STREAMING", "true").lower() == "true"
+
+
+# =============================================================================
+# STREAMING DETECTOR: ROLLING STATE
+# =============================================================================
+
+
+@dataclass
+class DayTotals:
+    """Totals of one entity's cost records for one day."""
+
+    cost_cents: float = 0.0
+    requests: int = 0
+    retries: int = 0
+    input_tokens: int = 0
+
+    def add(self, other: DayTotals) -> None:
+        self.cost_cents += other.cost_cents
+        self.requests += other.requests
+        self.retries += other.retries
+        self.input_tokens += other.input_tokens
+
+
+@dataclass
+class EntityWindow:
+    """Daily buckets plus EWMA statistics for one (entity_type, entity_id)."""
+
+    days: dict[date, DayTotals] = field(default_factory=dict)
+    ewma_mean: float = 0.0
+    ewma_var: float = 0.0
+    ewma_days: int = 0
+    folded_through: Optional[date] = None
+
+    def add(self, day: date, totals: DayTotals) -> None:
+        bucket = self.days.get(day)
+        if bucket is None:
+            bucket = self.days[day] = DayTotals()
+        bucket.add(totals)
+
+    def total(self, start: date, end: Optional[date] = None) -> tuple[float, int]:
+        """Cost and number of days with records in [start, end] (end open if None)."""
+        cost = 0.0
+        active_days = 0
+        for day, bucket in self.days.items():
+            if day >= start and (end is None or day <= end):
+                cost += bucket.cost_cents
+                active_days += 1
+        return cost, active_days
+
+    def since(self, start: date) -> Optional[DayTotals]:
+        """Summed totals for days >= start; None if there were no records."""
+        totals: Optional[DayTotals] = None
+        for day, bucket in self.days.items():
+            if day >= start:
+                if totals is None:
+                    totals = DayTotals()
+                totals.add(bucket)
+        return totals
+
+    def between(self, start: date, end: date) -> Optional[DayTotals]:
+        """Summed totals for start <= day < end; None if there were no records."""
+        totals: Optional[DayTotals] = None
+        for day, bucket in self.days.items():
+            if start <= day < end:
+                if totals is None:
+                    totals = DayTotals()
+                totals.add(bucket)
+        return totals
+
+    def fold(self, today: date) -> None:
+        """Fold closed days (before today) into the EWMA, each exactly once."""
+        closed = sorted(
+            day for day in self.days if day < today and (self.folded_through is None or day > self.folded_through)
+        )
+        for day in closed:
+            value = self.days[day].cost_cents
+            if self.ewma_days == 0:
+                self.ewma_mean = value
+                self.ewma_var = 0.0
+            else:
+                diff = value - self.ewma_mean
+                increment = EWMA_ALPHA * diff
+                self.ewma_mean += increment
+                self.ewma_var = (1 - EWMA_ALPHA) * (self.ewma_var + diff * increment)
+            self.ewma_days += 1
+            self.folded_through = day
+
+    def zscore(self, value: float) -> Optional[float]:
+        if self.ewma_days < 2 or self.ewma_var <= 0:
+            return None
+        return (value - self.ewma_mean) / math.sqrt(self.ewma_var)
+
+    def prune(self, oldest: date) -> None:
+        for day in [day for day in self.days if day < oldest]:
+            del self.days[day]
+
+
+@dataclass
+class _TenantState:
+    entities: dict[tuple[str, str], EntityWindow] = field(default_factory=dict)
+    # (entity_type, entity_id) -> (last breach date, consecutive days)
+    breaches: dict[tuple[str, str], tuple[date, int]] = field(default_factory=dict)
+    # (entity_type, entity_id) -> (last check date, drift days)
+    drift: dict[tuple[str, str], tuple[date, int]] = field(default_factory=dict)
+
+    def window(self, entity_type: str, entity_id: str) -> EntityWindow:
+        key = (entity_type, entity_id)
+        window = self.entities.get(key)
+        if window is None:
+            window = self.entities[key] = EntityWindow()
+        return window
+
+
+def _record_day(created_at: datetime) -> date:
+    """Calendar day of a record, as DATE(created_at) sees it (UTC)."""
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc)
+    return created_at.date()
+
+
+# =============================================================================
+# STREAMING DETECTOR
+# =============================================================================
+
+
+class StreamingCostAnomalyDetector:
+    """
+    Incremental cost anomaly detector.
+
+    Rules are those of CostAnomalyDetector:
+    1. ABSOLUTE_SPIKE: daily > baseline * 1.4 for 2 consecutive intervals
+    2. SUSTAINED_DRIFT: 7d rolling avg > baseline * 1.25 for >= 3 days
+    3. BUDGET_WARNING / BUDGET_EXCEEDED against the given budgets
+
+    They are evaluated from rolling per-entity state instead of
+    re-aggregating cost_records every run:
+
+    - Every cost record is folded once into daily buckets for its tenant,
+      user and feature. A run costs O(new records + entities), not O(history).
+    - Spike baselines, 7-day rolling averages and budget spend are sums over
+      at most HISTORY_DAYS buckets per entity.
+    - Consecutive-breach and drift-day counters are kept in memory.
+    - An EWMA mean/variance of daily spend per entity is kept alongside and
+      reported as a z-score in anomaly metadata.
+
+    Detection never touches the database. Only poll() and bootstrap() read,
+    through a CostRecordStreamProtocol driver on an AsyncSession.
+
+    Differences from CostAnomalyDetector:
+    - Re-checking drift on the same day keeps the day count. The batch
+      detector resets it to 1, so it is only correct when run once a day.
+    - Counters are not written to cost_breach_history / cost_drift_tracking.
+      bootstrap() rebuilds them by replaying the retained window, so drift
+      runs longer than REPLAY_DAYS restart their count after a restart.
+
+    Usage:
+        detector = StreamingCostAnomalyDetector()
+        await detector.bootstrap(stream)
+        ...
+        await detector.poll(stream)
+        budgets = await stream.fetch_active_budgets(tenant_id)
+        anomalies = await detector.detect_all(tenant_id, budgets=budgets)
+    """
+
+    def __init__(self) -> None:
+        self._tenants: dict[str, _TenantState] = {}
+        self._watermark: Optional[tuple[datetime, str]] = None
+
+    def tenants(self) -> List[str]:
+        return list(self._tenants)
+
+    # =========================================================================
+    # INGESTION
+    # =========================================================================
+
+    def observe(self, record: Any) -> None:
+        """Fold one cost record (CostRecord or any object with its fields) into state."""
+        self._add(
+            record.tenant_id,
+            getattr(record, "user_id", None),
+            getattr(record, "feature_tag", None),
+            _record_day(record.created_at),
+            DayTotals(
+                cost_cents=float(record.cost_cents or 0),
+                requests=1,
+                retries=1 if getattr(record, "is_retry", False) else 0,
+                input_tokens=int(getattr(record, "input_tokens", 0) or 0),
+            ),
+        )
+
+    def observe_many(self, records: Iterable[Any]) -> int:
+        count = 0
+        for record in records:
+            self.observe(record)
+            count += 1
+        return count
+
+    def _add(
+        self,
+        tenant_id: str,
+        user_id: Optional[str],
+        feature_tag: Optional[str],
+        day: date,
+        totals: DayTotals,
+    ) -> None:
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            state = self._tenants[tenant_id] = _TenantState()
+        state.window("tenant", tenant_id).add(day, totals)
+        if user_id is not None:
+            state.window("user", user_id).add(day, totals)
+        if feature_tag is not None:
+            state.window("feature", feature_tag).add(day, totals)
+
+    async def poll(self, stream: CostRecordStreamProtocol, limit: int = POLL_BATCH_SIZE) -> int:
+        """Fold cost_records created since the last poll into state.
+
+        Reads in (created_at, id) order from a watermark, so each record is
+        read once. Returns the number of records folded.
+        """
+        upper = datetime.now(timezone.utc) - POLL_SAFETY_LAG
+        if self._watermark is None:
+            start = datetime.combine(date.today() - timedelta(days=HISTORY_DAYS), datetime.min.time(), timezone.utc)
+            self._watermark = (start, "")
+
+        folded = 0
+        while True:
+            after_ts, after_id = self._watermark
+            rows = await stream.fetch_records_after(after_ts, after_id, upper, limit)
+            folded += self.observe_many(rows)
+            if rows:
+                self._watermark = (rows[-1].created_at, rows[-1].id)
+            if len(rows) < limit:
+                return folded
+
+    async def bootstrap(self, stream: CostRecordStreamProtocol, today: Optional[date] = None) -> None:
+        """Load HISTORY_DAYS of daily totals and rebuild breach/drift counters.
+
+        One grouped query replaces the raw history; later records arrive
+        through poll(), which continues from where this load stopped.
+        """
+        today = today or date.today()
+        upper = datetime.now(timezone.utc) - POLL_SAFETY_LAG
+        rows = await stream.fetch_daily_totals(today - timedelta(days=HISTORY_DAYS), upper)
+
+        self._tenants.clear()
+        for row in rows:
+            state = self._tenants.get(row.tenant_id)
+            if state is None:
+                state = self._tenants[row.tenant_id] = _TenantState()
+            # GROUPING(user_id, feature_tag): 3 = tenant, 1 = user, 2 = feature
+            if row.grouping_set == 3:
+                window = state.window("tenant", row.tenant_id)
+            elif row.grouping_set == 1:
+                if row.user_id is None:
+                    continue
+                window = state.window("user", row.user_id)
+            else:
+                if row.feature_tag is None:
+                    continue
+                window = state.window("feature", row.feature_tag)
+            window.add(
+                row.day,
+                DayTotals(
+                    cost_cents=float(row.cost_cents),
+                    requests=int(row.requests),
+                    retries=int(row.retries or 0),
+                    input_tokens=int(row.input_tokens),
+                ),
+            )
+
+        self._watermark = (upper, "")
+
+        # Replay the last few days so consecutive counters match history
+        for tenant_id in self._tenants:
+            for offset in range(REPLAY_DAYS, 0, -1):
+                await self.detect_absolute_spikes(tenant_id, today=today - timedelta(days=offset))
+                await self.detect_sustained_drift(tenant_id, today=today - timedelta(days=offset))
+
+        logger.info(f"Bootstrapped cost anomaly state for {len(self._tenants)} tenants")
+
+    # =========================================================================
+    # DETECTION
+    # =========================================================================
+
+    async def detect_all(
+        self,
+        tenant_id: str,
+        today: Optional[date] = None,
+        budgets: Optional[Sequence[Any]] = None,
+    ) -> List[DetectedAnomaly]:
+        """Run all anomaly detection checks for a tenant from rolling state."""
+        today = today or date.today()
+        anomalies: List[DetectedAnomaly] = []
+        anomalies.extend(await self.detect_absolute_spikes(tenant_id, today=today))
+        anomalies.extend(await self.detect_sustained_drift(tenant_id, today=today))
+        if budgets:
+            anomalies.extend(await self.detect_budget_issues(tenant_id, budgets, today=today))
+        return anomalies
+
+    async def detect_absolute_spikes(
+        self,
+        tenant_id: str,
+        lookback_days: int = 14,
+        today: Optional[date] = None,
+    ) -> List[DetectedAnomaly]:
+        """Detect absolute spikes (user, feature, tenant) with consecutive-day logic."""
+        today = today or date.today()
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            return []
+        self._advance(state, today)
+
+        baseline_start = today - timedelta(days=lookback_days)
+        baseline_end = today - timedelta(days=2)
+        anomalies: List[DetectedAnomaly] = []
+
+        for entity_type in SPIKE_ENTITY_TYPES:
+            for (window_type, entity_id), window in state.entities.items():
+                if window_type != entity_type:
+                    continue
+                today_totals = window.since(today)
+                if today_totals is None:
+                    continue
+                total, active_days = window.total(baseline_start, baseline_end)
+                baseline = total / active_days if active_days else 0
+                if not baseline or baseline <= 0:
+                    continue
+                anomaly = self._evaluate_spike(
+                    state,
+                    tenant_id,
+                    entity_type,
+                    entity_id,
+                    window,
+                    today_totals.cost_cents,
+                    baseline,
+                    lookback_days,
+                    today,
+                )
+                if anomaly:
+                    anomalies.append(anomaly)
+
+        # Tenant level: evaluated even without spend today
+        window = state.window("tenant", tenant_id)
+        total, active_days = window.total(baseline_start, baseline_end)
+        baseline = total / active_days if active_days else 0
+        if baseline > 0:
+            today_totals = window.since(today)
+            today_cost = today_totals.cost_cents if today_totals else 0
+            anomaly = self._evaluate_spike(
+                state, tenant_id, "tenant", tenant_id, window, today_cost, baseline, lookback_days, today
+            )
+            if anomaly:
+                anomalies.append(anomaly)
+
+        return anomalies
+
+    def _evaluate_spike(
+        self,
+        state: _TenantState,
+        tenant_id: str,
+        entity_type: str,
+        entity_id: str,
+        window: EntityWindow,
+        today_cost: float,
+        baseline: float,
+        lookback_days: int,
+        today: date,
+    ) -> Optional[DetectedAnomaly]:
+        ratio = today_cost / baseline
+        deviation_pct = (ratio - 1) * 100
+
+        if ratio < ABSOLUTE_SPIKE_THRESHOLD:
+            # Not breaching: the run ends because today is not recorded
+            return None
+
+        breach_count = self._record_breach(state, (entity_type, entity_id), today)
+        if breach_count < CONSECUTIVE_INTERVALS_REQUIRED:
+            return None
+
+        return DetectedAnomaly(
+            anomaly_type=AnomalyType.ABSOLUTE_SPIKE,
+            severity=classify_severity(deviation_pct),
+            entity_type=entity_type,
+            entity_id=entity_id,
+            current_value_cents=today_cost,
+            expected_value_cents=baseline,
+            deviation_pct=deviation_pct,
+            message=format_spike_message(entity_type, entity_id, deviation_pct, breach_count),
+            breach_count=breach_count,
+            derived_cause=self._derive_cause(state, tenant_id, entity_type, entity_id, today),
+            metadata={
+                "lookback_days": lookback_days,
+                "baseline_daily_avg": baseline,
+                "consecutive_breaches": breach_count,
+                "ewma_zscore": window.zscore(today_cost),
+            },
+        )
+
+    @staticmethod
+    def _record_breach(state: _TenantState, key: tuple[str, str], today: date) -> int:
+        """Record today's breach and return the consecutive-day count."""
+        last = state.breaches.get(key)
+        if last and last[0] == today:
+            run = last[1]
+        elif last and last[0] == today - timedelta(days=1):
+            run = last[1] + 1
+        else:
+            run = 1
+        state.breaches[key] = (today, run)
+        return min(run, MAX_CONSECUTIVE_BREACHES)
+
+    async def detect_sustained_drift(
+        self,
+        tenant_id: str,
+        today: Optional[date] = None,
+    ) -> List[DetectedAnomaly]:
+        """Detect a tenant's 7-day rolling average drifting above its baseline."""
+        today = today or date.today()
+        state = self._tenants.get(tenant_id)
+        if state is None:
+            return []
+        self._advance(state, today)
+
+        window = state.window("tenant", tenant_id)
+        rolling_total, _ = window.total(today - timedelta(days=6), today)
+        rolling_avg = rolling_total / 7.0
+        baseline_total, baseline_days = window.total(today - timedelta(days=28), today - timedelta(days=8))
+        baseline_avg = baseline_total / baseline_days if baseline_days else 0
+
+        if baseline_avg <= 0:
+            return []
+
+        ratio = rolling_avg / baseline_avg
+        drift_pct = (ratio - 1) * 100
+        key = ("tenant", tenant_id)
+
+        if ratio < SUSTAINED_DRIFT_THRESHOLD:
+            state.drift.pop(key, None)
+            return []
+
+        last = state.drift.get(key)
+        if last and last[0] == today:
+            drift_days = last[1]
+        elif last and last[0] == today - timedelta(days=1):
+            drift_days = last[1] + 1
+        else:
+            drift_days = 1
+        state.drift[key] = (today, drift_days)
+
+        if drift_days < DRIFT_DAYS_REQUIRED:
+            return []
+
+        return [
+            DetectedAnomaly(
+                anomaly_type=AnomalyType.SUSTAINED_DRIFT,
+                severity=classify_severity(drift_pct),
+                entity_type="tenant",
+                entity_id=tenant_id,
+                current_value_cents=rolling_avg,
+                expected_value_cents=baseline_avg,
+                deviation_pct=drift_pct,
+                message=f"Sustained drift detected: {drift_pct:.1f}% above baseline for {drift_days} days",
+                breach_count=drift_days,
+                derived_cause=self._derive_cause(state, tenant_id, "tenant", tenant_id, today),
+                metadata={
+                    "rolling_7d_avg": rolling_avg,
+                    "baseline_avg": baseline_avg,
+                    "drift_days": drift_days,
+                },
+            )
+        ]
+
+    async def detect_budget_issues(
+        self,
+        tenant_id: str,
+        budgets: Sequence[Any],
+        today: Optional[date] = None,
+    ) -> List[DetectedAnomaly]:
+        """Detect budget warnings and exceeded budgets from rolling spend."""
+        today = today or date.today()
+        state = self._tenants.get(tenant_id) or _TenantState()
+        month_start = today.replace(day=1)
+        anomalies: List[DetectedAnomaly] = []
+
+        for budget in budgets:
+            if not budget.is_active or budget.tenant_id != tenant_id:
+                continue
+            if budget.budget_type in ("feature", "user") and budget.entity_id:
+                window = state.entities.get((budget.budget_type, budget.entity_id))
+            else:
+                window = state.entities.get(("tenant", tenant_id))
+
+            if budget.daily_limit_cents:
+                totals = window.since(today) if window else None
+                anomaly = check_budget_threshold(
+                    budget.budget_type,
+                    budget.entity_id,
+                    "daily",
+                    totals.cost_cents if totals else 0,
+                    budget.daily_limit_cents,
+                    budget.warn_threshold_pct,
+                )
+                if anomaly:
+                    anomalies.append(anomaly)
+
+            if budget.monthly_limit_cents:
+                totals = window.since(month_start) if window else None
+                anomaly = check_budget_threshold(
+                    budget.budget_type,
+                    budget.entity_id,
+                    "monthly",
+                    totals.cost_cents if totals else 0,
+                    budget.monthly_limit_cents,
+                    budget.warn_threshold_pct,
+                )
+                if anomaly:
+                    anomalies.append(anomaly)
+
+        return anomalies
+
+    # =========================================================================
+    # HELPERS
+    # =========================================================================
+
+    @staticmethod
+    def _advance(state: _TenantState, today: date) -> None:
+        """Fold closed days into EWMA stats and drop buckets past retention."""
+        oldest = today - timedelta(days=HISTORY_DAYS)
+        for window in state.entities.values():
+            window.fold(today)
+            window.prune(oldest)
+
+    @staticmethod
+    def _derive_cause(
+        state: _TenantState,
+        tenant_id: str,
+        entity_type: str,
+        entity_id: str,
+        today: date,
+    ) -> DerivedCause:
+        """Same deterministic rules as CostAnomalyDetector._derive_cause, from state."""
+        window = state.entities.get((entity_type, entity_id))
+        if window is None:
+            return DerivedCause.UNKNOWN
+        current = window.since(today)
+        previous = window.between(today - timedelta(days=1), today)
+        today_requests = current.requests if current else 0
+        yesterday_requests = previous.requests if previous else 0
+
+        today_retry = current.retries / today_requests if today_requests else None
+        yesterday_retry = previous.retries / yesterday_requests if yesterday_requests else None
+        if today_retry and yesterday_retry and today_retry / yesterday_retry > 1.5:
+            return DerivedCause.RETRY_LOOP
+
+        today_prompt = current.input_tokens / today_requests if today_requests else None
+        yesterday_prompt = previous.input_tokens / yesterday_requests if yesterday_requests else None
+        if today_prompt and yesterday_prompt and today_prompt / yesterday_prompt > 1.3:
+            return DerivedCause.PROMPT_GROWTH
+
+        if entity_type == "tenant":
+            feature_costs = [
+                totals.cost_cents
+                for (window_type, _), feature_window in state.entities.items()
+                if window_type == "feature" and (totals := feature_window.since(today)) is not None
+            ]
+            total = sum(feature_costs)
+            top = max(feature_costs, default=0)
+            if total and top and top / total > 0.6:
+                return DerivedCause.FEATURE_SURGE
+
+        if today_requests and yesterday_requests and today_requests / yesterday_requests > 1.3:
+            return DerivedCause.TRAFFIC_GROWTH
+
+        return DerivedCause.UNKNOWN
+
+
 # =============================================================================
 # ENTRY POINTS
 # =============================================================================
@@ -918,9 +1560,35 @@ async def run_anomaly_detection(session, tenant_id: str) -> List[PersistedAnomal
     return persisted
 
 
+async def run_streaming_anomaly_detection(
+    session,
+    tenant_id: str,
+    detector: StreamingCostAnomalyDetector,
+    stream: CostRecordStreamProtocol,
+) -> List[PersistedAnomaly]:
+    """Run anomaly detection from streaming state and persist results.
+
+    The caller bootstraps or polls the detector first. Budgets are read
+    through the async stream driver; anomalies are persisted on session.
+    """
+    budgets = await stream.fetch_active_budgets(tenant_id)
+    anomalies = await detector.detect_all(tenant_id, budgets=budgets)
+
+    if not anomalies:
+        logger.debug(f"No anomalies detected for tenant {tenant_id}")
+        return []
+
+    persisted = await CostAnomalyDetector(session).persist_anomalies(tenant_id, anomalies)
+    logger.info(f"Detected and persisted {len(persisted)} anomalies for tenant {tenant_id}")
+
+    return persisted
+
+
 async def _run_anomaly_detection_with_facts(
     session,
     tenant_id: str,
+    detector: Optional[StreamingCostAnomalyDetector] = None,
+    stream: Optional[CostRecordStreamProtocol] = None,
 ) -> dict:
     """
     Run anomaly detection and emit CostAnomalyFact for HIGH anomalies.
@@ -933,6 +1601,9 @@ async def _run_anomaly_detection_with_facts(
     - Analytics: Detect anomalies, compute severity/confidence (this function)
     - Incidents: Decide if anomaly warrants incident creation (bridge)
 
+    With a detector and stream, detection runs from streaming state
+    (run_streaming_anomaly_detection); otherwise CostAnomalyDetector runs.
+
     Returns:
         {
             "detected": [PersistedAnomaly, ...],
@@ -950,7 +1621,10 @@ async def _run_anomaly_detection_with_facts(
     # Import locally to avoid circular dependency during file loading
     from app.hoc.cus.hoc_spine.schemas.anomaly_types import CostAnomalyFact
 
-    persisted = await run_anomaly_detection(session, tenant_id)
+    if detector is not None and stream is not None:
+        persisted = await run_streaming_anomaly_detection(session, tenant_id, detector, stream)
+    else:
+        persisted = await run_anomaly_detection(session, tenant_id)
 
     if not persisted:
         return {"detected": [], "facts": []}
@@ -988,3 +1662,29 @@ async def _run_anomaly_detection_with_facts(
     }
 
 
+async def replay_cost_stream(
+    records: Iterable[Any],
+    tenant_id: str,
+    start: date,
+    end: date,
+    budgets: Optional[Sequence[Any]] = None,
+) -> dict[date, List[DetectedAnomaly]]:
+    """Replay a historical cost stream one day at a time.
+
+    Records (in created_at order) are folded up to the end of each day, then
+    the day is evaluated, as a once-a-day detection job would. Returns the
+    anomalies detected per day in [start, end].
+    """
+    detector = StreamingCostAnomalyDetector()
+    pending = iter(sorted(records, key=lambda record: record.created_at))
+    record = next(pending, None)
+    detected: dict[date, List[DetectedAnomaly]] = {}
+
+    day = start
+    while day <= end:
+        while record is not None and _record_day(record.created_at) <= day:
+            detector.observe(record)
+            record = next(pending, None)
+        detected[day] = await detector.detect_all(tenant_id, today=day, budgets=budgets)
+        day += timedelta(days=1)
+    return detected
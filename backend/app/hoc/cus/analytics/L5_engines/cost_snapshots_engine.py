@@ -36,6 +36,12 @@ Architecture:
          ↓
   CostAnomalyDetector.evaluate_from_snapshot()
 
+Query shape:
+  Hourly windows take one GROUPING SETS scan of cost_records; daily windows
+  and baselines read cost_hourly_rollups (COST_SNAPSHOT_USE_ROLLUPS=false
+  falls back to raw records and daily snapshot aggregates). Baselines are
+  loaded once per snapshot; aggregates and baselines are written in batches.
+
 Usage:
   # Scheduled job (e.g., every hour)
   driver = get_cost_snapshots_driver(session)
@@ -51,8 +57,11 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
+
 from app.hoc.cus.analytics.L5_schemas.cost_snapshot_schemas import (
     SEVERITY_THRESHOLDS,
     AnomalyEvaluation,
@@ -68,6 +77,19 @@ from app.hoc.cus.analytics.L5_schemas.cost_snapshot_schemas import (
 logger = logging.getLogger(__name__)
 
 
+_ANOMALY_TYPES = {
+    EntityType.USER: "user_spike",
+    EntityType.FEATURE: "feature_spike",
+    EntityType.MODEL: "model_spike",
+    EntityType.TENANT: "tenant_spike",
+}
+
+
+def use_hourly_rollups() -> bool:
+    """Daily snapshots and baselines read cost_hourly_rollups (read per call)."""
+    return os.getenv("COST_SNAPSHOT_USE_ROLLUPS", "true").lower() == "true"
+
+
 # =============================================================================
 # NOTE: Enums and dataclasses in schemas/cost_snapshot_schemas.py.
 # DB operations extracted to L6_drivers/cost_snapshots_driver.py (PIN-508).
@@ -158,20 +180,22 @@ class SnapshotComputer:
         try:
             await self._driver.insert_snapshot(snapshot)
 
-            aggregates = await self._driver.aggregate_cost_records(
+            # Daily windows sum pre-aggregated hours; hourly windows scan raw records
+            aggregate = (
+                self._driver.aggregate_hourly_rollups
+                if snapshot_type == SnapshotType.DAILY and use_hourly_rollups()
+                else self._driver.aggregate_cost_records
+            )
+            aggregates = await aggregate(
                 tenant_id=tenant_id,
                 snapshot_id=snapshot.id,
                 period_start=period_start,
                 period_end=period_end,
             )
 
+            baselines = await self._driver.get_current_baselines(tenant_id=tenant_id, window_days=7)
             for agg in aggregates:
-                baseline = await self._driver.get_current_baseline(
-                    tenant_id=tenant_id,
-                    entity_type=agg.entity_type,
-                    entity_id=agg.entity_id,
-                    window_days=7,
-                )
+                baseline = baselines.get((agg.entity_type, agg.entity_id))
                 if baseline:
                     agg.baseline_7d_avg_cents = baseline.avg_daily_cost_cents
                     if baseline.avg_daily_cost_cents > 0:
@@ -179,7 +203,7 @@ class SnapshotComputer:
                             (agg.total_cost_cents - baseline.avg_daily_cost_cents) / baseline.avg_daily_cost_cents
                         ) * 100
 
-                await self._driver.insert_aggregate(agg)
+            await self._driver.insert_aggregates(aggregates)
 
             elapsed_ms = int((time.time() - start_time) * 1000)
             snapshot.status = SnapshotStatus.COMPLETE
@@ -219,10 +243,13 @@ class BaselineComputer:
         tenant_id: str,
         window_days: int = 7,
     ) -> list[SnapshotBaseline]:
-        """Compute baselines for all entities from historical snapshots."""
+        """Compute baselines for all entities from historical daily costs."""
         baselines: list[SnapshotBaseline] = []
 
-        rows = await self._driver.compute_baselines(tenant_id, window_days)
+        if use_hourly_rollups():
+            rows = await self._driver.compute_baselines_from_rollups(tenant_id, window_days)
+        else:
+            rows = await self._driver.compute_baselines(tenant_id, window_days)
 
         for row in rows:
             baseline = SnapshotBaseline.create(
@@ -239,8 +266,8 @@ class BaselineComputer:
                 last_snapshot_id=row["last_snapshot"],
             )
             baselines.append(baseline)
-            await self._driver.insert_baseline(baseline)
 
+        await self._driver.insert_baselines(baselines)
         return baselines
 
 
@@ -267,36 +294,78 @@ class SnapshotAnomalyDetector:
         snapshot_id: str,
         threshold_pct: float = 200,
     ) -> list[AnomalyEvaluation]:
-        """Evaluate all aggregates in a snapshot for anomalies."""
-        evaluations: list[AnomalyEvaluation] = []
+        """Evaluate all aggregates in a snapshot for anomalies.
 
+        Aggregates are classified together; triggered anomalies and then all
+        evaluations are written in one batch each, so audit rows carry the
+        anomaly they raised.
+        """
         snapshot = await self._driver.get_snapshot(snapshot_id)
         if not snapshot or snapshot.status != SnapshotStatus.COMPLETE:
             logger.warning(f"Cannot evaluate incomplete snapshot: {snapshot_id}")
-            return evaluations
+            return []
 
         rows = await self._driver.get_aggregates_with_baseline(snapshot_id)
+        if not rows:
+            return []
+
+        evaluations = self._evaluate_rows(snapshot_id, rows, threshold_pct)
+
+        anomalies: list[dict] = []
+        for evaluation in evaluations:
+            if not evaluation.triggered:
+                continue
+            evaluation.anomaly_id = f"anom_{hashlib.sha256(f'{evaluation.id}'.encode()).hexdigest()[:16]}"
+            anomalies.append({
+                "id": evaluation.anomaly_id,
+                "tenant_id": evaluation.tenant_id,
+                "anomaly_type": _ANOMALY_TYPES.get(evaluation.entity_type, "unknown"),
+                "severity": evaluation.severity_computed,
+                "entity_type": evaluation.entity_type.value,
+                "entity_id": evaluation.entity_id,
+                "current_value_cents": evaluation.current_value_cents,
+                "expected_value_cents": evaluation.baseline_value_cents,
+                "deviation_pct": evaluation.deviation_pct,
+                "threshold_pct": evaluation.threshold_pct,
+                "message": f"Cost spike detected from snapshot {snapshot.id}: {evaluation.deviation_pct:.1f}% above 7-day baseline",
+                "snapshot_id": snapshot.id,
+                "detected_at": evaluation.evaluated_at,
+            })
 
-        for row in rows:
-            deviation = row.get("deviation_from_7d_pct") or 0
-            triggered = deviation >= threshold_pct
-
-            severity = None
-            if triggered:
-                if deviation >= SEVERITY_THRESHOLDS["critical"]:
-                    severity = "critical"
-                elif deviation >= SEVERITY_THRESHOLDS["high"]:
-                    severity = "high"
-                elif deviation >= SEVERITY_THRESHOLDS["medium"]:
-                    severity = "medium"
-                else:
-                    severity = "low"
-
-            eval_id = (
-                f"eval_{hashlib.sha256(f'{snapshot_id}:{row['entity_type']}:{row['entity_id']}'.encode()).hexdigest()[:16]}"
-            )
-            evaluation = AnomalyEvaluation(
-                id=eval_id,
+        if anomalies:
+            await self._driver.insert_anomalies(anomalies)
+            logger.info(f"Created {len(anomalies)} anomalies from snapshot {snapshot.id} evaluation")
+        await self._driver.insert_evaluations(evaluations)
+
+        return evaluations
+
+    @staticmethod
+    def _evaluate_rows(
+        snapshot_id: str,
+        rows: list[dict],
+        threshold_pct: float,
+    ) -> list[AnomalyEvaluation]:
+        """Classify every aggregate at once; builds one evaluation per row."""
+        deviations = [row.get("deviation_from_7d_pct") or 0 for row in rows]
+        deviation = np.asarray(deviations, dtype=np.float64)
+
+        triggered = deviation >= threshold_pct
+        severities = np.select(
+            [
+                ~triggered,
+                deviation >= SEVERITY_THRESHOLDS["critical"],
+                deviation >= SEVERITY_THRESHOLDS["high"],
+                deviation >= SEVERITY_THRESHOLDS["medium"],
+            ],
+            [None, "critical", "high", "medium"],
+            default="low",
+        )
+
+        evaluations: list[AnomalyEvaluation] = []
+        for row, value, is_triggered, severity in zip(rows, deviations, triggered.tolist(), severities.tolist()):
+            eval_key = f"{snapshot_id}:{row['entity_type']}:{row['entity_id']}"
+            evaluations.append(AnomalyEvaluation(
+                id=f"eval_{hashlib.sha256(eval_key.encode()).hexdigest()[:16]}",
                 tenant_id=row["tenant_id"],
                 snapshot_id=snapshot_id,
                 entity_type=EntityType(row["entity_type"]),
@@ -304,44 +373,11 @@ class SnapshotAnomalyDetector:
                 current_value_cents=row["total_cost_cents"],
                 baseline_value_cents=row["baseline_7d_avg_cents"],
                 threshold_pct=threshold_pct,
-                deviation_pct=deviation,
-                triggered=triggered,
+                deviation_pct=value,
+                triggered=is_triggered,
                 severity_computed=severity,
-                evaluation_reason=f"{'TRIGGERED' if triggered else 'OK'}: {deviation:.1f}% deviation (threshold: {threshold_pct}%)",
-            )
-            evaluations.append(evaluation)
-
-            await self._driver.insert_evaluation(evaluation)
-
-            if triggered:
-                anomaly_type_map = {
-                    EntityType.USER: "user_spike",
-                    EntityType.FEATURE: "feature_spike",
-                    EntityType.MODEL: "model_spike",
-                    EntityType.TENANT: "tenant_spike",
-                }
-                anomaly_id = f"anom_{hashlib.sha256(f'{evaluation.id}'.encode()).hexdigest()[:16]}"
-                anomaly_type = anomaly_type_map.get(evaluation.entity_type, "unknown")
-
-                await self._driver.insert_anomaly(
-                    anomaly_id=anomaly_id,
-                    tenant_id=evaluation.tenant_id,
-                    anomaly_type=anomaly_type,
-                    severity=evaluation.severity_computed,
-                    entity_type=evaluation.entity_type.value,
-                    entity_id=evaluation.entity_id,
-                    current_value_cents=evaluation.current_value_cents,
-                    expected_value_cents=evaluation.baseline_value_cents,
-                    deviation_pct=evaluation.deviation_pct,
-                    threshold_pct=evaluation.threshold_pct,
-                    message=f"Cost spike detected from snapshot {snapshot.id}: {evaluation.deviation_pct:.1f}% above 7-day baseline",
-                    snapshot_id=snapshot.id,
-                    detected_at=evaluation.evaluated_at,
-                )
-                evaluation.anomaly_id = anomaly_id
-
-                logger.info(f"Created anomaly {anomaly_id} from snapshot evaluation")
-
+                evaluation_reason=f"{'TRIGGERED' if is_triggered else 'OK'}: {value:.1f}% deviation (threshold: {threshold_pct}%)",
+            ))
         return evaluations
 
 
@@ -7,13 +7,14 @@
 """
 Cost Anomaly Schemas (PIN-511 Phase 1.2)
 
-Defines the CostAnomalyReadProtocol that L5 engines depend on.
-L6 drivers implement this Protocol — engine never knows about Session.
+Defines the CostAnomalyReadProtocol and CostRecordStreamProtocol that L5
+engines depend on. L6 drivers implement these Protocols — engine never
+knows about Session.
 """
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from typing import TYPE_CHECKING, List, Optional, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -50,3 +51,30 @@ class CostAnomalyReadProtocol(Protocol):
     def flush_and_refresh(self, anomalies: List[CostAnomaly]) -> None:
         """Flush to get generated IDs and refresh."""
         ...
+
+
+@runtime_checkable
+class CostRecordStreamProtocol(Protocol):
+    """Protocol for the async reads of the streaming anomaly detector.
+
+    Implemented by: CostRecordStreamDriver (L6)
+    Consumed by: StreamingCostAnomalyDetector (L5 engine)
+    """
+
+    async def fetch_records_after(
+        self,
+        after_ts: datetime,
+        after_id: str,
+        upper: datetime,
+        limit: int,
+    ) -> list:
+        """Fetch cost records after a (created_at, id) watermark, oldest first."""
+        ...
+
+    async def fetch_daily_totals(self, start: date, upper: datetime) -> list:
+        """Fetch daily cost totals per tenant, user and feature since start."""
+        ...
+
+    async def fetch_active_budgets(self, tenant_id: str) -> list:
+        """Fetch all active budgets for a tenant."""
+        ...
@@ -259,6 +259,7 @@ class CostSnapshotsDriverProtocol(Protocol):
     async def insert_snapshot(self, snapshot: CostSnapshot) -> None: ...
     async def update_snapshot(self, snapshot: CostSnapshot) -> None: ...
     async def insert_aggregate(self, aggregate: SnapshotAggregate) -> None: ...
+    async def insert_aggregates(self, aggregates: list[SnapshotAggregate]) -> None: ...
     async def get_current_baseline(
         self,
         tenant_id: str,
@@ -266,6 +267,11 @@ class CostSnapshotsDriverProtocol(Protocol):
         entity_id: str | None,
         window_days: int,
     ) -> SnapshotBaseline | None: ...
+    async def get_current_baselines(
+        self,
+        tenant_id: str,
+        window_days: int,
+    ) -> dict[tuple[EntityType, str | None], SnapshotBaseline]: ...
     async def aggregate_cost_records(
         self,
         tenant_id: str,
@@ -273,12 +279,21 @@ class CostSnapshotsDriverProtocol(Protocol):
         period_start: datetime,
         period_end: datetime,
     ) -> list[SnapshotAggregate]: ...
+    async def aggregate_hourly_rollups(
+        self,
+        tenant_id: str,
+        snapshot_id: str,
+        period_start: datetime,
+        period_end: datetime,
+    ) -> list[SnapshotAggregate]: ...
     async def insert_baseline(self, baseline: SnapshotBaseline) -> None: ...
+    async def insert_baselines(self, baselines: list[SnapshotBaseline]) -> None: ...
     async def get_snapshot(self, snapshot_id: str) -> CostSnapshot | None: ...
     async def get_aggregates_with_baseline(
         self, snapshot_id: str,
     ) -> list[dict[str, Any]]: ...
     async def insert_evaluation(self, evaluation: AnomalyEvaluation) -> None: ...
+    async def insert_evaluations(self, evaluations: list[AnomalyEvaluation]) -> None: ...
     async def insert_anomaly(
         self,
         anomaly_id: str,
@@ -295,8 +310,14 @@ class CostSnapshotsDriverProtocol(Protocol):
         snapshot_id: str,
         detected_at: datetime,
     ) -> None: ...
+    async def insert_anomalies(self, anomalies: list[dict[str, Any]]) -> None: ...
     async def compute_baselines(
         self,
         tenant_id: str,
         window_days: int,
     ) -> list[dict[str, Any]]: ...
+    async def compute_baselines_from_rollups(
+        self,
+        tenant_id: str,
+        window_days: int,
+    ) -> list[dict[str, Any]]: ...
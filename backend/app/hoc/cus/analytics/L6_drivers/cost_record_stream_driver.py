@@ -0,0 +1,139 @@
+# Layer: L6 — Domain Driver
+# AUDIENCE: CUSTOMER
+# Temporal:
+#   Trigger: api|worker (via L5 engine)
+#   Execution: async
+# Data Access:
+#   Reads: cost_records, cost_budgets
+#   Writes: none
+# Role: Async cost record reads for the streaming cost anomaly detector
+# Callers: cost_anomaly_detector_engine.py (L5, via Protocol), anomaly_incident_coordinator.py (L4)
+# Allowed Imports: L6, L7 (models), sqlalchemy
+# Forbidden Imports: L1, L2, L3, L4, L5
+# Forbidden: session.commit(), session.rollback() — L6 DOES NOT COMMIT
+# Reference: PIN-470, PIN-511 Phase 1.2
+# artifact_class: CODE
+
+"""
+Cost Record Stream Driver (L6)
+
+Implements CostRecordStreamProtocol for StreamingCostAnomalyDetector.
+All reads go through an AsyncSession, so detection never blocks the loop.
+
+Query shape:
+- fetch_records_after: keyset page of cost_records in (created_at, id)
+  order, bounded above so late-committing rows are not skipped.
+- fetch_daily_totals: one GROUPING SETS scan yields the daily tenant,
+  user and feature totals of every tenant.
+- fetch_active_budgets: active cost_budgets of one tenant.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import CostBudget
+
+
+class CostRecordStreamDriver:
+    """L6 driver for the streaming detector's async reads.
+
+    Implements CostRecordStreamProtocol (L5_schemas).
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def fetch_records_after(
+        self,
+        after_ts: datetime,
+        after_id: str,
+        upper: datetime,
+        limit: int,
+    ) -> list:
+        """Fetch cost records created after the watermark and before upper.
+
+        Args:
+            after_ts: created_at of the last record read
+            after_id: id of the last record read ('' to start at after_ts)
+            upper: Exclusive upper bound on created_at
+            limit: Maximum rows returned
+
+        Returns:
+            Rows with id, tenant_id, user_id, feature_tag, input_tokens,
+            cost_cents, is_retry, created_at, oldest first
+        """
+        result = await self._session.execute(
+            text(
+                """
+                SELECT id, tenant_id, user_id, feature_tag, input_tokens, cost_cents, is_retry, created_at
+                FROM cost_records
+                WHERE (created_at, id) > (:after_ts, :after_id)
+                  AND created_at < :upper
+                ORDER BY created_at, id
+                LIMIT :limit
+                """
+            ),
+            {"after_ts": after_ts, "after_id": after_id, "upper": upper, "limit": limit},
+        )
+        return list(result.fetchall())
+
+    async def fetch_daily_totals(self, start: date, upper: datetime) -> list:
+        """Fetch daily totals per tenant, user and feature.
+
+        Args:
+            start: First day included
+            upper: Exclusive upper bound on created_at
+
+        Returns:
+            Rows with tenant_id, grouping_set (GROUPING(user_id, feature_tag):
+            3 = tenant, 1 = user, 2 = feature), user_id, feature_tag, day,
+            cost_cents, requests, retries, input_tokens
+        """
+        result = await self._session.execute(
+            text(
+                """
+                SELECT
+                    tenant_id,
+                    GROUPING(user_id, feature_tag) AS grouping_set,
+                    user_id,
+                    feature_tag,
+                    DATE(created_at) AS day,
+                    COALESCE(SUM(cost_cents), 0) AS cost_cents,
+                    COUNT(*) AS requests,
+                    SUM(CASE WHEN is_retry THEN 1 ELSE 0 END) AS retries,
+                    COALESCE(SUM(input_tokens), 0) AS input_tokens
+                FROM cost_records
+                WHERE DATE(created_at) >= :start
+                  AND created_at < :upper
+                GROUP BY tenant_id, DATE(created_at), GROUPING SETS ((), (user_id), (feature_tag))
+                """
+            ),
+            {"start": start, "upper": upper},
+        )
+        return list(result.fetchall())
+
+    async def fetch_active_budgets(self, tenant_id: str) -> list:
+        """Fetch all active budgets for a tenant.
+
+        Args:
+            tenant_id: Tenant to fetch budgets for
+
+        Returns:
+            List of active CostBudget records
+        """
+        result = await self._session.execute(
+            select(CostBudget).where(
+                CostBudget.tenant_id == tenant_id,
+                CostBudget.is_active == True,  # noqa: E712
+            )
+        )
+        return list(result.scalars().all())
+
+
+def get_cost_record_stream_driver(session: AsyncSession) -> CostRecordStreamDriver:
+    """Factory for CostRecordStreamDriver."""
+    return CostRecordStreamDriver(session)
@@ -4,7 +4,7 @@
 #   Trigger: api|worker (via L5 engine)
 #   Execution: async
 # Data Access:
-#   Reads: cost_records, cost_snapshots, cost_snapshot_aggregates, cost_snapshot_baselines, cost_anomalies
+#   Reads: cost_records, cost_hourly_rollups, cost_snapshots, cost_snapshot_aggregates, cost_snapshot_baselines, cost_anomalies
 #   Writes: cost_snapshots, cost_snapshot_aggregates, cost_snapshot_baselines, cost_anomaly_evaluations, cost_anomalies
 # Role: Data access for cost snapshot operations (extracted from cost_snapshots_engine.py)
 # Callers: cost_snapshots_engine.py (L5)
@@ -24,11 +24,22 @@ Extracted from cost_snapshots_engine.py per PIN-508 Phase 1A.
 Implements CostSnapshotsDriverProtocol for typed L5↔L6 boundary.
 NO business logic — only DB operations.
 NO session.commit() — L4 coordinator owns transaction boundary.
+
+Query shape:
+- aggregate_cost_records: one GROUPING SETS scan of cost_records yields
+  the tenant, user, feature and model aggregates together.
+- aggregate_hourly_rollups / compute_baselines_from_rollups: read
+  cost_hourly_rollups (migration 133), kept current by a trigger on
+  cost_records. entity_key '' (tenant row, NULL model) reads back as NULL,
+  matching the raw scan.
+- get_current_baselines: every current baseline of a tenant in one query.
+- insert_aggregates / insert_baselines / insert_evaluations /
+  insert_anomalies: one executemany per batch.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from sqlalchemy import text
@@ -44,6 +55,47 @@ from app.hoc.cus.analytics.L5_schemas.cost_snapshot_schemas import (
     SnapshotType,
 )
 
+# GROUPING(user_id, feature_tag, model) bitmask -> entity a GROUPING SETS row aggregates
+_GROUPING_SET_ENTITIES = {
+    7: EntityType.TENANT,
+    3: EntityType.USER,
+    5: EntityType.FEATURE,
+    6: EntityType.MODEL,
+}
+
+_ENTITY_ORDER = {
+    EntityType.TENANT: 0,
+    EntityType.USER: 1,
+    EntityType.FEATURE: 2,
+    EntityType.MODEL: 3,
+}
+
+
+def _order_aggregates(aggregates: list[SnapshotAggregate]) -> list[SnapshotAggregate]:
+    """Stable order: tenant, users, features, models."""
+    return sorted(aggregates, key=lambda a: (_ENTITY_ORDER[a.entity_type], a.entity_id or ""))
+
+
+def _baseline_from_row(row: Any) -> SnapshotBaseline:
+    """Build a SnapshotBaseline from a cost_snapshot_baselines row."""
+    return SnapshotBaseline(
+        id=row.id,
+        tenant_id=row.tenant_id,
+        entity_type=EntityType(row.entity_type),
+        entity_id=row.entity_id,
+        avg_daily_cost_cents=row.avg_daily_cost_cents,
+        stddev_daily_cost_cents=row.stddev_daily_cost_cents,
+        avg_daily_requests=row.avg_daily_requests,
+        max_daily_cost_cents=row.max_daily_cost_cents,
+        min_daily_cost_cents=row.min_daily_cost_cents,
+        window_days=row.window_days,
+        samples_count=row.samples_count,
+        computed_at=row.computed_at,
+        valid_until=row.valid_until,
+        is_current=row.is_current,
+        last_snapshot_id=row.last_snapshot_id,
+    )
+
 
 class CostSnapshotsDriver:
     """L6 driver for cost snapshot database operations.
@@ -104,6 +156,11 @@ class CostSnapshotsDriver:
         )
 
     async def insert_aggregate(self, aggregate: SnapshotAggregate) -> None:
+        await self.insert_aggregates([aggregate])
+
+    async def insert_aggregates(self, aggregates: list[SnapshotAggregate]) -> None:
+        if not aggregates:
+            return
         query = """
             INSERT INTO cost_snapshot_aggregates (
                 id, snapshot_id, tenant_id, entity_type, entity_id,
@@ -121,30 +178,34 @@ class CostSnapshotsDriver:
                 :created_at
             )
             ON CONFLICT (snapshot_id, entity_type, entity_id) DO UPDATE SET
-                total_cost_cents = :total_cost_cents,
-                request_count = :request_count,
-                deviation_from_7d_pct = :deviation_from_7d_pct
+                total_cost_cents = EXCLUDED.total_cost_cents,
+                request_count = EXCLUDED.request_count,
+                deviation_from_7d_pct = EXCLUDED.deviation_from_7d_pct
         """
+        created_at = datetime.now(timezone.utc)
         await self._session.execute(
             text(query),
-            {
-                "id": aggregate.id,
-                "snapshot_id": aggregate.snapshot_id,
-                "tenant_id": aggregate.tenant_id,
-                "entity_type": aggregate.entity_type.value if isinstance(aggregate.entity_type, EntityType) else aggregate.entity_type,
-                "entity_id": aggregate.entity_id,
-                "total_cost_cents": aggregate.total_cost_cents,
-                "request_count": aggregate.request_count,
-                "total_input_tokens": aggregate.total_input_tokens,
-                "total_output_tokens": aggregate.total_output_tokens,
-                "avg_cost_per_request_cents": aggregate.avg_cost_per_request_cents,
-                "avg_tokens_per_request": aggregate.avg_tokens_per_request,
-                "baseline_7d_avg_cents": aggregate.baseline_7d_avg_cents,
-                "baseline_30d_avg_cents": aggregate.baseline_30d_avg_cents,
-                "deviation_from_7d_pct": aggregate.deviation_from_7d_pct,
-                "deviation_from_30d_pct": aggregate.deviation_from_30d_pct,
-                "created_at": datetime.now(timezone.utc),
-            },
+            [
+                {
+                    "id": aggregate.id,
+                    "snapshot_id": aggregate.snapshot_id,
+                    "tenant_id": aggregate.tenant_id,
+                    "entity_type": aggregate.entity_type.value if isinstance(aggregate.entity_type, EntityType) else aggregate.entity_type,
+                    "entity_id": aggregate.entity_id,
+                    "total_cost_cents": aggregate.total_cost_cents,
+                    "request_count": aggregate.request_count,
+                    "total_input_tokens": aggregate.total_input_tokens,
+                    "total_output_tokens": aggregate.total_output_tokens,
+                    "avg_cost_per_request_cents": aggregate.avg_cost_per_request_cents,
+                    "avg_tokens_per_request": aggregate.avg_tokens_per_request,
+                    "baseline_7d_avg_cents": aggregate.baseline_7d_avg_cents,
+                    "baseline_30d_avg_cents": aggregate.baseline_30d_avg_cents,
+                    "deviation_from_7d_pct": aggregate.deviation_from_7d_pct,
+                    "deviation_from_30d_pct": aggregate.deviation_from_30d_pct,
+                    "created_at": created_at,
+                }
+                for aggregate in aggregates
+            ],
         )
 
     async def get_current_baseline(
@@ -175,25 +236,31 @@ class CostSnapshotsDriver:
         )
         row = result.fetchone()
         if row:
-            return SnapshotBaseline(
-                id=row.id,
-                tenant_id=row.tenant_id,
-                entity_type=EntityType(row.entity_type),
-                entity_id=row.entity_id,
-                avg_daily_cost_cents=row.avg_daily_cost_cents,
-                stddev_daily_cost_cents=row.stddev_daily_cost_cents,
-                avg_daily_requests=row.avg_daily_requests,
-                max_daily_cost_cents=row.max_daily_cost_cents,
-                min_daily_cost_cents=row.min_daily_cost_cents,
-                window_days=row.window_days,
-                samples_count=row.samples_count,
-                computed_at=row.computed_at,
-                valid_until=row.valid_until,
-                is_current=row.is_current,
-                last_snapshot_id=row.last_snapshot_id,
-            )
+            return _baseline_from_row(row)
         return None
 
+    async def get_current_baselines(
+        self,
+        tenant_id: str,
+        window_days: int,
+    ) -> dict[tuple[EntityType, str | None], SnapshotBaseline]:
+        query = """
+            SELECT * FROM cost_snapshot_baselines
+            WHERE tenant_id = :tenant_id
+              AND window_days = :window_days
+              AND is_current = true
+            ORDER BY computed_at DESC
+        """
+        result = await self._session.execute(
+            text(query),
+            {"tenant_id": tenant_id, "window_days": window_days},
+        )
+        baselines: dict[tuple[EntityType, str | None], SnapshotBaseline] = {}
+        for row in result.fetchall():
+            # Rows are newest first; keep the latest per entity
+            baselines.setdefault((EntityType(row.entity_type), row.entity_id), _baseline_from_row(row))
+        return baselines
+
     async def aggregate_cost_records(
         self,
         tenant_id: str,
@@ -201,108 +268,109 @@ class CostSnapshotsDriver:
         period_start: datetime,
         period_end: datetime,
     ) -> list[SnapshotAggregate]:
-        aggregates: list[SnapshotAggregate] = []
-        params = {
-            "tenant_id": tenant_id,
-            "period_start": period_start,
-            "period_end": period_end,
-        }
-
-        # 1. Tenant-level
+        # One pass over the window yields the tenant total plus per-user,
+        # per-feature and per-model groups; GROUPING() tells the sets apart.
         result = await self._session.execute(text("""
-            SELECT COALESCE(SUM(cost_cents), 0) as total_cost,
-                   COALESCE(COUNT(*), 0) as request_count,
+            SELECT GROUPING(user_id, feature_tag, model) as grouping_set,
+                   user_id, feature_tag, model,
+                   COALESCE(SUM(cost_cents), 0) as total_cost,
+                   COUNT(*) as request_count,
                    COALESCE(SUM(input_tokens), 0) as input_tokens,
                    COALESCE(SUM(output_tokens), 0) as output_tokens
             FROM cost_records
             WHERE tenant_id = :tenant_id
               AND created_at >= :period_start AND created_at < :period_end
-        """), params)
-        row = result.fetchone()
-        if row and row.request_count > 0:
-            aggregates.append(SnapshotAggregate.create(
-                snapshot_id=snapshot_id, tenant_id=tenant_id,
-                entity_type=EntityType.TENANT, entity_id=None,
-                total_cost_cents=float(row.total_cost), request_count=int(row.request_count),
-                total_input_tokens=int(row.input_tokens), total_output_tokens=int(row.output_tokens),
-            ))
+            GROUP BY GROUPING SETS ((), (user_id), (feature_tag), (model))
+        """), {
+            "tenant_id": tenant_id,
+            "period_start": period_start,
+            "period_end": period_end,
+        })
 
-        # 2. User-level
-        result = await self._session.execute(text("""
-            SELECT user_id, COALESCE(SUM(cost_cents), 0) as total_cost,
-                   COALESCE(COUNT(*), 0) as request_count,
-                   COALESCE(SUM(input_tokens), 0) as input_tokens,
-                   COALESCE(SUM(output_tokens), 0) as output_tokens
-            FROM cost_records
-            WHERE tenant_id = :tenant_id
-              AND created_at >= :period_start AND created_at < :period_end
-              AND user_id IS NOT NULL
-            GROUP BY user_id
-        """), params)
+        aggregates: list[SnapshotAggregate] = []
         for row in result.fetchall():
+            entity_type = _GROUPING_SET_ENTITIES.get(int(row.grouping_set))
+            if entity_type is None:
+                continue
+            entity_id = {
+                EntityType.TENANT: None,
+                EntityType.USER: row.user_id,
+                EntityType.FEATURE: row.feature_tag,
+                EntityType.MODEL: row.model,
+            }[entity_type]
+            # No empty tenant row, no NULL-user / NULL-feature groups
+            if entity_type == EntityType.TENANT and row.request_count == 0:
+                continue
+            if entity_type in (EntityType.USER, EntityType.FEATURE) and entity_id is None:
+                continue
             aggregates.append(SnapshotAggregate.create(
                 snapshot_id=snapshot_id, tenant_id=tenant_id,
-                entity_type=EntityType.USER, entity_id=row.user_id,
+                entity_type=entity_type, entity_id=entity_id,
                 total_cost_cents=float(row.total_cost), request_count=int(row.request_count),
                 total_input_tokens=int(row.input_tokens), total_output_tokens=int(row.output_tokens),
             ))
 
-        # 3. Feature-level
-        result = await self._session.execute(text("""
-            SELECT feature_tag, COALESCE(SUM(cost_cents), 0) as total_cost,
-                   COALESCE(COUNT(*), 0) as request_count,
-                   COALESCE(SUM(input_tokens), 0) as input_tokens,
-                   COALESCE(SUM(output_tokens), 0) as output_tokens
-            FROM cost_records
-            WHERE tenant_id = :tenant_id
-              AND created_at >= :period_start AND created_at < :period_end
-              AND feature_tag IS NOT NULL
-            GROUP BY feature_tag
-        """), params)
-        for row in result.fetchall():
-            aggregates.append(SnapshotAggregate.create(
-                snapshot_id=snapshot_id, tenant_id=tenant_id,
-                entity_type=EntityType.FEATURE, entity_id=row.feature_tag,
-                total_cost_cents=float(row.total_cost), request_count=int(row.request_count),
-                total_input_tokens=int(row.input_tokens), total_output_tokens=int(row.output_tokens),
-            ))
+        return _order_aggregates(aggregates)
 
-        # 4. Model-level
+    async def aggregate_hourly_rollups(
+        self,
+        tenant_id: str,
+        snapshot_id: str,
+        period_start: datetime,
+        period_end: datetime,
+    ) -> list[SnapshotAggregate]:
+        # Hour-aligned windows only; entity_key '' is the tenant row or a NULL model
         result = await self._session.execute(text("""
-            SELECT model, COALESCE(SUM(cost_cents), 0) as total_cost,
-                   COALESCE(COUNT(*), 0) as request_count,
-                   COALESCE(SUM(input_tokens), 0) as input_tokens,
-                   COALESCE(SUM(output_tokens), 0) as output_tokens
-            FROM cost_records
+            SELECT entity_type, NULLIF(entity_key, '') as entity_id,
+                   SUM(total_cost_cents) as total_cost,
+                   SUM(request_count) as request_count,
+                   SUM(input_tokens) as input_tokens,
+                   SUM(output_tokens) as output_tokens
+            FROM cost_hourly_rollups
             WHERE tenant_id = :tenant_id
-              AND created_at >= :period_start AND created_at < :period_end
-            GROUP BY model
-        """), params)
-        for row in result.fetchall():
-            aggregates.append(SnapshotAggregate.create(
+              AND hour_start >= :period_start AND hour_start < :period_end
+            GROUP BY entity_type, entity_key
+        """), {
+            "tenant_id": tenant_id,
+            "period_start": period_start,
+            "period_end": period_end,
+        })
+
+        aggregates = [
+            SnapshotAggregate.create(
                 snapshot_id=snapshot_id, tenant_id=tenant_id,
-                entity_type=EntityType.MODEL, entity_id=row.model,
+                entity_type=EntityType(row.entity_type), entity_id=row.entity_id,
                 total_cost_cents=float(row.total_cost), request_count=int(row.request_count),
                 total_input_tokens=int(row.input_tokens), total_output_tokens=int(row.output_tokens),
-            ))
-
-        return aggregates
+            )
+            for row in result.fetchall()
+        ]
+        return _order_aggregates(aggregates)
 
     async def insert_baseline(self, baseline: SnapshotBaseline) -> None:
+        await self.insert_baselines([baseline])
+
+    async def insert_baselines(self, baselines: list[SnapshotBaseline]) -> None:
+        if not baselines:
+            return
+
         # Mark existing baselines as not current
         await self._session.execute(text("""
             UPDATE cost_snapshot_baselines SET is_current = false
             WHERE tenant_id = :tenant_id AND entity_type = :entity_type
               AND (entity_id = :entity_id OR (entity_id IS NULL AND :entity_id IS NULL))
               AND window_days = :window_days AND is_current = true
-        """), {
-            "tenant_id": baseline.tenant_id,
-            "entity_type": baseline.entity_type.value,
-            "entity_id": baseline.entity_id,
-            "window_days": baseline.window_days,
-        })
-
-        # Insert new baseline
+        """), [
+            {
+                "tenant_id": baseline.tenant_id,
+                "entity_type": baseline.entity_type.value,
+                "entity_id": baseline.entity_id,
+                "window_days": baseline.window_days,
+            }
+            for baseline in baselines
+        ])
+
+        # Insert new baselines
         await self._session.execute(text("""
             INSERT INTO cost_snapshot_baselines (
                 id, tenant_id, entity_type, entity_id,
@@ -317,18 +385,21 @@ class CostSnapshotsDriver:
                 :window_days, :samples_count, :computed_at, :valid_until,
                 :is_current, :last_snapshot_id
             )
-        """), {
-            "id": baseline.id, "tenant_id": baseline.tenant_id,
-            "entity_type": baseline.entity_type.value, "entity_id": baseline.entity_id,
-            "avg_daily_cost_cents": baseline.avg_daily_cost_cents,
-            "stddev_daily_cost_cents": baseline.stddev_daily_cost_cents,
-            "avg_daily_requests": baseline.avg_daily_requests,
-            "max_daily_cost_cents": baseline.max_daily_cost_cents,
-            "min_daily_cost_cents": baseline.min_daily_cost_cents,
-            "window_days": baseline.window_days, "samples_count": baseline.samples_count,
-            "computed_at": baseline.computed_at, "valid_until": baseline.valid_until,
-            "is_current": baseline.is_current, "last_snapshot_id": baseline.last_snapshot_id,
-        })
+        """), [
+            {
+                "id": baseline.id, "tenant_id": baseline.tenant_id,
+                "entity_type": baseline.entity_type.value, "entity_id": baseline.entity_id,
+                "avg_daily_cost_cents": baseline.avg_daily_cost_cents,
+                "stddev_daily_cost_cents": baseline.stddev_daily_cost_cents,
+                "avg_daily_requests": baseline.avg_daily_requests,
+                "max_daily_cost_cents": baseline.max_daily_cost_cents,
+                "min_daily_cost_cents": baseline.min_daily_cost_cents,
+                "window_days": baseline.window_days, "samples_count": baseline.samples_count,
+                "computed_at": baseline.computed_at, "valid_until": baseline.valid_until,
+                "is_current": baseline.is_current, "last_snapshot_id": baseline.last_snapshot_id,
+            }
+            for baseline in baselines
+        ])
 
     async def get_snapshot(self, snapshot_id: str) -> CostSnapshot | None:
         query = "SELECT * FROM cost_snapshots WHERE id = :id"
@@ -364,6 +435,11 @@ class CostSnapshotsDriver:
         return rows
 
     async def insert_evaluation(self, evaluation: AnomalyEvaluation) -> None:
+        await self.insert_evaluations([evaluation])
+
+    async def insert_evaluations(self, evaluations: list[AnomalyEvaluation]) -> None:
+        if not evaluations:
+            return
         query = """
             INSERT INTO cost_anomaly_evaluations (
                 id, tenant_id, snapshot_id, entity_type, entity_id,
@@ -375,21 +451,24 @@ class CostSnapshotsDriver:
                 :triggered, :severity_computed, :anomaly_id, :evaluation_reason, :evaluated_at
             )
         """
-        await self._session.execute(text(query), {
-            "id": evaluation.id, "tenant_id": evaluation.tenant_id,
-            "snapshot_id": evaluation.snapshot_id,
-            "entity_type": evaluation.entity_type.value,
-            "entity_id": evaluation.entity_id,
-            "current_value_cents": evaluation.current_value_cents,
-            "baseline_value_cents": evaluation.baseline_value_cents,
-            "threshold_pct": evaluation.threshold_pct,
-            "deviation_pct": evaluation.deviation_pct,
-            "triggered": evaluation.triggered,
-            "severity_computed": evaluation.severity_computed,
-            "anomaly_id": evaluation.anomaly_id,
-            "evaluation_reason": evaluation.evaluation_reason,
-            "evaluated_at": evaluation.evaluated_at,
-        })
+        await self._session.execute(text(query), [
+            {
+                "id": evaluation.id, "tenant_id": evaluation.tenant_id,
+                "snapshot_id": evaluation.snapshot_id,
+                "entity_type": evaluation.entity_type.value,
+                "entity_id": evaluation.entity_id,
+                "current_value_cents": evaluation.current_value_cents,
+                "baseline_value_cents": evaluation.baseline_value_cents,
+                "threshold_pct": evaluation.threshold_pct,
+                "deviation_pct": evaluation.deviation_pct,
+                "triggered": evaluation.triggered,
+                "severity_computed": evaluation.severity_computed,
+                "anomaly_id": evaluation.anomaly_id,
+                "evaluation_reason": evaluation.evaluation_reason,
+                "evaluated_at": evaluation.evaluated_at,
+            }
+            for evaluation in evaluations
+        ])
 
     async def insert_anomaly(
         self,
@@ -407,6 +486,20 @@ class CostSnapshotsDriver:
         snapshot_id: str,
         detected_at: datetime,
     ) -> None:
+        await self.insert_anomalies([{
+            "id": anomaly_id, "tenant_id": tenant_id,
+            "anomaly_type": anomaly_type, "severity": severity,
+            "entity_type": entity_type, "entity_id": entity_id,
+            "current_value_cents": current_value_cents,
+            "expected_value_cents": expected_value_cents,
+            "deviation_pct": deviation_pct, "threshold_pct": threshold_pct,
+            "message": message, "snapshot_id": snapshot_id, "detected_at": detected_at,
+        }])
+
+    async def insert_anomalies(self, anomalies: list[dict[str, Any]]) -> None:
+        """Insert cost_anomalies rows; each dict carries the insert_anomaly columns (id, not anomaly_id)."""
+        if not anomalies:
+            return
         query = """
             INSERT INTO cost_anomalies (
                 id, tenant_id, anomaly_type, severity, entity_type, entity_id,
@@ -418,15 +511,7 @@ class CostSnapshotsDriver:
                 :message, :snapshot_id, :detected_at
             )
         """
-        await self._session.execute(text(query), {
-            "id": anomaly_id, "tenant_id": tenant_id,
-            "anomaly_type": anomaly_type, "severity": severity,
-            "entity_type": entity_type, "entity_id": entity_id,
-            "current_value_cents": current_value_cents,
-            "expected_value_cents": expected_value_cents,
-            "deviation_pct": deviation_pct, "threshold_pct": threshold_pct,
-            "message": message, "snapshot_id": snapshot_id, "detected_at": detected_at,
-        })
+        await self._session.execute(text(query), anomalies)
 
     async def compute_baselines(
         self,
@@ -464,6 +549,58 @@ class CostSnapshotsDriver:
         return rows
 
 
+    async def compute_baselines_from_rollups(
+        self,
+        tenant_id: str,
+        window_days: int,
+    ) -> list[dict[str, Any]]:
+        # Daily totals for the last window_days closed days, summed from hourly rollups
+        window_end = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        query = """
+            WITH daily AS (
+                SELECT entity_type, entity_key,
+                       SUM(total_cost_cents) as day_cost,
+                       SUM(request_count) as day_requests
+                FROM cost_hourly_rollups
+                WHERE tenant_id = :tenant_id
+                  AND hour_start >= :window_start AND hour_start < :window_end
+                GROUP BY entity_type, entity_key, date_trunc('day', hour_start, 'UTC')
+            )
+            SELECT
+                entity_type, NULLIF(entity_key, '') as entity_id,
+                AVG(day_cost) as avg_cost,
+                STDDEV(day_cost) as stddev_cost,
+                AVG(day_requests) as avg_requests,
+                MAX(day_cost) as max_cost,
+                MIN(day_cost) as min_cost,
+                COUNT(*) as samples,
+                (
+                    SELECT id FROM cost_snapshots
+                    WHERE tenant_id = :tenant_id
+                      AND snapshot_type = 'daily' AND status = 'complete'
+                    ORDER BY period_start DESC
+                    LIMIT 1
+                ) as last_snapshot
+            FROM daily
+            GROUP BY entity_type, entity_key
+        """
+        result = await self._session.execute(text(query), {
+            "tenant_id": tenant_id,
+            "window_start": window_end - timedelta(days=window_days),
+            "window_end": window_end,
+        })
+        rows = []
+        for row in result.fetchall():
+            rows.append({
+                "entity_type": row.entity_type, "entity_id": row.entity_id,
+                "avg_cost": row.avg_cost, "stddev_cost": row.stddev_cost,
+                "avg_requests": row.avg_requests, "max_cost": row.max_cost,
+                "min_cost": row.min_cost, "samples": row.samples,
+                "last_snapshot": row.last_snapshot,
+            })
+        return rows
+
+
 def get_cost_snapshots_driver(session: AsyncSession) -> CostSnapshotsDriver:
     """Factory function to get CostSnapshotsDriver instance."""
     return CostSnapshotsDriver(session)
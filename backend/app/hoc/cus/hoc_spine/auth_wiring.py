@@ -18,11 +18,14 @@ delegate to authority modules.
 
 This module re-exports the concrete symbols main.py needs:
   - AUTH_GATEWAY_ENABLED        (from authority.gateway_policy)
+  - get_policy_router           (from authority.rbac_policy — startup compile)
   - configure_auth_gateway      (from auth.gateway_config — startup orchestration)
   - setup_auth_middleware        (from auth.gateway_config — startup orchestration)
-  - RBACMiddleware              (from auth.rbac_middleware — Starlette middleware)
-  - OnboardingGateMiddleware    (from auth.onboarding_gate — Starlette middleware)
+  - setup_request_pipeline      (from auth.gateway_config — single auth/RBAC/tenant middleware)
+  - RBACMiddleware              (from auth.rbac_middleware — ASGI middleware)
+  - OnboardingGateMiddleware    (from auth.onboarding_gate — ASGI middleware)
   - verify_api_key              (from auth — FastAPI dependency)
+  - get_api_key_engine          (from auth.api_key_engine — usage flush)
 """
 
 from __future__ import annotations
@@ -31,25 +34,35 @@ from __future__ import annotations
 from app.hoc.cus.hoc_spine.authority.gateway_policy import (  # noqa: F401
     AUTH_GATEWAY_ENABLED,
 )
+from app.hoc.cus.hoc_spine.authority.rbac_policy import (  # noqa: F401
+    get_policy_router,
+)
 
 # Startup orchestration (needs FastAPI/session store/API key service)
 from app.auth.gateway_config import (  # noqa: F401
     configure_auth_gateway,
     setup_auth_middleware,
+    setup_request_pipeline,
 )
 
-# Middleware classes (need Starlette BaseHTTPMiddleware)
+# Middleware classes (pure ASGI, Starlette request types)
 from app.auth.rbac_middleware import RBACMiddleware  # noqa: F401
 from app.auth.onboarding_gate import OnboardingGateMiddleware  # noqa: F401
 
 # FastAPI dependency (X-AOS-Key header validation)
 from app.auth import verify_api_key  # noqa: F401
 
+# API key engine (batched usage accounting, revocation listener)
+from app.auth.api_key_engine import get_api_key_engine  # noqa: F401
+
 __all__ = [
     "AUTH_GATEWAY_ENABLED",
+    "get_policy_router",
     "configure_auth_gateway",
     "setup_auth_middleware",
+    "setup_request_pipeline",
     "RBACMiddleware",
     "OnboardingGateMiddleware",
     "verify_api_key",
+    "get_api_key_engine",
 ]
@@ -33,7 +33,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import Any, Literal
+from typing import Any, Literal, Optional, Sequence
 
 logger = logging.getLogger("nova.hoc.business_invariants")
 
@@ -668,7 +668,9 @@ def check_invariant(invariant_id: str, context: dict[str, Any]) -> tuple[bool, s
 
 
 def check_all_for_operation(
-    operation: str, context: dict[str, Any]
+    operation: str,
+    context: dict[str, Any],
+    invariant_ids: Optional[Sequence[str]] = None,
 ) -> list[tuple[str, bool, str]]:
     """
     Check ALL invariants that guard a given operation.
@@ -677,21 +679,36 @@ def check_all_for_operation(
     (e.g. "account.onboarding.advance") also trigger checks for invariants
     registered under their semantic alias (e.g. "onboarding.activate").
 
+    Args:
+        operation: Operation name
+        context: Invariant context
+        invariant_ids: Pre-resolved invariant_ids_for_operation(operation),
+            e.g. from a frozen registry's dispatch plan; skips the scan.
+
     Returns:
         List of (invariant_id, passed, message) tuples for every invariant
         whose operation field matches the given operation string or its alias.
     """
+    if invariant_ids is None:
+        invariant_ids = invariant_ids_for_operation(operation)
+
+    results: list[tuple[str, bool, str]] = []
+    for inv_id in invariant_ids:
+        passed, message = check_invariant(inv_id, context)
+        results.append((inv_id, passed, message))
+    return results
+
+
+def invariant_ids_for_operation(operation: str) -> tuple[str, ...]:
+    """
+    IDs of the invariants guarding *operation* (directly or via its alias),
+    in registry order.
+    """
     ops_to_check = {operation}
     alias = INVARIANT_OPERATION_ALIASES.get(operation)
     if alias:
         ops_to_check.add(alias)
-
-    results: list[tuple[str, bool, str]] = []
-    for inv_id, invariant in BUSINESS_INVARIANTS.items():
-        if invariant.operation in ops_to_check:
-            passed, message = check_invariant(inv_id, context)
-            results.append((inv_id, passed, message))
-    return results
+    return tuple(inv_id for inv_id, invariant in BUSINESS_INVARIANTS.items() if invariant.operation in ops_to_check)
 
 
 __all__ = [
@@ -701,5 +718,6 @@ __all__ = [
     "INVARIANT_OPERATION_ALIASES",
     "check_invariant",
     "check_all_for_operation",
+    "invariant_ids_for_operation",
     "register_checker",
 ]
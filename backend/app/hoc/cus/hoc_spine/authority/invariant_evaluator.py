@@ -34,6 +34,7 @@ from __future__ import annotations
 import enum
 import logging
 from dataclasses import dataclass
+from typing import Optional, Sequence
 
 from .business_invariants import (
     BusinessInvariantViolation,
@@ -82,13 +83,15 @@ def evaluate_invariants(
     operation: str,
     context: dict,
     mode: InvariantMode = InvariantMode.MONITOR,
+    invariant_ids: Optional[Sequence[str]] = None,
 ) -> list[InvariantResult]:
     """
     Evaluate all business invariants registered for *operation*.
 
     Steps:
         1. Delegate to ``check_all_for_operation`` to run every invariant
-           that applies to the given operation.
+           that applies to the given operation (or the pre-resolved
+           *invariant_ids*, when the caller already knows them).
         2. Log each result via stdlib logging.
         3. In ENFORCE mode: raise ``BusinessInvariantViolation`` if any
            CRITICAL invariant fails.
@@ -99,7 +102,7 @@ def evaluate_invariants(
     Returns:
         A list of ``InvariantResult`` — one per evaluated invariant.
     """
-    raw_outcomes = check_all_for_operation(operation, context)
+    raw_outcomes = check_all_for_operation(operation, context, invariant_ids)
 
     results: list[InvariantResult] = []
     failures_critical: list[InvariantResult] = []
@@ -25,7 +25,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger("nova.auth.rbac_policy")
 
@@ -223,322 +223,487 @@ RBAC_MATRIX: Dict[str, Dict[str, List[str]]] = {
 # ============================================================================
 # Path → Policy Mapping (Canonical Paths)
 # ============================================================================
+#
+# The mapping is a first-match decision list. Each PathRule names the paths
+# it applies to (prefixes and/or substrings) and a decide(path, method) step
+# that returns a PolicyObject, PUBLIC (no RBAC), or None to fall through to
+# the next rule. PathPolicyRouter compiles the rules once into a character
+# trie over their prefixes, so a request walks its path once instead of
+# testing every rule; the few substring rules are checked directly. Public
+# paths from RBAC_RULES.yaml get a trie of their own.
 
-def get_policy_for_path(path: str, method: str) -> Optional[PolicyObject]:
+PUBLIC = object()  # decide() result: path needs no RBAC
+
+_END = ""  # trie node key holding the values stored at that node
+
+
+@dataclass(frozen=True)
+class PathRule:
     """
-    Map request path and method to a PolicyObject.
+    One entry of the path → policy decision list.
 
-    Returns None for explicitly public paths (no RBAC needed).
-    All path matchers use canonical (unversioned) form.
+    Attributes:
+        decide: (path, method) → PolicyObject, PUBLIC, or None (fall through)
+        prefixes: The rule applies to paths starting with any of these
+        contains: The rule applies to paths containing any of these
     """
-    # Schema-driven public paths (PIN-391)
-    from app.auth.rbac_rules_loader import get_public_paths
 
-    public_paths = get_public_paths(environment=CURRENT_ENVIRONMENT)
+    decide: Callable[[str, str], Any]
+    prefixes: Tuple[str, ...] = ()
+    contains: Tuple[str, ...] = ()
+
+
+class _PrefixTrie:
+    """Character trie: which stored prefixes does a path start with?"""
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+
+    def add(self, prefix: str, value: Any) -> None:
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(_END, []).append(value)
+
+    def matches(self, path: str) -> List[Any]:
+        """Values of every stored prefix of path, shortest prefix first."""
+        node = self._root
+        found: List[Any] = list(node.get(_END, ()))
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                break
+            if _END in node:
+                found.extend(node[_END])
+        return found
+
+    def has_prefix_of(self, path: str) -> bool:
+        node = self._root
+        if _END in node:
+            return True
+        for char in path:
+            node = node.get(char)
+            if node is None:
+                return False
+            if _END in node:
+                return True
+        return False
+
+
+class PathPolicyRouter:
+    """
+    Compiled path → policy decision list.
 
-    is_public = any(
-        path.startswith(p) or path == p.rstrip("/") for p in public_paths
-    )
+    resolve() returns exactly what evaluating the rules in order would:
+    None for public paths, the first rule decision that does not fall
+    through, else default().
+    """
+
+    def __init__(
+        self,
+        rules: Sequence[PathRule],
+        public_paths: Sequence[str],
+        default: Callable[[], Any],
+    ):
+        self._rules = list(rules)
+        self._default = default
+        self._prefixes = _PrefixTrie()
+        self._contains: List[Tuple[str, int]] = []
+        for index, rule in enumerate(self._rules):
+            for prefix in rule.prefixes:
+                self._prefixes.add(prefix, index)
+            for needle in rule.contains:
+                self._contains.append((needle, index))
+        self._public = _PrefixTrie()
+        for public_path in public_paths:
+            self._public.add(public_path, public_path)
+        self._public_exact = frozenset(p.rstrip("/") for p in public_paths)
+
+    def is_public(self, path: str) -> bool:
+        """path starts with a public path, or equals one without its trailing slash."""
+        return path in self._public_exact or self._public.has_prefix_of(path)
+
+    def resolve(self, path: str, method: str) -> Optional[Any]:
+        if self.is_public(path):
+            return None
+
+        candidates = self._prefixes.matches(path)
+        for needle, index in self._contains:
+            if needle in path:
+                candidates.append(index)
+        if len(candidates) > 1:
+            candidates = sorted(set(candidates))
+
+        for index in candidates:
+            decision = self._rules[index].decide(path, method)
+            if decision is PUBLIC:
+                return None
+            if decision is not None:
+                return decision
+
+        logger.debug(f"rbac_unknown_path: {path} {method} - defaulting to runtime:query")
+        return self._default()
+
+
+def build_path_rules(api_prefix: str, policy: Callable[..., Any]) -> List[PathRule]:
+    """
+    Path rules for routes mounted under api_prefix ("" for canonical paths).
+
+    Args:
+        api_prefix: Mount prefix of the versioned routers (e.g. "/api/v1")
+        policy: PolicyObject constructor (resource=, action=)
+    """
 
-    if is_public:
-        return None
+    def rule(decide, prefixes=(), contains=()):
+        return PathRule(decide=decide, prefixes=tuple(prefixes), contains=tuple(contains))
 
     # =========================================================================
     # MEMORY PINS (/memory/pins)
     # =========================================================================
-    if path.startswith("/memory/pins"):
+    def memory_pins(path, method):
         if path.endswith("/cleanup"):
-            return PolicyObject(resource="memory_pin", action="admin")
+            return policy(resource="memory_pin", action="admin")
         elif method == "GET":
-            return PolicyObject(resource="memory_pin", action="read")
+            return policy(resource="memory_pin", action="read")
         elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="memory_pin", action="write")
+            return policy(resource="memory_pin", action="write")
         elif method == "DELETE":
-            return PolicyObject(resource="memory_pin", action="delete")
+            return policy(resource="memory_pin", action="delete")
 
     # =========================================================================
     # PROMETHEUS & METRICS
     # =========================================================================
-    if path.startswith("/-/reload") or path.startswith("/api/observability/prom-reload"):
-        return PolicyObject(resource="prometheus", action="reload")
+    def prometheus_reload(path, method):
+        return policy(resource="prometheus", action="reload")
 
-    if path.startswith("/query") or path.startswith("/api/prometheus"):
-        return PolicyObject(resource="prometheus", action="query")
+    def prometheus_query(path, method):
+        return policy(resource="prometheus", action="query")
 
     # =========================================================================
     # COSTSIM (/costsim)
     # =========================================================================
-    if path.startswith("/costsim"):
+    def costsim(path, method):
         if method == "GET":
-            return PolicyObject(resource="costsim", action="read")
+            return policy(resource="costsim", action="read")
         else:
-            return PolicyObject(resource="costsim", action="write")
+            return policy(resource="costsim", action="write")
 
     # =========================================================================
     # POLICY (/policy)
     # =========================================================================
-    if path.startswith("/policy"):
+    def policy_routes(path, method):
         if "/approve" in path or "/reject" in path:
-            return PolicyObject(resource="policy", action="approve")
+            return policy(resource="policy", action="approve")
         elif method == "GET":
-            return PolicyObject(resource="policy", action="read")
+            return policy(resource="policy", action="read")
         else:
-            return PolicyObject(resource="policy", action="write")
+            return policy(resource="policy", action="write")
 
     # =========================================================================
     # AGENTS (/agents)
     # =========================================================================
-    if path.startswith("/agents"):
+    def agents(path, method):
         if "/heartbeat" in path:
-            return PolicyObject(resource="agent", action="heartbeat")
+            return policy(resource="agent", action="heartbeat")
         elif "/register" in path:
-            return PolicyObject(resource="agent", action="register")
+            return policy(resource="agent", action="register")
         elif method == "GET":
-            return PolicyObject(resource="agent", action="read")
+            return policy(resource="agent", action="read")
         elif method == "POST":
-            return PolicyObject(resource="agent", action="write")
+            return policy(resource="agent", action="write")
         elif method in ("PUT", "PATCH"):
-            return PolicyObject(resource="agent", action="write")
+            return policy(resource="agent", action="write")
         elif method == "DELETE":
-            return PolicyObject(resource="agent", action="delete")
+            return policy(resource="agent", action="delete")
 
     # =========================================================================
     # RUNTIME (/runtime)
     # =========================================================================
-    if path.startswith("/runtime"):
+    def runtime(path, method):
         if "/simulate" in path:
-            return PolicyObject(resource="runtime", action="simulate")
+            return policy(resource="runtime", action="simulate")
         elif "/capabilities" in path:
-            return PolicyObject(resource="runtime", action="capabilities")
-        elif "/query" in path or method == "GET":
-            return PolicyObject(resource="runtime", action="query")
+            return policy(resource="runtime", action="capabilities")
         else:
-            return PolicyObject(resource="runtime", action="query")
+            return policy(resource="runtime", action="query")
 
     # =========================================================================
     # RECOVERY (/recovery)
     # =========================================================================
-    if path.startswith("/recovery"):
+    def recovery(path, method):
         if "/execute" in path or "/apply" in path:
-            return PolicyObject(resource="recovery", action="execute")
+            return policy(resource="recovery", action="execute")
         elif "/suggest" in path:
-            return PolicyObject(resource="recovery", action="suggest")
+            return policy(resource="recovery", action="suggest")
         elif method == "GET":
-            return PolicyObject(resource="recovery", action="read")
+            return policy(resource="recovery", action="read")
         elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="recovery", action="write")
+            return policy(resource="recovery", action="write")
 
     # =========================================================================
     # WORKERS (/workers)
     # =========================================================================
-    if path.startswith("/workers"):
+    def workers(path, method):
         if "/run" in path or "/execute" in path:
-            return PolicyObject(resource="worker", action="run")
+            return policy(resource="worker", action="run")
         elif "/stream" in path:
-            return PolicyObject(resource="worker", action="stream")
+            return policy(resource="worker", action="stream")
         elif "/cancel" in path or "/stop" in path:
-            return PolicyObject(resource="worker", action="cancel")
+            return policy(resource="worker", action="cancel")
         elif method == "GET":
-            return PolicyObject(resource="worker", action="read")
+            return policy(resource="worker", action="read")
 
     # =========================================================================
     # TRACES (/traces)
     # =========================================================================
-    if path.startswith("/traces"):
+    def traces(path, method):
         if "/export" in path:
-            return PolicyObject(resource="trace", action="export")
+            return policy(resource="trace", action="export")
         elif method == "GET":
-            return PolicyObject(resource="trace", action="read")
+            return policy(resource="trace", action="read")
         elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="trace", action="write")
+            return policy(resource="trace", action="write")
         elif method == "DELETE":
-            return PolicyObject(resource="trace", action="delete")
+            return policy(resource="trace", action="delete")
 
     # =========================================================================
     # EMBEDDING (/embedding)
     # =========================================================================
-    if path.startswith("/embedding"):
+    def embedding(path, method):
         if "/query" in path or "/search" in path:
-            return PolicyObject(resource="embedding", action="query")
+            return policy(resource="embedding", action="query")
         elif path.endswith("/embed") and method == "POST":
-            return PolicyObject(resource="embedding", action="embed")
+            return policy(resource="embedding", action="embed")
         elif method == "GET":
-            return PolicyObject(resource="embedding", action="read")
+            return policy(resource="embedding", action="read")
         elif method == "POST":
-            return PolicyObject(resource="embedding", action="embed")
+            return policy(resource="embedding", action="embed")
 
     # =========================================================================
     # KILLSWITCH
     # =========================================================================
-    if "/killswitch" in path:
+    def killswitch(path, method):
         if "/activate" in path or "/engage" in path:
-            return PolicyObject(resource="killswitch", action="activate")
+            return policy(resource="killswitch", action="activate")
         elif "/reset" in path or "/disengage" in path:
-            return PolicyObject(resource="killswitch", action="reset")
+            return policy(resource="killswitch", action="reset")
         else:
-            return PolicyObject(resource="killswitch", action="read")
+            return policy(resource="killswitch", action="read")
 
     # =========================================================================
     # INTEGRATION
     # =========================================================================
-    if "/integration" in path:
+    def integration(path, method):
         if "/resolve" in path:
-            return PolicyObject(resource="integration", action="resolve")
+            return policy(resource="integration", action="resolve")
         elif "/checkpoint" in path:
-            return PolicyObject(resource="integration", action="checkpoint")
+            return policy(resource="integration", action="checkpoint")
         elif method == "GET":
-            return PolicyObject(resource="integration", action="read")
+            return policy(resource="integration", action="read")
 
     # =========================================================================
     # COST
     # =========================================================================
-    if "/cost" in path and "/costsim" not in path:
+    def cost(path, method):
+        if "/costsim" in path:
+            return None
         if "/simulate" in path:
-            return PolicyObject(resource="cost", action="simulate")
+            return policy(resource="cost", action="simulate")
         elif "/forecast" in path:
-            return PolicyObject(resource="cost", action="forecast")
+            return policy(resource="cost", action="forecast")
         else:
-            return PolicyObject(resource="cost", action="read")
+            return policy(resource="cost", action="read")
 
     # =========================================================================
     # CHECKPOINTS (/checkpoints)
     # =========================================================================
-    if path.startswith("/checkpoints"):
+    def checkpoints(path, method):
         if "/restore" in path:
-            return PolicyObject(resource="checkpoint", action="restore")
+            return policy(resource="checkpoint", action="restore")
         elif method == "GET":
-            return PolicyObject(resource="checkpoint", action="read")
+            return policy(resource="checkpoint", action="read")
         elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="checkpoint", action="write")
+            return policy(resource="checkpoint", action="write")
 
     # =========================================================================
     # EVENTS (/events)
     # =========================================================================
-    if path.startswith("/events"):
+    def events(path, method):
         if "/subscribe" in path:
-            return PolicyObject(resource="event", action="subscribe")
+            return policy(resource="event", action="subscribe")
         elif "/publish" in path and method == "POST":
-            return PolicyObject(resource="event", action="publish")
+            return policy(resource="event", action="publish")
         else:
-            return PolicyObject(resource="event", action="read")
+            return policy(resource="event", action="read")
 
     # =========================================================================
     # INCIDENTS (/incidents)
     # =========================================================================
-    if path.startswith("/incidents") or "/incidents" in path:
+    def incidents(path, method):
         if "/resolve" in path:
-            return PolicyObject(resource="incident", action="resolve")
+            return policy(resource="incident", action="resolve")
         elif method == "GET":
-            return PolicyObject(resource="incident", action="read")
+            return policy(resource="incident", action="read")
         elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="incident", action="write")
+            return policy(resource="incident", action="write")
 
     # =========================================================================
     # RBAC (/rbac)
     # =========================================================================
-    if path.startswith("/rbac"):
+    def rbac(path, method):
         if "/reload" in path:
-            return PolicyObject(resource="rbac", action="reload")
+            return policy(resource="rbac", action="reload")
         elif "/audit" in path:
-            return PolicyObject(resource="rbac", action="audit")
+            return policy(resource="rbac", action="audit")
         else:
-            return PolicyObject(resource="rbac", action="read")
+            return policy(resource="rbac", action="read")
 
     # =========================================================================
     # TENANTS (/tenants)
     # =========================================================================
-    if path.startswith("/tenants"):
+    def tenants(path, method):
         if "/freeze" in path:
-            return PolicyObject(resource="tenant", action="freeze")
+            return policy(resource="tenant", action="freeze")
         elif method == "GET":
-            return PolicyObject(resource="tenant", action="read")
+            return policy(resource="tenant", action="read")
         elif method == "POST":
-            return PolicyObject(resource="tenant", action="write")
+            return policy(resource="tenant", action="write")
         elif method == "DELETE":
-            return PolicyObject(resource="tenant", action="delete")
+            return policy(resource="tenant", action="delete")
 
     # =========================================================================
     # RUNS (/runs) — maps to worker resource
     # =========================================================================
-    if path.startswith("/runs"):
+    def runs(path, method):
         if method == "GET":
-            return PolicyObject(resource="worker", action="read")
+            return policy(resource="worker", action="read")
         elif method == "POST":
-            return PolicyObject(resource="worker", action="run")
+            return policy(resource="worker", action="run")
 
     # =========================================================================
     # V1 PROXY ROUTES (/v1/chat, /v1/embeddings, /v1/status)
     # =========================================================================
-    if path.startswith("/v1/"):
+    def v1_proxy(path, method):
         if "/chat" in path or "/completions" in path:
-            return PolicyObject(resource="runtime", action="simulate")
+            return policy(resource="runtime", action="simulate")
         if "/embeddings" in path:
-            return PolicyObject(resource="embedding", action="embed")
+            return policy(resource="embedding", action="embed")
         if "/status" in path:
-            return PolicyObject(resource="runtime", action="query")
+            return policy(resource="runtime", action="query")
         if "/policies" in path:
-            return PolicyObject(resource="policy", action="read")
+            return policy(resource="policy", action="read")
         if "/demo" in path or "/replay" in path:
-            return PolicyObject(resource="trace", action="read")
+            return policy(resource="trace", action="read")
 
     # =========================================================================
     # CUSTOMER ROUTES (/cus/*)
     # =========================================================================
-    if path.startswith("/cus/"):
-        if "/pre-run" in path:
-            return PolicyObject(resource="runtime", action="query")
-        elif "/acknowledge" in path:
-            return PolicyObject(resource="runtime", action="query")
-        elif "/outcome" in path:
-            return PolicyObject(resource="runtime", action="query")
-        elif "/declaration" in path:
-            return PolicyObject(resource="runtime", action="query")
-        else:
-            return PolicyObject(resource="runtime", action="query")
+    def customer(path, method):
+        return policy(resource="runtime", action="query")
 
     # =========================================================================
     # GUARD ROUTES (/guard/*)
     # =========================================================================
-    if path.startswith("/guard/"):
+    def guard(path, method):
         if "/costs" in path:
-            return PolicyObject(resource="cost", action="read")
+            return policy(resource="cost", action="read")
         elif "/incidents" in path:
-            return PolicyObject(resource="incident", action="read")
+            return policy(resource="incident", action="read")
         else:
-            return PolicyObject(resource="runtime", action="query")
+            return policy(resource="runtime", action="query")
 
     # =========================================================================
     # OPS ROUTES (/ops/*)
     # =========================================================================
-    if path.startswith("/ops/"):
+    def ops(path, method):
         if "/cost" in path:
-            return PolicyObject(resource="cost", action="read")
+            return policy(resource="cost", action="read")
         elif "/customers" in path or "/tenants" in path:
-            return PolicyObject(resource="tenant", action="read")
+            return policy(resource="tenant", action="read")
         elif "/incidents" in path:
-            return PolicyObject(resource="incident", action="read")
+            return policy(resource="incident", action="read")
         elif "/actions" in path:
-            return PolicyObject(resource="tenant", action="write")
+            return policy(resource="tenant", action="write")
         else:
-            return PolicyObject(resource="runtime", action="query")
+            return policy(resource="runtime", action="query")
 
     # =========================================================================
     # FOUNDER TIMELINE (/fdr/timeline/*)
     # =========================================================================
-    if path.startswith("/fdr/timeline"):
-        return PolicyObject(resource="runtime", action="query")
+    def founder_timeline(path, method):
+        return policy(resource="runtime", action="query")
+
+    api = api_prefix
+    return [
+        rule(memory_pins, prefixes=[f"{api}/memory/pins"]),
+        rule(prometheus_reload, prefixes=["/-/reload", "/api/observability/prom-reload"]),
+        rule(prometheus_query, prefixes=[f"{api}/query", "/api/prometheus"]),
+        rule(costsim, prefixes=[f"{api}/costsim"]),
+        rule(policy_routes, prefixes=[f"{api}/policy"]),
+        rule(agents, prefixes=[f"{api}/agents"]),
+        rule(runtime, prefixes=[f"{api}/runtime"]),
+        rule(recovery, prefixes=[f"{api}/recovery"]),
+        rule(workers, prefixes=[f"{api}/workers"]),
+        rule(traces, prefixes=[f"{api}/traces"]),
+        rule(embedding, prefixes=[f"{api}/embedding"]),
+        rule(killswitch, contains=["/killswitch"]),
+        rule(integration, contains=["/integration"]),
+        rule(cost, contains=["/cost"]),
+        rule(checkpoints, prefixes=[f"{api}/checkpoints"]),
+        rule(events, prefixes=[f"{api}/events"]),
+        rule(incidents, contains=["/incidents"]),
+        rule(rbac, prefixes=[f"{api}/rbac"]),
+        rule(tenants, prefixes=[f"{api}/tenants"]),
+        rule(runs, prefixes=[f"{api}/runs"]),
+        rule(v1_proxy, prefixes=["/v1/"]),
+        rule(customer, prefixes=["/cus/"]),
+        rule(guard, prefixes=["/guard/"]),
+        rule(ops, prefixes=["/ops/"]),
+        rule(founder_timeline, prefixes=["/fdr/timeline"]),
+    ]
+
+
+def _default_policy() -> PolicyObject:
+    return PolicyObject(resource="runtime", action="query")
 
-    # =========================================================================
+
+def _stagetest(path: str, method: str) -> Any:
     # STAGETEST EVIDENCE CONSOLE (TODO: Re-enable auth)
-    # =========================================================================
-    if path.startswith("/hoc/api/stagetest"):
-        return None  # Public — no RBAC required
+    return PUBLIC
 
-    # =========================================================================
-    # CATCH-ALL: default to runtime:query
-    # =========================================================================
-    logger.debug(f"rbac_unknown_path: {path} {method} - defaulting to runtime:query")
-    return PolicyObject(resource="runtime", action="query")
+
+# (rules tuple, environment, router): recompiled when RBAC_RULES.yaml is reloaded
+_compiled_router: Optional[Tuple[Any, str, PathPolicyRouter]] = None
+
+
+def get_policy_router() -> PathPolicyRouter:
+    """Canonical path router, compiled from the coded rules and RBAC_RULES.yaml public paths."""
+    global _compiled_router
+
+    # Schema-driven public paths (PIN-391)
+    from app.auth.rbac_rules_loader import get_public_paths, load_rbac_rules
+
+    rules = load_rbac_rules()
+    compiled = _compiled_router
+    if compiled is None or compiled[0] is not rules or compiled[1] != CURRENT_ENVIRONMENT:
+        router = PathPolicyRouter(
+            [*build_path_rules("", PolicyObject), PathRule(_stagetest, prefixes=("/hoc/api/stagetest",))],
+            get_public_paths(environment=CURRENT_ENVIRONMENT),
+            _default_policy,
+        )
+        compiled = _compiled_router = (rules, CURRENT_ENVIRONMENT, router)
+    return compiled[2]
+
+
+def get_policy_for_path(path: str, method: str) -> Optional[PolicyObject]:
+    """
+    Map request path and method to a PolicyObject.
+
+    Returns None for explicitly public paths (no RBAC needed).
+    All path matchers use canonical (unversioned) form.
+    Unknown paths default to runtime:query.
+    """
+    return get_policy_router().resolve(path, method)
 
 
 __all__ = [
@@ -547,4 +712,9 @@ __all__ = [
     "RBAC_MATRIX",
     "CURRENT_ENVIRONMENT",
     "get_policy_for_path",
+    "get_policy_router",
+    "build_path_rules",
+    "PathPolicyRouter",
+    "PathRule",
+    "PUBLIC",
 ]
@@ -354,6 +354,10 @@ class RunCompletionTransaction:
             if not skip_events:
                 self._publish_events(run_id, run_status)
 
+            # A new incident changes the tenant's guard status and incident pages
+            if result.incident_result and result.incident_result.result_id:
+                self._invalidate_guard_cache(tenant_id)
+
             # Calculate duration
             end_time = datetime.now(timezone.utc)
             result.duration_ms = int((end_time - start_time).total_seconds() * 1000)
@@ -432,6 +436,12 @@ class RunCompletionTransaction:
 
             if incident_id:
                 result.phase = TransactionPhase.INCIDENT_CREATED
+                result.incident_result = DomainResult(
+                    domain="incidents",
+                    action="create_incident",
+                    result_id=incident_id,
+                    success=True,
+                )
                 # Register rollback (soft-delete incident if needed)
                 # Capture incident_id in closure for rollback
                 captured_incident_id = incident_id
@@ -623,6 +633,12 @@ class RunCompletionTransaction:
                 extra={"run_id": run_id, "error": str(e)},
             )
 
+    def _invalidate_guard_cache(self, tenant_id: str) -> None:
+        """Drop the tenant's cached guard reads once the incident is committed."""
+        from app.utils.guard_cache import get_guard_cache
+
+        get_guard_cache().invalidate_tenant_sync(tenant_id)
+
     # =========================================================================
     # Rollback Handlers
     # =========================================================================
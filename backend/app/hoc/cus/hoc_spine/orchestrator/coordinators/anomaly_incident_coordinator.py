@@ -19,7 +19,10 @@ cost_anomaly_detector_engine.py (lines 976, 982, 1048).
 
 Responsibilities:
 - Call analytics detection (returns pure CostAnomalyFact list)
+- Own the process-wide StreamingCostAnomalyDetector and the async session
+  it is bootstrapped and polled on (COST_ANOMALY_STREAMING, default on)
 - Pass facts to incidents bridge for incident creation
+- Commit created incidents and invalidate the tenant's guard cache
 - Return combined results
 
 Rules:
@@ -28,6 +31,7 @@ Rules:
 - Cross-domain sequencing ONLY
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Any, Optional
@@ -43,6 +47,46 @@ class AnomalyIncidentCoordinator:
     run_anomaly_detection_with_governance() (deprecated).
     """
 
+    def __init__(self) -> None:
+        self._stream_detector = None
+        self._stream_lock = asyncio.Lock()
+
+    async def _detect_with_facts(self, session: Any, tenant_id: str) -> dict:
+        """Run analytics detection, from streaming state unless disabled.
+
+        Streaming reads (bootstrap, poll, budgets) go through their own
+        async session; anomalies are persisted on the caller's session.
+        """
+        from app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine import (
+            StreamingCostAnomalyDetector,
+            _run_anomaly_detection_with_facts,
+            use_streaming_detector,
+        )
+
+        if not use_streaming_detector():
+            return await _run_anomaly_detection_with_facts(session, tenant_id)
+
+        from app.hoc.cus.analytics.L6_drivers.cost_record_stream_driver import (
+            get_cost_record_stream_driver,
+        )
+        from app.hoc.cus.hoc_spine.orchestrator.operation_registry import (
+            get_async_session_context,
+        )
+
+        async with get_async_session_context() as read_session:
+            stream = get_cost_record_stream_driver(read_session)
+            # One bootstrap per process; concurrent callers share each poll
+            async with self._stream_lock:
+                if self._stream_detector is None:
+                    detector = StreamingCostAnomalyDetector()
+                    await detector.bootstrap(stream)
+                    self._stream_detector = detector
+                else:
+                    await self._stream_detector.poll(stream)
+            return await _run_anomaly_detection_with_facts(
+                session, tenant_id, detector=self._stream_detector, stream=stream
+            )
+
     async def detect_and_ingest(self, session: Any, tenant_id: str) -> dict:
         """Run analytics detection, then pass facts to incidents bridge.
 
@@ -57,11 +101,7 @@ class AnomalyIncidentCoordinator:
             }
         """
         # Step 1: Analytics detects (returns pure facts)
-        from app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine import (
-            _run_anomaly_detection_with_facts,
-        )
-
-        result = await _run_anomaly_detection_with_facts(session, tenant_id)
+        result = await self._detect_with_facts(session, tenant_id)
 
         if not result["facts"]:
             return {"detected": result["detected"], "incidents_created": []}
@@ -86,6 +126,15 @@ class AnomalyIncidentCoordinator:
                     f"(tenant={tenant_id})"
                 )
 
+        if incidents_created:
+            # L4 owns the transaction boundary; cached guard status and
+            # incident pages are dropped only once the incidents are committed
+            session.commit()
+
+            from app.utils.guard_cache import get_guard_cache
+
+            await get_guard_cache().invalidate_tenant(tenant_id)
+
         return {
             "detected": result["detected"],
             "incidents_created": incidents_created,
@@ -105,11 +154,8 @@ class AnomalyIncidentCoordinator:
             List of detected CostAnomaly objects
         """
         # Analytics detection only — no incident bridge call
-        from app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine import (
-            run_anomaly_detection,
-        )
-
-        return await run_anomaly_detection(session, tenant_id)
+        result = await self._detect_with_facts(session, tenant_id)
+        return result["detected"]
 
     def persist_coordination_audit(
         self,
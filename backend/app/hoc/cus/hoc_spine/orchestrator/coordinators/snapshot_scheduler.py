@@ -3,7 +3,7 @@
 # Product: system-wide
 # Role: L4 coordinator — scheduled snapshot batch execution
 # Callers: Cron / systemd timer / APScheduler
-# Allowed Imports: hoc_spine, hoc.cus.analytics.L5_engines (lazy)
+# Allowed Imports: hoc_spine, hoc.cus.analytics.L5_engines (lazy), hoc.cus.analytics.L6_drivers (lazy)
 # Forbidden Imports: L1, L2
 # Reference: PIN-513 Batch 4 Final Wiring
 # artifact_class: CODE
@@ -24,14 +24,28 @@ Flow:
         → cost_snapshots_engine.run_hourly_snapshot_job(...)
     → SnapshotScheduler.run_daily(driver, tenant_ids)
         → cost_snapshots_engine.run_daily_snapshot_and_baseline_job(...)
+
+Sessions:
+  With a driver, every tenant runs on the caller's session, one after
+  another; the caller commits. With driver=None, each tenant gets its own
+  session and driver, up to max_concurrency tenants run at once
+  (COST_SNAPSHOT_JOB_CONCURRENCY, default 8), and each tenant's work is
+  committed here when it finishes.
 """
 
+import asyncio
 import logging
-from typing import Any, List
+import os
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 logger = logging.getLogger("nova.hoc_spine.coordinators.snapshot_scheduler")
 
 
+def snapshot_job_concurrency() -> int:
+    """Max tenants processed at once when the scheduler owns the sessions."""
+    return int(os.getenv("COST_SNAPSHOT_JOB_CONCURRENCY", "8"))
+
+
 class SnapshotScheduler:
     """L4 coordinator: scheduled snapshot batch execution.
 
@@ -41,8 +55,9 @@ class SnapshotScheduler:
 
     async def run_hourly(
         self,
-        driver: Any,
+        driver: Optional[Any],
         tenant_ids: List[str],
+        max_concurrency: Optional[int] = None,
     ) -> dict:
         """Run hourly snapshot job for multiple tenants.
 
@@ -52,9 +67,8 @@ class SnapshotScheduler:
             run_hourly_snapshot_job,
         )
 
-        result = await run_hourly_snapshot_job(
-            driver=driver,
-            tenant_ids=tenant_ids,
+        result = await self._run_job(
+            run_hourly_snapshot_job, driver, tenant_ids, max_concurrency, keys=("success", "failed")
         )
         logger.info(
             "hourly_snapshot_job_completed",
@@ -68,8 +82,9 @@ class SnapshotScheduler:
 
     async def run_daily(
         self,
-        driver: Any,
+        driver: Optional[Any],
         tenant_ids: List[str],
+        max_concurrency: Optional[int] = None,
     ) -> dict:
         """Run daily snapshot + baseline + anomaly detection for multiple tenants.
 
@@ -79,9 +94,12 @@ class SnapshotScheduler:
             run_daily_snapshot_and_baseline_job,
         )
 
-        result = await run_daily_snapshot_and_baseline_job(
-            driver=driver,
-            tenant_ids=tenant_ids,
+        result = await self._run_job(
+            run_daily_snapshot_and_baseline_job,
+            driver,
+            tenant_ids,
+            max_concurrency,
+            keys=("snapshots", "baselines", "anomalies", "failed"),
         )
         logger.info(
             "daily_snapshot_job_completed",
@@ -93,3 +111,51 @@ class SnapshotScheduler:
             },
         )
         return result
+
+    async def _run_job(
+        self,
+        job: Callable[..., Awaitable[dict]],
+        driver: Optional[Any],
+        tenant_ids: List[str],
+        max_concurrency: Optional[int],
+        keys: tuple,
+    ) -> dict:
+        """Run an engine job on the caller's driver, or per tenant with bounded concurrency.
+
+        A tenant whose session fails is reported under "failed".
+        """
+        if driver is not None:
+            return await job(driver=driver, tenant_ids=tenant_ids)
+
+        from app.hoc.cus.analytics.L6_drivers.cost_snapshots_driver import (
+            get_cost_snapshots_driver,
+        )
+        from app.hoc.cus.hoc_spine.orchestrator.operation_registry import (
+            get_async_session_context,
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency or snapshot_job_concurrency())
+
+        async def _run_tenant(tenant_id: str) -> Dict[str, list]:
+            async with semaphore:
+                try:
+                    async with get_async_session_context() as session:
+                        outcome = await job(
+                            driver=get_cost_snapshots_driver(session),
+                            tenant_ids=[tenant_id],
+                        )
+                        await session.commit()
+                        return outcome
+                except Exception as e:
+                    logger.error(
+                        "snapshot_job_tenant_failed",
+                        extra={"tenant_id": tenant_id, "error": str(e)},
+                    )
+                    return {"failed": [{"tenant_id": tenant_id, "error": str(e)}]}
+
+        # Merge per-tenant results in tenant order
+        merged: Dict[str, list] = {key: [] for key in keys}
+        for outcome in await asyncio.gather(*(_run_tenant(t) for t in tenant_ids)):
+            for key, items in outcome.items():
+                merged.setdefault(key, []).extend(items)
+        return merged
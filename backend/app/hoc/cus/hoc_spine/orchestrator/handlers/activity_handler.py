@@ -82,6 +82,7 @@ class ActivityQueryHandler:
 
     async def execute(self, ctx: OperationContext) -> OperationResult:
         from app.hoc.cus.activity.L5_engines.activity_facade import get_activity_facade
+        from app.hoc.cus.activity.L5_engines.run_cursor import InvalidCursorError
 
         method_name = ctx.params.get("method")
         if not method_name:
@@ -119,7 +120,10 @@ class ActivityQueryHandler:
             k: v for k, v in ctx.params.items()
             if k != "method" and not k.startswith("_")
         }
-        data = await method(session=ctx.session, tenant_id=ctx.tenant_id, **kwargs)
+        try:
+            data = await method(session=ctx.session, tenant_id=ctx.tenant_id, **kwargs)
+        except InvalidCursorError as e:
+            return OperationResult.fail(str(e), "INVALID_CURSOR")
         return OperationResult.ok(data)
 
 
@@ -172,9 +176,15 @@ class ActivitySignalFeedbackHandler:
 
     Wraps SignalFeedbackService methods:
       - get_bulk_feedback → get_bulk_signal_feedback(tenant_id, signal_ids)
+
+    Committed acknowledge/suppress/reopen feedback is applied to this
+    process's attention queue (attention_ranking.py).
     """
 
     async def execute(self, ctx: OperationContext) -> OperationResult:
+        from app.hoc.cus.activity.L5_engines.attention_ranking import (
+            get_attention_engine,
+        )
         from app.hoc.cus.activity.L5_engines.signal_feedback_engine import (
             SignalFeedbackService,
         )
@@ -204,6 +214,8 @@ class ActivitySignalFeedbackHandler:
                     acknowledged_by=ctx.params.get("acknowledged_by"),
                     as_of=ctx.params.get("as_of"),
                 )
+            # Committed: update this process's attention queue
+            get_attention_engine().apply_feedback(ctx.tenant_id, result.signal_id, "ACKNOWLEDGED")
             _emit_feedback_event(
                 "activity.SignalAcknowledged",
                 ctx.tenant_id,
@@ -233,6 +245,9 @@ class ActivitySignalFeedbackHandler:
                     target_set_hash=ctx.params.get("target_set_hash"),
                     target_count=ctx.params.get("target_count"),
                 )
+            get_attention_engine().apply_feedback(
+                ctx.tenant_id, result.signal_id, "SUPPRESSED", result.suppressed_until
+            )
             event_extra = {
                 "feedback_state": "SUPPRESSED",
                 "as_of": ctx.params.get("as_of"),
@@ -268,6 +283,7 @@ class ActivitySignalFeedbackHandler:
                     reopened_by=ctx.params.get("reopened_by"),
                     as_of=ctx.params.get("as_of"),
                 )
+            get_attention_engine().apply_feedback(ctx.tenant_id, signal_fp, "REOPENED")
             _emit_feedback_event(
                 "activity.SignalReopened",
                 ctx.tenant_id,
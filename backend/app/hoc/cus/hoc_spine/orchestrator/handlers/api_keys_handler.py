@@ -117,6 +117,10 @@ class ApiKeysWriteHandler:
                 )
                 # L4 transaction boundary: commit after write
                 sync_session.commit()
+                # Stop serving the key from validated-key caches
+                from app.auth.api_key_engine import get_api_key_engine
+
+                await get_api_key_engine().invalidate_key(ctx.params["key_id"])
                 return OperationResult.ok(api_key)
 
             elif method_name == "list_api_keys":
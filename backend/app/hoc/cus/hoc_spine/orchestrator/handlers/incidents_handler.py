@@ -197,6 +197,11 @@ class IncidentsWriteHandler:
         with ctx.session.begin():
             data = method(**kwargs)
 
+        # Committed: drop cached guard status/incident pages for the tenant
+        from app.utils.guard_cache import get_guard_cache
+
+        await get_guard_cache().invalidate_tenant(ctx.tenant_id)
+
         # Emit incident lifecycle events (UC-MON-05)
         incident_id = str(kwargs.get("incident", {}).id) if hasattr(kwargs.get("incident"), "id") else kwargs.get("incident_id", "unknown")
         actor_id = kwargs.get("acknowledged_by") or kwargs.get("resolved_by") or kwargs.get("closed_by", "system")
@@ -21,6 +21,7 @@ From integrations/L5_notifications/engines/channel_engine.py:
 - get_channel_config()        → channel config read
 - check_channel_health()      → health check
 - send_notification()         → notification dispatch
+- enqueue_notification()      → outbox write in the caller's transaction
 
 From integrations/L6_drivers/worker_registry_driver.py:
 - get_worker_registry_service() → already wired via IntegrationsWorkersHandler
@@ -43,6 +44,11 @@ Flow:
     → IntegrationBootstrapHandler.send_notification(...)
         → send_notification(tenant_id, event_type, payload)
 
+  Coordinator inside a transaction
+    → IntegrationBootstrapHandler.enqueue_notification(session, ...)
+        → enqueue_notification(session, tenant_id, event_type, payload)
+        (delivered by NotifyOutboxWorker after the caller commits)
+
   Ops dashboard
     → IntegrationBootstrapHandler.check_health(tenant_id)
         → check_channel_health(tenant_id)
@@ -126,6 +132,38 @@ class IntegrationBootstrapHandler:
 
         return results
 
+    async def enqueue_notification(
+        self,
+        session: Any,
+        tenant_id: str,
+        event_type: Any,
+        payload: Dict[str, Any],
+        channels: Optional[List[Any]] = None,
+    ) -> int:
+        """Write a notification to the outbox in the caller's transaction.
+
+        Args:
+            session: Caller's AsyncSession (caller commits)
+            tenant_id: Tenant identifier
+            event_type: NotifyEventType enum value
+            payload: Notification payload
+            channels: Optional specific channels to use
+
+        Returns:
+            Number of outbox rows written (one per target channel)
+        """
+        from app.hoc.cus.integrations.L5_notifications.engines.channel_engine import (
+            enqueue_notification,
+        )
+
+        return await enqueue_notification(
+            session=session,
+            tenant_id=tenant_id,
+            event_type=event_type,
+            payload=payload,
+            channels=channels,
+        )
+
     async def check_health(
         self,
         tenant_id: str,
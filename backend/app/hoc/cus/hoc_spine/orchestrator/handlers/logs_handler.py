@@ -20,8 +20,13 @@ Registers six operations:
   - logs.evidence → EvidenceFacade (8 async endpoints)
   - logs.certificate → CertificateService (4 sync endpoints)
   - logs.replay → ReplayValidator + ReplayContextBuilder (2 sync) + ReplayCoordinator (2 async, PIN-520)
-  - logs.evidence_report → generate_evidence_report (1 sync function)
-  - logs.pdf → PDFRenderer (3 sync endpoints, cross-domain: incidents L2 → logs L5)
+  - logs.evidence_report → ReportRenderPipeline.render_incident_report (1 async endpoint)
+  - logs.pdf → ReportRenderPipeline.render_bundle (3 async endpoints, cross-domain: incidents L2 → logs)
+
+Both PDF operations render off the event loop through the shared
+ReportRenderPipeline and return a RenderedReport (stream it with
+StreamingResponse(report.stream())). A full render queue fails with
+RENDER_QUEUE_FULL, which endpoints map to 503.
 """
 
 from app.hoc.cus.hoc_spine.orchestrator.operation_registry import (
@@ -268,62 +273,65 @@ class LogsEvidenceReportHandler:
     """
     Handler for logs.evidence_report operations.
 
-    Dispatches to generate_evidence_report() function.
-    Sync — returns PDF bytes.
+    Builds IncidentEvidence and renders it through the report render
+    pipeline. Returns a RenderedReport.
     """
 
     async def execute(self, ctx: OperationContext) -> OperationResult:
         from app.hoc.cus.logs.L5_engines.evidence_report import (
-            generate_evidence_report,
+            RenderQueueFullError,
+            build_incident_evidence,
+            get_report_render_pipeline,
         )
 
         kwargs = {
             k: v for k, v in ctx.params.items()
             if k != "method" and not k.startswith("_")
         }
-        data = generate_evidence_report(**kwargs)
-        return OperationResult.ok(data)
+        is_demo = kwargs.pop("is_demo", True)
+        evidence = build_incident_evidence(**kwargs)
+        try:
+            report = await get_report_render_pipeline().render_incident_report(evidence, is_demo=is_demo)
+        except RenderQueueFullError as e:
+            return OperationResult.fail(str(e), "RENDER_QUEUE_FULL")
+        return OperationResult.ok(report)
 
 
 class LogsPdfHandler:
     """
     Handler for logs.pdf operations.
 
-    Dispatches to PDFRenderer methods (render_evidence_pdf,
-    render_soc2_pdf, render_executive_debrief_pdf).
-    Sync — returns PDF bytes.
+    Renders export bundles through the report render pipeline with the
+    PDFRenderer method named in params (render_evidence_pdf,
+    render_soc2_pdf, render_executive_debrief_pdf). Returns a
+    RenderedReport.
 
     Note: This is a cross-domain operation — incidents L2 → logs L5.
     The L4 registry is the correct mediator for cross-domain calls.
     """
 
     async def execute(self, ctx: OperationContext) -> OperationResult:
-        from app.hoc.cus.logs.L5_engines.pdf_renderer import get_pdf_renderer
+        from app.hoc.cus.logs.L5_engines.evidence_report import (
+            RenderQueueFullError,
+            ReportRenderPipeline,
+            get_report_render_pipeline,
+        )
 
         method_name = ctx.params.get("method")
         if not method_name:
             return OperationResult.fail(
                 "Missing 'method' in params", "MISSING_METHOD"
             )
-
-        renderer = get_pdf_renderer()
-        dispatch = {
-            "render_evidence_pdf": renderer.render_evidence_pdf,
-            "render_soc2_pdf": renderer.render_soc2_pdf,
-            "render_executive_debrief_pdf": renderer.render_executive_debrief_pdf,
-        }
-        method = dispatch.get(method_name)
-        if method is None:
+        if method_name not in ReportRenderPipeline.BUNDLE_RENDER_METHODS:
             return OperationResult.fail(
                 f"Unknown renderer method: {method_name}", "UNKNOWN_METHOD"
             )
 
-        kwargs = {
-            k: v for k, v in ctx.params.items()
-            if k != "method" and not k.startswith("_")
-        }
-        data = method(**kwargs)
-        return OperationResult.ok(data)
+        try:
+            report = await get_report_render_pipeline().render_bundle(method_name, ctx.params["bundle"])
+        except RenderQueueFullError as e:
+            return OperationResult.fail(str(e), "RENDER_QUEUE_FULL")
+        return OperationResult.ok(report)
 
 
 class LogsCaptureHandler:
@@ -15,7 +15,7 @@
 # Allowed Imports: hoc_spine (authority, services, schemas)
 # Forbidden Imports: L1, L2, L5, L6, sqlalchemy (except types)
 # Reference: PIN-491 (L2-L4-L5 Construction Plan), L2-L4-L5_CONSTRUCTION_PLAN.md
-# Tests: backend/app/hoc/cus/hoc_spine/tests/test_operation_registry.py (16 invariants: REG-001–REG-008)
+# Tests: backend/app/hoc/cus/hoc_spine/tests/test_operation_registry.py (REG-001–REG-010)
 # Literature: literature/hoc_spine/orchestrator/operation_registry.md
 # artifact_class: CODE
 
@@ -38,6 +38,16 @@ What the registry does NOT do:
     - Execute business logic (that stays in L5)
     - Make decisions (authority is checked, not created here)
 
+Dispatch plans:
+    freeze() compiles one plan per operation (handler, context enricher,
+    invariant ids, invariant mode, shadow-compare flag) and pre-resolves the
+    authority probe and audit sink, so execute() is a plan lookup followed by
+    straight-line dispatch. Authority state itself (kill switch, degraded
+    mode) is still read on every call. Before freeze() plans are compiled
+    per call, so tests and startup see registration changes immediately.
+    Per-phase timings of every DISPATCH_PHASE_SAMPLE_EVERY-th dispatch go to
+    the hoc_operation_dispatch_phase_seconds histogram.
+
 Transaction ownership (PIN-520, TRANSACTION_COORDINATION_RATIONALE.md):
     - L4 handlers OWN transaction boundaries (commit/rollback)
     - L5 engines may call session.add(), session.flush()
@@ -61,6 +71,24 @@ Usage:
         raise HTTPException(status_code=500, detail=result.error)
     return result.data
 
+Batched reads (one console page, many small queries):
+    batch = await registry.execute_many(
+        [
+            BatchOperation("overview.query", {"method": "get_highlights"}),
+            BatchOperation("incidents.query", {"method": "list_active_incidents", "limit": 10}),
+        ],
+        tenant_id=tenant_id,
+        session=session,
+        session_factory=get_read_session_factory(),
+        lanes=4,
+    )
+    for result in batch.results:  # same order as the request
+        ...
+
+    Operations run concurrently over up to `lanes` read-only sessions that
+    share one REPEATABLE READ snapshot on Postgres. Authority is checked
+    once per batch; every operation is still audited on its own.
+
 Handler registration:
     # In hoc_spine/orchestrator/handlers/{domain}_handler.py
     from app.hoc.cus.hoc_spine.orchestrator.operation_registry import (
@@ -81,17 +109,34 @@ Handler registration:
     registry.register("overview.query", OverviewQueryHandler())
 """
 
+import asyncio
+import itertools
 import logging
+import os
+import re
 import time
 from dataclasses import dataclass, field
-from contextlib import asynccontextmanager
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Generator, Optional, Protocol, runtime_checkable
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncContextManager,
+    AsyncGenerator,
+    Callable,
+    Generator,
+    NamedTuple,
+    Optional,
+    Protocol,
+    Sequence,
+    runtime_checkable,
+)
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 if TYPE_CHECKING:
     from app.hoc.cus.hoc_spine.schemas.authority_decision import AuthorityDecision
 
+from app.hoc.cus.hoc_spine.services.metrics_helpers import get_or_create_histogram
 from app.hoc.cus.hoc_spine.services.time import utc_now
 
 logger = logging.getLogger("nova.hoc_spine.orchestrator.operation_registry")
@@ -99,6 +144,36 @@ logger = logging.getLogger("nova.hoc_spine.orchestrator.operation_registry")
 # Registry version — bump on structural changes
 REGISTRY_VERSION = "1.0.0"
 
+# Operations of one execute_many() batch in flight at once
+BATCH_MAX_CONCURRENCY = 16
+
+# Dispatch phases timed on every call; registry_overhead is total minus handler
+DISPATCH_PHASES = (
+    "authority",
+    "prepare",
+    "invariants_pre",
+    "handler",
+    "invariants_post",
+    "shadow_compare",
+    "audit",
+    "registry_overhead",
+)
+
+DISPATCH_PHASE_SECONDS = get_or_create_histogram(
+    "hoc_operation_dispatch_phase_seconds",
+    "OperationRegistry dispatch time per phase (registry_overhead = total minus handler)",
+    ["phase"],
+    buckets=[0.000005, 0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.01, 0.05, 0.25, 1.0, 5.0],
+)
+# Label children bound once: observe() is the only per-call metrics cost
+_PHASE_SECONDS = {phase: DISPATCH_PHASE_SECONDS.labels(phase=phase) for phase in DISPATCH_PHASES}
+
+# An observe() costs about as much as a whole compiled dispatch phase, so
+# every Nth dispatch is timed (all phases of it together). Dispatch counts
+# come from the dispatch metrics adapter, not from these histograms.
+DISPATCH_PHASE_SAMPLE_EVERY = max(1, int(os.getenv("HOC_DISPATCH_PHASE_SAMPLE_EVERY", "16")))
+_phase_tick = itertools.count()
+
 
 # =============================================================================
 # DATA CONTRACTS
@@ -158,6 +233,162 @@ class OperationResult:
         return OperationResult(success=False, error=error, error_code=error_code)
 
 
+@dataclass(frozen=True)
+class BatchOperation:
+    """One entry of an execute_many() batch."""
+
+    operation: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of execute_many().
+
+    results[i] belongs to operations[i]; each carries its own success,
+    data/error and duration_ms. A failing operation never fails the batch.
+    """
+
+    results: list[OperationResult]
+    duration_ms: float = 0.0
+    lanes: int = 0
+    snapshot_restarts: int = 0
+
+    @property
+    def succeeded(self) -> int:
+        return sum(1 for r in self.results if r.success)
+
+    @property
+    def failed(self) -> int:
+        return len(self.results) - self.succeeded
+
+
+class BatchReadOnlyError(RuntimeError):
+    """An operation in an execute_many() batch tried to write."""
+
+
+@dataclass(frozen=True)
+class _DispatchPlan:
+    """Everything dispatch needs for one operation, resolved ahead of the call."""
+
+    operation: str
+    handler: "OperationHandler"
+    enricher: Optional[Callable[[OperationContext], dict[str, Any]]]
+    invariant_ids: Optional[tuple[str, ...]]  # None: resolve at evaluation time
+    invariant_mode: object | None
+    shadow_compare: bool
+
+
+class _AuthorityProbe(NamedTuple):
+    """Runtime-switch readers and the three decisions they map to."""
+
+    is_governance_active: Callable[[], bool]
+    is_degraded_mode: Callable[[], bool]
+    active: "AuthorityDecision"
+    governance_disabled: "AuthorityDecision"
+    degraded: "AuthorityDecision"
+
+
+class _AuditSink(NamedTuple):
+    build_dispatch_record: Callable[..., Any]
+    get_audit_store: Callable[[], Any]
+    get_consequence_pipeline: Callable[[], Any]
+
+
+class _SharedReadSession:
+    """
+    One read-only session lane of an execute_many() batch.
+
+    An AsyncSession cannot run statements concurrently, so the operations
+    assigned to a lane serialise their statements on a lock; everything
+    between them (facade logic, cache and HTTP calls) still overlaps. Writes
+    and transaction control are refused: the batch owns the transaction.
+
+    On Postgres the lane runs REPEATABLE READ, READ ONLY. The first lane
+    exports its snapshot and the others import it, so every operation of the
+    batch reads the same snapshot whichever lane it runs on.
+
+    A failed statement aborts a Postgres transaction for the whole lane, so
+    the lane rolls back and starts a fresh read-only transaction before the
+    error propagates (later statements on it see a newer snapshot).
+    """
+
+    _STATEMENTS = frozenset({"execute", "scalar", "scalars", "get", "refresh"})
+    _REFUSED = frozenset(
+        {"add", "add_all", "delete", "merge", "flush", "commit", "rollback", "begin", "begin_nested", "close"}
+    )
+    _SNAPSHOT_ID = re.compile(r"^[0-9A-Fa-f-]+$")
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        self._lock = asyncio.Lock()
+        self._postgres = False
+        self.owns_transaction = False
+        self.restarts = 0
+
+    async def begin(self, snapshot_id: Optional[str] = None) -> None:
+        """Open the lane's read-only transaction, importing *snapshot_id* if given."""
+        if self._session.in_transaction():
+            # Caller already started a transaction: share it as is
+            return
+        try:
+            self._postgres = self._session.get_bind().dialect.name == "postgresql"
+        except Exception:
+            self._postgres = False
+        if self._postgres:
+            await self._session.execute(sql_text("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY"))
+            if snapshot_id is not None:
+                if not self._SNAPSHOT_ID.match(snapshot_id):
+                    raise ValueError(f"Malformed snapshot id: {snapshot_id!r}")
+                # SET does not take bind parameters; the id is validated above
+                await self._session.execute(sql_text(f"SET TRANSACTION SNAPSHOT '{snapshot_id}'"))
+        self.owns_transaction = True
+
+    async def export_snapshot(self) -> Optional[str]:
+        """Export this lane's snapshot for other lanes (Postgres only, else None)."""
+        if not (self._postgres and self.owns_transaction):
+            return None
+        result = await self._session.execute(sql_text("SELECT pg_export_snapshot()"))
+        return result.scalar_one()
+
+    async def end(self) -> None:
+        """Close the transaction opened by begin() (nothing to keep)."""
+        if self.owns_transaction:
+            self.owns_transaction = False
+            await self._session.rollback()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._REFUSED:
+
+            def refused(*args: Any, **kwargs: Any) -> Any:
+                raise BatchReadOnlyError(f"session.{name}() is not allowed in a read-only operation batch")
+
+            return refused
+
+        attr = getattr(self._session, name)
+        if name not in self._STATEMENTS:
+            return attr
+
+        async def serialised(*args: Any, **kwargs: Any) -> Any:
+            async with self._lock:
+                try:
+                    return await attr(*args, **kwargs)
+                except Exception:
+                    if self.owns_transaction:
+                        await self._restart()
+                    raise
+
+        return serialised
+
+    async def _restart(self) -> None:
+        self.restarts += 1
+        logger.warning("operation_batch.snapshot_restarted", extra={"restarts": self.restarts})
+        self.owns_transaction = False
+        await self._session.rollback()
+        await self.begin()
+
+
 # =============================================================================
 # HANDLER PROTOCOL
 # =============================================================================
@@ -220,6 +451,10 @@ class OperationRegistry:
         self._invariant_mode: object | None = None  # InvariantMode, set via set_invariant_mode()
         self._shadow_compare_enabled: bool = False   # BA-N6-03: shadow compare feature flag
         self._context_enrichers: dict[str, Any] = {}  # Pre-invariant context enrichers
+        # Compiled by freeze(); empty (compiled per call) until then
+        self._plans: dict[str, _DispatchPlan] = {}
+        self._authority_probe: Optional[_AuthorityProbe] = None
+        self._audit_sink: Optional[_AuditSink] = None
 
     # =========================================================================
     # Registration
@@ -277,20 +512,48 @@ class OperationRegistry:
                       Must be sync. Must not raise — return {} on failure.
         """
         self._context_enrichers[operation] = enricher
+        if self._frozen:
+            self._compile_plans()
 
     def freeze(self) -> None:
         """
         Freeze the registry. No further registrations allowed.
 
         Call this after all handlers are registered (e.g., at startup).
-        Prevents accidental runtime registration.
+        Prevents accidental runtime registration, and compiles the dispatch
+        plans: the handler set is final from here on.
         """
         self._frozen = True
+        self._compile_plans()
+        self._authority_probe = self._resolve_authority_probe()
+        self._audit_sink = self._resolve_audit_sink()
         logger.info(
             "registry.frozen",
             extra={"operation_count": len(self._handlers)},
         )
 
+    def _compile_plan(self, operation: str) -> Optional[_DispatchPlan]:
+        handler = self._handlers.get(operation)
+        if handler is None:
+            return None
+        return _DispatchPlan(
+            operation=operation,
+            handler=handler,
+            enricher=self._context_enrichers.get(operation),
+            invariant_ids=self._resolve_invariant_ids(operation),
+            invariant_mode=self._invariant_mode,
+            shadow_compare=self._shadow_compare_enabled,
+        )
+
+    def _compile_plans(self) -> None:
+        """(Re)build every plan; called by freeze() and by setters after it."""
+        self._plans = {operation: self._compile_plan(operation) for operation in self._handlers}
+
+    def _plan(self, operation: str) -> Optional[_DispatchPlan]:
+        if self._frozen:
+            return self._plans.get(operation)
+        return self._compile_plan(operation)
+
     # =========================================================================
     # Invariant Mode Configuration (BA-N6-02)
     # =========================================================================
@@ -307,6 +570,8 @@ class OperationRegistry:
         Default remains MONITOR unless explicitly configured.
         """
         self._invariant_mode = mode
+        if self._frozen:
+            self._compile_plans()
         logger.info(
             "invariant_mode.configured",
             extra={"mode": str(mode)},
@@ -315,6 +580,8 @@ class OperationRegistry:
     def set_shadow_compare_enabled(self, enabled: bool) -> None:
         """Enable or disable shadow compare (BA-N6-03)."""
         self._shadow_compare_enabled = enabled
+        if self._frozen:
+            self._compile_plans()
 
     # =========================================================================
     # Dispatch
@@ -335,14 +602,166 @@ class OperationRegistry:
         Returns:
             OperationResult with success/failure and data/error
         """
-        start = time.monotonic()
+        start = time.perf_counter()
 
         # --- Pre-dispatch: authority check (ITER3.4 — unified AuthorityDecision) ---
         authority_decision = self._check_authority(operation)
 
-        # --- Lookup handler ---
-        handler = self._handlers.get(operation)
-        if handler is None:
+        return await self._dispatch(
+            operation,
+            ctx,
+            authority_decision,
+            start=start,
+            timestamp=utc_now().isoformat(),
+            authority_s=time.perf_counter() - start,
+        )
+
+    async def execute_many(
+        self,
+        operations: Sequence[BatchOperation],
+        tenant_id: str,
+        session: Optional[AsyncSession] = None,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+        session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]] = None,
+        lanes: int = 1,
+    ) -> BatchResult:
+        """
+        Dispatch independent read operations for one tenant concurrently.
+
+        Compared with calling execute() once per operation:
+          - authority and the dispatch timestamp are resolved once
+          - all operations read inside one read-only transaction snapshot
+
+        *session* is the first lane. With a *session_factory* and lanes > 1,
+        up to lanes - 1 more sessions are opened that import its snapshot
+        (Postgres only; elsewhere the batch stays on *session*), and the
+        operations are spread across them so their statements can run in
+        parallel instead of queueing on one connection.
+
+        Every operation is still enriched, dispatched and audited on its own,
+        and gets its own OperationResult (with duration_ms) in request order.
+        Handler errors, unknown operations and write attempts fail only that
+        operation.
+
+        Args:
+            operations: Operations to run; order is preserved in the results
+            tenant_id: Tenant all operations run for
+            session: Shared AsyncSession, or None for self-contained handlers
+            max_concurrency: Operations in flight at once
+            session_factory: Opens an extra session lane (async context manager)
+            lanes: Maximum number of sessions the batch reads through
+        """
+        start = time.perf_counter()
+        authority_decision = self._check_authority("execute_many")
+        timestamp = utc_now().isoformat()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async with AsyncExitStack() as stack:
+            read_lanes: list[Optional[_SharedReadSession]] = [None]
+            if session is not None:
+                read_lanes = await self._open_read_lanes(stack, session, session_factory, min(lanes, len(operations)))
+
+            async def run_one(index: int, op: BatchOperation) -> OperationResult:
+                async with semaphore:
+                    op_start = time.perf_counter()
+                    ctx = OperationContext(
+                        session=read_lanes[index % len(read_lanes)],
+                        tenant_id=tenant_id,
+                        params=dict(op.params),
+                    )
+                    try:
+                        result = await self._dispatch(
+                            op.operation,
+                            ctx,
+                            authority_decision,
+                            start=op_start,
+                            timestamp=timestamp,
+                        )
+                    except Exception as exc:
+                        # Invariant violations (ENFORCE/STRICT) fail the operation, not the batch
+                        result = OperationResult.fail(
+                            error=str(exc), error_code=f"DISPATCH_EXCEPTION:{type(exc).__name__}"
+                        )
+                        result.duration_ms = (time.perf_counter() - op_start) * 1000
+                    # Results are matched to requests by position and by name
+                    result.operation = result.operation or op.operation
+                    return result
+
+            results = list(await asyncio.gather(*(run_one(i, op) for i, op in enumerate(operations))))
+
+        batch = BatchResult(
+            results=results,
+            duration_ms=(time.perf_counter() - start) * 1000,
+            lanes=len(read_lanes) if session is not None else 0,
+            snapshot_restarts=sum(lane.restarts for lane in read_lanes if lane is not None),
+        )
+        logger.info(
+            "operation_batch.dispatched",
+            extra={
+                "tenant_id": tenant_id,
+                "operations": len(results),
+                "failed": batch.failed,
+                "lanes": batch.lanes,
+                "duration_ms": round(batch.duration_ms, 2),
+                "snapshot_restarts": batch.snapshot_restarts,
+            },
+        )
+        return batch
+
+    @staticmethod
+    async def _open_read_lanes(
+        stack: AsyncExitStack,
+        session: AsyncSession,
+        session_factory: Optional[Callable[[], AsyncContextManager[AsyncSession]]],
+        lanes: int,
+    ) -> list[_SharedReadSession]:
+        """Open the batch's read lanes; all are closed when *stack* unwinds."""
+        leader = _SharedReadSession(session)
+        await leader.begin()
+        stack.push_async_callback(leader.end)
+
+        snapshot_id = None
+        if session_factory is not None and lanes > 1:
+            snapshot_id = await leader.export_snapshot()
+        if snapshot_id is None:
+            # Nothing to share a snapshot with: every operation reads through the leader
+            return [leader]
+
+        async def open_lane() -> _SharedReadSession:
+            lane = _SharedReadSession(await stack.enter_async_context(session_factory()))
+            stack.push_async_callback(lane.end)
+            await lane.begin(snapshot_id)
+            return lane
+
+        opened = await asyncio.gather(*(open_lane() for _ in range(lanes - 1)), return_exceptions=True)
+        followers = [lane for lane in opened if isinstance(lane, _SharedReadSession)]
+        if len(followers) < len(opened):
+            # Pool exhausted or import failed: run on the lanes we have
+            logger.warning(
+                "operation_batch.lanes_degraded",
+                extra={"requested": lanes, "opened": len(followers) + 1},
+            )
+        return [leader, *followers]
+
+    async def _dispatch(
+        self,
+        operation: str,
+        ctx: OperationContext,
+        authority_decision: "AuthorityDecision",
+        start: float,
+        timestamp: str,
+        authority_s: float = 0.0,
+    ) -> OperationResult:
+        """Dispatch one operation through its plan once authority has been checked.
+
+        *start* is when the dispatch began (perf_counter); *authority_s* is the
+        part of it spent on the authority check, for the phase histogram.
+        """
+        t0 = time.perf_counter()
+
+        # --- Lookup plan (handler, enricher, invariants, flags) ---
+        plan = self._plan(operation)
+        if plan is None:
             result = OperationResult.fail(
                 error=f"No handler registered for operation: {operation}",
                 error_code="UNKNOWN_OPERATION",
@@ -353,23 +772,21 @@ class OperationRegistry:
         # --- Build enriched context ---
         # Inject invariant mode for handler-level sub-operation evaluation
         enriched_params = {**ctx.params}
-        _inv_mode = getattr(self, "_invariant_mode", None)
-        if _inv_mode is not None:
-            enriched_params["_invariant_mode"] = _inv_mode
+        if plan.invariant_mode is not None:
+            enriched_params["_invariant_mode"] = plan.invariant_mode
 
         enriched_ctx = OperationContext(
             session=ctx.session,
             tenant_id=ctx.tenant_id,
             params=enriched_params,
             operation=operation,
-            timestamp=utc_now().isoformat(),
+            timestamp=timestamp,
         )
 
         # --- Pre-dispatch: context enrichment for invariant evaluation ---
-        enricher = self._context_enrichers.get(operation)
-        if enricher is not None:
+        if plan.enricher is not None:
             try:
-                extra = enricher(enriched_ctx)
+                extra = plan.enricher(enriched_ctx)
                 if extra:
                     enriched_ctx = OperationContext(
                         session=enriched_ctx.session,
@@ -384,13 +801,16 @@ class OperationRegistry:
                     extra={"operation": operation},
                     exc_info=True,
                 )
+        t1 = time.perf_counter()
 
         # --- Pre-dispatch: invariant preconditions (BA-04) ---
         self._evaluate_invariants_safe(
-            operation, enriched_ctx, phase="pre"
+            operation, enriched_ctx, phase="pre", invariant_ids=plan.invariant_ids
         )
+        t2 = time.perf_counter()
 
         # --- Execute handler ---
+        handler = plan.handler
         try:
             result = await handler.execute(enriched_ctx)
         except Exception as exc:
@@ -408,20 +828,35 @@ class OperationRegistry:
                 error=str(exc),
                 error_code=f"HANDLER_EXCEPTION:{type(exc).__name__}",
             )
+        t3 = time.perf_counter()
 
         # --- Post-dispatch: invariant postconditions (BA-04) ---
         self._evaluate_invariants_safe(
-            operation, enriched_ctx, phase="post"
+            operation, enriched_ctx, phase="post", invariant_ids=plan.invariant_ids
         )
+        t4 = time.perf_counter()
 
         # --- Post-dispatch: shadow compare (BA-N6-03) ---
-        self._shadow_compare_safe(operation, enriched_ctx, result)
+        if plan.shadow_compare:
+            self._shadow_compare_safe(operation, enriched_ctx, result)
+        t5 = time.perf_counter()
 
         # --- Post-dispatch: audit ---
-        duration_ms = (time.monotonic() - start) * 1000
+        duration_ms = (t5 - start) * 1000
         result.operation = operation
         result.duration_ms = duration_ms
         self._audit_dispatch(operation, ctx, result, duration_ms, authority_decision)
+        t6 = time.perf_counter()
+
+        if next(_phase_tick) % DISPATCH_PHASE_SAMPLE_EVERY == 0:
+            _PHASE_SECONDS["authority"].observe(authority_s)
+            _PHASE_SECONDS["prepare"].observe(t1 - t0)
+            _PHASE_SECONDS["invariants_pre"].observe(t2 - t1)
+            _PHASE_SECONDS["handler"].observe(t3 - t2)
+            _PHASE_SECONDS["invariants_post"].observe(t4 - t3)
+            _PHASE_SECONDS["shadow_compare"].observe(t5 - t4)
+            _PHASE_SECONDS["audit"].observe(t6 - t5)
+            _PHASE_SECONDS["registry_overhead"].observe((t6 - start) - (t3 - t2))
 
         return result
 
@@ -429,11 +864,25 @@ class OperationRegistry:
     # Invariant Evaluation (BA-04)
     # =========================================================================
 
+    @staticmethod
+    def _resolve_invariant_ids(operation: str) -> Optional[tuple[str, ...]]:
+        """IDs of the invariants guarding *operation*; None if they cannot be resolved."""
+        try:
+            from app.hoc.cus.hoc_spine.authority.business_invariants import (
+                invariant_ids_for_operation,
+            )
+
+            return invariant_ids_for_operation(operation)
+        except Exception:
+            logger.debug("invariant_ids.unresolved", extra={"operation": operation}, exc_info=True)
+            return None
+
     def _evaluate_invariants_safe(
         self,
         operation: str,
         ctx: OperationContext,
         phase: str,
+        invariant_ids: Optional[tuple[str, ...]] = None,
     ) -> None:
         """
         Evaluate business invariants for *operation* using the configured mode.
@@ -446,7 +895,12 @@ class OperationRegistry:
 
         BA-04: Wired into execute() path for all dispatched operations.
         BA-N6-02: Mode is configurable via set_invariant_mode().
+
+        *invariant_ids* comes from the dispatch plan; an empty tuple means no
+        invariant guards the operation and evaluation is skipped.
         """
+        if invariant_ids is not None and not invariant_ids:
+            return
         try:
             from app.hoc.cus.hoc_spine.authority.invariant_evaluator import (
                 InvariantMode,
@@ -467,7 +921,7 @@ class OperationRegistry:
             # Phase is logged for audit trail but does not alter the operation
             # name — invariants are registered under base names like
             # "project.create", not "project.create:pre".
-            evaluate_invariants(operation, invariant_context, mode)
+            evaluate_invariants(operation, invariant_context, mode, invariant_ids)
 
         except Exception:
             # In MONITOR mode, swallow all exceptions.
@@ -569,44 +1023,32 @@ class OperationRegistry:
 
         ITER3.4: Returns AuthorityDecision for uniform authority handling
         across all L4 checks. The decision is included in audit logs.
-        """
-        from app.hoc.cus.hoc_spine.schemas.authority_decision import AuthorityDecision
 
+        The switch readers and the decisions are resolved once by freeze();
+        the switch state itself is read on every call.
+        """
         try:
-            from app.hoc.cus.hoc_spine.authority.runtime_switch import (
-                is_degraded_mode,
-                is_governance_active,
-            )
+            probe = self._authority_probe or self._resolve_authority_probe()
 
-            active = is_governance_active()
-            degraded = is_degraded_mode()
-
-            if not active:
+            if not probe.is_governance_active():
                 logger.warning(
                     "operation.governance_disabled",
                     extra={"operation": operation},
                 )
-                return AuthorityDecision.allow_with_degraded_flag(
-                    reason="Governance kill-switch active",
-                    conditions=("governance_disabled",),
-                )
+                return probe.governance_disabled
 
-            if degraded:
+            if probe.is_degraded_mode():
                 logger.warning(
                     "operation.degraded_mode",
                     extra={"operation": operation},
                 )
-                return AuthorityDecision.allow_with_degraded_flag(
-                    reason="System in degraded mode",
-                    conditions=("degraded_mode",),
-                )
+                return probe.degraded
 
-            return AuthorityDecision.allow(
-                reason="Governance active",
-                conditions=("governance_active",),
-            )
+            return probe.active
 
         except Exception as exc:
+            from app.hoc.cus.hoc_spine.schemas.authority_decision import AuthorityDecision
+
             # Authority check failure must not block operations
             logger.error(
                 "operation.authority_check_failed",
@@ -617,6 +1059,31 @@ class OperationRegistry:
                 conditions=("authority_check_error",),
             )
 
+    @staticmethod
+    def _resolve_authority_probe() -> _AuthorityProbe:
+        from app.hoc.cus.hoc_spine.authority.runtime_switch import (
+            is_degraded_mode,
+            is_governance_active,
+        )
+        from app.hoc.cus.hoc_spine.schemas.authority_decision import AuthorityDecision
+
+        return _AuthorityProbe(
+            is_governance_active=is_governance_active,
+            is_degraded_mode=is_degraded_mode,
+            active=AuthorityDecision.allow(
+                reason="Governance active",
+                conditions=("governance_active",),
+            ),
+            governance_disabled=AuthorityDecision.allow_with_degraded_flag(
+                reason="Governance kill-switch active",
+                conditions=("governance_disabled",),
+            ),
+            degraded=AuthorityDecision.allow_with_degraded_flag(
+                reason="System in degraded mode",
+                conditions=("degraded_mode",),
+            ),
+        )
+
     # =========================================================================
     # Audit
     # =========================================================================
@@ -671,12 +1138,8 @@ class OperationRegistry:
         # Phase A.6 (G4): Persist dispatch record to AuditStore
         # Post-commit only — never participates in the operation's transaction
         try:
-            from app.hoc.cus.hoc_spine.services.dispatch_audit import (
-                build_dispatch_record,
-            )
-            from app.hoc.cus.hoc_spine.services.audit_store import get_audit_store
-
-            record = build_dispatch_record(
+            sink = self._audit_sink or self._resolve_audit_sink()
+            record = sink.build_dispatch_record(
                 operation=operation,
                 tenant_id=ctx.tenant_id,
                 success=result.success,
@@ -688,17 +1151,22 @@ class OperationRegistry:
                 error=result.error,
                 error_code=result.error_code,
             )
-            get_audit_store().record_dispatch(record)
+            sink.get_audit_store().record_dispatch(record)
 
             # Consequences pipeline: run post-dispatch adapters
-            from app.hoc.cus.hoc_spine.consequences.pipeline import (
-                get_consequence_pipeline,
-            )
-            get_consequence_pipeline().run(record)
+            sink.get_consequence_pipeline().run(record)
         except Exception:
             # Non-blocking: audit persistence and consequences must never break dispatch
             logger.debug("audit_store.dispatch_record_failed", exc_info=True)
 
+    @staticmethod
+    def _resolve_audit_sink() -> _AuditSink:
+        from app.hoc.cus.hoc_spine.consequences.pipeline import get_consequence_pipeline
+        from app.hoc.cus.hoc_spine.services.audit_store import get_audit_store
+        from app.hoc.cus.hoc_spine.services.dispatch_audit import build_dispatch_record
+
+        return _AuditSink(build_dispatch_record, get_audit_store, get_consequence_pipeline)
+
     # =========================================================================
     # Introspection
     # =========================================================================
@@ -763,6 +1231,20 @@ async def get_session_dep() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+def get_read_session_factory() -> Callable[[], AsyncContextManager[AsyncSession]]:
+    """
+    L4-provided session factory for the extra read lanes of execute_many().
+
+    L2 batch endpoints pass it through without touching app.db:
+
+        await registry.execute_many(ops, tenant_id, session=session,
+                                    session_factory=get_read_session_factory(), lanes=4)
+    """
+    from app.db import get_async_session_factory
+
+    return get_async_session_factory()
+
+
 def get_sync_session_dep() -> Generator:
     """
     L4-provided SYNC session dependency for L2 endpoints that use
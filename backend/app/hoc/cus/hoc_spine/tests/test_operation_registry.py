@@ -38,9 +38,13 @@ Invariants tested:
 - REG-006: Introspection (operations list, count, has_operation)
 - REG-007: OperationResult.ok() and .fail() factory methods
 - REG-008: Registry status reports correct data
+- REG-009: execute_many() preserves order, isolates failures, shares one read-only session
+- REG-010: freeze() compiles dispatch plans; runtime state is still read per call
 """
 
-from unittest.mock import MagicMock
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -61,7 +65,10 @@ _spec.loader.exec_module(_mod)
 OperationContext = _mod.OperationContext
 OperationResult = _mod.OperationResult
 OperationRegistry = _mod.OperationRegistry
+BatchOperation = _mod.BatchOperation
+BatchReadOnlyError = _mod.BatchReadOnlyError
 get_operation_registry = _mod.get_operation_registry
+DISPATCH_PHASE_SECONDS = _mod.DISPATCH_PHASE_SECONDS
 reset_operation_registry = _mod.reset_operation_registry
 
 
@@ -303,3 +310,305 @@ def test_invalid_handler_rejected(registry):
     """Handler without execute() method is rejected."""
     with pytest.raises(TypeError, match="OperationHandler protocol"):
         registry.register("bad.op", "not a handler")
+
+
+# =============================================================================
+# REG-009: execute_many()
+# =============================================================================
+
+
+class SessionProbeHandler:
+    """Test handler that runs one statement on ctx.session and sleeps off-DB."""
+
+    def __init__(self):
+        self.sessions = []
+
+    async def execute(self, ctx: OperationContext) -> OperationResult:
+        self.sessions.append(ctx.session)
+        await ctx.session.execute("SELECT 1")
+        await asyncio.sleep(0.01)
+        return OperationResult.ok({"method": ctx.params["method"]})
+
+
+class WritingStubHandler:
+    """Test handler that tries to write through the batch session."""
+
+    async def execute(self, ctx: OperationContext) -> OperationResult:
+        ctx.session.add(object())
+        return OperationResult.ok({})
+
+
+def _async_session(dialect="sqlite"):
+    """AsyncSession stand-in with no transaction in progress."""
+    session = MagicMock()
+    session.in_transaction.return_value = False
+    session.get_bind.return_value.dialect.name = dialect
+    result = MagicMock()
+    result.scalar_one.return_value = "00000003-0000001B-1"
+    session.execute = AsyncMock(return_value=result)
+    session.rollback = AsyncMock()
+    return session
+
+
+def _statements(session):
+    return [str(call.args[0]) for call in session.execute.await_args_list]
+
+
+@pytest.fixture
+def batch_session():
+    return _async_session()
+
+
+@pytest.mark.asyncio
+async def test_execute_many_preserves_order_and_isolates_failures(registry, batch_session):
+    """REG-009: One result per operation, in request order; failures stay local."""
+    registry.register("a.op", StubHandler(data={"a": 1}))
+    registry.register("bad.op", FailingStubHandler())
+
+    batch = await registry.execute_many(
+        [BatchOperation("a.op"), BatchOperation("bad.op"), BatchOperation("missing.op")],
+        tenant_id="tenant-001",
+        session=batch_session,
+    )
+
+    assert [r.operation for r in batch.results] == ["a.op", "bad.op", "missing.op"]
+    assert batch.results[0].success and batch.results[0].data == {"a": 1}
+    assert batch.results[1].error_code == "HANDLER_EXCEPTION:ValueError"
+    assert batch.results[2].error_code == "UNKNOWN_OPERATION"
+    assert (batch.succeeded, batch.failed) == (1, 2)
+    assert all(r.duration_ms >= 0 for r in batch.results)
+
+
+@pytest.mark.asyncio
+async def test_execute_many_shares_one_session_and_transaction(registry, batch_session):
+    """REG-009: All operations see the same session; the batch closes its transaction."""
+    handler = SessionProbeHandler()
+    registry.register("probe.op", handler)
+
+    ops = [BatchOperation("probe.op", {"method": f"m{i}"}) for i in range(5)]
+    batch = await registry.execute_many(ops, tenant_id="tenant-001", session=batch_session)
+
+    assert [r.data["method"] for r in batch.results] == [f"m{i}" for i in range(5)]
+    assert len({id(s) for s in handler.sessions}) == 1
+    assert batch_session.execute.await_count == 5
+    batch_session.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_many_runs_operations_concurrently(registry, batch_session):
+    """REG-009: Off-DB waits overlap across operations."""
+    registry.register("probe.op", SessionProbeHandler())
+
+    batch = await registry.execute_many(
+        [BatchOperation("probe.op", {"method": "m"})] * 8,
+        tenant_id="tenant-001",
+        session=batch_session,
+        max_concurrency=8,
+    )
+
+    assert batch.succeeded == 8
+    # 8 sequential sleeps would take >= 80ms
+    assert batch.duration_ms < 60
+
+
+@pytest.mark.asyncio
+async def test_execute_many_refuses_writes(registry, batch_session):
+    """REG-009: The shared session is read-only."""
+    registry.register("write.op", WritingStubHandler())
+
+    batch = await registry.execute_many(
+        [BatchOperation("write.op")], tenant_id="tenant-001", session=batch_session
+    )
+
+    assert batch.results[0].error_code == f"HANDLER_EXCEPTION:{BatchReadOnlyError.__name__}"
+    batch_session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_many_keeps_callers_transaction(registry, batch_session):
+    """REG-009: A transaction the caller already opened is shared, not ended."""
+    batch_session.in_transaction.return_value = True
+    registry.register("a.op", StubHandler())
+
+    await registry.execute_many([BatchOperation("a.op")], tenant_id="tenant-001", session=batch_session)
+
+    batch_session.rollback.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_execute_many_checks_authority_once(registry, monkeypatch):
+    """REG-009: Authority is resolved per batch, not per operation."""
+    registry.register("a.op", StubHandler())
+    calls = []
+    original = registry._check_authority
+
+    def counting(operation):
+        calls.append(operation)
+        return original(operation)
+
+    monkeypatch.setattr(registry, "_check_authority", counting)
+
+    await registry.execute_many([BatchOperation("a.op")] * 4, tenant_id="tenant-001")
+
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_many_spreads_over_snapshot_lanes(registry):
+    """REG-009: Extra lanes import the first lane's exported Postgres snapshot."""
+    leader = _async_session("postgresql")
+    followers = []
+
+    @asynccontextmanager
+    async def session_factory():
+        follower = _async_session("postgresql")
+        followers.append(follower)
+        yield follower
+
+    handler = SessionProbeHandler()
+    registry.register("probe.op", handler)
+
+    batch = await registry.execute_many(
+        [BatchOperation("probe.op", {"method": f"m{i}"}) for i in range(6)],
+        tenant_id="tenant-001",
+        session=leader,
+        session_factory=session_factory,
+        lanes=3,
+    )
+
+    assert batch.succeeded == 6 and batch.lanes == 3
+    assert len({id(s) for s in handler.sessions}) == 3
+    assert _statements(leader)[:2] == [
+        "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY",
+        "SELECT pg_export_snapshot()",
+    ]
+    for follower in followers:
+        assert _statements(follower)[:2] == [
+            "SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY",
+            "SET TRANSACTION SNAPSHOT '00000003-0000001B-1'",
+        ]
+        follower.rollback.assert_awaited_once()
+    leader.rollback.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_execute_many_without_snapshot_export_uses_one_lane(registry, batch_session):
+    """REG-009: Off Postgres no extra sessions are opened (no shared snapshot)."""
+    session_factory = MagicMock()
+    registry.register("probe.op", SessionProbeHandler())
+
+    batch = await registry.execute_many(
+        [BatchOperation("probe.op", {"method": "m"})] * 4,
+        tenant_id="tenant-001",
+        session=batch_session,
+        session_factory=session_factory,
+        lanes=4,
+    )
+
+    assert batch.lanes == 1
+    session_factory.assert_not_called()
+
+
+# =============================================================================
+# REG-010: Compiled dispatch plans
+# =============================================================================
+
+
+class ParamsProbeHandler:
+    """Test handler that records the params it was dispatched with."""
+
+    def __init__(self):
+        self.params = []
+
+    async def execute(self, ctx: OperationContext) -> OperationResult:
+        self.params.append(dict(ctx.params))
+        return OperationResult.ok({})
+
+
+def _phase_count(phase):
+    for metric in DISPATCH_PHASE_SECONDS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.labels.get("phase") == phase:
+                return sample.value
+    return 0.0
+
+
+def test_freeze_compiles_a_plan_per_operation(registry):
+    """REG-010: Every registered operation has a plan after freeze()."""
+    registry.register("a.op", StubHandler())
+    registry.register("b.op", StubHandler())
+    enricher = lambda ctx: {}  # noqa: E731
+    registry.register_context_enricher("b.op", enricher)
+
+    registry.freeze()
+
+    assert sorted(registry._plans) == ["a.op", "b.op"]
+    assert registry._plans["b.op"].enricher is enricher
+    assert registry._plans["a.op"].invariant_ids == ()
+    assert registry._authority_probe is not None
+    assert registry._audit_sink is not None
+
+
+@pytest.mark.asyncio
+async def test_setters_after_freeze_recompile_plans(registry, ctx):
+    """REG-010: Mode and enricher changes after freeze() reach dispatch."""
+    handler = ParamsProbeHandler()
+    registry.register("a.op", handler)
+    registry.freeze()
+
+    registry.set_invariant_mode("STRICT")
+    registry.register_context_enricher("a.op", lambda c: {"enriched": True})
+    await registry.execute("a.op", ctx)
+
+    assert handler.params[-1]["_invariant_mode"] == "STRICT"
+    assert handler.params[-1]["enriched"] is True
+
+
+@pytest.mark.asyncio
+async def test_frozen_authority_reads_runtime_switch_per_call(registry, ctx):
+    """REG-010: The kill switch still takes effect after freeze()."""
+    from app.hoc.cus.hoc_spine.authority import runtime_switch
+
+    registry.register("a.op", StubHandler())
+    registry.freeze()
+    runtime_switch.reset_governance_state()
+    try:
+        assert registry._check_authority("a.op").degraded is False
+        runtime_switch.disable_governance_runtime(reason="test", actor="pytest")
+        decision = registry._check_authority("a.op")
+        assert decision.degraded is True
+        assert "governance_disabled" in decision.conditions
+    finally:
+        runtime_switch.reset_governance_state()
+
+
+@pytest.mark.asyncio
+async def test_frozen_and_unfrozen_dispatch_agree(ctx):
+    """REG-010: A compiled plan dispatches exactly like per-call resolution."""
+    results = []
+    for freeze in (False, True):
+        reg = OperationRegistry()
+        handler = ParamsProbeHandler()
+        reg.register("a.op", handler)
+        reg.set_invariant_mode("MONITOR")
+        if freeze:
+            reg.freeze()
+        result = await reg.execute("a.op", ctx)
+        results.append((result.success, result.operation, handler.params[-1]))
+
+    assert results[0] == results[1]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_phases_are_timed(registry, ctx, monkeypatch):
+    """REG-010: A sampled dispatch observes every phase histogram once."""
+    monkeypatch.setattr(_mod, "DISPATCH_PHASE_SAMPLE_EVERY", 1)
+    registry.register("a.op", StubHandler())
+    registry.freeze()
+    before = {phase: _phase_count(phase) for phase in _mod.DISPATCH_PHASES}
+
+    await registry.execute("a.op", ctx)
+
+    assert {phase: _phase_count(phase) - before[phase] for phase in _mod.DISPATCH_PHASES} == {
+        phase: 1.0 for phase in _mod.DISPATCH_PHASES
+    }
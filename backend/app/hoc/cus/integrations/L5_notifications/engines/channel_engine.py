@@ -24,6 +24,10 @@ This service provides:
     - Channel validation (test connectivity)
     - Delivery tracking (success/failure metrics)
     - Retry logic for failed deliveries
+    - Concurrent channel fan-out with per-channel concurrency limits
+    - Durable notification outbox (migration 137) drained by
+      NotifyOutboxWorker, which coalesces bursts per (tenant, channel)
+      into one digest and retries failures with exponential backoff
 
 Exports:
     - NotifyChannel: Enum of available channels
@@ -32,19 +36,59 @@ Exports:
     - NotifyChannelService: Main service class
     - NotifyDeliveryResult: Delivery result tracking
     - NotifyChannelError: Error for channel failures
+    - NotifyOutboxWorker: Outbox delivery worker
     - Helper functions for quick access
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import os
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol, Set
+from typing import Any, AsyncContextManager, Callable, Dict, List, Optional, Protocol, Set, Tuple
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.hoc.cus.integrations.L6_drivers.notification_outbox_driver import NotificationOutboxDriver
 
 logger = logging.getLogger("nova.services.notifications.channel_service")
 
+# In-flight deliveries per channel type, per process
+NOTIFY_CHANNEL_CONCURRENCY = int(os.getenv("NOTIFY_CHANNEL_CONCURRENCY", "8"))
+
+# Outbox worker (main.py delivery loop)
+NOTIFY_OUTBOX_BATCH_SIZE = int(os.getenv("NOTIFY_OUTBOX_BATCH_SIZE", "200"))
+NOTIFY_OUTBOX_POLL_SECONDS = float(os.getenv("NOTIFY_OUTBOX_POLL_SECONDS", "1"))
+NOTIFY_OUTBOX_LEASE_SECONDS = int(os.getenv("NOTIFY_OUTBOX_LEASE_SECONDS", "120"))
+NOTIFY_COALESCE_WINDOW_SECONDS = float(os.getenv("NOTIFY_COALESCE_WINDOW_SECONDS", "30"))
+NOTIFY_MAX_BACKOFF_SECONDS = int(os.getenv("NOTIFY_MAX_BACKOFF_SECONDS", "900"))
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+NOTIFY_DELIVERY_SECONDS = Histogram(
+    "notify_delivery_seconds",
+    "Notification delivery latency per channel",
+    ["channel"],
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+NOTIFY_DELIVERIES_TOTAL = Counter(
+    "notify_deliveries_total",
+    "Notification delivery attempts by outcome",
+    ["channel", "outcome"],  # delivered, failed, retried, dead
+)
+
+NOTIFY_OUTBOX_DEPTH = Gauge(
+    "notify_outbox_depth",
+    "Pending rows in notification_outbox",
+)
+
 
 class NotifyChannel(str, Enum):
     """Available notification channels."""
@@ -141,6 +185,22 @@ class NotifyDeliveryResult:
         }
 
 
+# NotifyChannelConfig fields stored on outbox rows (migration 138), enough to
+# deliver from a process that does not hold the tenant's config
+_DELIVERY_SETTINGS = (
+    "webhook_url",
+    "webhook_secret",
+    "email_recipients",
+    "slack_webhook_url",
+    "slack_channel",
+    "pagerduty_routing_key",
+    "teams_webhook_url",
+    "retry_count",
+    "retry_delay_seconds",
+    "timeout_seconds",
+)
+
+
 @dataclass
 class NotifyChannelConfig:
     """Configuration for a notification channel."""
@@ -195,6 +255,25 @@ class NotifyChannelConfig:
             return bool(self.teams_webhook_url)
         return False
 
+    def delivery_settings(self) -> Dict[str, Any]:
+        """Endpoint, recipients and retry settings, as stored on outbox rows."""
+        return {name: getattr(self, name) for name in _DELIVERY_SETTINGS}
+
+    @classmethod
+    def from_delivery_settings(
+        cls,
+        tenant_id: str,
+        channel: NotifyChannel,
+        settings: Dict[str, Any],
+    ) -> "NotifyChannelConfig":
+        """Rebuild an enabled config from delivery_settings() (unknown keys ignored)."""
+        return cls(
+            channel=channel,
+            status=NotifyChannelStatus.ENABLED,
+            tenant_id=tenant_id,
+            **{name: value for name, value in settings.items() if name in _DELIVERY_SETTINGS},
+        )
+
     def record_success(self) -> None:
         """Record a successful delivery."""
         self.last_success_at = datetime.now(timezone.utc)
@@ -293,16 +372,20 @@ class NotifyChannelService:
     def __init__(
         self,
         default_channels: Optional[Set[NotifyChannel]] = None,
+        channel_concurrency: int = NOTIFY_CHANNEL_CONCURRENCY,
     ):
         """
         Initialize the notification channel service.
 
         Args:
             default_channels: Default enabled channels for new tenants
+            channel_concurrency: Max in-flight deliveries per channel type
         """
         self._default_channels = default_channels or {NotifyChannel.UI}
         self._configs: Dict[str, Dict[NotifyChannel, NotifyChannelConfig]] = {}
         self._delivery_history: Dict[str, List[NotifyDeliveryResult]] = {}
+        self._channel_concurrency = max(1, channel_concurrency)
+        self._channel_limits: Dict[NotifyChannel, asyncio.Semaphore] = {}
 
     def configure_channel(
         self,
@@ -583,6 +666,38 @@ class NotifyChannelService:
             message=f"Event filter updated for {channel.value}",
         )
 
+    def _resolve_targets(
+        self,
+        tenant_id: str,
+        event_type: NotifyEventType,
+        channels: Optional[List[NotifyChannel]],
+    ) -> List[Tuple[NotifyChannel, Optional[NotifyChannelConfig]]]:
+        """Channels a notification goes to, with their config (None for default UI)."""
+        if channels:
+            target_channels = channels
+        else:
+            target_channels = self.get_enabled_channels(tenant_id, event_type)
+
+        targets: List[Tuple[NotifyChannel, Optional[NotifyChannelConfig]]] = []
+        for channel in target_channels:
+            config = self.get_channel_config(tenant_id, channel)
+
+            if config is None:
+                # Use default UI notification
+                if channel == NotifyChannel.UI:
+                    targets.append((channel, None))
+                continue
+
+            if config.status != NotifyChannelStatus.ENABLED:
+                continue
+
+            if not config.is_event_enabled(event_type):
+                continue
+
+            targets.append((channel, config))
+
+        return targets
+
     async def send(
         self,
         tenant_id: str,
@@ -593,6 +708,10 @@ class NotifyChannelService:
         """
         Send notification via all enabled channels.
 
+        Channels are delivered concurrently, so a slow channel only delays
+        its own result. Callers that must not wait on delivery should use
+        enqueue() instead.
+
         Args:
             tenant_id: Tenant identifier
             event_type: Type of event
@@ -603,57 +722,106 @@ class NotifyChannelService:
             List of delivery results for each channel
         """
         start_time = datetime.now(timezone.utc)
-        results: List[NotifyDeliveryResult] = []
 
-        # Determine which channels to use
-        if channels:
-            target_channels = channels
-        else:
-            target_channels = self.get_enabled_channels(tenant_id, event_type)
+        results: List[NotifyDeliveryResult] = list(
+            await asyncio.gather(
+                *(
+                    self._deliver(tenant_id, channel, config, event_type, payload, start_time)
+                    for channel, config in self._resolve_targets(tenant_id, event_type, channels)
+                )
+            )
+        )
 
-        for channel in target_channels:
-            config = self.get_channel_config(tenant_id, channel)
+        self._record_history(tenant_id, results)
+        return results
 
-            if config is None:
-                # Use default UI notification
-                if channel == NotifyChannel.UI:
-                    result = await self._send_ui_notification(
-                        tenant_id, event_type, payload, start_time
-                    )
-                    results.append(result)
-                continue
+    async def enqueue(
+        self,
+        session: Any,
+        tenant_id: str,
+        event_type: NotifyEventType,
+        payload: Dict[str, Any],
+        channels: Optional[List[NotifyChannel]] = None,
+    ) -> int:
+        """
+        Write the notification to the outbox in the caller's transaction.
 
-            if config.status != NotifyChannelStatus.ENABLED:
-                continue
+        One row per target channel, carrying the channel's delivery settings
+        so any worker process can deliver it; NotifyOutboxWorker delivers
+        them after the caller commits. Does not commit.
 
-            if not config.is_event_enabled(event_type):
-                continue
+        Args:
+            session: Caller's AsyncSession
+            tenant_id: Tenant identifier
+            event_type: Type of event
+            payload: Notification payload
+            channels: Optional specific channels to use
 
-            # Send via appropriate channel
+        Returns:
+            Number of outbox rows written
+        """
+        rows = [
+            {
+                "tenant_id": tenant_id,
+                "channel": channel.value,
+                "event_type": event_type.value,
+                "payload": payload,
+                "channel_config": config.delivery_settings() if config is not None else None,
+            }
+            for channel, config in self._resolve_targets(tenant_id, event_type, channels)
+        ]
+        return await NotificationOutboxDriver(session).enqueue(rows)
+
+    def _channel_limit(self, channel: NotifyChannel) -> asyncio.Semaphore:
+        """Per-channel delivery semaphore, created on first use."""
+        limit = self._channel_limits.get(channel)
+        if limit is None:
+            limit = self._channel_limits[channel] = asyncio.Semaphore(self._channel_concurrency)
+        return limit
+
+    async def _deliver(
+        self,
+        tenant_id: str,
+        channel: NotifyChannel,
+        config: Optional[NotifyChannelConfig],
+        event_type: NotifyEventType,
+        payload: Dict[str, Any],
+        start_time: datetime,
+    ) -> NotifyDeliveryResult:
+        """Deliver via one channel under its concurrency limit and timeout."""
+        async with self._channel_limit(channel):
+            started = time.perf_counter()
             try:
-                result = await self._send_via_channel(
-                    config, event_type, payload, start_time
-                )
-                results.append(result)
-
-                if result.success:
-                    config.record_success()
+                if config is None:
+                    result = await self._send_ui_notification(tenant_id, event_type, payload, start_time)
                 else:
-                    config.record_failure()
-
-            except Exception as e:
-                config.record_failure()
-                results.append(
-                    NotifyDeliveryResult(
-                        channel=channel,
-                        event_type=event_type,
-                        success=False,
-                        delivered_at=datetime.now(timezone.utc),
-                        error_message=str(e),
+                    result = await asyncio.wait_for(
+                        self._send_via_channel(config, event_type, payload, start_time),
+                        timeout=config.timeout_seconds,
                     )
+            except Exception as e:
+                error = f"Timed out after {config.timeout_seconds}s" if isinstance(e, asyncio.TimeoutError) else str(e)
+                result = NotifyDeliveryResult(
+                    channel=channel,
+                    event_type=event_type,
+                    success=False,
+                    delivered_at=datetime.now(timezone.utc),
+                    error_message=error,
                 )
+            NOTIFY_DELIVERY_SECONDS.labels(channel=channel.value).observe(time.perf_counter() - started)
+
+        NOTIFY_DELIVERIES_TOTAL.labels(
+            channel=channel.value, outcome="delivered" if result.success else "failed"
+        ).inc()
+        if config is not None:
+            if result.success:
+                config.record_success()
+            else:
+                config.record_failure()
+        return result
 
-        # Store delivery history
+    def _record_history(self, tenant_id: str, results: List[NotifyDeliveryResult]) -> None:
+        """Store delivery history, trimmed to the last 1000 entries."""
         if tenant_id not in self._delivery_history:
             self._delivery_history[tenant_id] = []
         self._delivery_history[tenant_id].extend(results)
@@ -662,8 +830,6 @@ class NotifyChannelService:
         if len(self._delivery_history[tenant_id]) > 1000:
             self._delivery_history[tenant_id] = self._delivery_history[tenant_id][-1000:]
 
-        return results
-
     async def _send_via_channel(
         self,
         config: NotifyChannelConfig,
@@ -1025,6 +1191,186 @@ class NotifyChannelService:
         return self._delivery_history[tenant_id][-limit:]
 
 
+class NotifyOutboxWorker:
+    """
+    Delivers notification_outbox rows through NotifyChannelService.
+
+    Each pass claims due rows (committed before delivery, so no
+    transaction is held open across network calls), groups them by
+    (tenant, channel), and delivers the groups concurrently under the
+    service's per-channel limits.
+
+    Burst coalescing: the first notification for a (tenant, channel) is
+    delivered immediately; rows arriving within coalesce_window_seconds
+    after a delivery are held until the window ends and then delivered
+    as one digest. Windows are tracked per process, so with several
+    workers a burst may produce one digest per worker.
+
+    Failures are retried with exponential backoff from the channel's
+    retry_delay_seconds and dead-lettered after its retry_count.
+
+    The channel config comes from this process's service when it holds
+    one (so a channel disabled here stops delivery), otherwise from the
+    settings stored on the newest row of the group at enqueue time.
+
+    Usage:
+        worker = NotifyOutboxWorker(get_notify_service(), get_async_session)
+        await worker.run()
+    """
+
+    def __init__(
+        self,
+        service: NotifyChannelService,
+        session_factory: Callable[[], AsyncContextManager[Any]],
+        batch_size: int = NOTIFY_OUTBOX_BATCH_SIZE,
+        lease_seconds: int = NOTIFY_OUTBOX_LEASE_SECONDS,
+        coalesce_window_seconds: float = NOTIFY_COALESCE_WINDOW_SECONDS,
+        max_backoff_seconds: int = NOTIFY_MAX_BACKOFF_SECONDS,
+    ):
+        self._service = service
+        self._session_factory = session_factory
+        self._batch_size = batch_size
+        self._lease_seconds = lease_seconds
+        self._window = timedelta(seconds=coalesce_window_seconds)
+        self._max_backoff_seconds = max_backoff_seconds
+        self._last_sent: Dict[Tuple[str, str], datetime] = {}
+
+    async def run(self, poll_seconds: float = NOTIFY_OUTBOX_POLL_SECONDS) -> None:
+        """Drain the outbox until cancelled; polls when a pass finds nothing to claim."""
+        while True:
+            try:
+                counts = await self.run_once()
+            except Exception as e:
+                logger.warning(f"Notification outbox pass failed: {e}")
+                counts = {}
+            if counts.get("claimed", 0) < self._batch_size:
+                await asyncio.sleep(poll_seconds)
+
+    async def run_once(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Claim, coalesce, deliver and record one batch.
+
+        Returns:
+            Row counts: claimed, delivered, retried, dead, deferred
+        """
+        counts = {"claimed": 0, "delivered": 0, "retried": 0, "dead": 0, "deferred": 0}
+
+        async with self._session_factory() as session:
+            rows = await NotificationOutboxDriver(session).claim_due(self._batch_size, self._lease_seconds)
+            await session.commit()
+        counts["claimed"] = len(rows)
+
+        now = now or datetime.now(timezone.utc)
+        self._last_sent = {key: at for key, at in self._last_sent.items() if now - at < self._window}
+
+        groups: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for row in sorted(rows, key=lambda r: (r["created_at"], r["id"])):
+            groups.setdefault((row["tenant_id"], row["channel"]), []).append(row)
+
+        deferred: Dict[datetime, List[int]] = {}
+        due: List[Tuple[Tuple[str, str], List[Dict[str, Any]]]] = []
+        for key, group in groups.items():
+            last_sent = self._last_sent.get(key)
+            if last_sent is not None:
+                deferred.setdefault(last_sent + self._window, []).extend(row["id"] for row in group)
+            else:
+                due.append((key, group))
+
+        outcomes = await asyncio.gather(*(self._deliver_group(key, group, now) for key, group in due))
+
+        delivered: List[int] = []
+        retries: Dict[Tuple[datetime, str], List[int]] = {}
+        dead: Dict[str, List[int]] = {}
+        for (key, group), (outcome, next_attempt_at, error) in zip(due, outcomes):
+            ids = [row["id"] for row in group]
+            if outcome == "delivered":
+                delivered.extend(ids)
+                self._last_sent[key] = now
+            elif outcome == "retried":
+                retries.setdefault((next_attempt_at, error), []).extend(ids)
+            else:
+                dead.setdefault(error, []).extend(ids)
+            if outcome != "delivered":
+                # Attempts are counted by _deliver; these count rows
+                NOTIFY_DELIVERIES_TOTAL.labels(channel=key[1], outcome=outcome).inc(len(ids))
+            counts[outcome] += len(ids)
+        counts["deferred"] = sum(len(ids) for ids in deferred.values())
+
+        async with self._session_factory() as session:
+            driver = NotificationOutboxDriver(session)
+            await driver.mark_delivered(delivered)
+            for (next_attempt_at, error), ids in retries.items():
+                await driver.reschedule(ids, next_attempt_at, error)
+            for error, ids in dead.items():
+                await driver.mark_dead(ids, error)
+            for next_attempt_at, ids in deferred.items():
+                await driver.defer(ids, next_attempt_at)
+            NOTIFY_OUTBOX_DEPTH.set(await driver.count_pending())
+            await session.commit()
+
+        if counts["dead"]:
+            logger.warning("notify_outbox_dead_lettered", extra={"rows": counts["dead"]})
+        return counts
+
+    async def _deliver_group(
+        self,
+        key: Tuple[str, str],
+        group: List[Dict[str, Any]],
+        now: datetime,
+    ) -> Tuple[str, Optional[datetime], str]:
+        """Deliver one (tenant, channel) group; returns (outcome, next_attempt_at, error)."""
+        tenant_id, channel_value = key
+        try:
+            channel = NotifyChannel(channel_value)
+            event_type, payload = self._coalesce(group)
+        except ValueError as e:
+            return "dead", None, str(e)
+
+        config = self._service.get_channel_config(tenant_id, channel)
+        if config is None and group[-1].get("channel_config") is not None:
+            config = NotifyChannelConfig.from_delivery_settings(tenant_id, channel, group[-1]["channel_config"])
+        if config is None and channel != NotifyChannel.UI:
+            return "dead", None, f"Channel {channel.value} is not configured"
+        if config is not None and config.status != NotifyChannelStatus.ENABLED:
+            return "dead", None, f"Channel {channel.value} is {config.status.value}"
+
+        result = await self._service._deliver(tenant_id, channel, config, event_type, payload, now)
+        self._service._record_history(tenant_id, [result])
+        if result.success:
+            return "delivered", None, ""
+
+        attempts = max(row["attempts"] for row in group) + 1
+        retry_count = config.retry_count if config is not None else 3
+        error = result.error_message or "Delivery failed"
+        if attempts > retry_count:
+            return "dead", None, error
+        base = config.retry_delay_seconds if config is not None else 5
+        delay = min(base * 2 ** (attempts - 1), self._max_backoff_seconds)
+        return "retried", now + timedelta(seconds=delay), error
+
+    def _coalesce(self, group: List[Dict[str, Any]]) -> Tuple[NotifyEventType, Dict[str, Any]]:
+        """One row is sent as is; several become a digest (event type of the first)."""
+        first = group[0]
+        if len(group) == 1:
+            return NotifyEventType(first["event_type"]), first["payload"]
+
+        return NotifyEventType(first["event_type"]), {
+            "digest": True,
+            "count": len(group),
+            "event_types": sorted({row["event_type"] for row in group}),
+            "first_at": first["created_at"].isoformat(),
+            "last_at": group[-1]["created_at"].isoformat(),
+            "notifications": [
+                {
+                    "event_type": row["event_type"],
+                    "created_at": row["created_at"].isoformat(),
+                    "payload": row["payload"],
+                }
+                for row in group
+            ],
+        }
+
+
 # Module-level service instance
 _notify_service: Optional[NotifyChannelService] = None
 
@@ -1086,6 +1432,30 @@ async def send_notification(
     return await service.send(tenant_id, event_type, payload, channels)
 
 
+async def enqueue_notification(
+    session: Any,
+    tenant_id: str,
+    event_type: NotifyEventType,
+    payload: Dict[str, Any],
+    channels: Optional[List[NotifyChannel]] = None,
+) -> int:
+    """
+    Quick helper to write a notification to the outbox.
+
+    Args:
+        session: Caller's AsyncSession (caller commits)
+        tenant_id: Tenant identifier
+        event_type: Type of event
+        payload: Notification payload
+        channels: Optional specific channels
+
+    Returns:
+        Number of outbox rows written
+    """
+    service = get_notify_service()
+    return await service.enqueue(session, tenant_id, event_type, payload, channels)
+
+
 async def check_channel_health(
     tenant_id: str,
 ) -> Dict[NotifyChannel, Dict[str, Any]]:
@@ -38,6 +38,7 @@ from .mcp_driver import (
     compute_input_hash,
     compute_output_hash,
 )
+from .notification_outbox_driver import NotificationOutboxDriver
 from .proxy_driver import (
     ApiKeyRow,
     GuardrailRow,
@@ -64,6 +65,8 @@ __all__ = [
     "McpInvocationRow",
     "compute_input_hash",
     "compute_output_hash",
+    # notification_outbox_driver (GAP-017)
+    "NotificationOutboxDriver",
     # proxy_driver (L2 session.execute refactor)
     "ProxyDriver",
     "ApiKeyRow",
@@ -0,0 +1,163 @@
+# Layer: L6 — Domain Driver
+# AUDIENCE: CUSTOMER
+# Temporal:
+#   Trigger: api|worker (via L5 channel engine)
+#   Execution: async
+# Lifecycle:
+#   Emits: none
+#   Subscribes: none
+# Data Access:
+#   Reads: notification_outbox
+#   Writes: notification_outbox
+# Role: Notification outbox persistence: enqueue, claim, and delivery outcomes
+# Callers: channel_engine.py (L5)
+# Allowed Imports: sqlalchemy
+# Forbidden Imports: L1, L2, L3, L4, L5
+# Forbidden: session.commit(), session.rollback() — L6 DOES NOT COMMIT
+# Reference: GAP-017 (Notify Channels), migrations 137_notification_outbox, 138_notification_outbox_channel_config
+
+"""
+Notification Outbox Driver (L6 Data Access)
+
+notification_outbox (migration 137) holds one row per (notification,
+target channel), with the delivery settings of the channel config
+resolved at enqueue time (migration 138), so any worker process can
+deliver it. Callers enqueue rows in their own transaction; the
+delivery worker claims due rows by pushing next_attempt_at forward by a
+lease (FOR UPDATE SKIP LOCKED, so concurrent workers never claim the
+same row), delivers, and records the outcome.
+
+Pure persistence - the caller owns the transaction.
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ENQUEUE_SQL = """
+    INSERT INTO notification_outbox (tenant_id, channel, event_type, payload, channel_config)
+    VALUES (:tenant_id, :channel, :event_type, CAST(:payload AS jsonb), CAST(:channel_config AS jsonb))
+"""
+
+# Claimed rows stay 'pending' with next_attempt_at at the end of the lease,
+# so rows of a worker that died mid-delivery become due again
+CLAIM_SQL = """
+    UPDATE notification_outbox o
+    SET next_attempt_at = NOW() + make_interval(secs => :lease_seconds)
+    FROM (
+        SELECT id
+        FROM notification_outbox
+        WHERE status = 'pending' AND next_attempt_at <= NOW()
+        ORDER BY next_attempt_at, id
+        LIMIT :limit
+        FOR UPDATE SKIP LOCKED
+    ) due
+    WHERE o.id = due.id
+    RETURNING o.id, o.tenant_id, o.channel, o.event_type, o.payload, o.channel_config, o.attempts, o.created_at
+"""
+
+DELIVERED_SQL = """
+    UPDATE notification_outbox
+    SET status = 'delivered', delivered_at = NOW(), last_error = NULL
+    WHERE id = ANY(:ids)
+"""
+
+RETRY_SQL = """
+    UPDATE notification_outbox
+    SET attempts = attempts + 1, next_attempt_at = :next_attempt_at, last_error = :error
+    WHERE id = ANY(:ids)
+"""
+
+DEAD_SQL = """
+    UPDATE notification_outbox
+    SET status = 'dead', attempts = attempts + 1, last_error = :error
+    WHERE id = ANY(:ids)
+"""
+
+# Coalescing deferral: not a failed attempt
+DEFER_SQL = """
+    UPDATE notification_outbox
+    SET next_attempt_at = :next_attempt_at
+    WHERE id = ANY(:ids)
+"""
+
+DEPTH_SQL = "SELECT COUNT(*) FROM notification_outbox WHERE status = 'pending'"
+
+
+class NotificationOutboxDriver:
+    """Data access for notification_outbox. Does not commit."""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def enqueue(self, rows: Sequence[Dict[str, Any]]) -> int:
+        """
+        Insert outbox rows in the caller's transaction.
+
+        Args:
+            rows: Dicts with tenant_id, channel, event_type, payload and
+                channel_config (None for the default UI channel)
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        await self._session.execute(
+            text(ENQUEUE_SQL),
+            [
+                {
+                    "tenant_id": row["tenant_id"],
+                    "channel": row["channel"],
+                    "event_type": row["event_type"],
+                    "payload": json.dumps(row["payload"], default=str),
+                    "channel_config": (
+                        json.dumps(row["channel_config"]) if row.get("channel_config") is not None else None
+                    ),
+                }
+                for row in rows
+            ],
+        )
+        return len(rows)
+
+    async def claim_due(self, limit: int, lease_seconds: float) -> List[Dict[str, Any]]:
+        """Claim up to limit due rows for lease_seconds, oldest first."""
+        result = await self._session.execute(
+            text(CLAIM_SQL),
+            {"limit": limit, "lease_seconds": lease_seconds},
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    async def mark_delivered(self, ids: Sequence[int]) -> None:
+        """Record successful delivery."""
+        if ids:
+            await self._session.execute(text(DELIVERED_SQL), {"ids": list(ids)})
+
+    async def reschedule(self, ids: Sequence[int], next_attempt_at: datetime, error: str) -> None:
+        """Count a failed attempt and make the rows due again at next_attempt_at."""
+        if ids:
+            await self._session.execute(
+                text(RETRY_SQL),
+                {"ids": list(ids), "next_attempt_at": next_attempt_at, "error": error},
+            )
+
+    async def mark_dead(self, ids: Sequence[int], error: str) -> None:
+        """Dead-letter rows that exhausted their retries."""
+        if ids:
+            await self._session.execute(text(DEAD_SQL), {"ids": list(ids), "error": error})
+
+    async def defer(self, ids: Sequence[int], next_attempt_at: datetime) -> None:
+        """Hold rows until next_attempt_at without counting an attempt."""
+        if ids:
+            await self._session.execute(
+                text(DEFER_SQL),
+                {"ids": list(ids), "next_attempt_at": next_attempt_at},
+            )
+
+    async def count_pending(self) -> int:
+        """Outbox depth: rows not yet delivered or dead-lettered."""
+        result = await self._session.execute(text(DEPTH_SQL))
+        return int(result.scalar() or 0)
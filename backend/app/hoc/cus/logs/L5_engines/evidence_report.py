@@ -2,15 +2,15 @@
 # AUDIENCE: CUSTOMER
 # Temporal:
 #   Trigger: api
-#   Execution: sync
+#   Execution: sync (generator), async (render pipeline, process pool)
 # Lifecycle:
 #   Emits: none
 #   Subscribes: none
 # Data Access:
 #   Reads: none (via driver)
-#   Writes: none (PDF generation only)
-# Role: Evidence report generator - Legal-grade PDF export
-# Callers: guard.py (incident export endpoint)
+#   Writes: none (PDF generation only; rendered PDFs cached on local disk)
+# Role: Evidence report generator - Legal-grade PDF export, plus the shared report render pipeline
+# Callers: logs_handler.py (logs.evidence_report, logs.pdf), app.services.evidence_report (re-export)
 # Allowed Imports: L5, L6
 # Forbidden Imports: L1, L2, L3, sqlalchemy (runtime)
 # Reference: PIN-470, PIN-240
@@ -32,14 +32,38 @@ Features:
 - Counterfactual prevention proof
 - Remediation & controls
 - Legal attestation with verification signature
+
+Rendering pipeline:
+- ReportRenderPipeline renders off the event loop in a process pool, behind
+  a bounded queue (RenderQueueFullError when full)
+- Finished PDFs land in a size-capped, content-addressed disk cache
+  (ReportCache); repeat downloads and concurrent identical requests reuse
+  one render
+- RenderedReport.stream() yields the file in chunks for StreamingResponse
+- Per-section build times are exported as report_render_section_seconds
+- Cached reports keep the generation/verification timestamps of the render
+  that produced them
 """
 
+import asyncio
 import hashlib
 import io
-from dataclasses import dataclass
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
 
+from prometheus_client import Counter, Gauge, Histogram
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.pagesizes import letter
@@ -55,6 +79,44 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+logger = logging.getLogger("nova.hoc.logs.evidence_report")
+
+# Bump when the report layout changes so cached PDFs are not reused
+REPORT_TEMPLATE_VERSION = "1"
+
+RENDER_WORKERS = int(os.getenv("REPORT_RENDER_WORKERS", "2"))
+RENDER_MAX_PENDING = int(os.getenv("REPORT_RENDER_MAX_PENDING", "16"))
+REPORT_CACHE_DIR = os.getenv("REPORT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "nova-report-cache"))
+REPORT_CACHE_MAX_BYTES = int(os.getenv("REPORT_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# =============================================================================
+# Metrics
+# =============================================================================
+
+RENDER_SECTION_SECONDS = Histogram(
+    "report_render_section_seconds",
+    "Time spent building each report section",
+    ["report", "section"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10],
+)
+
+RENDER_REQUESTS_TOTAL = Counter(
+    "report_render_requests_total",
+    "Report render requests by outcome",
+    ["report", "outcome"],  # cache_hit, coalesced, rendered, rejected, failed
+)
+
+RENDER_PENDING = Gauge(
+    "report_render_pending",
+    "Renders queued or running in the render pool",
+)
+
+REPORT_CACHE_BYTES = Gauge(
+    "report_render_cache_bytes",
+    "Bytes held by the rendered report cache",
+)
+
 
 @dataclass
 class CertificateEvidence:
@@ -113,6 +175,7 @@ class EvidenceReportGenerator:
 
     def __init__(self, is_demo: bool = True):
         self.is_demo = is_demo
+        self.section_timings: Dict[str, float] = {}
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
 
@@ -246,6 +309,8 @@ class EvidenceReportGenerator:
         """
         Generate the complete PDF evidence report.
 
+        Per-section build times (seconds) are left in ``section_timings``.
+
         Returns:
             PDF file as bytes
         """
@@ -260,49 +325,40 @@ class EvidenceReportGenerator:
             bottomMargin=0.75 * inch,
         )
 
-        # Build story (content)
-        story = []
-
-        # Incident Snapshot (1-page scannable summary for executives)
-        story.extend(self._build_incident_snapshot(evidence))
-        story.append(PageBreak())
-
-        # Cover page
-        story.extend(self._build_cover_page(evidence))
-        story.append(PageBreak())
-
-        # Section 1: Executive Summary
-        story.extend(self._build_executive_summary(evidence))
-        story.append(PageBreak())
-
-        # Section 2: Factual Reconstruction
-        story.extend(self._build_factual_reconstruction(evidence))
-
-        # Section 3: Policy Evaluation
-        story.extend(self._build_policy_evaluation(evidence))
-
-        # Section 4: Decision Timeline
-        story.extend(self._build_decision_timeline(evidence))
-        story.append(PageBreak())
-
-        # Section 5: Replay Verification
-        story.extend(self._build_replay_verification(evidence))
-
+        # Build story (content), timing each section for render metrics.
+        # (name, builder, page break after)
+        sections = [
+            # Incident Snapshot (1-page scannable summary for executives)
+            ("incident_snapshot", self._build_incident_snapshot, True),
+            ("cover", self._build_cover_page, True),
+            ("executive_summary", self._build_executive_summary, True),
+            ("factual_reconstruction", self._build_factual_reconstruction, False),
+            ("policy_evaluation", self._build_policy_evaluation, False),
+            ("decision_timeline", self._build_decision_timeline, True),
+            ("replay_verification", self._build_replay_verification, False),
+        ]
         # Section 5.5: M23 Cryptographic Certificate (if available)
         if evidence.certificate:
-            story.extend(self._build_certificate_section(evidence))
-
-        # Section 6: Prevention Proof
-        story.extend(self._build_prevention_proof(evidence))
-
-        # Section 7: Remediation
-        story.extend(self._build_remediation(evidence))
-
-        # Section 8: Legal Attestation
-        story.extend(self._build_legal_attestation(evidence))
+            sections.append(("certificate", self._build_certificate_section, False))
+        sections += [
+            ("prevention_proof", self._build_prevention_proof, False),
+            ("remediation", self._build_remediation, False),
+            ("legal_attestation", self._build_legal_attestation, False),
+        ]
 
-        # Build PDF with footer
+        self.section_timings = {}
+        story = []
+        for name, build, page_break in sections:
+            started = time.perf_counter()
+            story.extend(build(evidence))
+            self.section_timings[name] = time.perf_counter() - started
+            if page_break:
+                story.append(PageBreak())
+
+        # Build PDF with footer (flowable layout dominates render time)
+        started = time.perf_counter()
         doc.build(story, onFirstPage=self._add_footer, onLaterPages=self._add_footer)
+        self.section_timings["layout"] = time.perf_counter() - started
 
         buffer.seek(0)
         return buffer.read()
@@ -1085,8 +1141,21 @@ class EvidenceReportGenerator:
         content = f"{evidence.incident_id}:{evidence.timestamp}:{evidence.ai_output}"
         return self._compute_hash(content)
 
+    def cache_key(self, evidence: IncidentEvidence) -> str:
+        """
+        Content address of the rendered report.
 
-def generate_evidence_report(
+        The verification hash only covers incident_id/timestamp/ai_output, so
+        the full evidence, the watermark flag and the template version are
+        folded in to keep two different reports from sharing a cache entry.
+        """
+        evidence_digest = self._compute_hash(json.dumps(asdict(evidence), sort_keys=True, default=str))
+        return self._compute_hash(
+            f"{REPORT_TEMPLATE_VERSION}:{self._compute_report_hash(evidence)}:{evidence_digest}:{int(self.is_demo)}"
+        )
+
+
+def build_incident_evidence(
     incident_id: str,
     tenant_id: str,
     tenant_name: str,
@@ -1106,13 +1175,12 @@ def generate_evidence_report(
     certificate: Optional[Dict[str, Any]] = None,  # M23: Cryptographic certificate
     severity: str = "HIGH",  # CRITICAL, HIGH, MEDIUM, LOW
     status: str = "RESOLVED",  # OPEN, INVESTIGATING, RESOLVED
-    is_demo: bool = True,
-) -> bytes:
+) -> IncidentEvidence:
     """
-    Convenience function to generate an evidence report.
+    Assemble IncidentEvidence from raw incident fields.
 
     Returns:
-        PDF file as bytes
+        IncidentEvidence ready for EvidenceReportGenerator or the render pipeline
     """
     if impact_assessment is None:
         impact_assessment = [
@@ -1138,7 +1206,7 @@ def generate_evidence_report(
             policies_total=certificate.get("policies_total", 0),
         )
 
-    evidence = IncidentEvidence(
+    return IncidentEvidence(
         incident_id=incident_id,
         tenant_id=tenant_id,
         tenant_name=tenant_name,
@@ -1160,5 +1228,351 @@ def generate_evidence_report(
         status=status,
     )
 
+
+def generate_evidence_report(
+    incident_id: str,
+    tenant_id: str,
+    tenant_name: str,
+    user_id: str,
+    product_name: str,
+    model_id: str,
+    timestamp: str,
+    user_input: str,
+    context_data: Dict[str, Any],
+    ai_output: str,
+    policy_results: List[Dict[str, Any]],
+    timeline_events: List[Dict[str, Any]],
+    replay_result: Optional[Dict[str, Any]] = None,
+    prevention_result: Optional[Dict[str, Any]] = None,
+    root_cause: str = "Policy enforcement gap: system asserted fact when required data was NULL.",
+    impact_assessment: Optional[List[str]] = None,
+    certificate: Optional[Dict[str, Any]] = None,  # M23: Cryptographic certificate
+    severity: str = "HIGH",  # CRITICAL, HIGH, MEDIUM, LOW
+    status: str = "RESOLVED",  # OPEN, INVESTIGATING, RESOLVED
+    is_demo: bool = True,
+) -> bytes:
+    """
+    Convenience function to generate an evidence report.
+
+    Renders inline; async callers should use
+    get_report_render_pipeline().render_incident_report() instead.
+
+    Returns:
+        PDF file as bytes
+    """
+    evidence = build_incident_evidence(
+        incident_id=incident_id,
+        tenant_id=tenant_id,
+        tenant_name=tenant_name,
+        user_id=user_id,
+        product_name=product_name,
+        model_id=model_id,
+        timestamp=timestamp,
+        user_input=user_input,
+        context_data=context_data,
+        ai_output=ai_output,
+        policy_results=policy_results,
+        timeline_events=timeline_events,
+        replay_result=replay_result,
+        prevention_result=prevention_result,
+        root_cause=root_cause,
+        impact_assessment=impact_assessment,
+        certificate=certificate,
+        severity=severity,
+        status=status,
+    )
+
     generator = EvidenceReportGenerator(is_demo=is_demo)
     return generator.generate(evidence)
+
+
+# =============================================================================
+# Render Pipeline
+# =============================================================================
+
+
+class RenderQueueFullError(Exception):
+    """Raised when the render queue is at capacity (callers should return 503)."""
+
+
+class ReportCache:
+    """
+    Size-capped, content-addressed disk cache of rendered PDFs.
+
+    Entries are evicted least-recently-used once the total size exceeds
+    max_bytes. Workers write into a staging directory and commit() moves the
+    file into place atomically, so readers never see a partial PDF.
+    """
+
+    def __init__(self, root: str = REPORT_CACHE_DIR, max_bytes: int = REPORT_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.staging = self.root / ".staging"
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """Index existing entries (oldest first) and drop abandoned staging files."""
+        self.staging.mkdir(parents=True, exist_ok=True)
+        for stale in self.staging.iterdir():
+            stale.unlink(missing_ok=True)
+
+        found = []
+        for path in self.root.glob("*/*.pdf"):
+            stat = path.stat()
+            found.append((stat.st_mtime, path.stem, stat.st_size))
+        for _, key, size in sorted(found):
+            self._entries[key] = size
+            self._bytes += size
+        self._evict()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def path_for(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pdf"
+
+    def staging_path(self, key: str) -> Path:
+        return self.staging / f"{key}.{uuid.uuid4().hex}.pdf"
+
+    def get(self, key: str) -> Optional[Path]:
+        """Return the cached PDF path for key, or None."""
+        path = self.path_for(key)
+        with self._lock:
+            if key not in self._entries:
+                return None
+            if not path.exists():
+                self._bytes -= self._entries.pop(key)
+                return None
+            self._entries.move_to_end(key)
+        os.utime(path)
+        return path
+
+    def commit(self, key: str, staged: Path) -> Path:
+        """Move a fully written staging file into the cache and enforce the cap."""
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(staged, path)
+        size = path.stat().st_size
+        with self._lock:
+            self._bytes += size - self._entries.pop(key, 0)
+            self._entries[key] = size
+            self._evict(keep=key)
+        return path
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            key, size = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            del self._entries[key]
+            self._bytes -= size
+            # Open readers keep their file handle; unlink only drops the name
+            self.path_for(key).unlink(missing_ok=True)
+        REPORT_CACHE_BYTES.set(self._bytes)
+
+
+@dataclass
+class RenderedReport:
+    """A rendered PDF sitting in the report cache."""
+
+    key: str
+    path: Path
+    size: int
+    cache_hit: bool
+    section_timings: Dict[str, float] = field(default_factory=dict)
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+    def stream(self, chunk_size: int = STREAM_CHUNK_BYTES) -> AsyncIterator[bytes]:
+        """
+        Stream the PDF in chunks (e.g. as a StreamingResponse body).
+
+        The file is opened here rather than on first iteration so a
+        concurrent cache eviction cannot pull it away mid-response.
+        """
+        return _stream_file(self.path.open("rb"), chunk_size)
+
+
+async def _stream_file(handle, chunk_size: int) -> AsyncIterator[bytes]:
+    try:
+        while True:
+            chunk = await asyncio.to_thread(handle.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        handle.close()
+
+
+def _render_to_file(kind: str, payload: Any, options: Dict[str, Any], staged_path: str) -> Dict[str, float]:
+    """
+    Render in a pool worker and write the PDF to staged_path.
+
+    Writing in the worker keeps the PDF bytes from crossing the process
+    boundary; only the section timings are returned.
+    """
+    if kind == "incident_report":
+        generator = EvidenceReportGenerator(is_demo=options.get("is_demo", True))
+        pdf = generator.generate(payload)
+        timings = generator.section_timings
+    else:
+        from app.hoc.cus.logs.L5_engines.pdf_renderer import PDFRenderer
+
+        renderer = PDFRenderer()
+        pdf = getattr(renderer, kind)(payload)
+        timings = renderer.section_timings
+
+    with open(staged_path, "wb") as f:
+        f.write(pdf)
+    return timings
+
+
+class ReportRenderPipeline:
+    """
+    Renders PDFs off the event loop with caching and backpressure.
+
+    At most max_pending renders may be queued or running; further cache
+    misses raise RenderQueueFullError instead of growing an unbounded
+    backlog. Concurrent requests for the same key share one render, and a
+    render that has started runs to completion (and is cached) even if the
+    requesting client goes away.
+
+    Usage:
+        pipeline = get_report_render_pipeline()
+        report = await pipeline.render_incident_report(evidence, is_demo=False)
+        return StreamingResponse(report.stream(), media_type="application/pdf")
+    """
+
+    BUNDLE_RENDER_METHODS = ("render_evidence_pdf", "render_soc2_pdf", "render_executive_debrief_pdf")
+
+    def __init__(
+        self,
+        cache: Optional[ReportCache] = None,
+        executor: Optional[Executor] = None,
+        max_workers: int = RENDER_WORKERS,
+        max_pending: int = RENDER_MAX_PENDING,
+    ):
+        """
+        Initialize the render pipeline.
+
+        Args:
+            cache: Report cache (defaults to REPORT_CACHE_DIR)
+            executor: Executor to render in (defaults to a spawn-based process pool)
+            max_workers: Process pool size when no executor is given
+            max_pending: Bound on renders queued or running
+        """
+        self.cache = cache or ReportCache()
+        self._executor = executor
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            # spawn: forking a process that holds DB pools and event loop
+            # threads is unsafe, and workers only need reportlab.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    @property
+    def pending(self) -> int:
+        return len(self._inflight)
+
+    async def render_incident_report(self, evidence: IncidentEvidence, is_demo: bool = True) -> RenderedReport:
+        """Render (or fetch from cache) the legal-grade evidence report."""
+        key = EvidenceReportGenerator(is_demo=is_demo).cache_key(evidence)
+        return await self._render("incident_report", key, evidence, {"is_demo": is_demo})
+
+    async def render_bundle(self, method: str, bundle: Any) -> RenderedReport:
+        """
+        Render an export bundle with the PDFRenderer method of that name.
+
+        Bundles carry their own bundle_id and created_at, so the cache key
+        is the full bundle: repeat downloads of one export hit the cache,
+        a fresh export renders anew.
+        """
+        if method not in self.BUNDLE_RENDER_METHODS:
+            raise ValueError(f"Unknown renderer method: {method}")
+        digest = hashlib.sha256(bundle.model_dump_json().encode()).hexdigest()
+        key = hashlib.sha256(f"{REPORT_TEMPLATE_VERSION}:{method}:{digest}".encode()).hexdigest()
+        return await self._render(method, key, bundle, {})
+
+    async def _render(self, kind: str, key: str, payload: Any, options: Dict[str, Any]) -> RenderedReport:
+        path = self.cache.get(key)
+        if path is not None:
+            RENDER_REQUESTS_TOTAL.labels(kind, "cache_hit").inc()
+            return RenderedReport(key=key, path=path, size=path.stat().st_size, cache_hit=True)
+
+        task = self._inflight.get(key)
+        if task is not None:
+            RENDER_REQUESTS_TOTAL.labels(kind, "coalesced").inc()
+        else:
+            if len(self._inflight) >= self._max_pending:
+                RENDER_REQUESTS_TOTAL.labels(kind, "rejected").inc()
+                raise RenderQueueFullError(f"{len(self._inflight)} reports already rendering")
+            task = asyncio.ensure_future(self._run(kind, key, payload, options))
+            # Retrieve the outcome even when every requester has gone away
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+            RENDER_PENDING.set(len(self._inflight))
+
+        # shield: a cancelled request must not cancel a render others share
+        return await asyncio.shield(task)
+
+    async def _run(self, kind: str, key: str, payload: Any, options: Dict[str, Any]) -> RenderedReport:
+        staged = self.cache.staging_path(key)
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            timings = await loop.run_in_executor(self.executor, _render_to_file, kind, payload, options, str(staged))
+            path = self.cache.commit(key, staged)
+        except Exception:
+            staged.unlink(missing_ok=True)
+            RENDER_REQUESTS_TOTAL.labels(kind, "failed").inc()
+            logger.exception("report_render_failed", extra={"report": kind, "key": key})
+            raise
+        finally:
+            self._inflight.pop(key, None)
+            RENDER_PENDING.set(len(self._inflight))
+
+        for section, seconds in timings.items():
+            RENDER_SECTION_SECONDS.labels(kind, section).observe(seconds)
+        RENDER_REQUESTS_TOTAL.labels(kind, "rendered").inc()
+        size = path.stat().st_size
+        logger.info(
+            "report_rendered",
+            extra={
+                "report": kind,
+                "key": key,
+                "bytes": size,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+            },
+        )
+        return RenderedReport(key=key, path=path, size=size, cache_hit=False, section_timings=timings)
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (queued renders are cancelled)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+_report_render_pipeline: Optional[ReportRenderPipeline] = None
+
+
+def get_report_render_pipeline() -> ReportRenderPipeline:
+    """Get or create ReportRenderPipeline singleton."""
+    global _report_render_pipeline
+    if _report_render_pipeline is None:
+        _report_render_pipeline = ReportRenderPipeline()
+    return _report_render_pipeline
@@ -28,6 +28,7 @@ from __future__ import annotations
 
 import io
 import logging
+import time
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
@@ -70,6 +71,8 @@ class PDFRenderer:
         """Initialize PDF renderer with styles."""
         self.styles = getSampleStyleSheet()
         self._setup_styles()
+        # Per-section build times (seconds) of the last render
+        self.section_timings: dict[str, float] = {}
 
     def _setup_styles(self) -> None:
         """Configure custom paragraph styles."""
@@ -109,16 +112,12 @@ class PDFRenderer:
             )
         )
 
-        # Body text style
-        self.styles.add(
-            ParagraphStyle(
-                "BodyText",
-                parent=self.styles["Normal"],
-                fontSize=10,
-                leading=14,
-                spaceAfter=8,
-            )
-        )
+        # Body text style (the sample sheet already defines BodyText, and
+        # add() refuses duplicates, so adjust it in place)
+        body_text = self.styles["BodyText"]
+        body_text.fontSize = 10
+        body_text.leading = 14
+        body_text.spaceAfter = 8
 
         # Alert text style
         self.styles.add(
@@ -151,28 +150,20 @@ class PDFRenderer:
             bottomMargin=0.75 * inch,
         )
 
-        story = []
-
-        # Cover page
-        story.extend(self._build_evidence_cover(bundle))
-        story.append(PageBreak())
-
-        # Summary section
-        story.extend(self._build_evidence_summary(bundle))
-
-        # Trace timeline
+        # (name, builder, page break before)
+        sections = [
+            ("cover", self._build_evidence_cover, False),
+            ("summary", self._build_evidence_summary, True),
+        ]
         if bundle.steps:
-            story.append(PageBreak())
-            story.extend(self._build_trace_timeline(bundle))
-
-        # Policy context
-        story.append(PageBreak())
-        story.extend(self._build_policy_section(bundle))
-
-        # Integrity verification
-        story.extend(self._build_integrity_section(bundle))
+            sections.append(("trace_timeline", self._build_trace_timeline, True))
+        sections += [
+            ("policy_context", self._build_policy_section, True),
+            ("integrity", self._build_integrity_section, False),
+        ]
 
-        doc.build(story)
+        story = self._build_story(bundle, sections)
+        self._build_document(doc, story)
         buffer.seek(0)
 
         logger.info(
@@ -205,29 +196,19 @@ class PDFRenderer:
             bottomMargin=0.75 * inch,
         )
 
-        story = []
-
-        # Cover page with SOC2 branding
-        story.extend(self._build_soc2_cover(bundle))
-        story.append(PageBreak())
-
-        # Control mappings
-        story.extend(self._build_control_mappings(bundle))
-        story.append(PageBreak())
-
-        # Attestation statement
-        story.extend(self._build_attestation(bundle))
-        story.append(PageBreak())
-
-        # Evidence summary (from base bundle)
-        story.extend(self._build_evidence_summary(bundle))
-
-        # Trace timeline
+        # (name, builder, page break before)
+        sections = [
+            ("cover", self._build_soc2_cover, False),
+            ("control_mappings", self._build_control_mappings, True),
+            ("attestation", self._build_attestation, True),
+            # Evidence summary (from base bundle)
+            ("summary", self._build_evidence_summary, True),
+        ]
         if bundle.steps:
-            story.append(PageBreak())
-            story.extend(self._build_trace_timeline(bundle))
+            sections.append(("trace_timeline", self._build_trace_timeline, True))
 
-        doc.build(story)
+        story = self._build_story(bundle, sections)
+        self._build_document(doc, story)
         buffer.seek(0)
 
         logger.info(
@@ -260,22 +241,16 @@ class PDFRenderer:
             bottomMargin=0.75 * inch,
         )
 
-        story = []
-
-        # Cover page
-        story.extend(self._build_exec_cover(bundle))
-        story.append(PageBreak())
-
-        # Executive summary
-        story.extend(self._build_exec_summary(bundle))
-
-        # Recommendations
-        story.extend(self._build_recommendations(bundle))
-
-        # Key metrics
-        story.extend(self._build_exec_metrics(bundle))
+        # (name, builder, page break before)
+        sections = [
+            ("cover", self._build_exec_cover, False),
+            ("summary", self._build_exec_summary, True),
+            ("recommendations", self._build_recommendations, False),
+            ("metrics", self._build_exec_metrics, False),
+        ]
 
-        doc.build(story)
+        story = self._build_story(bundle, sections)
+        self._build_document(doc, story)
         buffer.seek(0)
 
         logger.info(
@@ -288,6 +263,24 @@ class PDFRenderer:
 
         return buffer.getvalue()
 
+    def _build_story(self, bundle, sections: list) -> list:
+        """Build the story from (name, builder, page_break_before) sections, timing each."""
+        self.section_timings = {}
+        story = []
+        for name, build, page_break in sections:
+            if page_break:
+                story.append(PageBreak())
+            started = time.perf_counter()
+            story.extend(build(bundle))
+            self.section_timings[name] = time.perf_counter() - started
+        return story
+
+    def _build_document(self, doc: SimpleDocTemplate, story: list) -> None:
+        """Lay out the story, recording layout time alongside the sections."""
+        started = time.perf_counter()
+        doc.build(story)
+        self.section_timings["layout"] = time.perf_counter() - started
+
     # =========================================================================
     # Evidence PDF Builders
     # =========================================================================
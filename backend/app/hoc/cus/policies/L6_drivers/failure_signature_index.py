@@ -0,0 +1,588 @@
+# Layer: L6 — Domain Driver
+# AUDIENCE: CUSTOMER
+# Product: system-wide
+# Temporal:
+#   Trigger: worker
+#   Execution: sync
+# Lifecycle:
+#   Emits: none
+#   Subscribes: none
+# Data Access:
+#   Reads: failure_catalog, failure_matches (index reload)
+#   Writes: none
+# Database:
+#   Scope: domain (policies)
+#   Models: none (in-memory MinHash/LSH index)
+# Role: Lexical similarity tier for recovery matching — MinHash/LSH over normalised error signatures
+# Callers: recovery_matcher.py (L6 driver, app/services legacy copy)
+# Allowed Imports: L6, L7 (models)
+# Forbidden Imports: L1, L2, L3, L5
+# Reference: PIN-050 (Hybrid ML Recovery), PIN-240
+
+"""
+Failure Signature Index — lexical recovery tier
+
+Sits between the signature cache and the pgvector embedding search in
+RecoveryMatcher.suggest_hybrid(). Most failures that miss the cache are
+re-phrasings of a known failure: the same message with a different
+request id, host, port or duration. Those do not need an embedding
+round-trip (or an LLM call); a character-trigram Jaccard match against
+the catalog is enough.
+
+Index:
+- Messages are canonicalised (lowercase, UUIDs/hex/numbers replaced by
+  placeholders, whitespace collapsed) and shingled into character
+  trigrams.
+- Each entry gets a MinHash signature of RECOVERY_LEXICAL_PERMUTATIONS
+  values, split into RECOVERY_LEXICAL_BANDS bands for LSH bucketing.
+  With 64 permutations in 16 bands of 4 rows, pairs at Jaccard 0.6
+  share a band with probability ~0.9 and pairs at 0.3 with ~0.12.
+- Bucket collisions are only candidates: the exact Jaccard of the
+  trigram sets is checked against RECOVERY_LEXICAL_THRESHOLD, so the
+  band layout trades recall for lookup cost but never admits a match
+  below the threshold.
+
+Entries come from the failure catalog (failure_catalog.error_pattern)
+and recovered failure history (failure_matches with a successful
+recovery), reloaded every RECOVERY_LEXICAL_RELOAD_SECONDS, and from
+failures resolved by the embedding and LLM tiers as they happen. The
+index is per process and bounded by RECOVERY_LEXICAL_MAX_ENTRIES
+(oldest entries are evicted first).
+
+RecoveryLayerStats keeps per-layer lookup/hit counters and latency for
+cache → lexical → embedding → llm → fallback; each record is mirrored
+to the recovery_match_layer_total Prometheus counter when available.
+
+LexicalRecoveryTier is the layer as both RecoveryMatcher copies (this
+package's L6 driver and the legacy app/services one) use it: reload from
+the session the matcher hands it, look up, learn, record stats.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from app.security.sanitize import sanitize_error_message
+
+logger = logging.getLogger("nova.services.failure_signature_index")
+
+RECOVERY_LEXICAL_THRESHOLD = float(os.getenv("RECOVERY_LEXICAL_THRESHOLD", "0.6"))
+RECOVERY_LEXICAL_PERMUTATIONS = int(os.getenv("RECOVERY_LEXICAL_PERMUTATIONS", "64"))
+RECOVERY_LEXICAL_BANDS = int(os.getenv("RECOVERY_LEXICAL_BANDS", "16"))
+RECOVERY_LEXICAL_MAX_ENTRIES = int(os.getenv("RECOVERY_LEXICAL_MAX_ENTRIES", "50000"))
+RECOVERY_LEXICAL_RELOAD_SECONDS = int(os.getenv("RECOVERY_LEXICAL_RELOAD_SECONDS", "3600"))
+SHINGLE_SIZE = 3
+DEFAULT_SUCCESS_RATE = 0.8
+MAX_MESSAGE_CHARS = 500
+
+RECOVERY_LAYERS = ("cache", "lexical", "embedding", "llm", "fallback")
+
+_MERSENNE_PRIME = (1 << 31) - 1
+_HASH_SEED = 20240917
+
+_UUID_RE = re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b")
+_HEX_RE = re.compile(r"\b0x[0-9a-f]+\b|\b[0-9a-f]{12,}\b")
+_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def normalize_message(raw: Any) -> str:
+    """Sanitized, lowercased, stripped and truncated error message (as hashed into error_signature)."""
+    # Sanitize error message to prevent secrets in signatures (PIN-052)
+    return sanitize_error_message(str(raw)).lower().strip()[:MAX_MESSAGE_CHARS]
+
+
+def canonicalize(message: str) -> str:
+    """Canonical form of an error message: volatile tokens replaced, whitespace collapsed."""
+    text = str(message).lower()[:MAX_MESSAGE_CHARS]
+    text = _UUID_RE.sub("<id>", text)
+    text = _HEX_RE.sub("<hex>", text)
+    text = _NUMBER_RE.sub("<n>", text)
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def shingles(canonical: str) -> frozenset:
+    """Character trigram hashes (crc32) of a canonical message."""
+    if len(canonical) <= SHINGLE_SIZE:
+        return frozenset((zlib.crc32(canonical.encode()),)) if canonical else frozenset()
+    return frozenset(
+        zlib.crc32(canonical[i : i + SHINGLE_SIZE].encode()) for i in range(len(canonical) - SHINGLE_SIZE + 1)
+    )
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not a or not b:
+        return 0.0
+    inter = len(a & b)
+    return inter / (len(a) + len(b) - inter)
+
+
+@dataclass
+class IndexedSignature:
+    """A message indexed for lexical matching, with the recovery it resolves to."""
+
+    key: str
+    error_code: str
+    error_pattern: str
+    recovery_action: str
+    success_rate: float
+    source: str  # catalog | history | embedding | llm
+    catalog_id: Optional[str]
+    shingles: frozenset
+    bands: tuple
+
+
+@dataclass
+class LexicalMatch:
+    """Best lexical match for a message."""
+
+    entry: IndexedSignature
+    similarity: float
+    candidates: int
+
+    @property
+    def suggestion(self) -> str:
+        return self.entry.recovery_action
+
+    @property
+    def confidence(self) -> float:
+        return min(0.95, self.similarity * self.entry.success_rate)
+
+    def explain(self) -> Dict[str, Any]:
+        return {
+            "method": "lexical",
+            "similarity": round(self.similarity, 4),
+            "catalog_id": self.entry.catalog_id,
+            "indexed_from": self.entry.source,
+        }
+
+    def cache_entry(self) -> Dict[str, Any]:
+        """Value stored in the recovery signature cache."""
+        return {
+            "suggestion": self.suggestion,
+            "confidence": self.confidence,
+            "matched_entry": self.as_matched_entry(),
+        }
+
+    def as_matched_entry(self) -> Dict[str, Any]:
+        """Shape of matched_entry used by the embedding tier."""
+        return {
+            "id": self.entry.catalog_id,
+            "error_code": self.entry.error_code,
+            "error_pattern": self.entry.error_pattern,
+            "recovery_action": self.entry.recovery_action,
+            "success_rate": self.entry.success_rate,
+            "similarity": round(self.similarity, 4),
+            "source": "lexical",
+            "indexed_from": self.entry.source,
+        }
+
+
+class FailureSignatureIndex:
+    """
+    MinHash/LSH index over canonicalised error messages.
+
+    Thread-safe: the worker pool and the API share one index per process.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold: float = RECOVERY_LEXICAL_THRESHOLD,
+        num_perm: int = RECOVERY_LEXICAL_PERMUTATIONS,
+        bands: int = RECOVERY_LEXICAL_BANDS,
+        max_entries: int = RECOVERY_LEXICAL_MAX_ENTRIES,
+        reload_seconds: int = RECOVERY_LEXICAL_RELOAD_SECONDS,
+    ):
+        if num_perm <= 0 or bands <= 0 or num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a positive multiple of bands ({bands})")
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.max_entries = max_entries
+        self.reload_seconds = reload_seconds
+        self.loaded_at: Optional[float] = None
+
+        rng = np.random.default_rng(_HASH_SEED)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+        self._entries: "OrderedDict[str, IndexedSignature]" = OrderedDict()
+        self._buckets: List[Dict[bytes, set]] = [{} for _ in range(bands)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # -------------------------------------------------------------------------
+    # Signatures
+    # -------------------------------------------------------------------------
+
+    def _band_keys(self, shingle_set: frozenset) -> tuple:
+        """MinHash signature of a shingle set, split into LSH band keys."""
+        x = np.fromiter(shingle_set, dtype=np.uint64, count=len(shingle_set))
+        # x < 2^32 and a < 2^31, so a * x + b stays inside uint64
+        signature = ((np.outer(x, self._a) + self._b) % _MERSENNE_PRIME).min(axis=0).astype(np.uint32)
+        raw = signature.tobytes()
+        width = self.rows * 4
+        return tuple(raw[i * width : (i + 1) * width] for i in range(self.bands))
+
+    # -------------------------------------------------------------------------
+    # Mutation
+    # -------------------------------------------------------------------------
+
+    def add(
+        self,
+        message: str,
+        *,
+        error_code: str,
+        recovery_action: str,
+        success_rate: Optional[float] = None,
+        source: str = "catalog",
+        catalog_id: Optional[str] = None,
+    ) -> bool:
+        """
+        Index a message and the recovery it resolves to.
+
+        Re-adding a message with the same canonical form replaces its
+        recovery. Returns False if the message or recovery is empty.
+        """
+        canonical = canonicalize(message)
+        if not canonical or not recovery_action:
+            return False
+        shingle_set = shingles(canonical)
+        entry = IndexedSignature(
+            key=hashlib.sha256(canonical.encode()).hexdigest()[:16],
+            error_code=error_code,
+            error_pattern=str(message)[:MAX_MESSAGE_CHARS],
+            recovery_action=recovery_action,
+            success_rate=DEFAULT_SUCCESS_RATE if success_rate is None else float(success_rate),
+            source=source,
+            catalog_id=catalog_id,
+            shingles=shingle_set,
+            bands=self._band_keys(shingle_set),
+        )
+        with self._lock:
+            self._discard(entry.key)
+            self._entries[entry.key] = entry
+            for band, key in enumerate(entry.bands):
+                self._buckets[band].setdefault(key, set()).add(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+        return True
+
+    def _discard(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for band, band_key in enumerate(entry.bands):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def load(self, rows: Iterable[Dict[str, Any]], now: Optional[float] = None) -> int:
+        """
+        Replace catalog and history entries with `rows`.
+
+        Rows carry error_pattern, error_code, recovery_action and optionally
+        success_rate, id and source (default "catalog"). Entries learned
+        from the embedding and LLM tiers are kept and re-added after the
+        rows, so they stay the most recently inserted. Returns the number
+        of rows indexed.
+        """
+        with self._lock:
+            learned = [e for e in self._entries.values() if e.source in ("embedding", "llm")]
+            self._entries.clear()
+            self._buckets = [{} for _ in range(self.bands)]
+        indexed = 0
+        for row in rows:
+            indexed += self.add(
+                row.get("error_pattern") or "",
+                error_code=row.get("error_code") or "UNKNOWN",
+                recovery_action=row.get("recovery_action") or "",
+                success_rate=row.get("success_rate"),
+                source=row.get("source") or "catalog",
+                catalog_id=str(row["id"]) if row.get("id") is not None else None,
+            )
+        for entry in learned:
+            self.add(
+                entry.error_pattern,
+                error_code=entry.error_code,
+                recovery_action=entry.recovery_action,
+                success_rate=entry.success_rate,
+                source=entry.source,
+                catalog_id=entry.catalog_id,
+            )
+        self.loaded_at = time.monotonic() if now is None else now
+        return indexed
+
+    def needs_reload(self, now: Optional[float] = None) -> bool:
+        """True before the first load and every reload_seconds after it."""
+        if self.loaded_at is None:
+            return True
+        now = time.monotonic() if now is None else now
+        return now - self.loaded_at >= self.reload_seconds
+
+    # -------------------------------------------------------------------------
+    # Lookup
+    # -------------------------------------------------------------------------
+
+    def lookup(self, message: str, error_code: Optional[str] = None) -> Optional[LexicalMatch]:
+        """
+        Best entry at or above the Jaccard threshold, or None.
+
+        Ties on similarity prefer an entry with the same error_code, then
+        the larger key (deterministic across runs).
+        """
+        canonical = canonicalize(message)
+        if not canonical or not self._entries:
+            return None
+        shingle_set = shingles(canonical)
+        band_keys = self._band_keys(shingle_set)
+        with self._lock:
+            candidates: set = set()
+            for band, key in enumerate(band_keys):
+                bucket = self._buckets[band].get(key)
+                if bucket:
+                    candidates |= bucket
+            best: Optional[IndexedSignature] = None
+            best_rank: tuple = (self.threshold, False, "")
+            best_similarity = 0.0
+            for key in candidates:
+                entry = self._entries[key]
+                similarity = jaccard(shingle_set, entry.shingles)
+                rank = (similarity, entry.error_code == error_code, key)
+                if rank >= best_rank:
+                    best, best_rank, best_similarity = entry, rank, similarity
+        if best is None:
+            return None
+        return LexicalMatch(entry=best, similarity=best_similarity, candidates=len(candidates))
+
+
+# =============================================================================
+# Per-layer hit metrics
+# =============================================================================
+
+
+@dataclass
+class _LayerOutcome:
+    hit: bool = False
+
+
+class RecoveryLayerStats:
+    """Lookup/hit counters and latency per recovery layer."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._lookups = {layer: 0 for layer in RECOVERY_LAYERS}
+            self._hits = {layer: 0 for layer in RECOVERY_LAYERS}
+            self._seconds = {layer: 0.0 for layer in RECOVERY_LAYERS}
+
+    def record(self, layer: str, hit: bool, seconds: float = 0.0) -> None:
+        """Record one lookup at `layer`; `hit` means the layer resolved the failure."""
+        with self._lock:
+            self._lookups[layer] += 1
+            self._hits[layer] += int(hit)
+            self._seconds[layer] += seconds
+        try:
+            from app.metrics import recovery_match_layer_total
+
+            recovery_match_layer_total.labels(layer=layer, outcome="hit" if hit else "miss").inc()
+        except Exception:
+            pass
+
+    @contextmanager
+    def timed(self, layer: str) -> Iterator["_LayerOutcome"]:
+        """Time a layer lookup; set `.hit` on the yielded outcome before the block ends."""
+        outcome = _LayerOutcome()
+        started = time.perf_counter()
+        try:
+            yield outcome
+        finally:
+            self.record(layer, outcome.hit, time.perf_counter() - started)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-layer lookups, hits, hit_rate and mean latency (ms)."""
+        with self._lock:
+            return {
+                layer: {
+                    "lookups": self._lookups[layer],
+                    "hits": self._hits[layer],
+                    "hit_rate": round(self._hits[layer] / self._lookups[layer], 4) if self._lookups[layer] else 0.0,
+                    "avg_ms": round(self._seconds[layer] * 1000 / self._lookups[layer], 3)
+                    if self._lookups[layer]
+                    else 0.0,
+                }
+                for layer in RECOVERY_LAYERS
+            }
+
+
+_index: Optional[FailureSignatureIndex] = None
+_stats: Optional[RecoveryLayerStats] = None
+_singleton_lock = threading.Lock()
+
+
+def get_failure_signature_index() -> FailureSignatureIndex:
+    """Process-wide failure signature index."""
+    global _index
+    if _index is None:
+        with _singleton_lock:
+            if _index is None:
+                _index = FailureSignatureIndex()
+    return _index
+
+
+def get_recovery_layer_stats() -> RecoveryLayerStats:
+    """Process-wide recovery layer stats."""
+    global _stats
+    if _stats is None:
+        with _singleton_lock:
+            if _stats is None:
+                _stats = RecoveryLayerStats()
+    return _stats
+
+
+# =============================================================================
+# Matcher layer
+# =============================================================================
+
+
+class LexicalRecoveryTier:
+    """
+    Lexical layer of RecoveryMatcher.suggest_hybrid().
+
+    `get_session` is called only when the index is due for a reload; the
+    reload reads through the matcher's session and never commits.
+    """
+
+    def __init__(
+        self,
+        get_session: Callable[[], Any],
+        *,
+        index: Optional[FailureSignatureIndex] = None,
+        stats: Optional[RecoveryLayerStats] = None,
+    ):
+        self._get_session = get_session
+        self.index = index or get_failure_signature_index()
+        self.stats = stats or get_recovery_layer_stats()
+
+    def resolve(self, error_code: str, error_message: str) -> Optional[LexicalMatch]:
+        """Best match at or above the threshold for a raw error message, recorded as the "lexical" layer."""
+        with self.stats.timed("lexical") as layer:
+            if self.index.needs_reload():
+                self.reload()
+            match = self.index.lookup(normalize_message(error_message), error_code)
+            layer.hit = match is not None
+        return match
+
+    def learn(self, error_code: str, error_message: str, suggestion: str, source: str, **kwargs: Any) -> None:
+        """Index a failure resolved by the embedding or LLM layer for later lexical hits."""
+        try:
+            self.index.add(
+                normalize_message(error_message),
+                error_code=error_code,
+                recovery_action=suggestion,
+                source=source,
+                **kwargs,
+            )
+        except Exception as e:
+            logger.debug(f"Lexical index update failed (non-fatal): {e}")
+
+    def reload(self) -> None:
+        """Reload catalog and history rows; on failure keep the current entries until the next interval."""
+        try:
+            indexed = self.index.load(self.load_catalog_rows(self._get_session()))
+            logger.info(f"Lexical index loaded {indexed} signatures ({len(self.index)} total)")
+        except Exception as e:
+            self.index.loaded_at = time.monotonic()
+            logger.warning(f"Lexical index load failed: {e}")
+
+    @staticmethod
+    def load_catalog_rows(session: Any) -> List[Dict[str, Any]]:
+        """
+        Rows for the index: recovered failure history, then the catalog.
+
+        History is loaded first (oldest to newest) so that, once the index
+        is full, it is evicted before catalog entries.
+        """
+        from sqlalchemy import text
+
+        rows: List[Dict[str, Any]] = []
+
+        try:
+            result = session.execute(
+                text(
+                    """
+                SELECT id, error_code, error_message, recovery_suggestion
+                FROM failure_matches
+                WHERE recovery_succeeded IS TRUE
+                  AND recovery_suggestion IS NOT NULL
+                  AND error_message IS NOT NULL
+                ORDER BY created_at DESC
+                LIMIT :limit
+                """
+                ),
+                {"limit": RECOVERY_LEXICAL_MAX_ENTRIES // 2},
+            )
+            rows.extend(
+                {
+                    "id": str(row[0]),
+                    "error_code": row[1],
+                    "error_pattern": normalize_message(row[2]),
+                    "recovery_action": row[3],
+                    "source": "history",
+                }
+                for row in reversed(result.fetchall())
+            )
+        except Exception as e:
+            logger.warning(f"Lexical index history load failed: {e}")
+
+        try:
+            result = session.execute(
+                text(
+                    """
+                SELECT id, error_code, error_pattern, recovery_action, success_rate
+                FROM failure_catalog
+                WHERE error_pattern IS NOT NULL
+                  AND recovery_action IS NOT NULL
+                ORDER BY id
+                LIMIT :limit
+                """
+                ),
+                {"limit": RECOVERY_LEXICAL_MAX_ENTRIES // 2},
+            )
+            rows.extend(
+                {
+                    "id": str(row[0]),
+                    "error_code": row[1],
+                    "error_pattern": normalize_message(row[2]),
+                    "recovery_action": row[3],
+                    "success_rate": float(row[4]) if row[4] else None,
+                    "source": "catalog",
+                }
+                for row in result.fetchall()
+            )
+        except Exception as e:
+            logger.warning(f"Lexical index catalog load failed: {e}")
+
+        return rows
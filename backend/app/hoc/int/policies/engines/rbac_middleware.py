@@ -42,6 +42,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.types import ASGIApp
 
+from app.hoc.cus.hoc_spine.authority.rbac_policy import PathPolicyRouter, build_path_rules
 from app.utils.metrics_helpers import get_or_create_counter, get_or_create_histogram
 from .contexts import (
     FounderAuthContext,
@@ -58,7 +59,7 @@ from .oidc_provider import (
     map_keycloak_roles_to_aos,
     validate_token,
 )
-from .rbac_rules_loader import get_public_paths
+from .rbac_rules_loader import get_public_paths, load_rbac_rules
 from .shadow_audit import (
     record_shadow_audit_metric,
     shadow_aggregator,
@@ -329,6 +330,49 @@ RBAC_MATRIX: Dict[str, Dict[str, List[str]]] = {
 # ============================================================================
 
 
+# Legacy list for shadow comparison (remove after Phase 2B validation)
+_LEGACY_PUBLIC_PATHS = [
+    "/health",
+    "/metrics",
+    "/api/v1/auth/",
+    "/api/v1/c2/predictions/",
+    # REMOVED: "/api/v1/activity/" - now requires auth via unified facade
+    "/api/v1/policy-proposals/",
+    # REMOVED: "/api/v1/incidents/" - now requires auth via unified facade
+    "/docs",
+    "/openapi.json",
+    "/redoc",
+    "/fdr/",
+    "/platform/",
+]
+
+# (rules tuple, environment, router, legacy router): recompiled when RBAC_RULES.yaml is reloaded
+_compiled_routers = None
+
+
+def _default_policy() -> PolicyObject:
+    # CATCH-ALL: Unknown paths default to runtime:query
+    # This ensures no path returns None for protected routes
+    return PolicyObject(resource="runtime", action="query")
+
+
+def _get_policy_routers():
+    """Path routers compiled from the coded /api/v1 rules, with schema and legacy public paths."""
+    global _compiled_routers
+
+    rules = load_rbac_rules()
+    compiled = _compiled_routers
+    if compiled is None or compiled[0] is not rules or compiled[1] != CURRENT_ENVIRONMENT:
+        path_rules = build_path_rules("/api/v1", PolicyObject)
+        compiled = _compiled_routers = (
+            rules,
+            CURRENT_ENVIRONMENT,
+            PathPolicyRouter(path_rules, get_public_paths(environment=CURRENT_ENVIRONMENT), _default_policy),
+            PathPolicyRouter(path_rules, _LEGACY_PUBLIC_PATHS, _default_policy),
+        )
+    return compiled[2], compiled[3]
+
+
 def get_policy_for_path(path: str, method: str) -> Optional[PolicyObject]:
     """
     Map request path and method to a PolicyObject.
@@ -351,36 +395,17 @@ def get_policy_for_path(path: str, method: str) -> Optional[PolicyObject]:
     # - /metrics: GLOBAL metrics, NO tenant_id in labels
     # - /api/v1/auth/: Login flow, unauthenticated by definition
     # - /docs: OpenAPI spec, no sensitive data
+    #
+    # PROMETHEUS posture (see build_path_rules):
+    # /metrics is PUBLIC; /-/reload needs prometheus:reload; query endpoints
+    # need prometheus:query. Metrics MUST NOT carry tenant_id labels.
     # =========================================================================
+    router, legacy_router = _get_policy_routers()
 
-    # Schema-driven public paths (PIN-391)
-    PUBLIC_PATHS = get_public_paths(environment=CURRENT_ENVIRONMENT)
-
-    # Legacy list for shadow comparison (remove after Phase 2B validation)
-    _LEGACY_PUBLIC_PATHS = [
-        "/health",
-        "/metrics",
-        "/api/v1/auth/",
-        "/api/v1/c2/predictions/",
-        # REMOVED: "/api/v1/activity/" - now requires auth via unified facade
-        "/api/v1/policy-proposals/",
-        # REMOVED: "/api/v1/incidents/" - now requires auth via unified facade
-        "/docs",
-        "/openapi.json",
-        "/redoc",
-        "/fdr/",
-        "/platform/",
-    ]
-
-    # Check if path matches schema-driven public paths
-    is_public_schema = any(
-        path.startswith(public_path) or path == public_path.rstrip("/") for public_path in PUBLIC_PATHS
-    )
+    is_public_schema = router.is_public(path)
 
     # Shadow comparison: detect discrepancies between legacy and schema
-    is_public_legacy = any(
-        path.startswith(public_path) or path == public_path.rstrip("/") for public_path in _LEGACY_PUBLIC_PATHS
-    )
+    is_public_legacy = legacy_router.is_public(path)
 
     if is_public_schema != is_public_legacy:
         # Log discrepancy for monitoring (PIN-391 shadow mode)
@@ -392,326 +417,7 @@ def get_policy_for_path(path: str, method: str) -> Optional[PolicyObject]:
             CURRENT_ENVIRONMENT,
         )
 
-    if is_public_schema:
-        return None
-
-    # =========================================================================
-    # MEMORY PINS (/api/v1/memory/pins)
-    # =========================================================================
-    if path.startswith("/api/v1/memory/pins"):
-        if path.endswith("/cleanup"):
-            return PolicyObject(resource="memory_pin", action="admin")
-        elif method == "GET":
-            return PolicyObject(resource="memory_pin", action="read")
-        elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="memory_pin", action="write")
-        elif method == "DELETE":
-            return PolicyObject(resource="memory_pin", action="delete")
-
-    # =========================================================================
-    # PROMETHEUS & METRICS
-    #
-    # SECURITY POSTURE:
-    # 1. /metrics endpoint is PUBLIC (no auth) - standard Prometheus scrape
-    # 2. Metrics are GLOBAL - no tenant-scoped data in labels
-    # 3. /-/reload requires "prometheus:reload" permission (infra+)
-    # 4. Query endpoints require "prometheus:query" permission
-    #
-    # TENANT LEAKAGE: Metrics MUST NOT contain tenant_id in labels.
-    # If metrics become tenant-aware, they MUST move behind RBAC.
-    # =========================================================================
-    if path.startswith("/-/reload") or path.startswith("/api/observability/prom-reload"):
-        return PolicyObject(resource="prometheus", action="reload")
-
-    if path.startswith("/api/v1/query") or path.startswith("/api/prometheus"):
-        return PolicyObject(resource="prometheus", action="query")
-
-    # =========================================================================
-    # COSTSIM (/api/v1/costsim)
-    # =========================================================================
-    if path.startswith("/api/v1/costsim"):
-        if method == "GET":
-            return PolicyObject(resource="costsim", action="read")
-        else:
-            return PolicyObject(resource="costsim", action="write")
-
-    # =========================================================================
-    # POLICY (/api/v1/policy)
-    # =========================================================================
-    if path.startswith("/api/v1/policy"):
-        if "/approve" in path or "/reject" in path:
-            return PolicyObject(resource="policy", action="approve")
-        elif method == "GET":
-            return PolicyObject(resource="policy", action="read")
-        else:
-            return PolicyObject(resource="policy", action="write")
-
-    # =========================================================================
-    # AGENTS (/api/v1/agents)
-    # =========================================================================
-    if path.startswith("/api/v1/agents"):
-        if "/heartbeat" in path:
-            return PolicyObject(resource="agent", action="heartbeat")
-        elif "/register" in path:
-            return PolicyObject(resource="agent", action="register")
-        elif method == "GET":
-            return PolicyObject(resource="agent", action="read")
-        elif method == "POST":
-            return PolicyObject(resource="agent", action="write")
-        elif method in ("PUT", "PATCH"):
-            return PolicyObject(resource="agent", action="write")
-        elif method == "DELETE":
-            return PolicyObject(resource="agent", action="delete")
-
-    # =========================================================================
-    # RUNTIME (/api/v1/runtime)
-    # =========================================================================
-    if path.startswith("/api/v1/runtime"):
-        if "/simulate" in path:
-            return PolicyObject(resource="runtime", action="simulate")
-        elif "/capabilities" in path:
-            return PolicyObject(resource="runtime", action="capabilities")
-        elif "/query" in path or method == "GET":
-            return PolicyObject(resource="runtime", action="query")
-        else:
-            return PolicyObject(resource="runtime", action="query")
-
-    # =========================================================================
-    # RECOVERY (/api/v1/recovery)
-    # =========================================================================
-    if path.startswith("/api/v1/recovery"):
-        if "/execute" in path or "/apply" in path:
-            return PolicyObject(resource="recovery", action="execute")
-        elif "/suggest" in path:
-            return PolicyObject(resource="recovery", action="suggest")
-        elif method == "GET":
-            return PolicyObject(resource="recovery", action="read")
-        elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="recovery", action="write")
-
-    # =========================================================================
-    # WORKERS (/api/v1/workers)
-    # =========================================================================
-    if path.startswith("/api/v1/workers"):
-        if "/run" in path or "/execute" in path:
-            return PolicyObject(resource="worker", action="run")
-        elif "/stream" in path:
-            return PolicyObject(resource="worker", action="stream")
-        elif "/cancel" in path or "/stop" in path:
-            return PolicyObject(resource="worker", action="cancel")
-        elif method == "GET":
-            return PolicyObject(resource="worker", action="read")
-
-    # =========================================================================
-    # TRACES (/api/v1/traces)
-    # =========================================================================
-    if path.startswith("/api/v1/traces"):
-        if "/export" in path:
-            return PolicyObject(resource="trace", action="export")
-        elif method == "GET":
-            return PolicyObject(resource="trace", action="read")
-        elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="trace", action="write")
-        elif method == "DELETE":
-            return PolicyObject(resource="trace", action="delete")
-
-    # =========================================================================
-    # EMBEDDING (/api/v1/embedding)
-    # =========================================================================
-    if path.startswith("/api/v1/embedding"):
-        # Check /query and /search FIRST (more specific than base /embedding)
-        if "/query" in path or "/search" in path:
-            return PolicyObject(resource="embedding", action="query")
-        # Then check /embed endpoint (POST only) - use path.endswith to avoid matching /embedding
-        elif path.endswith("/embed") and method == "POST":
-            return PolicyObject(resource="embedding", action="embed")
-        elif method == "GET":
-            return PolicyObject(resource="embedding", action="read")
-        # POST to base /embedding for embed
-        elif method == "POST":
-            return PolicyObject(resource="embedding", action="embed")
-
-    # =========================================================================
-    # KILLSWITCH (/v1/killswitch, /api/v1/killswitch)
-    # =========================================================================
-    if "/killswitch" in path:
-        if "/activate" in path or "/engage" in path:
-            return PolicyObject(resource="killswitch", action="activate")
-        elif "/reset" in path or "/disengage" in path:
-            return PolicyObject(resource="killswitch", action="reset")
-        else:
-            return PolicyObject(resource="killswitch", action="read")
-
-    # =========================================================================
-    # INTEGRATION (/integration, /api/v1/integration)
-    # =========================================================================
-    if "/integration" in path:
-        # Check /resolve FIRST (more specific - appears in /checkpoints/123/resolve)
-        if "/resolve" in path:
-            return PolicyObject(resource="integration", action="resolve")
-        elif "/checkpoint" in path:
-            return PolicyObject(resource="integration", action="checkpoint")
-        elif method == "GET":
-            return PolicyObject(resource="integration", action="read")
-
-    # =========================================================================
-    # COST (/cost, /api/v1/cost)
-    # =========================================================================
-    if "/cost" in path and "/costsim" not in path:
-        if "/simulate" in path:
-            return PolicyObject(resource="cost", action="simulate")
-        elif "/forecast" in path:
-            return PolicyObject(resource="cost", action="forecast")
-        else:
-            return PolicyObject(resource="cost", action="read")
-
-    # =========================================================================
-    # CHECKPOINTS (/api/v1/checkpoints)
-    # =========================================================================
-    if path.startswith("/api/v1/checkpoints"):
-        if "/restore" in path:
-            return PolicyObject(resource="checkpoint", action="restore")
-        elif method == "GET":
-            return PolicyObject(resource="checkpoint", action="read")
-        elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="checkpoint", action="write")
-
-    # =========================================================================
-    # EVENTS (/api/v1/events)
-    # =========================================================================
-    if path.startswith("/api/v1/events"):
-        if "/subscribe" in path:
-            return PolicyObject(resource="event", action="subscribe")
-        elif "/publish" in path and method == "POST":
-            return PolicyObject(resource="event", action="publish")
-        else:
-            return PolicyObject(resource="event", action="read")
-
-    # =========================================================================
-    # INCIDENTS (/api/v1/incidents)
-    # =========================================================================
-    if path.startswith("/api/v1/incidents") or "/incidents" in path:
-        if "/resolve" in path:
-            return PolicyObject(resource="incident", action="resolve")
-        elif method == "GET":
-            return PolicyObject(resource="incident", action="read")
-        elif method in ("POST", "PUT", "PATCH"):
-            return PolicyObject(resource="incident", action="write")
-
-    # =========================================================================
-    # RBAC (/api/v1/rbac)
-    # =========================================================================
-    if path.startswith("/api/v1/rbac"):
-        if "/reload" in path:
-            return PolicyObject(resource="rbac", action="reload")
-        elif "/audit" in path:
-            return PolicyObject(resource="rbac", action="audit")
-        else:
-            return PolicyObject(resource="rbac", action="read")
-
-    # =========================================================================
-    # TENANTS (/api/v1/tenants)
-    # =========================================================================
-    if path.startswith("/api/v1/tenants"):
-        if "/freeze" in path:
-            return PolicyObject(resource="tenant", action="freeze")
-        elif method == "GET":
-            return PolicyObject(resource="tenant", action="read")
-        elif method == "POST":
-            return PolicyObject(resource="tenant", action="write")
-        elif method == "DELETE":
-            return PolicyObject(resource="tenant", action="delete")
-
-    # =========================================================================
-    # RUNS (/api/v1/runs) - Maps to worker resource
-    # =========================================================================
-    if path.startswith("/api/v1/runs"):
-        if method == "GET":
-            return PolicyObject(resource="worker", action="read")
-        elif method == "POST":
-            return PolicyObject(resource="worker", action="run")
-
-    # =========================================================================
-    # V1 PROXY ROUTES (/v1/chat, /v1/embeddings, /v1/status)
-    # =========================================================================
-    if path.startswith("/v1/"):
-        # Chat/completions
-        if "/chat" in path or "/completions" in path:
-            return PolicyObject(resource="runtime", action="simulate")
-        # Embeddings
-        if "/embeddings" in path:
-            return PolicyObject(resource="embedding", action="embed")
-        # Status
-        if "/status" in path:
-            return PolicyObject(resource="runtime", action="query")
-        # Policies
-        if "/policies" in path:
-            return PolicyObject(resource="policy", action="read")
-        # Demo/replay
-        if "/demo" in path or "/replay" in path:
-            return PolicyObject(resource="trace", action="read")
-
-    # =========================================================================
-    # CUSTOMER ROUTES (/cus/*) - Phase 4C-2 Customer Visibility
-    # PRE-RUN declarations and outcome reconciliation
-    # =========================================================================
-    if path.startswith("/cus/"):
-        if "/pre-run" in path:
-            return PolicyObject(resource="runtime", action="query")
-        elif "/acknowledge" in path:
-            return PolicyObject(resource="runtime", action="query")
-        elif "/outcome" in path:
-            return PolicyObject(resource="runtime", action="query")
-        elif "/declaration" in path:
-            return PolicyObject(resource="runtime", action="query")
-        else:
-            return PolicyObject(resource="runtime", action="query")
-
-    # =========================================================================
-    # GUARD ROUTES (/guard/*) - Customer Console
-    # These are handled by console_auth, but we still map them for shadow audit
-    # =========================================================================
-    if path.startswith("/guard/"):
-        if "/costs" in path:
-            return PolicyObject(resource="cost", action="read")
-        elif "/incidents" in path:
-            return PolicyObject(resource="incident", action="read")
-        else:
-            # Default guard access
-            return PolicyObject(resource="runtime", action="query")
-
-    # =========================================================================
-    # OPS ROUTES (/ops/*) - Founder Console
-    # These are handled by fops_auth, but we still map them for shadow audit
-    # =========================================================================
-    if path.startswith("/ops/"):
-        if "/cost" in path:
-            return PolicyObject(resource="cost", action="read")
-        elif "/customers" in path or "/tenants" in path:
-            return PolicyObject(resource="tenant", action="read")
-        elif "/incidents" in path:
-            return PolicyObject(resource="incident", action="read")
-        elif "/actions" in path:
-            return PolicyObject(resource="tenant", action="write")
-        else:
-            # Default ops access
-            return PolicyObject(resource="runtime", action="query")
-
-    # =========================================================================
-    # FOUNDER TIMELINE (/fdr/timeline/*) - Phase 5E-1
-    # Decision records visibility for founder forensics
-    # =========================================================================
-    if path.startswith("/fdr/timeline"):
-        # Read-only timeline access - maps to runtime:query
-        return PolicyObject(resource="runtime", action="query")
-
-    # =========================================================================
-    # CATCH-ALL: Unknown paths default to runtime:query
-    # This ensures no path returns None for protected routes
-    # =========================================================================
-    # Log unknown paths for visibility
-    logger.debug(f"rbac_unknown_path: {path} {method} - defaulting to runtime:query")
-    return PolicyObject(resource="runtime", action="query")
+    return router.resolve(path, method)
 
 
 # ============================================================================
@@ -1297,7 +1297,7 @@ class RunRunner:
                 # 2. Track run consumed and deduct from agent budget
                 if step_cost_cents > 0:
                     run_consumed_cents += step_cost_cents
-                    deduct_budget(run.agent_id, step_cost_cents)
+                    deduct_budget(run.agent_id, step_cost_cents, run_id=self.run_id)
 
                     logger.debug(
                         "step_cost_tracked",
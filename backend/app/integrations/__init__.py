@@ -29,6 +29,7 @@ logger = logging.getLogger(__name__)
 
 # Singleton dispatcher instance
 _dispatcher: Optional["IntegrationDispatcher"] = None
+_coalescer: Optional["DispatchCoalescer"] = None
 
 from .bridges import (
     IncidentToCatalogBridge,
@@ -37,7 +38,7 @@ from .bridges import (
     PolicyToRoutingBridge,
     RecoveryToPolicyBridge,
 )
-from .dispatcher import IntegrationDispatcher
+from .dispatcher import DispatchCoalescer, IntegrationDispatcher
 from .events import (
     ConfidenceBand,
     HumanCheckpoint,
@@ -90,6 +91,7 @@ __all__ = [
     "HumanCheckpoint",
     # Dispatcher
     "IntegrationDispatcher",
+    "DispatchCoalescer",
     # Bridges
     "IncidentToCatalogBridge",
     "PatternToRecoveryBridge",
@@ -113,6 +115,7 @@ __all__ = [
     "PreventionTimeline",
     # Dispatcher factory
     "get_dispatcher",
+    "get_dispatch_coalescer",
     "trigger_integration_loop",
 ]
 
@@ -167,6 +170,20 @@ def get_dispatcher() -> IntegrationDispatcher:
     return _dispatcher
 
 
+def get_dispatch_coalescer() -> DispatchCoalescer:
+    """
+    Get the singleton coalescer in front of the M25 dispatcher.
+
+    Concurrent trigger_integration_loop() calls go through it so that a
+    burst of new incidents is dispatched as one dispatch_many() batch.
+    """
+    global _coalescer
+
+    if _coalescer is None:
+        _coalescer = DispatchCoalescer(get_dispatcher())
+    return _coalescer
+
+
 async def trigger_integration_loop(
     incident_id: str,
     tenant_id: str,
@@ -187,10 +204,13 @@ async def trigger_integration_loop(
         tenant_id: The tenant ID
         incident_data: Incident details for pattern matching
 
+    Concurrent calls are coalesced into one dispatch_many() batch (see
+    DispatchCoalescer); each caller still gets its own incident's result.
+
     Returns:
         LoopEvent: The final event after processing through all stages
     """
-    dispatcher = get_dispatcher()
+    coalescer = get_dispatch_coalescer()
 
     # Create the initial loop event
     initial_event = LoopEvent.create(
@@ -206,7 +226,7 @@ async def trigger_integration_loop(
     logger.info(f"Triggering M25 integration loop for incident {incident_id}")
 
     # Dispatch through the loop
-    result = await dispatcher.dispatch(initial_event)
+    result = await coalescer.dispatch(initial_event)
 
     logger.info(
         f"M25 loop completed for incident {incident_id}: stage={result.stage.value}, success={result.is_success}"
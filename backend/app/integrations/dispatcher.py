@@ -17,6 +17,13 @@ Orchestrates the feedback loop with:
 - Failure state handling
 - Human checkpoint integration
 - Guardrail enforcement
+- Batched stage pipeline: dispatch_many() advances a burst of incidents
+  one stage per iteration with one round trip per step; dispatch() is a
+  batch of one. Loop mechanics (stage order, idempotency, checkpoints,
+  status transitions) are the same as per-event dispatch.
+- DispatchCoalescer collects events dispatched concurrently (e.g. one
+  trigger_integration_loop() call per new incident) into one
+  dispatch_many() call.
 
 FROZEN: 2025-12-23
 Do NOT modify loop mechanics without explicit approval.
@@ -27,11 +34,14 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Callable, Coroutine, Optional
+from typing import Any, Callable, Coroutine, Optional, Sequence
 from uuid import uuid4
 
+from prometheus_client import Counter, Histogram
+
 from .events import (
     LOOP_MECHANICS_FROZEN_AT,
     LOOP_MECHANICS_VERSION,
@@ -47,6 +57,41 @@ from .events import (
 
 logger = logging.getLogger(__name__)
 
+# =============================================================================
+# METRICS
+# =============================================================================
+
+LOOP_STAGE_EVENTS_TOTAL = Counter(
+    "integration_loop_stage_events_total",
+    "Loop events processed per stage by outcome",
+    ["stage", "outcome"],  # completed, failed, checkpoint, idempotent, skipped, error
+)
+
+LOOP_STAGE_LAG_SECONDS = Histogram(
+    "integration_loop_stage_lag_seconds",
+    "Time from event creation until its stage batch starts",
+    ["stage"],
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 120],
+)
+
+LOOP_STAGE_BATCH_SIZE = Histogram(
+    "integration_loop_stage_batch_size",
+    "Events per dispatcher stage batch",
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500],
+)
+
+LOOP_COALESCED_BATCH_SIZE = Histogram(
+    "integration_loop_coalesced_batch_size",
+    "Events per dispatch_many() call made by the dispatch coalescer",
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500],
+)
+
+LOOP_STAGE_BATCH_SECONDS = Histogram(
+    "integration_loop_stage_batch_seconds",
+    "Wall time of one dispatcher stage batch",
+    buckets=[0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30],
+)
+
 
 # =============================================================================
 # DISPATCHER CONFIGURATION
@@ -79,6 +124,10 @@ class DispatcherConfig:
     require_human_for_weak_match: bool = True
     require_human_for_novel: bool = True
 
+    # Dispatch coalescing (trigger_integration_loop)
+    coalesce_window_seconds: float = 0.005
+    coalesce_max_batch: int = 100
+
     @classmethod
     def from_env(cls) -> "DispatcherConfig":
         """Load config from environment variables."""
@@ -93,6 +142,8 @@ class DispatcherConfig:
             bridge_5_enabled=os.getenv("BRIDGE_5_ENABLED", "true").lower() == "true",
             policy_confirmations_required=int(os.getenv("POLICY_CONFIRMATIONS", "3")),
             max_routing_delta=float(os.getenv("MAX_ROUTING_DELTA", "0.2")),
+            coalesce_window_seconds=float(os.getenv("INTEGRATION_LOOP_COALESCE_MS", "5")) / 1000,
+            coalesce_max_batch=int(os.getenv("INTEGRATION_LOOP_COALESCE_MAX_BATCH", "100")),
         )
 
 
@@ -183,89 +234,205 @@ class IntegrationDispatcher:
         8. Publish to Redis (real-time updates)
         9. Update loop status
         10. Trigger next stage if successful
+
+        Runs as a batch of one through dispatch_many(); stages advance
+        iteratively until the chain completes, fails or blocks.
+        """
+        return (await self.dispatch_many([event]))[0]
+
+    async def dispatch_many(self, events: Sequence[LoopEvent]) -> list[LoopEvent]:
         """
+        Dispatch a burst of events through the integration loop.
+
+        Returns the final event for each input event, in input order: the
+        event dispatch() returns for it when the events are dispatched one
+        at a time in input order.
+
+        Events run in waves holding at most one event per incident (the
+        k-th event of each incident), since a second event for an incident
+        depends on everything the first one's chain wrote. Within a wave,
+        each iteration advances every unfinished chain by one stage, with
+        one round trip per step for the whole batch (idempotency check,
+        loop status load/create, event persistence, checkpoint and status
+        upserts). Handlers run per event in input order, so a bridge sees
+        other incidents' writes for its stage in the same order as before.
+        """
+        results = list(events)
+
         if not self.config.enabled:
             logger.debug("Integration loop disabled, skipping dispatch")
-            return event
+            return results
 
-        if not self.is_bridge_enabled(event.stage):
-            logger.debug(f"Bridge for {event.stage.value} disabled, skipping")
-            return event
+        waves: list[list[tuple[int, LoopEvent]]] = []
+        seen: dict[str, int] = {}
+        for slot, event in enumerate(events):
+            wave = seen.get(event.incident_id, 0)
+            seen[event.incident_id] = wave + 1
+            if wave == len(waves):
+                waves.append([])
+            waves[wave].append((slot, event))
 
-        # HYGIENE #4: Idempotency check
-        idempotency_key = f"{event.incident_id}:{event.stage.value}"
-        if idempotency_key in self._processed_events:
-            logger.warning(
-                f"Idempotency blocked: {idempotency_key} already processed. Duplicate event {event.event_id} ignored."
-            )
-            # Return existing loop status if available
-            existing_status = await self._load_loop_status(event.incident_id)
-            if existing_status:
-                event.details["idempotency_blocked"] = True
-                event.details["existing_loop_id"] = existing_status.loop_id
-            return event
+        for wave in waves:
+            frontier = wave
+            while frontier:
+                frontier = await self._run_stage_batch(frontier, results)
 
-        # Also check database for persistence-based idempotency
-        if await self._check_db_idempotency(event.incident_id, event.stage):
-            logger.warning(f"DB idempotency blocked: {idempotency_key} exists in database.")
-            event.details["idempotency_blocked"] = True
-            return event
+        return results
 
-        try:
-            # Get or create loop status
-            loop_status = await self._get_or_create_loop_status(event)
+    async def _run_stage_batch(
+        self,
+        batch: list[tuple[int, LoopEvent]],
+        results: list[LoopEvent],
+    ) -> list[tuple[int, LoopEvent]]:
+        """
+        Run one stage for a batch of (slot, event) chains, one per incident.
+
+        Writes each chain's current outcome to results[slot] and returns
+        the next-stage events of chains that continue.
+        """
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        LOOP_STAGE_BATCH_SIZE.observe(len(batch))
+
+        live: list[tuple[int, LoopEvent]] = []
+        for slot, event in batch:
+            results[slot] = event
+            if not self.is_bridge_enabled(event.stage):
+                logger.debug(f"Bridge for {event.stage.value} disabled, skipping")
+                LOOP_STAGE_EVENTS_TOTAL.labels(stage=event.stage.value, outcome="skipped").inc()
+                continue
+            LOOP_STAGE_LAG_SECONDS.labels(stage=event.stage.value).observe(
+                max(0.0, (now - event.timestamp).total_seconds())
+            )
+            live.append((slot, event))
 
-            # Persist event first (durability)
-            await self._persist_event(event)
+        # HYGIENE #4: Idempotency check
+        memory_blocked = [event for _, event in live if self._idempotency_key(event) in self._processed_events]
+        if memory_blocked:
+            # Return existing loop status if available
+            existing = await self._load_loop_statuses([event.incident_id for event in memory_blocked])
+            for event in memory_blocked:
+                logger.warning(
+                    f"Idempotency blocked: {self._idempotency_key(event)} already processed. "
+                    f"Duplicate event {event.event_id} ignored."
+                )
+                existing_status = existing.get(event.incident_id)
+                if existing_status:
+                    event.details["idempotency_blocked"] = True
+                    event.details["existing_loop_id"] = existing_status.loop_id
+                LOOP_STAGE_EVENTS_TOTAL.labels(stage=event.stage.value, outcome="idempotent").inc()
+        live = [(slot, event) for slot, event in live if self._idempotency_key(event) not in self._processed_events]
 
-            # Check if human checkpoint is needed
-            checkpoint = await self._check_human_checkpoint_needed(event)
+        # Also check database for persistence-based idempotency
+        in_db = await self._check_db_idempotency_many([(event.incident_id, event.stage) for _, event in live])
+        proceed: list[tuple[int, LoopEvent]] = []
+        for slot, event in live:
+            if (event.incident_id, event.stage.value) in in_db:
+                logger.warning(f"DB idempotency blocked: {self._idempotency_key(event)} exists in database.")
+                event.details["idempotency_blocked"] = True
+                LOOP_STAGE_EVENTS_TOTAL.labels(stage=event.stage.value, outcome="idempotent").inc()
+            else:
+                proceed.append((slot, event))
+
+        if not proceed:
+            LOOP_STAGE_BATCH_SECONDS.observe(time.perf_counter() - started)
+            return []
+
+        failed: list[LoopEvent] = []
+
+        # Get or create loop status
+        statuses = await self._get_or_create_loop_statuses([event for _, event in proceed])
+
+        # Persist events first (durability)
+        rejected = await self._persist_events([event for _, event in proceed])
+        for event, error in rejected:
+            self._mark_dispatch_error(event, error)
+        rejected_ids = {event.event_id for event, _ in rejected}
+        proceed = [(slot, event) for slot, event in proceed if event.event_id not in rejected_ids]
+
+        # Check if human checkpoints are needed
+        checkpoints: list[HumanCheckpoint] = []
+        to_run: list[tuple[int, LoopEvent]] = []
+        for slot, event in proceed:
+            try:
+                checkpoint = await self._check_human_checkpoint_needed(event)
+            except Exception as e:
+                self._mark_dispatch_error(event, e)
+                failed.append(event)
+                continue
             if checkpoint:
                 self._pending_checkpoints[checkpoint.checkpoint_id] = checkpoint
-                await self._persist_checkpoint(checkpoint)
+                checkpoints.append(checkpoint)
 
                 # Update event with blocked state
                 event.failure_state = LoopFailureState.HUMAN_CHECKPOINT_PENDING
+                loop_status = statuses[event.incident_id]
                 loop_status.is_blocked = True
                 loop_status.pending_checkpoints.append(checkpoint.checkpoint_id)
-
-                # Publish checkpoint needed event
-                await self._publish_checkpoint_needed(checkpoint)
-
-                return event
-
-            # Execute handlers
-            result_event = await self._execute_handlers(event)
-
-            # Publish to Redis
-            await self._publish_event(result_event)
-
-            # Update loop status
-            await self._update_loop_status(loop_status, result_event)
+                LOOP_STAGE_EVENTS_TOTAL.labels(stage=event.stage.value, outcome="checkpoint").inc()
+            else:
+                to_run.append((slot, event))
+
+        if checkpoints:
+            await self._persist_checkpoints(checkpoints)
+            # Publish checkpoint needed events
+            await asyncio.gather(*(self._publish_checkpoint_needed(checkpoint) for checkpoint in checkpoints))
+
+        # Execute handlers, per event in input order
+        handled: list[tuple[int, LoopEvent, LoopEvent]] = []
+        for slot, event in to_run:
+            handled.append((slot, event, await self._execute_handlers(event)))
+
+        # Publish to Redis
+        await asyncio.gather(*(self._publish_event(result_event) for _, _, result_event in handled))
+
+        # Update loop status
+        next_batch: list[tuple[int, LoopEvent]] = []
+        updated: dict[str, LoopStatus] = {}
+        for slot, event, result_event in handled:
+            results[slot] = result_event
+            loop_status = statuses[event.incident_id]
+            try:
+                self._apply_stage_result(loop_status, result_event)
+                updated[loop_status.loop_id] = loop_status
+            except Exception as e:
+                self._mark_dispatch_error(result_event, e)
+                failed.append(result_event)
+                continue
+            LOOP_STAGE_EVENTS_TOTAL.labels(
+                stage=result_event.stage.value,
+                outcome="completed" if result_event.is_success else "failed",
+            ).inc()
 
             # Trigger next stage if successful
             if result_event.is_success:
                 next_event = await self._trigger_next_stage(result_event, loop_status)
                 if next_event:
-                    return await self.dispatch(next_event)
+                    next_batch.append((slot, next_event))
+                    continue
 
             # HYGIENE #4: Mark as processed AFTER successful handler execution
-            self._processed_events.add(idempotency_key)
+            self._processed_events.add(self._idempotency_key(event))
 
-            return result_event
+        await self._persist_loop_statuses(list(updated.values()))
+        if failed:
+            await self._persist_events(failed)
 
-        except asyncio.TimeoutError:
-            logger.error(f"Timeout dispatching event {event.event_id}")
-            event.failure_state = LoopFailureState.TIMEOUT
-            await self._persist_event(event)
-            return event
+        LOOP_STAGE_BATCH_SECONDS.observe(time.perf_counter() - started)
+        return next_batch
 
-        except Exception as e:
-            logger.exception(f"Error dispatching event {event.event_id}: {e}")
-            event.failure_state = LoopFailureState.ERROR
-            event.details["error"] = str(e)
-            await self._persist_event(event)
-            return event
+    @staticmethod
+    def _idempotency_key(event: LoopEvent) -> str:
+        """HYGIENE #4: One dispatch per incident and stage."""
+        return f"{event.incident_id}:{event.stage.value}"
+
+    @staticmethod
+    def _mark_dispatch_error(event: LoopEvent, error: Exception) -> None:
+        """Record an unexpected dispatch error on the event."""
+        logger.exception(f"Error dispatching event {event.event_id}: {error}")
+        event.failure_state = LoopFailureState.ERROR
+        event.details["error"] = str(error)
+        LOOP_STAGE_EVENTS_TOTAL.labels(stage=event.stage.value, outcome="error").inc()
 
     async def _check_db_idempotency(self, incident_id: str, stage: LoopStage) -> bool:
         """
@@ -273,6 +440,17 @@ class IntegrationDispatcher:
 
         Returns True if already processed (should skip).
         """
+        return (incident_id, stage.value) in await self._check_db_idempotency_many([(incident_id, stage)])
+
+    async def _check_db_idempotency_many(self, keys: Sequence[tuple[str, LoopStage]]) -> set[tuple[str, str]]:
+        """
+        HYGIENE #4: Which (incident_id, stage) pairs already have events.
+
+        One query for the batch. Fails open (empty set) on database errors.
+        """
+        if not keys:
+            return set()
+        wanted = {(incident_id, stage.value) for incident_id, stage in keys}
         try:
             async with self.db_factory() as session:
                 from sqlalchemy import text
@@ -280,18 +458,20 @@ class IntegrationDispatcher:
                 result = await session.execute(
                     text(
                         """
-                        SELECT 1 FROM loop_events
-                        WHERE incident_id = :incident_id
-                        AND stage = :stage
-                        LIMIT 1
+                        SELECT DISTINCT incident_id, stage FROM loop_events
+                        WHERE incident_id = ANY(:incident_ids)
+                        AND stage = ANY(:stages)
                     """
                     ),
-                    {"incident_id": incident_id, "stage": stage.value},
+                    {
+                        "incident_ids": sorted({incident_id for incident_id, _ in wanted}),
+                        "stages": sorted({stage for _, stage in wanted}),
+                    },
                 )
-                return result.fetchone() is not None
+                return {(row.incident_id, row.stage) for row in result.fetchall()} & wanted
         except Exception as e:
             logger.error(f"DB idempotency check failed: {e}")
-            return False  # Fail open (allow processing)
+            return set()  # Fail open (allow processing)
 
     async def _execute_handlers(self, event: LoopEvent) -> LoopEvent:
         """Execute all handlers for an event stage."""
@@ -417,33 +597,41 @@ class IntegrationDispatcher:
     # LOOP STATUS MANAGEMENT
     # =========================================================================
 
-    async def _get_or_create_loop_status(self, event: LoopEvent) -> LoopStatus:
-        """Get existing loop status or create new one."""
-        if event.incident_id in self._active_loops:
-            return self._active_loops[event.incident_id]
+    async def _get_or_create_loop_statuses(self, events: Sequence[LoopEvent]) -> dict[str, LoopStatus]:
+        """Get existing loop status or create new one, for each event's incident."""
+        missing = [
+            incident_id
+            for incident_id in dict.fromkeys(event.incident_id for event in events)
+            if incident_id not in self._active_loops
+        ]
 
         # Try loading from DB
-        loop_status = await self._load_loop_status(event.incident_id)
-        if loop_status:
+        loaded = await self._load_loop_statuses(missing) if missing else {}
+
+        created: list[LoopStatus] = []
+        for event in events:
+            if event.incident_id in self._active_loops:
+                continue
+            loop_status = loaded.get(event.incident_id)
+            if loop_status is None:
+                # Create new
+                loop_status = LoopStatus(
+                    loop_id=f"loop_{uuid4().hex[:16]}",
+                    incident_id=event.incident_id,
+                    tenant_id=event.tenant_id,
+                    current_stage=event.stage,
+                    stages_completed=[],
+                    stages_failed=[],
+                )
+                created.append(loop_status)
             self._active_loops[event.incident_id] = loop_status
-            return loop_status
-
-        # Create new
-        loop_status = LoopStatus(
-            loop_id=f"loop_{uuid4().hex[:16]}",
-            incident_id=event.incident_id,
-            tenant_id=event.tenant_id,
-            current_stage=event.stage,
-            stages_completed=[],
-            stages_failed=[],
-        )
-        self._active_loops[event.incident_id] = loop_status
-        await self._persist_loop_status(loop_status)
 
-        return loop_status
+        await self._persist_loop_statuses(created)
+
+        return {event.incident_id: self._active_loops[event.incident_id] for event in events}
 
-    async def _update_loop_status(self, loop_status: LoopStatus, event: LoopEvent) -> None:
-        """Update loop status after event processing."""
+    def _apply_stage_result(self, loop_status: LoopStatus, event: LoopEvent) -> None:
+        """Update loop status after event processing (persisted by the caller)."""
         loop_status.current_stage = event.stage
 
         if event.is_success:
@@ -476,8 +664,6 @@ class IntegrationDispatcher:
             loop_status.is_complete = True
             loop_status.completed_at = datetime.now(timezone.utc)
 
-        await self._persist_loop_status(loop_status)
-
     async def _trigger_next_stage(self, event: LoopEvent, loop_status: LoopStatus) -> Optional[LoopEvent]:
         """Determine and create the next stage event if needed."""
         stage_sequence = [
@@ -519,11 +705,44 @@ class IntegrationDispatcher:
 
         HYGIENE #1: Applies JSON guard to ensure all details are serializable.
         """
-        try:
-            # HYGIENE #1: Apply JSON guard - fail fast if non-serializable
-            event_dict = event.to_dict()
-            validated_dict = ensure_json_serializable(event_dict, path="event")
+        rejected = await self._persist_events([event])
+        if rejected:
+            raise rejected[0][1]
+
+    async def _persist_events(self, events: Sequence[LoopEvent]) -> list[tuple[LoopEvent, TypeError]]:
+        """
+        Persist events to database in one statement batch.
 
+        HYGIENE #1: Applies JSON guard to each event. Events that fail it
+        are not written and are returned with their error; the rest are.
+        """
+        rows = []
+        rejected: list[tuple[LoopEvent, TypeError]] = []
+        for event in events:
+            try:
+                # HYGIENE #1: Apply JSON guard - fail fast if non-serializable
+                event_dict = event.to_dict()
+                validated_dict = ensure_json_serializable(event_dict, path="event")
+                details = json.dumps(validated_dict)
+            except TypeError as e:
+                # JSON serialization failed - this is a bug, log and report
+                logger.error(f"JSON serialization failed for event {event.event_id}: {e}")
+                rejected.append((event, e))
+                continue
+            rows.append(
+                {
+                    "id": event.event_id,
+                    "incident_id": event.incident_id,
+                    "tenant_id": event.tenant_id,
+                    "stage": event.stage.value,
+                    "details": details,
+                    "created_at": event.timestamp,
+                }
+            )
+
+        if not rows:
+            return rejected
+        try:
             async with self.db_factory() as session:
                 from sqlalchemy import text
 
@@ -535,25 +754,21 @@ class IntegrationDispatcher:
                         ON CONFLICT (id) DO UPDATE SET details = CAST(:details AS jsonb)
                     """
                     ),
-                    {
-                        "id": event.event_id,
-                        "incident_id": event.incident_id,
-                        "tenant_id": event.tenant_id,
-                        "stage": event.stage.value,
-                        "details": json.dumps(validated_dict),
-                        "created_at": event.timestamp,
-                    },
+                    rows,
                 )
                 await session.commit()
-        except TypeError as e:
-            # JSON serialization failed - this is a bug, log and raise
-            logger.error(f"JSON serialization failed for event {event.event_id}: {e}")
-            raise
         except Exception as e:
-            logger.error(f"Failed to persist event {event.event_id}: {e}")
+            logger.error(f"Failed to persist events {', '.join(row['id'] for row in rows)}: {e}")
+        return rejected
 
     async def _persist_loop_status(self, status: LoopStatus) -> None:
         """Persist loop status to database."""
+        await self._persist_loop_statuses([status])
+
+    async def _persist_loop_statuses(self, statuses: Sequence[LoopStatus]) -> None:
+        """Persist loop statuses to database in one statement batch."""
+        if not statuses:
+            return
         try:
             async with self.db_factory() as session:
                 from sqlalchemy import text
@@ -569,27 +784,36 @@ class IntegrationDispatcher:
                             is_complete = :is_complete
                     """
                     ),
-                    {
-                        "id": status.loop_id,
-                        "incident_id": status.incident_id,
-                        "tenant_id": status.tenant_id,
-                        "stages": json.dumps(
-                            {
-                                "completed": status.stages_completed,
-                                "failed": status.stages_failed,
-                            }
-                        ),
-                        "started_at": status.started_at,
-                        "completed_at": status.completed_at,
-                        "is_complete": status.is_complete,
-                    },
+                    [
+                        {
+                            "id": status.loop_id,
+                            "incident_id": status.incident_id,
+                            "tenant_id": status.tenant_id,
+                            "stages": json.dumps(
+                                {
+                                    "completed": status.stages_completed,
+                                    "failed": status.stages_failed,
+                                }
+                            ),
+                            "started_at": status.started_at,
+                            "completed_at": status.completed_at,
+                            "is_complete": status.is_complete,
+                        }
+                        for status in statuses
+                    ],
                 )
                 await session.commit()
         except Exception as e:
-            logger.error(f"Failed to persist loop status {status.loop_id}: {e}")
+            logger.error(f"Failed to persist loop status {', '.join(s.loop_id for s in statuses)}: {e}")
 
     async def _persist_checkpoint(self, checkpoint: HumanCheckpoint) -> None:
         """Persist human checkpoint to database."""
+        await self._persist_checkpoints([checkpoint])
+
+    async def _persist_checkpoints(self, checkpoints: Sequence[HumanCheckpoint]) -> None:
+        """Persist human checkpoints to database in one statement batch."""
+        if not checkpoints:
+            return
         try:
             async with self.db_factory() as session:
                 from sqlalchemy import text
@@ -608,27 +832,36 @@ class IntegrationDispatcher:
                             resolution = :resolution
                     """
                     ),
-                    {
-                        "id": checkpoint.checkpoint_id,
-                        "type": checkpoint.checkpoint_type.value,
-                        "incident_id": checkpoint.incident_id,
-                        "tenant_id": checkpoint.tenant_id,
-                        "stage": checkpoint.stage.value,
-                        "target_id": checkpoint.target_id,
-                        "description": checkpoint.description,
-                        "options": json.dumps(checkpoint.options),
-                        "created_at": checkpoint.created_at,
-                        "resolved_at": checkpoint.resolved_at,
-                        "resolved_by": checkpoint.resolved_by,
-                        "resolution": checkpoint.resolution,
-                    },
+                    [
+                        {
+                            "id": checkpoint.checkpoint_id,
+                            "type": checkpoint.checkpoint_type.value,
+                            "incident_id": checkpoint.incident_id,
+                            "tenant_id": checkpoint.tenant_id,
+                            "stage": checkpoint.stage.value,
+                            "target_id": checkpoint.target_id,
+                            "description": checkpoint.description,
+                            "options": json.dumps(checkpoint.options),
+                            "created_at": checkpoint.created_at,
+                            "resolved_at": checkpoint.resolved_at,
+                            "resolved_by": checkpoint.resolved_by,
+                            "resolution": checkpoint.resolution,
+                        }
+                        for checkpoint in checkpoints
+                    ],
                 )
                 await session.commit()
         except Exception as e:
-            logger.error(f"Failed to persist checkpoint {checkpoint.checkpoint_id}: {e}")
+            logger.error(f"Failed to persist checkpoint {', '.join(c.checkpoint_id for c in checkpoints)}: {e}")
 
     async def _load_loop_status(self, incident_id: str) -> Optional[LoopStatus]:
         """Load loop status from database."""
+        return (await self._load_loop_statuses([incident_id])).get(incident_id)
+
+    async def _load_loop_statuses(self, incident_ids: Sequence[str]) -> dict[str, LoopStatus]:
+        """Load the latest loop status of each incident from database, in one query."""
+        if not incident_ids:
+            return {}
         try:
             async with self.db_factory() as session:
                 from sqlalchemy import text
@@ -636,19 +869,19 @@ class IntegrationDispatcher:
                 result = await session.execute(
                     text(
                         """
-                        SELECT id, incident_id, tenant_id, stages, started_at, completed_at, is_complete
+                        SELECT DISTINCT ON (incident_id)
+                            id, incident_id, tenant_id, stages, started_at, completed_at, is_complete
                         FROM loop_traces
-                        WHERE incident_id = :incident_id
-                        ORDER BY started_at DESC
-                        LIMIT 1
+                        WHERE incident_id = ANY(:incident_ids)
+                        ORDER BY incident_id, started_at DESC
                     """
                     ),
-                    {"incident_id": incident_id},
+                    {"incident_ids": list(dict.fromkeys(incident_ids))},
                 )
-                row = result.fetchone()
-                if row:
+                statuses = {}
+                for row in result.fetchall():
                     stages = json.loads(row.stages) if isinstance(row.stages, str) else row.stages
-                    return LoopStatus(
+                    statuses[row.incident_id] = LoopStatus(
                         loop_id=row.id,
                         incident_id=row.incident_id,
                         tenant_id=row.tenant_id,
@@ -659,9 +892,10 @@ class IntegrationDispatcher:
                         completed_at=row.completed_at,
                         is_complete=row.is_complete,
                     )
+                return statuses
         except Exception as e:
-            logger.error(f"Failed to load loop status for {incident_id}: {e}")
-        return None
+            logger.error(f"Failed to load loop status for {', '.join(incident_ids)}: {e}")
+        return {}
 
     async def _load_checkpoint(self, checkpoint_id: str) -> Optional[HumanCheckpoint]:
         """Load checkpoint from database."""
@@ -792,5 +1026,67 @@ class IntegrationDispatcher:
         await self._persist_loop_status(loop_status)
 
 
+# =============================================================================
+# DISPATCH COALESCING
+# =============================================================================
+
+
+class DispatchCoalescer:
+    """
+    Collects events dispatched concurrently into one dispatch_many() call.
+
+    The first event opens a window of coalesce_window_seconds; events that
+    arrive before it closes, up to coalesce_max_batch, go out in the same
+    batch. Each caller gets the final event for its own input, the same
+    one dispatch() would return.
+    """
+
+    def __init__(self, dispatcher: IntegrationDispatcher):
+        self._dispatcher = dispatcher
+        self._window = dispatcher.config.coalesce_window_seconds
+        self._max_batch = max(1, dispatcher.config.coalesce_max_batch)
+        self._pending: list[tuple[LoopEvent, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: set[asyncio.Task] = set()
+
+    async def dispatch(self, event: LoopEvent) -> LoopEvent:
+        """Queue the event for the current batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((event, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _run(self, batch: list[tuple[LoopEvent, asyncio.Future]]) -> None:
+        LOOP_COALESCED_BATCH_SIZE.observe(len(batch))
+        try:
+            results = await self._dispatcher.dispatch_many([event for event, _ in batch])
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
 # Import PolicyMode for use in revert_loop
 from .events import PolicyMode
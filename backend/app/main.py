@@ -14,16 +14,21 @@ import json
 import os
 import uuid
 from contextlib import asynccontextmanager
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 
+# Cold-start profiling (STARTUP_PROFILE=true) must hook imports before the heavy ones below
+from app.startup.profiler import emit_startup_report, install_startup_profiler, mark_startup_phase
+
+install_startup_profiler()
+
 from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, PlainTextResponse
 from pydantic import BaseModel, Field
 from sqlmodel import Session, select
 
-from app.hoc.cus.hoc_spine.auth_wiring import RBACMiddleware, verify_api_key
+from app.hoc.cus.hoc_spine.auth_wiring import verify_api_key
 from .contracts.decisions import backfill_run_id_for_request
 from .db import Agent, Memory, Provenance, Run, engine, init_db
 from .logging_config import log_provenance, log_request, setup_logging
@@ -37,7 +42,6 @@ from .metrics import (
     nova_skill_duration_seconds,
     nova_worker_pool_size,
 )
-from .middleware.tenant import TenantMiddleware
 from .models.logs_records import (
     SystemCausedBy,
     SystemComponent,
@@ -229,6 +233,95 @@ async def reactivate_deferred_lessons():
         await asyncio.sleep(60)  # Check every 60 seconds
 
 
+async def reconcile_budget_daily_spend():
+    """
+    Periodically correct daily spend counters against llm_costs.
+
+    Budget checks read agent_daily_spend instead of summing today's cost
+    rows; this keeps the counters exact if an update was ever lost.
+
+    Runs every BUDGET_RECONCILE_INTERVAL_SECONDS (default 300).
+    """
+    from .utils.budget_tracker import BUDGET_RECONCILE_INTERVAL_SECONDS, reconcile_daily_spend
+
+    while True:
+        await asyncio.sleep(BUDGET_RECONCILE_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(reconcile_daily_spend)
+        except Exception as e:
+            logger.warning(f"Failed to reconcile budget daily spend: {e}")
+
+
+async def reconcile_run_summary_buckets():
+    """
+    Periodically correct activity summary buckets against runs.
+
+    Activity summaries read run_summary_buckets instead of counting runs;
+    this rewrites recent buckets that drifted from the live aggregate
+    (e.g. runs rewritten with triggers disabled).
+
+    Runs every RUN_SUMMARY_RECONCILE_INTERVAL_SECONDS (default 600) over
+    the last RUN_SUMMARY_RECONCILE_DAYS UTC days (default 2).
+    """
+    from app.hoc.cus.activity.L6_drivers.run_summary_driver import (
+        RUN_SUMMARY_RECONCILE_DAYS,
+        RUN_SUMMARY_RECONCILE_INTERVAL_SECONDS,
+        RunSummaryDriver,
+    )
+
+    from .db import get_async_session
+
+    while True:
+        await asyncio.sleep(RUN_SUMMARY_RECONCILE_INTERVAL_SECONDS)
+        try:
+            since = datetime.now(timezone.utc).date() - timedelta(days=RUN_SUMMARY_RECONCILE_DAYS - 1)
+            async with get_async_session() as session:
+                corrected = await RunSummaryDriver(session).repair_buckets(since)
+                await session.commit()
+            if corrected:
+                logger.warning(
+                    "run_summary_buckets_drift_corrected",
+                    extra={"since": since.isoformat(), "buckets": corrected},
+                )
+        except Exception as e:
+            logger.warning(f"Failed to reconcile run summary buckets: {e}")
+
+
+async def deliver_notification_outbox():
+    """
+    Deliver notifications written to notification_outbox.
+
+    Callers enqueue notifications in their own transaction; this drains
+    the outbox, fanning channels out concurrently with retries and burst
+    coalescing (see NotifyOutboxWorker).
+
+    Polls every NOTIFY_OUTBOX_POLL_SECONDS (default 1) when idle.
+    """
+    from app.hoc.cus.integrations.L5_notifications.engines.channel_engine import (
+        NotifyOutboxWorker,
+        get_notify_service,
+    )
+
+    from .db import get_async_session
+
+    await NotifyOutboxWorker(get_notify_service(), get_async_session).run()
+
+
+async def flush_api_key_usage():
+    """
+    Periodically write API key usage aggregated by the API key engine.
+
+    Machine requests only count usage in memory; this writes
+    last_used_at / total_requests for every key used since the last
+    flush in one statement.
+
+    Runs every API_KEY_USAGE_FLUSH_SECONDS (default 10).
+    """
+    from app.hoc.cus.hoc_spine.auth_wiring import get_api_key_engine
+
+    await get_api_key_engine().run_usage_flusher()
+
+
 # =============================================================================
 # PIN-411 GOV-POL-003: Panel Invariant Monitor Scheduler
 # =============================================================================
@@ -361,6 +454,7 @@ async def lifespan(app: FastAPI):
     # These were previously initialized at import time. Now initialized here
     # to prevent DB connections and resource allocation during module import.
     global rate_limiter, concurrent_limiter, budget_tracker, planner
+    mark_startup_phase("server_startup")
 
     # Initialize utilities
     rate_limiter = RateLimiter()
@@ -369,6 +463,7 @@ async def lifespan(app: FastAPI):
 
     # Initialize database
     init_db()
+    mark_startup_phase("init_db")
 
     # =========================================================================
     # GAP-046: EventReactor Initialization
@@ -388,6 +483,7 @@ async def lifespan(app: FastAPI):
     except RuntimeError as e:
         logger.critical(f"STARTUP ABORTED - EventReactor initialization failed: {e}")
         raise
+    mark_startup_phase("event_reactor")
 
     # =========================================================================
     # GAP-067: SPINE Component Validation (FAIL-FAST)
@@ -407,6 +503,7 @@ async def lifespan(app: FastAPI):
     except SpineValidationError as e:
         logger.critical(f"STARTUP ABORTED - SPINE validation failed: {e}")
         raise
+    mark_startup_phase("spine_validation")
 
     # =========================================================================
     # ITER3.3: HOC Spine Bootstrap (Registry Hardening)
@@ -421,6 +518,7 @@ async def lifespan(app: FastAPI):
     except RuntimeError as e:
         logger.critical(f"STARTUP ABORTED - HOC Spine bootstrap failed: {e}")
         raise
+    mark_startup_phase("hoc_spine_bootstrap")
 
     # PIN-413: Create immutable system record for API startup
     _create_system_record(
@@ -479,6 +577,7 @@ async def lifespan(app: FastAPI):
     except GovernanceConfigError as e:
         logger.critical(f"STARTUP ABORTED - Invalid governance configuration: {e}")
         raise
+    mark_startup_phase("secrets_and_governance")
 
     # =========================================================================
     # SYSTEM MODE DECLARATIONS (Objective-1: Variable Truth Mapping)
@@ -510,6 +609,7 @@ async def lifespan(app: FastAPI):
     logger.info(
         f"[BOOT] CARE_SCOPE={care_scope} (routing {'API+Worker' if care_scope == 'api_and_worker' else 'Worker only'})"
     )
+    mark_startup_phase("system_modes")
 
     # =========================================================================
     # M7: Memory Features
@@ -587,6 +687,7 @@ async def lifespan(app: FastAPI):
             raise RuntimeError(f"Failed to initialize M7 services: {e}") from e
         else:
             logger.error(f"Failed to initialize M7 services: {e}")
+    mark_startup_phase("memory_services")
 
     # =========================================================================
     # PB-S2: Orphan Run Recovery (Crash & Resume)
@@ -611,6 +712,7 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         # Recovery failure should not block startup, but must be logged
         logger.error(f"pb_s2_orphan_recovery_error: {e}", exc_info=True)
+    mark_startup_phase("orphan_recovery")
 
     # =========================================================================
     # Phase R-3: Process pending budget enforcement decisions
@@ -632,6 +734,7 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         # Decision emission failure should not block startup
         logger.error(f"phase_r3_budget_decision_error: {e}", exc_info=True)
+    mark_startup_phase("budget_decisions")
 
     # Start queue depth updater
     task = asyncio.create_task(update_queue_depth())
@@ -645,6 +748,22 @@ async def lifespan(app: FastAPI):
     panel_monitor_task = asyncio.create_task(run_panel_invariant_checks())
     logger.info("GOV-POL-003_panel_invariant_scheduler_started")
 
+    # Start budget daily spend reconciler
+    budget_reconcile_task = asyncio.create_task(reconcile_budget_daily_spend())
+    logger.info("budget_spend_reconciler_started")
+
+    # Start activity summary bucket reconciler
+    run_summary_reconcile_task = asyncio.create_task(reconcile_run_summary_buckets())
+    logger.info("run_summary_reconciler_started")
+
+    # Start notification outbox delivery
+    notify_outbox_task = asyncio.create_task(deliver_notification_outbox())
+    logger.info("notify_outbox_worker_started")
+
+    # Start API key usage flusher
+    api_key_usage_task = asyncio.create_task(flush_api_key_usage())
+    logger.info("api_key_usage_flusher_started")
+
     # Runtime route validation (PIN-108)
     route_issues = validate_route_order(app)
     if route_issues:
@@ -653,6 +772,7 @@ async def lifespan(app: FastAPI):
         logger.warning("route_validation_complete", extra={"issues": len(route_issues)})
     else:
         logger.info("route_validation_complete", extra={"issues": 0, "status": "pass"})
+    mark_startup_phase("schedulers_and_route_validation")
 
     # =========================================================================
     # CAP-006: Auth Gateway Initialization
@@ -672,6 +792,25 @@ async def lifespan(app: FastAPI):
         # Gateway init failure should not block startup in non-production
         if os.getenv("AUTH_GATEWAY_REQUIRED", "false").lower() == "true":
             raise
+    mark_startup_phase("auth_gateway")
+
+    # Compile the RBAC path router (coded rules + RBAC_RULES.yaml public paths)
+    # so the first request does not pay for it
+    try:
+        from app.hoc.cus.hoc_spine.auth_wiring import get_policy_router
+
+        get_policy_router()
+    except Exception as e:
+        logger.error(f"rbac_policy_router_compile_error: {e}", exc_info=True)
+
+    # =========================================================================
+    # Prebuilt OpenAPI schema (scripts/build_openapi_artifact.py)
+    # =========================================================================
+    # Load the schema serialised at build time so neither the first
+    # /openapi.json nor the warm-up below regenerates it. A stale artifact
+    # (route fingerprint mismatch) is ignored and generation falls back to live.
+    if OPENAPI_ARTIFACT_ENABLED and app.openapi_url and not app.openapi_schema:
+        app.openapi_schema = load_openapi_artifact(app)
 
     # =========================================================================
     # PIN-443, PIN-444: OpenAPI Warm-Up with Assertion
@@ -698,6 +837,8 @@ async def lifespan(app: FastAPI):
                 raise RuntimeError(msg)
 
         logger.info("[BOOT] OpenAPI schema warmed in %.2fs", warmup_duration)
+    mark_startup_phase("openapi")
+    emit_startup_report()
 
     yield
 
@@ -717,6 +858,24 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"event_reactor_shutdown_error: {e}")
 
+    # Flush buffered events and close the event publisher
+    try:
+        from .events.publisher import reset_publisher
+
+        reset_publisher()
+        logger.info("event_publisher_closed")
+    except Exception as e:
+        logger.error(f"event_publisher_close_error: {e}")
+
+    # Write decision records still queued in the decision sink
+    try:
+        from .contracts.decisions import get_decision_service
+
+        get_decision_service().close()
+        logger.info("decision_sink_closed")
+    except Exception as e:
+        logger.error(f"decision_sink_close_error: {e}")
+
     # Cleanup on shutdown
     task.cancel()
     try:
@@ -741,6 +900,41 @@ async def lifespan(app: FastAPI):
         pass
     logger.info("GOV-POL-003_panel_invariant_scheduler_stopped")
 
+    # Cancel budget daily spend reconciler
+    budget_reconcile_task.cancel()
+    try:
+        await budget_reconcile_task
+    except asyncio.CancelledError:
+        pass
+    logger.info("budget_spend_reconciler_stopped")
+
+    # Cancel activity summary bucket reconciler
+    run_summary_reconcile_task.cancel()
+    try:
+        await run_summary_reconcile_task
+    except asyncio.CancelledError:
+        pass
+    logger.info("run_summary_reconciler_stopped")
+
+    # Cancel notification outbox delivery
+    notify_outbox_task.cancel()
+    try:
+        await notify_outbox_task
+    except asyncio.CancelledError:
+        pass
+    logger.info("notify_outbox_worker_stopped")
+
+    # Cancel API key usage flusher; write what is still pending
+    api_key_usage_task.cancel()
+    try:
+        await api_key_usage_task
+    except asyncio.CancelledError:
+        pass
+    from app.hoc.cus.hoc_spine.auth_wiring import get_api_key_engine
+
+    await get_api_key_engine().close()
+    logger.info("api_key_usage_flusher_stopped")
+
 
 # ---------- FastAPI App ----------
 from app.hoc.cus.hoc_spine.authority.veil_policy import fastapi_schema_urls
@@ -761,11 +955,14 @@ import time as _openapi_time
 
 from fastapi.openapi.utils import get_openapi as _fastapi_get_openapi
 
+from app.startup.openapi_artifact import OPENAPI_ARTIFACT_ENABLED
+from app.startup.openapi_artifact import load_artifact as load_openapi_artifact
+
 # Configurable timeout threshold (seconds) - fail loudly if exceeded
 OPENAPI_TIMEOUT_THRESHOLD = float(os.getenv("OPENAPI_TIMEOUT_THRESHOLD", "10.0"))
 
 
-def custom_openapi():
+def custom_openapi(use_artifact: bool = True):
     """
     Custom OpenAPI generator with explicit tracing and timeout detection.
 
@@ -774,10 +971,18 @@ def custom_openapi():
 
     FastAPI caches after first call, but first call can be slow (~2s for large schemas).
     If generation exceeds OPENAPI_TIMEOUT_THRESHOLD, something is wrong.
+
+    The prebuilt artifact (app/openapi_schema.json) is used when it matches
+    the live routes; generation only runs when it is missing or stale.
     """
     if app.openapi_schema:
         return app.openapi_schema
 
+    if use_artifact and OPENAPI_ARTIFACT_ENABLED:
+        app.openapi_schema = load_openapi_artifact(app)
+        if app.openapi_schema:
+            return app.openapi_schema
+
     logger.warning("OPENAPI: generation started")
     start = _openapi_time.perf_counter()
 
@@ -840,9 +1045,9 @@ async def openapi_nocache():
     logger.warning("OPENAPI_DEBUG: cache-free generation requested")
     start = _openapi_time.perf_counter()
 
-    # Force regeneration by clearing cache
+    # Force regeneration by clearing cache and bypassing the prebuilt artifact
     app.openapi_schema = None
-    schema = app.openapi()
+    schema = custom_openapi(use_artifact=False)
 
     duration_ms = (_openapi_time.perf_counter() - start) * 1000
     logger.warning(
@@ -919,33 +1124,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Tenant context middleware (M6)
-# Extracts tenant_id from X-Tenant-ID header and propagates through request lifecycle
-app.add_middleware(TenantMiddleware)
-
-# RBAC enforcement middleware (M7)
-# Evaluates PolicyObject patterns for protected paths
-app.add_middleware(RBACMiddleware)
+# Request pipeline: one pure-ASGI layer running, in order,
+# 1. AuthGateway (CAP-006: authenticates, sets auth_context; only if AUTH_GATEWAY_ENABLED)
+# 2. OnboardingGate (PIN-399: checks tenant.onboarding_state)
+# 3. RBAC (M7: checks permissions - only after COMPLETE state)
+# 4. Tenant (M6: propagates tenant context)
+from app.hoc.cus.hoc_spine.auth_wiring import setup_request_pipeline
 
-# Auth Gateway middleware (CAP-006)
-# Central authentication entry point - JWT XOR API Key, session revocation
-# Must run BEFORE RBAC so auth context is available
-from app.hoc.cus.hoc_spine.auth_wiring import AUTH_GATEWAY_ENABLED, setup_auth_middleware
-
-# Onboarding Gate middleware (PIN-399)
-# Enforces onboarding state requirements per endpoint
-# Must run AFTER Auth (needs tenant_id) but BEFORE RBAC
-from app.hoc.cus.hoc_spine.auth_wiring import OnboardingGateMiddleware
-
-# Middleware execution order (Starlette runs in reverse of add order):
-# 1. AuthGateway (authenticates, sets auth_context)
-# 2. OnboardingGate (checks tenant.onboarding_state)
-# 3. RBAC (checks permissions - only after COMPLETE state)
-# 4. Tenant (propagates tenant context)
-app.add_middleware(OnboardingGateMiddleware)
-
-if AUTH_GATEWAY_ENABLED:
-    setup_auth_middleware(app)
+setup_request_pipeline(app)
 
 # Slow Request Diagnostic Middleware (PIN-443)
 # Logs warnings for requests > 500ms - helps diagnose VPS hangs
@@ -1834,3 +2020,6 @@ async def list_failed_runs(limit: int = 50, _: str = Depends(verify_api_key)):
                 for r in runs
             ],
         }
+
+
+mark_startup_phase("import_app_main")
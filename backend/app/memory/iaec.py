@@ -31,14 +31,17 @@ v3.0 Features (preserved):
 PIN-082 Enhancement: IAEC v3.2 for MN-OS
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import os
+import struct
+import tempfile
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple, Union
 
 import numpy as np
 from prometheus_client import Counter, Histogram
@@ -79,8 +82,15 @@ EMBEDDING_MODEL_FAMILY = os.getenv("EMBEDDING_MODEL_FAMILY", "openai")
 EMBEDDING_MODEL_VERSION = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
 
 # Whitening matrix persistence
+# Stored as raw .npy (no pickle) + JSON sidecar so workers can mmap one shared copy
 WHITENING_STORAGE_DIR = os.getenv("IAEC_WHITENING_DIR", "/tmp/iaec")
-WHITENING_VERSION_FILE = "whitening_v{version}.npz"
+WHITENING_VERSION_FILE = "whitening_v{version}.npz"  # Legacy pickled format (read-only migration)
+WHITENING_FORMAT_VERSION = 2
+WHITENING_PRECISION = os.getenv("IAEC_WHITENING_PRECISION", "float32")  # float32 | float64
+WHITENING_EPSILON = 1e-5
+
+# Slot basis binary format (float32 payload, see SlotBasis.to_packed)
+SLOT_BASIS_FORMAT_VERSION = 1
 
 # Policy hierarchy levels (v3.1: 5-level)
 POLICY_LEVEL_GLOBAL = 0
@@ -196,6 +206,24 @@ IAEC_COMPOSITION_LATENCY = Histogram(
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5],
 )
 
+IAEC_BATCH_SIZE = Histogram(
+    "aos_iaec_batch_size",
+    "Items per IAEC compose_batch call",
+    buckets=[1, 8, 32, 128, 512, 2048],
+)
+
+IAEC_BATCH_COMPOSITION_LATENCY = Histogram(
+    "aos_iaec_batch_composition_latency_seconds",
+    "IAEC compose_batch latency (whole batch)",
+    buckets=[0.005, 0.025, 0.1, 0.25, 1.0, 5.0],
+)
+
+IAEC_SIMILARITY_MATRIX_SIZE = Histogram(
+    "aos_iaec_similarity_matrix_candidates",
+    "Candidates scored per IAEC similarity_matrix call",
+    buckets=[10, 100, 1000, 10000, 100000],
+)
+
 IAEC_COLLAPSE_EVENTS = Counter(
     "aos_iaec_collapse_events_total",
     "Times anti-collapse safeguards activated",
@@ -873,6 +901,70 @@ class SlotBasis:
             policy_vector=np.array(d["p"], dtype=np.float32),
         )
 
+    # Binary layout: header (magic, format, slot structure, D, T, P, weights) + float32 vectors
+    _PACKED_HEADER = struct.Struct("<6sHHIII3d")
+    _PACKED_MAGIC = b"IAECSB"
+
+    def to_packed(self) -> bytes:
+        """
+        Serialize to the compact float32 binary format (~18 KB vs ~90 KB JSON).
+
+        to_bytes() stays the canonical form for slot_basis_hash; this format is
+        for storage and can be read back zero-copy from an mmap'd buffer.
+        """
+        header = self._PACKED_HEADER.pack(
+            self._PACKED_MAGIC,
+            SLOT_BASIS_FORMAT_VERSION,
+            SLOT_STRUCTURE_VERSION,
+            len(self.instruction_vector),
+            len(self.temporal_vector),
+            len(self.policy_vector),
+            *self.weights,
+        )
+        payload = np.concatenate(
+            [
+                self.instruction_vector,
+                self.query_vector,
+                self.context_vector,
+                self.temporal_vector,
+                self.policy_vector,
+            ]
+        ).astype("<f4", copy=False)
+        return header + payload.tobytes()
+
+    @classmethod
+    def from_packed(cls, buffer, offset: int = 0) -> "SlotBasis":
+        """
+        Deserialize from to_packed() output.
+
+        Vectors are views into buffer (bytes, memoryview or mmap), so reading
+        a basis out of a mapped file does not copy it onto the heap.
+        """
+        magic, fmt, slots, dim, t_size, p_size, wi, wq, wc = cls._PACKED_HEADER.unpack_from(buffer, offset)
+        if magic != cls._PACKED_MAGIC:
+            raise ValueError("Not a packed IAEC slot basis")
+        if fmt != SLOT_BASIS_FORMAT_VERSION or slots != SLOT_STRUCTURE_VERSION:
+            raise ValueError(
+                f"Slot basis version mismatch (format={fmt}, slots={slots}; "
+                f"expected {SLOT_BASIS_FORMAT_VERSION}/{SLOT_STRUCTURE_VERSION})"
+            )
+
+        start = offset + cls._PACKED_HEADER.size
+        values = np.frombuffer(buffer, dtype="<f4", count=3 * dim + t_size + p_size, offset=start)
+        return cls(
+            instruction_vector=values[:dim],
+            query_vector=values[dim : 2 * dim],
+            context_vector=values[2 * dim : 3 * dim],
+            weights=(wi, wq, wc),
+            temporal_vector=values[3 * dim : 3 * dim + t_size],
+            policy_vector=values[3 * dim + t_size :],
+        )
+
+    @classmethod
+    def packed_size(cls, dim: int = EMBEDDING_DIMENSIONS) -> int:
+        """Size in bytes of one packed basis (fixed per slot structure)."""
+        return cls._PACKED_HEADER.size + 4 * (3 * dim + TEMPORAL_SLOT_SIZE + POLICY_SLOT_SIZE)
+
 
 @dataclass
 class CompositeEmbedding:
@@ -1204,6 +1296,200 @@ class IntegrityCheckResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
+# =============================================================================
+# Whitening Storage (v3.2: mmap-shared, non-pickled)
+# =============================================================================
+
+
+class StreamingCovariance:
+    """
+    Streaming mean/covariance over embedding batches.
+
+    Uses the pairwise (Chan et al.) update, so the builder only ever holds
+    one batch plus a D x D accumulator instead of every embedding. State can
+    be checkpointed with save()/load() and shards combined with merge().
+
+    Usage:
+        acc = StreamingCovariance()
+        for batch in batches:           # (n, D) arrays, any n
+            acc.update(batch)
+        matrix = compute_whitening_matrix(acc.mean, acc.covariance())
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean: Optional[np.ndarray] = None
+        self._m2: Optional[np.ndarray] = None
+
+    def update(self, batch: np.ndarray) -> "StreamingCovariance":
+        """Fold an (n, D) batch into the running statistics."""
+        batch = np.asarray(batch, dtype=np.float64)
+        if batch.ndim == 1:
+            batch = batch[None, :]
+        if batch.shape[0] == 0:
+            return self
+
+        batch_mean = batch.mean(axis=0)
+        centered = batch - batch_mean
+        other = StreamingCovariance()
+        other.count, other.mean, other._m2 = batch.shape[0], batch_mean, centered.T @ centered
+        return self.merge(other)
+
+    def merge(self, other: "StreamingCovariance") -> "StreamingCovariance":
+        """Combine statistics from another accumulator (e.g. a parallel shard)."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self._m2 = other.count, other.mean.copy(), other._m2.copy()
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + np.outer(delta, delta) * (self.count * other.count / total)
+        self.mean = self.mean + delta * (other.count / total)
+        self.count = total
+        return self
+
+    def covariance(self, ddof: int = 1) -> np.ndarray:
+        """Sample covariance (ddof=1 matches np.cov)."""
+        if self.count <= ddof:
+            raise ValueError(f"Need more than {ddof} samples for covariance, have {self.count}")
+        return self._m2 / (self.count - ddof)
+
+    def save(self, path: str) -> None:
+        """Checkpoint accumulator state (plain arrays, no pickle)."""
+        with open(path, "wb") as f:
+            np.savez(f, count=np.int64(self.count), mean=self.mean, m2=self._m2)
+
+    @classmethod
+    def load(cls, path: str) -> "StreamingCovariance":
+        """Resume from a save() checkpoint."""
+        acc = cls()
+        with np.load(path, allow_pickle=False) as data:
+            acc.count = int(data["count"])
+            acc.mean = data["mean"]
+            acc._m2 = data["m2"]
+        return acc
+
+
+def compute_whitening_matrix(
+    mean: np.ndarray,
+    cov: np.ndarray,
+    precision: str = WHITENING_PRECISION,
+    epsilon: float = WHITENING_EPSILON,
+) -> np.ndarray:
+    """PCA whitening matrix D^-1/2 @ E^T, computed in float64 and stored at `precision`."""
+    eigenvalues, eigenvectors = np.linalg.eigh(cov)
+    matrix = (eigenvectors / np.sqrt(eigenvalues + epsilon)).T
+    return matrix.astype(precision)
+
+
+def whitening_artifact_base(version_key: str, precision: str = WHITENING_PRECISION) -> str:
+    """Path prefix of a whitening artifact (.npy matrix, .mean.npy, .json sidecar)."""
+    safe_key = version_key.replace(":", "_").replace("/", "_")
+    return os.path.join(WHITENING_STORAGE_DIR, f"whitening_{safe_key}_{precision}")
+
+
+def write_whitening_artifact(
+    base: str,
+    matrix: np.ndarray,
+    mean: Optional[np.ndarray],
+    samples: int = 0,
+) -> Dict[str, Any]:
+    """
+    Write a whitening artifact atomically.
+
+    Each file is written to a temp name and renamed; the JSON sidecar goes
+    last, so readers never see a partial artifact. Returns the sidecar dict.
+    """
+    directory = os.path.dirname(base) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    metadata = {
+        "format_version": WHITENING_FORMAT_VERSION,
+        "iaec_version": IAEC_VERSION,
+        "model_version": EMBEDDING_MODEL_VERSION,
+        "model_family": EMBEDDING_MODEL_FAMILY,
+        "slot_structure": SLOT_STRUCTURE_VERSION,
+        "precision": str(matrix.dtype),
+        "shape": list(matrix.shape),
+        "samples": int(samples),
+        "epsilon": WHITENING_EPSILON,
+        "has_mean": mean is not None,
+        "matrix_sha256": hashlib.sha256(np.ascontiguousarray(matrix).tobytes()).hexdigest(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+    }
+
+    def _atomic_write(path: str, write) -> None:
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".whitening-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                write(f)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    _atomic_write(f"{base}.npy", lambda f: np.save(f, np.ascontiguousarray(matrix), allow_pickle=False))
+    if mean is not None:
+        _atomic_write(
+            f"{base}.mean.npy",
+            lambda f: np.save(f, np.asarray(mean, dtype=matrix.dtype), allow_pickle=False),
+        )
+    _atomic_write(f"{base}.json", lambda f: f.write(json.dumps(metadata, indent=2).encode()))
+    return metadata
+
+
+def load_whitening_artifact(
+    base: str,
+    mmap: bool = True,
+) -> Optional[Tuple[np.ndarray, Optional[np.ndarray], Dict[str, Any]]]:
+    """
+    Open a whitening artifact written by write_whitening_artifact().
+
+    With mmap=True the matrix is a read-only np.memmap: pages come from the
+    OS page cache, so every worker on a node shares one physical copy.
+
+    Returns:
+        (matrix, mean, metadata), or None if the artifact does not exist
+
+    Raises:
+        ValueError: If the artifact belongs to another IAEC/model version,
+            precision or format, or its shape does not match the sidecar
+    """
+    meta_path = f"{base}.json"
+    if not os.path.exists(meta_path):
+        return None
+
+    with open(meta_path) as f:
+        metadata = json.load(f)
+
+    expected = {
+        "format_version": WHITENING_FORMAT_VERSION,
+        "iaec_version": IAEC_VERSION,
+        "model_version": EMBEDDING_MODEL_VERSION,
+        "slot_structure": SLOT_STRUCTURE_VERSION,
+    }
+    for key, value in expected.items():
+        if metadata.get(key) != value:
+            raise ValueError(f"Whitening artifact {key} mismatch (stored: {metadata.get(key)}, current: {value})")
+
+    mmap_mode = "r" if mmap else None
+    matrix = np.load(f"{base}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+    if str(matrix.dtype) != metadata["precision"] or list(matrix.shape) != metadata["shape"]:
+        raise ValueError(
+            f"Whitening artifact does not match its sidecar "
+            f"({matrix.dtype}{list(matrix.shape)} vs {metadata['precision']}{metadata['shape']})"
+        )
+
+    mean = None
+    if metadata.get("has_mean"):
+        mean = np.load(f"{base}.mean.npy", mmap_mode=mmap_mode, allow_pickle=False)
+
+    return matrix, mean, metadata
+
+
 # =============================================================================
 # Core IAEC Class v3.0
 # =============================================================================
@@ -1241,14 +1527,17 @@ class InstructionAwareEmbeddingComposer:
         check = composer.verify_integrity(result)
     """
 
-    def __init__(self, embedding_fn=None):
+    def __init__(self, embedding_fn=None, batch_embedding_fn=None):
         self._embedding_fn = embedding_fn
+        # Optional list -> list provider used by compose_batch (one request per batch)
+        self._batch_embedding_fn = batch_embedding_fn
         self._instruction_cache: Dict[str, np.ndarray] = {}
         self._instruction_raw_cache: Dict[str, np.ndarray] = {}  # For mismatch detection
         self._initialized = False
 
-        # Whitening matrix for slot decorrelation
+        # Whitening matrix for slot decorrelation (read-only memmap once persisted)
         self._whitening_matrix: Optional[np.ndarray] = None
+        self._whitening_mean: Optional[np.ndarray] = None
 
         # Normalization stats
         self._instruction_norms: Dict[str, float] = {}
@@ -1256,15 +1545,20 @@ class InstructionAwareEmbeddingComposer:
         # Current temporal signature
         self._temporal_signature: Optional[TemporalSignature] = None
 
+        # (matrix, basis_id) so the whitening matrix is hashed once, not per compose
+        self._whitening_basis_id_cache: Optional[Tuple[np.ndarray, str]] = None
+
     async def initialize(self):
         """Pre-compute and cache all instruction embeddings."""
         if self._initialized:
             return
 
         if self._embedding_fn is None:
-            from app.memory.vector_store import get_embedding
+            from app.memory.vector_store import get_embedding, get_embeddings_batch
 
             self._embedding_fn = get_embedding
+            if self._batch_embedding_fn is None:
+                self._batch_embedding_fn = get_embeddings_batch
 
         logger.info("IAEC v3.0: Pre-computing instruction embeddings...")
 
@@ -1303,80 +1597,113 @@ class InstructionAwareEmbeddingComposer:
             f"temporal={self._temporal_signature.iaec_version}"
         )
 
+    def _get_whitening_base(self) -> str:
+        """Path prefix of this composer's whitening artifact."""
+        version_key = self._temporal_signature.version_key() if self._temporal_signature else "unknown"
+        return whitening_artifact_base(version_key)
+
     def _get_whitening_path(self) -> str:
         """Get path for whitening matrix storage."""
+        return f"{self._get_whitening_base()}.npy"
+
+    def _get_legacy_whitening_path(self) -> str:
+        """Path of the pre-mmap .npz artifact for this version."""
         version_key = self._temporal_signature.version_key() if self._temporal_signature else "unknown"
         safe_key = version_key.replace(":", "_").replace("/", "_")
         return os.path.join(WHITENING_STORAGE_DIR, f"whitening_{safe_key}.npz")
 
     def _load_whitening_matrix(self) -> bool:
         """
-        Load whitening matrix from disk if available and version-compatible.
+        Map the whitening matrix from disk if available and version-compatible.
+
+        The matrix is opened read-only with mmap (no pickle), so all workers
+        on a node share one page-cache copy. A legacy .npz artifact for the
+        same version is converted once and then mapped.
 
         Returns True if loaded successfully, False otherwise.
         """
         try:
-            path = self._get_whitening_path()
-            if not os.path.exists(path):
-                IAEC_WHITENING_LOADS.labels(result="not_found").inc()
-                return False
-
-            data = np.load(path, allow_pickle=True)
+            base = self._get_whitening_base()
+            loaded = load_whitening_artifact(base)
 
-            # Verify version compatibility
-            stored_version = str(data.get("iaec_version", "unknown"))
-            stored_model = str(data.get("model_version", "unknown"))
+            if loaded is None and os.path.exists(self._get_legacy_whitening_path()):
+                if not self._migrate_legacy_whitening(base):
+                    return False
+                loaded = load_whitening_artifact(base)
 
-            if stored_version != IAEC_VERSION or stored_model != EMBEDDING_MODEL_VERSION:
-                logger.warning(
-                    f"IAEC: Whitening matrix version mismatch "
-                    f"(stored: {stored_version}/{stored_model}, current: {IAEC_VERSION}/{EMBEDDING_MODEL_VERSION})"
-                )
-                IAEC_WHITENING_LOADS.labels(result="version_mismatch").inc()
+            if loaded is None:
+                IAEC_WHITENING_LOADS.labels(result="not_found").inc()
                 return False
 
-            self._whitening_matrix = data["matrix"]
-            self._whitening_mean = data.get("mean")
+            matrix, mean, metadata = loaded
+            self._whitening_matrix = matrix
+            self._whitening_mean = mean
+            # Sidecar carries the hash, so the mapped pages are not read just to build the ID
+            self._whitening_basis_id_cache = (matrix, f"wht_{EMBEDDING_MODEL_FAMILY}_{metadata['matrix_sha256'][:16]}")
 
-            logger.info(f"IAEC: Loaded whitening matrix from {path}")
+            logger.info(f"IAEC: Mapped whitening matrix from {base}.npy ({metadata['precision']})")
             IAEC_WHITENING_LOADS.labels(result="success").inc()
             return True
 
+        except ValueError as e:
+            logger.warning(f"IAEC: Whitening matrix version mismatch: {e}")
+            IAEC_WHITENING_LOADS.labels(result="version_mismatch").inc()
+            return False
+
         except Exception as e:
             logger.warning(f"IAEC: Failed to load whitening matrix: {e}")
             IAEC_WHITENING_LOADS.labels(result="error").inc()
             return False
 
-    def _save_whitening_matrix(self):
+    def _migrate_legacy_whitening(self, base: str) -> bool:
+        """Convert a legacy .npz artifact to the mmap format (read without pickle)."""
+        path = self._get_legacy_whitening_path()
+        with np.load(path, allow_pickle=False) as data:
+            stored_version = str(data["iaec_version"]) if "iaec_version" in data else "unknown"
+            stored_model = str(data["model_version"]) if "model_version" in data else "unknown"
+            if stored_version != IAEC_VERSION or stored_model != EMBEDDING_MODEL_VERSION:
+                logger.warning(
+                    f"IAEC: Legacy whitening matrix version mismatch "
+                    f"(stored: {stored_version}/{stored_model}, current: {IAEC_VERSION}/{EMBEDDING_MODEL_VERSION})"
+                )
+                IAEC_WHITENING_LOADS.labels(result="version_mismatch").inc()
+                return False
+
+            matrix = data["matrix"].astype(WHITENING_PRECISION)
+            try:
+                mean = data["mean"]
+            except ValueError:
+                # mean=None was saved as a pickled object array
+                mean = None
+
+        write_whitening_artifact(base, matrix, mean)
+        IAEC_WHITENING_LOADS.labels(result="migrated").inc()
+        logger.info(f"IAEC: Migrated legacy whitening matrix {path} -> {base}.npy")
+        return True
+
+    def _save_whitening_matrix(self, samples: int = 0) -> bool:
         """
         Save whitening matrix to disk with version locking.
 
         The matrix is immutable per-version - never overwritten.
+
+        Returns True if a new artifact was written.
         """
         try:
-            os.makedirs(WHITENING_STORAGE_DIR, exist_ok=True)
-            path = self._get_whitening_path()
+            base = self._get_whitening_base()
 
             # Don't overwrite existing (immutable per-version)
-            if os.path.exists(path):
-                logger.debug(f"IAEC: Whitening matrix already exists at {path}, skipping save")
-                return
-
-            np.savez_compressed(
-                path,
-                matrix=self._whitening_matrix,
-                mean=self._whitening_mean if hasattr(self, "_whitening_mean") else None,
-                iaec_version=IAEC_VERSION,
-                model_version=EMBEDDING_MODEL_VERSION,
-                model_family=EMBEDDING_MODEL_FAMILY,
-                slot_structure=SLOT_STRUCTURE_VERSION,
-                created_at=datetime.now(timezone.utc).isoformat(),
-            )
+            if os.path.exists(f"{base}.json"):
+                logger.debug(f"IAEC: Whitening matrix already exists at {base}.npy, skipping save")
+                return False
 
-            logger.info(f"IAEC: Saved whitening matrix to {path}")
+            write_whitening_artifact(base, self._whitening_matrix, self._whitening_mean, samples=samples)
+            logger.info(f"IAEC: Saved whitening matrix to {base}.npy")
+            return True
 
         except Exception as e:
             logger.warning(f"IAEC: Failed to save whitening matrix: {e}")
+            return False
 
     def _compute_whitening_matrix(self, embeddings: np.ndarray, force_recompute: bool = False):
         """
@@ -1385,7 +1712,11 @@ class InstructionAwareEmbeddingComposer:
         v3.1: Persistent storage with version locking.
         - First tries to load from disk
         - If not found or version mismatch, computes new
-        - Saves computed matrix (immutable per-version)
+        - Saves computed matrix (immutable per-version), then maps the saved
+          copy so this worker shares it too
+
+        Large corpora should be whitened offline with StreamingCovariance
+        (scripts/build_iaec_whitening.py) rather than passed in here.
         """
         # Try to load existing matrix first (unless forced)
         if not force_recompute and self._load_whitening_matrix():
@@ -1396,18 +1727,13 @@ class InstructionAwareEmbeddingComposer:
             logger.info("IAEC: Computing new whitening matrix...")
             IAEC_WHITENING_LOADS.labels(result="compute_new").inc()
 
-            self._whitening_mean = np.mean(embeddings, axis=0)
-            centered = embeddings - self._whitening_mean
-            cov = np.cov(centered.T)
-
-            # Use deterministic eigenvalue decomposition
-            eigenvalues, eigenvectors = np.linalg.eigh(cov)
-            epsilon = 1e-5
-            D_inv_sqrt = np.diag(1.0 / np.sqrt(eigenvalues + epsilon))
-            self._whitening_matrix = D_inv_sqrt @ eigenvectors.T
+            acc = StreamingCovariance().update(embeddings)
+            self._whitening_mean = acc.mean.astype(WHITENING_PRECISION)
+            self._whitening_matrix = compute_whitening_matrix(acc.mean, acc.covariance())
 
             # Save for future use (immutable per-version)
-            self._save_whitening_matrix()
+            if self._save_whitening_matrix(samples=acc.count):
+                self._load_whitening_matrix()
 
             logger.info("IAEC: Whitening matrix computed for slot decorrelation")
 
@@ -1415,11 +1741,28 @@ class InstructionAwareEmbeddingComposer:
             logger.warning(f"IAEC: Could not compute whitening matrix: {e}")
             self._whitening_matrix = None
 
+    def _whitening_metadata(self) -> Tuple[Optional[str], Optional[str]]:
+        """Stable whitening basis ID and version for audit replay (hash cached per matrix)."""
+        if self._whitening_matrix is None:
+            return None, None
+
+        cached = self._whitening_basis_id_cache
+        if cached is None or cached[0] is not self._whitening_matrix:
+            matrix_hash = hashlib.sha256(self._whitening_matrix.tobytes()).hexdigest()[:16]
+            cached = (self._whitening_matrix, f"wht_{EMBEDDING_MODEL_FAMILY}_{matrix_hash}")
+            self._whitening_basis_id_cache = cached
+
+        return cached[
+            1
+        ], f"{IAEC_VERSION}/{EMBEDDING_MODEL_VERSION}/{SLOT_STRUCTURE_VERSION}/{self._whitening_matrix.dtype}"
+
     def get_whitening_info(self) -> Dict[str, Any]:
         """Get information about current whitening matrix."""
         return {
             "available": self._whitening_matrix is not None,
             "shape": self._whitening_matrix.shape if self._whitening_matrix is not None else None,
+            "precision": str(self._whitening_matrix.dtype) if self._whitening_matrix is not None else None,
+            "memory_mapped": isinstance(self._whitening_matrix, np.memmap),
             "storage_path": self._get_whitening_path() if self._temporal_signature else None,
             "iaec_version": IAEC_VERSION,
             "model_version": EMBEDDING_MODEL_VERSION,
@@ -1804,13 +2147,7 @@ class InstructionAwareEmbeddingComposer:
         IAEC_COMPOSITIONS.labels(mode=mode, instruction=instruction, version="3.2").inc()
 
         # v3.2: Generate whitening metadata for audit replay
-        whitening_basis_id = None
-        whitening_version = None
-        if self._whitening_matrix is not None:
-            # Generate stable ID from whitening matrix hash
-            matrix_hash = hashlib.sha256(self._whitening_matrix.tobytes()).hexdigest()[:16]
-            whitening_basis_id = f"wht_{EMBEDDING_MODEL_FAMILY}_{matrix_hash}"
-            whitening_version = f"{IAEC_VERSION}/{EMBEDDING_MODEL_VERSION}/{SLOT_STRUCTURE_VERSION}"
+        whitening_basis_id, whitening_version = self._whitening_metadata()
 
         return CompositeEmbedding(
             vector=composed,
@@ -1838,6 +2175,222 @@ class InstructionAwareEmbeddingComposer:
             whitening_version=whitening_version,
         )
 
+    async def compose_batch(
+        self,
+        items: Sequence[Tuple[str, str, Optional[str]]],
+        mode: Literal["segmented", "weighted", "hybrid"] = "weighted",
+        policy_id: Optional[str] = None,
+        policy_version: int = 1,
+        policy_level: int = 0,
+        detect_mismatch: bool = True,
+        store_basis: bool = True,
+    ) -> List[CompositeEmbedding]:
+        """
+        Compose many (instruction, query, context) triples at once.
+
+        Produces the same CompositeEmbedding per item as compose(), but:
+        - all queries and contexts are embedded through one batched provider
+          call (falls back to concurrent single calls without a batch provider)
+        - slot weighting, clamping, collapse checks, norm coefficients and
+          reconstruction checks run as (N, D) matrix operations
+        - temporal signature, policy encoding and whitening metadata are
+          built once per batch
+
+        Args:
+            items: (instruction, query, context) triples; context may be None
+            mode, policy_*, detect_mismatch, store_basis: as in compose()
+
+        Returns:
+            One CompositeEmbedding per item, in input order
+        """
+        import time
+
+        if not items:
+            return []
+
+        start = time.perf_counter()
+
+        if not self._initialized:
+            await self.initialize()
+
+        instructions = [instr.lower() if instr.lower() in INSTRUCTION_WEIGHTS else "default" for instr, _, _ in items]
+        queries = [query for _, query, _ in items]
+        contexts = [context for _, _, context in items]
+        has_context = np.array([bool(c and c.strip()) for c in contexts])
+        n = len(items)
+
+        # One provider round trip for every distinct query/context text
+        texts = queries + [c for c, present in zip(contexts, has_context) if present]
+        embedded = await self._embed_batch(texts)
+        query_full = embedded[:n]
+
+        instr_mat = np.stack([self._get_instruction_embedding(instr) for instr in instructions])
+        query_mat = self._normalize_rows(query_full)
+        ctx_mat = np.zeros((n, embedded.shape[1]), dtype=np.float32)
+        if has_context.any():
+            ctx_mat[has_context] = self._normalize_rows(embedded[n:])
+
+        weights = [INSTRUCTION_WEIGHTS.get(instr, INSTRUCTION_WEIGHTS["default"]) for instr in instructions]
+        weight_mat = np.array(weights, dtype=np.float32)
+        norm_coefs = np.array([INSTRUCTION_NORM_COEFFICIENTS.get(instr, 1.0) for instr in instructions])
+
+        temporal_sig = TemporalSignature.current()
+        temporal_vec = temporal_sig.encode()
+        policy_enc = PolicyEncoding.from_id(policy_id, policy_version, policy_level)
+        policy_vec = policy_enc.vector
+        metadata = np.concatenate([temporal_vec, policy_vec])
+
+        # Slot weighting for the whole batch
+        if mode == "segmented":
+            composed = np.hstack(
+                [
+                    instr_mat[:, :SEGMENT_SIZE],
+                    query_mat[:, :SEGMENT_SIZE],
+                    ctx_mat[:, :SEGMENT_SIZE],
+                    np.broadcast_to(metadata, (n, metadata.shape[0])),
+                ]
+            )
+        else:
+            content = (
+                weight_mat[:, 0:1] * instr_mat[:, :CONTENT_DIMENSIONS]
+                + weight_mat[:, 1:2] * query_mat[:, :CONTENT_DIMENSIONS]
+                + weight_mat[:, 2:3] * ctx_mat[:, :CONTENT_DIMENSIONS]
+            )
+            composed = np.hstack([content, np.broadcast_to(metadata, (n, metadata.shape[0]))])
+
+        # Anti-collapse: clamp extreme values
+        clamped = np.clip(composed, VALUE_CLAMP_MIN, VALUE_CLAMP_MAX)
+        values_clamped = (clamped != composed).any(axis=1)
+        composed = clamped
+        if values_clamped.any():
+            IAEC_COLLAPSE_EVENTS.labels(type="value_clamped").inc(int(values_clamped.sum()))
+
+        # Anti-collapse: context dominance, rebalanced row by row (rare path)
+        collapsed = np.linalg.norm(ctx_mat, axis=1) >= MIN_VECTOR_NORM
+        if collapsed.any():
+            ctx_sim = np.einsum("ij,ij->i", composed, ctx_mat)
+            query_sim = np.einsum("ij,ij->i", composed, query_mat)
+            collapsed &= (ctx_sim > COLLAPSE_THRESHOLD) & (ctx_sim > query_sim * 1.5)
+        for i in np.flatnonzero(collapsed):
+            IAEC_COLLAPSE_EVENTS.labels(type="context_dominant").inc()
+            rebalanced = self._rebalance_collapsed(instr_mat[i], query_mat[i], ctx_mat[i], instructions[i])
+            composed[i] = self._add_metadata_slots(rebalanced, temporal_vec, policy_vec)
+
+        # Cross-instruction normalization + final L2 (content portion only)
+        content = composed[:, :CONTENT_DIMENSIONS] * norm_coefs[:, None]
+        content_norms = np.linalg.norm(content, axis=1, keepdims=True)
+        composed[:, :CONTENT_DIMENSIONS] = np.divide(content, content_norms, out=content, where=content_norms > 0)
+
+        # Reconstruction check for the whole batch (mirrors _reconstruct_from_basis)
+        keep_basis = store_basis and mode in ("weighted", "hybrid")
+        reconstruction_errors = np.zeros(n)
+        if keep_basis:
+            recon = (
+                weight_mat[:, 0:1] * instr_mat[:, :CONTENT_DIMENSIONS]
+                + weight_mat[:, 1:2] * query_mat[:, :CONTENT_DIMENSIONS]
+                + weight_mat[:, 2:3] * ctx_mat[:, :CONTENT_DIMENSIONS]
+            )
+            recon = recon / np.maximum(np.linalg.norm(recon, axis=1, keepdims=True), 1e-8)
+            recon = recon * norm_coefs[:, None]
+            recon = recon / np.maximum(np.linalg.norm(recon, axis=1, keepdims=True), 1e-8)
+            recon = np.hstack([recon, np.broadcast_to(metadata, (n, metadata.shape[0]))])
+            reconstruction_errors = np.linalg.norm(composed - recon, axis=1)
+
+        whitening_basis_id, whitening_version = self._whitening_metadata()
+
+        results: List[CompositeEmbedding] = []
+        for i, (instruction, query, context) in enumerate(zip(instructions, queries, contexts)):
+            mismatch_score = 0.0
+            deep_mismatch_score = 0.0
+            if detect_mismatch:
+                mismatch_score, kw_suggested = self._detect_mismatch_keyword(instruction, query)
+                deep_mismatch_score, emb_suggested, corrective_action = await self._detect_mismatch_deep(
+                    instruction, query_full[i]
+                )
+                suggested_instruction = emb_suggested if deep_mismatch_score > DEEP_MISMATCH_THRESHOLD else kw_suggested
+                if deep_mismatch_score > DEEP_MISMATCH_THRESHOLD:
+                    IAEC_MISMATCH_WARNINGS.labels(instruction=instruction, detection_method="embedding").inc()
+                    logger.warning(
+                        f"IAEC: Deep mismatch detected (instruction={instruction}, "
+                        f"score={deep_mismatch_score:.2f}, suggested={suggested_instruction})"
+                    )
+                    if corrective_action and corrective_action.should_auto_correct:
+                        logger.warning(
+                            f"IAEC: Corrective action prescribed: {corrective_action.reason} "
+                            f"(confidence={corrective_action.confidence:.2f})"
+                        )
+                elif mismatch_score > MISMATCH_THRESHOLD:
+                    IAEC_MISMATCH_WARNINGS.labels(instruction=instruction, detection_method="keyword").inc()
+
+            slot_basis = None
+            slot_basis_hash = None
+            if keep_basis:
+                slot_basis = SlotBasis(
+                    instruction_vector=instr_mat[i].copy(),
+                    query_vector=query_mat[i].copy(),
+                    context_vector=ctx_mat[i].copy(),
+                    weights=weights[i],
+                    temporal_vector=temporal_vec.copy(),
+                    policy_vector=policy_vec.copy(),
+                )
+                slot_basis_hash = hashlib.sha256(slot_basis.to_bytes()).hexdigest()[:16]
+
+            IAEC_COMPOSITIONS.labels(mode=mode, instruction=instruction, version="3.2").inc()
+
+            results.append(
+                CompositeEmbedding(
+                    vector=composed[i].copy(),
+                    mode=mode,
+                    instruction=instruction,
+                    weights=weights[i],
+                    norm_coefficient=float(norm_coefs[i]),
+                    instruction_hash=self._hash_text(INSTRUCTION_PROMPTS.get(instruction, "")),
+                    query_hash=self._hash_text(query),
+                    context_hash=self._hash_text(context) if context else None,
+                    provenance_hash=self._compute_provenance_hash(
+                        instruction, query, context, mode, weights[i], policy_id
+                    ),
+                    mismatch_score=mismatch_score,
+                    deep_mismatch_score=deep_mismatch_score,
+                    collapse_prevented=bool(collapsed[i]),
+                    values_clamped=bool(values_clamped[i]),
+                    policy_id=policy_id,
+                    policy_encoding=policy_enc,
+                    temporal_signature=temporal_sig,
+                    slot_basis=slot_basis,
+                    slot_basis_hash=slot_basis_hash,
+                    integrity_verified=float(reconstruction_errors[i]) < 0.01,
+                    reconstruction_error=float(reconstruction_errors[i]),
+                    iaec_version=IAEC_VERSION,
+                    whitening_basis_id=whitening_basis_id,
+                    whitening_version=whitening_version,
+                )
+            )
+
+        IAEC_BATCH_SIZE.observe(n)
+        IAEC_BATCH_COMPOSITION_LATENCY.observe(time.perf_counter() - start)
+        return results
+
+    async def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as an (N, D) float32 matrix, requesting each distinct text once."""
+        unique = list(dict.fromkeys(texts))
+        if self._batch_embedding_fn is not None:
+            raw = await self._batch_embedding_fn(unique, use_cache=True)
+        else:
+            raw = await asyncio.gather(*(self._embedding_fn(text, use_cache=True) for text in unique))
+
+        matrix = np.asarray(raw, dtype=np.float32)
+        position = {text: i for i, text in enumerate(unique)}
+        return matrix[[position[text] for text in texts]]
+
+    def _normalize_rows(self, mat: np.ndarray) -> np.ndarray:
+        """Row-wise _normalize(); near-zero rows take the scalar anti-collapse path."""
+        norms = np.linalg.norm(mat, axis=1)
+        out = mat / np.where(norms > 0, norms, 1.0)[:, None]
+        for i in np.flatnonzero(norms < MIN_VECTOR_NORM):
+            out[i] = self._normalize(mat[i])
+        return out.astype(np.float32, copy=False)
+
     def _compose_segmented(
         self,
         instr: np.ndarray,
@@ -2154,6 +2707,105 @@ class InstructionAwareEmbeddingComposer:
         else:
             raise ValueError(f"Unknown similarity mode: {mode}")
 
+    def similarity_matrix(
+        self,
+        query: Union[CompositeEmbedding, np.ndarray],
+        candidates: Union[np.ndarray, Sequence[Union[CompositeEmbedding, np.ndarray]]],
+        mode: Literal["cosine", "instruction_weighted", "slot_weighted"] = "cosine",
+        instruction: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Score one embedding against many in a single vectorised pass.
+
+        Equivalent to [similarity(query, c, mode, instruction) for c in candidates]
+        without per-pair decompose() calls: slot regions are sliced out of the
+        (N, D) candidate matrix and compared with one matrix-vector product
+        per slot. A raw (N, D) float32 array is used without copying.
+
+        Unlike similarity(), slots below MIN_VECTOR_NORM are not jittered by
+        _normalize() (all-zero slots score 0), so results are deterministic.
+
+        Returns:
+            (N,) float32 array of scores
+        """
+        if isinstance(candidates, np.ndarray):
+            cand_mat = np.asarray(candidates, dtype=np.float32)
+            cand_items = None
+        else:
+            cand_items = list(candidates)
+            if not cand_items:
+                return np.zeros(0, dtype=np.float32)
+            cand_mat = np.stack([c.vector if isinstance(c, CompositeEmbedding) else c for c in cand_items]).astype(
+                np.float32, copy=False
+            )
+
+        if cand_mat.ndim != 2:
+            raise ValueError(f"candidates must be a 2-D (N, D) array, got shape {cand_mat.shape}")
+
+        IAEC_SIMILARITY_MATRIX_SIZE.observe(cand_mat.shape[0])
+        query_vec = np.asarray(query.vector if isinstance(query, CompositeEmbedding) else query, dtype=np.float32)
+
+        if mode == "cosine":
+            dots = cand_mat @ query_vec
+            denom = np.linalg.norm(cand_mat, axis=1) * np.linalg.norm(query_vec) + 1e-8
+            return (dots / denom).astype(np.float32, copy=False)
+
+        if mode not in ("instruction_weighted", "slot_weighted"):
+            raise ValueError(f"Unknown similarity mode: {mode}")
+
+        query_slots = self._content_slots(query)
+        slot_sims = []
+        for slot_index, query_slot in enumerate(query_slots):
+            if cand_items is None or all(self._content_slots_are_segments(c) for c in cand_items):
+                lo = slot_index * SEGMENT_SIZE
+                slot_mat = cand_mat[:, lo : lo + SEGMENT_SIZE]
+            else:
+                slot_mat = np.stack([self._content_slots(c)[slot_index] for c in cand_items])
+            slot_sims.append(self._slot_cosines(query_slot, slot_mat))
+
+        if mode == "instruction_weighted":
+            wi, wq, wc = INSTRUCTION_WEIGHTS.get(instruction or "default", (0.33, 0.34, 0.33))
+            scores = wi * slot_sims[0] + wq * slot_sims[1] + wc * slot_sims[2]
+        else:
+            scores = (slot_sims[0] + slot_sims[1] + slot_sims[2]) / 3.0
+
+        return scores.astype(np.float32, copy=False)
+
+    def _content_slots(
+        self, embedding: Union[CompositeEmbedding, np.ndarray]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Instruction/query/context slots exactly as decompose() extracts them (no metrics)."""
+        if self._content_slots_are_segments(embedding):
+            vec = embedding.vector if isinstance(embedding, CompositeEmbedding) else embedding
+            return (
+                vec[:SEGMENT_SIZE],
+                vec[SEGMENT_SIZE : 2 * SEGMENT_SIZE],
+                vec[2 * SEGMENT_SIZE : 3 * SEGMENT_SIZE],
+            )
+        basis = embedding.slot_basis
+        return (
+            basis.instruction_vector[:SEGMENT_SIZE],
+            basis.query_vector[:SEGMENT_SIZE],
+            basis.context_vector[:SEGMENT_SIZE],
+        )
+
+    @staticmethod
+    def _content_slots_are_segments(embedding: Union[CompositeEmbedding, np.ndarray]) -> bool:
+        """Whether decompose() reads the slots straight from the vector's segments."""
+        return not isinstance(embedding, CompositeEmbedding) or (
+            embedding.mode == "segmented" or embedding.slot_basis is None
+        )
+
+    @staticmethod
+    def _slot_cosines(query_slot: np.ndarray, slot_mat: np.ndarray) -> np.ndarray:
+        """Cosine of one slot against each row of an (N, S) slot matrix."""
+        query_norm = np.linalg.norm(query_slot)
+        row_norms = np.linalg.norm(slot_mat, axis=1)
+        if query_norm == 0:
+            return np.zeros(slot_mat.shape[0], dtype=np.float32)
+        dots = slot_mat @ (query_slot / query_norm).astype(np.float32, copy=False)
+        return np.divide(dots, row_norms, out=np.zeros_like(dots), where=row_norms > 0)
+
     def get_instruction_types(self) -> List[str]:
         """Get list of supported instruction types."""
         return list(INSTRUCTION_PROMPTS.keys())
@@ -62,6 +62,7 @@ EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
 VOYAGE_MODEL = os.getenv("VOYAGE_MODEL", "voyage-3-lite")  # voyage-3, voyage-3-lite, voyage-code-3
 EMBEDDING_DIMENSIONS = int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
 EMBEDDING_FALLBACK_ENABLED = os.getenv("EMBEDDING_FALLBACK_ENABLED", "true").lower() == "true"
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "128"))  # Voyage caps a request at 128 inputs
 
 
 class EmbeddingError(Exception):
@@ -241,6 +242,117 @@ async def get_embedding(text: str, allow_fallback: bool = True, use_cache: bool
     raise last_error or EmbeddingError("No embedding providers available")
 
 
+async def get_embeddings_batch_provider(provider: str, texts: List[str]) -> List[List[float]]:
+    """
+    Embed several texts with a single provider request.
+
+    Both OpenAI and Voyage accept a list as "input" and return one embedding
+    per item (tagged with its index). Counts as one call against the quota.
+    """
+    import time
+
+    if provider == "voyage":
+        api_key, url, model = VOYAGE_API_KEY, "https://api.voyageai.com/v1/embeddings", VOYAGE_MODEL
+        payload: Dict[str, Any] = {"input_type": "document"}
+    else:
+        api_key, url, model = OPENAI_API_KEY, "https://api.openai.com/v1/embeddings", EMBEDDING_MODEL
+        payload = {}
+
+    if not api_key:
+        raise EmbeddingError(f"{provider.upper()}_API_KEY not set")
+
+    if not check_embedding_quota():
+        raise EmbeddingError("Daily embedding quota exceeded")
+
+    payload.update({"model": model, "input": [t[:8000] for t in texts]})
+    start_time = time.perf_counter()
+
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        try:
+            response = await client.post(
+                url,
+                headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"},
+                json=payload,
+            )
+        except httpx.TimeoutException:
+            EMBEDDING_ERRORS.labels(provider=provider, error_type="timeout").inc()
+            raise EmbeddingError(f"{provider} API timeout")
+
+    EMBEDDING_API_LATENCY.labels(provider=provider).observe(time.perf_counter() - start_time)
+
+    if response.status_code == 429:
+        EMBEDDING_ERRORS.labels(provider=provider, error_type="rate_limit").inc()
+        raise EmbeddingError(f"{provider} API rate limited")
+    elif response.status_code == 401:
+        EMBEDDING_ERRORS.labels(provider=provider, error_type="auth").inc()
+        raise EmbeddingError(f"{provider} API authentication failed")
+    elif response.status_code != 200:
+        EMBEDDING_ERRORS.labels(provider=provider, error_type="other").inc()
+        raise EmbeddingError(f"{provider} API error: {response.status_code} - {response.text}")
+
+    increment_embedding_count()
+    EMBEDDING_API_CALLS.labels(provider=provider, status="success").inc()
+
+    data = sorted(response.json()["data"], key=lambda item: item["index"])
+    return [item["embedding"] for item in data]
+
+
+async def get_embeddings_batch(
+    texts: List[str],
+    allow_fallback: bool = True,
+    use_cache: bool = True,
+) -> List[List[float]]:
+    """
+    Batched counterpart of get_embedding().
+
+    Cache hits are served individually; all misses go to the provider in
+    chunks of EMBEDDING_BATCH_SIZE texts per request instead of one request
+    per text. Results are returned in input order.
+    """
+    from app.memory.embedding_cache import get_embedding_cache
+
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    cache = get_embedding_cache() if use_cache else None
+
+    missing: List[int] = []
+    for i, text in enumerate(texts):
+        if cache is not None:
+            model = EMBEDDING_MODEL if EMBEDDING_PROVIDER == "openai" else VOYAGE_MODEL
+            cached = await cache.get(text, model=model, provider=EMBEDDING_PROVIDER)
+            if cached is not None:
+                results[i] = cached
+                continue
+        missing.append(i)
+
+    providers = [EMBEDDING_PROVIDER]
+    if EMBEDDING_FALLBACK_ENABLED and allow_fallback and EMBEDDING_BACKUP_PROVIDER:
+        providers.append(EMBEDDING_BACKUP_PROVIDER)
+
+    for offset in range(0, len(missing), EMBEDDING_BATCH_SIZE):
+        chunk = missing[offset : offset + EMBEDDING_BATCH_SIZE]
+        chunk_texts = [texts[i] for i in chunk]
+
+        for provider in providers:
+            try:
+                embeddings = await get_embeddings_batch_provider(provider, chunk_texts)
+                break
+            except EmbeddingError as e:
+                if provider == EMBEDDING_PROVIDER and len(providers) > 1:
+                    logger.warning(
+                        f"Primary provider {provider} failed ({e}), trying backup {EMBEDDING_BACKUP_PROVIDER}"
+                    )
+                    continue
+                raise
+
+        model = VOYAGE_MODEL if provider == "voyage" else EMBEDDING_MODEL
+        for i, embedding in zip(chunk, embeddings):
+            results[i] = embedding
+            if cache is not None:
+                await cache.set(texts[i], embedding, model=model)
+
+    return results
+
+
 def compute_text_hash(text: str) -> str:
     """Compute hash of text for deduplication."""
     return hashlib.sha256(text.encode()).hexdigest()[:16]
@@ -146,6 +146,11 @@ recovery_suggestions_latency_seconds = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
 )
 
+# Recovery lookups per hybrid layer (cache, lexical, embedding, llm, fallback)
+recovery_match_layer_total = Counter(
+    "recovery_match_layer_total", "Recovery hybrid lookups per layer", ["layer", "outcome"]
+)
+
 # Recovery approval counters
 recovery_approvals_total = Counter(
     "recovery_approvals_total", "Total recovery candidate approvals/rejections", ["decision"]
@@ -441,6 +446,36 @@ m10_consumer_count = Gauge("m10_consumer_count", "Number of active M10 stream co
 
 m10_reclaim_count = Gauge("m10_reclaim_count", "Number of reclaim attempts in progress")
 
+# =====================
+# Event Publisher Buffer Metrics (batched publish path)
+# =====================
+
+aos_event_publisher_queue_depth = Gauge(
+    "aos_event_publisher_queue_depth",
+    "Events buffered awaiting flush",
+    ["adapter"],
+)
+
+aos_event_publisher_events_total = Counter(
+    "aos_event_publisher_events_total",
+    "Events handled by the buffered publisher",
+    ["adapter", "outcome"],  # outcome: published, dropped, failed
+)
+
+aos_event_publisher_batch_size = Histogram(
+    "aos_event_publisher_batch_size",
+    "Events per flushed batch",
+    ["adapter"],
+    buckets=(1, 5, 10, 25, 50, 100, 250, 500, 1000),
+)
+
+aos_event_publisher_flush_seconds = Histogram(
+    "aos_event_publisher_flush_seconds",
+    "Time to flush one batch to the transport (seconds)",
+    ["adapter"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
 # Aliases for test imports (UPPERCASE names)
 M10_QUEUE_DEPTH = m10_queue_depth
 M10_DEAD_LETTER_COUNT = m10_dead_letter_count
@@ -713,6 +748,30 @@ governance_limit_breaches_recorded_total = Counter(
     # breach_type: BREACHED, EXHAUSTED, THROTTLED, VIOLATED
 )
 
+# Decision record sink (contracts.decision_records, buffered write path)
+aos_decision_sink_queue_depth = Gauge(
+    "aos_decision_sink_queue_depth",
+    "Decision records queued awaiting flush",
+)
+
+aos_decision_sink_records_total = Counter(
+    "aos_decision_sink_records_total",
+    "Decision records handled by the buffered sink",
+    ["outcome"],  # outcome: written, duplicate, dropped, failed
+)
+
+aos_decision_sink_batch_size = Histogram(
+    "aos_decision_sink_batch_size",
+    "Decision records per flushed batch",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500),
+)
+
+aos_decision_sink_flush_seconds = Histogram(
+    "aos_decision_sink_flush_seconds",
+    "Time to write one batch of decision records (seconds)",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
 # =====================
 # Customer Integration Metrics (Phase 6 - Evidence Signal Wiring)
 # Namespace: cus_llm_*, cus_enforcement_*, cus_integration_*
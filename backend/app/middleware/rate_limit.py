@@ -14,7 +14,9 @@ Rate Limit Middleware
 M8 Deliverable: JWT-based rate limiting per tenant/tier
 
 Enforces per-tenant rate limits based on user's rate_limit_tier claim from JWT.
-Uses Redis (Upstash) for distributed rate limiting with fixed-window algorithm.
+Uses Redis (Upstash) token buckets leased to each process in slices
+(app.utils.rate_limiter.LeasedRateLimiter), so most requests are decided
+locally without a Redis round trip.
 
 Tiers:
 - free: 60 requests/minute
@@ -35,6 +37,7 @@ Usage:
 """
 
 import logging
+import math
 import os
 import time
 from typing import Optional
@@ -47,6 +50,7 @@ except ImportError:
     import aioredis
 
 from app.utils.metrics_helpers import get_or_create_counter, get_or_create_gauge
+from app.utils.rate_limiter import LeasedRateLimiter, RateLimitDecision
 
 logger = logging.getLogger(__name__)
 
@@ -62,7 +66,6 @@ rl_redis_errors = get_or_create_counter("aos_rate_limit_redis_errors_total", "To
 # Configuration
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 RATE_LIMIT_ENABLED = os.environ.get("RATE_LIMIT_ENABLED", "true").lower() == "true"
-RATE_LIMIT_FAIL_OPEN = os.environ.get("RATE_LIMIT_FAIL_OPEN", "true").lower() == "true"
 
 # Tier configurations: (requests_per_window, window_seconds)
 RATE_LIMIT_TIERS = {
@@ -94,6 +97,16 @@ async def get_redis() -> aioredis.Redis:
     return _redis_pool
 
 
+# Leased token buckets sharing the pool above (fail-open/closed is applied
+# by check_rate_limit_decision so RATE_LIMIT_FAIL_OPEN stays authoritative)
+_limiter = LeasedRateLimiter(redis_factory=lambda: get_redis())
+
+
+def rate_limit_fail_open() -> bool:
+    """RATE_LIMIT_FAIL_OPEN, read per call so operators can flip it without a restart."""
+    return os.environ.get("RATE_LIMIT_FAIL_OPEN", "true").lower() == "true"
+
+
 def get_tier_limits(tier: Optional[str]) -> tuple:
     """Get rate limit configuration for a tier."""
     if not tier or tier not in RATE_LIMIT_TIERS:
@@ -129,12 +142,9 @@ def extract_tier_from_user(user) -> str:
     return "free"
 
 
-async def check_rate_limit(tenant_id: str, tier: str) -> tuple:
+async def check_rate_limit_decision(tenant_id: str, tier: str) -> RateLimitDecision:
     """
-    Check and increment rate limit counter.
-
-    Returns:
-        (allowed: bool, current_count: int, limit: int, remaining: int)
+    Take one token from the tenant's bucket.
 
     Behavior on Redis failure:
         - RATE_LIMIT_FAIL_OPEN=true (default): Allow request, log warning
@@ -142,39 +152,35 @@ async def check_rate_limit(tenant_id: str, tier: str) -> tuple:
     """
     reqs_limit, window_seconds = get_tier_limits(tier)
 
-    # Calculate current window slot
-    current_slot = int(time.time() // window_seconds)
-    key = f"rl:{tenant_id}:{tier}:{current_slot}"
+    decision = await _limiter.acquire(f"rl:{tenant_id}:{tier}", reqs_limit, window_seconds)
 
-    try:
-        redis = await get_redis()
+    if not decision.degraded:
         rl_redis_connected.set(1)
+        return decision
 
-        # Atomic increment
-        current = await redis.incr(key)
-
-        # Set expiry on first request in window
-        if current == 1:
-            await redis.expire(key, window_seconds + 2)
+    rl_redis_connected.set(0)
+    rl_redis_errors.inc()
+    if rate_limit_fail_open():
+        # Fail-open: allow request if Redis unavailable
+        logger.warning("Rate limit check failed (FAIL_OPEN=true, allowing request)")
+        return RateLimitDecision(True, reqs_limit, reqs_limit, degraded=True)
+    # Fail-closed: deny request if Redis unavailable
+    logger.error("Rate limit check failed (FAIL_OPEN=false, denying request)")
+    return RateLimitDecision(False, reqs_limit, 0, retry_after=decision.retry_after, degraded=True)
 
-        allowed = current <= reqs_limit
-        remaining = max(0, reqs_limit - current)
 
-        return allowed, current, reqs_limit, remaining
+async def check_rate_limit(tenant_id: str, tier: str) -> tuple:
+    """
+    Check and take one token from the tenant's bucket.
 
-    except Exception as e:
-        rl_redis_connected.set(0)
-        rl_redis_errors.inc()
-        logger.warning(f"Rate limit Redis error: {e}")
+    Returns:
+        (allowed: bool, current_count: int, limit: int, remaining: int)
 
-        if RATE_LIMIT_FAIL_OPEN:
-            # Fail-open: allow request if Redis unavailable
-            logger.warning("Rate limit check failed (FAIL_OPEN=true, allowing request)")
-            return True, 0, reqs_limit, reqs_limit
-        else:
-            # Fail-closed: deny request if Redis unavailable
-            logger.error("Rate limit check failed (FAIL_OPEN=false, denying request)")
-            return False, 0, reqs_limit, 0
+    current_count and remaining are approximate: they reflect this process's
+    lease plus the shared bucket as of its last lease.
+    """
+    decision = await check_rate_limit_decision(tenant_id, tier)
+    return decision.allowed, decision.limit - decision.remaining, decision.limit, decision.remaining
 
 
 async def rate_limit_dependency(request: Request) -> bool:
@@ -199,7 +205,9 @@ async def rate_limit_dependency(request: Request) -> bool:
         tenant_id = getattr(user, "tenant_id", "default")
         tier = extract_tier_from_user(user)
 
-    allowed, current, limit, remaining = await check_rate_limit(tenant_id, tier)
+    decision = await check_rate_limit_decision(tenant_id, tier)
+    allowed, limit, remaining = decision.allowed, decision.limit, decision.remaining
+    retry_seconds = max(1, math.ceil(decision.retry_after))
 
     # Add rate limit headers to response
     request.state.rate_limit_headers = {
@@ -213,17 +221,17 @@ async def rate_limit_dependency(request: Request) -> bool:
         return True
     else:
         rl_blocked.labels(tier=tier, tenant_id=tenant_id[:32]).inc()
-        logger.info(f"Rate limit exceeded: tenant={tenant_id}, tier={tier}, current={current}, limit={limit}")
+        logger.info(f"Rate limit exceeded: tenant={tenant_id}, tier={tier}, limit={limit}")
         raise HTTPException(
             status_code=429,
             detail={
                 "error": "rate_limit_exceeded",
                 "tier": tier,
                 "limit": limit,
-                "retry_after": 60,
+                "retry_after": retry_seconds,
             },
             headers={
-                "Retry-After": "60",
+                "Retry-After": str(retry_seconds),
                 "X-RateLimit-Limit": str(limit),
                 "X-RateLimit-Remaining": "0",
             },
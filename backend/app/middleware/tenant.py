@@ -29,7 +29,8 @@ from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
 from fastapi import HTTPException, Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("nova.middleware.tenant")
 
@@ -104,16 +105,18 @@ def get_tenant_id() -> Optional[str]:
     return context.tenant_id if context else None
 
 
-class TenantMiddleware(BaseHTTPMiddleware):
+class TenantMiddleware:
     """
-    Middleware for tenant context propagation.
+    Pure ASGI middleware for tenant context propagation.
 
     Extracts tenant_id from:
     1. X-Tenant-ID header
     2. Authorization token (JWT claim)
     3. Query parameter (for testing only)
 
-    Sets tenant context for the request lifecycle.
+    Sets tenant context for the request lifecycle. Correlation headers are
+    added to the response start message, so streaming bodies pass through
+    unbuffered.
     """
 
     # Header names
@@ -131,11 +134,17 @@ class TenantMiddleware(BaseHTTPMiddleware):
         "/openapi.json",
     }
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process request and set tenant context."""
         # Skip exempt paths
-        if request.url.path in self.EXEMPT_PATHS:
-            return await call_next(request)
+        if scope["type"] != "http" or scope["path"] in self.EXEMPT_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope, receive)
 
         # Generate request ID
         request_id = str(uuid.uuid4())
@@ -161,19 +170,21 @@ class TenantMiddleware(BaseHTTPMiddleware):
 
             logger.debug(f"Tenant context set: tenant_id={tenant_id}, user_id={user_id}, request_id={request_id}")
 
+        async def send_with_correlation(message: Message) -> None:
+            # Add correlation headers to response
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                if correlation_id:
+                    headers["X-Correlation-ID"] = correlation_id
+            await send(message)
+
         try:
             # Store request_id in request state for logging
             request.state.request_id = request_id
             request.state.tenant_id = tenant_id
 
-            response = await call_next(request)
-
-            # Add correlation headers to response
-            response.headers["X-Request-ID"] = request_id
-            if correlation_id:
-                response.headers["X-Correlation-ID"] = correlation_id
-
-            return response
+            await self.app(scope, receive, send_with_correlation)
 
         finally:
             # Clear tenant context after request
@@ -33,6 +33,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 # Phase 4B: Decision Record Emission (DECISION_RECORD_CONTRACT v0.2)
 from app.contracts.decisions import emit_routing_decision
+from app.utils.rate_limiter import LeasedRateLimiter
 
 from .models import (
     CONFIDENCE_BLOCK_THRESHOLD,
@@ -62,24 +63,26 @@ class RateLimiter:
     """
     Redis-based rate limiter with per-policy limits.
 
+    Token buckets leased to this process in slices (see
+    app.utils.rate_limiter), so most routing calls skip Redis entirely.
     Falls back to no-op if Redis unavailable (degraded mode).
     """
 
     def __init__(self, redis_url: Optional[str] = None):
         self.redis_url = redis_url if redis_url is not None else os.environ.get("REDIS_URL", "redis://localhost:6379/0")
         self._redis: Optional[redis_async.Redis] = None
+        self._limiter = LeasedRateLimiter(redis_factory=self._get_redis, fail_open=True)
 
-    async def _get_redis(self) -> Optional[redis_async.Redis]:
+    async def _get_redis(self) -> redis_async.Redis:
         """Get Redis connection (lazy init)."""
         if self._redis is None:
-            try:
-                self._redis = redis_async.from_url(self.redis_url, decode_responses=True)
-                await self._redis.ping()
-            except Exception as e:
-                logger.debug(f"Rate limiter Redis unavailable: {e}")
-                self._redis = None
+            self._redis = redis_async.from_url(self.redis_url, decode_responses=True)
         return self._redis
 
+    @staticmethod
+    def _key(tenant_id: str, risk_policy: RiskPolicy) -> str:
+        return f"care:bucket:{tenant_id}:{risk_policy.value}"
+
     async def check_rate_limit(
         self,
         tenant_id: str,
@@ -89,50 +92,22 @@ class RateLimiter:
         Check if request is within rate limits.
 
         Returns:
-            (allowed, current_count, limit)
+            (allowed, current_count, limit); current_count is approximate
         """
-        r = await self._get_redis()
-        if not r:
-            # Redis unavailable - allow all (degraded mode)
-            return True, 0, RATE_LIMITS.get(risk_policy, 30)
-
         limit = RATE_LIMITS.get(risk_policy, 30)
-        key = f"care:ratelimit:{tenant_id}:{risk_policy.value}"
-
-        try:
-            # Sliding window counter
-            current = await r.incr(key)
-            if current == 1:
-                await r.expire(key, RATE_LIMIT_WINDOW)
-
-            remaining_ttl = await r.ttl(key)
-            if remaining_ttl == -1:
-                await r.expire(key, RATE_LIMIT_WINDOW)
-
-            allowed = current <= limit
-            return allowed, int(current), limit
-        except Exception as e:
-            logger.warning(f"Rate limit check failed: {e}")
+        decision = await self._limiter.acquire(self._key(tenant_id, risk_policy), limit, RATE_LIMIT_WINDOW)
+        if decision.degraded:
+            # Redis unavailable - allow all (degraded mode)
             return True, 0, limit
+        return decision.allowed, limit - decision.remaining, limit
 
     async def get_remaining(
         self,
         tenant_id: str,
         risk_policy: RiskPolicy,
     ) -> int:
-        """Get remaining requests in current window."""
-        r = await self._get_redis()
-        if not r:
-            return RATE_LIMITS.get(risk_policy, 30)
-
-        key = f"care:ratelimit:{tenant_id}:{risk_policy.value}"
-        try:
-            current = await r.get(key)
-            if current is None:
-                return RATE_LIMITS.get(risk_policy, 30)
-            return max(0, RATE_LIMITS.get(risk_policy, 30) - int(current))
-        except Exception:
-            return RATE_LIMITS.get(risk_policy, 30)
+        """Get remaining requests as of this process's last lease."""
+        return self._limiter.remaining(self._key(tenant_id, risk_policy), RATE_LIMITS.get(risk_policy, 30))
 
 
 # Singleton rate limiter
@@ -744,7 +744,8 @@ class CostAnomalyDetector:
                 WITH consecutive AS (
                     SELECT breach_date,
                            ROW_NUMBER() OVER (ORDER BY breach_date DESC) as rn,
-                           breach_date - INTERVAL '1 day' * (ROW_NUMBER() OVER (ORDER BY breach_date DESC) - 1) as grp
+                           -- newest first, so a run of consecutive days shares breach_date + (rn - 1)
+                           breach_date + INTERVAL '1 day' * (ROW_NUMBER() OVER (ORDER BY breach_date DESC) - 1) as grp
                     FROM cost_breach_history
                     WHERE tenant_id = :tenant_id
                       AND entity_type = :entity_type
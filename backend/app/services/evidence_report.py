@@ -19,11 +19,18 @@ Features:
 - Counterfactual prevention proof
 - Remediation & controls
 - Legal attestation with verification signature
+
+Rendering pipeline:
+- ReportRenderPipeline (app.hoc.cus.logs.L5_engines.evidence_report,
+  re-exported here) renders off the event loop in a process pool with a
+  bounded queue and a size-capped disk cache; see that module
 """
 
 import hashlib
 import io
-from dataclasses import dataclass
+import json
+import time
+from dataclasses import asdict, dataclass
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
@@ -42,6 +49,17 @@ from reportlab.platypus import (
     TableStyle,
 )
 
+# The render pipeline lives with the logs domain engine; re-exported here for
+# app.services callers (export_bundle_service, scripts).
+from app.hoc.cus.logs.L5_engines.evidence_report import (  # noqa: F401
+    REPORT_TEMPLATE_VERSION,
+    RenderedReport,
+    RenderQueueFullError,
+    ReportCache,
+    ReportRenderPipeline,
+    get_report_render_pipeline,
+)
+
 
 @dataclass
 class CertificateEvidence:
@@ -100,6 +118,7 @@ class EvidenceReportGenerator:
 
     def __init__(self, is_demo: bool = True):
         self.is_demo = is_demo
+        self.section_timings: Dict[str, float] = {}
         self.styles = getSampleStyleSheet()
         self._setup_custom_styles()
 
@@ -233,6 +252,8 @@ class EvidenceReportGenerator:
         """
         Generate the complete PDF evidence report.
 
+        Per-section build times (seconds) are left in ``section_timings``.
+
         Returns:
             PDF file as bytes
         """
@@ -247,49 +268,40 @@ class EvidenceReportGenerator:
             bottomMargin=0.75 * inch,
         )
 
-        # Build story (content)
-        story = []
-
-        # Incident Snapshot (1-page scannable summary for executives)
-        story.extend(self._build_incident_snapshot(evidence))
-        story.append(PageBreak())
-
-        # Cover page
-        story.extend(self._build_cover_page(evidence))
-        story.append(PageBreak())
-
-        # Section 1: Executive Summary
-        story.extend(self._build_executive_summary(evidence))
-        story.append(PageBreak())
-
-        # Section 2: Factual Reconstruction
-        story.extend(self._build_factual_reconstruction(evidence))
-
-        # Section 3: Policy Evaluation
-        story.extend(self._build_policy_evaluation(evidence))
-
-        # Section 4: Decision Timeline
-        story.extend(self._build_decision_timeline(evidence))
-        story.append(PageBreak())
-
-        # Section 5: Replay Verification
-        story.extend(self._build_replay_verification(evidence))
-
+        # Build story (content), timing each section for render metrics.
+        # (name, builder, page break after)
+        sections = [
+            # Incident Snapshot (1-page scannable summary for executives)
+            ("incident_snapshot", self._build_incident_snapshot, True),
+            ("cover", self._build_cover_page, True),
+            ("executive_summary", self._build_executive_summary, True),
+            ("factual_reconstruction", self._build_factual_reconstruction, False),
+            ("policy_evaluation", self._build_policy_evaluation, False),
+            ("decision_timeline", self._build_decision_timeline, True),
+            ("replay_verification", self._build_replay_verification, False),
+        ]
         # Section 5.5: M23 Cryptographic Certificate (if available)
         if evidence.certificate:
-            story.extend(self._build_certificate_section(evidence))
-
-        # Section 6: Prevention Proof
-        story.extend(self._build_prevention_proof(evidence))
-
-        # Section 7: Remediation
-        story.extend(self._build_remediation(evidence))
-
-        # Section 8: Legal Attestation
-        story.extend(self._build_legal_attestation(evidence))
+            sections.append(("certificate", self._build_certificate_section, False))
+        sections += [
+            ("prevention_proof", self._build_prevention_proof, False),
+            ("remediation", self._build_remediation, False),
+            ("legal_attestation", self._build_legal_attestation, False),
+        ]
 
-        # Build PDF with footer
+        self.section_timings = {}
+        story = []
+        for name, build, page_break in sections:
+            started = time.perf_counter()
+            story.extend(build(evidence))
+            self.section_timings[name] = time.perf_counter() - started
+            if page_break:
+                story.append(PageBreak())
+
+        # Build PDF with footer (flowable layout dominates render time)
+        started = time.perf_counter()
         doc.build(story, onFirstPage=self._add_footer, onLaterPages=self._add_footer)
+        self.section_timings["layout"] = time.perf_counter() - started
 
         buffer.seek(0)
         return buffer.read()
@@ -1072,8 +1084,21 @@ class EvidenceReportGenerator:
         content = f"{evidence.incident_id}:{evidence.timestamp}:{evidence.ai_output}"
         return self._compute_hash(content)
 
+    def cache_key(self, evidence: IncidentEvidence) -> str:
+        """
+        Content address of the rendered report.
+
+        The verification hash only covers incident_id/timestamp/ai_output, so
+        the full evidence, the watermark flag and the template version are
+        folded in to keep two different reports from sharing a cache entry.
+        """
+        evidence_digest = self._compute_hash(json.dumps(asdict(evidence), sort_keys=True, default=str))
+        return self._compute_hash(
+            f"{REPORT_TEMPLATE_VERSION}:{self._compute_report_hash(evidence)}:{evidence_digest}:{int(self.is_demo)}"
+        )
 
-def generate_evidence_report(
+
+def build_incident_evidence(
     incident_id: str,
     tenant_id: str,
     tenant_name: str,
@@ -1093,13 +1118,12 @@ def generate_evidence_report(
     certificate: Optional[Dict[str, Any]] = None,  # M23: Cryptographic certificate
     severity: str = "HIGH",  # CRITICAL, HIGH, MEDIUM, LOW
     status: str = "RESOLVED",  # OPEN, INVESTIGATING, RESOLVED
-    is_demo: bool = True,
-) -> bytes:
+) -> IncidentEvidence:
     """
-    Convenience function to generate an evidence report.
+    Assemble IncidentEvidence from raw incident fields.
 
     Returns:
-        PDF file as bytes
+        IncidentEvidence ready for EvidenceReportGenerator or the render pipeline
     """
     if impact_assessment is None:
         impact_assessment = [
@@ -1125,7 +1149,7 @@ def generate_evidence_report(
             policies_total=certificate.get("policies_total", 0),
         )
 
-    evidence = IncidentEvidence(
+    return IncidentEvidence(
         incident_id=incident_id,
         tenant_id=tenant_id,
         tenant_name=tenant_name,
@@ -1147,5 +1171,59 @@ def generate_evidence_report(
         status=status,
     )
 
+
+def generate_evidence_report(
+    incident_id: str,
+    tenant_id: str,
+    tenant_name: str,
+    user_id: str,
+    product_name: str,
+    model_id: str,
+    timestamp: str,
+    user_input: str,
+    context_data: Dict[str, Any],
+    ai_output: str,
+    policy_results: List[Dict[str, Any]],
+    timeline_events: List[Dict[str, Any]],
+    replay_result: Optional[Dict[str, Any]] = None,
+    prevention_result: Optional[Dict[str, Any]] = None,
+    root_cause: str = "Policy enforcement gap: system asserted fact when required data was NULL.",
+    impact_assessment: Optional[List[str]] = None,
+    certificate: Optional[Dict[str, Any]] = None,  # M23: Cryptographic certificate
+    severity: str = "HIGH",  # CRITICAL, HIGH, MEDIUM, LOW
+    status: str = "RESOLVED",  # OPEN, INVESTIGATING, RESOLVED
+    is_demo: bool = True,
+) -> bytes:
+    """
+    Convenience function to generate an evidence report.
+
+    Renders inline; async callers should use
+    get_report_render_pipeline().render_incident_report() instead.
+
+    Returns:
+        PDF file as bytes
+    """
+    evidence = build_incident_evidence(
+        incident_id=incident_id,
+        tenant_id=tenant_id,
+        tenant_name=tenant_name,
+        user_id=user_id,
+        product_name=product_name,
+        model_id=model_id,
+        timestamp=timestamp,
+        user_input=user_input,
+        context_data=context_data,
+        ai_output=ai_output,
+        policy_results=policy_results,
+        timeline_events=timeline_events,
+        replay_result=replay_result,
+        prevention_result=prevention_result,
+        root_cause=root_cause,
+        impact_assessment=impact_assessment,
+        certificate=certificate,
+        severity=severity,
+        status=status,
+    )
+
     generator = EvidenceReportGenerator(is_demo=is_demo)
     return generator.generate(evidence)
@@ -20,13 +20,15 @@ Key Responsibilities:
 2. Assemble EvidenceBundle with all cross-domain links
 3. Enhance for SOC2 compliance (control mappings)
 4. Generate executive summary (non-technical)
+5. Render evidence/SOC2 bundles to PDF through the shared report render
+   pipeline (process pool, bounded queue, disk cache, streaming)
 """
 
 import hashlib
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Tuple
 
 from sqlmodel import Session, select
 
@@ -40,6 +42,11 @@ from app.models.export_bundles import (
     TraceStepEvidence,
 )
 from app.hoc.cus.logs.L6_drivers.trace_store import TraceStore
+from app.services.evidence_report import (
+    RenderedReport,
+    ReportRenderPipeline,
+    get_report_render_pipeline,
+)
 
 logger = logging.getLogger("nova.services.export_bundle")
 
@@ -47,14 +54,20 @@ logger = logging.getLogger("nova.services.export_bundle")
 class ExportBundleService:
     """Generate structured export bundles from incidents/traces."""
 
-    def __init__(self, trace_store: Optional[TraceStore] = None):
+    def __init__(
+        self,
+        trace_store: Optional[TraceStore] = None,
+        render_pipeline: Optional[ReportRenderPipeline] = None,
+    ):
         """
         Initialize export bundle service.
 
         Args:
             trace_store: Optional TraceStore instance (for testing)
+            render_pipeline: Optional ReportRenderPipeline (for testing)
         """
         self._trace_store = trace_store
+        self._render_pipeline = render_pipeline
 
     @property
     def trace_store(self) -> TraceStore:
@@ -63,6 +76,13 @@ class ExportBundleService:
             self._trace_store = TraceStore()
         return self._trace_store
 
+    @property
+    def render_pipeline(self) -> ReportRenderPipeline:
+        """Get the shared report render pipeline."""
+        if self._render_pipeline is None:
+            self._render_pipeline = get_report_render_pipeline()
+        return self._render_pipeline
+
     async def create_evidence_bundle(
         self,
         incident_id: str,
@@ -250,6 +270,68 @@ class ExportBundleService:
 
         return bundle
 
+    async def render_evidence_pdf(
+        self,
+        incident_id: str,
+        exported_by: str = "system",
+        export_reason: Optional[str] = None,
+    ) -> Tuple[EvidenceBundle, RenderedReport]:
+        """
+        Create an evidence bundle and render it to PDF off the event loop.
+
+        Args:
+            incident_id: Incident to export
+            exported_by: User ID or "system"
+            export_reason: Optional reason for export
+
+        Returns:
+            (bundle, rendered report); stream the PDF with report.stream()
+
+        Raises:
+            RenderQueueFullError: If the render queue is at capacity
+        """
+        bundle = await self.create_evidence_bundle(
+            incident_id=incident_id,
+            exported_by=exported_by,
+            export_reason=export_reason,
+        )
+        report = await self.render_pipeline.render_bundle("render_evidence_pdf", bundle)
+        return bundle, report
+
+    async def render_soc2_pdf(
+        self,
+        incident_id: str,
+        exported_by: str = "system",
+        compliance_period_start: Optional[datetime] = None,
+        compliance_period_end: Optional[datetime] = None,
+        auditor_notes: Optional[str] = None,
+    ) -> Tuple[SOC2Bundle, RenderedReport]:
+        """
+        Create a SOC2 bundle and render it to PDF off the event loop.
+
+        Args:
+            incident_id: Incident to export
+            exported_by: User ID or "system"
+            compliance_period_start: Start of compliance period
+            compliance_period_end: End of compliance period
+            auditor_notes: Optional auditor notes
+
+        Returns:
+            (bundle, rendered report); stream the PDF with report.stream()
+
+        Raises:
+            RenderQueueFullError: If the render queue is at capacity
+        """
+        bundle = await self.create_soc2_bundle(
+            incident_id=incident_id,
+            exported_by=exported_by,
+            compliance_period_start=compliance_period_start,
+            compliance_period_end=compliance_period_end,
+            auditor_notes=auditor_notes,
+        )
+        report = await self.render_pipeline.render_bundle("render_soc2_pdf", bundle)
+        return bundle, report
+
     async def create_executive_debrief(
         self,
         incident_id: str,
@@ -25,6 +25,7 @@ from app.services.notifications.channel_service import (
     NotifyDeliveryResult,
     NotifyEventType,
     check_channel_health,
+    enqueue_notification,
     get_channel_config,
     send_notification,
 )
@@ -39,6 +40,7 @@ __all__ = [
     "NotifyDeliveryResult",
     "NotifyEventType",
     "check_channel_health",
+    "enqueue_notification",
     "get_channel_config",
     "send_notification",
 ]
@@ -4,6 +4,7 @@
 # Reference: PIN-240
 # WARNING: If this logic is wrong, ALL products break.
 
+from app.hoc.cus.policies.L6_drivers.failure_signature_index import LexicalRecoveryTier, normalize_message
 from app.infra import FeatureIntent, RetryPolicy
 
 # Phase-2.3: Feature Intent Declaration
@@ -24,6 +25,10 @@ Scoring Algorithm:
 - Weighted time-decay: exp(-lambda * age_in_days), half-life = 30 days
 - Final: alpha * weighted + (1-alpha) * basic, alpha = 0.7
 
+Hybrid lookup (suggest_hybrid): cache → lexical (MinHash/LSH over
+normalised messages, failure_signature_index.py) → embedding → LLM,
+with per-layer hit rates in get_recovery_layer_stats().
+
 References:
 - PIN-033: M8-M14 Machine-Native Realignment
 - M10 Blueprint: Recovery Suggestion Engine
@@ -77,6 +82,7 @@ class RecoveryMatcher:
         """Initialize matcher with optional database session."""
         self._session = db_session
         self._db_url = os.getenv("DATABASE_URL")
+        self._lexical = LexicalRecoveryTier(self._get_session)
 
     def _get_session(self):
         """Get or create database session."""
@@ -101,11 +107,8 @@ class RecoveryMatcher:
         error_type = payload.get("error_type", payload.get("error_code", "UNKNOWN"))
         raw = payload.get("raw", payload.get("error_message", ""))
 
-        # Sanitize error message to prevent secrets in signatures (PIN-052)
-        sanitized_raw = sanitize_error_message(str(raw))
-
-        # Normalize: lowercase, strip whitespace, truncate
-        normalized = sanitized_raw.lower().strip()[:500]
+        # Sanitize (PIN-052), lowercase, strip whitespace, truncate
+        normalized = normalize_message(raw)
 
         # Generate signature hash
         signature_input = f"{error_type}:{normalized}"
@@ -283,7 +286,7 @@ class RecoveryMatcher:
 
     # =========================================================================
     # Hybrid ML Recovery (PIN-050)
-    # 3-layer lookup: cache → embedding → LLM
+    # 4-layer lookup: cache → lexical → embedding → LLM
     # =========================================================================
 
     def _get_cached_recovery(self, error_signature: str) -> Optional[Dict[str, Any]]:
@@ -329,7 +332,7 @@ class RecoveryMatcher:
 
     async def _find_similar_by_embedding(self, error_message: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
-        Layer 2: Vector similarity search for similar failures.
+        Layer 3: Vector similarity search for similar failures.
 
         Uses pgvector to find semantically similar error messages
         even if error_code differs.
@@ -403,10 +406,11 @@ class RecoveryMatcher:
         self, error_code: str, error_message: str, context: Optional[Dict[str, Any]] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        Layer 3: LLM reasoning for complex/novel failures.
+        Layer 4: LLM reasoning for complex/novel failures.
 
         Only called when:
         - No cache hit
+        - No lexical match above threshold
         - No embedding match above threshold
         - Error is complex or novel
 
@@ -475,11 +479,14 @@ Provide a JSON response with:
 
     async def suggest_hybrid(self, request: Dict[str, Any]) -> MatchResult:
         """
-        Hybrid ML recovery suggestion using 3-layer lookup.
+        Hybrid ML recovery suggestion using 4-layer lookup.
 
         Layer 1: Cache (fast, O(1))
-        Layer 2: Embedding similarity (semantic match)
-        Layer 3: LLM reasoning (complex/novel failures)
+        Layer 2: Lexical similarity (in-process MinHash/LSH)
+        Layer 3: Embedding similarity (semantic match)
+        Layer 4: LLM reasoning (complex/novel failures)
+
+        Every layer consulted is recorded in get_recovery_layer_stats().
 
         Args:
             request: Dict with failure_match_id, failure_payload, source
@@ -497,8 +504,12 @@ Provide a JSON response with:
 
         logger.info(f"Hybrid recovery for failure_match_id={failure_match_id}, error_code={error_code}")
 
+        stats = self._lexical.stats
+
         # Layer 1: Cache lookup
-        cached = self._get_cached_recovery(error_signature)
+        with stats.timed("cache") as layer:
+            cached = self._get_cached_recovery(error_signature)
+            layer.hit = bool(cached)
         if cached:
             return MatchResult(
                 matched_entry=cached.get("matched_entry"),
@@ -511,8 +522,27 @@ Provide a JSON response with:
                 error_signature=error_signature,
             )
 
-        # Layer 2: Embedding similarity search
-        similar_by_embedding = await self._find_similar_by_embedding(error_message)
+        # Layer 2: Lexical similarity (in-process)
+        lexical = self._lexical.resolve(error_code, error_message)
+        if lexical:
+            self._set_cached_recovery(error_signature, lexical.cache_entry())
+            return MatchResult(
+                matched_entry=lexical.as_matched_entry(),
+                suggested_recovery=lexical.suggestion,
+                confidence=lexical.confidence,
+                candidate_id=None,
+                explain=lexical.explain(),
+                failure_match_id=failure_match_id,
+                error_code=error_code,
+                error_signature=error_signature,
+            )
+
+        # Layer 3: Embedding similarity search
+        with stats.timed("embedding") as layer:
+            similar_by_embedding = await self._find_similar_by_embedding(error_message)
+            layer.hit = bool(similar_by_embedding) and (
+                similar_by_embedding[0].get("similarity", 0) >= EMBEDDING_SIMILARITY_THRESHOLD
+            )
 
         if similar_by_embedding:
             best_match = similar_by_embedding[0]
@@ -531,6 +561,14 @@ Provide a JSON response with:
                         "matched_entry": best_match,
                     },
                 )
+                self._lexical.learn(
+                    error_code,
+                    error_message,
+                    suggestion,
+                    "embedding",
+                    success_rate=best_match.get("success_rate") or None,
+                    catalog_id=best_match.get("id"),
+                )
 
                 return MatchResult(
                     matched_entry=best_match,
@@ -547,12 +585,16 @@ Provide a JSON response with:
                     error_signature=error_signature,
                 )
 
-        # Layer 3: LLM escalation for complex/novel failures
-        llm_result = await self._escalate_to_llm(error_code, error_message)
+        # Layer 4: LLM escalation for complex/novel failures
+        with stats.timed("llm") as layer:
+            llm_result = await self._escalate_to_llm(error_code, error_message)
+            layer.hit = bool(llm_result)
 
         if llm_result:
             suggestion = llm_result.get("suggested_action", "")
             confidence = llm_result.get("confidence", 0.5)
+            if not llm_result.get("requires_human", False):
+                self._lexical.learn(error_code, error_message, suggestion, "llm", success_rate=confidence)
 
             # Cache LLM results too (shorter TTL could be configured)
             self._set_cached_recovery(
@@ -579,7 +621,9 @@ Provide a JSON response with:
             )
 
         # Fallback: Use error_code matching (original behavior)
-        return self.suggest(request)
+        with stats.timed("fallback") as layer:
+            layer.hit = True
+            return self.suggest(request)
 
     def _upsert_candidate(
         self,
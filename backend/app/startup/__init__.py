@@ -7,6 +7,8 @@ Startup Package
 
 Contains boot-time validation and guards:
 - boot_guard: SPINE component validation (GAP-067)
+- openapi_artifact: prebuilt OpenAPI schema loaded at boot
+- profiler: opt-in cold-start profiler (STARTUP_PROFILE=true)
 """
 
 from app.startup.boot_guard import (
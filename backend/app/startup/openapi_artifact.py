@@ -0,0 +1,110 @@
+# Layer: L5 — Execution & Workers
+# Product: system-wide
+# Temporal:
+#   Trigger: startup | build
+#   Execution: sync
+# Role: Prebuilt OpenAPI schema artifact (build, fingerprint, load at boot)
+# Callers: main.py (custom_openapi, lifespan), scripts/build_openapi_artifact.py
+# Allowed Imports: fastapi, stdlib
+# Forbidden Imports: L1, L2, L3, L4, L6
+# Reference: PIN-443, PIN-444 (OpenAPI cold-start)
+
+"""
+Module: openapi_artifact
+Purpose: Serve /openapi.json from a schema serialised at build time instead
+of walking ~700 routes and their models on the first request after boot.
+
+The artifact (app/openapi_schema.json) carries the app version and a
+fingerprint of the schema-visible routes (path, methods, endpoint name).
+load_artifact() only accepts it when both match the running app, so a
+stale artifact falls back to live generation rather than serving the
+wrong contract. Full schema parity is enforced in tests
+(tests/test_openapi_artifact.py).
+
+Rebuild after changing routes or response models:
+    python scripts/build_openapi_artifact.py
+"""
+
+import hashlib
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+from fastapi.routing import APIRoute
+
+logger = logging.getLogger("nova.startup.openapi_artifact")
+
+ARTIFACT_FORMAT = 1
+ARTIFACT_PATH = Path(
+    os.getenv("OPENAPI_ARTIFACT_PATH", str(Path(__file__).resolve().parent.parent / "openapi_schema.json"))
+)
+OPENAPI_ARTIFACT_ENABLED = os.getenv("OPENAPI_ARTIFACT_ENABLED", "true").lower() == "true"
+
+
+def route_fingerprint(app: FastAPI) -> str:
+    """Hash of every route that appears in the schema, independent of order."""
+    entries = sorted(
+        f"{route.path} {','.join(sorted(route.methods or ()))} {route.name}"
+        for route in app.routes
+        if isinstance(route, APIRoute) and route.include_in_schema
+    )
+    return hashlib.sha256("\n".join(entries).encode()).hexdigest()
+
+
+def generate_schema(app: FastAPI) -> dict:
+    """Generate the schema the same way main.custom_openapi() does."""
+    return get_openapi(
+        title=app.title,
+        version=app.version,
+        description=app.description,
+        routes=app.routes,
+    )
+
+
+def build_artifact(app: FastAPI, path: Path = ARTIFACT_PATH) -> dict:
+    """Generate the schema and write it with its version and fingerprint."""
+    artifact = {
+        "format": ARTIFACT_FORMAT,
+        "app_version": app.version,
+        "route_fingerprint": route_fingerprint(app),
+        "schema": generate_schema(app),
+    }
+    path.write_text(json.dumps(artifact, separators=(",", ":"), sort_keys=False) + "\n")
+    return artifact
+
+
+def load_artifact(app: FastAPI, path: Path = ARTIFACT_PATH) -> Optional[dict]:
+    """
+    Return the prebuilt schema if it matches the running app, else None.
+
+    A missing, unreadable or stale artifact is logged and ignored; callers
+    fall back to live generation.
+    """
+    start = time.perf_counter()
+    try:
+        artifact = json.loads(path.read_text())
+    except FileNotFoundError:
+        logger.info("OPENAPI: no artifact at %s, generating live", path)
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("OPENAPI: unreadable artifact %s: %s", path, e)
+        return None
+
+    if artifact.get("format") != ARTIFACT_FORMAT or artifact.get("app_version") != app.version:
+        logger.warning(
+            "OPENAPI: artifact version mismatch (artifact=%s, app=%s), generating live",
+            artifact.get("app_version"),
+            app.version,
+        )
+        return None
+    if artifact.get("route_fingerprint") != route_fingerprint(app):
+        logger.warning("OPENAPI: artifact is stale (route fingerprint mismatch), generating live")
+        return None
+
+    logger.info("OPENAPI: loaded prebuilt schema in %.3fs", time.perf_counter() - start)
+    return artifact["schema"]
@@ -0,0 +1,197 @@
+# Layer: L5 — Execution & Workers
+# Product: system-wide
+# Temporal:
+#   Trigger: startup
+#   Execution: sync
+# Role: Opt-in cold-start profiler (module import times, lifespan phases)
+# Callers: main.py (module top, lifespan)
+# Allowed Imports: stdlib only
+# Forbidden Imports: L1, L2, L3, L4, L6
+# Reference: Cold-start tracking
+
+"""
+Module: profiler
+Purpose: Break cold start down into per-module import time and lifespan
+phase timings, so regressions show up as a named module or phase.
+
+Enabled with STARTUP_PROFILE=true. When disabled every entry point is a
+no-op and no import hook is installed.
+
+- install_startup_profiler(): call first thing in main.py; wraps the
+  exec_module() of file-backed modules to record cumulative and self time.
+- mark_startup_phase(name): closes the phase that started at the previous
+  mark (or at install) and names it.
+- emit_startup_report(): logs the slowest imports and all phases, and writes
+  the full report to STARTUP_PROFILE_PATH when set.
+"""
+
+import importlib.abc
+import importlib.machinery
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger("nova.startup.profiler")
+
+STARTUP_PROFILE_ENABLED = os.getenv("STARTUP_PROFILE", "false").lower() == "true"
+STARTUP_PROFILE_PATH = os.getenv("STARTUP_PROFILE_PATH", "")
+STARTUP_PROFILE_TOP = int(os.getenv("STARTUP_PROFILE_TOP", "25"))
+
+# Loaders created per module by the path finders; builtin/frozen importers
+# are shared classes and cheap, so they are left alone.
+_TIMED_LOADERS = (
+    importlib.machinery.SourceFileLoader,
+    importlib.machinery.SourcelessFileLoader,
+    importlib.machinery.ExtensionFileLoader,
+)
+
+
+class _ImportTimer(importlib.abc.MetaPathFinder):
+    """Meta-path finder that times module execution without changing loaders."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+
+        if isinstance(spec.loader, _TIMED_LOADERS):
+            spec.loader.exec_module = self._timed(fullname, spec.loader.exec_module)
+        return spec
+
+    def _timed(self, fullname: str, exec_module):
+        profiler = self._profiler
+        local = self._local
+
+        def exec_module_timed(module):
+            stack = local.__dict__.setdefault("stack", [])
+            stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                total = time.perf_counter() - start
+                children = stack.pop()
+                if stack:
+                    stack[-1] += total
+                profiler.imports[fullname] = (total, total - children)
+
+        return exec_module_timed
+
+
+class StartupProfiler:
+    """Collects import timings and named startup phases for one process."""
+
+    def __init__(self):
+        self.imports: Dict[str, Tuple[float, float]] = {}
+        self.phases: List[Tuple[str, float]] = []
+        self._origin = time.perf_counter()
+        self._last = self._origin
+        self._timer: Optional[_ImportTimer] = None
+
+    def install(self) -> None:
+        if self._timer is None:
+            self._timer = _ImportTimer(self)
+            sys.meta_path.insert(0, self._timer)
+
+    def uninstall(self) -> None:
+        if self._timer is not None and self._timer in sys.meta_path:
+            sys.meta_path.remove(self._timer)
+        self._timer = None
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def report(self, top: int = STARTUP_PROFILE_TOP) -> dict:
+        by_cumulative = sorted(self.imports.items(), key=lambda kv: kv[1][0], reverse=True)
+        by_self = sorted(self.imports.items(), key=lambda kv: kv[1][1], reverse=True)
+        # Top-level packages get their own roll-up: app.* vs third-party
+        packages: Dict[str, float] = {}
+        for name, (_, self_s) in self.imports.items():
+            root = name.split(".", 1)[0]
+            packages[root] = packages.get(root, 0.0) + self_s
+
+        def rows(items):
+            return [
+                {"module": name, "cumulative_ms": round(c * 1000, 2), "self_ms": round(s * 1000, 2)}
+                for name, (c, s) in items[:top]
+            ]
+
+        return {
+            "total_ms": round((self._last - self._origin) * 1000, 2),
+            "modules_imported": len(self.imports),
+            "phases": [{"phase": name, "ms": round(s * 1000, 2)} for name, s in self.phases],
+            "slowest_cumulative": rows(by_cumulative),
+            "slowest_self": rows(by_self),
+            "packages_self_ms": {
+                name: round(s * 1000, 2)
+                for name, s in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[:top]
+            },
+        }
+
+
+_profiler: Optional[StartupProfiler] = None
+
+
+def install_startup_profiler() -> None:
+    """Start profiling if STARTUP_PROFILE=true. Safe to call more than once."""
+    global _profiler
+    if not STARTUP_PROFILE_ENABLED or _profiler is not None:
+        return
+    _profiler = StartupProfiler()
+    _profiler.install()
+
+
+def mark_startup_phase(phase: str) -> None:
+    """Record the time since the previous mark under `phase` (no-op when disabled)."""
+    if _profiler is not None:
+        _profiler.mark(phase)
+
+
+def emit_startup_report() -> Optional[dict]:
+    """Stop the import hook, log the report and optionally write it to disk."""
+    if _profiler is None:
+        return None
+    _profiler.uninstall()
+    report = _profiler.report()
+
+    logger.info(
+        "[BOOT] Startup profile: %.0fms total, %d modules imported",
+        report["total_ms"],
+        report["modules_imported"],
+    )
+    for phase in report["phases"]:
+        logger.info("[BOOT]   phase %-28s %9.1fms", phase["phase"], phase["ms"])
+    for row in report["slowest_cumulative"][:10]:
+        logger.info(
+            "[BOOT]   import %-48s %9.1fms (self %.1fms)",
+            row["module"],
+            row["cumulative_ms"],
+            row["self_ms"],
+        )
+
+    if STARTUP_PROFILE_PATH:
+        with open(STARTUP_PROFILE_PATH, "w") as f:
+            json.dump(report, f, indent=2)
+        logger.info("[BOOT] Startup profile written to %s", STARTUP_PROFILE_PATH)
+    return report
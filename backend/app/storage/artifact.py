@@ -12,14 +12,18 @@
 # Artifact Storage
 # Provides storage backends for run artifacts (files, blobs, etc.)
 
+import asyncio
+import fcntl
 import hashlib
 import json
 import logging
 import os
+import tempfile
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, BinaryIO, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field
@@ -28,6 +32,36 @@ from ..schemas.artifact import ArtifactType, StorageBackend
 
 logger = logging.getLogger("nova.storage.artifact")
 
+# Chunk size used when streaming artifact content in and out of a backend
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+# S3 requires every multipart part except the last to be >= 5 MiB
+S3_MULTIPART_PART_SIZE = 8 * 1024 * 1024  # 8 MiB
+
+ArtifactContent = Union[bytes, str, BinaryIO, Iterable[bytes]]
+
+
+def _iter_content(content: ArtifactContent, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Yield artifact content as byte chunks without materialising it.
+
+    Accepts bytes, str (UTF-8 encoded), a binary file-like object, or any
+    iterable of byte chunks.
+    """
+    if isinstance(content, str):
+        yield content.encode("utf-8")
+    elif isinstance(content, (bytes, bytearray, memoryview)):
+        yield bytes(content)
+    elif hasattr(content, "read"):
+        while True:
+            chunk = content.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+    else:
+        for chunk in content:
+            if chunk:
+                yield chunk
+
 
 class StoredArtifact(BaseModel):
     """Metadata for a stored artifact."""
@@ -52,16 +86,20 @@ class ArtifactStore(ABC):
     def store(
         self,
         run_id: str,
-        content: Union[bytes, str, BinaryIO],
+        content: ArtifactContent,
         filename: str,
         artifact_type: ArtifactType = ArtifactType.BLOB,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> StoredArtifact:
         """Store an artifact and return its metadata.
 
+        Content is consumed in chunks; file-like objects and chunk iterables
+        are never read fully into memory.
+
         Args:
             run_id: The run this artifact belongs to
-            content: The artifact content (bytes, string, or file-like object)
+            content: The artifact content (bytes, string, file-like object,
+                or an iterable of byte chunks)
             filename: Original filename or identifier
             artifact_type: Type of artifact
             metadata: Optional additional metadata
@@ -71,6 +109,27 @@ class ArtifactStore(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_content(
+        self,
+        artifact_id: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield artifact content in chunks, optionally limited to a byte range.
+
+        Args:
+            artifact_id: Unique artifact identifier
+            start: First byte offset (inclusive)
+            end: Last byte offset (exclusive), or None for end of artifact
+            chunk_size: Maximum size of each yielded chunk
+
+        Raises:
+            FileNotFoundError: If the artifact does not exist
+        """
+        pass
+
     @abstractmethod
     def retrieve(self, artifact_id: str) -> bytes:
         """Retrieve artifact content by ID.
@@ -119,6 +178,49 @@ class ArtifactStore(ABC):
         """
         pass
 
+    def retrieve_range(self, artifact_id: str, start: int, end: Optional[int] = None) -> bytes:
+        """Retrieve a byte range [start, end) of an artifact."""
+        return b"".join(self.iter_content(artifact_id, start=start, end=end))
+
+    async def retrieve_stream(
+        self,
+        artifact_id: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Asynchronously stream artifact content in chunks.
+
+        Blocking reads are performed in a worker thread so the event loop
+        is never held for the duration of a large download.
+        """
+        iterator = await asyncio.to_thread(self.iter_content, artifact_id, start, end, chunk_size)
+        sentinel = object()
+        while True:
+            chunk = await asyncio.to_thread(next, iterator, sentinel)
+            if chunk is sentinel:
+                break
+            yield chunk
+
+    async def store_stream(
+        self,
+        run_id: str,
+        content: ArtifactContent,
+        filename: str,
+        artifact_type: ArtifactType = ArtifactType.BLOB,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> StoredArtifact:
+        """Store an artifact from a stream without blocking the event loop."""
+        return await asyncio.to_thread(self.store, run_id, content, filename, artifact_type, metadata)
+
+    @staticmethod
+    def _normalize_range(start: int, end: Optional[int], size: int) -> Tuple[int, int]:
+        """Clamp a requested [start, end) range to the artifact size."""
+        if start < 0:
+            raise ValueError(f"Invalid range start: {start}")
+        end = size if end is None else min(end, size)
+        return min(start, size), max(end, min(start, size))
+
     def _generate_id(self, run_id: str, filename: str) -> str:
         """Generate a unique artifact ID."""
         timestamp = datetime.now(timezone.utc).isoformat()
@@ -135,6 +237,18 @@ class LocalArtifactStore(ArtifactStore):
 
     Stores artifacts in a local directory, suitable for development
     and single-node deployments.
+
+    Layout:
+        _blobs/<sha[:2]>/<sha>      content-addressed blob (deduplicated)
+        <run_id>/<id>_<filename>    hard link to the blob (storage_uri)
+        _metadata/<id>.json         per-artifact metadata (get_metadata)
+        _runs/<run_id>.jsonl        per-run manifest (list_by_run)
+        _locks/                     flock files for run manifests and blobs
+
+    Identical content stored by different runs shares one blob; the blob is
+    removed once its last hard link is deleted. Manifest updates take the
+    run's lock and blob link/unlink take the digest's lock, so they are safe
+    across threads and across processes sharing base_path.
     """
 
     def __init__(self, base_path: str = "/tmp/nova_artifacts"):
@@ -147,25 +261,28 @@ class LocalArtifactStore(ArtifactStore):
         self.base_path.mkdir(parents=True, exist_ok=True)
         self._metadata_path = self.base_path / "_metadata"
         self._metadata_path.mkdir(exist_ok=True)
+        self._blobs_path = self.base_path / "_blobs"
+        self._blobs_path.mkdir(exist_ok=True)
+        self._runs_path = self.base_path / "_runs"
+        self._runs_path.mkdir(exist_ok=True)
+        self._locks_path = self.base_path / "_locks"
+        self._locks_path.mkdir(exist_ok=True)
         logger.info(f"LocalArtifactStore initialized at {self.base_path}")
 
     def store(
         self,
         run_id: str,
-        content: Union[bytes, str, BinaryIO],
+        content: ArtifactContent,
         filename: str,
         artifact_type: ArtifactType = ArtifactType.BLOB,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> StoredArtifact:
-        """Store artifact in local filesystem."""
-        # Normalize content to bytes
-        if isinstance(content, str):
-            content_bytes = content.encode("utf-8")
-        elif hasattr(content, "read"):
-            content_bytes = content.read()
-        else:
-            content_bytes = content
+        """Store artifact in local filesystem.
 
+        Content is streamed to a temporary file while the checksum is
+        computed incrementally, then linked into the content-addressed
+        blob store.
+        """
         # Generate artifact ID and paths
         artifact_id = self._generate_id(run_id, filename)
         run_dir = self.base_path / run_id
@@ -174,8 +291,25 @@ class LocalArtifactStore(ArtifactStore):
         artifact_path = run_dir / f"{artifact_id}_{filename}"
         storage_uri = f"file://{artifact_path}"
 
-        # Write content
-        artifact_path.write_bytes(content_bytes)
+        # Stream content to a temp file, hashing as we go
+        hasher = hashlib.sha256()
+        size_bytes = 0
+        fd, tmp_name = tempfile.mkstemp(dir=self._blobs_path, prefix=".upload-")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                for chunk in _iter_content(content):
+                    hasher.update(chunk)
+                    size_bytes += len(chunk)
+                    tmp.write(chunk)
+            checksum = hasher.hexdigest()
+            # A concurrent delete of the last reference must not unlink the
+            # blob between the dedup check and the link
+            with self._lock(f"blob-{checksum}"):
+                deduplicated = self._commit_blob(Path(tmp_name), checksum)
+                self._link_blob(checksum, artifact_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
 
         # Create artifact metadata
         artifact = StoredArtifact(
@@ -185,16 +319,24 @@ class LocalArtifactStore(ArtifactStore):
             artifact_type=artifact_type,
             storage_backend=StorageBackend.LOCAL,
             storage_uri=storage_uri,
-            size_bytes=len(content_bytes),
-            checksum=self._compute_checksum(content_bytes),
+            size_bytes=size_bytes,
+            checksum=checksum,
             content_type=self._infer_content_type(filename, artifact_type),
             metadata=metadata or {},
             created_at=datetime.now(timezone.utc),
         )
 
-        # Store metadata
+        # Store metadata and append to the run manifest. A run stored before
+        # manifests existed gets its manifest rebuilt first, or the append
+        # would start a manifest that hides the run's earlier artifacts.
+        artifact_json = artifact.model_dump_json()
         metadata_file = self._metadata_path / f"{artifact_id}.json"
-        metadata_file.write_text(artifact.model_dump_json())
+        with self._lock(f"run-{run_id}"):
+            if not self._manifest_file(run_id).exists():
+                self._rebuild_manifest(run_id)
+            metadata_file.write_text(artifact_json)
+            with open(self._manifest_file(run_id), "a", encoding="utf-8") as manifest:
+                manifest.write(artifact_json + "\n")
 
         logger.info(
             "artifact_stored",
@@ -202,7 +344,8 @@ class LocalArtifactStore(ArtifactStore):
                 "artifact_id": artifact_id,
                 "run_id": run_id,
                 "filename": filename,
-                "size_bytes": len(content_bytes),
+                "size_bytes": size_bytes,
+                "deduplicated": deduplicated,
                 "backend": "local",
             },
         )
@@ -211,13 +354,19 @@ class LocalArtifactStore(ArtifactStore):
 
     def retrieve(self, artifact_id: str) -> bytes:
         """Retrieve artifact content from local filesystem."""
-        artifact = self.get_metadata(artifact_id)
-        if not artifact:
-            raise FileNotFoundError(f"Artifact not found: {artifact_id}")
+        return self._content_path(artifact_id).read_bytes()
 
-        # Parse file path from URI
-        path = urlparse(artifact.storage_uri).path
-        return Path(path).read_bytes()
+    def iter_content(
+        self,
+        artifact_id: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield artifact content (or a byte range of it) in chunks."""
+        path = self._content_path(artifact_id)
+        start, end = self._normalize_range(start, end, path.stat().st_size)
+        return self._read_range(path, start, end, chunk_size)
 
     def get_metadata(self, artifact_id: str) -> Optional[StoredArtifact]:
         """Get artifact metadata."""
@@ -229,13 +378,17 @@ class LocalArtifactStore(ArtifactStore):
         return StoredArtifact(**data)
 
     def list_by_run(self, run_id: str) -> List[StoredArtifact]:
-        """List all artifacts for a run."""
-        artifacts = []
-        for metadata_file in self._metadata_path.glob("*.json"):
-            data = json.loads(metadata_file.read_text())
-            if data.get("run_id") == run_id:
-                artifacts.append(StoredArtifact(**data))
-        return sorted(artifacts, key=lambda a: a.created_at, reverse=True)
+        """List all artifacts for a run.
+
+        Reads the run manifest, so cost is proportional to the number of
+        artifacts in the run. Runs stored before manifests existed are
+        scanned once and their manifest is written for subsequent calls.
+        """
+        if not self._manifest_file(run_id).exists():
+            with self._lock(f"run-{run_id}"):
+                if not self._manifest_file(run_id).exists():
+                    return self._rebuild_manifest(run_id)
+        return self._read_manifest(run_id)
 
     def delete(self, artifact_id: str) -> bool:
         """Delete artifact from local filesystem."""
@@ -243,20 +396,127 @@ class LocalArtifactStore(ArtifactStore):
         if not artifact:
             return False
 
-        # Delete content file
+        # Delete content link; drop the blob once no artifact references it
         path = urlparse(artifact.storage_uri).path
         content_path = Path(path)
-        if content_path.exists():
-            content_path.unlink()
+        with self._lock(f"blob-{artifact.checksum}"):
+            if content_path.exists():
+                content_path.unlink()
+            blob_path = self._blob_path(artifact.checksum)
+            if blob_path.exists() and blob_path.stat().st_nlink <= 1:
+                blob_path.unlink()
 
         # Delete metadata
         metadata_file = self._metadata_path / f"{artifact_id}.json"
         if metadata_file.exists():
             metadata_file.unlink()
+        self._remove_from_manifest(artifact.run_id, artifact_id)
 
         logger.info("artifact_deleted", extra={"artifact_id": artifact_id})
         return True
 
+    def _content_path(self, artifact_id: str) -> Path:
+        """Resolve the on-disk content path for an artifact."""
+        artifact = self.get_metadata(artifact_id)
+        if not artifact:
+            raise FileNotFoundError(f"Artifact not found: {artifact_id}")
+
+        # Parse file path from URI
+        return Path(urlparse(artifact.storage_uri).path)
+
+    @staticmethod
+    def _read_range(path: Path, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        """Read [start, end) from a file in chunks."""
+        with open(path, "rb") as f:
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    def _blob_path(self, checksum: str) -> Path:
+        """Content-addressed location of a blob."""
+        return self._blobs_path / checksum[:2] / checksum
+
+    def _commit_blob(self, tmp_path: Path, checksum: str) -> bool:
+        """Move an uploaded temp file into the blob store.
+
+        Returns True if an identical blob already existed (deduplicated).
+        """
+        blob_path = self._blob_path(checksum)
+        if blob_path.exists():
+            tmp_path.unlink(missing_ok=True)
+            return True
+        blob_path.parent.mkdir(exist_ok=True)
+        os.replace(tmp_path, blob_path)
+        return False
+
+    def _link_blob(self, checksum: str, artifact_path: Path) -> None:
+        """Expose a blob at the artifact path, hard-linking where possible."""
+        blob_path = self._blob_path(checksum)
+        try:
+            os.link(blob_path, artifact_path)
+        except OSError:
+            # Filesystems without hard links fall back to a private copy
+            with open(blob_path, "rb") as src, open(artifact_path, "wb") as dst:
+                for chunk in iter(lambda: src.read(DEFAULT_CHUNK_SIZE), b""):
+                    dst.write(chunk)
+
+    @contextmanager
+    def _lock(self, name: str) -> Iterator[None]:
+        """Hold an exclusive flock on _locks/<name>.lock."""
+        with open(self._locks_path / f"{name}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _manifest_file(self, run_id: str) -> Path:
+        """Per-run manifest path."""
+        return self._runs_path / f"{run_id}.jsonl"
+
+    def _read_manifest(self, run_id: str) -> List[StoredArtifact]:
+        """Read the run manifest, newest first."""
+        artifacts = []
+        for line in self._manifest_file(run_id).read_text(encoding="utf-8").splitlines():
+            if line.strip():
+                artifacts.append(StoredArtifact(**json.loads(line)))
+        return sorted(artifacts, key=lambda a: a.created_at, reverse=True)
+
+    def _rebuild_manifest(self, run_id: str) -> List[StoredArtifact]:
+        """Scan legacy metadata for a run and persist its manifest.
+
+        Caller holds the run lock.
+        """
+        artifacts = []
+        for metadata_file in self._metadata_path.glob("*.json"):
+            data = json.loads(metadata_file.read_text())
+            if data.get("run_id") == run_id:
+                artifacts.append(StoredArtifact(**data))
+        artifacts.sort(key=lambda a: a.created_at, reverse=True)
+        if artifacts:
+            self._write_manifest(run_id, artifacts)
+        return artifacts
+
+    def _remove_from_manifest(self, run_id: str, artifact_id: str) -> None:
+        """Drop one artifact from the run manifest."""
+        with self._lock(f"run-{run_id}"):
+            if not self._manifest_file(run_id).exists():
+                return
+            remaining = [a for a in self._read_manifest(run_id) if a.artifact_id != artifact_id]
+            self._write_manifest(run_id, remaining)
+
+    def _write_manifest(self, run_id: str, artifacts: List[StoredArtifact]) -> None:
+        """Atomically replace the run manifest."""
+        manifest_file = self._manifest_file(run_id)
+        tmp_file = manifest_file.with_suffix(".jsonl.tmp")
+        tmp_file.write_text("".join(a.model_dump_json() + "\n" for a in artifacts), encoding="utf-8")
+        os.replace(tmp_file, manifest_file)
+
     def _infer_content_type(self, filename: str, artifact_type: ArtifactType) -> str:
         """Infer content type from filename and type."""
         ext = Path(filename).suffix.lower()
@@ -348,20 +608,18 @@ class S3ArtifactStore(ArtifactStore):
     def store(
         self,
         run_id: str,
-        content: Union[bytes, str, BinaryIO],
+        content: ArtifactContent,
         filename: str,
         artifact_type: ArtifactType = ArtifactType.BLOB,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> StoredArtifact:
-        """Store artifact in S3."""
-        # Normalize content to bytes
-        if isinstance(content, str):
-            content_bytes = content.encode("utf-8")
-        elif hasattr(content, "read"):
-            content_bytes = content.read()
-        else:
-            content_bytes = content
+        """Store artifact in S3.
 
+        Content is uploaded with a multipart upload in S3_MULTIPART_PART_SIZE
+        parts while the checksum is computed incrementally, so only one part
+        is buffered at a time. Artifacts smaller than one part use a single
+        PUT.
+        """
         # Generate artifact ID and key
         artifact_id = self._generate_id(run_id, filename)
         s3_key = f"{self.prefix}{run_id}/{artifact_id}_{filename}"
@@ -372,21 +630,19 @@ class S3ArtifactStore(ArtifactStore):
 
         # Upload to S3
         client = self._get_client()
-        client.put_object(
-            Bucket=self.bucket,
-            Key=s3_key,
-            Body=content_bytes,
-            ContentType=content_type,
-            Metadata={
+        checksum, size_bytes = self._upload_stream(
+            client,
+            s3_key,
+            _iter_content(content),
+            content_type=content_type,
+            object_metadata={
                 "artifact_id": artifact_id,
                 "run_id": run_id,
                 "artifact_type": artifact_type.value,
-                "checksum": self._compute_checksum(content_bytes),
             },
         )
 
-        # Also store metadata as a sidecar JSON
-        metadata_key = f"{self.prefix}_metadata/{artifact_id}.json"
+        # Also store metadata as a sidecar JSON, plus a per-run index entry
         artifact = StoredArtifact(
             artifact_id=artifact_id,
             run_id=run_id,
@@ -394,19 +650,21 @@ class S3ArtifactStore(ArtifactStore):
             artifact_type=artifact_type,
             storage_backend=StorageBackend.S3,
             storage_uri=storage_uri,
-            size_bytes=len(content_bytes),
-            checksum=self._compute_checksum(content_bytes),
+            size_bytes=size_bytes,
+            checksum=checksum,
             content_type=content_type,
             metadata=metadata or {},
             created_at=datetime.now(timezone.utc),
         )
 
-        client.put_object(
-            Bucket=self.bucket,
-            Key=metadata_key,
-            Body=artifact.model_dump_json().encode(),
-            ContentType="application/json",
-        )
+        artifact_json = artifact.model_dump_json().encode()
+        for metadata_key in (self._metadata_key(artifact_id), self._run_index_key(run_id, artifact_id)):
+            client.put_object(
+                Bucket=self.bucket,
+                Key=metadata_key,
+                Body=artifact_json,
+                ContentType="application/json",
+            )
 
         logger.info(
             "artifact_stored",
@@ -414,7 +672,7 @@ class S3ArtifactStore(ArtifactStore):
                 "artifact_id": artifact_id,
                 "run_id": run_id,
                 "filename": filename,
-                "size_bytes": len(content_bytes),
+                "size_bytes": size_bytes,
                 "backend": "s3",
                 "bucket": self.bucket,
             },
@@ -422,25 +680,111 @@ class S3ArtifactStore(ArtifactStore):
 
         return artifact
 
+    def _upload_stream(
+        self,
+        client: Any,
+        key: str,
+        chunks: Iterator[bytes],
+        content_type: str,
+        object_metadata: Dict[str, str],
+    ) -> Tuple[str, int]:
+        """Upload a chunk stream, returning (checksum, size_bytes)."""
+        hasher = hashlib.sha256()
+        size_bytes = 0
+        buffer = bytearray()
+        upload_id: Optional[str] = None
+        parts: List[Dict[str, Any]] = []
+
+        def _flush_part(size: int) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                upload_id = client.create_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=key,
+                    ContentType=content_type,
+                    Metadata=object_metadata,
+                )["UploadId"]
+            part_number = len(parts) + 1
+            response = client.upload_part(
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=bytes(buffer[:size]),
+            )
+            parts.append({"ETag": response["ETag"], "PartNumber": part_number})
+            del buffer[:size]
+
+        try:
+            for chunk in chunks:
+                hasher.update(chunk)
+                size_bytes += len(chunk)
+                buffer.extend(chunk)
+                while len(buffer) >= S3_MULTIPART_PART_SIZE:
+                    _flush_part(S3_MULTIPART_PART_SIZE)
+
+            if upload_id is None:
+                # Small artifact: single PUT carries the checksum in metadata
+                client.put_object(
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=bytes(buffer),
+                    ContentType=content_type,
+                    Metadata={**object_metadata, "checksum": hasher.hexdigest()},
+                )
+            else:
+                if buffer:
+                    _flush_part(len(buffer))
+                client.complete_multipart_upload(
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            if upload_id is not None:
+                try:
+                    client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+                except Exception as e:
+                    logger.warning(f"Failed to abort multipart upload: {e}")
+            raise
+
+        return hasher.hexdigest(), size_bytes
+
     def retrieve(self, artifact_id: str) -> bytes:
         """Retrieve artifact content from S3."""
+        bucket, key = self._content_location(artifact_id)
+        client = self._get_client()
+        response = client.get_object(Bucket=bucket, Key=key)
+        return response["Body"].read()
+
+    def iter_content(
+        self,
+        artifact_id: str,
+        start: int = 0,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Yield artifact content (or a byte range of it) using ranged GETs."""
         artifact = self.get_metadata(artifact_id)
         if not artifact:
             raise FileNotFoundError(f"Artifact not found: {artifact_id}")
-
-        # Parse S3 key from URI
-        parsed = urlparse(artifact.storage_uri)
-        bucket = parsed.netloc
-        key = parsed.path.lstrip("/")
-
+        start, end = self._normalize_range(start, end, artifact.size_bytes)
+        bucket, key = self._parse_uri(artifact.storage_uri)
+        return self._read_range(bucket, key, start, end, chunk_size)
+
+    def _read_range(self, bucket: str, key: str, start: int, end: int, chunk_size: int) -> Iterator[bytes]:
+        """Stream [start, end) of an object in chunks."""
+        if end <= start:
+            return
         client = self._get_client()
-        response = client.get_object(Bucket=bucket, Key=key)
-        return response["Body"].read()
+        response = client.get_object(Bucket=bucket, Key=key, Range=f"bytes={start}-{end - 1}")
+        yield from response["Body"].iter_chunks(chunk_size=chunk_size)
 
     def get_metadata(self, artifact_id: str) -> Optional[StoredArtifact]:
         """Get artifact metadata from S3."""
         client = self._get_client()
-        metadata_key = f"{self.prefix}_metadata/{artifact_id}.json"
+        metadata_key = self._metadata_key(artifact_id)
 
         try:
             response = client.get_object(Bucket=self.bucket, Key=metadata_key)
@@ -453,10 +797,41 @@ class S3ArtifactStore(ArtifactStore):
             return None
 
     def list_by_run(self, run_id: str) -> List[StoredArtifact]:
-        """List all artifacts for a run from S3."""
+        """List all artifacts for a run from S3.
+
+        Reads the per-run index prefix and lists the run's content prefix,
+        so cost is proportional to the number of artifacts in the run.
+        Content with no index entry (stored before the index existed) is
+        resolved through its metadata sidecar and added to the index.
+        """
         client = self._get_client()
-        prefix = f"{self.prefix}_metadata/"
+        artifacts = self._read_metadata_prefix(client, self._run_index_prefix(run_id))
+        indexed = {a.artifact_id for a in artifacts}
 
+        content_prefix = f"{self.prefix}{run_id}/"
+        paginator = client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=content_prefix):
+            for obj in page.get("Contents", []):
+                artifact_id = obj["Key"][len(content_prefix) :].split("_", 1)[0]
+                if artifact_id in indexed:
+                    continue
+                # Absent metadata means a store still in flight, or a delete
+                artifact = self.get_metadata(artifact_id)
+                if artifact is None or artifact.run_id != run_id:
+                    continue
+                client.put_object(
+                    Bucket=self.bucket,
+                    Key=self._run_index_key(run_id, artifact_id),
+                    Body=artifact.model_dump_json().encode(),
+                    ContentType="application/json",
+                )
+                indexed.add(artifact_id)
+                artifacts.append(artifact)
+
+        return sorted(artifacts, key=lambda a: a.created_at, reverse=True)
+
+    def _read_metadata_prefix(self, client: Any, prefix: str) -> List[StoredArtifact]:
+        """Load every metadata document under a key prefix."""
         artifacts = []
         paginator = client.get_paginator("list_objects_v2")
 
@@ -465,12 +840,11 @@ class S3ArtifactStore(ArtifactStore):
                 try:
                     response = client.get_object(Bucket=self.bucket, Key=obj["Key"])
                     data = json.loads(response["Body"].read().decode())
-                    if data.get("run_id") == run_id:
-                        artifacts.append(StoredArtifact(**data))
+                    artifacts.append(StoredArtifact(**data))
                 except Exception as e:
                     logger.warning(f"Failed to read metadata: {e}")
 
-        return sorted(artifacts, key=lambda a: a.created_at, reverse=True)
+        return artifacts
 
     def delete(self, artifact_id: str) -> bool:
         """Delete artifact from S3."""
@@ -481,17 +855,38 @@ class S3ArtifactStore(ArtifactStore):
         client = self._get_client()
 
         # Delete content
-        parsed = urlparse(artifact.storage_uri)
-        content_key = parsed.path.lstrip("/")
+        _, content_key = self._parse_uri(artifact.storage_uri)
         client.delete_object(Bucket=self.bucket, Key=content_key)
 
-        # Delete metadata
-        metadata_key = f"{self.prefix}_metadata/{artifact_id}.json"
-        client.delete_object(Bucket=self.bucket, Key=metadata_key)
+        # Delete metadata and run index entry
+        client.delete_object(Bucket=self.bucket, Key=self._metadata_key(artifact_id))
+        client.delete_object(Bucket=self.bucket, Key=self._run_index_key(artifact.run_id, artifact_id))
 
         logger.info("artifact_deleted", extra={"artifact_id": artifact_id})
         return True
 
+    def _content_location(self, artifact_id: str) -> Tuple[str, str]:
+        """Resolve (bucket, key) for an artifact's content."""
+        artifact = self.get_metadata(artifact_id)
+        if not artifact:
+            raise FileNotFoundError(f"Artifact not found: {artifact_id}")
+        return self._parse_uri(artifact.storage_uri)
+
+    @staticmethod
+    def _parse_uri(storage_uri: str) -> Tuple[str, str]:
+        """Parse an s3:// URI into (bucket, key)."""
+        parsed = urlparse(storage_uri)
+        return parsed.netloc, parsed.path.lstrip("/")
+
+    def _metadata_key(self, artifact_id: str) -> str:
+        return f"{self.prefix}_metadata/{artifact_id}.json"
+
+    def _run_index_prefix(self, run_id: str) -> str:
+        return f"{self.prefix}_runs/{run_id}/"
+
+    def _run_index_key(self, run_id: str, artifact_id: str) -> str:
+        return f"{self._run_index_prefix(run_id)}{artifact_id}.json"
+
     def _infer_content_type(self, filename: str, artifact_type: ArtifactType) -> str:
         """Infer content type from filename and type."""
         ext = Path(filename).suffix.lower()
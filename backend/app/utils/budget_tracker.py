@@ -12,17 +12,24 @@
 # Budget Tracker
 # Tracks LLM costs and enforces budget limits per agent/tenant
 # Phase 5: Budget Protection Layer (BPL)
+#
+# Daily spend is read from agent_daily_spend (migration 134), a per-agent,
+# per-UTC-day counter bumped in the same transaction as each llm_costs
+# insert, so checks cost one indexed row instead of a SUM over today's
+# cost rows. reconcile_daily_spend() corrects counter drift against the
+# authoritative SUM(llm_costs) and runs periodically from app startup.
 
 import logging
 import os
 import uuid
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import Dict, Optional
 
 from sqlmodel import Session, text
 
-from ..db import Agent, engine
+from ..db import engine
+from .metrics_helpers import get_or_create_counter
 
 logger = logging.getLogger("nova.utils.budget_tracker")
 
@@ -49,6 +56,113 @@ PER_MODEL_LIMITS: Dict[str, int] = {
 # Auto-pause behavior
 AUTO_PAUSE_ON_BREACH = os.getenv("AUTO_PAUSE_ON_BREACH", "true").lower() == "true"
 
+# Daily spend counter reconciliation
+BUDGET_RECONCILE_INTERVAL_SECONDS = int(os.getenv("BUDGET_RECONCILE_INTERVAL_SECONDS", "300"))
+BUDGET_RECONCILE_DAYS = int(os.getenv("BUDGET_RECONCILE_DAYS", "2"))  # today and yesterday (late commits)
+
+BUDGET_SPEND_DRIFT = get_or_create_counter(
+    "aos_budget_daily_spend_drift_corrections_total",
+    "Daily spend counter rows corrected by reconciliation",
+)
+
+# Budget, lifetime spend, pause flag and today's counter in one round trip.
+# is_paused is read through to_jsonb so a schema without the column reads false.
+STATUS_SQL = """
+    SELECT a.budget_cents,
+           a.spent_cents,
+           COALESCE((to_jsonb(a) ->> 'is_paused')::boolean, false) AS is_paused,
+           COALESCE(d.spent_cents, 0) AS today_spent_cents
+    FROM agents a
+    LEFT JOIN agent_daily_spend d ON d.agent_id = a.id AND d.spend_date = :today
+    WHERE a.id = :agent_id
+"""
+
+# Post-hoc deduction in one statement: the cost row and today's counter bump
+# are always written (the cost has been incurred), and spent_cents is bumped
+# only if the lifetime budget covers it. The daily limit is a pre-flight gate
+# in enforce_budget(); rejecting here would drop cost that was already spent.
+DEDUCT_SQL = """
+    WITH agent AS (
+        SELECT agents.id, agents.tenant_id FROM agents
+        WHERE agents.id = :agent_id
+        {tenant_filter}
+    ),
+    cost AS (
+        INSERT INTO llm_costs (id, run_id, agent_id, cost_cents, created_at)
+        SELECT :id, :run_id, agent.id, :cost, :created_at FROM agent
+        RETURNING agent_id, cost_cents
+    ),
+    today AS (
+        INSERT INTO agent_daily_spend (agent_id, spend_date, tenant_id, spent_cents, updated_at)
+        SELECT cost.agent_id, :today, agent.tenant_id, cost.cost_cents, now()
+        FROM cost JOIN agent ON agent.id = cost.agent_id
+        ON CONFLICT (agent_id, spend_date) DO UPDATE
+        SET spent_cents = agent_daily_spend.spent_cents + EXCLUDED.spent_cents,
+            updated_at = now()
+        RETURNING spent_cents
+    ),
+    deducted AS (
+        UPDATE agents
+        SET spent_cents = agents.spent_cents + :cost
+        FROM agent
+        WHERE agents.id = agent.id
+        AND (agents.budget_cents = 0 OR agents.budget_cents - agents.spent_cents >= :cost)
+        RETURNING agents.id, agents.budget_cents, agents.spent_cents
+    )
+    SELECT deducted.id, deducted.budget_cents, deducted.spent_cents, today.spent_cents
+    FROM today LEFT JOIN deducted ON true
+"""
+
+# Cost row and counter bump in one statement (one transaction)
+RECORD_COST_SQL = """
+    WITH cost AS (
+        INSERT INTO llm_costs (id, run_id, agent_id, provider, model, input_tokens, output_tokens, cost_cents, created_at)
+        VALUES (:id, :run_id, :agent_id, :provider, :model, :input_tokens, :output_tokens, :cost_cents, :created_at)
+        RETURNING agent_id, cost_cents
+    )
+    INSERT INTO agent_daily_spend (agent_id, spend_date, tenant_id, spent_cents, updated_at)
+    SELECT cost.agent_id, :spend_date,
+           COALESCE(:tenant_id, (SELECT tenant_id FROM agents WHERE id = cost.agent_id)),
+           cost.cost_cents, now()
+    FROM cost
+    ON CONFLICT (agent_id, spend_date) DO UPDATE
+    SET spent_cents = agent_daily_spend.spent_cents + EXCLUDED.spent_cents,
+        updated_at = now()
+"""
+
+# Rewrite one day's counters from SUM(llm_costs); returns rows corrected.
+# Run after LOCK TABLE agent_daily_spend IN SHARE ROW EXCLUSIVE MODE so no
+# recorder can commit between the SUM snapshot and the rewrite.
+RECONCILE_SQL = """
+    WITH actual AS (
+        SELECT agent_id, SUM(cost_cents) AS spent_cents
+        FROM llm_costs
+        WHERE created_at >= :day_start AND created_at < :day_end
+        GROUP BY agent_id
+    ),
+    corrected AS (
+        INSERT INTO agent_daily_spend (agent_id, spend_date, tenant_id, spent_cents, updated_at)
+        SELECT actual.agent_id, :spend_date, agents.tenant_id, actual.spent_cents, now()
+        FROM actual LEFT JOIN agents ON agents.id = actual.agent_id
+        ON CONFLICT (agent_id, spend_date) DO UPDATE
+        SET spent_cents = EXCLUDED.spent_cents, updated_at = now()
+        WHERE agent_daily_spend.spent_cents <> EXCLUDED.spent_cents
+        RETURNING 1
+    ),
+    zeroed AS (
+        UPDATE agent_daily_spend SET spent_cents = 0, updated_at = now()
+        WHERE spend_date = :spend_date
+        AND spent_cents <> 0
+        AND agent_id NOT IN (SELECT agent_id FROM actual)
+        RETURNING 1
+    )
+    SELECT (SELECT COUNT(*) FROM corrected) + (SELECT COUNT(*) FROM zeroed)
+"""
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
 
 @dataclass
 class BudgetStatus:
@@ -100,22 +214,16 @@ class BudgetTracker:
             BudgetStatus or None if agent not found
         """
         with Session(engine) as session:
-            agent = session.get(Agent, agent_id)
-            if not agent:
+            row = session.execute(text(STATUS_SQL), {"agent_id": agent_id, "today": _utc_today()}).first()
+            if not row:
                 return None
 
-            budget = agent.budget_cents or 0
-            spent = agent.spent_cents or 0
+            budget = row[0] or 0
+            spent = row[1] or 0
             remaining = budget - spent
 
             usage_percent = (spent / budget * 100) if budget > 0 else 0
 
-            # Get today's spending from llm_costs table
-            today_spent = self._get_today_spent(session, agent_id)
-
-            # Check if agent is paused
-            is_paused = getattr(agent, "is_paused", False)
-
             return BudgetStatus(
                 budget_cents=budget,
                 spent_cents=spent,
@@ -123,27 +231,32 @@ class BudgetTracker:
                 usage_percent=usage_percent,
                 is_exhausted=remaining <= 0 and budget > 0,
                 is_alert_threshold=usage_percent >= (self.alert_threshold * 100),
-                today_spent_cents=today_spent,
-                is_paused=is_paused,
+                today_spent_cents=int(row[3]),
+                is_paused=bool(row[2]),
             )
 
     def _get_today_spent(self, session: Session, agent_id: str) -> int:
-        """Get total spent today from llm_costs table."""
-        try:
-            today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
-            query = text(
+        """Get total spent today from the daily spend counter."""
+        row = session.execute(
+            text("SELECT spent_cents FROM agent_daily_spend WHERE agent_id = :agent_id AND spend_date = :today"),
+            {"agent_id": agent_id, "today": _utc_today()},
+        ).first()
+        return int(row[0]) if row else 0
+
+    def get_tenant_today_spent(self, tenant_id: str) -> int:
+        """Get total spent today across a tenant's agents."""
+        with Session(engine) as session:
+            row = session.execute(
+                text(
+                    """
+                    SELECT COALESCE(SUM(spent_cents), 0)
+                    FROM agent_daily_spend
+                    WHERE tenant_id = :tenant_id AND spend_date = :today
                 """
-                SELECT COALESCE(SUM(cost_cents), 0) as total
-                FROM llm_costs
-                WHERE agent_id = :agent_id AND created_at >= :today_start
-            """
-            )
-            result = session.exec(query, {"agent_id": agent_id, "today_start": today_start})
-            row = result.first()
+                ),
+                {"tenant_id": tenant_id, "today": _utc_today()},
+            ).first()
             return int(row[0]) if row else 0
-        except Exception:
-            # Table might not exist
-            return 0
 
     def check_budget(
         self,
@@ -355,48 +468,46 @@ class BudgetTracker:
         agent_id: str,
         cost_cents: int,
         tenant_id: Optional[str] = None,
+        run_id: Optional[str] = None,
     ) -> bool:
-        """Atomically deduct cost from agent budget.
+        """Atomically record and deduct an incurred cost from agent budget.
+
+        One statement writes the llm_costs row, adds the cost to today's
+        spend counter and bumps spent_cents if the lifetime budget covers
+        it. The cost row and counter are written even when the budget does
+        not cover it; PER_DAY_MAX_CENTS is enforced before spending, in
+        enforce_budget().
 
         Args:
             agent_id: Agent to deduct from
             cost_cents: Cost to deduct
             tenant_id: Optional tenant filter for safety
+            run_id: Run that incurred the cost, stored on the cost row
 
         Returns:
-            True if deduction successful, False if budget would go negative
+            True if deduction successful, False if the agent was not found
+            or the budget would go negative
         """
-        with Session(engine) as session:
-            # Use raw SQL for atomic update with check
-            query = text(
-                """
-                UPDATE agents
-                SET spent_cents = spent_cents + :cost
-                WHERE id = :agent_id
-                AND (budget_cents = 0 OR budget_cents - spent_cents >= :cost)
-                RETURNING id, budget_cents, spent_cents
-            """
-            )
-
-            if tenant_id:
-                query = text(
-                    """
-                    UPDATE agents
-                    SET spent_cents = spent_cents + :cost
-                    WHERE id = :agent_id
-                    AND tenant_id = :tenant_id
-                    AND (budget_cents = 0 OR budget_cents - spent_cents >= :cost)
-                    RETURNING id, budget_cents, spent_cents
-                """
-                )
-                result = session.execute(query, {"agent_id": agent_id, "cost": cost_cents, "tenant_id": tenant_id})
-            else:
-                result = session.execute(query, {"agent_id": agent_id, "cost": cost_cents})
+        now = datetime.now(timezone.utc)
+        params = {
+            "id": str(uuid.uuid4()),
+            "run_id": run_id,
+            "agent_id": agent_id,
+            "cost": cost_cents,
+            "created_at": now,
+            "today": now.date(),
+        }
+        tenant_filter = ""
+        if tenant_id:
+            tenant_filter = "AND agents.tenant_id = :tenant_id"
+            params["tenant_id"] = tenant_id
 
+        with Session(engine) as session:
+            result = session.execute(text(DEDUCT_SQL.format(tenant_filter=tenant_filter)), params)
             row = result.first()
             session.commit()
 
-            if row:
+            if row and row[0] is not None:
                 logger.info(
                     "budget_deducted",
                     extra={
@@ -404,11 +515,19 @@ class BudgetTracker:
                         "cost_cents": cost_cents,
                         "new_spent": row[2],
                         "budget": row[1],
+                        "today_spent": row[3],
                     },
                 )
                 return True
             else:
-                logger.warning("budget_deduction_failed", extra={"agent_id": agent_id, "cost_cents": cost_cents})
+                logger.warning(
+                    "budget_deduction_failed",
+                    extra={
+                        "agent_id": agent_id,
+                        "cost_cents": cost_cents,
+                        "today_spent": row[3] if row else None,
+                    },
+                )
                 return False
 
     def record_cost(
@@ -420,23 +539,20 @@ class BudgetTracker:
         input_tokens: int,
         output_tokens: int,
         cost_cents: int,
+        tenant_id: Optional[str] = None,
     ):
         """Record LLM cost for auditing.
 
-        Stores cost record in llm_costs table (if exists).
+        Stores cost record in llm_costs table (if exists) and adds it to the
+        agent's daily spend counter in the same transaction. Costs passed to
+        deduct() already get their own row and must not be recorded again.
         Falls back to logging if table doesn't exist.
         """
+        now = datetime.now(timezone.utc)
         try:
             with Session(engine) as session:
-                # Try to insert into llm_costs table
-                query = text(
-                    """
-                    INSERT INTO llm_costs (id, run_id, agent_id, provider, model, input_tokens, output_tokens, cost_cents, created_at)
-                    VALUES (:id, :run_id, :agent_id, :provider, :model, :input_tokens, :output_tokens, :cost_cents, :created_at)
-                """
-                )
-                session.exec(
-                    query,
+                session.execute(
+                    text(RECORD_COST_SQL),
                     {
                         "id": str(uuid.uuid4()),
                         "run_id": run_id,
@@ -446,7 +562,9 @@ class BudgetTracker:
                         "input_tokens": input_tokens,
                         "output_tokens": output_tokens,
                         "cost_cents": cost_cents,
-                        "created_at": datetime.now(timezone.utc),
+                        "created_at": now,
+                        "spend_date": now.date(),
+                        "tenant_id": tenant_id,
                     },
                 )
                 session.commit()
@@ -467,6 +585,39 @@ class BudgetTracker:
                 },
             )
 
+    def reconcile_daily_spend(self, days: int = BUDGET_RECONCILE_DAYS) -> int:
+        """Correct daily spend counters against SUM(llm_costs).
+
+        Rewrites the counters for the last `days` UTC days (today included)
+        wherever they differ from the cost rows, including counters for
+        agents with no cost rows left. Each day is reconciled in its own
+        short transaction under a lock that briefly holds back recorders.
+
+        Returns:
+            Number of counter rows corrected
+        """
+        corrected = 0
+        today = _utc_today()
+        for offset in range(days):
+            spend_date = today - timedelta(days=offset)
+            day_start = datetime.combine(spend_date, datetime.min.time(), tzinfo=timezone.utc)
+            with Session(engine) as session:
+                session.execute(text("LOCK TABLE agent_daily_spend IN SHARE ROW EXCLUSIVE MODE"))
+                row = session.execute(
+                    text(RECONCILE_SQL),
+                    {"spend_date": spend_date, "day_start": day_start, "day_end": day_start + timedelta(days=1)},
+                ).first()
+                session.commit()
+            fixed = int(row[0]) if row else 0
+            if fixed:
+                logger.warning(
+                    "budget_daily_spend_drift_corrected",
+                    extra={"spend_date": spend_date.isoformat(), "rows": fixed},
+                )
+                BUDGET_SPEND_DRIFT.inc(fixed)
+            corrected += fixed
+        return corrected
+
 
 # Singleton instance
 _tracker: Optional[BudgetTracker] = None
@@ -485,9 +636,14 @@ def check_budget(agent_id: str, estimated_cost_cents: int) -> tuple[bool, Option
     return get_budget_tracker().check_budget(agent_id, estimated_cost_cents)
 
 
-def deduct_budget(agent_id: str, cost_cents: int, tenant_id: Optional[str] = None) -> bool:
+def deduct_budget(
+    agent_id: str,
+    cost_cents: int,
+    tenant_id: Optional[str] = None,
+    run_id: Optional[str] = None,
+) -> bool:
     """Convenience function to deduct budget."""
-    return get_budget_tracker().deduct(agent_id, cost_cents, tenant_id)
+    return get_budget_tracker().deduct(agent_id, cost_cents, tenant_id, run_id)
 
 
 def record_cost(
@@ -498,9 +654,17 @@ def record_cost(
     input_tokens: int,
     output_tokens: int,
     cost_cents: int,
+    tenant_id: Optional[str] = None,
 ):
     """Convenience function to record cost."""
-    get_budget_tracker().record_cost(run_id, agent_id, provider, model, input_tokens, output_tokens, cost_cents)
+    get_budget_tracker().record_cost(
+        run_id, agent_id, provider, model, input_tokens, output_tokens, cost_cents, tenant_id
+    )
+
+
+def reconcile_daily_spend(days: int = BUDGET_RECONCILE_DAYS) -> int:
+    """Convenience function to reconcile daily spend counters."""
+    return get_budget_tracker().reconcile_daily_spend(days)
 
 
 def enforce_budget(
@@ -9,6 +9,7 @@
 # Forbidden Imports: L1, L2, L3, L4, L5
 # Reference: Guard System
 
+
 # Guard API Cache Layer
 """
 Redis-based cache for Guard Console endpoints.
@@ -17,19 +18,43 @@ Reduces database query latency by caching frequently-accessed data.
 Critical for cross-region deployments (EU server, Singapore DB).
 
 Cache Keys:
-- guard:status:{tenant_id} - 5s TTL (real-time status)
-- guard:snapshot:{tenant_id} - 10s TTL (today's metrics)
-- guard:incidents:{tenant_id}:{limit}:{offset} - 5s TTL
+- guard:status:{tenant_id} - 5s fresh (real-time status)
+- guard:snapshot:{tenant_id} - 10s fresh (today's metrics)
+- guard:incidents:{tenant_id}:{limit}:{offset} - 5s fresh
+- guard:gen:{tenant_id} - tenant generation, bumped on invalidation
+- guard:lock:{key} - recompute lease
 
 Performance Target:
 - Reduce /guard/status from 4-7s to <100ms (cache hit)
 - Reduce /guard/snapshot/today from 2-6s to <100ms (cache hit)
+
+Read path (get_or_compute):
+1. L1: per-process dict, entries live at most GUARD_CACHE_L1_TTL seconds.
+2. L2: Redis envelope {v, fresh_until, gen}. Values are kept for
+   GUARD_CACHE_STALE_TTL seconds past fresh_until; a stale value is served
+   immediately while one background task refreshes it.
+3. Miss: one compute per key per process (in-process single-flight), and one
+   per key across processes (SET NX lease). Processes that lose the lease
+   poll Redis for the winner's value and only compute themselves if the
+   lease lapses without one.
+
+Invalidation:
+invalidate_tenant() bumps guard:gen:{tenant_id}. Envelopes written under an
+older generation are treated as misses (never served stale), so nothing has
+to be scanned or deleted, and a compute that started before the mutation
+cannot republish pre-mutation data. The tenant id is also published on
+guard:invalidate so every process drops its L1 entries for the tenant.
+invalidate_tenant_sync() does the same from sync code (e.g. the worker after
+it commits an incident).
 """
 
+import asyncio
 import json
 import logging
 import os
-from typing import Dict, Optional
+import time
+import uuid
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 
 from .metrics_helpers import get_or_create_counter, get_or_create_histogram
 
@@ -40,7 +65,20 @@ GUARD_CACHE_ENABLED = os.getenv("GUARD_CACHE_ENABLED", "true").lower() == "true"
 GUARD_STATUS_TTL = int(os.getenv("GUARD_STATUS_TTL", "5"))  # 5 seconds
 GUARD_SNAPSHOT_TTL = int(os.getenv("GUARD_SNAPSHOT_TTL", "10"))  # 10 seconds
 GUARD_INCIDENTS_TTL = int(os.getenv("GUARD_INCIDENTS_TTL", "5"))  # 5 seconds
+GUARD_CACHE_STALE_TTL = int(os.getenv("GUARD_CACHE_STALE_TTL", "30"))  # served stale while refreshing
+GUARD_CACHE_L1_TTL = float(os.getenv("GUARD_CACHE_L1_TTL", "1.0"))  # in-process tier
+GUARD_CACHE_LOCK_LEASE_MS = int(os.getenv("GUARD_CACHE_LOCK_LEASE_MS", "8000"))  # covers a slow recompute
+GUARD_CACHE_LOCK_POLL_SECONDS = 0.05
 GUARD_CACHE_PREFIX = "guard:"
+GUARD_INVALIDATE_CHANNEL = f"{GUARD_CACHE_PREFIX}invalidate"
+
+# Delete the lease only if we still own it (it may have lapsed and been re-taken)
+RELEASE_LOCK_LUA = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
 
 # Metrics - using idempotent registration (PIN-120 PREV-1)
 GUARD_CACHE_HITS = get_or_create_counter(
@@ -55,12 +93,37 @@ GUARD_CACHE_MISSES = get_or_create_counter(
     ["endpoint"],
 )
 
+GUARD_CACHE_L1_HITS = get_or_create_counter(
+    "aos_guard_cache_l1_hits_total",
+    "Guard cache hits served from the in-process tier",
+    ["endpoint"],
+)
+
+GUARD_CACHE_STALE = get_or_create_counter(
+    "aos_guard_cache_stale_total",
+    "Guard cache stale values served while a refresh runs",
+    ["endpoint"],
+)
+
+GUARD_CACHE_REFRESHES = get_or_create_counter(
+    "aos_guard_cache_refreshes_total",
+    "Guard cache recomputations",
+    ["endpoint", "mode", "outcome"],
+)
+
+GUARD_CACHE_INVALIDATIONS = get_or_create_counter(
+    "aos_guard_cache_invalidations_total",
+    "Guard cache tenant invalidations",
+)
+
 GUARD_CACHE_LATENCY = get_or_create_histogram(
     "aos_guard_cache_latency_seconds",
     "Guard cache lookup latency",
     buckets=[0.001, 0.005, 0.01, 0.025, 0.05, 0.1],
 )
 
+Compute = Callable[[], Awaitable[Dict]]
+
 
 class GuardCache:
     """
@@ -69,18 +132,46 @@ class GuardCache:
     Usage:
         cache = GuardCache()
 
-        # Check cache first
-        data = await cache.get_status(tenant_id)
-        if data is None:
-            data = fetch_from_db(...)
-            await cache.set_status(tenant_id, data)
+        async def compute():
+            return fetch_from_db(...)
+
+        data = await cache.get_or_compute("status", tenant_id, compute, GUARD_STATUS_TTL)
+
+        # On mutation
+        await cache.invalidate_tenant(tenant_id)
+
+    compute() runs in the request for a miss. A stale value is refreshed in
+    the background by `refresh` (defaults to compute), which must not depend
+    on request-scoped resources such as the request's DB session.
     """
 
     _instance: Optional["GuardCache"] = None
 
-    def __init__(self, redis_client=None):
+    def __init__(
+        self,
+        redis_client=None,
+        sync_redis_client=None,
+        l1_ttl: float = GUARD_CACHE_L1_TTL,
+        stale_ttl: int = GUARD_CACHE_STALE_TTL,
+        lock_lease_ms: int = GUARD_CACHE_LOCK_LEASE_MS,
+        clock: Callable[[], float] = time.time,
+    ):
         self._redis = redis_client
+        self._sync_redis = sync_redis_client
         self._enabled = GUARD_CACHE_ENABLED
+        self._l1_ttl = l1_ttl
+        self._stale_ttl = stale_ttl
+        self._lock_lease_ms = lock_lease_ms
+        self._clock = clock
+        # L1: key -> (value, expires_at); tenant -> keys, for eviction
+        self._l1: Dict[str, Tuple[Dict, float]] = {}
+        self._l1_keys: Dict[str, set] = {}
+        # Bumped on every local eviction so in-flight computes don't repopulate L1
+        self._local_generation: Dict[str, int] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._refreshing: set = set()
+        self._background: set = set()
+        self._listener: Optional[asyncio.Task] = None
         logger.info(f"GuardCache initialized (enabled={self._enabled})")
 
     @classmethod
@@ -119,37 +210,302 @@ class GuardCache:
             key += f":{extra}"
         return key
 
-    async def get(self, endpoint: str, tenant_id: str, extra: str = "") -> Optional[Dict]:
-        """Get cached data."""
-        if not self._enabled:
+    def _generation_key(self, tenant_id: str) -> str:
+        return f"{GUARD_CACHE_PREFIX}gen:{tenant_id}"
+
+    def _lock_key(self, key: str) -> str:
+        return f"{GUARD_CACHE_PREFIX}lock:{key}"
+
+    # -------------------------------------------------------------------------
+    # L1 (in-process)
+    # -------------------------------------------------------------------------
+
+    def _l1_get(self, key: str) -> Optional[Dict]:
+        entry = self._l1.get(key)
+        if entry is None:
             return None
+        if entry[1] <= self._clock():
+            del self._l1[key]
+            return None
+        return entry[0]
 
-        import time
+    def _l1_put(self, key: str, tenant_id: str, value: Dict, fresh_until: float) -> None:
+        self._l1[key] = (value, min(self._clock() + self._l1_ttl, fresh_until))
+        self._l1_keys.setdefault(tenant_id, set()).add(key)
 
-        start = time.perf_counter()
+    def _evict_local(self, tenant_id: str) -> None:
+        """Drop a tenant's L1 entries and fence off computes already running."""
+        self._local_generation[tenant_id] = self._local_generation.get(tenant_id, 0) + 1
+        for key in self._l1_keys.pop(tenant_id, ()):
+            self._l1.pop(key, None)
 
-        try:
-            redis = await self._get_redis()
-            if not redis:
-                return None
+    # -------------------------------------------------------------------------
+    # L2 (Redis)
+    # -------------------------------------------------------------------------
 
-            key = self._make_key(endpoint, tenant_id, extra)
-            data = await redis.get(key)
+    async def _read(self, redis, key: str, tenant_id: str) -> Tuple[Optional[Dict], int]:
+        """Return (envelope, current generation). Envelopes from older generations read as misses."""
+        if redis is None:
+            return None, 0
 
-            latency = time.perf_counter() - start
-            GUARD_CACHE_LATENCY.observe(latency)
+        start = time.perf_counter()
+        try:
+            raw, generation = await redis.mget(key, self._generation_key(tenant_id))
+        except Exception as e:
+            logger.warning(f"Cache get error: {e}")
+            return None, 0
+        finally:
+            GUARD_CACHE_LATENCY.observe(time.perf_counter() - start)
+
+        generation = int(generation or 0)
+        if not raw:
+            return None, generation
+        envelope = json.loads(raw)
+        if envelope.get("gen") != generation:
+            return None, generation
+        return envelope, generation
+
+    async def _write(
+        self,
+        redis,
+        key: str,
+        tenant_id: str,
+        value: Dict,
+        ttl: int,
+        generation: int,
+        local_generation: int,
+    ) -> Dict:
+        """Store a computed value in both tiers; returns it as readers will see it."""
+        fresh_until = self._clock() + ttl
+        payload = json.dumps({"v": value, "fresh_until": fresh_until, "gen": generation}, default=str)
+        # Normalise through JSON so every tier returns the same shapes
+        value = json.loads(payload)["v"]
+
+        if self._local_generation.get(tenant_id, 0) == local_generation:
+            self._l1_put(key, tenant_id, value, fresh_until)
+
+        if redis is not None:
+            try:
+                await redis.set(key, payload, ex=ttl + self._stale_ttl)
+            except Exception as e:
+                logger.warning(f"Cache set error: {e}")
+        return value
+
+    async def _acquire_lock(self, redis, key: str) -> Optional[str]:
+        """
+        Take the recompute lease for a key.
+
+        Returns the lease token, None if another process holds it, or "" if
+        Redis failed (compute without a lease rather than stall the request).
+        """
+        token = uuid.uuid4().hex
+        try:
+            if await redis.set(self._lock_key(key), token, nx=True, px=self._lock_lease_ms):
+                return token
+            return None
+        except Exception as e:
+            logger.warning(f"Cache lock error: {e}")
+            return ""
 
-            if data:
+    async def _release_lock(self, redis, key: str, token: str) -> None:
+        try:
+            await redis.eval(RELEASE_LOCK_LUA, 1, self._lock_key(key), token)
+        except Exception as e:
+            logger.warning(f"Cache unlock error: {e}")
+
+    async def _await_holder(self, redis, key: str, tenant_id: str) -> Optional[Dict]:
+        """Wait for the lease holder's value; None if the lease ends without one."""
+        deadline = time.monotonic() + self._lock_lease_ms / 1000
+        while time.monotonic() < deadline:
+            await asyncio.sleep(GUARD_CACHE_LOCK_POLL_SECONDS)
+            try:
+                raw, generation, holder = await redis.mget(key, self._generation_key(tenant_id), self._lock_key(key))
+            except Exception as e:
+                logger.warning(f"Cache get error: {e}")
+                return None
+            if raw:
+                envelope = json.loads(raw)
+                if envelope.get("gen") == int(generation or 0):
+                    self._l1_put(key, tenant_id, envelope["v"], envelope["fresh_until"])
+                    return envelope["v"]
+            if holder is None:
+                return None
+        return None
+
+    # -------------------------------------------------------------------------
+    # Read-through API
+    # -------------------------------------------------------------------------
+
+    async def get_or_compute(
+        self,
+        endpoint: str,
+        tenant_id: str,
+        compute: Compute,
+        ttl: int,
+        extra: str = "",
+        refresh: Optional[Compute] = None,
+    ) -> Dict:
+        """
+        Return the cached value for a key, computing it at most once per key.
+
+        Fresh values come from L1 or Redis. Stale values (within the stale
+        window of the current generation) are returned as-is while `refresh`
+        recomputes them in the background. Misses run `compute` under
+        single-flight; its exceptions propagate to every waiting caller.
+        """
+        if not self._enabled:
+            return await compute()
+
+        key = self._make_key(endpoint, tenant_id, extra)
+        value = self._l1_get(key)
+        if value is not None:
+            GUARD_CACHE_L1_HITS.labels(endpoint=endpoint).inc()
+            GUARD_CACHE_HITS.labels(endpoint=endpoint).inc()
+            return value
+
+        redis = await self._get_redis()
+        if redis is not None:
+            self._ensure_listener(redis)
+
+        envelope, generation = await self._read(redis, key, tenant_id)
+        if envelope is not None:
+            if envelope["fresh_until"] > self._clock():
                 GUARD_CACHE_HITS.labels(endpoint=endpoint).inc()
-                return json.loads(data)
+                self._l1_put(key, tenant_id, envelope["v"], envelope["fresh_until"])
             else:
-                GUARD_CACHE_MISSES.labels(endpoint=endpoint).inc()
-                return None
+                GUARD_CACHE_STALE.labels(endpoint=endpoint).inc()
+                self._schedule_refresh(redis, key, endpoint, tenant_id, refresh or compute, ttl, generation)
+            return envelope["v"]
+
+        GUARD_CACHE_MISSES.labels(endpoint=endpoint).inc()
+        future = self._inflight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._fill(redis, key, endpoint, tenant_id, compute, ttl, generation))
+            self._inflight[key] = future
+            future.add_done_callback(lambda f: self._forget_inflight(key, f))
+        # Shielded: a cancelled request must not cancel the compute others wait on
+        return await asyncio.shield(future)
+
+    def _forget_inflight(self, key: str, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            future.exception()  # retrieved here so an abandoned failure isn't logged as unhandled
+
+    async def _fill(
+        self, redis, key: str, endpoint: str, tenant_id: str, compute: Compute, ttl: int, generation: int
+    ) -> Dict:
+        local_generation = self._local_generation.get(tenant_id, 0)
+        token = ""
+        if redis is not None:
+            token = await self._acquire_lock(redis, key)
+            if token is None:
+                value = await self._await_holder(redis, key, tenant_id)
+                if value is not None:
+                    return value
+                token = ""  # holder failed or overran its lease
 
-        except Exception as e:
-            logger.warning(f"Cache get error: {e}")
+        try:
+            try:
+                value = await compute()
+            except Exception:
+                GUARD_CACHE_REFRESHES.labels(endpoint=endpoint, mode="foreground", outcome="error").inc()
+                raise
+            GUARD_CACHE_REFRESHES.labels(endpoint=endpoint, mode="foreground", outcome="ok").inc()
+            return await self._write(redis, key, tenant_id, value, ttl, generation, local_generation)
+        finally:
+            if token:
+                await self._release_lock(redis, key, token)
+
+    def _schedule_refresh(
+        self, redis, key: str, endpoint: str, tenant_id: str, refresh: Compute, ttl: int, generation: int
+    ) -> None:
+        if key in self._refreshing or key in self._inflight:
+            return
+        self._refreshing.add(key)
+        task = asyncio.ensure_future(self._refresh(redis, key, endpoint, tenant_id, refresh, ttl, generation))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _refresh(
+        self, redis, key: str, endpoint: str, tenant_id: str, refresh: Compute, ttl: int, generation: int
+    ) -> None:
+        local_generation = self._local_generation.get(tenant_id, 0)
+        token = ""
+        try:
+            if redis is not None:
+                token = await self._acquire_lock(redis, key)
+                if token is None:
+                    # Another process is already refreshing this key
+                    GUARD_CACHE_REFRESHES.labels(endpoint=endpoint, mode="background", outcome="skipped").inc()
+                    return
+            try:
+                value = await refresh()
+            except Exception as e:
+                GUARD_CACHE_REFRESHES.labels(endpoint=endpoint, mode="background", outcome="error").inc()
+                logger.warning(f"Cache refresh error for {key}: {e}")
+                return
+            GUARD_CACHE_REFRESHES.labels(endpoint=endpoint, mode="background", outcome="ok").inc()
+            await self._write(redis, key, tenant_id, value, ttl, generation, local_generation)
+        finally:
+            if token:
+                await self._release_lock(redis, key, token)
+            self._refreshing.discard(key)
+
+    # -------------------------------------------------------------------------
+    # Cross-process L1 invalidation
+    # -------------------------------------------------------------------------
+
+    def _ensure_listener(self, redis) -> None:
+        if self._listener is None:
+            self._listener = asyncio.ensure_future(self._listen(redis))
+
+    async def _listen(self, redis) -> None:
+        """Evict L1 entries for tenants invalidated by any process."""
+        while True:
+            try:
+                pubsub = redis.pubsub()
+                try:
+                    await pubsub.subscribe(GUARD_INVALIDATE_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self._evict_local(message["data"])
+                finally:
+                    await pubsub.aclose()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Guard cache invalidation listener error: {e}")
+            # Invalidations may have been missed while unsubscribed
+            for tenant_id in list(self._l1_keys):
+                self._evict_local(tenant_id)
+            await asyncio.sleep(1.0)
+
+    async def close(self) -> None:
+        """Stop the invalidation listener and any background refreshes."""
+        tasks = [t for t in [self._listener, *self._background] if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._listener = None
+
+    # -------------------------------------------------------------------------
+    # Direct access
+    # -------------------------------------------------------------------------
+
+    async def get(self, endpoint: str, tenant_id: str, extra: str = "") -> Optional[Dict]:
+        """Get cached data (fresh values only)."""
+        if not self._enabled:
             return None
 
+        key = self._make_key(endpoint, tenant_id, extra)
+        envelope, _ = await self._read(await self._get_redis(), key, tenant_id)
+        if envelope is not None and envelope["fresh_until"] > self._clock():
+            GUARD_CACHE_HITS.labels(endpoint=endpoint).inc()
+            return envelope["v"]
+        GUARD_CACHE_MISSES.labels(endpoint=endpoint).inc()
+        return None
+
     async def set(self, endpoint: str, tenant_id: str, data: Dict, ttl: int, extra: str = "") -> bool:
         """Set cached data."""
         if not self._enabled:
@@ -161,7 +517,8 @@ class GuardCache:
                 return False
 
             key = self._make_key(endpoint, tenant_id, extra)
-            await redis.setex(key, ttl, json.dumps(data, default=str))
+            generation = int(await redis.get(self._generation_key(tenant_id)) or 0)
+            await self._write(redis, key, tenant_id, data, ttl, generation, self._local_generation.get(tenant_id, 0))
             return True
 
         except Exception as e:
@@ -170,12 +527,13 @@ class GuardCache:
 
     async def invalidate(self, endpoint: str, tenant_id: str, extra: str = "") -> bool:
         """Invalidate cached data."""
+        key = self._make_key(endpoint, tenant_id, extra)
+        self._l1.pop(key, None)
         try:
             redis = await self._get_redis()
             if not redis:
                 return False
 
-            key = self._make_key(endpoint, tenant_id, extra)
             await redis.delete(key)
             return True
 
@@ -211,22 +569,51 @@ class GuardCache:
         return await self.set("incidents", tenant_id, data, GUARD_INCIDENTS_TTL, extra)
 
     async def invalidate_tenant(self, tenant_id: str) -> int:
-        """Invalidate all cache for a tenant (on mutations)."""
+        """
+        Invalidate all cache for a tenant (on mutations).
+
+        Call after the mutation commits. Returns the tenant's new generation
+        (0 if Redis is unavailable; L1 is still cleared).
+        """
+        self._evict_local(tenant_id)
+        GUARD_CACHE_INVALIDATIONS.inc()
         try:
             redis = await self._get_redis()
             if not redis:
                 return 0
 
-            pattern = f"{GUARD_CACHE_PREFIX}*:{tenant_id}*"
-            keys = []
-            async for key in redis.scan_iter(pattern):
-                keys.append(key)
+            generation = await redis.incr(self._generation_key(tenant_id))
+            await redis.publish(GUARD_INVALIDATE_CHANNEL, tenant_id)
+            logger.info(f"Invalidated guard cache for {tenant_id} (generation {generation})")
+            return generation
+
+        except Exception as e:
+            logger.warning(f"Cache invalidate_tenant error: {e}")
+            return 0
+
+    def invalidate_tenant_sync(self, tenant_id: str) -> int:
+        """
+        invalidate_tenant() for callers without an event loop (the worker's
+        run-completion transaction, sync-session coordinators).
+
+        Bumps the same generation key and publishes on the same channel, so
+        API processes drop their L1 entries for the tenant.
+        """
+        self._evict_local(tenant_id)
+        GUARD_CACHE_INVALIDATIONS.inc()
+        try:
+            if self._sync_redis is None:
+                redis_url = os.getenv("REDIS_URL", "")
+                if not redis_url:
+                    return 0
+                import redis as sync_redis
 
-            if keys:
-                await redis.delete(*keys)
-                logger.info(f"Invalidated {len(keys)} cache keys for {tenant_id}")
+                self._sync_redis = sync_redis.Redis.from_url(redis_url, decode_responses=True)
 
-            return len(keys)
+            generation = self._sync_redis.incr(self._generation_key(tenant_id))
+            self._sync_redis.publish(GUARD_INVALIDATE_CHANNEL, tenant_id)
+            logger.info(f"Invalidated guard cache for {tenant_id} (generation {generation})")
+            return generation
 
         except Exception as e:
             logger.warning(f"Cache invalidate_tenant error: {e}")
@@ -239,4 +626,10 @@ def get_guard_cache() -> GuardCache:
     return GuardCache.get_instance()
 
 
-__all__ = ["GuardCache", "get_guard_cache", "GUARD_STATUS_TTL", "GUARD_SNAPSHOT_TTL", "GUARD_INCIDENTS_TTL"]
+__all__ = [
+    "GuardCache",
+    "get_guard_cache",
+    "GUARD_STATUS_TTL",
+    "GUARD_SNAPSHOT_TTL",
+    "GUARD_INCIDENTS_TTL",
+]
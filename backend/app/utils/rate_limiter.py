@@ -11,61 +11,228 @@
 
 # Rate Limiter
 # Token bucket rate limiting using Redis
+"""
+Leased token buckets.
+
+Each limit is a token bucket in Redis (capacity = limit, refilled
+continuously at limit/window). Rather than spending one Redis round trip
+per request, a process leases a slice of the bucket in one atomic script
+call and serves requests from that slice locally until it is used up or
+expires (RATE_LIMIT_LEASE_TTL). Denials are cached locally until the
+bucket can refill, so an over-limit tenant does not hit Redis either.
+
+Guarantees, for any number of processes sharing a bucket:
+- Tokens only come out of the shared bucket, and a lease is only honoured
+  for lease_ttl after it was granted. So in any interval of length W at
+  most limit + rate * (W + lease_ttl) requests are admitted, which is at
+  most rate * lease_ttl more than an exact per-request bucket.
+- Unused lease tokens expire rather than return, so the error on the other
+  side is undershoot. Leases are sized from each process's own recent
+  demand and capped at min(limit * LEASE_MAX_FRACTION, rate * lease_ttl).
+
+The bucket clock is Redis TIME, so process clock skew does not matter.
+RateLimiter (sync) and LeasedRateLimiter (async) share the script and the
+lease bookkeeping (LeaseTable).
+"""
 
+import asyncio
 import logging
 import os
+import threading
 import time
-from typing import Optional
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 
 logger = logging.getLogger("nova.utils.rate_limiter")
 
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-
-# Lua script for atomic token bucket operation
-TOKEN_BUCKET_LUA = """
+LEASE_TTL_SECONDS = float(os.getenv("RATE_LIMIT_LEASE_TTL", "1.0"))
+LEASE_MAX_FRACTION = float(os.getenv("RATE_LIMIT_LEASE_MAX_FRACTION", "0.1"))
+# After a Redis failure, decide by fail-open/closed for this long before retrying
+REDIS_RETRY_BACKOFF_SECONDS = 1.0
+# Prune idle leases once the table grows past this many keys
+LEASE_TABLE_PRUNE_SIZE = 10_000
+
+# Lua script: lease up to ARGV[3] tokens from a continuously refilled bucket.
+# Returns {granted, tokens_left, retry_after_ms}.
+LEASE_BUCKET_LUA = """
 local key = KEYS[1]
-local rate = tonumber(ARGV[1])
-local now_ts = tonumber(ARGV[2])
-
-local bucket = redis.call("HMGET", key, "tokens", "last")
-local tokens = tonumber(bucket[1]) or rate
-local last = tonumber(bucket[2]) or now_ts
-
-local elapsed = math.max(0, now_ts - last)
-local refill = (elapsed / 60) * rate
-tokens = math.min(rate, tokens + refill)
-
-if tokens < 1 then
-    redis.call("HMSET", key, "tokens", tokens, "last", now_ts)
-    redis.call("EXPIRE", key, 120)
-    return 0
-else
-    tokens = tokens - 1
-    redis.call("HMSET", key, "tokens", tokens, "last", now_ts)
-    redis.call("EXPIRE", key, 120)
-    return 1
+local capacity = tonumber(ARGV[1])
+local window_ms = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+
+local t = redis.call("TIME")
+local now_ms = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local rate = capacity / window_ms
+
+local bucket = redis.call("HMGET", key, "tokens", "ts")
+local tokens = tonumber(bucket[1]) or capacity
+local last = tonumber(bucket[2]) or now_ms
+
+tokens = math.min(capacity, tokens + math.max(0, now_ms - last) * rate)
+local granted = math.min(requested, math.floor(tokens))
+tokens = tokens - granted
+
+redis.call("HSET", key, "tokens", tostring(tokens), "ts", now_ms)
+redis.call("PEXPIRE", key, window_ms + 1000)
+
+local retry_ms = 0
+if granted == 0 then
+    retry_ms = math.ceil((1 - tokens) / rate)
 end
+return {granted, tostring(tokens), retry_ms}
 """
 
 
+@dataclass
+class RateLimitDecision:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    limit: int
+    remaining: int  # Approximate: local lease plus shared tokens at last lease
+    retry_after: float = 0.0  # Seconds until a token is expected (denials only)
+    degraded: bool = False  # Redis unavailable; decided by fail-open/closed
+
+
+@dataclass
+class _Lease:
+    tokens: int = 0
+    expires_at: float = 0.0
+    size: int = 1
+    used: int = 0
+    shared_remaining: int = 0
+    limit: int = 0
+    denied_until: float = 0.0
+    retry_after: float = 0.0
+
+
+class LeaseTable:
+    """
+    Per-process slices of shared token buckets.
+
+    Pure bookkeeping with no I/O: callers try_local() first and, on None,
+    lease request_size() tokens from Redis and hand the reply to apply().
+    Not thread-safe; the sync limiter wraps it in a lock.
+    """
+
+    def __init__(
+        self,
+        lease_ttl: float = LEASE_TTL_SECONDS,
+        max_fraction: float = LEASE_MAX_FRACTION,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.lease_ttl = lease_ttl
+        self.max_fraction = max_fraction
+        self.clock = clock
+        self._leases: Dict[str, _Lease] = {}
+
+    def try_local(self, key: str) -> Optional[RateLimitDecision]:
+        """Decide from the local slice, or return None if a lease is needed."""
+        lease = self._leases.get(key)
+        if lease is None:
+            return None
+        now = self.clock()
+        if now < lease.denied_until:
+            return RateLimitDecision(False, lease.limit, 0, retry_after=lease.denied_until - now)
+        if lease.tokens > 0 and now < lease.expires_at:
+            lease.tokens -= 1
+            lease.used += 1
+            return RateLimitDecision(True, lease.limit, lease.tokens + lease.shared_remaining)
+        return None
+
+    def max_lease(self, limit: int, window_seconds: float) -> int:
+        rate_per_second = limit / window_seconds
+        return max(1, int(min(limit * self.max_fraction, rate_per_second * self.lease_ttl)))
+
+    def request_size(self, key: str, limit: int, window_seconds: float) -> int:
+        """
+        Tokens to ask for: double after a slice ran out before expiring,
+        otherwise what the last slice actually served.
+        """
+        lease = self._leases.get(key)
+        if lease is None:
+            size = 1
+        elif lease.tokens == 0 and self.clock() < lease.expires_at:
+            size = lease.size * 2
+        else:
+            size = lease.used
+        return min(max(1, size), self.max_lease(limit, window_seconds))
+
+    def apply(self, key: str, limit: int, granted: int, shared_tokens: float, retry_ms: int) -> RateLimitDecision:
+        """Record a lease reply and decide the request that triggered it."""
+        if len(self._leases) > LEASE_TABLE_PRUNE_SIZE:
+            self.prune()
+        now = self.clock()
+        lease = self._leases.setdefault(key, _Lease())
+        lease.limit = limit
+        lease.shared_remaining = int(shared_tokens)
+        if granted <= 0:
+            retry_after = retry_ms / 1000
+            lease.tokens = 0
+            lease.used = 0
+            lease.denied_until = now + min(retry_after, self.lease_ttl)
+            return RateLimitDecision(False, limit, 0, retry_after=retry_after)
+
+        lease.size = granted
+        lease.tokens = granted - 1
+        lease.used = 1
+        lease.expires_at = now + self.lease_ttl
+        lease.denied_until = 0.0
+        return RateLimitDecision(True, limit, lease.tokens + lease.shared_remaining)
+
+    def local_tokens(self, key: str) -> int:
+        lease = self._leases.get(key)
+        if lease is None or self.clock() >= lease.expires_at:
+            return 0
+        return lease.tokens
+
+    def remaining(self, key: str, limit: int) -> int:
+        lease = self._leases.get(key)
+        if lease is None:
+            return limit
+        return self.local_tokens(key) + lease.shared_remaining
+
+    def prune(self) -> None:
+        now = self.clock()
+        stale = [k for k, v in self._leases.items() if v.expires_at <= now and v.denied_until <= now]
+        for key in stale:
+            del self._leases[key]
+
+
+def _parse_lease_reply(reply) -> Tuple[int, float, int]:
+    granted, tokens, retry_ms = reply
+    return int(granted), float(tokens), int(retry_ms)
+
+
 class RateLimiter:
     """Token bucket rate limiter using Redis.
 
-    Provides per-key rate limiting with configurable RPM.
+    Provides per-key rate limiting with configurable RPM, served from
+    locally leased token slices (see module docstring).
     Falls back to allowing requests if Redis is unavailable.
     """
 
-    def __init__(self, redis_url: Optional[str] = None, fail_open: bool = True):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        fail_open: bool = True,
+        leases: Optional[LeaseTable] = None,
+    ):
         """Initialize rate limiter.
 
         Args:
             redis_url: Redis connection URL
             fail_open: If True, allow requests when Redis fails
+            leases: Lease bookkeeping (defaults to a fresh LeaseTable)
         """
         self.redis_url = redis_url or REDIS_URL
         self.fail_open = fail_open
         self._client = None
-        self._script_sha = None
+        self._script = None
+        self._leases = leases or LeaseTable()
+        self._lock = threading.Lock()
+        self._redis_down_until = 0.0
 
     def _get_client(self):
         """Lazy-load Redis client."""
@@ -74,8 +241,8 @@ class RateLimiter:
                 import redis
 
                 self._client = redis.from_url(self.redis_url)
-                # Pre-load the Lua script
-                self._script_sha = self._client.script_load(TOKEN_BUCKET_LUA)
+                # Script objects use EVALSHA and reload on NOSCRIPT
+                self._script = self._client.register_script(LEASE_BUCKET_LUA)
                 logger.info("rate_limiter_connected", extra={"url": self.redis_url[:20] + "..."})
             except ImportError:
                 logger.error("redis package not installed - pip install redis")
@@ -99,28 +266,35 @@ class RateLimiter:
             return True  # No limit configured
 
         bucket_key = f"rate:{key}"
-        now = int(time.time())
+
+        with self._lock:
+            decision = self._leases.try_local(bucket_key)
+            if decision is None:
+                size = self._leases.request_size(bucket_key, rate_per_min, 60)
+        if decision is not None:
+            return decision.allowed
+
+        if self._leases.clock() < self._redis_down_until:
+            return self.fail_open
 
         try:
             client = self._get_client()
             if client is None:
                 return self.fail_open
 
-            # Execute Lua script atomically
-            if self._script_sha:
-                result = client.evalsha(self._script_sha, 1, bucket_key, rate_per_min, now)
-            else:
-                result = client.eval(TOKEN_BUCKET_LUA, 1, bucket_key, rate_per_min, now)
+            # One atomic lease call covers this request and up to size - 1 more
+            reply = self._script(keys=[bucket_key], args=[rate_per_min, 60_000, size])
+            with self._lock:
+                decision = self._leases.apply(bucket_key, rate_per_min, *_parse_lease_reply(reply))
 
-            allowed = bool(result)
-
-            if not allowed:
+            if not decision.allowed:
                 logger.warning("rate_limited", extra={"key": key, "rate_per_min": rate_per_min})
 
-            return allowed
+            return decision.allowed
 
         except Exception as e:
             logger.error("rate_limiter_error", extra={"error": str(e), "key": key})
+            self._redis_down_until = self._leases.clock() + REDIS_RETRY_BACKOFF_SECONDS
             return self.fail_open
 
     def get_remaining(self, key: str, rate_per_min: int) -> int:
@@ -131,7 +305,7 @@ class RateLimiter:
             rate_per_min: Configured rate
 
         Returns:
-            Estimated remaining tokens
+            Estimated remaining tokens (local lease plus shared bucket)
         """
         bucket_key = f"rate:{key}"
         try:
@@ -144,12 +318,116 @@ class RateLimiter:
                 return rate_per_min
 
             tokens = float(data.get(b"tokens", rate_per_min))
-            return max(0, int(tokens))
+            with self._lock:
+                local = self._leases.local_tokens(bucket_key)
+            return max(0, int(tokens)) + local
 
         except Exception:
             return rate_per_min
 
 
+class LeasedRateLimiter:
+    """
+    Async leased token-bucket limiter shared by the API middleware and CARE routing.
+
+    Concurrent requests for the same key in one process share a single
+    in-flight lease call instead of each going to Redis.
+
+    Usage:
+        limiter = LeasedRateLimiter(redis_factory=get_redis, fail_open=True)
+        decision = await limiter.acquire(f"rl:{tenant_id}:{tier}", limit=300, window_seconds=60)
+        if not decision.allowed:
+            raise HTTPException(429, headers={"Retry-After": str(math.ceil(decision.retry_after))})
+    """
+
+    def __init__(
+        self,
+        redis_factory: Optional[Callable[[], Awaitable]] = None,
+        redis_url: Optional[str] = None,
+        fail_open: bool = True,
+        leases: Optional[LeaseTable] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            redis_factory: Coroutine returning an asyncio Redis client (shares the caller's pool)
+            redis_url: Redis URL when no factory is given
+            fail_open: If True, allow requests when Redis fails
+            leases: Lease bookkeeping (defaults to a fresh LeaseTable)
+        """
+        self.redis_url = redis_url or REDIS_URL
+        self.fail_open = fail_open
+        self._redis_factory = redis_factory
+        self._redis = None
+        self._script = None
+        self._leases = leases or LeaseTable()
+        self._refreshing: Dict[str, asyncio.Future] = {}
+        self._redis_down_until = 0.0
+
+    async def _get_script(self):
+        if self._redis_factory is not None:
+            redis = await self._redis_factory()
+        else:
+            if self._redis is None:
+                import redis.asyncio as aioredis
+
+                self._redis = aioredis.from_url(self.redis_url, socket_connect_timeout=5.0, socket_timeout=5.0)
+            redis = self._redis
+        if self._script is None or self._script.registered_client is not redis:
+            self._script = redis.register_script(LEASE_BUCKET_LUA)
+        return self._script
+
+    def _degraded(self, limit: int) -> RateLimitDecision:
+        if self.fail_open:
+            return RateLimitDecision(True, limit, limit, degraded=True)
+        return RateLimitDecision(False, limit, 0, retry_after=REDIS_RETRY_BACKOFF_SECONDS, degraded=True)
+
+    async def acquire(self, key: str, limit: int, window_seconds: float = 60) -> RateLimitDecision:
+        """
+        Take one token from the bucket at key.
+
+        Args:
+            key: Redis key of the shared bucket
+            limit: Bucket capacity (requests per window)
+            window_seconds: Time to refill an empty bucket
+
+        Returns:
+            RateLimitDecision
+        """
+        while True:
+            decision = self._leases.try_local(key)
+            if decision is not None:
+                return decision
+            pending = self._refreshing.get(key)
+            if pending is None:
+                break
+            # Another request is already leasing for this key; share its slice
+            await asyncio.shield(pending)
+
+        if self._leases.clock() < self._redis_down_until:
+            return self._degraded(limit)
+
+        size = self._leases.request_size(key, limit, window_seconds)
+        future = asyncio.get_running_loop().create_future()
+        self._refreshing[key] = future
+        try:
+            script = await self._get_script()
+            reply = await script(keys=[key], args=[limit, int(window_seconds * 1000), size])
+            return self._leases.apply(key, limit, *_parse_lease_reply(reply))
+        except Exception as e:
+            logger.warning("rate_limiter_error", extra={"error": str(e), "key": key})
+            self._redis_down_until = self._leases.clock() + REDIS_RETRY_BACKOFF_SECONDS
+            return self._degraded(limit)
+        finally:
+            del self._refreshing[key]
+            future.set_result(None)
+
+    def remaining(self, key: str, limit: int) -> int:
+        """Approximate tokens left as of this process's last lease (no Redis call)."""
+        return self._leases.remaining(key, limit)
+
+
 # Singleton instance
 _limiter: Optional[RateLimiter] = None
 
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: ai-console
+# Temporal:
+#   Trigger: manual
+#   Execution: async
+# Role: Activity listing benchmark: offset vs keyset pages, exact vs estimated vs cached counts
+# artifact_class: CODE
+"""
+Activity Pagination Benchmark
+
+Loads --rows synthetic runs for one tenant into a scratch schema on a
+Postgres database, then times ActivityReadDriver on them:
+
+- fetch_runs, page 1 and page --page (--limit rows per page), by
+  LIMIT/OFFSET and by (created_at, run_id) keyset
+- count_runs in exact, estimated and cached (warm) mode
+
+The scratch schema has a runs table with the columns the listings read,
+the indexes of migrations 086 and 135, and a v_runs_o2 view projecting
+them; the policy-context joins of the production view are left out, so
+the numbers isolate paging and counting cost. Offset pages are sorted by
+created_at as well, so both modes can use the same index.
+
+    python scripts/benchmark_activity_pagination.py --database-url postgresql://localhost/aos_bench
+    python scripts/benchmark_activity_pagination.py --rows 200000 --page 100 --keep
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+TENANT_ID = "tenant-bench"
+
+SETUP_SQL = [
+    "DROP SCHEMA IF EXISTS {schema} CASCADE",
+    "CREATE SCHEMA {schema}",
+    """
+    CREATE TABLE {schema}.runs (
+        id VARCHAR(64) PRIMARY KEY,
+        tenant_id VARCHAR(64) NOT NULL,
+        project_id VARCHAR(64),
+        is_synthetic BOOLEAN NOT NULL DEFAULT false,
+        source VARCHAR(16) NOT NULL,
+        provider_type VARCHAR(16) NOT NULL,
+        state VARCHAR(16) NOT NULL,
+        status VARCHAR(16) NOT NULL,
+        started_at TIMESTAMPTZ,
+        last_seen_at TIMESTAMPTZ,
+        completed_at TIMESTAMPTZ,
+        duration_ms DOUBLE PRECISION,
+        risk_level VARCHAR(16) NOT NULL,
+        latency_bucket VARCHAR(16) NOT NULL,
+        evidence_health VARCHAR(16) NOT NULL,
+        integrity_status VARCHAR(16) NOT NULL,
+        incident_count INTEGER NOT NULL DEFAULT 0,
+        policy_draft_count INTEGER NOT NULL DEFAULT 0,
+        policy_violation BOOLEAN NOT NULL DEFAULT false,
+        input_tokens INTEGER,
+        output_tokens INTEGER,
+        estimated_cost_usd NUMERIC(12, 6),
+        created_at TIMESTAMPTZ NOT NULL
+    )
+    """,
+    # Two runs per second going back from now; every 50th run still LIVE
+    """
+    INSERT INTO {schema}.runs
+    SELECT
+        'run-' || lpad(g::text, 10, '0'),
+        '{tenant_id}',
+        'project-' || (g % 20),
+        false,
+        (ARRAY['agent', 'human', 'sdk'])[1 + g % 3],
+        (ARRAY['openai', 'anthropic', 'internal'])[1 + g % 3],
+        CASE WHEN g % 50 = 0 THEN 'LIVE' ELSE 'COMPLETED' END,
+        CASE WHEN g % 50 = 0 THEN 'running' WHEN g % 17 = 0 THEN 'failed' ELSE 'succeeded' END,
+        ts,
+        ts + interval '2 seconds',
+        CASE WHEN g % 50 = 0 THEN NULL ELSE ts + interval '2 seconds' END,
+        2000 + g % 5000,
+        (ARRAY['NORMAL', 'NORMAL', 'NORMAL', 'NEAR_THRESHOLD', 'AT_RISK', 'VIOLATED'])[1 + g % 6],
+        (ARRAY['OK', 'OK', 'SLOW', 'STALLED'])[1 + g % 4],
+        (ARRAY['FLOWING', 'FLOWING', 'DEGRADED', 'MISSING'])[1 + g % 4],
+        'VERIFIED',
+        g % 7 / 6,
+        0,
+        g % 97 = 0,
+        100 + g % 900,
+        50 + g % 400,
+        (g % 1000) / 10000.0,
+        ts
+    FROM generate_series(1, {rows}) AS g,
+         LATERAL (SELECT now() - (g * interval '500 milliseconds') AS ts) t
+    """,
+    # 086_runs_o2_schema
+    "CREATE INDEX idx_runs_tenant_state_started ON {schema}.runs (tenant_id, state, started_at)",
+    # 135_runs_keyset_pagination
+    "CREATE INDEX idx_runs_tenant_created_id ON {schema}.runs (tenant_id, created_at, id)",
+    "CREATE INDEX idx_runs_tenant_state_created_id ON {schema}.runs (tenant_id, state, created_at, id)",
+    "ANALYZE {schema}.runs",
+    """
+    CREATE VIEW {schema}.v_runs_o2 AS
+    SELECT
+        id AS run_id, tenant_id, project_id, is_synthetic, source, provider_type,
+        state, status, started_at, last_seen_at, completed_at, duration_ms,
+        risk_level, latency_bucket, evidence_health, integrity_status,
+        incident_count, policy_draft_count, policy_violation,
+        input_tokens, output_tokens, estimated_cost_usd, created_at
+    FROM {schema}.runs
+    """,
+]
+
+
+def _async_url(url: str) -> str:
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+async def _median_ms(fn, runs: int) -> float:
+    await fn()  # warm up
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+async def run(args) -> dict:
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.hoc.cus.activity.L6_drivers import activity_read_driver
+    from app.hoc.cus.activity.L6_drivers.activity_read_driver import ActivityReadDriver
+
+    engine = create_async_engine(_async_url(args.database_url))
+    try:
+        t0 = time.perf_counter()
+        async with engine.begin() as conn:
+            for statement in SETUP_SQL:
+                await conn.execute(
+                    text(statement.format(schema=args.schema, rows=args.rows, tenant_id=TENANT_ID))
+                )
+        load_s = time.perf_counter() - t0
+
+        async with AsyncSession(engine) as session:
+            await session.execute(text(f"SET search_path TO {args.schema}"))
+            driver = ActivityReadDriver(session)
+            where_sql, params = "tenant_id = :tenant_id", {"tenant_id": TENANT_ID}
+            deep_offset = (args.page - 1) * args.limit
+
+            # Keyset of the last row before the deep page (setup, not timed)
+            boundary = (
+                await session.execute(
+                    text(
+                        "SELECT created_at, run_id FROM v_runs_o2 WHERE tenant_id = :tenant_id "
+                        "ORDER BY created_at DESC, run_id DESC LIMIT 1 OFFSET :offset"
+                    ),
+                    {**params, "offset": deep_offset - 1},
+                )
+            ).one()
+
+            def offset_page(offset):
+                return lambda: driver.fetch_runs(where_sql, params, "created_at", "DESC", args.limit, offset)
+
+            def keyset_page(after):
+                return lambda: driver.fetch_runs(
+                    where_sql, params, "created_at", "DESC", args.limit, 0, keyset=True, after=after
+                )
+
+            def count(mode):
+                return lambda: driver.count_runs(where_sql, params, mode)
+
+            result = {"load_s": round(load_s, 1)}
+            result["offset_page_1_ms"] = await _median_ms(offset_page(0), args.runs)
+            result[f"offset_page_{args.page}_ms"] = await _median_ms(offset_page(deep_offset), args.runs)
+            result["keyset_page_1_ms"] = await _median_ms(keyset_page(None), args.runs)
+            result[f"keyset_page_{args.page}_ms"] = await _median_ms(
+                keyset_page((boundary.created_at, boundary.run_id)), args.runs
+            )
+            for mode in activity_read_driver.COUNT_MODES:
+                result[f"count_{mode}_ms"] = await _median_ms(count(mode), args.runs)
+            result["count_exact"] = await driver.count_runs(where_sql, params, "exact")
+            result["count_estimated"] = await driver.count_runs(where_sql, params, "estimated")
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE"))
+        await engine.dispose()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Postgres URL (default: DATABASE_URL)")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Synthetic runs for the tenant")
+    parser.add_argument("--limit", type=int, default=50, help="Rows per page")
+    parser.add_argument("--page", type=int, default=1000, help="Deep page number")
+    parser.add_argument("--runs", type=int, default=20, help="Timed repetitions per measurement")
+    parser.add_argument("--schema", default="bench_activity_pagination", help="Scratch schema (dropped and recreated)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+    if args.page < 2 or (args.page - 1) * args.limit >= args.rows:
+        parser.error("--page must be >= 2 and within --rows")
+
+    print("Activity Pagination Benchmark")
+    print(f"Rows: {args.rows:,}  Limit: {args.limit}  Deep page: {args.page}  Runs: {args.runs}")
+    print("=" * 72)
+
+    result = asyncio.run(run(args))
+    print(f"  loaded in {result['load_s']}s")
+    for mode in ("offset", "keyset"):
+        print(
+            f"  {mode:<7} page 1: {result[f'{mode}_page_1_ms']:9.2f} ms   "
+            f"page {args.page}: {result[f'{mode}_page_{args.page}_ms']:9.2f} ms"
+        )
+    for mode in ("exact", "estimated", "cached"):
+        print(f"  count {mode:<10} {result[f'count_{mode}_ms']:9.2f} ms")
+    print(f"  exact total {result['count_exact']:,}  estimated total {result['count_estimated']:,}")
+
+    artifact_path = backend / "benchmark_activity_pagination.json"
+    with open(artifact_path, "w") as f:
+        # The URL may carry credentials
+        recorded = {k: v for k, v in vars(args).items() if k != "database_url"}
+        json.dump({"benchmark": "activity_pagination", "args": recorded, "median": result}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
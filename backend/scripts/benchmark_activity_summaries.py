@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: ai-console
+# Temporal:
+#   Trigger: manual
+#   Execution: async
+# Role: Activity summary benchmark: live COUNT(*) FILTER scans vs run_summary_buckets, by run count
+# artifact_class: CODE
+"""
+Activity Summary Benchmark
+
+Grows one tenant's run history in a scratch schema on a Postgres database
+and, at each size in --sizes, times the three dashboard summaries (status
+summary, metrics, dimension breakdown) two ways:
+
+- live:    the previous COUNT(*) / COUNT(*) FILTER queries over v_runs_o2
+- buckets: ActivityReadDriver, summing run_summary_buckets
+
+Runs are inserted in chunks through the migration 136 triggers, so the
+load rate includes bucket maintenance. Each step then moves --transitions
+LIVE runs to COMPLETED in one UPDATE and times it. At the end
+RunSummaryDriver.check_buckets() compares all buckets with the live
+aggregate (expected: no drift) and a reconcile pass over the last
+--reconcile-days days is timed.
+
+The scratch v_runs_o2 projects runs without the policy-context joins of the
+production view, so live timings are a lower bound.
+
+    python scripts/benchmark_activity_summaries.py --database-url postgresql://localhost/aos_bench
+    python scripts/benchmark_activity_summaries.py --sizes 100000,1000000 --keep
+"""
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+TENANT_ID = "tenant-bench"
+CHUNK = 100_000
+
+SETUP_SQL = [
+    "DROP SCHEMA IF EXISTS {schema} CASCADE",
+    "CREATE SCHEMA {schema}",
+    """
+    CREATE TABLE {schema}.runs (
+        id VARCHAR(64) PRIMARY KEY,
+        tenant_id VARCHAR(64),
+        project_id VARCHAR(36),
+        source VARCHAR(20) NOT NULL,
+        provider_type VARCHAR(30) NOT NULL,
+        state VARCHAR(20) NOT NULL,
+        status VARCHAR(32) NOT NULL,
+        risk_level VARCHAR(20) NOT NULL,
+        latency_bucket VARCHAR(20) NOT NULL,
+        evidence_health VARCHAR(20) NOT NULL,
+        integrity_status VARCHAR(20) NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL
+    )
+    """,
+    "CREATE INDEX idx_runs_tenant_created_id ON {schema}.runs (tenant_id, created_at, id)",
+    "CREATE INDEX idx_runs_tenant_state_created_id ON {schema}.runs (tenant_id, state, created_at, id)",
+    """
+    CREATE TABLE {schema}.limits (
+        id VARCHAR(64) PRIMARY KEY,
+        tenant_id VARCHAR(64) NOT NULL,
+        scope VARCHAR(16) NOT NULL,
+        limit_type VARCHAR(32) NOT NULL,
+        limit_category VARCHAR(16) NOT NULL,
+        status VARCHAR(16) NOT NULL
+    )
+    """,
+    f"""
+    INSERT INTO {{schema}}.limits VALUES
+        ('limit-cost', '{TENANT_ID}', 'TENANT', 'COST_USD', 'THRESHOLD', 'ACTIVE')
+    """,
+    """
+    CREATE VIEW {schema}.v_runs_o2 AS
+    SELECT
+        id AS run_id, tenant_id, project_id, source, provider_type, state, status,
+        risk_level, latency_bucket, evidence_health, integrity_status, created_at,
+        'COST'::text AS risk_type
+    FROM {schema}.runs
+    """,
+    """
+    CREATE TABLE {schema}.run_summary_buckets (
+        tenant_id VARCHAR NOT NULL,
+        bucket_date DATE NOT NULL,
+        project_id VARCHAR(36) NOT NULL,
+        state VARCHAR(20) NOT NULL,
+        status VARCHAR NOT NULL,
+        risk_level VARCHAR(20) NOT NULL,
+        latency_bucket VARCHAR(20) NOT NULL,
+        evidence_health VARCHAR(20) NOT NULL,
+        integrity_status VARCHAR(20) NOT NULL,
+        source VARCHAR(20) NOT NULL,
+        provider_type VARCHAR(30) NOT NULL,
+        run_count BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (tenant_id, bucket_date, project_id, state, status, risk_level,
+                     latency_bucket, evidence_health, integrity_status, source, provider_type)
+    )
+    """,
+]
+
+# Two runs per second going back from now; every 50th run still LIVE
+INSERT_SQL = """
+    INSERT INTO runs
+    SELECT
+        'run-' || lpad(g::text, 10, '0'),
+        :tenant_id,
+        CASE WHEN g % 11 = 0 THEN NULL ELSE 'project-' || (g % 20) END,
+        (ARRAY['agent', 'human', 'sdk'])[1 + g % 3],
+        (ARRAY['openai', 'anthropic', 'internal'])[1 + g % 3],
+        CASE WHEN g % 50 = 0 THEN 'LIVE' ELSE 'COMPLETED' END,
+        CASE WHEN g % 50 = 0 THEN 'running' WHEN g % 17 = 0 THEN 'failed' ELSE 'succeeded' END,
+        (ARRAY['NORMAL', 'NORMAL', 'NORMAL', 'NEAR_THRESHOLD', 'AT_RISK', 'VIOLATED'])[1 + g % 6],
+        (ARRAY['OK', 'OK', 'SLOW', 'STALLED'])[1 + g % 4],
+        (ARRAY['FLOWING', 'FLOWING', 'DEGRADED', 'MISSING'])[1 + g % 4],
+        'VERIFIED',
+        now() - (g * interval '500 milliseconds')
+    FROM generate_series(:lo, :hi) AS g
+"""
+
+TRANSITION_SQL = """
+    UPDATE runs SET state = 'COMPLETED', status = 'succeeded'
+    WHERE id IN (
+        SELECT id FROM runs WHERE tenant_id = :tenant_id AND state = 'LIVE'
+        ORDER BY created_at DESC LIMIT :n
+    )
+"""
+
+# The summary queries before run_summary_buckets
+LIVE_SQL = {
+    "status_summary": """
+        SELECT status, COUNT(*) as count FROM v_runs_o2
+        WHERE tenant_id = :tenant_id GROUP BY status ORDER BY count DESC
+    """,
+    "metrics": """
+        SELECT
+            COUNT(*) FILTER (WHERE risk_level = 'AT_RISK'),
+            COUNT(*) FILTER (WHERE risk_level = 'VIOLATED'),
+            COUNT(*) FILTER (WHERE risk_level = 'NEAR_THRESHOLD'),
+            COUNT(*) FILTER (WHERE risk_level != 'NORMAL'),
+            COUNT(*) FILTER (WHERE state = 'LIVE'),
+            COUNT(*) FILTER (WHERE state = 'COMPLETED'),
+            COUNT(*) FILTER (WHERE evidence_health = 'FLOWING'),
+            COUNT(*) FILTER (WHERE evidence_health = 'DEGRADED'),
+            COUNT(*) FILTER (WHERE evidence_health = 'MISSING'),
+            COUNT(*) FILTER (WHERE risk_type = 'COST'),
+            COUNT(*) FILTER (WHERE risk_type = 'TIME'),
+            COUNT(*) FILTER (WHERE risk_type = 'TOKENS'),
+            COUNT(*) FILTER (WHERE risk_type = 'RATE')
+        FROM v_runs_o2 WHERE tenant_id = :tenant_id
+    """,
+    "dimension_breakdown": """
+        SELECT COALESCE(risk_level::text, 'unknown') as value, COUNT(*) as count FROM v_runs_o2
+        WHERE tenant_id = :tenant_id AND state = :state GROUP BY risk_level ORDER BY count DESC LIMIT 20
+    """,
+}
+
+
+def _load_migration():
+    path = backend / "alembic" / "versions" / "136_run_summary_buckets.py"
+    spec = importlib.util.spec_from_file_location("run_summary_buckets_migration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _async_url(url: str) -> str:
+    for prefix in ("postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
+
+async def _median_ms(fn, runs: int) -> float:
+    await fn()  # warm up
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return round(statistics.median(samples), 2)
+
+
+async def run(args, sizes: list[int]) -> dict:
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.hoc.cus.activity.L6_drivers.activity_read_driver import ActivityReadDriver
+    from app.hoc.cus.activity.L6_drivers.run_summary_driver import RunSummaryDriver
+
+    migration = _load_migration()
+    # Every pooled connection resolves runs, limits and buckets in the scratch schema
+    engine = create_async_engine(
+        _async_url(args.database_url), connect_args={"server_settings": {"search_path": args.schema}}
+    )
+    where_sql, params = "tenant_id = :tenant_id", {"tenant_id": TENANT_ID}
+    steps = []
+    try:
+        async with engine.begin() as conn:
+            for statement in SETUP_SQL:
+                await conn.execute(text(statement.format(schema=args.schema)))
+            await conn.execute(text(migration.APPLY_FUNCTION_SQL))
+            # One statement per round trip (asyncpg prepares each one)
+            for statement in migration.TRIGGERS_SQL.split(";"):
+                if statement.strip():
+                    await conn.execute(text(statement))
+
+        async with AsyncSession(engine) as session:
+            driver = ActivityReadDriver(session)
+            loaded = 0
+            for size in sizes:
+                t0 = time.perf_counter()
+                for lo in range(loaded + 1, size + 1, CHUNK):
+                    await session.execute(
+                        text(INSERT_SQL), {"tenant_id": TENANT_ID, "lo": lo, "hi": min(lo + CHUNK - 1, size)}
+                    )
+                    await session.commit()
+                load_s = time.perf_counter() - t0
+                step = {"runs": size, "insert_rows_per_s": round((size - loaded) / load_s)}
+                loaded = size
+                await session.execute(text("ANALYZE runs"))
+                await session.execute(text("ANALYZE run_summary_buckets"))
+
+                t0 = time.perf_counter()
+                await session.execute(text(TRANSITION_SQL), {"tenant_id": TENANT_ID, "n": args.transitions})
+                await session.commit()
+                step["transition_ms"] = round((time.perf_counter() - t0) * 1000, 2)
+
+                step["buckets"] = (
+                    await session.execute(text("SELECT COUNT(*) FROM run_summary_buckets"))
+                ).scalar()
+                for name, sql in LIVE_SQL.items():
+                    live_params = {**params, "state": "COMPLETED"}
+
+                    async def live(sql=sql, live_params=live_params):
+                        (await session.execute(text(sql), live_params)).all()
+
+                    step[f"live_{name}_ms"] = await _median_ms(live, args.runs)
+                step["buckets_status_summary_ms"] = await _median_ms(
+                    lambda: driver.fetch_status_summary(where_sql, params), args.runs
+                )
+                step["buckets_metrics_ms"] = await _median_ms(lambda: driver.fetch_metrics(where_sql, params), args.runs)
+                step["buckets_dimension_breakdown_ms"] = await _median_ms(
+                    lambda: driver.fetch_dimension_breakdown(
+                        "risk_level", where_sql + " AND state = :state", {**params, "state": "COMPLETED"}, 20
+                    ),
+                    args.runs,
+                )
+                await session.rollback()
+                steps.append(step)
+
+            summary_driver = RunSummaryDriver(session)
+            oldest = datetime.now(timezone.utc).date() - timedelta(days=3650)
+            drift = await summary_driver.check_buckets(oldest, TENANT_ID)
+            await session.rollback()
+
+            since = datetime.now(timezone.utc).date() - timedelta(days=args.reconcile_days - 1)
+            t0 = time.perf_counter()
+            corrected = await summary_driver.repair_buckets(since, TENANT_ID)
+            await session.commit()
+            reconcile_ms = round((time.perf_counter() - t0) * 1000, 2)
+    finally:
+        if not args.keep:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP SCHEMA IF EXISTS {args.schema} CASCADE"))
+        await engine.dispose()
+    return {"steps": steps, "drifted_buckets": len(drift), "reconcile_ms": reconcile_ms, "reconciled": corrected}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Postgres URL (default: DATABASE_URL)")
+    parser.add_argument("--sizes", default="100000,1000000,5000000", help="Run counts to measure at (ascending)")
+    parser.add_argument("--transitions", type=int, default=1000, help="LIVE runs completed per step (one UPDATE)")
+    parser.add_argument("--reconcile-days", type=int, default=2, help="Days covered by the timed reconcile pass")
+    parser.add_argument("--runs", type=int, default=10, help="Timed repetitions per measurement")
+    parser.add_argument("--schema", default="bench_activity_summaries", help="Scratch schema (dropped and recreated)")
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema afterwards")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("--database-url or DATABASE_URL is required")
+    sizes = [int(s) for s in args.sizes.split(",")]
+    if sizes != sorted(sizes) or sizes[0] <= 0:
+        parser.error("--sizes must be positive and ascending")
+
+    print("Activity Summary Benchmark")
+    print(f"Sizes: {', '.join(f'{s:,}' for s in sizes)}  Runs: {args.runs}")
+    print("=" * 72)
+
+    result = asyncio.run(run(args, sizes))
+    for step in result["steps"]:
+        print(
+            f"  {step['runs']:>10,} runs  {step['buckets']:>6,} buckets  "
+            f"insert {step['insert_rows_per_s']:>9,} rows/s  {args.transitions} transitions {step['transition_ms']:8.2f} ms"
+        )
+        for name in LIVE_SQL:
+            print(
+                f"      {name:<20} live {step[f'live_{name}_ms']:9.2f} ms   "
+                f"buckets {step[f'buckets_{name}_ms']:7.2f} ms"
+            )
+    print(f"  drifted buckets: {result['drifted_buckets']}")
+    print(f"  reconcile ({args.reconcile_days} days): {result['reconcile_ms']:.2f} ms, {result['reconciled']} corrected")
+
+    artifact_path = backend / "benchmark_activity_summaries.json"
+    with open(artifact_path, "w") as f:
+        # The URL may carry credentials
+        recorded = {k: v for k, v in vars(args).items() if k != "database_url"}
+        json.dump({"benchmark": "activity_summaries", "args": recorded, "median": result}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
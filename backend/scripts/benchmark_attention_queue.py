@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: ai-console
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Attention queue benchmark: top-K heap updates vs re-scoring every signal, at 1M signals/tenant/day
+# artifact_class: CODE
+"""
+Attention Queue Benchmark
+
+Replays one tenant-day of activity signals (--signals, default 1,000,000,
+created evenly over 24 hours with a VIOLATED/AT_RISK/NEAR_THRESHOLD/NORMAL
+mix) through a TenantAttentionQueue, interleaved with operator feedback
+(ack, suppress for 15-1440 minutes, reopen) on --fingerprints fingerprints
+and console snapshots of the top --top-k.
+
+Reported:
+- observe: signals/s and p50/p99 per signal (one O(log K) heap update)
+- feedback: p50/p99 per acknowledge/suppress/reopen
+- snapshot: p50/p99 of the top-K read
+- rescore: p50/p99 of the previous approach at the same points, scoring
+  every signal of the day and taking the top K (heapq.nlargest)
+- rebuilds: snapshots preceded by a database rebuild, scheduled (every
+  ATTENTION_REBUILD_SECONDS of signal time) or forced (inexact top K, or
+  lifted feedback that could bring back a top-K signal). Rebuilds are
+  simulated from the in-memory signal list, so their cost is not included.
+
+At the end the queue's top K is compared with brute-force scoring
+(expected: identical).
+
+    python scripts/benchmark_attention_queue.py
+    python scripts/benchmark_attention_queue.py --signals 200000 --snapshot-every 1000
+"""
+
+import argparse
+import heapq
+import json
+import math
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+RISK_MIX = (("VIOLATED", 0.05), ("AT_RISK", 0.15), ("NEAR_THRESHOLD", 0.3), ("NORMAL", 0.5))
+
+
+def _percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"p50_us": 0.0, "p99_us": 0.0, "count": 0}
+    ordered = sorted(samples)
+    return {
+        "p50_us": round(statistics.median(ordered) * 1e6, 2),
+        "p99_us": round(ordered[int(len(ordered) * 0.99) - 1 if len(ordered) >= 100 else -1] * 1e6, 2),
+        "count": len(ordered),
+    }
+
+
+def _signals(args, start: datetime):
+    from app.hoc.cus.activity.L5_engines.attention_ranking import AttentionCandidate
+
+    rng = random.Random(args.seed)
+    levels = [level for level, _ in RISK_MIX]
+    weights = [weight for _, weight in RISK_MIX]
+    step = 86400 / args.signals
+    for i in range(args.signals):
+        run_id = f"run-{i:08d}"
+        level = rng.choices(levels, weights)[0]
+        yield AttentionCandidate(
+            run_id=run_id,
+            signal_id=f"sig-{run_id[:8]}",
+            fingerprint=f"fp-{rng.randrange(args.fingerprints)}",
+            signal_type="COST_RISK",
+            dimension="COST",
+            title="COST_RISK",
+            description=f"Run {run_id} has COST_RISK signal ({level})",
+            risk_level=level,
+            created_at=start + timedelta(seconds=i * step),
+        )
+
+
+def _brute_force(signals, feedback, now, k):
+    """Top k run_ids by scoring every signal under the current feedback."""
+    from app.hoc.cus.activity.L5_engines.attention_ranking import ACK_DAMPENER, TenantAttentionQueue
+
+    queue = TenantAttentionQueue(top_k=k)
+    scored = []
+    for c in signals:
+        state, expires_at = feedback.get(c.fingerprint, (None, None))
+        if expires_at is not None and expires_at <= now:
+            state = None
+        if state == "SUPPRESSED":
+            continue
+        key = queue.base_key(c) + (math.log(ACK_DAMPENER) if state == "ACKNOWLEDGED" else 0.0)
+        scored.append((key, c.run_id))
+    scored.sort(key=lambda entry: (-entry[0], entry[1]))
+    return [run_id for _, run_id in scored[:k]]
+
+
+def run(args) -> dict:
+    from app.hoc.cus.activity.L5_engines.attention_ranking import (
+        ACK_DAMPENER,
+        ATTENTION_HALF_LIFE_HOURS,
+        ATTENTION_REBUILD_SECONDS,
+        TenantAttentionQueue,
+        decay_rate,
+    )
+
+    rng = random.Random(args.seed + 1)
+    start = datetime(2026, 10, 18, tzinfo=timezone.utc)
+    queue = TenantAttentionQueue(top_k=args.top_k)
+    queue.rebuilt_at = start
+    day: list = []
+    feedback: dict[str, tuple[str, datetime | None]] = {}
+    observe_s: list[float] = []
+    feedback_s: list[float] = []
+    snapshot_s: list[float] = []
+    rescore_s: list[float] = []
+    rebuilds = {"scheduled": 0, "forced": 0}
+    log_ack = math.log(ACK_DAMPENER)
+
+    def rebuild(now):
+        fresh = TenantAttentionQueue(top_k=args.top_k)
+        fresh.load_feedback(
+            (
+                {"signal_fingerprint": fingerprint, "feedback_state": state, "expires_at": expires_at}
+                for fingerprint, (state, expires_at) in feedback.items()
+            ),
+            now,
+        )
+        for c in day:
+            fresh.observe(c, now)
+        fresh.rebuilt_at = now
+        return fresh
+
+    ingest_started = time.perf_counter()
+    for i, candidate in enumerate(_signals(args, start)):
+        now = candidate.created_at
+        day.append(candidate)
+        t0 = time.perf_counter()
+        queue.observe(candidate, now)
+        observe_s.append(time.perf_counter() - t0)
+
+        if rng.random() < args.feedback_rate:
+            fingerprint = f"fp-{rng.randrange(args.fingerprints)}"
+            roll = rng.random()
+            if roll < 0.6:
+                state, expires_at = "ACKNOWLEDGED", None
+            elif roll < 0.9:
+                state, expires_at = "SUPPRESSED", now + timedelta(minutes=rng.randint(15, 1440))
+            else:
+                state, expires_at = "REOPENED", None
+            t0 = time.perf_counter()
+            queue.apply_feedback(fingerprint, state, expires_at)
+            feedback_s.append(time.perf_counter() - t0)
+            if state == "REOPENED":
+                feedback.pop(fingerprint, None)
+            else:
+                feedback[fingerprint] = (state, expires_at)
+
+        if (i + 1) % args.snapshot_every == 0:
+            if (now - queue.rebuilt_at).total_seconds() >= ATTENTION_REBUILD_SECONDS:
+                rebuilds["scheduled"] += 1
+                queue = rebuild(now)
+            elif queue.needs_rebuild(now):
+                rebuilds["forced"] += 1
+                queue = rebuild(now)
+            t0 = time.perf_counter()
+            queue.snapshot(now, limit=args.top_k)
+            snapshot_s.append(time.perf_counter() - t0)
+            if len(rescore_s) < args.rescore_samples:
+                # Previous approach: score every signal, take the top K
+                t0 = time.perf_counter()
+                shift = now.timestamp() * decay_rate(ATTENTION_HALF_LIFE_HOURS)
+                heapq.nlargest(
+                    args.top_k,
+                    (
+                        (queue.base_key(c) + (log_ack if feedback.get(c.fingerprint, ("",))[0] == "ACKNOWLEDGED" else 0.0) - shift, c.run_id)
+                        for c in day
+                        if feedback.get(c.fingerprint, ("",))[0] != "SUPPRESSED"
+                    ),
+                )
+                rescore_s.append(time.perf_counter() - t0)
+    ingest_s = time.perf_counter() - ingest_started
+
+    end = day[-1].created_at
+    if queue.needs_rebuild(end):
+        queue = rebuild(end)
+    items, _ = queue.snapshot(end, limit=args.top_k)
+    expected = _brute_force(day, feedback, end, args.top_k)
+    return {
+        "signals": args.signals,
+        "observe_signals_per_s": round(args.signals / sum(observe_s)),
+        "ingest_wall_s": round(ingest_s, 2),
+        "observe": _percentiles(observe_s),
+        "feedback": _percentiles(feedback_s),
+        "snapshot": _percentiles(snapshot_s),
+        "rescore": _percentiles(rescore_s),
+        "rebuilds": rebuilds,
+        "snapshots": len(snapshot_s),
+        "heap_size": len(queue),
+        "matches_brute_force": [item.source_run_id for item in items] == expected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--signals", type=int, default=1_000_000, help="Signals in the tenant-day")
+    parser.add_argument("--top-k", type=int, default=100, help="Attention queue size")
+    parser.add_argument("--fingerprints", type=int, default=1000, help="Distinct signal fingerprints")
+    parser.add_argument("--feedback-rate", type=float, default=0.001, help="Feedback actions per signal")
+    parser.add_argument("--snapshot-every", type=int, default=10_000, help="Signals between console snapshots")
+    parser.add_argument("--rescore-samples", type=int, default=20, help="Snapshots also timed with full re-scoring")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if args.signals <= 0 or args.top_k <= 0 or args.snapshot_every <= 0:
+        parser.error("--signals, --top-k and --snapshot-every must be positive")
+
+    print("Attention Queue Benchmark")
+    print(
+        f"Signals: {args.signals:,}  Top-K: {args.top_k}  Fingerprints: {args.fingerprints}  "
+        f"Feedback rate: {args.feedback_rate}  Snapshot every: {args.snapshot_every:,}"
+    )
+    print("=" * 72)
+
+    result = run(args)
+    print(f"  observe   {result['observe_signals_per_s']:>10,} signals/s  (ingest wall {result['ingest_wall_s']} s)")
+    for name in ("observe", "feedback", "snapshot", "rescore"):
+        stats = result[name]
+        print(f"  {name:<9} p50 {stats['p50_us']:>12,.2f} us   p99 {stats['p99_us']:>12,.2f} us   n={stats['count']:,}")
+    rebuilds = result["rebuilds"]
+    print(
+        f"  rebuilds  {rebuilds['scheduled']} scheduled, {rebuilds['forced']} forced, "
+        f"of {result['snapshots']} snapshots   heap size {result['heap_size']}"
+    )
+    print(f"  top-K matches brute force: {result['matches_brute_force']}")
+
+    artifact_path = backend / "benchmark_attention_queue.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "attention_queue", "args": vars(args), "results": result}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
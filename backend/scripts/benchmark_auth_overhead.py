@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: async
+# Role: Machine auth benchmark: per-request AuthGateway overhead with and without the validated API key cache
+# artifact_class: CODE
+"""
+Machine Auth Overhead Benchmark
+
+Drives --requests API-key authentications (default 20,000) through
+AuthGateway → ApiKeyEngine, --concurrency at a time, spread over --keys
+distinct keys. The API key driver is simulated: every call sleeps
+--db-latency-ms in the default thread pool, as ApiKeyDriver's
+synchronous session work does.
+
+Modes:
+- per_request: no cache, usage flushed after every request (one lookup
+  and one usage write per request, as before the cache)
+- batched_usage: no cache, usage flushed every --flush-every requests
+- cached: validated-key cache (--ttl seconds) and batched usage
+
+Reported per mode: auth latency p50/p99 per request, throughput, and
+driver calls per request.
+
+    python scripts/benchmark_auth_overhead.py
+    python scripts/benchmark_auth_overhead.py --db-latency-ms 3 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import statistics
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+
+def _percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"p50_us": 0.0, "p99_us": 0.0, "count": 0}
+    ordered = sorted(samples)
+    return {
+        "p50_us": round(statistics.median(ordered) * 1e6, 2),
+        "p99_us": round(ordered[max(0, int(len(ordered) * 0.99) - 1)] * 1e6, 2),
+        "count": len(ordered),
+    }
+
+
+class SimulatedDriver:
+    """ApiKeyDriver stand-in with a fixed per-call database latency."""
+
+    def __init__(self, rows: dict, latency_s: float):
+        self._rows = rows
+        self._latency_s = latency_s
+        self.calls = 0
+
+    def fetch_key_by_hash(self, key_hash):
+        self.calls += 1
+        time.sleep(self._latency_s)
+        return self._rows.get(key_hash)
+
+    def record_usage_bulk(self, usage):
+        self.calls += 1
+        time.sleep(self._latency_s)
+        return len(usage)
+
+
+def _rows(keys: int) -> tuple[list[str], dict]:
+    from app.auth.api_key_driver import KeyRow
+
+    template = KeyRow(
+        id="",
+        name="bench",
+        key_prefix="aos_bench",
+        tenant_id="t-bench",
+        user_id=None,
+        status="active",
+        permissions_json='["run:*", "read:*"]',
+        rate_limit_rpm=1000,
+        is_valid=True,
+        created_at=None,
+        last_used_at=None,
+        total_requests=0,
+        expires_at=None,
+        revoked_at=None,
+        revoked_reason=None,
+    )
+    api_keys = [f"aos_bench_{n:06d}" for n in range(keys)]
+    rows = {
+        hashlib.sha256(key.encode()).hexdigest(): replace(template, id=f"key-{n}") for n, key in enumerate(api_keys)
+    }
+    return api_keys, rows
+
+
+async def run_mode(mode: str, args, api_keys: list[str], rows: dict) -> dict:
+    from app.auth.api_key_engine import ApiKeyEngine
+    from app.auth.contexts import MachineCapabilityContext
+    from app.auth.gateway import AuthGateway
+
+    driver = SimulatedDriver(rows, args.db_latency_ms / 1000)
+    engine = ApiKeyEngine(
+        driver=driver,
+        redis_client=None,
+        cache_ttl=args.ttl if mode == "cached" else 0,
+    )
+    gateway = AuthGateway(api_key_service=engine)
+    flush_every = 1 if mode == "per_request" else args.flush_every
+    rng = random.Random(args.seed)
+    order = [rng.choice(api_keys) for _ in range(args.requests)]
+    latencies: list[float] = []
+    rejected = 0
+    done = 0
+
+    async def worker(keys: list[str]):
+        nonlocal rejected, done
+        for key in keys:
+            start = time.perf_counter()
+            result = await gateway.authenticate(None, key)
+            done += 1
+            if flush_every == 1:
+                await engine.flush_usage()
+            latencies.append(time.perf_counter() - start)
+            if not isinstance(result, MachineCapabilityContext):
+                rejected += 1
+            if flush_every > 1 and done % flush_every == 0:
+                await engine.flush_usage()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(order[i :: args.concurrency]) for i in range(args.concurrency)))
+    await engine.flush_usage()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "auth": _percentiles(latencies),
+        "requests_per_second": round(args.requests / elapsed, 1),
+        "driver_calls_per_request": round(driver.calls / args.requests, 4),
+        "rejected": rejected,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="Authentications per mode")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight")
+    parser.add_argument("--keys", type=int, default=200, help="Distinct API keys")
+    parser.add_argument("--db-latency-ms", type=float, default=1.0, help="Simulated latency per driver call")
+    parser.add_argument("--ttl", type=float, default=5.0, help="Cache TTL in cached mode")
+    parser.add_argument("--flush-every", type=int, default=1_000, help="Requests between usage flushes")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if args.requests <= 0 or args.concurrency <= 0 or args.keys <= 0 or args.flush_every <= 1:
+        parser.error("--requests, --concurrency and --keys must be positive and --flush-every above 1")
+
+    print("Machine Auth Overhead Benchmark")
+    print(
+        f"Requests: {args.requests:,}  Concurrency: {args.concurrency}  Keys: {args.keys}  "
+        f"DB latency: {args.db_latency_ms} ms  TTL: {args.ttl}s"
+    )
+    print("=" * 72)
+
+    api_keys, rows = _rows(args.keys)
+    results = {}
+    for mode in ("per_request", "batched_usage", "cached"):
+        result = asyncio.run(run_mode(mode, args, api_keys, rows))
+        results[mode] = result
+        print(
+            f"  {mode:<14} p50 {result['auth']['p50_us']:>10,.2f} us   p99 {result['auth']['p99_us']:>10,.2f} us   "
+            f"{result['requests_per_second']:>10,.1f} req/s   "
+            f"{result['driver_calls_per_request']:.4f} driver calls/req"
+        )
+
+    artifact_path = backend / "benchmark_auth_overhead.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "auth_overhead", "args": vars(args), "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: ai-console
+# Temporal:
+#   Trigger: manual
+#   Execution: async
+# Role: Dashboard load benchmark: N individual read requests vs one batch request
+# artifact_class: CODE
+"""
+Batch Dispatch Benchmark
+
+Models a console page that issues --ops read operations on load, and times
+the page two ways through the same OperationRegistry:
+
+- individual: one HTTP request per operation, --client-concurrency at a time
+  (browsers allow ~6 connections per host); every request pays the
+  per-request cost (auth, tenant, RBAC, session checkout) and gets its own
+  session.
+- batch:      one POST with all operations; OperationRegistry.execute_many()
+  runs them concurrently over --lanes sessions sharing one snapshot.
+
+Handlers issue --statements statements of --rtt-ms each through ctx.session
+and wait --io-ms off the database (cache / HTTP). Statements on one session
+never overlap, as on a real AsyncSession; --lanes 1 shows the cost of
+funnelling a whole page through a single connection.
+
+Requests go through httpx's ASGI transport, so no server or database is
+needed:
+
+    python scripts/benchmark_batch_dispatch.py
+    python scripts/benchmark_batch_dispatch.py --ops 15 --rtt-ms 2 --io-ms 8 --lanes 1
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+
+class SimulatedResult:
+    def scalar_one(self):
+        return "00000003-0000001B-1"
+
+
+class SimulatedSession:
+    """Postgres AsyncSession stand-in: every statement costs one round trip."""
+
+    def __init__(self, rtt_s: float):
+        self._rtt_s = rtt_s
+        self._busy = False
+        self.statements = 0
+
+    def in_transaction(self) -> bool:
+        return False
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    async def execute(self, *args, **kwargs):
+        # A real AsyncSession cannot run two statements at once
+        assert not self._busy, "concurrent statements on one session"
+        self._busy = True
+        try:
+            await asyncio.sleep(self._rtt_s)
+            self.statements += 1
+            return SimulatedResult()
+        finally:
+            self._busy = False
+
+    async def rollback(self):
+        await asyncio.sleep(self._rtt_s)
+
+
+def build_app(args):
+    from fastapi import Depends, FastAPI, Request
+
+    from app.hoc.api.cus.overview import overview_batch
+    from app.hoc.cus.hoc_spine.orchestrator.operation_registry import (
+        OperationContext,
+        OperationRegistry,
+        OperationResult,
+    )
+
+    rtt_s = args.rtt_ms / 1000
+    registry = OperationRegistry()
+
+    class SimulatedReadHandler:
+        async def execute(self, ctx):
+            for _ in range(args.statements):
+                await ctx.session.execute("SELECT 1")
+            await asyncio.sleep(args.io_ms / 1000)
+            return OperationResult.ok({"method": ctx.params["method"]})
+
+    operations = sorted(overview_batch.BATCHABLE_READS)
+    for operation in operations:
+        registry.register(operation, SimulatedReadHandler())
+
+    async def session_dep():
+        await asyncio.sleep(args.checkout_ms / 1000)
+        yield SimulatedSession(rtt_s)
+
+    @asynccontextmanager
+    async def session_factory():
+        await asyncio.sleep(args.checkout_ms / 1000)
+        yield SimulatedSession(rtt_s)
+
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def request_cost(request, call_next):
+        # Auth, tenant resolution and RBAC for every request
+        await asyncio.sleep(args.request_ms / 1000)
+        return await call_next(request)
+
+    @app.get("/cus/op/{operation}/{method}")
+    async def single(operation: str, method: str, request: Request, session=Depends(session_dep)):
+        result = await registry.execute(
+            operation,
+            OperationContext(session=session, tenant_id="tenant-bench", params={"method": method}),
+        )
+        return {"success": result.success, "data": result.data}
+
+    async def allow(resource, action, request):
+        return type("Decision", (), {"allowed": True, "reason": None})()
+
+    overview_batch.get_operation_registry = lambda: registry
+    overview_batch.get_tenant_id_from_auth = lambda request: "tenant-bench"
+    overview_batch.check_permission_request = allow
+    overview_batch.get_read_session_factory = lambda: session_factory
+    overview_batch.BATCH_SESSION_LANES = args.lanes
+    app.include_router(overview_batch.router)
+    app.dependency_overrides[overview_batch.get_session_dep] = session_dep
+
+    items = []
+    for i in range(args.ops):
+        operation = operations[i % len(operations)]
+        method = sorted(overview_batch.BATCHABLE_READS[operation][2])[0]
+        items.append({"operation": operation, "method": method})
+    return app, items
+
+
+async def load_individual(client, items, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(item):
+        async with semaphore:
+            response = await client.get(f"/cus/op/{item['operation']}/{item['method']}")
+            assert response.status_code == 200 and response.json()["success"], response.text
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(fetch(item) for item in items))
+    return time.perf_counter() - t0
+
+
+async def load_batch(client, items) -> float:
+    t0 = time.perf_counter()
+    response = await client.post("/cus/overview/batch", json={"items": items})
+    assert response.status_code == 200, response.text
+    assert response.json()["failed"] == 0, response.text
+    return time.perf_counter() - t0
+
+
+async def run(args) -> dict:
+    import httpx
+
+    app, items = build_app(args)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up routing / validation
+        await load_individual(client, items, args.client_concurrency)
+        await load_batch(client, items)
+
+        individual = [await load_individual(client, items, args.client_concurrency) for _ in range(args.runs)]
+        batch = [await load_batch(client, items) for _ in range(args.runs)]
+
+    return {
+        "individual_ms": round(statistics.median(individual) * 1000, 2),
+        "batch_ms": round(statistics.median(batch) * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--ops", type=int, default=15, help="Read operations per page load")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--client-concurrency", type=int, default=6, help="Parallel requests (individual mode)")
+    parser.add_argument("--request-ms", type=float, default=4.0, help="Per-request auth/tenant/RBAC cost")
+    parser.add_argument("--checkout-ms", type=float, default=1.0, help="Session checkout per request")
+    parser.add_argument("--statements", type=int, default=2, help="Statements per operation")
+    parser.add_argument("--rtt-ms", type=float, default=1.5, help="Database round trip per statement")
+    parser.add_argument("--io-ms", type=float, default=8.0, help="Off-database wait per operation")
+    parser.add_argument("--lanes", type=int, default=4, help="Sessions per batch (BATCH_SESSION_LANES)")
+    args = parser.parse_args()
+
+    print("Batch Dispatch Benchmark")
+    print(
+        f"Ops: {args.ops}  Runs: {args.runs}  Client concurrency: {args.client_concurrency}  "
+        f"request {args.request_ms}ms  checkout {args.checkout_ms}ms  "
+        f"{args.statements}x{args.rtt_ms}ms statements  io {args.io_ms}ms  lanes {args.lanes}"
+    )
+    print("=" * 72)
+
+    result = asyncio.run(run(args))
+    print(f"  individual requests: {result['individual_ms']:8.2f} ms per page")
+    print(f"  one batch request:   {result['batch_ms']:8.2f} ms per page")
+    print(f"  speedup:             {result['individual_ms'] / result['batch_ms']:8.2f}x")
+
+    artifact_path = backend / "benchmark_batch_dispatch.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "batch_dispatch", "args": vars(args), "median": result}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
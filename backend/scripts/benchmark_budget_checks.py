@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Budget check benchmark: enforce_budget latency vs cost rows today
+# artifact_class: CODE
+"""
+Budget Check Benchmark
+
+Measures BudgetTracker.enforce_budget latency as one agent's llm_costs rows
+for today grow, against the previous status lookup (agent row by primary
+key, then SUM(cost_cents) over today's llm_costs rows for the agent).
+
+The first cost row goes through BudgetTracker.record_cost; the rest are
+bulk-inserted at zero cost, so the daily counter stays exact. Each step
+also runs reconcile_daily_spend and reports any corrections (expected 0).
+Decision-record emission is stubbed out so only the budget check is timed.
+
+Needs a Postgres DATABASE_URL (or --database-url). Everything runs in a
+scratch schema that is dropped afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_budget_checks.py
+    python scripts/benchmark_budget_checks.py --rows 0,1000,10000,100000 --iterations 500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+SCHEMA = "bench_budget_checks"
+AGENT_ID = "agent_bench"
+
+SCRATCH_TABLES = """
+    CREATE TABLE agents (
+        id VARCHAR(64) PRIMARY KEY,
+        tenant_id VARCHAR(64),
+        budget_cents INTEGER,
+        spent_cents INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE llm_costs (
+        id VARCHAR(64) PRIMARY KEY,
+        run_id VARCHAR(64),
+        agent_id VARCHAR(64) NOT NULL,
+        provider VARCHAR(64),
+        model VARCHAR(128),
+        input_tokens INTEGER NOT NULL DEFAULT 0,
+        output_tokens INTEGER NOT NULL DEFAULT 0,
+        cost_cents INTEGER NOT NULL,
+        created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+    );
+    CREATE INDEX ix_llm_costs_created_at ON llm_costs (created_at);
+    CREATE TABLE agent_daily_spend (
+        agent_id VARCHAR(64) NOT NULL,
+        spend_date DATE NOT NULL,
+        tenant_id VARCHAR(64),
+        spent_cents BIGINT NOT NULL DEFAULT 0,
+        updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+        PRIMARY KEY (agent_id, spend_date)
+    );
+"""
+
+LEGACY_SUM = """
+    SELECT COALESCE(SUM(cost_cents), 0) as total
+    FROM llm_costs
+    WHERE agent_id = :agent_id AND created_at >= :today_start
+"""
+
+
+def _timed(fn, iterations: int) -> dict:
+    samples = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    samples.sort()
+    return {
+        "p50_ms": round(statistics.median(samples), 3),
+        "p99_ms": round(samples[min(len(samples) - 1, int(len(samples) * 0.99))], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--rows", default="0,1000,10000,50000", help="Cost rows today, comma separated")
+    parser.add_argument("--iterations", type=int, default=300)
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("a Postgres --database-url (or DATABASE_URL) is required")
+
+    from sqlalchemy import create_engine, event, text
+    from sqlmodel import Session
+
+    from app.utils import budget_tracker
+
+    url = args.database_url.replace("postgresql+asyncpg://", "postgresql://")
+    engine = create_engine(url)
+
+    @event.listens_for(engine, "connect")
+    def _scratch_search_path(dbapi_connection, _record):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}; SET search_path TO {SCHEMA}")
+        dbapi_connection.commit()
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        conn.execute(text(f"SET search_path TO {SCHEMA}"))
+        conn.execute(text(SCRATCH_TABLES))
+        conn.execute(
+            text("INSERT INTO agents (id, tenant_id, budget_cents, spent_cents) VALUES (:id, 't_bench', 0, 0)"),
+            {"id": AGENT_ID},
+        )
+
+    budget_tracker.engine = engine
+    budget_tracker.emit_budget_decision = lambda **kwargs: None
+    tracker = budget_tracker.BudgetTracker()
+    today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def legacy_status():
+        with Session(engine) as session:
+            session.execute(text("SELECT * FROM agents WHERE id = :id"), {"id": AGENT_ID}).first()
+            session.execute(text(LEGACY_SUM), {"agent_id": AGENT_ID, "today_start": today_start}).first()
+
+    def enforce():
+        assert tracker.enforce_budget(AGENT_ID, 1).allowed
+
+    print("Budget Check Benchmark")
+    print(f"Rows: {args.rows}  Iterations: {args.iterations}")
+    print("=" * 72)
+
+    results = []
+    written = 0
+    try:
+        for target in (int(n) for n in args.rows.split(",")):
+            if written == 0 and target > 0:
+                tracker.record_cost("run_bench", AGENT_ID, "bench", "bench-model", 10, 10, 0)
+                written = 1
+            if target > written:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            """
+                            INSERT INTO llm_costs (id, run_id, agent_id, cost_cents, created_at)
+                            SELECT md5(random()::text || g::text), 'run_bench', :agent_id, 0, NOW()
+                            FROM generate_series(1, :n) g
+                        """
+                        ),
+                        {"agent_id": AGENT_ID, "n": target - written},
+                    )
+                    conn.execute(text("ANALYZE llm_costs"))
+                written = target
+
+            drift = tracker.reconcile_daily_spend(days=1)
+            row = {
+                "rows_today": written,
+                "legacy_status": _timed(legacy_status, args.iterations),
+                "enforce_budget": _timed(enforce, args.iterations),
+                "reconcile_corrections": drift,
+            }
+            results.append(row)
+            print(
+                f"{written:>8} rows: legacy status p50 {row['legacy_status']['p50_ms']:>8.3f}ms "
+                f"p99 {row['legacy_status']['p99_ms']:>8.3f}ms | enforce_budget p50 "
+                f"{row['enforce_budget']['p50_ms']:>8.3f}ms p99 {row['enforce_budget']['p99_ms']:>8.3f}ms"
+            )
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+    artifact_path = backend / "benchmark_budget_checks.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "budget_checks", "args": vars(args), "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
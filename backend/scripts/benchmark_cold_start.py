@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Cold-start benchmark (time to first healthy response, first /openapi.json)
+# artifact_class: CODE
+"""
+Cold Start Benchmark
+
+Starts the API in a fresh process N times and reports the median of:
+
+server mode (default) - uvicorn app.main:app, needs DATABASE_URL/REDIS_URL:
+- healthy_s:  process spawn until GET /health first returns 200
+- openapi_s:  the first GET /openapi.json after that
+
+import mode - no services needed:
+- import_s:   `import app.main` (route registration included)
+- openapi_s:  the first GET /openapi.json through TestClient (no lifespan)
+- total_s:    process spawn until that response
+
+--backend-dir points at another checkout, so the same script measures a
+before/after pair:
+
+    git worktree add /tmp/before HEAD~1
+    python scripts/benchmark_cold_start.py --mode import --backend-dir /tmp/before/backend
+    python scripts/benchmark_cold_start.py --mode import
+
+Set STARTUP_PROFILE=true to also get per-module and lifespan phase timings
+in the server log.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+IMPORT_PROBE = """
+import json, time, warnings
+warnings.simplefilter("ignore")
+t0 = time.perf_counter()
+import app.main as main
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+response = TestClient(main.app).get(main.app.openapi_url or "/openapi.json")
+t2 = time.perf_counter()
+print(json.dumps({"import_s": t1 - t0, "openapi_s": t2 - t1, "status": response.status_code}))
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _get(url: str, timeout: float = 30.0) -> int:
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except (urllib.error.URLError, ConnectionError, socket.timeout):
+        return 0
+
+
+def run_import(backend_dir: Path) -> dict:
+    t0 = time.perf_counter()
+    out = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=backend_dir,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total = time.perf_counter() - t0
+    result = json.loads(out.stdout.strip().splitlines()[-1])
+    result["total_s"] = total
+    return result
+
+
+def run_server(backend_dir: Path, timeout: float) -> dict:
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=backend_dir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while _get(f"{base}/health", timeout=2.0) != 200:
+            if proc.poll() is not None:
+                raise RuntimeError(f"server exited with {proc.returncode} before becoming healthy")
+            if time.perf_counter() - t0 > timeout:
+                raise RuntimeError(f"server not healthy after {timeout}s")
+            time.sleep(0.05)
+        healthy = time.perf_counter() - t0
+
+        t1 = time.perf_counter()
+        status = _get(f"{base}/openapi.json", timeout=timeout)
+        return {"healthy_s": healthy, "openapi_s": time.perf_counter() - t1, "status": status}
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=["server", "import"], default="server")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--backend-dir", default=str(backend), help="Backend checkout to start")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds to wait for /health")
+    args = parser.parse_args()
+
+    backend_dir = Path(args.backend_dir).resolve()
+    if args.mode == "server" and not os.environ.get("DATABASE_URL"):
+        parser.error("server mode needs DATABASE_URL (use --mode import without services)")
+
+    print("Cold Start Benchmark")
+    print(f"Mode: {args.mode}  Runs: {args.runs}  Backend: {backend_dir}")
+    print("=" * 72)
+
+    runs = []
+    for i in range(args.runs):
+        r = run_import(backend_dir) if args.mode == "import" else run_server(backend_dir, args.timeout)
+        runs.append(r)
+        print(
+            f"  run {i + 1}: " + "  ".join(f"{k} {v:.3f}" if isinstance(v, float) else f"{k} {v}" for k, v in r.items())
+        )
+
+    metrics = [k for k, v in runs[0].items() if isinstance(v, float)]
+    summary = {k: round(statistics.median(r[k] for r in runs), 3) for k in metrics}
+    print("median: " + "  ".join(f"{k} {v:.3f}s" for k, v in summary.items()))
+
+    artifact_path = backend / "benchmark_cold_start.json"
+    with open(artifact_path, "w") as f:
+        json.dump(
+            {"benchmark": "cold_start", "args": vars(args), "median": summary, "runs": runs},
+            f,
+            indent=2,
+        )
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
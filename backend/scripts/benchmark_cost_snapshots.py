@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Cost snapshot aggregation benchmark (Postgres)
+# artifact_class: CODE
+"""
+Cost Snapshot Aggregation Benchmark
+
+Loads synthetic cost_records into a scratch schema and times one day's
+aggregation three ways:
+
+- four_scans:    the old per-entity queries (tenant, user, feature, model)
+- grouping_sets: one GROUPING SETS scan of cost_records
+- rollups:       summing cost_hourly_rollups (maintained by the trigger)
+
+Needs a Postgres DATABASE_URL (or --database-url). Everything runs in a
+temporary schema that is dropped afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/benchmark_cost_snapshots.py
+    python scripts/benchmark_cost_snapshots.py --rows 10000000 --tenants 20 --runs 5
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+SCHEMA = "bench_cost_snapshots"
+
+FOUR_SCANS = [
+    """SELECT SUM(cost_cents), COUNT(*), SUM(input_tokens), SUM(output_tokens)
+       FROM cost_records WHERE tenant_id = :tenant_id AND created_at >= :start AND created_at < :end""",
+    """SELECT user_id, SUM(cost_cents), COUNT(*), SUM(input_tokens), SUM(output_tokens)
+       FROM cost_records WHERE tenant_id = :tenant_id AND created_at >= :start AND created_at < :end
+         AND user_id IS NOT NULL GROUP BY user_id""",
+    """SELECT feature_tag, SUM(cost_cents), COUNT(*), SUM(input_tokens), SUM(output_tokens)
+       FROM cost_records WHERE tenant_id = :tenant_id AND created_at >= :start AND created_at < :end
+         AND feature_tag IS NOT NULL GROUP BY feature_tag""",
+    """SELECT model, SUM(cost_cents), COUNT(*), SUM(input_tokens), SUM(output_tokens)
+       FROM cost_records WHERE tenant_id = :tenant_id AND created_at >= :start AND created_at < :end
+       GROUP BY model""",
+]
+
+GROUPING_SETS = """
+    SELECT GROUPING(user_id, feature_tag, model), user_id, feature_tag, model,
+           SUM(cost_cents), COUNT(*), SUM(input_tokens), SUM(output_tokens)
+    FROM cost_records
+    WHERE tenant_id = :tenant_id AND created_at >= :start AND created_at < :end
+    GROUP BY GROUPING SETS ((), (user_id), (feature_tag), (model))
+"""
+
+ROLLUPS = """
+    SELECT entity_type, entity_key, SUM(total_cost_cents), SUM(request_count),
+           SUM(input_tokens), SUM(output_tokens)
+    FROM cost_hourly_rollups
+    WHERE tenant_id = :tenant_id AND hour_start >= :start AND hour_start < :end
+    GROUP BY entity_type, entity_key
+"""
+
+
+def _load_migration():
+    path = backend / "alembic" / "versions" / "133_cost_hourly_rollups.py"
+    spec = importlib.util.spec_from_file_location("cost_hourly_rollups_migration", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def setup(conn, text, rows: int, tenants: int, days: int) -> float:
+    migration = _load_migration()
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(text(f"SET search_path TO {SCHEMA}"))
+    conn.execute(
+        text(
+            """
+            CREATE TABLE cost_records (
+                id BIGSERIAL PRIMARY KEY,
+                tenant_id VARCHAR(64) NOT NULL,
+                user_id VARCHAR(64),
+                feature_tag VARCHAR(64),
+                model VARCHAR(64) NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                cost_cents FLOAT NOT NULL,
+                created_at TIMESTAMPTZ NOT NULL
+            )
+            """
+        )
+    )
+    conn.execute(text("CREATE INDEX ix_bench_cost_records_tenant_created ON cost_records (tenant_id, created_at)"))
+    conn.execute(
+        text(
+            f"""
+            CREATE TABLE cost_hourly_rollups (
+                tenant_id VARCHAR(64) NOT NULL,
+                entity_type VARCHAR(16) NOT NULL,
+                entity_key VARCHAR(128) NOT NULL,
+                hour_start TIMESTAMPTZ NOT NULL,
+                total_cost_cents FLOAT NOT NULL DEFAULT 0,
+                request_count BIGINT NOT NULL DEFAULT 0,
+                input_tokens BIGINT NOT NULL DEFAULT 0,
+                output_tokens BIGINT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+                PRIMARY KEY (tenant_id, entity_type, entity_key, hour_start)
+            );
+            CREATE INDEX ix_bench_rollups_tenant_hour ON cost_hourly_rollups (tenant_id, hour_start);
+            CREATE FUNCTION cost_hourly_rollup_apply() RETURNS TRIGGER AS $$
+            BEGIN
+                INSERT INTO cost_hourly_rollups AS r ({migration.ROLLUP_COLUMNS})
+                {migration.ROLLUP_SELECT.format(source="new_rows", where="")}
+                ON CONFLICT (tenant_id, entity_type, entity_key, hour_start) DO UPDATE SET
+                    total_cost_cents = r.total_cost_cents + EXCLUDED.total_cost_cents,
+                    request_count = r.request_count + EXCLUDED.request_count,
+                    input_tokens = r.input_tokens + EXCLUDED.input_tokens,
+                    output_tokens = r.output_tokens + EXCLUDED.output_tokens,
+                    updated_at = EXCLUDED.updated_at;
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            CREATE TRIGGER trg_bench_hourly_rollup AFTER INSERT ON cost_records
+                REFERENCING NEW TABLE AS new_rows FOR EACH STATEMENT
+                EXECUTE FUNCTION cost_hourly_rollup_apply();
+            """
+        )
+    )
+
+    # Insert in chunks so each trigger call sees a realistic batch
+    chunk = 100_000
+    t0 = time.perf_counter()
+    for offset in range(0, rows, chunk):
+        conn.execute(
+            text(
+                """
+                INSERT INTO cost_records
+                    (tenant_id, user_id, feature_tag, model, input_tokens, output_tokens, cost_cents, created_at)
+                SELECT
+                    't' || (g % :tenants),
+                    CASE WHEN g % 10 = 0 THEN NULL ELSE 'u' || (g % 500) END,
+                    CASE WHEN g % 7 = 0 THEN NULL ELSE 'f' || (g % 12) END,
+                    'm' || (g % 6),
+                    (g % 2000) + 1,
+                    (g % 800) + 1,
+                    ((g % 997) + 1) / 10.0,
+                    date_trunc('day', NOW()) - make_interval(secs => (g % (:days * 86400)))
+                FROM generate_series(:lo, :hi) AS g
+                """
+            ),
+            {"tenants": tenants, "days": days, "lo": offset, "hi": min(offset + chunk, rows) - 1},
+        )
+    insert_s = time.perf_counter() - t0
+    conn.execute(text("ANALYZE cost_records; ANALYZE cost_hourly_rollups"))
+    return insert_s
+
+
+def time_strategy(conn, text, queries: list, params: dict, runs: int) -> dict:
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        for query in queries:
+            conn.execute(text(query), params).fetchall()
+        timings.append((time.perf_counter() - t0) * 1000)
+    return {"median_ms": round(statistics.median(timings), 2), "min_ms": round(min(timings), 2)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--tenants", type=int, default=20)
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("a Postgres --database-url (or DATABASE_URL) is required")
+
+    from sqlalchemy import create_engine, text
+
+    url = args.database_url.replace("postgresql+asyncpg://", "postgresql://")
+    engine = create_engine(url, isolation_level="AUTOCOMMIT")
+
+    print("Cost Snapshot Aggregation Benchmark")
+    print(f"Rows: {args.rows:,}  Tenants: {args.tenants}  Days: {args.days}")
+    print("=" * 72)
+
+    with engine.connect() as conn:
+        try:
+            insert_s = setup(conn, text, args.rows, args.tenants, args.days)
+            print(f"Loaded in {insert_s:.1f}s ({args.rows / insert_s:,.0f} rows/s with rollup trigger)")
+
+            end = conn.execute(text("SELECT date_trunc('day', NOW())")).scalar()
+            params = {"tenant_id": "t0", "start": end - timedelta(days=1), "end": end}
+
+            results = {
+                "four_scans": time_strategy(conn, text, FOUR_SCANS, params, args.runs),
+                "grouping_sets": time_strategy(conn, text, [GROUPING_SETS], params, args.runs),
+                "rollups": time_strategy(conn, text, [ROLLUPS], params, args.runs),
+            }
+        finally:
+            if not args.keep:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+    baseline = results["four_scans"]["median_ms"]
+    for name, r in results.items():
+        print(
+            f"{name:>14}: median {r['median_ms']:>9.2f}ms  min {r['min_ms']:>9.2f}ms  ({baseline / r['median_ms']:.1f}x)"
+        )
+
+    artifact_path = backend / "benchmark_cost_snapshots.json"
+    with open(artifact_path, "w") as f:
+        json.dump(
+            {"benchmark": "cost_snapshots", "rows": args.rows, "insert_s": insert_s, "results": results}, f, indent=2
+        )
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
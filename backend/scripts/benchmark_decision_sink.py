@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Decision record benchmark: caller-side cost of emitting decisions, per-call writes vs the buffered sink
+# artifact_class: CODE
+"""
+Decision Sink Benchmark
+
+Emits --decisions decision records (default 20,000) from --threads caller
+threads, as CAREEngine.route and PolicyEngine.evaluate do, paced at --rate
+decisions per second in total (0: as fast as possible), and reports the
+per-emission latency seen by the caller, throughput, database round trips
+per decision and records written. An unpaced burst can outrun the flush
+thread and overflow DECISION_SINK_QUEUE_SIZE; overflowed records are
+dropped and show up as fewer records written.
+
+The database is simulated: opening a connection costs --connect-ms (a
+fresh engine per decision pays it every time), every statement costs
+--db-latency-ms plus --row-us per row.
+
+Modes:
+- per_call: the write path before the sink; a new engine, connection and
+  INSERT per decision, plus a second one for the taxonomy bridge
+- sink: emit_sync() queues the record; the flush thread writes batched
+  INSERTs over one shared engine (drain time reported separately)
+
+Record mix: 60% routing, 30% policy (bridged to the taxonomy), 10% budget.
+
+    python scripts/benchmark_decision_sink.py
+    python scripts/benchmark_decision_sink.py --connect-ms 5 --threads 32
+    python scripts/benchmark_decision_sink.py --rate 0
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+DB_URL = "postgresql://benchmark/decisions"
+
+
+def _percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"p50_us": 0.0, "p99_us": 0.0, "count": 0}
+    ordered = sorted(samples)
+    return {
+        "p50_us": round(statistics.median(ordered) * 1e6, 2),
+        "p99_us": round(ordered[max(0, int(len(ordered) * 0.99) - 1)] * 1e6, 2),
+        "count": len(ordered),
+    }
+
+
+class SimulatedEngine:
+    """Engine stand-in: connection setup and per-statement latency, counted round trips."""
+
+    def __init__(self, args, pooled: bool):
+        self._connect_s = args.connect_ms / 1000
+        self._statement_s = args.db_latency_ms / 1000
+        self._row_s = args.row_us / 1e6
+        self._pooled = pooled
+        self._warm = False
+        self._lock = threading.Lock()
+        self.connects = 0
+        self.statements = 0
+        self.decision_rows = 0
+
+    def connect(self):
+        with self._lock:
+            cold = not (self._pooled and self._warm)
+            self._warm = True
+            if cold:
+                self.connects += 1
+        if cold:
+            time.sleep(self._connect_s)
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params=None):
+        rows = len(params) if isinstance(params, list) else 1
+        with self._lock:
+            self.statements += 1
+            if getattr(statement, "table", None) is not None and statement.table.name == "decision_records":
+                self.decision_rows += rows
+        time.sleep(self._statement_s + rows * self._row_s)
+
+    def commit(self):
+        pass
+
+
+def _records(args) -> list:
+    from app.contracts.decisions import (
+        DecisionOutcome,
+        DecisionRecord,
+        DecisionSource,
+        DecisionTrigger,
+        DecisionType,
+    )
+
+    rng = random.Random(args.seed)
+    records = []
+    for n in range(args.decisions):
+        roll = rng.random()
+        decision_type = (
+            DecisionType.ROUTING if roll < 0.6 else DecisionType.POLICY if roll < 0.9 else DecisionType.BUDGET
+        )
+        records.append(
+            DecisionRecord(
+                decision_type=decision_type,
+                decision_source=DecisionSource.SYSTEM,
+                decision_trigger=DecisionTrigger.EXPLICIT,
+                decision_outcome=DecisionOutcome.SELECTED if rng.random() < 0.8 else DecisionOutcome.BLOCKED,
+                decision_inputs={"eligible_agents": [f"agent-{i}" for i in range(rng.randint(1, 5))]},
+                decision_reason="benchmark",
+                tenant_id=f"t-{n % 50}",
+                request_id=f"req-{n}",
+            )
+        )
+    return records
+
+
+def _per_call_emit(args):
+    """The write path before the sink: a fresh engine and connection per statement."""
+    from app.contracts.decisions import (
+        DECISION_RECORD_INSERT,
+        POLICY_DECISION_INSERT,
+        _record_row,
+        _taxonomy_row,
+    )
+
+    engines = []
+
+    def emit(record):
+        engine = SimulatedEngine(args, pooled=False)
+        engines.append(engine)
+        with engine.connect() as conn:
+            conn.execute(DECISION_RECORD_INSERT, _record_row(record))
+            conn.commit()
+        taxonomy = _taxonomy_row(record)
+        if taxonomy is not None:
+            with engine.connect() as conn:
+                conn.execute(POLICY_DECISION_INSERT, taxonomy)
+                conn.commit()
+        return True
+
+    def totals():
+        return (
+            sum(e.connects for e in engines),
+            sum(e.statements for e in engines),
+            sum(e.decision_rows for e in engines),
+        )
+
+    return emit, totals, None
+
+
+def _sink_emit(args):
+    import app.contracts.decisions as decisions
+
+    engine = SimulatedEngine(args, pooled=True)
+    decisions._get_engine = lambda db_url: engine
+    service = decisions.DecisionRecordService(DB_URL)
+    return service.emit_sync, lambda: (engine.connects, engine.statements, engine.decision_rows), service
+
+
+def run_mode(mode: str, args, records: list) -> dict:
+    emit, totals, service = _per_call_emit(args) if mode == "per_call" else _sink_emit(args)
+    latencies: list[list[float]] = [[] for _ in range(args.threads)]
+
+    interval = args.threads / args.rate if args.rate else 0.0
+
+    def worker(index: int):
+        samples = latencies[index]
+        due = time.perf_counter()
+        for record in records[index :: args.threads]:
+            if interval:
+                due += interval
+                pause = due - time.perf_counter()
+                if pause > 0:
+                    time.sleep(pause)
+            start = time.perf_counter()
+            emit(record)
+            samples.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(args.threads)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    emitted = time.perf_counter() - started
+
+    drain_ms = 0.0
+    if service is not None:
+        drain_start = time.perf_counter()
+        service.flush(timeout=120)
+        drain_ms = (time.perf_counter() - drain_start) * 1000
+        service.close()
+
+    connects, statements, written = totals()
+    return {
+        "emit": _percentiles([s for samples in latencies for s in samples]),
+        "decisions_per_second": round(args.decisions / emitted, 1),
+        "drain_ms": round(drain_ms, 1),
+        "written": written,
+        "connections_per_decision": round(connects / args.decisions, 4),
+        "statements_per_decision": round(statements / args.decisions, 4),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--decisions", type=int, default=20_000, help="Decision records per mode")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent emitting threads")
+    parser.add_argument("--rate", type=float, default=5_000, help="Total decisions per second (0: unpaced)")
+    parser.add_argument("--connect-ms", type=float, default=2.0, help="Simulated connection setup latency")
+    parser.add_argument("--db-latency-ms", type=float, default=0.5, help="Simulated latency per statement")
+    parser.add_argument("--row-us", type=float, default=10.0, help="Simulated latency per inserted row")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if args.decisions <= 0 or args.threads <= 0 or args.rate < 0:
+        parser.error("--decisions and --threads must be positive, --rate not negative")
+
+    import logging
+
+    logging.disable(logging.WARNING)
+
+    print("Decision Sink Benchmark")
+    print(
+        f"Decisions: {args.decisions:,}  Threads: {args.threads}  Rate: {args.rate or 'unpaced'}/s  "
+        f"Connect: {args.connect_ms} ms  "
+        f"Statement: {args.db_latency_ms} ms + {args.row_us} us/row"
+    )
+    print("=" * 72)
+
+    records = _records(args)
+    results = {}
+    for mode in ("per_call", "sink"):
+        result = run_mode(mode, args, records)
+        results[mode] = result
+        print(
+            f"  {mode:<9} p50 {result['emit']['p50_us']:>9,.2f} us   p99 {result['emit']['p99_us']:>9,.2f} us   "
+            f"{result['decisions_per_second']:>10,.1f} decisions/s   "
+            f"{result['statements_per_decision']:.4f} statements/decision   "
+            f"written {result['written']:,}   drain {result['drain_ms']:,.1f} ms"
+        )
+
+    artifact_path = backend / "benchmark_decision_sink.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "decision_sink", "args": vars(args), "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: async
+# Role: OperationRegistry dispatch-overhead benchmark (registry time vs handler time)
+# artifact_class: CODE
+"""
+Dispatch Overhead Benchmark
+
+Registers every operation from every handler module (register_all_handlers),
+swaps each handler for a no-op so handler time is ~0, wires the consequence
+pipeline as bootstrap does, and dispatches round-robin over all operations:
+
+- dynamic:  registry not frozen, so everything is resolved per call
+- compiled: registry frozen, so each call runs a precompiled dispatch plan
+
+It reports µs per dispatch for each mode, and the per-phase split recorded
+in hoc_operation_dispatch_phase_seconds, with registry_overhead (total minus
+handler) shown separately.
+
+--backend-dir points at another checkout, so the same script measures a
+before/after pair (the phase split needs the histogram, so it only shows
+where it exists):
+
+    git worktree add /tmp/before HEAD~1
+    python scripts/benchmark_dispatch_overhead.py --backend-dir /tmp/before/backend
+    python scripts/benchmark_dispatch_overhead.py
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+
+
+def _histogram_totals(histogram) -> dict:
+    """phase -> (sum_seconds, count) from a labelled histogram."""
+    totals: dict = {}
+    for metric in histogram.collect():
+        for sample in metric.samples:
+            phase = sample.labels.get("phase")
+            if sample.name.endswith("_sum"):
+                totals.setdefault(phase, [0.0, 0.0])[0] = sample.value
+            elif sample.name.endswith("_count"):
+                totals.setdefault(phase, [0.0, 0.0])[1] = sample.value
+    return totals
+
+
+async def run(args) -> dict:
+    from app.hoc.cus.hoc_spine.consequences.adapters.dispatch_metrics_adapter import (
+        get_dispatch_metrics_adapter,
+    )
+    from app.hoc.cus.hoc_spine.consequences.pipeline import get_consequence_pipeline
+    from app.hoc.cus.hoc_spine.orchestrator import operation_registry
+    from app.hoc.cus.hoc_spine.orchestrator.handlers import register_all_handlers
+    from app.hoc.cus.hoc_spine.orchestrator.operation_registry import (
+        OperationContext,
+        OperationRegistry,
+        OperationResult,
+    )
+
+    class NoopHandler:
+        async def execute(self, ctx):
+            return OperationResult.ok(None)
+
+    source = OperationRegistry()
+    register_all_handlers(source)
+    modules = {type(source.get_handler(op)).__module__ for op in source.operations}
+
+    pipeline = get_consequence_pipeline()
+    if not pipeline.is_frozen:
+        pipeline.register(get_dispatch_metrics_adapter())
+        pipeline.freeze()
+
+    def build(freeze: bool) -> OperationRegistry:
+        registry = OperationRegistry()
+        for op in source.operations:
+            registry.register(op, NoopHandler())
+        for op, enricher in source._context_enrichers.items():
+            registry.register_context_enricher(op, enricher)
+        if freeze:
+            registry.freeze()
+        return registry
+
+    ops = source.operations
+    ctx = OperationContext(session=None, tenant_id="tenant-bench", params={"method": "bench"})
+
+    async def per_call_us(registry) -> float:
+        samples = []
+        for _ in range(args.rounds):
+            t0 = time.perf_counter()
+            for op in ops:
+                await registry.execute(op, ctx)
+            samples.append((time.perf_counter() - t0) / len(ops) * 1e6)
+        return statistics.median(samples)
+
+    result = {"handler_modules": len(modules), "operations": len(ops)}
+    for mode, freeze in (("dynamic", False), ("compiled", True)):
+        registry = build(freeze)
+        await per_call_us(registry)  # warm up
+        histogram = getattr(operation_registry, "DISPATCH_PHASE_SECONDS", None)
+        before = _histogram_totals(histogram) if histogram is not None else {}
+        result[f"{mode}_us_per_dispatch"] = round(await per_call_us(registry), 2)
+        if histogram is not None:
+            after = _histogram_totals(histogram)
+            result[f"{mode}_phases_us"] = {
+                phase: round(
+                    (after[phase][0] - before.get(phase, [0.0])[0])
+                    / (after[phase][1] - before.get(phase, [0.0, 0.0])[1])
+                    * 1e6,
+                    2,
+                )
+                for phase in after
+                if after[phase][1] > before.get(phase, [0.0, 0.0])[1]
+            }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=200, help="Passes over all operations per mode")
+    parser.add_argument("--backend-dir", default=str(backend), help="Backend checkout to measure")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(args.backend_dir).resolve()))
+    # Dispatch logs every call; measure the registry, not the log handlers
+    logging.disable(logging.WARNING)
+
+    print("Dispatch Overhead Benchmark")
+    print(f"Rounds: {args.rounds}  Backend: {args.backend_dir}")
+    print("=" * 72)
+
+    result = asyncio.run(run(args))
+    print(f"  handler modules: {result['handler_modules']}  operations: {result['operations']}")
+    for mode in ("dynamic", "compiled"):
+        print(f"  {mode:<9} {result[f'{mode}_us_per_dispatch']:8.2f} µs per dispatch (no-op handler)")
+        for phase, us in result.get(f"{mode}_phases_us", {}).items():
+            print(f"      {phase:<18} {us:8.2f} µs")
+
+    artifact_path = backend / "benchmark_dispatch_overhead.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "dispatch_overhead", "args": vars(args), "result": result}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Event publisher throughput/latency benchmark
+# artifact_class: CODE
+"""
+Event Publisher Benchmark
+
+Compares synchronous RedisPublisher.publish (one PUBLISH round trip per
+event) with the buffered path (enqueue + pipelined background flush).
+Reports caller-side publish latency (p50/p99) and end-to-end events/sec.
+
+Without --redis-url a fake Redis client with a simulated round-trip time
+is used, so the numbers isolate the publisher's own overhead.
+
+Usage:
+    python scripts/benchmark_event_publisher.py
+    python scripts/benchmark_event_publisher.py --events 50000 --rtt-ms 0.5
+    python scripts/benchmark_event_publisher.py --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+
+class _SimulatedRedis:
+    """Redis stand-in that sleeps rtt seconds per network round trip."""
+
+    def __init__(self, rtt: float):
+        self.rtt = rtt
+        self.round_trips = 0
+
+    def ping(self):
+        return True
+
+    def publish(self, channel, message):
+        self.round_trips += 1
+        time.sleep(self.rtt)
+        return 0
+
+    def pipeline(self, transaction=True):
+        client = self
+
+        class _Pipe:
+            def __init__(self):
+                self.n = 0
+
+            def publish(self, channel, message):
+                self.n += 1
+
+            def execute(self, raise_on_error=True):
+                client.round_trips += 1
+                time.sleep(client.rtt)
+                return [0] * self.n
+
+        return _Pipe()
+
+    def close(self):
+        pass
+
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(int(pct * len(ordered)), len(ordered) - 1)]
+
+
+def run_mode(batching: bool, events: int, client_factory) -> dict:
+    from app.events.redis_publisher import RedisPublisher
+
+    with patch("redis.Redis.from_url", side_effect=lambda *a, **kw: client_factory()):
+        publisher = RedisPublisher(batching=batching)
+    client = publisher._client
+
+    latencies = []
+    payload = {"run_id": "bench-run", "step": 0, "source": "benchmark"}
+    start = time.perf_counter()
+    for i in range(events):
+        t0 = time.perf_counter()
+        publisher.publish("RUN_STEP", {**payload, "step": i})
+        latencies.append((time.perf_counter() - t0) * 1e6)
+    caller_elapsed = time.perf_counter() - start
+    publisher.flush(timeout=120)
+    total_elapsed = time.perf_counter() - start
+
+    stats = publisher.get_buffer_stats()
+    publisher.close()
+
+    return {
+        "mode": "batched" if batching else "sync",
+        "events": events,
+        "caller_p50_us": round(statistics.median(latencies), 2),
+        "caller_p99_us": round(_percentile(latencies, 0.99), 2),
+        "caller_events_per_sec": round(events / caller_elapsed),
+        "end_to_end_events_per_sec": round(events / total_elapsed),
+        "round_trips": getattr(client, "round_trips", None),
+        "buffer": stats.to_dict() if stats else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20000)
+    parser.add_argument("--rtt-ms", type=float, default=0.2, help="Simulated Redis RTT (fake client only)")
+    parser.add_argument("--redis-url", default=None, help="Benchmark against a real Redis instead")
+    args = parser.parse_args()
+
+    # Large enough that the benchmark measures throughput, not overflow
+    os.environ.setdefault("EVENT_PUBLISHER_QUEUE_SIZE", str(max(args.events, 10000)))
+
+    if args.redis_url:
+        import redis
+
+        os.environ["REDIS_URL"] = args.redis_url
+        real_from_url = redis.Redis.from_url
+
+        def client_factory():
+            return real_from_url(args.redis_url, decode_responses=True)
+
+    else:
+        os.environ.setdefault("REDIS_URL", "redis://benchmark:6379/0")
+
+        def client_factory():
+            return _SimulatedRedis(args.rtt_ms / 1000.0)
+
+    print("Event Publisher Benchmark")
+    print(f"Events: {args.events}  Backend: {args.redis_url or f'simulated ({args.rtt_ms}ms RTT)'}")
+    print("=" * 72)
+
+    results = [run_mode(False, args.events, client_factory), run_mode(True, args.events, client_factory)]
+    for r in results:
+        print(
+            f"{r['mode']:>8}: caller p50 {r['caller_p50_us']:>8.2f}us  p99 {r['caller_p99_us']:>8.2f}us  "
+            f"end-to-end {r['end_to_end_events_per_sec']:>8} ev/s  round trips {r['round_trips']}"
+        )
+
+    artifact_path = backend / "benchmark_event_publisher.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "event_publisher", "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
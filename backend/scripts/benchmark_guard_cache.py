@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Guard cache load test: DB queries/sec under concurrent dashboard clients
+# artifact_class: CODE
+"""
+Guard Cache Load Test
+
+Simulates Guard Console dashboards polling /guard/status and
+/guard/snapshot/today against several API workers that share one Redis.
+Each worker is a GuardCache instance with its own L1 tier and invalidation
+listener (all in one event loop). The DB reads behind each endpoint are
+simulated with a fixed latency and counted as queries (4 per status
+compute, 3 per snapshot compute, as in the guard API).
+
+Two modes:
+
+- ttl: the previous read path (GET; on miss compute, then SETEX)
+- swr: GuardCache.get_or_compute (L1, stale-while-revalidate, single-flight)
+
+Tenants are invalidated at --invalidate-rate per second (killswitch or
+incident changes). Reported per mode: DB queries/sec, computes, request
+p50/p99 latency.
+
+Needs a Redis REDIS_URL (or --redis-url). Keys are namespaced by tenant
+ids prefixed with "bench-" and removed afterwards.
+
+Usage:
+    REDIS_URL=redis://localhost:6379/0 python scripts/benchmark_guard_cache.py
+    python scripts/benchmark_guard_cache.py --clients 200 --workers 8 --tenants 20 --db-latency 2.0
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+ENDPOINTS = {"status": 4, "snapshot": 3}  # DB queries per compute
+
+
+class SimulatedDB:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.queries = 0
+        self.computes = 0
+
+    def reader(self, endpoint: str, tenant_id: str):
+        async def compute():
+            self.computes += 1
+            self.queries += ENDPOINTS[endpoint]
+            await asyncio.sleep(self.latency)
+            return {"tenant_id": tenant_id, "endpoint": endpoint, "at": time.time()}
+
+        return compute
+
+
+async def _ttl_read(redis, endpoint: str, tenant_id: str, compute, ttl: int) -> dict:
+    key = f"guard:{endpoint}:{tenant_id}"
+    cached = await redis.get(key)
+    if cached:
+        return json.loads(cached)
+    data = await compute()
+    await redis.setex(key, ttl, json.dumps(data, default=str))
+    return data
+
+
+async def run_mode(mode: str, args) -> dict:
+    import redis.asyncio as aioredis
+
+    from app.utils.guard_cache import GUARD_SNAPSHOT_TTL, GUARD_STATUS_TTL, GuardCache
+
+    ttls = {"status": GUARD_STATUS_TTL, "snapshot": GUARD_SNAPSHOT_TTL}
+    tenants = [f"bench-{i}" for i in range(args.tenants)]
+    clients = [aioredis.from_url(args.redis_url, decode_responses=True) for _ in range(args.workers)]
+    caches = [GuardCache(redis_client=client) for client in clients]
+    for cache in caches:
+        cache._enabled = True
+    db = SimulatedDB(args.db_latency)
+    latencies = []
+    deadline = time.perf_counter() + args.seconds
+
+    async def dashboard(n: int):
+        rng = random.Random(n)
+        worker = n % args.workers
+        tenant_id = tenants[n % len(tenants)]
+        await asyncio.sleep(rng.uniform(0, args.poll))
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            for endpoint, ttl in ttls.items():
+                compute = db.reader(endpoint, tenant_id)
+                t0 = time.perf_counter()
+                if mode == "ttl":
+                    await _ttl_read(clients[worker], endpoint, tenant_id, compute, ttl)
+                else:
+                    await caches[worker].get_or_compute(endpoint, tenant_id, compute, ttl)
+                latencies.append((time.perf_counter() - t0) * 1000)
+            await asyncio.sleep(max(0.0, args.poll - (time.perf_counter() - started)))
+
+    async def mutations():
+        rng = random.Random(0)
+        while args.invalidate_rate > 0 and time.perf_counter() < deadline:
+            await asyncio.sleep(rng.expovariate(args.invalidate_rate))
+            tenant_id = rng.choice(tenants)
+            if mode == "ttl":
+                # The previous invalidate_tenant: SCAN + DEL
+                keys = [key async for key in clients[0].scan_iter(f"guard:*:{tenant_id}*")]
+                if keys:
+                    await clients[0].delete(*keys)
+            else:
+                await caches[rng.randrange(args.workers)].invalidate_tenant(tenant_id)
+
+    started = time.perf_counter()
+    await asyncio.gather(mutations(), *(dashboard(n) for n in range(args.clients)))
+    elapsed = time.perf_counter() - started
+
+    for cache in caches:
+        await cache.close()
+    for tenant_id in tenants:
+        keys = [key async for key in clients[0].scan_iter(f"guard:*{tenant_id}*")]
+        if keys:
+            await clients[0].delete(*keys)
+    for client in clients:
+        await client.aclose()
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "computes": db.computes,
+        "db_queries_per_sec": round(db.queries / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", default=os.environ.get("REDIS_URL"))
+    parser.add_argument("--clients", type=int, default=200, help="Concurrent dashboards")
+    parser.add_argument("--workers", type=int, default=4, help="API workers (GuardCache instances)")
+    parser.add_argument("--tenants", type=int, default=20)
+    parser.add_argument("--poll", type=float, default=2.0, help="Seconds between dashboard refreshes")
+    parser.add_argument("--db-latency", type=float, default=1.0, help="Seconds per simulated compute")
+    parser.add_argument("--invalidate-rate", type=float, default=0.5, help="Tenant invalidations per second")
+    parser.add_argument("--seconds", type=int, default=60)
+    args = parser.parse_args()
+
+    if not args.redis_url:
+        parser.error("a --redis-url (or REDIS_URL) is required")
+
+    print("Guard Cache Load Test")
+    print(
+        f"Clients: {args.clients}  Workers: {args.workers}  Tenants: {args.tenants}  "
+        f"Poll: {args.poll}s  DB latency: {args.db_latency}s  Seconds: {args.seconds}"
+    )
+    print("=" * 72)
+
+    results = {mode: asyncio.run(run_mode(mode, args)) for mode in ("ttl", "swr")}
+
+    for mode, r in results.items():
+        print(
+            f"{mode:>4}: {r['db_queries_per_sec']:>8.1f} DB queries/s  computes {r['computes']:>6}  "
+            f"p50 {r['p50_ms']:>8.2f}ms  p99 {r['p99_ms']:>8.2f}ms  requests {r['requests']:,}"
+        )
+
+    artifact_path = backend / "benchmark_guard_cache.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "guard_cache", "args": vars(args), "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
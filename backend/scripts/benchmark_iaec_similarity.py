@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: IAEC one-vs-many similarity benchmark
+# artifact_class: CODE
+"""
+IAEC Similarity Benchmark
+
+Scores one query embedding against N stored composites with the per-pair
+similarity() loop and with the vectorised similarity_matrix(), for each
+similarity mode, and checks that both agree.
+
+A deterministic fake embedding provider is used, so no API keys are needed
+and the numbers isolate the composer's own cost.
+
+Usage:
+    python scripts/benchmark_iaec_similarity.py
+    python scripts/benchmark_iaec_similarity.py --candidates 10000 --loop-sample 2000
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+MODES = ("cosine", "instruction_weighted", "slot_weighted")
+
+
+def _fake_embedding(dimensions: int):
+    async def embed(text, use_cache=True):
+        seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+        return np.random.default_rng(seed).standard_normal(dimensions).astype(np.float32).tolist()
+
+    return embed
+
+
+def run(candidates: int, loop_sample: int) -> dict:
+    from app.memory import iaec
+
+    iaec.WHITENING_STORAGE_DIR = tempfile.mkdtemp(prefix="iaec-bench-")
+    composer = iaec.InstructionAwareEmbeddingComposer(embedding_fn=_fake_embedding(iaec.EMBEDDING_DIMENSIONS))
+    asyncio.run(composer.initialize())
+
+    rng = np.random.default_rng(42)
+    matrix = rng.standard_normal((candidates, iaec.EMBEDDING_DIMENSIONS)).astype(np.float32)
+    query = matrix[0].copy()
+
+    # The per-pair loop is slow; time a sample and extrapolate to N
+    sample = min(loop_sample, candidates)
+    results = []
+    for mode in MODES:
+        t0 = time.perf_counter()
+        loop_scores = [composer.similarity(query, row, mode=mode, instruction="analyze") for row in matrix[:sample]]
+        loop_elapsed = (time.perf_counter() - t0) * candidates / sample
+
+        t0 = time.perf_counter()
+        scores = composer.similarity_matrix(query, matrix, mode=mode, instruction="analyze")
+        matrix_elapsed = time.perf_counter() - t0
+
+        results.append(
+            {
+                "mode": mode,
+                "candidates": candidates,
+                "loop_ms": round(loop_elapsed * 1000, 2),
+                "loop_extrapolated_from": sample,
+                "matrix_ms": round(matrix_elapsed * 1000, 2),
+                "speedup": round(loop_elapsed / matrix_elapsed, 1),
+                "max_abs_diff": float(np.max(np.abs(scores[:sample] - np.array(loop_scores)))),
+            }
+        )
+    return {"benchmark": "iaec_similarity", "results": results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=10000)
+    parser.add_argument("--loop-sample", type=int, default=10000, help="Pairs timed for the per-pair loop")
+    args = parser.parse_args()
+
+    print("IAEC Similarity Benchmark")
+    print(f"Candidates: {args.candidates}")
+    print("=" * 72)
+
+    report = run(args.candidates, args.loop_sample)
+    for r in report["results"]:
+        print(
+            f"{r['mode']:>21}: loop {r['loop_ms']:>10.2f}ms  matrix {r['matrix_ms']:>8.2f}ms  "
+            f"speedup {r['speedup']:>7.1f}x  max diff {r['max_abs_diff']:.2e}"
+        )
+
+    artifact_path = backend / "benchmark_iaec_similarity.json"
+    with open(artifact_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: IAEC whitening cold-start / RSS benchmark
+# artifact_class: CODE
+"""
+IAEC Whitening Load Benchmark
+
+Starts N worker processes that each load a D x D whitening matrix and touch
+every page of it (as composing would), then report load time and memory:
+
+- legacy: float64 .npz read with np.load(allow_pickle=True) (old format)
+- mmap:   float32 .npy mapped read-only (new format)
+
+Anonymous RSS is private heap per worker; file-backed RSS of a mapping is
+shared page cache, paid once per node. PSS splits shared pages between the
+processes mapping them, so its sum is the node-wide cost.
+
+Usage:
+    python scripts/benchmark_iaec_whitening.py
+    python scripts/benchmark_iaec_whitening.py --workers 8 --dim 1536
+"""
+
+import argparse
+import json
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+
+def _memory_kb() -> dict:
+    fields = {}
+    with open("/proc/self/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "RssAnon", "RssFile"):
+                fields[key] = int(value.split()[0])
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    fields["Pss"] = int(line.split()[1])
+    except OSError:
+        pass
+    return fields
+
+
+def _worker(fmt: str, path: str, ready, release, results):
+    before = _memory_kb()
+    t0 = time.perf_counter()
+    if fmt == "legacy":
+        data = np.load(path, allow_pickle=True)
+        matrix = data["matrix"]
+    else:
+        matrix = np.load(path, mmap_mode="r", allow_pickle=False)
+    float(np.asarray(matrix).sum())  # fault in every page
+    elapsed = time.perf_counter() - t0
+
+    # Measure while every worker still holds its matrix
+    ready.wait()
+    after = _memory_kb()
+    results.put(
+        {
+            "load_ms": elapsed * 1000,
+            "rss_delta_kb": after["VmRSS"] - before["VmRSS"],
+            "anon_delta_kb": after.get("RssAnon", 0) - before.get("RssAnon", 0),
+            "file_delta_kb": after.get("RssFile", 0) - before.get("RssFile", 0),
+            "pss_delta_kb": after.get("Pss", 0) - before.get("Pss", 0),
+        }
+    )
+    release.wait()
+
+
+def run(fmt: str, path: str, workers: int) -> dict:
+    ctx = mp.get_context("spawn")
+    ready = ctx.Barrier(workers + 1)
+    release = ctx.Barrier(workers + 1)
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(fmt, path, ready, release, results)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    ready.wait()
+    rows = [results.get() for _ in range(workers)]
+    release.wait()
+    for p in procs:
+        p.join()
+
+    mean = {key: sum(r[key] for r in rows) / workers for key in rows[0]}
+    return {
+        "format": fmt,
+        "workers": workers,
+        "cold_start_ms": round(mean["load_ms"], 2),
+        "rss_per_worker_mb": round(mean["rss_delta_kb"] / 1024, 1),
+        "private_per_worker_mb": round(mean["anon_delta_kb"] / 1024, 1),
+        "shared_per_worker_mb": round(mean["file_delta_kb"] / 1024, 1),
+        "node_total_pss_mb": round(sum(r["pss_delta_kb"] for r in rows) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--dim", type=int, default=1536)
+    args = parser.parse_args()
+
+    from app.memory import iaec
+
+    workdir = Path(tempfile.mkdtemp(prefix="iaec-whitening-bench-"))
+    iaec.WHITENING_STORAGE_DIR = str(workdir)
+
+    matrix = np.random.default_rng(0).standard_normal((args.dim, args.dim))
+    legacy_path = workdir / "legacy.npz"
+    np.savez_compressed(legacy_path, matrix=matrix, mean=None, iaec_version=iaec.IAEC_VERSION)
+    base = str(workdir / "whitening_bench_float32")
+    iaec.write_whitening_artifact(base, matrix.astype(np.float32), matrix.mean(axis=0))
+
+    print("IAEC Whitening Load Benchmark")
+    print(f"Matrix: {args.dim}x{args.dim}  Workers: {args.workers}")
+    print("=" * 72)
+
+    results = [run("legacy", str(legacy_path), args.workers), run("mmap", f"{base}.npy", args.workers)]
+    for r in results:
+        print(
+            f"{r['format']:>7}: cold start {r['cold_start_ms']:>8.2f}ms  RSS/worker {r['rss_per_worker_mb']:>6.1f}MB "
+            f"(private {r['private_per_worker_mb']:>5.1f}, shared {r['shared_per_worker_mb']:>5.1f})  "
+            f"node PSS {r['node_total_pss_mb']:>6.1f}MB"
+        )
+
+    artifact_path = backend / "benchmark_iaec_whitening.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "iaec_whitening", "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
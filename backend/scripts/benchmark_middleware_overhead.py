@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: async
+# Role: Middleware benchmark: per-request overhead of the auth/onboarding/RBAC/tenant chain on a no-op endpoint
+# artifact_class: CODE
+"""
+Middleware Overhead Benchmark
+
+Sends --requests authenticated GETs (default 20,000) to a no-op endpoint
+by calling the ASGI app directly (no server, no sockets), --concurrency
+at a time, and reports per-request latency p50/p99 and the overhead over
+the bare app.
+
+Stacks:
+- bare: no middleware
+- stacked: CORS, then AuthGateway, OnboardingGate, RBAC and Tenant each
+  as its own BaseHTTPMiddleware layer (the layout before the pipeline),
+  plus the request-id middleware
+- pipeline: CORS, RequestPipelineMiddleware, request-id middleware
+
+The gateway authenticates a fixed API key in memory, the onboarding
+state lookup returns COMPLETE and the auth audit write is a no-op, so only
+middleware cost is measured. The RBACv2 shadow comparison is disabled in
+every stack: it now runs off the response path.
+
+    python scripts/benchmark_middleware_overhead.py
+    python scripts/benchmark_middleware_overhead.py --requests 50000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+API_KEY = "aos_bench_key"
+PATH = "/api/v1/bench/noop"
+
+
+def _percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"p50_us": 0.0, "p99_us": 0.0, "count": 0}
+    ordered = sorted(samples)
+    return {
+        "p50_us": round(statistics.median(ordered) * 1e6, 2),
+        "p99_us": round(ordered[max(0, int(len(ordered) * 0.99) - 1)] * 1e6, 2),
+        "count": len(ordered),
+    }
+
+
+class BenchGateway:
+    """AuthGateway stand-in: one API key, authenticated in memory."""
+
+    async def authenticate(self, authorization_header=None, api_key_header=None):
+        from app.auth.contexts import AuthSource, MachineCapabilityContext
+        from app.auth.gateway_types import GatewayAuthError, GatewayErrorCode
+
+        if api_key_header != API_KEY:
+            return GatewayAuthError(error_code=GatewayErrorCode.API_KEY_INVALID, message="invalid", http_status=401)
+        return MachineCapabilityContext(
+            key_id="key-bench",
+            key_name="bench",
+            auth_source=AuthSource.API_KEY,
+            tenant_id="t-bench",
+            scopes=frozenset({"runtime:query"}),
+            rate_limit=1000,
+        )
+
+
+def _stage_layer(stage):
+    """One auth stage as its own BaseHTTPMiddleware layer, as it was deployed before the pipeline."""
+
+    async def dispatch(request, call_next):
+        response = await stage.check(request)
+        if response is not None:
+            return response
+        return await call_next(request)
+
+    return dispatch
+
+
+def _build_app(stack: str):
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.cors import CORSMiddleware
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    from app.auth.gateway_middleware import AuthGatewayMiddleware
+    from app.auth.onboarding_gate import OnboardingGateMiddleware
+    from app.auth.rbac_middleware import RBACMiddleware
+    from app.auth.request_pipeline import RequestPipelineMiddleware
+    from app.middleware.tenant import TenantContext, clear_tenant_context, set_tenant_context
+
+    app = FastAPI()
+
+    @app.get(PATH)
+    async def noop():
+        return {"ok": True}
+
+    if stack == "bare":
+        return app
+
+    app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+    gateway_config = {"gateway": BenchGateway(), "public_paths": ["/health"]}
+
+    if stack == "stacked":
+
+        async def tenant(request, call_next):
+            request_id = str(uuid.uuid4())
+            tenant_id = request.headers.get("X-Tenant-ID")
+            if tenant_id:
+                set_tenant_context(TenantContext(tenant_id=tenant_id, request_id=request_id))
+            try:
+                request.state.request_id = request_id
+                request.state.tenant_id = tenant_id
+                response = await call_next(request)
+                response.headers["X-Request-ID"] = request_id
+                response.headers["X-Correlation-ID"] = request.headers.get("X-Correlation-ID") or request_id
+                return response
+            finally:
+                clear_tenant_context()
+
+        app.add_middleware(BaseHTTPMiddleware, dispatch=tenant)
+        app.add_middleware(BaseHTTPMiddleware, dispatch=_stage_layer(RBACMiddleware(app, enforce_rbac=True)))
+        app.add_middleware(BaseHTTPMiddleware, dispatch=_stage_layer(OnboardingGateMiddleware(app)))
+        app.add_middleware(BaseHTTPMiddleware, dispatch=_stage_layer(AuthGatewayMiddleware(app, **gateway_config)))
+    else:
+        app.add_middleware(RequestPipelineMiddleware, gateway_config=gateway_config, enforce_rbac=True)
+
+    @app.middleware("http")
+    async def add_request_id(request: Request, call_next):
+        request_id = str(uuid.uuid4())
+        request.state.request_id = request_id
+        response = await call_next(request)
+        response.headers["X-Request-ID"] = request_id
+        return response
+
+    return app
+
+
+async def _call(app, scope: dict) -> int:
+    status = 0
+    request_sent = False
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Client stays connected; disconnect listeners are cancelled when the response completes
+        await asyncio.get_running_loop().create_future()
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(dict(scope), receive, send)
+    return status
+
+
+async def run_stack(stack: str, args) -> dict:
+    app = _build_app(stack)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": PATH,
+        "raw_path": PATH.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"x-aos-key", API_KEY.encode()), (b"x-tenant-id", b"t-bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+    for _ in range(args.warmup):
+        await _call(app, scope)
+
+    latencies: list[float] = []
+    failures = 0
+
+    async def worker(count: int):
+        nonlocal failures
+        for _ in range(count):
+            start = time.perf_counter()
+            status = await _call(app, scope)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                failures += 1
+
+    per_worker, extra = divmod(args.requests, args.concurrency)
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(per_worker + (i < extra)) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "latency": _percentiles(latencies),
+        "requests_per_second": round(args.requests / elapsed, 1),
+        "non_200": failures,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20_000, help="Requests per stack")
+    parser.add_argument("--concurrency", type=int, default=1, help="Requests in flight")
+    parser.add_argument("--warmup", type=int, default=500, help="Unmeasured requests per stack")
+    args = parser.parse_args()
+    if args.requests <= 0 or args.concurrency <= 0 or args.warmup < 0:
+        parser.error("--requests and --concurrency must be positive, --warmup not negative")
+
+    import logging
+
+    import app.auth.gateway_audit as gateway_audit
+    import app.auth.rbac_middleware as rbac_middleware
+    from app.auth.onboarding_gate import OnboardingGateMiddleware
+    from app.hoc.cus.account.L5_schemas.onboarding_state import OnboardingState
+
+    async def complete(self, tenant_id):
+        return OnboardingState.COMPLETE
+
+    async def no_audit(**kwargs):
+        return None
+
+    # Middleware cost only: no tenant DB lookup, no audit write, no v2 comparison, no per-request log lines
+    OnboardingGateMiddleware._get_tenant_state = complete
+    gateway_audit.emit_auth_audit = no_audit
+    rbac_middleware.RBAC_V2_SHADOW_ENABLED = False
+    logging.disable(logging.WARNING)
+
+    print("Middleware Overhead Benchmark")
+    print(f"Requests: {args.requests:,}  Concurrency: {args.concurrency}  Endpoint: GET {PATH}")
+    print("=" * 72)
+
+    results = {}
+    for stack in ("bare", "stacked", "pipeline"):
+        result = asyncio.run(run_stack(stack, args))
+        results[stack] = result
+        if stack != "bare":
+            bare = results["bare"]["latency"]
+            result["overhead"] = {
+                "p50_us": round(result["latency"]["p50_us"] - bare["p50_us"], 2),
+                "p99_us": round(result["latency"]["p99_us"] - bare["p99_us"], 2),
+            }
+        overhead = result.get("overhead", {"p50_us": 0.0, "p99_us": 0.0})
+        print(
+            f"  {stack:<9} p50 {result['latency']['p50_us']:>9,.2f} us   p99 {result['latency']['p99_us']:>9,.2f} us   "
+            f"overhead p50 {overhead['p50_us']:>8,.2f} us   p99 {overhead['p99_us']:>8,.2f} us   "
+            f"{result['requests_per_second']:>9,.1f} req/s"
+        )
+
+    artifact_path = backend / "benchmark_middleware_overhead.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "middleware_overhead", "args": vars(args), "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
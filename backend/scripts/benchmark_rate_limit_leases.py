@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Rate limiter benchmark: per-request Redis vs leased token buckets
+# artifact_class: CODE
+"""
+Rate Limiter Lease Benchmark
+
+Drives a fixed request rate through N worker processes against one Redis
+and compares two limiters:
+
+- per_request: the previous fixed-window check (INCR + EXPIRE per request)
+- leased:      LeasedRateLimiter (token slices leased per process)
+
+Each worker paces its share of the target rate on its own event loop
+across a set of tenants. Reported per mode:
+- Redis commands/sec, from INFO total_commands_processed
+- p50 and p99 of the time each check adds to a request
+- admitted requests vs the exact bucket bound
+
+Needs a Redis REDIS_URL (or --redis-url). Keys are namespaced and
+removed afterwards.
+
+Usage:
+    REDIS_URL=redis://localhost:6379/0 python scripts/benchmark_rate_limit_leases.py
+    python scripts/benchmark_rate_limit_leases.py --rps 5000 --workers 8 --seconds 20 --tenants 50
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+PREFIX = "bench:rl"
+
+
+async def _per_request_check(redis, tenant: str, limit: int, window: int) -> bool:
+    slot = int(time.time() // window)
+    key = f"{PREFIX}:fw:{tenant}:{slot}"
+    current = await redis.incr(key)
+    if current == 1:
+        await redis.expire(key, window + 2)
+    return current <= limit
+
+
+async def _drive(mode: str, redis_url: str, worker: int, args) -> dict:
+    import redis.asyncio as aioredis
+
+    from app.utils.rate_limiter import LeasedRateLimiter
+
+    redis = aioredis.from_url(redis_url, decode_responses=True)
+
+    async def factory():
+        return redis
+
+    limiter = LeasedRateLimiter(redis_factory=factory, fail_open=True)
+    per_worker_rps = args.rps / args.workers
+    interval = 1 / per_worker_rps
+    latencies = []
+    admitted = 0
+    started = time.perf_counter()
+    n = 0
+    while time.perf_counter() - started < args.seconds:
+        tenant = f"t{(n * args.workers + worker) % args.tenants}"
+        t0 = time.perf_counter()
+        if mode == "per_request":
+            allowed = await _per_request_check(redis, tenant, args.limit, args.window)
+        else:
+            allowed = (await limiter.acquire(f"{PREFIX}:lease:{tenant}", args.limit, args.window)).allowed
+        latencies.append((time.perf_counter() - t0) * 1000)
+        admitted += allowed
+        n += 1
+        # Pace to the target rate (open loop, catching up if behind)
+        delay = started + n * interval - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    await redis.aclose()
+    return {"latencies": latencies, "admitted": admitted, "requests": n}
+
+
+def _worker(mode: str, redis_url: str, worker: int, args, queue) -> None:
+    queue.put(asyncio.run(_drive(mode, redis_url, worker, args)))
+
+
+def run_mode(mode: str, redis_url: str, args) -> dict:
+    import redis
+
+    client = redis.from_url(redis_url)
+    before = client.info("stats")["total_commands_processed"]
+
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=_worker, args=(mode, redis_url, w, args, queue)) for w in range(args.workers)]
+    t0 = time.perf_counter()
+    for p in procs:
+        p.start()
+    results = [queue.get() for _ in procs]
+    for p in procs:
+        p.join()
+    elapsed = time.perf_counter() - t0
+
+    commands = client.info("stats")["total_commands_processed"] - before
+    for key in client.scan_iter(f"{PREFIX}:*"):
+        client.delete(key)
+
+    latencies = sorted(x for r in results for x in r["latencies"])
+    requests = sum(r["requests"] for r in results)
+    return {
+        "requests": requests,
+        "achieved_rps": round(requests / args.seconds, 1),
+        "admitted": sum(r["admitted"] for r in results),
+        "redis_ops_per_sec": round(commands / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 3),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--redis-url", default=os.environ.get("REDIS_URL"))
+    parser.add_argument("--rps", type=int, default=5000, help="Total request rate across workers")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seconds", type=int, default=20)
+    parser.add_argument("--tenants", type=int, default=50)
+    parser.add_argument("--limit", type=int, default=6000, help="Requests per window per tenant")
+    parser.add_argument("--window", type=int, default=60)
+    args = parser.parse_args()
+
+    if not args.redis_url:
+        parser.error("a --redis-url (or REDIS_URL) is required")
+
+    print("Rate Limiter Lease Benchmark")
+    print(f"Target: {args.rps} req/s  Workers: {args.workers}  Tenants: {args.tenants}  Seconds: {args.seconds}")
+    print("=" * 72)
+
+    # Exact token-bucket bound per tenant over the run
+    bound = args.tenants * (args.limit + args.limit / args.window * args.seconds)
+    results = {mode: run_mode(mode, args.redis_url, args) for mode in ("per_request", "leased")}
+
+    for mode, r in results.items():
+        print(
+            f"{mode:>12}: {r['achieved_rps']:>8.1f} req/s  redis {r['redis_ops_per_sec']:>9.1f} ops/s  "
+            f"p50 {r['p50_ms']:>7.3f}ms  p99 {r['p99_ms']:>7.3f}ms  admitted {r['admitted']:,}"
+        )
+    print(f"Exact bucket bound: {bound:,.0f} admitted")
+
+    artifact_path = backend / "benchmark_rate_limit_leases.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "rate_limit_leases", "args": vars(args), "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
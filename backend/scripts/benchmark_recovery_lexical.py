@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Recovery matcher benchmark: per-layer hit rates with the lexical MinHash/LSH tier on a replayed failure corpus
+# artifact_class: CODE
+"""
+Recovery Lexical Tier Benchmark
+
+Replays a failure corpus (--failures, default 50,000) through the hybrid
+layer order cache → lexical → embedding → LLM. The corpus is built from
+the error families in app/data/failure_catalog.json: each family's
+message is rendered through a handful of templates with volatile tokens
+(request ids, hosts, ports, durations, attempts, tool names), so most
+failures are re-phrasings of a known family. --catalog-share of the
+families are seeded into the index as catalog entries; the rest are
+novel and first resolved by the simulated embedding tier
+(--embedding-recall of them) or the LLM, after which the resolution is
+learned by the index.
+
+The cache is keyed by the exact normalised-message signature (as in
+RecoveryMatcher), so it only catches verbatim repeats.
+
+Reported:
+- hit rate per layer, and the embedding/LLM calls avoided by the
+  lexical tier relative to cache → embedding → LLM
+- lexical precision (the matched recovery belongs to the failure's family)
+- LSH recall: lexical hits / queries whose brute-force best Jaccard is at
+  or above the threshold (sampled with --recall-samples)
+- lexical lookup p50/p99 vs a brute-force Jaccard scan of the index
+
+    python scripts/benchmark_recovery_lexical.py
+    python scripts/benchmark_recovery_lexical.py --threshold 0.5 --bands 32
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import statistics
+import sys
+import time
+import uuid
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+TEMPLATES = (
+    "{msg} (request_id={uuid})",
+    "{msg} after {ms}ms calling {host}:{port}",
+    "{tool} failed: {msg} [attempt {attempt}/5]",
+    "error in step {step} of run {uuid}: {msg}",
+)
+TOOLS = ("http_call", "llm_invoke", "web_search", "db_query", "file_read", "email_send")
+HOSTS = ("api", "search", "billing", "vector", "auth", "gateway")
+
+
+def _percentiles(samples: list[float]) -> dict:
+    if not samples:
+        return {"p50_us": 0.0, "p99_us": 0.0, "count": 0}
+    ordered = sorted(samples)
+    return {
+        "p50_us": round(statistics.median(ordered) * 1e6, 2),
+        "p99_us": round(ordered[max(0, int(len(ordered) * 0.99) - 1)] * 1e6, 2),
+        "count": len(ordered),
+    }
+
+
+def _families() -> list[dict]:
+    catalog = json.loads((backend / "app" / "data" / "failure_catalog.json").read_text())
+    return [
+        {
+            "code": code,
+            "message": entry["message"],
+            "recovery": (entry.get("recovery_suggestions") or [f"Handle {code}"])[0],
+        }
+        for code, entry in catalog["errors"].items()
+    ]
+
+
+def _render(rng: random.Random, family: dict, template: str) -> str:
+    return template.format(
+        msg=family["message"],
+        uuid=uuid.UUID(int=rng.getrandbits(128)),
+        ms=rng.randint(50, 60_000),
+        host=f"{rng.choice(HOSTS)}-{rng.randint(1, 40)}.internal",
+        port=rng.choice((443, 8080, 8443, 5432, 6379)),
+        attempt=rng.randint(1, 5),
+        step=rng.randint(1, 30),
+        tool=rng.choice(TOOLS),
+    )
+
+
+def run(args) -> dict:
+    from app.hoc.cus.policies.L6_drivers.failure_signature_index import (
+        FailureSignatureIndex,
+        RecoveryLayerStats,
+        canonicalize,
+        jaccard,
+        shingles,
+    )
+
+    rng = random.Random(args.seed)
+    families = _families()
+    rng.shuffle(families)
+    seeded = families[: int(len(families) * args.catalog_share)]
+    # Family weights are skewed: a few failure kinds dominate production
+    weights = [1.0 / (rank + 1) ** 0.8 for rank in range(len(families))]
+
+    index = FailureSignatureIndex(threshold=args.threshold, num_perm=args.permutations, bands=args.bands)
+    index.load(
+        (
+            {
+                "id": i,
+                "error_code": family["code"],
+                "error_pattern": _render(rng, family, template),
+                "recovery_action": family["recovery"],
+            }
+            for i, family in enumerate(seeded)
+            for template in TEMPLATES
+        ),
+    )
+    recovery_family = {family["recovery"]: family["code"] for family in families}
+
+    stats = RecoveryLayerStats()
+    baseline = RecoveryLayerStats()
+    cache: set[str] = set()
+    baseline_cache: set[str] = set()
+    lexical_s: list[float] = []
+    brute_s: list[float] = []
+    correct = 0
+    recall_eligible = 0
+    recall_found = 0
+
+    for i in range(args.failures):
+        family = rng.choices(families, weights)[0]
+        message = _render(rng, family, rng.choice(TEMPLATES))
+        normalized = message.lower().strip()[:500]
+        signature = hashlib.sha256(f"{family['code']}:{normalized}".encode()).hexdigest()[:16]
+        resolve_expensive = rng.random()
+
+        # Baseline: cache → embedding → LLM
+        if signature in baseline_cache:
+            baseline.record("cache", True)
+        else:
+            baseline.record("cache", False)
+            embedding_hit = resolve_expensive < args.embedding_recall
+            baseline.record("embedding", embedding_hit)
+            if not embedding_hit:
+                baseline.record("llm", True)
+            baseline_cache.add(signature)
+
+        # With the lexical tier
+        if signature in cache:
+            stats.record("cache", True)
+            continue
+        stats.record("cache", False)
+
+        t0 = time.perf_counter()
+        match = index.lookup(normalized, family["code"])
+        lexical_s.append(time.perf_counter() - t0)
+        stats.record("lexical", match is not None)
+
+        if i % max(1, args.failures // args.recall_samples) == 0:
+            query = shingles(canonicalize(normalized))
+            t0 = time.perf_counter()
+            best = max((jaccard(query, entry.shingles) for entry in index._entries.values()), default=0.0)
+            brute_s.append(time.perf_counter() - t0)
+            if best >= args.threshold:
+                recall_eligible += 1
+                recall_found += match is not None
+
+        if match is not None:
+            correct += recovery_family.get(match.entry.recovery_action) == family["code"]
+        else:
+            embedding_hit = resolve_expensive < args.embedding_recall
+            stats.record("embedding", embedding_hit)
+            if not embedding_hit:
+                stats.record("llm", True)
+            index.add(
+                normalized,
+                error_code=family["code"],
+                recovery_action=family["recovery"],
+                source="embedding" if embedding_hit else "llm",
+            )
+        cache.add(signature)
+
+    layers = stats.snapshot()
+    base_layers = baseline.snapshot()
+    expensive = layers["embedding"]["lookups"] + layers["llm"]["lookups"]
+    base_expensive = base_layers["embedding"]["lookups"] + base_layers["llm"]["lookups"]
+    lexical_hits = layers["lexical"]["hits"]
+    return {
+        "failures": args.failures,
+        "families": len(families),
+        "seeded_families": len(seeded),
+        "index_size": len(index),
+        "layers": {name: {k: layer[k] for k in ("lookups", "hits", "hit_rate")} for name, layer in layers.items()},
+        "baseline_layers": {
+            name: {k: layer[k] for k in ("lookups", "hits", "hit_rate")} for name, layer in base_layers.items()
+        },
+        "expensive_calls": expensive,
+        "baseline_expensive_calls": base_expensive,
+        "expensive_calls_avoided": round(1 - expensive / base_expensive, 4) if base_expensive else 0.0,
+        "llm_calls": layers["llm"]["lookups"],
+        "baseline_llm_calls": base_layers["llm"]["lookups"],
+        "lexical_precision": round(correct / lexical_hits, 4) if lexical_hits else 0.0,
+        "lsh_recall": round(recall_found / recall_eligible, 4) if recall_eligible else 0.0,
+        "lexical_lookup": _percentiles(lexical_s),
+        "brute_force_scan": _percentiles(brute_s),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--failures", type=int, default=50_000, help="Failures to replay")
+    parser.add_argument("--threshold", type=float, default=0.6, help="Jaccard threshold for a lexical match")
+    parser.add_argument("--permutations", type=int, default=64, help="MinHash permutations")
+    parser.add_argument("--bands", type=int, default=16, help="LSH bands (must divide --permutations)")
+    parser.add_argument("--catalog-share", type=float, default=0.6, help="Share of families seeded as catalog")
+    parser.add_argument("--embedding-recall", type=float, default=0.7, help="Share of misses the embedding tier resolves")
+    parser.add_argument("--recall-samples", type=int, default=500, help="Lookups also checked by brute force")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    if args.failures <= 0 or args.recall_samples <= 0:
+        parser.error("--failures and --recall-samples must be positive")
+
+    print("Recovery Lexical Tier Benchmark")
+    print(
+        f"Failures: {args.failures:,}  Threshold: {args.threshold}  "
+        f"MinHash: {args.permutations} perms / {args.bands} bands  Catalog share: {args.catalog_share}"
+    )
+    print("=" * 72)
+
+    result = run(args)
+    print(
+        f"  families {result['families']} ({result['seeded_families']} seeded)   index size {result['index_size']:,}"
+    )
+    print(f"  {'layer':<10} {'lookups':>10} {'hits':>10} {'hit rate':>9}    baseline lookups / hit rate")
+    for name, layer in result["layers"].items():
+        base = result["baseline_layers"][name]
+        print(
+            f"  {name:<10} {layer['lookups']:>10,} {layer['hits']:>10,} {layer['hit_rate']:>9.2%}"
+            f"    {base['lookups']:>10,} / {base['hit_rate']:.2%}"
+        )
+    print(
+        f"  embedding+LLM calls {result['expensive_calls']:,} vs {result['baseline_expensive_calls']:,} "
+        f"without lexical ({result['expensive_calls_avoided']:.1%} avoided); "
+        f"LLM {result['llm_calls']:,} vs {result['baseline_llm_calls']:,}"
+    )
+    print(f"  lexical precision {result['lexical_precision']:.2%}   LSH recall {result['lsh_recall']:.2%}")
+    for name in ("lexical_lookup", "brute_force_scan"):
+        stats = result[name]
+        print(f"  {name:<17} p50 {stats['p50_us']:>10,.2f} us   p99 {stats['p99_us']:>10,.2f} us   n={stats['count']:,}")
+
+    artifact_path = backend / "benchmark_recovery_lexical.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "recovery_lexical", "args": vars(args), "results": result}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
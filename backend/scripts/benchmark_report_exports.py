@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Evidence report export latency benchmark (inline vs render pipeline)
+# artifact_class: CODE
+"""
+Evidence Report Export Benchmark
+
+Serves a small FastAPI app in-process (httpx ASGI transport, one event loop
+like one API worker) and fires concurrent PDF exports while probing a
+lightweight /health route. It runs two modes:
+
+- inline:   EvidenceReportGenerator.generate() called in the request handler
+- pipeline: ReportRenderPipeline (process pool + disk cache), streamed response
+
+Reported per mode: /health latency (p50/p99/max, from when each probe was
+due) while exports run, export latency, and for the pipeline a second round
+that is served from the cache.
+
+Usage:
+    python scripts/benchmark_report_exports.py
+    python scripts/benchmark_report_exports.py --exports 16 --events 2000 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+
+def make_evidence(incident_id: str, events: int):
+    from app.services.evidence_report import build_incident_evidence
+
+    return build_incident_evidence(
+        incident_id=incident_id,
+        tenant_id="t_bench",
+        tenant_name="Bench Corp",
+        user_id="u_bench",
+        product_name="Support Bot",
+        model_id="gpt-4o",
+        timestamp="2025-01-01T00:00:00Z",
+        user_input="Is my contract renewing automatically?",
+        context_data={f"field_{i}": (None if i % 5 == 0 else f"value {i}") for i in range(40)},
+        ai_output="Yes, your contract renews automatically on the 1st. " * 20,
+        policy_results=[
+            {"policy": f"POLICY_{i}", "result": "PASS" if i % 4 else "FAIL", "reason": "evaluated " * 8}
+            for i in range(30)
+        ],
+        timeline_events=[
+            {"time": f"00:{i // 60:02d}:{i % 60:02d}", "event": f"STEP_{i}", "details": "trace step detail " * 6}
+            for i in range(events)
+        ],
+    )
+
+
+def build_app(mode: str, evidence_by_id: dict, pipeline):
+    from fastapi import FastAPI, Response
+    from fastapi.responses import StreamingResponse
+
+    from app.services.evidence_report import EvidenceReportGenerator
+
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+    @app.get("/export/{incident_id}")
+    async def export(incident_id: str):
+        evidence = evidence_by_id[incident_id]
+        if mode == "inline":
+            pdf = EvidenceReportGenerator(is_demo=False).generate(evidence)
+            return Response(content=pdf, media_type="application/pdf")
+        report = await pipeline.render_incident_report(evidence, is_demo=False)
+        return StreamingResponse(report.stream(), media_type="application/pdf")
+
+    return app
+
+
+def _summary(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 2),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+async def run_round(client, incident_ids: list, probe_interval: float) -> dict:
+    health_ms = []
+    export_ms = []
+    done = asyncio.Event()
+
+    async def probe():
+        # Latency is measured from when each probe was due, so time spent
+        # waiting for a blocked event loop counts against it.
+        due = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            await client.get("/health")
+            health_ms.append((time.perf_counter() - due) * 1000)
+            due = max(due + probe_interval, time.perf_counter())
+
+    async def export(incident_id):
+        t0 = time.perf_counter()
+        response = await client.get(f"/export/{incident_id}")
+        assert response.status_code == 200 and response.content.startswith(b"%PDF"), response.status_code
+        export_ms.append((time.perf_counter() - t0) * 1000)
+
+    prober = asyncio.create_task(probe())
+    await asyncio.sleep(0)
+    t0 = time.perf_counter()
+    await asyncio.gather(*(export(i) for i in incident_ids))
+    wall_s = time.perf_counter() - t0
+    done.set()
+    await prober
+
+    return {"wall_s": round(wall_s, 2), "health": _summary(health_ms), "export": _summary(export_ms)}
+
+
+async def benchmark(mode: str, args, evidence_by_id: dict, cache_dir: str) -> dict:
+    import httpx
+
+    from app.services.evidence_report import ReportCache, ReportRenderPipeline
+
+    pipeline = None
+    if mode == "pipeline":
+        pipeline = ReportRenderPipeline(cache=ReportCache(root=cache_dir), max_workers=args.workers)
+        # Spawn workers up front so process start-up is not billed to the first round
+        await asyncio.gather(
+            *(
+                pipeline.render_incident_report(make_evidence(f"warmup_{i}", 1), is_demo=False)
+                for i in range(args.workers)
+            )
+        )
+
+    app = build_app(mode, evidence_by_id, pipeline)
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=600) as client:
+            results = {"cold": await run_round(client, list(evidence_by_id), args.probe_interval)}
+            if pipeline is not None:
+                results["cached"] = await run_round(client, list(evidence_by_id), args.probe_interval)
+    finally:
+        if pipeline is not None:
+            pipeline.shutdown()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--exports", type=int, default=8, help="Concurrent exports per round")
+    parser.add_argument("--events", type=int, default=1000, help="Timeline events per report")
+    parser.add_argument("--workers", type=int, default=2, help="Render pool size")
+    parser.add_argument("--probe-interval", type=float, default=0.01, help="Seconds between /health probes")
+    args = parser.parse_args()
+
+    evidence_by_id = {f"inc_{i}": make_evidence(f"inc_{i}", args.events) for i in range(args.exports)}
+
+    print("Evidence Report Export Benchmark")
+    print(f"Exports: {args.exports}  Timeline events: {args.events}  Workers: {args.workers}")
+    print("=" * 72)
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="report-bench-") as cache_dir:
+        for mode in ("inline", "pipeline"):
+            results[mode] = asyncio.run(benchmark(mode, args, evidence_by_id, cache_dir))
+
+    for mode, rounds in results.items():
+        for name, r in rounds.items():
+            h, e = r["health"], r["export"]
+            print(
+                f"{mode:>8}/{name:<6} wall {r['wall_s']:>6.2f}s  "
+                f"health p50 {h['p50_ms']:>8.2f}ms p99 {h['p99_ms']:>8.2f}ms max {h['max_ms']:>8.2f}ms  "
+                f"export p50 {e['p50_ms']:>8.2f}ms"
+            )
+
+    artifact_path = backend / "benchmark_report_exports.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "report_exports", "args": vars(args), "results": results}, f, indent=2)
+    print(f"\nArtifact written to: {artifact_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Offline IAEC whitening matrix builder
+# artifact_class: CODE
+"""
+Build the IAEC whitening artifact offline.
+
+Streams embeddings from one or more .npy files (each (N, D), opened with
+mmap) through StreamingCovariance in fixed-size batches, so the corpus never
+has to fit in RAM. Writes the versioned, non-pickled artifact that composers
+map at startup.
+
+Long builds can checkpoint accumulator state and resume:
+
+    python scripts/build_iaec_whitening.py emb_0.npy emb_1.npy --checkpoint /tmp/wht.state.npz
+    python scripts/build_iaec_whitening.py emb_2.npy --checkpoint /tmp/wht.state.npz --resume
+
+Options:
+    --batch-size    Rows per streamed batch (default 4096)
+    --output-dir    Artifact directory (default IAEC_WHITENING_DIR)
+    --force         Overwrite an existing artifact for this version
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("embeddings", nargs="+", help=".npy files of shape (N, D)")
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--checkpoint", default=None, help="Accumulator state file (.npz)")
+    parser.add_argument("--resume", action="store_true", help="Continue from --checkpoint")
+    parser.add_argument("--force", action="store_true")
+    args = parser.parse_args()
+
+    from app.memory import iaec
+
+    if args.output_dir:
+        iaec.WHITENING_STORAGE_DIR = args.output_dir
+
+    if args.resume:
+        if not args.checkpoint or not os.path.exists(args.checkpoint):
+            parser.error("--resume needs an existing --checkpoint")
+        acc = iaec.StreamingCovariance.load(args.checkpoint)
+        print(f"Resumed from {args.checkpoint} ({acc.count} samples)")
+    else:
+        acc = iaec.StreamingCovariance()
+
+    start = time.perf_counter()
+    for path in args.embeddings:
+        data = np.load(path, mmap_mode="r", allow_pickle=False)
+        if data.ndim != 2:
+            parser.error(f"{path}: expected a 2-D array, got shape {data.shape}")
+        for offset in range(0, data.shape[0], args.batch_size):
+            acc.update(data[offset : offset + args.batch_size])
+        print(f"  {path}: {data.shape[0]} rows (total {acc.count})")
+        if args.checkpoint:
+            acc.save(args.checkpoint)
+
+    base = iaec.whitening_artifact_base(iaec.TemporalSignature.current().version_key())
+    if os.path.exists(f"{base}.json") and not args.force:
+        print(f"Artifact already exists at {base}.npy (immutable per version; use --force to replace)")
+        return 1
+
+    matrix = iaec.compute_whitening_matrix(acc.mean, acc.covariance())
+    metadata = iaec.write_whitening_artifact(base, matrix, acc.mean, samples=acc.count)
+
+    print(f"\nWrote {base}.npy in {time.perf_counter() - start:.1f}s")
+    print(f"  precision={metadata['precision']} shape={metadata['shape']} samples={metadata['samples']}")
+    print(f"  sha256={metadata['matrix_sha256'][:16]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual | build
+#   Execution: sync
+# Role: Build the prebuilt OpenAPI schema artifact served at boot
+# artifact_class: CODE
+"""
+Build the OpenAPI schema artifact.
+
+Imports the app, generates the schema once and writes it, with the app
+version and route fingerprint, to app/openapi_schema.json. main.py serves
+it instead of generating the schema on the first /openapi.json.
+
+Run after changing routes or response models (tests/test_openapi_artifact.py
+fails until you do). The Docker build runs it too.
+
+    python scripts/build_openapi_artifact.py
+    python scripts/build_openapi_artifact.py --check   # exit 1 if stale
+    python scripts/build_openapi_artifact.py --output /tmp/openapi_schema.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=None, help="Artifact path (default: app/openapi_schema.json)")
+    parser.add_argument("--check", action="store_true", help="Only verify the existing artifact is current")
+    args = parser.parse_args()
+
+    from app.main import app
+    from app.startup import openapi_artifact
+
+    path = Path(args.output) if args.output else openapi_artifact.ARTIFACT_PATH
+
+    t0 = time.perf_counter()
+    if args.check:
+        try:
+            current = json.loads(path.read_text())
+        except FileNotFoundError:
+            print(f"Missing artifact: {path}")
+            return 1
+        fresh = openapi_artifact.generate_schema(app)
+        if (
+            current.get("route_fingerprint") != openapi_artifact.route_fingerprint(app)
+            or current.get("app_version") != app.version
+            or current.get("schema") != fresh
+        ):
+            print(f"Stale artifact: {path}")
+            print("Run: python scripts/build_openapi_artifact.py")
+            return 1
+        print(f"Artifact is current: {path}")
+        return 0
+
+    artifact = openapi_artifact.build_artifact(app, path)
+    elapsed = time.perf_counter() - t0
+    print(f"Wrote {path}")
+    print(f"  app_version:       {artifact['app_version']}")
+    print(f"  route_fingerprint: {artifact['route_fingerprint'][:16]}...")
+    print(f"  paths:             {len(artifact['schema'].get('paths', {}))}")
+    print(f"  size:              {path.stat().st_size / 1024:.0f} KiB")
+    print(f"  generated in:      {elapsed:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+# Layer: L8 — Operational Script
+# AUDIENCE: INTERNAL
+# Product: system-wide
+# Temporal:
+#   Trigger: manual
+#   Execution: sync
+# Role: Replay harness: streaming vs batch cost anomaly detection
+# artifact_class: CODE
+"""
+Cost Anomaly Replay Harness
+
+Feeds a historical cost stream, one day at a time, to both detectors:
+
+- batch:     CostAnomalyDetector against Postgres (records inserted into a
+             scratch schema day by day, detector.today set to the day)
+- streaming: StreamingCostAnomalyDetector fed the same records in memory
+
+It reports any day where the two disagree, plus per-tick detection time.
+The stream comes from a JSONL file (tenant_id, user_id, feature_tag,
+input_tokens, cost_cents, is_retry, created_at) or is generated.
+
+Needs a Postgres DATABASE_URL (or --database-url). The scratch schema is
+dropped afterwards.
+
+Usage:
+    DATABASE_URL=postgresql://... python scripts/replay_cost_anomalies.py
+    python scripts/replay_cost_anomalies.py --input stream.jsonl --tenant t_123
+    python scripts/replay_cost_anomalies.py --days 90 --users 200
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add backend to path
+backend = Path(__file__).parent.parent
+sys.path.insert(0, str(backend))
+
+SCHEMA = "replay_cost_anomalies"
+
+SCRATCH_TABLES = """
+    CREATE TABLE cost_records (
+        id VARCHAR(64) PRIMARY KEY,
+        tenant_id VARCHAR(64) NOT NULL,
+        user_id VARCHAR(64),
+        feature_tag VARCHAR(64),
+        model VARCHAR(64) NOT NULL DEFAULT 'replay',
+        input_tokens INTEGER NOT NULL DEFAULT 0,
+        output_tokens INTEGER NOT NULL DEFAULT 0,
+        cost_cents FLOAT NOT NULL,
+        is_retry BOOLEAN NOT NULL DEFAULT false,
+        created_at TIMESTAMP NOT NULL
+    );
+    CREATE INDEX ix_replay_cost_records ON cost_records (tenant_id, created_at);
+    CREATE TABLE cost_breach_history (
+        id VARCHAR(32) PRIMARY KEY,
+        tenant_id VARCHAR(64) NOT NULL,
+        entity_type VARCHAR(32) NOT NULL,
+        entity_id VARCHAR(128),
+        breach_type VARCHAR(32) NOT NULL,
+        breach_date DATE NOT NULL,
+        deviation_pct FLOAT NOT NULL,
+        current_value_cents FLOAT NOT NULL,
+        baseline_value_cents FLOAT NOT NULL,
+        created_at TIMESTAMPTZ DEFAULT NOW(),
+        CONSTRAINT uq_breach_per_entity_day UNIQUE (tenant_id, entity_type, entity_id, breach_type, breach_date)
+    );
+    -- No per-entity unique constraint here: the batch detector inserts a new
+    -- tracker after deactivating the old one, which uq_drift_tracker_per_entity rejects.
+    CREATE TABLE cost_drift_tracking (
+        id VARCHAR(32) PRIMARY KEY,
+        tenant_id VARCHAR(64) NOT NULL,
+        entity_type VARCHAR(32) NOT NULL,
+        entity_id VARCHAR(128),
+        rolling_7d_avg_cents FLOAT NOT NULL,
+        baseline_7d_avg_cents FLOAT NOT NULL,
+        drift_pct FLOAT NOT NULL,
+        drift_days_count INTEGER NOT NULL DEFAULT 1,
+        first_drift_date DATE NOT NULL,
+        last_check_date DATE NOT NULL,
+        is_active BOOLEAN NOT NULL DEFAULT true,
+        created_at TIMESTAMPTZ DEFAULT NOW(),
+        updated_at TIMESTAMPTZ DEFAULT NOW()
+    );
+"""
+
+
+def load_stream(path: str) -> list:
+    records = []
+    with open(path) as f:
+        for line in f:
+            if line.strip():
+                row = json.loads(line)
+                row["created_at"] = datetime.fromisoformat(row["created_at"]).replace(tzinfo=None)
+                row.setdefault("is_retry", False)
+                row.setdefault("input_tokens", 0)
+                records.append(SimpleNamespace(**row))
+    return records
+
+
+def synthetic_stream(tenant_id: str, start: date, days: int, users: int, seed: int = 7) -> list:
+    """Steady traffic with random multi-day user spikes and a late tenant-wide ramp."""
+    rng = random.Random(seed)
+    spikes = {(f"u{rng.randrange(users)}", rng.randrange(15, days)) for _ in range(max(1, users // 5))}
+    features = ["chat", "search", "summarize", None]
+    records = []
+    for offset in range(days):
+        day = start + timedelta(days=offset)
+        ramp = 1.0 + max(0, offset - int(days * 0.7)) * 0.05
+        for u in range(users):
+            user = f"u{u}"
+            spike = any((user, offset - k) in spikes for k in range(3))
+            for _ in range(rng.randint(2, 6) * (3 if spike else 1)):
+                records.append(
+                    SimpleNamespace(
+                        tenant_id=tenant_id,
+                        user_id=user,
+                        feature_tag=rng.choice(features),
+                        input_tokens=rng.randint(100, 600),
+                        cost_cents=round(rng.uniform(5, 15) * ramp, 4),
+                        is_retry=rng.random() < 0.05,
+                        created_at=datetime.combine(day, datetime.min.time())
+                        + timedelta(seconds=rng.randint(0, 86399)),
+                    )
+                )
+    return records
+
+
+def anomaly_key(anomaly) -> tuple:
+    return (
+        anomaly.anomaly_type.value,
+        anomaly.entity_type,
+        anomaly.entity_id or "",
+        anomaly.severity.value,
+        anomaly.breach_count,
+        anomaly.derived_cause.value,
+        round(anomaly.current_value_cents, 4),
+        round(anomaly.expected_value_cents, 4),
+        round(anomaly.deviation_pct, 4),
+    )
+
+
+async def replay(session, text, records: list, tenant_id: str, start: date, end: date) -> dict:
+    from app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine import (
+        CostAnomalyDetector,
+        StreamingCostAnomalyDetector,
+    )
+
+    by_day = defaultdict(list)
+    for record in records:
+        by_day[record.created_at.date()].append(record)
+
+    streaming = StreamingCostAnomalyDetector()
+    mismatches = []
+    anomaly_count = 0
+    batch_ms = []
+    stream_ms = []
+
+    day = start
+    while day <= end:
+        rows = by_day.get(day, [])
+        if rows:
+            session.execute(
+                text(
+                    """
+                    INSERT INTO cost_records (id, tenant_id, user_id, feature_tag, input_tokens, cost_cents, is_retry, created_at)
+                    VALUES (:id, :tenant_id, :user_id, :feature_tag, :input_tokens, :cost_cents, :is_retry, :created_at)
+                """
+                ),
+                [
+                    {
+                        "id": f"cr_{day:%Y%m%d}_{i}",
+                        "tenant_id": r.tenant_id,
+                        "user_id": r.user_id,
+                        "feature_tag": r.feature_tag,
+                        "input_tokens": r.input_tokens,
+                        "cost_cents": r.cost_cents,
+                        "is_retry": bool(r.is_retry),
+                        "created_at": r.created_at,
+                    }
+                    for i, r in enumerate(rows)
+                ],
+            )
+            session.commit()
+
+        batch = CostAnomalyDetector(session)
+        batch.today = day
+        t0 = time.perf_counter()
+        expected = await batch.detect_absolute_spikes(tenant_id)
+        expected += await batch.detect_sustained_drift(tenant_id)
+        batch_ms.append((time.perf_counter() - t0) * 1000)
+
+        streaming.observe_many(rows)
+        t0 = time.perf_counter()
+        found = await streaming.detect_all(tenant_id, today=day)
+        stream_ms.append((time.perf_counter() - t0) * 1000)
+
+        anomaly_count += len(expected)
+        if sorted(map(anomaly_key, found)) != sorted(map(anomaly_key, expected)):
+            mismatches.append(
+                {
+                    "day": day.isoformat(),
+                    "batch": sorted(map(anomaly_key, expected)),
+                    "streaming": sorted(map(anomaly_key, found)),
+                }
+            )
+        day += timedelta(days=1)
+
+    return {
+        "days": (end - start).days + 1,
+        "records": len(records),
+        "anomalies": anomaly_count,
+        "mismatches": mismatches,
+        "batch_tick_ms_avg": round(sum(batch_ms) / len(batch_ms), 2),
+        "streaming_tick_ms_avg": round(sum(stream_ms) / len(stream_ms), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", default=os.environ.get("DATABASE_URL"))
+    parser.add_argument("--input", default=None, help="JSONL cost stream (default: synthetic)")
+    parser.add_argument("--tenant", default="t_replay")
+    parser.add_argument("--days", type=int, default=60)
+    parser.add_argument("--users", type=int, default=25)
+    parser.add_argument("--keep", action="store_true", help="Keep the scratch schema")
+    args = parser.parse_args()
+
+    if not args.database_url:
+        parser.error("a Postgres --database-url (or DATABASE_URL) is required")
+
+    from sqlalchemy import create_engine, event, text
+    from sqlmodel import Session
+
+    from app.db import CostBudget
+
+    if args.input:
+        records = [r for r in load_stream(args.input) if r.tenant_id == args.tenant]
+        if not records:
+            parser.error(f"no records for tenant {args.tenant} in {args.input}")
+        start = min(r.created_at for r in records).date()
+        end = max(r.created_at for r in records).date()
+    else:
+        start = date.today() - timedelta(days=args.days)
+        end = start + timedelta(days=args.days - 1)
+        records = synthetic_stream(args.tenant, start, args.days, args.users)
+
+    url = args.database_url.replace("postgresql+asyncpg://", "postgresql://")
+    engine = create_engine(url)
+
+    @event.listens_for(engine, "connect")
+    def _scratch_search_path(dbapi_connection, _record):
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {SCHEMA}; SET search_path TO {SCHEMA}")
+        dbapi_connection.commit()
+
+    print("Cost Anomaly Replay Harness")
+    print(f"Tenant: {args.tenant}  Days: {start} .. {end}  Records: {len(records):,}")
+    print("=" * 72)
+
+    with engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        conn.execute(text(f"SET search_path TO {SCHEMA}"))
+        conn.execute(text(SCRATCH_TABLES))
+        CostBudget.__table__.create(conn)
+
+    try:
+        with Session(engine) as session:
+            result = asyncio.run(replay(session, text, records, args.tenant, start, end))
+    finally:
+        if not args.keep:
+            with engine.begin() as conn:
+                conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+    print(f"Anomalies (batch): {result['anomalies']}")
+    print(f"Tick time: batch {result['batch_tick_ms_avg']}ms, streaming {result['streaming_tick_ms_avg']}ms")
+    if result["mismatches"]:
+        print(f"MISMATCH on {len(result['mismatches'])} day(s):")
+        for mismatch in result["mismatches"][:10]:
+            print(f"  {mismatch['day']}: batch={mismatch['batch']} streaming={mismatch['streaming']}")
+    else:
+        print("Streaming detector matches batch on every day")
+
+    artifact_path = backend / "replay_cost_anomalies.json"
+    with open(artifact_path, "w") as f:
+        json.dump({"benchmark": "cost_anomaly_replay", **result}, f, indent=2, default=str)
+    print(f"\nArtifact written to: {artifact_path}")
+    return 1 if result["mismatches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
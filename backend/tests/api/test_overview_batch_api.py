@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.hoc.api.cus.overview import overview_batch
+from app.hoc.app import build_hoc_router
+
+
+class FakeRegistry:
+    def __init__(self) -> None:
+        self.batches: list[dict] = []
+
+    async def execute_many(self, operations, tenant_id, session=None, session_factory=None, lanes=1):
+        self.batches.append({"tenant_id": tenant_id, "operations": list(operations), "lanes": lanes})
+        results = []
+        for op in operations:
+            if op.params["method"] == "list_incidents":
+                results.append(
+                    SimpleNamespace(
+                        success=False,
+                        data=None,
+                        error="boom",
+                        error_code="HANDLER_EXCEPTION:ValueError",
+                        duration_ms=1.5,
+                    )
+                )
+            else:
+                results.append(
+                    SimpleNamespace(
+                        success=True,
+                        data={"operation": op.operation, "params": op.params},
+                        error=None,
+                        error_code=None,
+                        duration_ms=2.25,
+                    )
+                )
+        succeeded = sum(1 for r in results if r.success)
+        return SimpleNamespace(
+            results=results,
+            succeeded=succeeded,
+            failed=len(results) - succeeded,
+            duration_ms=4.0,
+        )
+
+
+def _build_client(monkeypatch, denied: set[tuple[str, str]] = frozenset()):
+    registry = FakeRegistry()
+    permission_checks: list[tuple[str, str]] = []
+
+    async def fake_check(resource, action, request):
+        permission_checks.append((resource, action))
+        allowed = (resource, action) not in denied
+        return SimpleNamespace(allowed=allowed, reason=None if allowed else "denied")
+
+    app = FastAPI()
+    app.include_router(overview_batch.router)
+    app.dependency_overrides[overview_batch.get_session_dep] = lambda: object()
+
+    monkeypatch.setattr(overview_batch, "get_tenant_id_from_auth", lambda _request: "tenant-test")
+    monkeypatch.setattr(overview_batch, "get_operation_registry", lambda: registry)
+    monkeypatch.setattr(overview_batch, "check_permission_request", fake_check)
+    monkeypatch.setattr(overview_batch, "get_read_session_factory", lambda: object())
+
+    return TestClient(app), registry, permission_checks
+
+
+def test_route_registered_once():
+    hoc_router = build_hoc_router()
+    paths = [route.path for route in hoc_router.routes if hasattr(route, "path")]
+
+    assert paths.count("/cus/overview/batch") == 1
+
+
+def test_batch_dispatches_once_with_per_item_results(monkeypatch):
+    client, registry, permission_checks = _build_client(monkeypatch)
+
+    response = client.post(
+        "/cus/overview/batch",
+        json={
+            "items": [
+                {"id": "pulse", "operation": "overview.query", "method": "get_highlights"},
+                {"operation": "incidents.query", "method": "list_incidents", "params": {"limit": 10}},
+                {"operation": "controls.query", "method": "list_controls"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(registry.batches) == 1
+    batch = registry.batches[0]
+    assert batch["tenant_id"] == "tenant-test"
+    assert batch["lanes"] == overview_batch.BATCH_SESSION_LANES
+    assert [op.params["method"] for op in batch["operations"]] == [
+        "get_highlights",
+        "list_incidents",
+        "list_controls",
+    ]
+    assert batch["operations"][1].params == {"limit": 10, "method": "list_incidents"}
+
+    assert [r["id"] for r in body["results"]] == ["pulse", None, None]
+    assert body["results"][0]["success"] is True
+    assert body["results"][1] == {
+        "id": None,
+        "operation": "incidents.query",
+        "method": "list_incidents",
+        "success": False,
+        "data": None,
+        "error": "boom",
+        "error_code": "HANDLER_EXCEPTION:ValueError",
+        "duration_ms": 1.5,
+    }
+    assert (body["succeeded"], body["failed"]) == (2, 1)
+
+    # One check per distinct permission, not per item
+    assert sorted(permission_checks) == [("incident", "read"), ("runtime", "query")]
+
+
+def test_non_batchable_operation_rejected(monkeypatch):
+    client, registry, _ = _build_client(monkeypatch)
+
+    response = client.post(
+        "/cus/overview/batch",
+        json={"items": [{"operation": "account.query", "method": "get_profile"}]},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["field_errors"][0]["field"] == "items[0].operation"
+    assert registry.batches == []
+
+
+def test_write_method_rejected(monkeypatch):
+    client, registry, _ = _build_client(monkeypatch)
+
+    response = client.post(
+        "/cus/overview/batch",
+        json={"items": [{"operation": "logs.query", "method": "get_llm_run_export"}]},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["field_errors"][0]["field"] == "items[0].method"
+    assert registry.batches == []
+
+
+def test_reserved_params_rejected(monkeypatch):
+    client, registry, _ = _build_client(monkeypatch)
+
+    for key in ("tenant_id", "method", "_invariant_mode"):
+        response = client.post(
+            "/cus/overview/batch",
+            json={"items": [{"operation": "overview.query", "method": "get_costs", "params": {key: "x"}}]},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"]["field_errors"][0]["field"] == f"items[0].params.{key}"
+    assert registry.batches == []
+
+
+def test_limit_capped(monkeypatch):
+    client, registry, _ = _build_client(monkeypatch)
+
+    response = client.post(
+        "/cus/overview/batch",
+        json={
+            "items": [
+                {
+                    "operation": "incidents.query",
+                    "method": "list_incidents",
+                    "params": {"limit": overview_batch.MAX_ITEM_LIMIT + 1},
+                }
+            ]
+        },
+    )
+
+    assert response.status_code == 400
+    assert registry.batches == []
+
+
+def test_batch_size_bounded(monkeypatch):
+    client, registry, _ = _build_client(monkeypatch)
+    item = {"operation": "overview.query", "method": "get_costs"}
+
+    assert client.post("/cus/overview/batch", json={"items": []}).status_code == 422
+    response = client.post(
+        "/cus/overview/batch",
+        json={"items": [item] * (overview_batch.MAX_BATCH_ITEMS + 1)},
+    )
+    assert response.status_code == 422
+    assert registry.batches == []
+
+
+def test_permission_denied_rejects_whole_batch(monkeypatch):
+    client, registry, _ = _build_client(monkeypatch, denied={("integration", "read")})
+
+    response = client.post(
+        "/cus/overview/batch",
+        json={
+            "items": [
+                {"operation": "overview.query", "method": "get_costs"},
+                {"operation": "integrations.query", "method": "list_integrations"},
+            ]
+        },
+    )
+
+    assert response.status_code == 403
+    assert registry.batches == []
@@ -15,6 +15,7 @@ class FakeRegistry:
     def __init__(self) -> None:
         self.calls: list[dict] = []
         self.data_by_method: dict[str, SimpleNamespace] = {}
+        self.errors_by_method: dict[str, tuple[str, str]] = {}
 
     async def execute(self, operation: str, ctx) -> SimpleNamespace:
         params = dict(ctx.params)
@@ -26,6 +27,9 @@ class FakeRegistry:
             }
         )
         method = params["method"]
+        if method in self.errors_by_method:
+            error, error_code = self.errors_by_method[method]
+            return SimpleNamespace(success=False, data=None, error=error, error_code=error_code)
         return SimpleNamespace(success=True, data=self.data_by_method[method], error=None)
 
 
@@ -289,3 +293,81 @@ def test_has_more_derived_from_total_and_page_math(client_with_registry):
     body = response.json()
     assert body["has_more"] is True
     assert body["pagination"]["next_offset"] == 1
+
+
+def test_cursor_pagination_forwarded_and_next_cursor_echoed(client_with_registry):
+    client, registry = client_with_registry
+
+    registry.data_by_method["get_live_runs"] = SimpleNamespace(
+        items=[_run_payload("run-page-2", "2026-02-16T10:00:00Z", None)],
+        total=5,
+        has_more=True,
+        next_cursor="next-token",
+        generated_at=datetime(2026, 2, 16, 10, 15, tzinfo=timezone.utc),
+    )
+
+    response = client.get("/cus/activity/runs?topic=live&limit=1&cursor=page-token&count_mode=cached")
+
+    assert response.status_code == 200
+    params = registry.calls[0]["params"]
+    assert params["cursor"] == "page-token"
+    assert params["pagination"] == "offset"
+    assert params["count_mode"] == "cached"
+
+    body = response.json()
+    assert body["has_more"] is True
+    assert body["pagination"]["next_cursor"] == "next-token"
+    assert body["pagination"]["next_offset"] is None
+    assert body["pagination"]["count_mode"] == "cached"
+
+
+def test_cursor_pagination_last_page_has_no_more(client_with_registry):
+    client, registry = client_with_registry
+
+    registry.data_by_method["get_completed_runs"] = SimpleNamespace(
+        items=[_run_payload("run-last", "2026-02-16T07:00:00Z", "2026-02-16T08:00:00Z")],
+        total=50,
+        has_more=False,
+        next_cursor=None,
+        generated_at=datetime(2026, 2, 16, 8, 5, tzinfo=timezone.utc),
+    )
+
+    response = client.get("/cus/activity/runs?topic=completed&pagination=cursor&limit=1")
+
+    assert response.status_code == 200
+    body = response.json()
+    # Keyset pages ignore total: the backend issues a cursor only when rows remain
+    assert body["has_more"] is False
+    assert body["pagination"]["next_offset"] is None
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "topic=live&pagination=cursor&offset=10",
+        "topic=live&cursor=abc&offset=10",
+        "topic=live&pagination=sideways",
+        "topic=live&count_mode=guess",
+    ],
+)
+def test_invalid_pagination_params_rejected(query: str, client_with_registry):
+    client, registry = client_with_registry
+
+    response = client.get(f"/cus/activity/runs?{query}")
+
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "INVALID_QUERY"
+    assert len(registry.calls) == 0
+
+
+def test_invalid_cursor_maps_to_invalid_query(client_with_registry):
+    client, registry = client_with_registry
+
+    registry.errors_by_method["get_live_runs"] = ("Malformed cursor", "INVALID_CURSOR")
+
+    response = client.get("/cus/activity/runs?topic=live&cursor=garbage")
+
+    assert response.status_code == 400
+    detail = response.json()["detail"]
+    assert detail["code"] == "INVALID_QUERY"
+    assert detail["field_errors"][0]["field"] == "cursor"
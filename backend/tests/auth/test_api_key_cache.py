@@ -0,0 +1,308 @@
+"""
+API Key Cache Tests
+
+ApiKeyEngine serves validated key records from an in-process cache keyed
+by key hash, aggregates usage in memory and writes it in bulk.
+
+Revocation bound:
+- the revoking process rejects the key on its next request
+- other processes reject it once the revocation message arrives
+- without Redis, a revoked key is accepted for at most the cache TTL
+
+Run with:
+    pytest tests/auth/test_api_key_cache.py -v
+"""
+
+import asyncio
+import hashlib
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.auth.api_key_driver import KeyRow
+from app.auth.api_key_engine import API_KEY_REVOKE_CHANNEL, ApiKeyEngine
+from app.auth.contexts import MachineCapabilityContext
+from app.auth.gateway import AuthGateway
+from app.auth.gateway_types import GatewayAuthError, GatewayErrorCode
+
+API_KEY = "aos_test_key_0001"
+KEY_HASH = hashlib.sha256(API_KEY.encode()).hexdigest()
+
+
+def _row(**overrides):
+    row = KeyRow(
+        id="key-1",
+        name="ci",
+        key_prefix="aos_test",
+        tenant_id="t1",
+        user_id=None,
+        status="active",
+        permissions_json='["run:*"]',
+        rate_limit_rpm=600,
+        is_valid=True,
+        created_at=None,
+        last_used_at=None,
+        total_requests=0,
+        expires_at=None,
+        revoked_at=None,
+        revoked_reason=None,
+    )
+    return replace(row, **overrides)
+
+
+class FakeDriver:
+    """ApiKeyDriver stand-in: one key, counted lookups, recorded usage batches."""
+
+    def __init__(self, row=None):
+        self.rows = {KEY_HASH: row or _row()}
+        self.fetches = 0
+        self.usage_batches = []
+        self.fail_usage = False
+
+    def fetch_key_by_hash(self, key_hash):
+        self.fetches += 1
+        return self.rows.get(key_hash)
+
+    def record_usage_bulk(self, usage):
+        if self.fail_usage:
+            raise ConnectionError("database unavailable")
+        self.usage_batches.append(dict(usage))
+        return len(usage)
+
+    def revoke_key(self, key_id, reason):
+        for key_hash, row in self.rows.items():
+            if row.id == key_id:
+                self.rows[key_hash] = replace(row, status="revoked", is_valid=False)
+                return True
+        return False
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self._redis = redis
+        self._queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        self._redis.subscribers.setdefault(channel, []).append(self._queue)
+
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+    async def aclose(self):
+        for queues in self._redis.subscribers.values():
+            if self._queue in queues:
+                queues.remove(self._queue)
+
+
+class FakeRedis:
+    """Redis pub/sub shared by several engines (processes)."""
+
+    def __init__(self):
+        self.subscribers = {}
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def publish(self, channel, message):
+        for queue in self.subscribers.get(channel, []):
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(self.subscribers.get(channel, []))
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    """Engines only publish/subscribe through an explicitly passed FakeRedis."""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+
+async def _authenticate(engine):
+    return await AuthGateway(api_key_service=engine).authenticate(None, API_KEY)
+
+
+class TestValidatedKeyCache:
+    @pytest.mark.asyncio
+    async def test_repeat_requests_are_served_from_cache(self):
+        driver = FakeDriver()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5)
+
+        results = [await _authenticate(engine) for _ in range(20)]
+
+        assert all(isinstance(r, MachineCapabilityContext) for r in results)
+        assert results[-1].scopes == frozenset({"run:*"})
+        assert results[-1].rate_limit == 600
+        assert driver.fetches == 1
+
+    @pytest.mark.asyncio
+    async def test_entry_expires_after_ttl(self):
+        driver, clock = FakeDriver(), FakeClock()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5, clock=clock)
+
+        await engine.validate_key(API_KEY)
+        clock.now += 4.9
+        await engine.validate_key(API_KEY)
+        assert driver.fetches == 1
+
+        clock.now += 0.2
+        await engine.validate_key(API_KEY)
+        assert driver.fetches == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_never_outlives_key_expiry(self):
+        driver = FakeDriver(_row(expires_at=datetime.utcnow() + timedelta(milliseconds=50)))
+        engine = ApiKeyEngine(driver=driver, cache_ttl=60)
+
+        await engine.validate_key(API_KEY)
+        await asyncio.sleep(0.1)
+        await engine.validate_key(API_KEY)
+
+        assert driver.fetches == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_keys_are_not_cached(self):
+        driver = FakeDriver()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5)
+
+        assert await engine.validate_key("aos_unknown") is None
+        assert await engine.validate_key("aos_unknown") is None
+        assert driver.fetches == 2
+
+    @pytest.mark.asyncio
+    async def test_oldest_entry_dropped_at_capacity(self):
+        driver = FakeDriver()
+        for n in range(3):
+            key_hash = hashlib.sha256(f"aos_key_{n}".encode()).hexdigest()
+            driver.rows[key_hash] = _row(id=f"key-{n}")
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5, cache_max_entries=2)
+
+        for n in range(3):
+            await engine.validate_key(f"aos_key_{n}")
+
+        assert len(engine._cache) == 2
+        assert set(engine._hash_by_key_id) == {"key-1", "key-2"}
+
+
+class TestRevocationBound:
+    @pytest.mark.asyncio
+    async def test_revoking_process_rejects_on_next_request(self):
+        driver = FakeDriver()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=300)
+        assert isinstance(await _authenticate(engine), MachineCapabilityContext)
+
+        assert await engine.revoke_key("key-1", "compromised")
+
+        result = await _authenticate(engine)
+        assert isinstance(result, GatewayAuthError)
+        assert result.error_code == GatewayErrorCode.API_KEY_INVALID
+
+    @pytest.mark.asyncio
+    async def test_other_processes_reject_once_revocation_arrives(self):
+        redis, driver = FakeRedis(), FakeDriver()
+        revoker = ApiKeyEngine(driver=driver, redis_client=redis, cache_ttl=300)
+        others = [ApiKeyEngine(driver=driver, redis_client=redis, cache_ttl=300) for _ in range(3)]
+        for engine in [revoker, *others]:
+            assert isinstance(await _authenticate(engine), MachineCapabilityContext)
+        await asyncio.sleep(0)
+        assert len(redis.subscribers[API_KEY_REVOKE_CHANNEL]) == 4
+
+        await revoker.revoke_key("key-1", "compromised")
+        await asyncio.sleep(0)
+
+        for engine in others:
+            assert isinstance(await _authenticate(engine), GatewayAuthError)
+        for engine in [revoker, *others]:
+            await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_without_redis_revocation_is_bounded_by_ttl(self):
+        driver, clock = FakeDriver(), FakeClock()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5, clock=clock)
+        await engine.validate_key(API_KEY)
+
+        # Revoked by another process that could not publish
+        driver.revoke_key("key-1", "compromised")
+        clock.now += 5
+
+        assert isinstance(await _authenticate(engine), GatewayAuthError)
+
+    @pytest.mark.asyncio
+    async def test_lookup_in_flight_during_revocation_is_not_cached(self):
+        driver = FakeDriver()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=300)
+        fetch = driver.fetch_key_by_hash
+
+        def fetch_then_revoke(key_hash):
+            row = fetch(key_hash)
+            engine._evict_local("key-1")
+            return row
+
+        driver.fetch_key_by_hash = fetch_then_revoke
+        await engine.validate_key(API_KEY)
+
+        assert engine._cache == {}
+
+    @pytest.mark.asyncio
+    async def test_missed_messages_drop_the_whole_cache(self):
+        class BrokenRedis(FakeRedis):
+            def pubsub(self):
+                raise ConnectionError("redis unavailable")
+
+        engine = ApiKeyEngine(driver=FakeDriver(), redis_client=BrokenRedis(), cache_ttl=300)
+        engine._cache["stale"] = ({"key_id": "key-9"}, float("inf"))
+
+        listener = asyncio.ensure_future(engine._listen(engine._redis))
+        await asyncio.sleep(0.01)
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+
+        assert engine._cache == {}
+
+
+class TestUsageAccounting:
+    @pytest.mark.asyncio
+    async def test_usage_is_aggregated_and_flushed_in_one_write(self):
+        driver = FakeDriver()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5)
+
+        for _ in range(25):
+            await engine.validate_key(API_KEY)
+
+        assert driver.usage_batches == []
+        assert await engine.flush_usage() == 1
+        ((batch),) = driver.usage_batches
+        assert batch[KEY_HASH][0] == 25
+        assert await engine.flush_usage() == 0
+
+    @pytest.mark.asyncio
+    async def test_revoked_key_usage_is_not_counted(self):
+        driver = FakeDriver(_row(status="revoked", is_valid=False))
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5)
+
+        await engine.validate_key(API_KEY)
+        await engine.validate_key(API_KEY)
+
+        assert engine._usage == {}
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried_with_later_usage(self):
+        driver = FakeDriver()
+        engine = ApiKeyEngine(driver=driver, cache_ttl=5)
+        for _ in range(3):
+            await engine.validate_key(API_KEY)
+
+        driver.fail_usage = True
+        assert await engine.flush_usage() == 0
+        await engine.validate_key(API_KEY)
+        driver.fail_usage = False
+        await engine.flush_usage()
+
+        assert driver.usage_batches[0][KEY_HASH][0] == 4
@@ -0,0 +1,268 @@
+"""
+Request Pipeline Tests
+
+RequestPipelineMiddleware runs AuthGateway → OnboardingGate → RBAC →
+Tenant as one pure-ASGI layer. It must answer exactly as the four
+middlewares stacked in that order, authenticate once per request, stream
+response bodies without buffering, and keep the RBACv2 shadow comparison
+off the response path.
+
+Run with:
+    pytest tests/auth/test_request_pipeline.py -v
+"""
+
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+import app.auth.rbac_middleware as rbac_mod
+from app.auth.contexts import AuthSource, MachineCapabilityContext
+from app.auth.gateway_middleware import AuthGatewayMiddleware
+from app.auth.gateway_types import GatewayAuthError, GatewayErrorCode
+from app.auth.onboarding_gate import OnboardingGateMiddleware
+from app.auth.rbac_middleware import RBACMiddleware
+from app.auth.request_pipeline import RequestPipelineMiddleware
+from app.hoc.cus.account.L5_schemas.onboarding_state import OnboardingState
+from app.middleware.tenant import TenantMiddleware, get_tenant_context
+
+# Memory pin routes resolve to the runtime:query policy
+KEYS = {
+    "aos_allowed": ("t-ready", {"runtime:query"}),
+    "aos_denied": ("t-ready", {"trace:read"}),
+    "aos_new_tenant": ("t-new", {"runtime:query"}),
+}
+TENANT_STATES = {"t-ready": OnboardingState.COMPLETE, "t-new": OnboardingState.CREATED}
+
+
+class FakeGateway:
+    """AuthGateway stand-in: API keys only, counted calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def authenticate(self, authorization_header=None, api_key_header=None):
+        self.calls += 1
+        if api_key_header not in KEYS:
+            return GatewayAuthError(
+                error_code=GatewayErrorCode.API_KEY_INVALID, message="Invalid API key", http_status=401
+            )
+        tenant_id, scopes = KEYS[api_key_header]
+        return MachineCapabilityContext(
+            key_id=api_key_header,
+            key_name=None,
+            auth_source=AuthSource.API_KEY,
+            tenant_id=tenant_id,
+            scopes=frozenset(scopes),
+            rate_limit=600,
+        )
+
+
+@pytest.fixture(autouse=True)
+def tenant_states(monkeypatch):
+    async def get_tenant_state(self, tenant_id):
+        return TENANT_STATES[tenant_id]
+
+    monkeypatch.setattr(OnboardingGateMiddleware, "_get_tenant_state", get_tenant_state)
+
+
+def _routes(app: FastAPI, seen: list):
+    @app.post("/api/v1/memory/pins")
+    async def create_pin(request: Request):
+        tenant = get_tenant_context()
+        seen.append((getattr(request.state, "auth_context", None), tenant.tenant_id if tenant else None))
+        return {"status": "created"}
+
+    @app.get("/api/v1/memory/pins/{key}")
+    async def get_pin(key: str):
+        return {"key": key}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "ok"}
+
+
+def _stacked(gateway):
+    app, seen = FastAPI(), []
+    _routes(app, seen)
+    app.add_middleware(TenantMiddleware)
+    app.add_middleware(RBACMiddleware, enforce_rbac=True)
+    app.add_middleware(OnboardingGateMiddleware)
+    app.add_middleware(AuthGatewayMiddleware, gateway=gateway, public_paths=["/health"])
+    return app, seen
+
+
+def _pipeline(gateway, **kwargs):
+    app, seen = FastAPI(), []
+    _routes(app, seen)
+    app.add_middleware(
+        RequestPipelineMiddleware,
+        gateway_config={"gateway": gateway, "public_paths": ["/health"]},
+        enforce_rbac=True,
+        **kwargs,
+    )
+    return app, seen
+
+
+REQUESTS = [
+    ("GET", "/health", {}),
+    ("POST", "/api/v1/memory/pins", {}),
+    ("POST", "/api/v1/memory/pins", {"X-AOS-Key": "aos_unknown"}),
+    ("POST", "/api/v1/memory/pins", {"X-AOS-Key": "aos_allowed", "X-Correlation-ID": "corr-1"}),
+    ("POST", "/api/v1/memory/pins", {"X-AOS-Key": "aos_allowed", "X-Tenant-ID": "t-ready"}),
+    ("POST", "/api/v1/memory/pins", {"X-AOS-Key": "aos_denied"}),
+    ("POST", "/api/v1/memory/pins", {"X-AOS-Key": "aos_new_tenant"}),
+    ("GET", "/api/v1/memory/pins/k1", {"X-AOS-Key": "aos_allowed"}),
+]
+
+
+def _observe(client, method, path, headers):
+    response = client.request(method, path, headers=headers, json={})
+    request_id = response.headers.get("x-request-id")
+    correlation_id = response.headers.get("x-correlation-id")
+    # Request ids are random; the correlation id defaults to the request id
+    return (
+        response.status_code,
+        response.content,
+        request_id is not None,
+        "request-id" if correlation_id and correlation_id == request_id else correlation_id,
+    )
+
+
+class TestEquivalence:
+    def test_pipeline_answers_as_the_stacked_middlewares(self):
+        stacked, stacked_seen = _stacked(FakeGateway())
+        pipeline, pipeline_seen = _pipeline(FakeGateway())
+
+        with TestClient(stacked) as a, TestClient(pipeline) as b:
+            for method, path, headers in REQUESTS:
+                assert _observe(b, method, path, headers) == _observe(a, method, path, headers), (method, path, headers)
+
+        # Only the allowed key reached the handler, with and without a tenant header
+        assert [(ctx.key_id, tenant) for ctx, tenant in pipeline_seen] == [
+            (ctx.key_id, tenant) for ctx, tenant in stacked_seen
+        ]
+        assert [(ctx.key_id, tenant) for ctx, tenant in pipeline_seen] == [
+            ("aos_allowed", None),
+            ("aos_allowed", "t-ready"),
+        ]
+
+    def test_auth_context_resolved_once_per_request(self):
+        gateway = FakeGateway()
+        pipeline, seen = _pipeline(gateway)
+
+        with TestClient(pipeline) as client:
+            response = client.post("/api/v1/memory/pins", headers={"X-AOS-Key": "aos_allowed"}, json={})
+
+        assert response.status_code == 200
+        assert gateway.calls == 1
+        assert seen[0][0].scopes == frozenset(KEYS["aos_allowed"][1])
+
+    def test_tenant_context_cleared_after_request(self):
+        pipeline, _ = _pipeline(FakeGateway())
+
+        with TestClient(pipeline) as client:
+            client.post("/api/v1/memory/pins", headers={"X-AOS-Key": "aos_allowed", "X-Tenant-ID": "t-ready"}, json={})
+
+        assert get_tenant_context() is None
+
+
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_body_chunks_are_not_buffered(self):
+        release = asyncio.Event()
+
+        async def chunks():
+            yield b"first"
+            await release.wait()
+            yield b"second"
+
+        app = FastAPI()
+
+        @app.get("/api/v1/memory/pins/stream")
+        async def stream():
+            return StreamingResponse(chunks())
+
+        app.add_middleware(
+            RequestPipelineMiddleware,
+            gateway_config={"gateway": FakeGateway(), "public_paths": []},
+            enforce_rbac=True,
+        )
+
+        sent = asyncio.Queue()
+
+        async def receive():
+            await asyncio.Event().wait()
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": "/api/v1/memory/pins/stream",
+            "raw_path": b"/api/v1/memory/pins/stream",
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"x-aos-key", b"aos_allowed")],
+            "client": ("127.0.0.1", 1234),
+            "server": ("testserver", 80),
+        }
+        call = asyncio.create_task(app(scope, receive, sent.put))
+
+        start = await asyncio.wait_for(sent.get(), timeout=2)
+        first = await asyncio.wait_for(sent.get(), timeout=2)
+        assert start["status"] == 200
+        assert (b"x-request-id" in dict(start["headers"])) is True
+        assert first["body"] == b"first" and not call.done()
+
+        release.set()
+        await asyncio.wait_for(call, timeout=2)
+        rest = []
+        while not sent.empty():
+            rest.append(await sent.get())
+        assert b"".join(m.get("body", b"") for m in rest) == b"second"
+
+
+class TestShadowComparison:
+    def test_comparison_does_not_delay_response(self, monkeypatch):
+        finished = []
+
+        async def slow_compare(request, policy, decision):
+            await asyncio.sleep(0.5)
+            finished.append(policy.resource)
+
+        monkeypatch.setattr(rbac_mod, "RBAC_V2_SHADOW_ENABLED", True)
+        monkeypatch.setattr(rbac_mod, "RBAC_V2_SHADOW_SAMPLE_RATE", 1.0)
+        monkeypatch.setattr(rbac_mod, "_compare_with_v2", slow_compare)
+        pipeline, _ = _pipeline(FakeGateway())
+
+        with TestClient(pipeline) as client:
+            started = time.perf_counter()
+            response = client.get("/api/v1/memory/pins/k1", headers={"X-AOS-Key": "aos_allowed"})
+            assert response.status_code == 200
+            assert time.perf_counter() - started < 0.4
+            assert finished == [] and len(rbac_mod._shadow_tasks) == 1
+
+            time.sleep(0.7)
+            assert finished == ["runtime"] and not rbac_mod._shadow_tasks
+
+    def test_sample_rate_zero_skips_comparison(self, monkeypatch):
+        calls = []
+
+        async def compare(request, policy, decision):
+            calls.append(policy.resource)
+
+        monkeypatch.setattr(rbac_mod, "RBAC_V2_SHADOW_ENABLED", True)
+        monkeypatch.setattr(rbac_mod, "RBAC_V2_SHADOW_SAMPLE_RATE", 0.0)
+        monkeypatch.setattr(rbac_mod, "_compare_with_v2", compare)
+        pipeline, _ = _pipeline(FakeGateway())
+
+        with TestClient(pipeline) as client:
+            for _ in range(5):
+                client.get("/api/v1/memory/pins/k1", headers={"X-AOS-Key": "aos_allowed"})
+
+        assert calls == []
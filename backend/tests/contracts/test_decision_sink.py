@@ -0,0 +1,244 @@
+"""
+Decision Sink Tests
+
+Decision records are queued by emit_sync() and written by DecisionSink's
+flush thread in batched INSERTs over one shared engine. Idempotency
+guards answer from in-memory keys before querying the database, and the
+sink drains on flush() / close().
+
+Run with:
+    pytest tests/contracts/test_decision_sink.py -v
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy.exc import IntegrityError, OperationalError
+
+import app.contracts.decisions as decisions
+from app.contracts.decisions import (
+    CausalRole,
+    DecisionOutcome,
+    DecisionRecord,
+    DecisionRecordService,
+    DecisionSink,
+    DecisionSource,
+    DecisionTrigger,
+    DecisionType,
+    backfill_run_id_for_request,
+    emit_budget_enforcement_decision,
+)
+
+DB_URL = "postgresql://decision-sink-test/db"
+
+
+class FakeResult:
+    def __init__(self, row=None, rowcount=0):
+        self._row = row
+        self.rowcount = rowcount
+
+    def fetchone(self):
+        return self._row
+
+
+class FakeConnection:
+    def __init__(self, engine):
+        self._engine = engine
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params=None):
+        sql = statement.text if hasattr(statement, "text") else str(statement)
+        return self._engine.execute(sql, params or {})
+
+    def commit(self):
+        pass
+
+
+class FakeEngine:
+    """Shared engine stand-in: records statements, optional latency and failures."""
+
+    def __init__(self, latency=0.0, exists=False):
+        self.latency = latency
+        self.exists = exists
+        self.statements = []
+        self.fail_insert = None
+        self.reject_decision_id = None
+        self._lock = threading.Lock()
+
+    def connect(self):
+        return FakeConnection(self)
+
+    def execute(self, sql, params):
+        time.sleep(self.latency)
+        if sql.lstrip().startswith("INSERT INTO contracts.decision_records"):
+            if self.fail_insert is not None:
+                raise self.fail_insert
+            if any(row["decision_id"] == self.reject_decision_id for row in params):
+                raise IntegrityError(sql, params, Exception("bad row"))
+        with self._lock:
+            self.statements.append((sql, params))
+        if sql.lstrip().startswith("SELECT"):
+            return FakeResult(row=(1,) if self.exists else None)
+        return FakeResult(rowcount=1)
+
+    def inserts(self, table):
+        return [params for sql, params in self.statements if sql.lstrip().startswith(f"INSERT INTO {table}")]
+
+    def selects(self):
+        return [params for sql, params in self.statements if sql.lstrip().startswith("SELECT")]
+
+
+def _decision_ids(rows):
+    return sorted(row["decision_id"] for row in rows)
+
+
+def _record(decision_type=DecisionType.ROUTING, decision_id=None, **kwargs):
+    fields = {
+        "decision_type": decision_type,
+        "decision_source": DecisionSource.SYSTEM,
+        "decision_trigger": DecisionTrigger.EXPLICIT,
+        "decision_outcome": DecisionOutcome.SELECTED,
+        **kwargs,
+    }
+    if decision_id is not None:
+        fields["decision_id"] = decision_id
+    return DecisionRecord(**fields)
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    fake = FakeEngine()
+    monkeypatch.setattr(decisions, "_get_engine", lambda db_url: fake)
+    return fake
+
+
+@pytest.fixture
+def service(monkeypatch, engine):
+    """Process-wide decision service bound to the fake engine."""
+    monkeypatch.setenv("DATABASE_URL", DB_URL)
+    monkeypatch.setenv("DECISION_SINK_FLUSH_INTERVAL_MS", "1000")
+    svc = DecisionRecordService(DB_URL)
+    monkeypatch.setattr(decisions, "_service", svc)
+    yield svc
+    svc.close()
+
+
+class TestBufferedWrites:
+    def test_emit_does_not_wait_for_the_database(self, service, engine):
+        engine.latency = 0.2
+
+        started = time.perf_counter()
+        for n in range(50):
+            assert service.emit_sync(_record(decision_id=f"d-{n:02d}"))
+        assert time.perf_counter() - started < 0.1
+
+        assert service.flush()
+        (batch,) = engine.inserts("contracts.decision_records")
+        assert _decision_ids(batch) == [f"d-{n:02d}" for n in range(50)]
+
+    def test_batches_are_capped_at_batch_size(self, engine):
+        sink = DecisionSink(DB_URL, batch_size=10, flush_interval=1.0)
+        for n in range(25):
+            sink.put(_record(decision_id=f"d-{n:02d}"))
+
+        assert sink.flush()
+        sink.close()
+        assert sorted(len(_decision_ids(batch)) for batch in engine.inserts("contracts.decision_records")) == [
+            5,
+            10,
+            10,
+        ]
+
+    def test_policy_decisions_are_bridged_in_one_insert(self, service, engine):
+        service.emit_sync(_record(DecisionType.POLICY, decision_id="p-1", decision_outcome=DecisionOutcome.BLOCKED))
+        service.emit_sync(_record(DecisionType.ROUTING, decision_id="r-1"))
+        service.emit_sync(_record(DecisionType.BUDGET, decision_id="b-1", decision_outcome=DecisionOutcome.NONE))
+        service.flush()
+
+        ((sql, rows),) = [(s, p) for s, p in engine.statements if "governance.policy_decisions" in s]
+        assert sql.rstrip().endswith("ON CONFLICT (id) DO NOTHING")
+        assert {row["id"]: row["decision"] for row in rows} == {"p-1": "denied", "b-1": "allowed"}
+
+    def test_overflow_drops_newest_and_close_drains(self, engine):
+        sink = DecisionSink(DB_URL, max_size=2, flush_interval=10.0)
+
+        assert [sink.put(_record(decision_id=f"d-{n}")) for n in range(3)] == [True, True, False]
+
+        sink.close()
+        (batch,) = engine.inserts("contracts.decision_records")
+        assert _decision_ids(batch) == ["d-0", "d-1"]
+
+    def test_put_after_close_writes_inline(self, engine):
+        sink = DecisionSink(DB_URL)
+        sink.close()
+
+        assert sink.put(_record(decision_id="late"))
+        (batch,) = engine.inserts("contracts.decision_records")
+        assert _decision_ids(batch) == ["late"]
+
+
+class TestFailedWrites:
+    def test_bad_row_does_not_fail_the_batch(self, service, engine):
+        engine.reject_decision_id = "bad"
+        for decision_id in ("ok-1", "bad", "ok-2"):
+            service.emit_sync(_record(decision_id=decision_id))
+        service.flush()
+
+        written = [_decision_ids(batch) for batch in engine.inserts("contracts.decision_records")]
+        assert written == [["ok-1"], ["ok-2"]]
+
+    def test_failed_write_releases_idempotency_key(self, service, engine):
+        engine.fail_insert = OperationalError("INSERT", {}, Exception("database unavailable"))
+        key = (DecisionType.BUDGET_ENFORCEMENT.value, "run-1")
+
+        assert service.emit_sync(_record(DecisionType.BUDGET_ENFORCEMENT), idempotency_key=key)
+        assert service.has_emitted(key)
+        service.flush()
+
+        assert not service.has_emitted(key)
+        assert engine.inserts("contracts.decision_records") == []
+
+
+class TestIdempotency:
+    def test_repeat_emission_is_answered_from_memory(self, service, engine):
+        first = emit_budget_enforcement_decision("run-1", 100, 120, 20, 3, 5)
+        second = emit_budget_enforcement_decision("run-1", 100, 140, 20, 4, 5)
+        service.flush()
+
+        assert first is not None and second is None
+        assert len(engine.selects()) == 1
+        (batch,) = engine.inserts("contracts.decision_records")
+        assert _decision_ids(batch) == [first.decision_id]
+
+    def test_database_hit_is_remembered(self, service, engine):
+        engine.exists = True
+
+        assert emit_budget_enforcement_decision("run-2", 100, 120, 20, 3, 5) is None
+        assert emit_budget_enforcement_decision("run-2", 100, 120, 20, 3, 5) is None
+
+        assert len(engine.selects()) == 1
+
+    def test_emit_with_same_key_is_queued_once(self, service, engine):
+        key = (DecisionType.CARE_ROUTING_OPTIMIZED.value, "req-1")
+
+        assert service.emit_sync(_record(DecisionType.CARE_ROUTING_OPTIMIZED), idempotency_key=key)
+        assert not service.emit_sync(_record(DecisionType.CARE_ROUTING_OPTIMIZED), idempotency_key=key)
+
+
+class TestBackfill:
+    def test_queued_pre_run_decisions_are_written_before_backfill(self, service, engine):
+        service.emit_sync(_record(DecisionType.POLICY, request_id="req-9", causal_role=CausalRole.PRE_RUN))
+
+        assert backfill_run_id_for_request("req-9", "run-9") == 1
+
+        assert [" ".join(sql.split()[:3]) for sql, _ in engine.statements] == [
+            "INSERT INTO contracts.decision_records",
+            "INSERT INTO governance.policy_decisions",
+            "UPDATE contracts.decision_records SET",
+        ]
@@ -32,6 +32,7 @@ from sqlalchemy import create_engine, text
 # Import the Phase 5B emission function
 from app.contracts.decisions import (
     emit_policy_precheck_decision,
+    get_decision_service,
 )
 
 # =============================================================================
@@ -137,6 +138,9 @@ def get_run_count(db_url: str, request_id: str) -> int:
 
 def get_decision_records(db_url: str, request_id: str, decision_type: Optional[str] = None) -> list:
     """Fetch decision records for this request."""
+    # Emitted records are written by the decision sink's flush thread
+    get_decision_service().flush()
+
     engine = create_engine(db_url)
     with engine.connect() as conn:
         if decision_type:
@@ -32,6 +32,7 @@ from sqlalchemy import create_engine, text
 # Phase 5C imports
 from app.contracts.decisions import (
     emit_recovery_evaluation_decision,
+    get_decision_service,
 )
 
 # =============================================================================
@@ -147,6 +148,9 @@ def get_decision_records(
     if not db_url:
         return []
 
+    # Emitted records are written by the decision sink's flush thread
+    get_decision_service().flush()
+
     engine = create_engine(db_url)
     try:
         with engine.connect() as conn:
@@ -35,6 +35,7 @@ from app.contracts.decisions import (
     check_signal_access,
     deactivate_care_kill_switch,
     emit_care_optimization_decision,
+    get_decision_service,
 )
 
 # =============================================================================
@@ -121,6 +122,9 @@ def get_decision_records(
     if not db_url:
         return []
 
+    # Emitted records are written by the decision sink's flush thread
+    get_decision_service().flush()
+
     engine = create_engine(db_url)
     try:
         with engine.connect() as conn:
@@ -0,0 +1,249 @@
+"""
+Event Buffer Tests
+
+Tests for the bounded, batched publish path used by RedisPublisher and
+NatsAdapter: overflow policies, batching, flush-on-close and the Redis
+pipeline flush.
+
+Run with:
+    pytest tests/events/test_event_buffer.py -v
+"""
+
+import json
+import threading
+import time
+
+import pytest
+
+from app.events.batching import EventBuffer, OverflowPolicy
+
+
+class _RecordingFlush:
+    """Flush callback that records batches and can be gated."""
+
+    def __init__(self, fail_every: int = 0):
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail_every = fail_every
+
+    def __call__(self, batch):
+        self.gate.wait(5)
+        self.batches.append(list(batch))
+        if self.fail_every:
+            return sum(1 for i, _ in enumerate(batch) if i % self.fail_every == 0)
+        return 0
+
+    @property
+    def events(self):
+        return [e for b in self.batches for e in b]
+
+
+class TestEventBuffer:
+    """Tests for EventBuffer."""
+
+    def test_events_flushed_in_order(self):
+        flush = _RecordingFlush()
+        buffer = EventBuffer("test", flush, max_size=100, batch_size=10, flush_interval=0.01)
+        buffer.start()
+        for i in range(25):
+            assert buffer.put("T", json.dumps({"i": i}))
+        assert buffer.flush(timeout=2)
+        buffer.close()
+
+        assert [json.loads(m)["i"] for _, m in flush.events] == list(range(25))
+        assert all(len(b) <= 10 for b in flush.batches)
+        stats = buffer.get_stats()
+        assert stats.enqueued == 25
+        assert stats.published == 25
+        assert stats.queue_depth == 0
+
+    def test_close_drains_buffer(self):
+        flush = _RecordingFlush()
+        buffer = EventBuffer("test", flush, max_size=1000, batch_size=1000, flush_interval=10)
+        buffer.start()
+        for i in range(50):
+            buffer.put("T", json.dumps({"i": i}))
+        buffer.close()
+        assert len(flush.events) == 50
+        assert not buffer.is_running
+
+    def test_drop_newest_policy(self):
+        flush = _RecordingFlush()
+        flush.gate.clear()
+        buffer = EventBuffer(
+            "test", flush, max_size=3, batch_size=1, flush_interval=0.01, overflow_policy=OverflowPolicy.DROP_NEWEST
+        )
+        buffer.start()
+        buffer.put("T", json.dumps({"i": -1}))  # taken by the blocked flush thread
+        time.sleep(0.05)
+        results = [buffer.put("T", json.dumps({"i": i})) for i in range(5)]
+        assert results == [True, True, True, False, False]
+        assert buffer.get_stats().dropped == 2
+
+        flush.gate.set()
+        buffer.close()
+        assert [json.loads(m)["i"] for _, m in flush.events] == [-1, 0, 1, 2]
+
+    def test_drop_oldest_policy(self):
+        flush = _RecordingFlush()
+        flush.gate.clear()
+        buffer = EventBuffer(
+            "test", flush, max_size=3, batch_size=1, flush_interval=0.01, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        buffer.start()
+        buffer.put("T", json.dumps({"i": -1}))
+        time.sleep(0.05)
+        assert all(buffer.put("T", json.dumps({"i": i})) for i in range(5))
+        assert buffer.get_stats().dropped == 2
+
+        flush.gate.set()
+        buffer.close()
+        assert [json.loads(m)["i"] for _, m in flush.events] == [-1, 2, 3, 4]
+
+    def test_block_policy_times_out(self):
+        flush = _RecordingFlush()
+        flush.gate.clear()
+        buffer = EventBuffer(
+            "test",
+            flush,
+            max_size=1,
+            batch_size=1,
+            flush_interval=0.01,
+            overflow_policy=OverflowPolicy.BLOCK,
+            block_timeout=0.05,
+        )
+        buffer.start()
+        buffer.put("T", json.dumps({"i": 0}))
+        time.sleep(0.05)
+        assert buffer.put("T", json.dumps({"i": 1})) is True
+        start = time.monotonic()
+        assert buffer.put("T", json.dumps({"i": 2})) is False
+        assert time.monotonic() - start >= 0.04
+
+        flush.gate.set()
+        buffer.close()
+
+    def test_flush_failures_are_counted(self):
+        flush = _RecordingFlush(fail_every=2)
+        buffer = EventBuffer("test", flush, max_size=100, batch_size=4, flush_interval=0.01)
+        buffer.start()
+        for i in range(4):
+            buffer.put("T", json.dumps({"i": i}))
+        buffer.close()
+        stats = buffer.get_stats()
+        assert stats.failed == 2
+        assert stats.published == 2
+
+    def test_flush_exception_does_not_kill_thread(self):
+        calls = []
+
+        def _flaky(batch):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise ConnectionError("redis down")
+            return 0
+
+        buffer = EventBuffer("test", _flaky, max_size=100, batch_size=1, flush_interval=0.01)
+        buffer.start()
+        buffer.put("T", json.dumps({"i": 0}))
+        buffer.flush(timeout=2)
+        buffer.put("T", json.dumps({"i": 1}))
+        buffer.close()
+        stats = buffer.get_stats()
+        assert stats.failed == 1
+        assert stats.published == 1
+
+
+class _FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def publish(self, channel, message):
+        self.commands.append((channel, message))
+
+    def execute(self, raise_on_error=True):
+        self.client.round_trips += 1
+        self.client.published.extend(self.commands)
+        return [1] * len(self.commands)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.published = []
+        self.round_trips = 0
+
+    def ping(self):
+        return True
+
+    def publish(self, channel, message):
+        self.round_trips += 1
+        self.published.append((channel, message))
+        return 1
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    import redis
+
+    client = _FakeRedis()
+    monkeypatch.setenv("REDIS_URL", "redis://localhost:6379/0")
+    monkeypatch.setattr(redis.Redis, "from_url", classmethod(lambda cls, *a, **kw: client))
+    return client
+
+
+class TestRedisPublisherBatching:
+    """Tests for RedisPublisher on the buffered path."""
+
+    def test_batched_publish_uses_pipeline(self, fake_redis, monkeypatch):
+        from app.events.redis_publisher import RedisPublisher
+
+        monkeypatch.setenv("EVENT_PUBLISHER_BATCH_SIZE", "100")
+        publisher = RedisPublisher(batching=True)
+        for i in range(100):
+            publisher.publish("RUN_STEP", {"i": i, "source": "worker"})
+        assert publisher.flush(timeout=2)
+        publisher.close()
+
+        assert len(fake_redis.published) == 100
+        assert fake_redis.round_trips < 100
+        first = json.loads(fake_redis.published[0][1])
+        assert first["event_type"] == "RUN_STEP"
+        assert first["source"] == "worker"
+        assert first["payload"]["i"] == 0
+
+    def test_payload_is_captured_at_publish(self, fake_redis):
+        from app.events.redis_publisher import RedisPublisher
+
+        publisher = RedisPublisher(batching=True)
+        payload = {"run_id": "r1", "status": "running"}
+        publisher.publish("RUN_STEP", payload)
+        payload["status"] = "failed"
+        assert publisher.flush(timeout=2)
+        publisher.close()
+
+        assert json.loads(fake_redis.published[0][1])["payload"]["status"] == "running"
+
+    def test_unbatched_publish_is_synchronous(self, fake_redis):
+        from app.events.redis_publisher import RedisPublisher
+
+        publisher = RedisPublisher(batching=False)
+        publisher.publish("RUN_STARTED", {"run_id": "r1"})
+        assert fake_redis.round_trips == 1
+        assert publisher.get_buffer_stats() is None
+        publisher.close()
+
+    def test_batching_env_switch(self, fake_redis, monkeypatch):
+        from app.events.redis_publisher import RedisPublisher
+
+        monkeypatch.setenv("EVENT_PUBLISHER_BATCHING", "false")
+        publisher = RedisPublisher()
+        assert publisher.get_buffer_stats() is None
+        publisher.close()
@@ -0,0 +1,358 @@
+"""
+Event Reactor Tests
+
+Tests for concurrent per-event-type dispatch, async handlers, Redis Streams
+consumer-group delivery (ACK, reclaim, dead-letter) and idempotent
+redelivery in EventReactor.
+
+Run with:
+    pytest tests/events/test_event_reactor.py -v
+"""
+
+import asyncio
+import itertools
+import json
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.events import subscribers
+from app.events.subscribers import EventEnvelope, EventReactor
+
+
+def _envelope(event_type: str, **payload) -> EventEnvelope:
+    return EventEnvelope(
+        event_type=event_type,
+        timestamp=datetime.now(timezone.utc),
+        source="test",
+        payload=payload,
+    )
+
+
+def _message(event_type: str, **payload) -> dict:
+    return {
+        "data": json.dumps(
+            {
+                "event_type": event_type,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "source": "test",
+                "payload": payload,
+            }
+        )
+    }
+
+
+class _FakeStreamRedis:
+    """In-memory subset of Redis Streams + key commands used by the reactor."""
+
+    def __init__(self):
+        self.entries = []  # (id, fields)
+        self.pending = {}  # id -> {"consumer", "times_delivered", "delivered_at"}
+        self.last_delivered = 0
+        self.keys = {}
+        self.dead_letter = []
+        self._ids = itertools.count(1)
+        self.lock = threading.Lock()
+
+    def add(self, fields):
+        msg_id = f"{next(self._ids)}-0"
+        self.entries.append((msg_id, fields))
+        return msg_id
+
+    def ping(self):
+        return True
+
+    def xgroup_create(self, name, groupname, id="$", mkstream=False):
+        return True
+
+    def xreadgroup(self, groupname, consumername, streams, count=None, block=None):
+        with self.lock:
+            new = self.entries[self.last_delivered : self.last_delivered + (count or 10)]
+            self.last_delivered += len(new)
+            for msg_id, _ in new:
+                self.pending[msg_id] = {"consumer": consumername, "times_delivered": 1, "delivered_at": time.time()}
+        if not new:
+            time.sleep(0.01)
+            return []
+        return [("aos:events:stream", new)]
+
+    def xack(self, name, groupname, *ids):
+        with self.lock:
+            return sum(1 for i in ids if self.pending.pop(i, None) is not None)
+
+    def xpending_range(self, name, groupname, min, max, count, consumername=None, idle=None):
+        now = time.time()
+        with self.lock:
+            return [
+                {"message_id": i, "consumer": p["consumer"], "times_delivered": p["times_delivered"]}
+                for i, p in self.pending.items()
+                if idle is None or (now - p["delivered_at"]) * 1000 >= idle
+            ][:count]
+
+    def xclaim(self, name, groupname, consumername, min_idle_time, message_ids, **kwargs):
+        claimed = []
+        with self.lock:
+            for msg_id in message_ids:
+                self.pending[msg_id]["times_delivered"] += 1
+                self.pending[msg_id]["delivered_at"] = time.time()
+                fields = next((f for i, f in self.entries if i == msg_id), None)
+                claimed.append((msg_id, fields))
+        return claimed
+
+    def xrange(self, name, min, max):
+        return [(i, f) for i, f in self.entries if i == min]
+
+    def xadd(self, name, fields, maxlen=None, approximate=True):
+        self.dead_letter.append(fields)
+        return "dl-0"
+
+    def exists(self, key):
+        return int(key in self.keys)
+
+    def set(self, key, value, ex=None):
+        self.keys[key] = value
+
+    def publish(self, channel, message):
+        return 0
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_stream_redis(monkeypatch):
+    import redis
+
+    client = _FakeStreamRedis()
+    monkeypatch.setattr(redis.Redis, "from_url", classmethod(lambda cls, *a, **kw: client))
+    monkeypatch.setattr(subscribers, "REACTOR_CLAIM_INTERVAL_SECONDS", 0.0)
+    return client
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestConcurrentDispatch:
+    """Worker pools isolate slow handlers per event type."""
+
+    def test_slow_handler_does_not_block_other_event_types(self):
+        reactor = EventReactor(redis_url="redis://unused", workers_per_type=1, queue_size=10)
+        release = threading.Event()
+        fast_done = threading.Event()
+
+        reactor.register_handler("audit.slow", lambda p: release.wait(5), name="slow")
+        reactor.register_handler("run.failed", lambda p: fast_done.set(), name="fast")
+
+        reactor._submit(_envelope("audit.slow"))
+        reactor._submit(_envelope("run.failed"))
+        assert fast_done.wait(2), "fast handler was blocked by the slow one"
+
+        release.set()
+        assert _wait_for(lambda: reactor.stats.events_handled == 2)
+        assert set(reactor.stats.queue_depths) == {"audit.slow", "run.failed"}
+        reactor._stop_event.set()
+        for pool in reactor._pools.values():
+            pool.shutdown(timeout=1)
+
+    def test_inline_dispatch_is_default(self):
+        reactor = EventReactor(redis_url="redis://unused", workers_per_type=0)
+        seen = []
+        reactor.register_handler("run.failed", lambda p: seen.append(threading.current_thread().name))
+        reactor._submit(_envelope("run.failed"))
+        assert seen == [threading.current_thread().name]
+        assert reactor._pools == {}
+
+    def test_async_handler_supported(self):
+        reactor = EventReactor(redis_url="redis://unused", workers_per_type=0)
+        seen = []
+
+        async def handler(payload):
+            await asyncio.sleep(0)
+            seen.append(payload["run_id"])
+
+        reactor.register_handler("run.completed", handler)
+        reactor._submit(_envelope("run.completed", run_id="r1"))
+        reactor._submit(_envelope("run.completed", run_id="r2"))
+        assert seen == ["r1", "r2"]
+
+    def test_handler_stats_track_latency_lag_and_failures(self):
+        reactor = EventReactor(redis_url="redis://unused", workers_per_type=0)
+
+        def boom(payload):
+            raise ValueError("boom")
+
+        reactor.register_handler("run.failed", lambda p: time.sleep(0.01), name="ok")
+        reactor.register_handler("run.failed", boom, name="boom")
+        reactor._submit(_envelope("run.failed"))
+
+        stats = reactor.stats
+        assert stats.handler_stats["ok"].invocations == 1
+        assert stats.handler_stats["ok"].avg_duration_ms >= 10
+        assert stats.handler_stats["ok"].max_lag_ms >= 0
+        assert stats.handler_stats["boom"].failures == 1
+        assert stats.events_failed == 1
+
+    def test_shutdown_with_full_queue_does_not_block(self):
+        reactor = EventReactor(redis_url="redis://unused", workers_per_type=1, queue_size=2)
+        release = threading.Event()
+        started = threading.Event()
+
+        def slow(payload):
+            started.set()
+            release.wait(5)
+
+        reactor.register_handler("audit.slow", slow)
+        reactor._submit(_envelope("audit.slow"))
+        assert started.wait(2)
+        reactor._submit(_envelope("audit.slow"))
+        reactor._submit(_envelope("audit.slow"))  # queue now full
+
+        pool = reactor._pools["audit.slow"]
+        t0 = time.monotonic()
+        stopper = threading.Thread(target=pool.shutdown, args=(0.2,))
+        stopper.start()
+        stopper.join(2)
+        assert not stopper.is_alive(), "shutdown blocked on a full queue"
+        assert time.monotonic() - t0 < 1.0
+        release.set()
+
+    def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            EventReactor(redis_url="redis://unused", mode="kafka")
+
+
+class TestStreamsMode:
+    """Redis Streams consumer-group delivery."""
+
+    def _start(self, reactor):
+        reactor.start_background()
+        assert _wait_for(lambda: reactor.state.value == "RUNNING")
+
+    def test_messages_acked_after_handling(self, fake_stream_redis):
+        handled = []
+        reactor = EventReactor(redis_url="redis://fake", mode="streams", workers_per_type=2)
+        reactor.register_handler("run.failed", lambda p: handled.append(p["run_id"]))
+
+        for i in range(5):
+            fake_stream_redis.add(_message("run.failed", run_id=f"r{i}"))
+        self._start(reactor)
+
+        assert _wait_for(lambda: reactor.stats.events_acked == 5)
+        reactor.stop(timeout=2)
+        assert sorted(handled) == [f"r{i}" for i in range(5)]
+        assert fake_stream_redis.pending == {}
+
+    def test_events_published_while_down_are_delivered(self, fake_stream_redis):
+        handled = []
+        fake_stream_redis.add(_message("run.failed", run_id="before-start"))
+
+        reactor = EventReactor(redis_url="redis://fake", mode="streams")
+        reactor.register_handler("run.failed", lambda p: handled.append(p["run_id"]))
+        self._start(reactor)
+        assert _wait_for(lambda: handled == ["before-start"])
+        reactor.stop(timeout=2)
+
+    def test_failed_message_redelivered_and_succeeded_handlers_skipped(self, fake_stream_redis, monkeypatch):
+        monkeypatch.setattr(subscribers, "REACTOR_CLAIM_IDLE_MS", 0)
+        calls = {"audit": 0, "flaky": 0}
+
+        def audit(payload):
+            calls["audit"] += 1
+
+        def flaky(payload):
+            calls["flaky"] += 1
+            if calls["flaky"] == 1:
+                raise RuntimeError("transient")
+
+        reactor = EventReactor(redis_url="redis://fake", mode="streams")
+        reactor.register_handler("run.failed", audit, name="audit", priority=10)
+        reactor.register_handler("run.failed", flaky, name="flaky")
+        fake_stream_redis.add(_message("run.failed", run_id="r1"))
+        self._start(reactor)
+
+        assert _wait_for(lambda: reactor.stats.events_acked == 1)
+        reactor.stop(timeout=2)
+        assert calls == {"audit": 1, "flaky": 2}
+        assert reactor.stats.events_redelivered == 1
+        assert reactor.stats.handler_stats["audit"].duplicates_skipped == 1
+
+    def test_locally_queued_messages_not_reclaimed(self, fake_stream_redis, monkeypatch):
+        monkeypatch.setattr(subscribers, "REACTOR_CLAIM_IDLE_MS", 0)
+        release = threading.Event()
+        handled = []
+
+        def slow(payload):
+            release.wait(5)
+            handled.append(payload["run_id"])
+
+        reactor = EventReactor(redis_url="redis://fake", mode="streams", workers_per_type=1, queue_size=10)
+        reactor.register_handler("run.failed", slow)
+        for i in range(3):
+            fake_stream_redis.add(_message("run.failed", run_id=f"r{i}"))
+        self._start(reactor)
+
+        # Several reclaim passes run while the messages wait in the pool queue
+        time.sleep(0.2)
+        release.set()
+        assert _wait_for(lambda: reactor.stats.events_acked == 3)
+        reactor.stop(timeout=2)
+        assert sorted(handled) == ["r0", "r1", "r2"]
+        assert reactor.stats.events_redelivered == 0
+        assert reactor._in_flight == set()
+
+    def test_poison_message_dead_lettered(self, fake_stream_redis, monkeypatch):
+        monkeypatch.setattr(subscribers, "REACTOR_CLAIM_IDLE_MS", 0)
+        monkeypatch.setattr(subscribers, "REACTOR_MAX_DELIVERIES", 2)
+
+        def always_fails(payload):
+            raise RuntimeError("poison")
+
+        reactor = EventReactor(redis_url="redis://fake", mode="streams")
+        reactor.register_handler("run.failed", always_fails)
+        msg_id = fake_stream_redis.add(_message("run.failed", run_id="bad"))
+        self._start(reactor)
+
+        assert _wait_for(lambda: reactor.stats.events_dead_lettered == 1)
+        reactor.stop(timeout=2)
+        assert fake_stream_redis.dead_letter[0]["original_id"] == msg_id
+        assert msg_id not in fake_stream_redis.pending
+
+    def test_custom_idempotency_key_dedups_across_messages(self, fake_stream_redis):
+        handled = []
+        reactor = EventReactor(redis_url="redis://fake", mode="streams")
+        reactor.register_handler(
+            "incident.created",
+            lambda p: handled.append(p["incident_id"]),
+            name="notify",
+            idempotency_key=lambda env: env.payload["incident_id"],
+        )
+        fake_stream_redis.add(_message("incident.created", incident_id="inc-1"))
+        fake_stream_redis.add(_message("incident.created", incident_id="inc-1"))
+        self._start(reactor)
+
+        assert _wait_for(lambda: reactor.stats.events_acked == 2)
+        reactor.stop(timeout=2)
+        assert handled == ["inc-1"]
+
+    def test_quiet_stream_is_not_reported_unhealthy(self, fake_stream_redis):
+        misses = []
+        reactor = EventReactor(redis_url="redis://fake", mode="streams")
+        reactor._heartbeat_interval = 0.05
+        reactor._heartbeat_miss_threshold = 1
+        reactor.set_unhealthy_callback(misses.append)
+        self._start(reactor)
+
+        # No events: only empty XREADGROUP returns keep the reactor live
+        assert _wait_for(lambda: reactor.stats.heartbeats_emitted >= 5)
+        reactor.stop(timeout=2)
+        assert reactor.stats.last_event_time is not None
+        assert misses == []
+        assert reactor.stats.heartbeats_missed == 0
@@ -1,13 +1,19 @@
 """
 Rate Limit Integration Tests
 M8 Deliverable: Verify rate limiting works correctly with Redis
+
+Lease tests run against an in-memory transcription of LEASE_BUCKET_LUA.
 """
 
+import asyncio
+import math
 import os
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from app.utils.rate_limiter import LEASE_BUCKET_LUA, LeasedRateLimiter, LeaseTable, RateLimiter
+
 # Set test environment
 os.environ.setdefault("RATE_LIMIT_ENABLED", "true")
 os.environ.setdefault("RATE_LIMIT_FAIL_OPEN", "true")
@@ -74,13 +80,8 @@ class TestRateLimitMiddleware:
         """Test rate limit check when under limit."""
         from app.middleware.rate_limit import check_rate_limit
 
-        # Mock Redis to always return low count
-        with patch("app.middleware.rate_limit.get_redis") as mock_get_redis:
-            mock_redis = AsyncMock()
-            mock_redis.incr = AsyncMock(return_value=1)
-            mock_redis.expire = AsyncMock(return_value=True)
-            mock_get_redis.return_value = mock_redis
-
+        # Bucket grants the whole lease request
+        with patch("app.middleware.rate_limit._limiter", LeasedRateLimiter(redis_factory=_redis_returning(1, 59))):
             allowed, current, limit, remaining = await check_rate_limit("tenant1", "free")
 
             assert allowed is True
@@ -93,16 +94,14 @@ class TestRateLimitMiddleware:
         """Test rate limit check when over limit."""
         from app.middleware.rate_limit import check_rate_limit
 
-        # Mock Redis to return count over limit
-        with patch("app.middleware.rate_limit.get_redis") as mock_get_redis:
-            mock_redis = AsyncMock()
-            mock_redis.incr = AsyncMock(return_value=61)  # Over 60 limit
-            mock_get_redis.return_value = mock_redis
-
+        # Empty bucket: nothing granted, next token in 400ms
+        with patch(
+            "app.middleware.rate_limit._limiter", LeasedRateLimiter(redis_factory=_redis_returning(0, 0.6, 400))
+        ):
             allowed, current, limit, remaining = await check_rate_limit("tenant1", "free")
 
             assert allowed is False
-            assert current == 61
+            assert current == 60
             assert limit == 60
             assert remaining == 0
 
@@ -114,7 +113,10 @@ class TestRateLimitMiddleware:
         with patch("app.middleware.rate_limit.get_redis") as mock_get_redis:
             mock_get_redis.side_effect = Exception("Redis connection failed")
 
-            with patch("app.middleware.rate_limit.RATE_LIMIT_FAIL_OPEN", True):
+            with (
+                patch("app.middleware.rate_limit._limiter", LeasedRateLimiter(redis_factory=mock_get_redis)),
+                patch.dict(os.environ, {"RATE_LIMIT_FAIL_OPEN": "true"}),
+            ):
                 allowed, current, limit, remaining = await check_rate_limit("tenant1", "free")
 
                 # Should allow request (fail-open)
@@ -129,7 +131,10 @@ class TestRateLimitMiddleware:
         with patch("app.middleware.rate_limit.get_redis") as mock_get_redis:
             mock_get_redis.side_effect = Exception("Redis connection failed")
 
-            with patch("app.middleware.rate_limit.RATE_LIMIT_FAIL_OPEN", False):
+            with (
+                patch("app.middleware.rate_limit._limiter", LeasedRateLimiter(redis_factory=mock_get_redis)),
+                patch.dict(os.environ, {"RATE_LIMIT_FAIL_OPEN": "false"}),
+            ):
                 allowed, current, limit, remaining = await check_rate_limit("tenant1", "free")
 
                 # Should deny request (fail-closed)
@@ -137,6 +142,177 @@ class TestRateLimitMiddleware:
                 assert remaining == 0
 
 
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeBucketRedis:
+    """In-memory transcription of LEASE_BUCKET_LUA, sharing a clock with the limiters."""
+
+    def __init__(self, clock: _Clock):
+        self.clock = clock
+        self.buckets = {}
+        self.calls = 0
+        self.fail = False
+
+    def register_script(self, script):
+        assert "HMGET" in script
+        return _FakeScript(self)
+
+    def lease(self, key, capacity, window_ms, requested):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        now_ms = int(self.clock() * 1000)
+        rate = capacity / window_ms
+        tokens, last = self.buckets.get(key, (capacity, now_ms))
+        tokens = min(capacity, tokens + max(0, now_ms - last) * rate)
+        granted = min(requested, math.floor(tokens))
+        tokens -= granted
+        self.buckets[key] = (tokens, now_ms)
+        retry_ms = math.ceil((1 - tokens) / rate) if granted == 0 else 0
+        return [granted, repr(tokens), retry_ms]
+
+
+class _FakeScript:
+    def __init__(self, redis):
+        self.registered_client = redis
+
+    def __call__(self, keys, args):
+        reply = self.registered_client.lease(keys[0], *args)
+        if getattr(self.registered_client, "sync", False):
+            return reply
+
+        async def _reply():
+            return reply
+
+        return _reply()
+
+
+def _redis_returning(granted, tokens, retry_ms=0):
+    script = AsyncMock(return_value=[granted, str(tokens), retry_ms])
+    redis = MagicMock()
+    redis.register_script.return_value = script
+    script.registered_client = redis
+    return AsyncMock(return_value=redis)
+
+
+def _limiter(redis, clock, fail_open=True):
+    async def factory():
+        return redis
+
+    return LeasedRateLimiter(redis_factory=factory, fail_open=fail_open, leases=LeaseTable(lease_ttl=1.0, clock=clock))
+
+
+class TestLeasedRateLimiter:
+    """Leased token buckets: local serving, bounded overshoot, failure modes."""
+
+    @pytest.mark.asyncio
+    async def test_serves_from_local_lease(self):
+        clock = _Clock()
+        redis = _FakeBucketRedis(clock)
+        limiter = _limiter(redis, clock)
+
+        results = []
+        for _ in range(200):
+            results.append(await limiter.acquire("rl:t1:pro", 1200, 60))
+            clock.now += 0.005  # 200 req/s for one process
+        assert all(d.allowed for d in results)
+        # Leases grow to rate * ttl = 20 tokens, so ~1 Redis call per 20 requests
+        assert redis.calls < 25
+
+    @pytest.mark.asyncio
+    async def test_denial_is_cached_until_refill(self):
+        clock = _Clock()
+        redis = _FakeBucketRedis(clock)
+        limiter = _limiter(redis, clock)
+
+        admitted = [(await limiter.acquire("rl:t1:free", 60, 60)).allowed for _ in range(100)]
+        assert sum(admitted) == 60
+        calls = redis.calls
+
+        denied = await limiter.acquire("rl:t1:free", 60, 60)
+        assert not denied.allowed and 0 < denied.retry_after <= 1.0
+        assert redis.calls == calls  # denied locally
+
+        clock.now += 1.0  # one token refilled
+        assert (await limiter.acquire("rl:t1:free", 60, 60)).allowed
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_lease_call(self):
+        clock = _Clock()
+        redis = _FakeBucketRedis(clock)
+        limiter = _limiter(redis, clock)
+        await limiter.acquire("rl:t1:pro", 1200, 60)  # warm: lease size 1
+        clock.now += 2.0
+
+        decisions = await asyncio.gather(*(limiter.acquire("rl:t1:pro", 1200, 60) for _ in range(20)))
+        assert all(d.allowed for d in decisions)
+        # 20 waiters served from at most a handful of leases, not 20 calls
+        assert redis.calls <= 6
+
+    @pytest.mark.asyncio
+    async def test_overshoot_bounded_across_processes(self):
+        """8 processes hammering one tenant at 5k req/s stay within limit + rate * (T + ttl)."""
+        clock = _Clock()
+        redis = _FakeBucketRedis(clock)
+        limit, window, workers, seconds, rps = 600, 60, 8, 10, 5000
+        limiters = [_limiter(redis, clock) for _ in range(workers)]
+
+        admitted = 0
+        step = 1 / rps
+        for i in range(seconds * rps):
+            clock.now += step
+            admitted += (await limiters[i % workers].acquire("rl:hot:pro", limit, window)).allowed
+
+        rate = limit / window
+        exact = limit + rate * seconds
+        assert admitted <= limit + rate * (seconds + 1.0)
+        assert admitted >= exact * 0.8
+        # Redis sees a small fraction of the 50k requests
+        assert redis.calls < seconds * rps / 50
+
+    @pytest.mark.asyncio
+    async def test_redis_failure_fails_open_or_closed_with_backoff(self):
+        clock = _Clock()
+        redis = _FakeBucketRedis(clock)
+        redis.fail = True
+
+        open_limiter = _limiter(redis, clock, fail_open=True)
+        decision = await open_limiter.acquire("rl:t1:free", 60, 60)
+        assert decision.allowed and decision.degraded
+        await open_limiter.acquire("rl:t1:free", 60, 60)
+        assert redis.calls == 1  # backing off, not retrying every request
+
+        closed = await _limiter(redis, clock, fail_open=False).acquire("rl:t1:free", 60, 60)
+        assert not closed.allowed and closed.degraded
+
+        redis.fail = False
+        clock.now += 1.5
+        recovered = await open_limiter.acquire("rl:t1:free", 60, 60)
+        assert recovered.allowed and not recovered.degraded
+
+    def test_sync_limiter_uses_leases(self):
+        clock = _Clock()
+        redis = _FakeBucketRedis(clock)
+        redis.sync = True
+        limiter = RateLimiter(leases=LeaseTable(lease_ttl=1.0, clock=clock))
+        limiter._client = redis
+        limiter._script = redis.register_script(LEASE_BUCKET_LUA)
+
+        allowed = 0
+        for _ in range(300):
+            allowed += limiter.allow("tenant:t1", rate_per_min=100)
+            clock.now += 0.01
+        # 100 burst + ~5 refilled over 3s (+ at most one lease TTL of refill)
+        assert 100 <= allowed <= 100 + 100 / 60 * 4
+        assert redis.calls < 300
+
+
 class TestRateLimitMetrics:
     """Test Prometheus metrics for rate limiting."""
 
@@ -182,7 +358,7 @@ class TestRateLimitLiveRedis:
         # Use unique tenant to avoid conflicts
         tenant_id = f"test_tenant_{int(time.time())}"
 
-        # First request should be allowed
+        # First request leases one token from a full bucket
         allowed, current, limit, remaining = await check_rate_limit(tenant_id, "free")
         assert allowed is True
         assert current == 1
@@ -191,5 +367,4 @@ class TestRateLimitLiveRedis:
         # Second request should also be allowed
         allowed, current, limit, remaining = await check_rate_limit(tenant_id, "free")
         assert allowed is True
-        assert current == 2
-        assert remaining == 58
+        assert remaining <= 59
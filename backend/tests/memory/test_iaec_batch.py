@@ -0,0 +1,147 @@
+"""
+IAEC Batch API Tests
+
+compose_batch() must produce the same composites as compose() with one
+provider call per batch, and similarity_matrix() must match the per-pair
+similarity() loop.
+
+Run with:
+    pytest tests/memory/test_iaec_batch.py -v
+"""
+
+import hashlib
+
+import numpy as np
+import pytest
+
+from app.memory import iaec
+from app.memory.iaec import EMBEDDING_DIMENSIONS, InstructionAwareEmbeddingComposer
+
+
+def _fake_vector(text: str) -> np.ndarray:
+    seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).standard_normal(EMBEDDING_DIMENSIONS).astype(np.float32)
+
+
+class _FakeProvider:
+    """Deterministic embedding provider that counts requests."""
+
+    def __init__(self):
+        self.single_calls = 0
+        self.batch_calls = 0
+        self.batch_sizes = []
+
+    async def embed(self, text, use_cache=True):
+        self.single_calls += 1
+        return _fake_vector(text).tolist()
+
+    async def embed_batch(self, texts, use_cache=True):
+        self.batch_calls += 1
+        self.batch_sizes.append(len(texts))
+        return [_fake_vector(t).tolist() for t in texts]
+
+
+ITEMS = [
+    ("summarize", "What are the key points of this report?", "Quarterly revenue grew 12%."),
+    ("extract", "Extract all email addresses", None),
+    ("analyze", "Why did latency spike on Tuesday?", "p99 went from 80ms to 900ms."),
+    ("unknown_instruction", "Tell me about the weather", ""),
+    ("summarize", "What are the key points of this report?", "Quarterly revenue grew 12%."),
+]
+
+
+@pytest.fixture
+def provider():
+    return _FakeProvider()
+
+
+@pytest.fixture
+async def composer(provider, tmp_path, monkeypatch):
+    monkeypatch.setattr(iaec, "WHITENING_STORAGE_DIR", str(tmp_path))
+    c = InstructionAwareEmbeddingComposer(embedding_fn=provider.embed, batch_embedding_fn=provider.embed_batch)
+    await c.initialize()
+    provider.single_calls = 0
+    return c
+
+
+class TestComposeBatch:
+    @pytest.mark.parametrize("mode", ["weighted", "hybrid"])
+    async def test_matches_compose(self, composer, mode):
+        batch = await composer.compose_batch(ITEMS, mode=mode, policy_id="pol_001")
+        assert len(batch) == len(ITEMS)
+
+        for (instruction, query, context), got in zip(ITEMS, batch):
+            expected = await composer.compose(instruction, query, context, mode=mode, policy_id="pol_001")
+            np.testing.assert_allclose(got.vector, expected.vector, atol=1e-5)
+            assert got.instruction == expected.instruction
+            assert got.weights == expected.weights
+            assert got.provenance_hash == expected.provenance_hash
+            assert got.slot_basis_hash == expected.slot_basis_hash
+            assert got.collapse_prevented == expected.collapse_prevented
+            assert got.values_clamped == expected.values_clamped
+            assert got.integrity_verified == expected.integrity_verified
+            assert got.deep_mismatch_score == pytest.approx(expected.deep_mismatch_score, abs=1e-5)
+            assert got.whitening_basis_id == expected.whitening_basis_id
+
+    async def test_single_batched_provider_call(self, composer, provider):
+        await composer.compose_batch(ITEMS)
+
+        assert provider.batch_calls == 1
+        assert provider.single_calls == 0
+        # Duplicate query/context texts are embedded once
+        assert provider.batch_sizes == [6]
+
+    async def test_falls_back_to_single_calls_without_batch_provider(self, provider, tmp_path, monkeypatch):
+        monkeypatch.setattr(iaec, "WHITENING_STORAGE_DIR", str(tmp_path))
+        c = InstructionAwareEmbeddingComposer(embedding_fn=provider.embed)
+        await c.initialize()
+
+        batch = await c.compose_batch(ITEMS[:2])
+
+        assert provider.batch_calls == 0
+        assert [r.instruction for r in batch] == ["summarize", "extract"]
+
+    async def test_empty_batch(self, composer, provider):
+        assert await composer.compose_batch([]) == []
+        assert provider.batch_calls == 0
+
+
+class TestSimilarityMatrix:
+    @pytest.mark.parametrize("mode", ["cosine", "instruction_weighted", "slot_weighted"])
+    def test_raw_candidates_match_pairwise(self, composer, mode):
+        rng = np.random.default_rng(7)
+        query = rng.standard_normal(EMBEDDING_DIMENSIONS).astype(np.float32)
+        candidates = rng.standard_normal((50, EMBEDDING_DIMENSIONS)).astype(np.float32)
+
+        scores = composer.similarity_matrix(query, candidates, mode=mode, instruction="analyze")
+        expected = [composer.similarity(query, c, mode=mode, instruction="analyze") for c in candidates]
+
+        assert scores.dtype == np.float32
+        assert scores.shape == (50,)
+        np.testing.assert_allclose(scores, expected, atol=1e-5)
+
+    @pytest.mark.parametrize("mode", ["cosine", "instruction_weighted", "slot_weighted"])
+    async def test_composite_candidates_match_pairwise(self, composer, mode):
+        # Context-bearing items only: similarity() jitters all-zero context slots
+        composites = await composer.compose_batch([item for item in ITEMS if item[2]])
+        query = composites[0]
+
+        scores = composer.similarity_matrix(query, composites, mode=mode, instruction="summarize")
+        expected = [composer.similarity(query, c, mode=mode, instruction="summarize") for c in composites]
+
+        np.testing.assert_allclose(scores, expected, atol=1e-5)
+
+    async def test_empty_context_slot_is_deterministic(self, composer):
+        composites = await composer.compose_batch(ITEMS[:2])
+
+        first = composer.similarity_matrix(composites[0], composites, mode="slot_weighted")
+        second = composer.similarity_matrix(composites[0], composites, mode="slot_weighted")
+
+        np.testing.assert_array_equal(first, second)
+
+    def test_rejects_unknown_mode_and_bad_shape(self, composer):
+        vec = np.ones(EMBEDDING_DIMENSIONS, dtype=np.float32)
+        with pytest.raises(ValueError):
+            composer.similarity_matrix(vec, vec[None, :], mode="euclidean")
+        with pytest.raises(ValueError):
+            composer.similarity_matrix(vec, vec)
@@ -0,0 +1,170 @@
+"""
+IAEC Whitening Storage Tests
+
+Streaming covariance, the mmap'd non-pickled whitening artifact, legacy
+.npz migration and the packed slot-basis format.
+
+Run with:
+    pytest tests/memory/test_iaec_whitening.py -v
+"""
+
+import hashlib
+import json
+import mmap
+
+import numpy as np
+import pytest
+
+from app.memory import iaec
+from app.memory.iaec import (
+    EMBEDDING_DIMENSIONS,
+    IAEC_VERSION,
+    EMBEDDING_MODEL_VERSION,
+    InstructionAwareEmbeddingComposer,
+    SlotBasis,
+    StreamingCovariance,
+    compute_whitening_matrix,
+    load_whitening_artifact,
+    write_whitening_artifact,
+)
+
+
+async def _fake_embedding(text, use_cache=True):
+    seed = int(hashlib.sha256(text.encode()).hexdigest()[:8], 16)
+    return np.random.default_rng(seed).standard_normal(EMBEDDING_DIMENSIONS).tolist()
+
+
+@pytest.fixture
+def storage_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(iaec, "WHITENING_STORAGE_DIR", str(tmp_path))
+    return tmp_path
+
+
+class TestStreamingCovariance:
+    def test_batches_match_full_covariance(self):
+        data = np.random.default_rng(1).standard_normal((500, 16))
+
+        acc = StreamingCovariance()
+        for start in range(0, 500, 37):
+            acc.update(data[start : start + 37])
+
+        assert acc.count == 500
+        np.testing.assert_allclose(acc.mean, data.mean(axis=0), atol=1e-12)
+        np.testing.assert_allclose(acc.covariance(), np.cov(data.T), atol=1e-12)
+
+    def test_merge_shards_and_checkpoint(self, tmp_path):
+        data = np.random.default_rng(2).standard_normal((300, 8))
+        left = StreamingCovariance().update(data[:120])
+        right = StreamingCovariance().update(data[120:])
+
+        left.save(str(tmp_path / "state.npz"))
+        resumed = StreamingCovariance.load(str(tmp_path / "state.npz")).merge(right)
+
+        np.testing.assert_allclose(resumed.covariance(), np.cov(data.T), atol=1e-12)
+
+    def test_needs_two_samples(self):
+        with pytest.raises(ValueError):
+            StreamingCovariance().update(np.ones(4)).covariance()
+
+
+class TestWhiteningArtifact:
+    def test_round_trip_is_mmapped_float32(self, storage_dir):
+        data = np.random.default_rng(3).standard_normal((64, 32))
+        acc = StreamingCovariance().update(data)
+        matrix = compute_whitening_matrix(acc.mean, acc.covariance())
+        base = str(storage_dir / "whitening_test")
+
+        meta = write_whitening_artifact(base, matrix, acc.mean, samples=acc.count)
+        loaded, mean, stored_meta = load_whitening_artifact(base)
+
+        assert isinstance(loaded, np.memmap)
+        assert loaded.dtype == np.float32
+        assert stored_meta == meta
+        assert stored_meta["samples"] == 64
+        np.testing.assert_array_equal(loaded, matrix)
+        np.testing.assert_allclose(mean, acc.mean, rtol=1e-6)
+        # Plain .npy: readable without pickle
+        np.load(f"{base}.npy", allow_pickle=False)
+
+    def test_missing_artifact(self, storage_dir):
+        assert load_whitening_artifact(str(storage_dir / "nope")) is None
+
+    def test_version_mismatch_rejected(self, storage_dir):
+        base = str(storage_dir / "whitening_test")
+        write_whitening_artifact(base, np.eye(4, dtype=np.float32), None)
+        meta_path = storage_dir / "whitening_test.json"
+        meta = json.loads(meta_path.read_text())
+        meta["model_version"] = "some-other-model"
+        meta_path.write_text(json.dumps(meta))
+
+        with pytest.raises(ValueError):
+            load_whitening_artifact(base)
+
+
+class TestComposerWhitening:
+    async def test_second_worker_maps_saved_matrix(self, storage_dir):
+        first = InstructionAwareEmbeddingComposer(embedding_fn=_fake_embedding)
+        await first.initialize()
+        second = InstructionAwareEmbeddingComposer(embedding_fn=_fake_embedding)
+        await second.initialize()
+
+        info = second.get_whitening_info()
+        assert info["memory_mapped"] is True
+        assert info["precision"] == "float32"
+        assert second._whitening_metadata() == first._whitening_metadata()
+        assert second._whitening_metadata()[1].endswith("/float32")
+
+    async def test_legacy_npz_is_migrated(self, storage_dir):
+        composer = InstructionAwareEmbeddingComposer(embedding_fn=_fake_embedding)
+        composer._temporal_signature = iaec.TemporalSignature.current()
+        legacy = np.random.default_rng(4).standard_normal((8, 8))
+        np.savez_compressed(
+            composer._get_legacy_whitening_path(),
+            matrix=legacy,
+            mean=None,
+            iaec_version=IAEC_VERSION,
+            model_version=EMBEDDING_MODEL_VERSION,
+        )
+
+        assert composer._load_whitening_matrix() is True
+        assert isinstance(composer._whitening_matrix, np.memmap)
+        assert composer._whitening_mean is None
+        np.testing.assert_allclose(composer._whitening_matrix, legacy.astype(np.float32))
+
+
+class TestPackedSlotBasis:
+    def _basis(self):
+        rng = np.random.default_rng(5)
+        return SlotBasis(
+            instruction_vector=rng.standard_normal(EMBEDDING_DIMENSIONS).astype(np.float32),
+            query_vector=rng.standard_normal(EMBEDDING_DIMENSIONS).astype(np.float32),
+            context_vector=np.zeros(EMBEDDING_DIMENSIONS, dtype=np.float32),
+            weights=(0.3, 0.5, 0.2),
+            temporal_vector=rng.standard_normal(iaec.TEMPORAL_SLOT_SIZE).astype(np.float32),
+            policy_vector=rng.standard_normal(iaec.POLICY_SLOT_SIZE).astype(np.float32),
+        )
+
+    def test_round_trip(self):
+        basis = self._basis()
+        packed = basis.to_packed()
+
+        assert len(packed) == SlotBasis.packed_size()
+        assert len(packed) < len(basis.to_bytes()) / 3
+
+        restored = SlotBasis.from_packed(packed)
+        assert restored.weights == basis.weights
+        assert restored.to_bytes() == basis.to_bytes()
+
+    def test_reads_from_mmapped_file_at_offset(self, tmp_path):
+        basis = self._basis()
+        path = tmp_path / "bases.bin"
+        path.write_bytes(basis.to_packed() * 3)
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            restored = SlotBasis.from_packed(mm, offset=2 * SlotBasis.packed_size())
+            np.testing.assert_array_equal(restored.query_vector, basis.query_vector)
+            del restored
+
+    def test_rejects_foreign_buffer(self):
+        with pytest.raises(ValueError):
+            SlotBasis.from_packed(b"\0" * SlotBasis.packed_size())
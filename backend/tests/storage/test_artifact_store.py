@@ -0,0 +1,299 @@
+"""
+Artifact Store Tests
+
+Tests for streaming store/retrieve, content-addressed deduplication,
+per-run manifests and range reads in the artifact storage backends.
+
+Run with:
+    pytest tests/storage/test_artifact_store.py -v
+"""
+
+import hashlib
+import io
+import os
+import threading
+
+import pytest
+
+from app.schemas.artifact import ArtifactType
+from app.storage import artifact as artifact_module
+from app.storage.artifact import LocalArtifactStore, S3ArtifactStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return LocalArtifactStore(base_path=str(tmp_path / "artifacts"))
+
+
+class TestLocalArtifactStore:
+    """Tests for LocalArtifactStore."""
+
+    def test_store_and_retrieve_roundtrip(self, store):
+        stored = store.store("run-1", b"hello world", "out.txt", ArtifactType.TEXT)
+        assert stored.size_bytes == 11
+        assert stored.checksum == hashlib.sha256(b"hello world").hexdigest()
+        assert stored.content_type == "text/plain"
+        assert store.retrieve(stored.artifact_id) == b"hello world"
+
+    def test_store_file_like_is_streamed(self, store):
+        payload = bytes(range(256)) * 10_000  # spans several chunks
+        stream = io.BytesIO(payload)
+        stored = store.store("run-1", stream, "blob.bin")
+        assert stored.size_bytes == len(payload)
+        assert stored.checksum == hashlib.sha256(payload).hexdigest()
+        assert store.retrieve(stored.artifact_id) == payload
+
+    def test_store_chunk_iterable(self, store):
+        stored = store.store("run-1", iter([b"ab", b"", b"cd"]), "chunks.bin")
+        assert store.retrieve(stored.artifact_id) == b"abcd"
+
+    def test_identical_content_is_deduplicated(self, store):
+        a = store.store("run-1", b"same bytes", "a.txt")
+        b = store.store("run-2", b"same bytes", "b.txt")
+        assert a.checksum == b.checksum
+        blobs = [p for p in store._blobs_path.rglob("*") if p.is_file() and not p.name.startswith(".")]
+        assert len(blobs) == 1
+
+    def test_delete_keeps_shared_blob_until_last_reference(self, store):
+        a = store.store("run-1", b"shared", "a.txt")
+        b = store.store("run-2", b"shared", "b.txt")
+
+        assert store.delete(a.artifact_id) is True
+        assert store.retrieve(b.artifact_id) == b"shared"
+        assert store._blob_path(b.checksum).exists()
+
+        assert store.delete(b.artifact_id) is True
+        assert not store._blob_path(b.checksum).exists()
+        assert store.delete(b.artifact_id) is False
+
+    def test_list_by_run_uses_manifest(self, store, monkeypatch):
+        a = store.store("run-1", b"one", "a.txt")
+        b = store.store("run-1", b"two", "b.txt")
+        store.store("run-2", b"three", "c.txt")
+
+        def _no_scan(*args, **kwargs):
+            raise AssertionError("list_by_run must not scan all metadata")
+
+        monkeypatch.setattr(type(store._metadata_path), "glob", _no_scan)
+        listed = store.list_by_run("run-1")
+        assert {x.artifact_id for x in listed} == {a.artifact_id, b.artifact_id}
+        assert listed[0].created_at >= listed[1].created_at
+
+    def test_list_by_run_after_delete(self, store):
+        a = store.store("run-1", b"one", "a.txt")
+        b = store.store("run-1", b"two", "b.txt")
+        store.delete(a.artifact_id)
+        assert [x.artifact_id for x in store.list_by_run("run-1")] == [b.artifact_id]
+
+    def test_list_by_run_rebuilds_legacy_manifest(self, store):
+        a = store.store("run-1", b"one", "a.txt")
+        store._manifest_file("run-1").unlink()
+
+        assert [x.artifact_id for x in store.list_by_run("run-1")] == [a.artifact_id]
+        assert store._manifest_file("run-1").exists()
+        assert store.list_by_run("missing-run") == []
+
+    def test_store_into_legacy_run_keeps_earlier_artifacts(self, store):
+        legacy = store.store("run-1", b"one", "a.txt")
+        store._manifest_file("run-1").unlink()
+
+        new = store.store("run-1", b"two", "b.txt")
+
+        assert {x.artifact_id for x in store.list_by_run("run-1")} == {legacy.artifact_id, new.artifact_id}
+
+    def test_delete_waits_for_in_flight_link(self, store, monkeypatch):
+        a = store.store("run-1", b"shared", "a.txt")
+        linking, release = threading.Event(), threading.Event()
+        link_blob = store._link_blob
+
+        def _slow_link(checksum, artifact_path):
+            linking.set()
+            release.wait(5)
+            link_blob(checksum, artifact_path)
+
+        monkeypatch.setattr(store, "_link_blob", _slow_link)
+        stored = {}
+        writer = threading.Thread(target=lambda: stored.update(b=store.store("run-2", b"shared", "b.txt")))
+        writer.start()
+        assert linking.wait(5)
+
+        deleter = threading.Thread(target=store.delete, args=(a.artifact_id,))
+        deleter.start()
+        deleter.join(0.2)
+        assert deleter.is_alive()  # blocked on the digest lock
+
+        release.set()
+        writer.join(5)
+        deleter.join(5)
+        assert store.retrieve(stored["b"].artifact_id) == b"shared"
+        assert os.stat(store._blob_path(a.checksum)).st_nlink == 2
+
+    def test_range_reads(self, store):
+        stored = store.store("run-1", b"0123456789", "digits.txt")
+        assert store.retrieve_range(stored.artifact_id, 2, 5) == b"234"
+        assert store.retrieve_range(stored.artifact_id, 7) == b"789"
+        assert store.retrieve_range(stored.artifact_id, 8, 100) == b"89"
+        assert store.retrieve_range(stored.artifact_id, 20) == b""
+        with pytest.raises(ValueError):
+            store.retrieve_range(stored.artifact_id, -1)
+
+    def test_iter_content_chunks(self, store):
+        stored = store.store("run-1", b"abcdefghij", "letters.txt")
+        chunks = list(store.iter_content(stored.artifact_id, 1, 9, chunk_size=3))
+        assert chunks == [b"bcd", b"efg", b"hi"]
+
+    def test_missing_artifact_raises(self, store):
+        with pytest.raises(FileNotFoundError):
+            store.retrieve("nope")
+        with pytest.raises(FileNotFoundError):
+            store.iter_content("nope")
+
+    @pytest.mark.asyncio
+    async def test_async_stream_roundtrip(self, store):
+        stored = await store.store_stream("run-1", io.BytesIO(b"x" * 5000), "x.bin")
+        chunks = [c async for c in store.retrieve_stream(stored.artifact_id, chunk_size=2048)]
+        assert [len(c) for c in chunks] == [2048, 2048, 904]
+        assert b"".join(chunks) == b"x" * 5000
+
+
+class _FakeBody:
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self):
+        return self._data
+
+    def iter_chunks(self, chunk_size=1024):
+        for i in range(0, len(self._data), chunk_size):
+            yield self._data[i : i + chunk_size]
+
+
+class _FakeS3Client:
+    """Minimal in-memory S3 client supporting multipart and ranged GETs."""
+
+    class exceptions:
+        class NoSuchKey(Exception):
+            pass
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = {}
+        self.calls = []
+
+    def put_object(self, Bucket, Key, Body, ContentType=None, Metadata=None):
+        self.calls.append("put_object")
+        self.objects[Key] = bytes(Body)
+
+    def create_multipart_upload(self, Bucket, Key, ContentType=None, Metadata=None):
+        self.calls.append("create_multipart_upload")
+        upload_id = f"upload-{len(self.uploads)}"
+        self.uploads[upload_id] = {}
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.calls.append("upload_part")
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.calls.append("complete_multipart_upload")
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b"".join(parts[p["PartNumber"]] for p in MultipartUpload["Parts"])
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.calls.append("abort_multipart_upload")
+        self.uploads.pop(UploadId, None)
+
+    def get_object(self, Bucket, Key, Range=None):
+        if Key not in self.objects:
+            raise self.exceptions.NoSuchKey(Key)
+        data = self.objects[Key]
+        if Range:
+            start, end = Range.removeprefix("bytes=").split("-")
+            data = data[int(start) : int(end) + 1]
+        return {"Body": _FakeBody(data)}
+
+    def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    def get_paginator(self, name):
+        client = self
+
+        class _Paginator:
+            def paginate(self, Bucket, Prefix):
+                keys = sorted(k for k in client.objects if k.startswith(Prefix))
+                client.calls.append(("list", Prefix))
+                yield {"Contents": [{"Key": k} for k in keys]}
+
+        return _Paginator()
+
+
+@pytest.fixture
+def s3_store(monkeypatch):
+    monkeypatch.setattr(artifact_module, "S3_MULTIPART_PART_SIZE", 1024)
+    s3 = S3ArtifactStore(bucket="test-bucket")
+    s3._client = _FakeS3Client()
+    return s3
+
+
+class TestS3ArtifactStore:
+    """Tests for S3ArtifactStore streaming with a fake client."""
+
+    def test_small_artifact_uses_single_put(self, s3_store):
+        stored = s3_store.store("run-1", b"tiny", "t.txt")
+        assert "create_multipart_upload" not in s3_store._client.calls
+        assert s3_store.retrieve(stored.artifact_id) == b"tiny"
+
+    def test_large_artifact_uses_multipart(self, s3_store):
+        payload = b"z" * 3000
+        stored = s3_store.store("run-1", io.BytesIO(payload), "big.bin")
+        assert s3_store._client.calls.count("upload_part") == 3
+        assert stored.size_bytes == 3000
+        assert stored.checksum == hashlib.sha256(payload).hexdigest()
+        assert s3_store.retrieve(stored.artifact_id) == payload
+
+    def test_failed_stream_aborts_upload(self, s3_store):
+        def _chunks():
+            yield b"a" * 2048
+            raise IOError("source failed")
+
+        with pytest.raises(IOError):
+            s3_store.store("run-1", _chunks(), "broken.bin")
+        assert "abort_multipart_upload" in s3_store._client.calls
+
+    def test_range_read(self, s3_store):
+        stored = s3_store.store("run-1", b"0123456789", "d.txt")
+        assert s3_store.retrieve_range(stored.artifact_id, 3, 6) == b"345"
+
+    def test_list_by_run_reads_run_index(self, s3_store):
+        a = s3_store.store("run-1", b"one", "a.txt")
+        s3_store.store("run-2", b"two", "b.txt")
+        s3_store._client.calls.clear()
+
+        listed = s3_store.list_by_run("run-1")
+        assert [x.artifact_id for x in listed] == [a.artifact_id]
+        assert ("list", "artifacts/_metadata/") not in s3_store._client.calls
+
+    def test_list_by_run_falls_back_for_legacy_runs(self, s3_store):
+        legacy = s3_store.store("run-1", b"one", "a.txt")
+        s3_store._client.delete_object("test-bucket", s3_store._run_index_key("run-1", legacy.artifact_id))
+        assert [x.artifact_id for x in s3_store.list_by_run("run-1")] == [legacy.artifact_id]
+
+    def test_list_by_run_backfills_partially_indexed_runs(self, s3_store):
+        legacy = s3_store.store("run-1", b"one", "a.txt")
+        s3_store._client.delete_object("test-bucket", s3_store._run_index_key("run-1", legacy.artifact_id))
+        new = s3_store.store("run-1", b"two", "b.txt")
+        s3_store.store("run-10", b"three", "c.txt")
+        s3_store._client.calls.clear()
+
+        listed = s3_store.list_by_run("run-1")
+
+        assert {x.artifact_id for x in listed} == {legacy.artifact_id, new.artifact_id}
+        assert ("list", "artifacts/_metadata/") not in s3_store._client.calls
+        assert s3_store._run_index_key("run-1", legacy.artifact_id) in s3_store._client.objects
+
+    def test_delete_removes_index_entry(self, s3_store):
+        stored = s3_store.store("run-1", b"one", "a.txt")
+        assert s3_store.delete(stored.artifact_id) is True
+        assert not any(k.startswith("artifacts/_runs/run-1/") for k in s3_store._client.objects)
+        assert s3_store.list_by_run("run-1") == []
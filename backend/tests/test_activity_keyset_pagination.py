@@ -0,0 +1,323 @@
+# Layer: Test
+# AUDIENCE: INTERNAL
+# Role: Keyset pagination and count modes for activity run listings
+
+"""
+Activity Keyset Pagination Tests
+
+- run_cursor: opaque cursors round-trip and are bound to their query
+- ActivityReadDriver: keyset SQL and exact/estimated/cached counts
+- ActivityFacade: cursor pages fetch limit+1 and chain through next_cursor
+- ActivityQueryHandler: bad cursors surface as INVALID_CURSOR
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.hoc.cus.activity.L5_engines.activity_facade import ActivityFacade
+from app.hoc.cus.activity.L5_engines.run_cursor import (
+    InvalidCursorError,
+    cursor_scope,
+    decode_run_cursor,
+    encode_run_cursor,
+)
+from app.hoc.cus.activity.L6_drivers import activity_read_driver
+from app.hoc.cus.activity.L6_drivers.activity_read_driver import ActivityReadDriver
+
+T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+class RecordingSession:
+    """AsyncSession stand-in that records statements and returns canned values."""
+
+    def __init__(self, scalar=0, rows=()):
+        self.statements: list[tuple[str, dict]] = []
+        self._scalar = scalar
+        self._rows = list(rows)
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append((sql, dict(params or {})))
+        result = MagicMock()
+        result.scalar.return_value = self._scalar(sql) if callable(self._scalar) else self._scalar
+        result.mappings.return_value.all.return_value = self._rows
+        return result
+
+
+def _run_row(i: int) -> dict:
+    return {
+        "run_id": f"run-{i:04d}",
+        "tenant_id": "tenant-1",
+        "project_id": None,
+        "is_synthetic": False,
+        "source": "sdk",
+        "provider_type": "openai",
+        "state": "COMPLETED",
+        "status": "succeeded",
+        "started_at": T0 - timedelta(seconds=i),
+        "last_seen_at": None,
+        "completed_at": None,
+        "duration_ms": None,
+        "risk_level": "NORMAL",
+        "latency_bucket": "OK",
+        "evidence_health": "FLOWING",
+        "integrity_status": "VERIFIED",
+        "incident_count": 0,
+        "policy_draft_count": 0,
+        "policy_violation": False,
+        "input_tokens": None,
+        "output_tokens": None,
+        "estimated_cost_usd": None,
+        "created_at": T0 - timedelta(seconds=i),
+    }
+
+
+def _policy_row(i: int) -> dict:
+    return {
+        **_run_row(i),
+        "policy_id": "default",
+        "policy_name": "Default Policy",
+        "policy_scope": "TENANT",
+        "threshold_source": "DEFAULT",
+        "evaluation_outcome": "OK",
+    }
+
+
+@pytest.fixture(autouse=True)
+def _clear_count_cache():
+    activity_read_driver.clear_count_cache()
+    yield
+    activity_read_driver.clear_count_cache()
+
+
+class TestRunCursor:
+    def test_round_trip(self):
+        scope = cursor_scope("runs", "tenant_id = :tenant_id", {"tenant_id": "t"}, "DESC")
+        token = encode_run_cursor(T0, "run-1", scope)
+
+        assert decode_run_cursor(token, scope) == (T0, "run-1")
+        assert "run-1" not in token  # opaque, url-safe
+        assert "=" not in token
+
+    def test_scope_binds_filters_and_direction(self):
+        base = cursor_scope("runs", "tenant_id = :tenant_id", {"tenant_id": "t"}, "DESC")
+        token = encode_run_cursor(T0, "run-1", base)
+
+        for other in (
+            cursor_scope("signals", "tenant_id = :tenant_id", {"tenant_id": "t"}, "DESC"),
+            cursor_scope("runs", "tenant_id = :tenant_id", {"tenant_id": "u"}, "DESC"),
+            cursor_scope("runs", "tenant_id = :tenant_id", {"tenant_id": "t"}, "ASC"),
+        ):
+            with pytest.raises(InvalidCursorError):
+                decode_run_cursor(token, other)
+
+    @pytest.mark.parametrize("token", ["", "not-base64!", "bnVsbA", "W10", "eyJ2IjoxfQ"])
+    def test_malformed_rejected(self, token):
+        with pytest.raises(InvalidCursorError):
+            decode_run_cursor(token, "scope")
+
+
+class TestDriverKeyset:
+    @pytest.mark.asyncio
+    async def test_offset_mode_unchanged(self):
+        session = RecordingSession()
+        await ActivityReadDriver(session).fetch_runs(
+            "tenant_id = :tenant_id", {"tenant_id": "t"}, "started_at", "DESC", 50, 100
+        )
+
+        sql, params = session.statements[0]
+        assert "ORDER BY started_at DESC" in sql
+        assert "LIMIT :limit OFFSET :offset" in sql
+        assert params == {"tenant_id": "t", "limit": 50, "offset": 100}
+
+    @pytest.mark.asyncio
+    async def test_keyset_first_and_next_page(self):
+        session = RecordingSession()
+        driver = ActivityReadDriver(session)
+
+        await driver.fetch_runs_with_policy_context(
+            "tenant_id = :tenant_id", {"tenant_id": "t"}, "completed_at", "DESC", 51, 0, keyset=True
+        )
+        await driver.fetch_runs_with_policy_context(
+            "tenant_id = :tenant_id", {"tenant_id": "t"}, "completed_at", "DESC", 51, 0,
+            keyset=True, after=(T0, "run-9"),
+        )
+
+        first_sql, first_params = session.statements[0]
+        assert "ORDER BY created_at DESC, run_id DESC LIMIT :limit" in first_sql
+        assert "OFFSET" not in first_sql and "(created_at, run_id)" not in first_sql
+        assert first_params == {"tenant_id": "t", "limit": 51}
+
+        next_sql, next_params = session.statements[1]
+        assert "(created_at, run_id) < (:after_created_at, :after_run_id)" in next_sql
+        assert next_params["after_created_at"] == T0
+        assert next_params["after_run_id"] == "run-9"
+
+    @pytest.mark.asyncio
+    async def test_keyset_ascending(self):
+        session = RecordingSession()
+        await ActivityReadDriver(session).fetch_runs(
+            "tenant_id = :tenant_id", {"tenant_id": "t"}, "started_at", "ASC", 10, 0,
+            keyset=True, after=(T0, "run-1"),
+        )
+
+        sql, _ = session.statements[0]
+        assert "(created_at, run_id) > (:after_created_at, :after_run_id)" in sql
+        assert "ORDER BY created_at ASC, run_id ASC" in sql
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", ["fetch_at_risk_runs", "fetch_threshold_signals"])
+    async def test_signal_listings_page_by_keyset(self, method):
+        session = RecordingSession()
+        await getattr(ActivityReadDriver(session), method)(
+            "tenant_id = :tenant_id", {"tenant_id": "t"}, 20, 0, keyset=True, after=(T0, "run-1")
+        )
+
+        sql, _ = session.statements[0]
+        assert "created_at" in sql.split("FROM")[0]
+        assert "ORDER BY created_at DESC, run_id DESC LIMIT :limit" in sql
+
+
+class TestCountModes:
+    @pytest.mark.asyncio
+    async def test_exact(self):
+        session = RecordingSession(scalar=42)
+
+        assert await ActivityReadDriver(session).count_runs("tenant_id = :tenant_id", {"tenant_id": "t"}) == 42
+        assert session.statements[0][0].startswith("SELECT COUNT(*)")
+
+    @pytest.mark.asyncio
+    async def test_cached_reuses_until_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(activity_read_driver, "time", SimpleNamespace(monotonic=lambda: now[0]))
+        session = RecordingSession(scalar=7)
+        driver = ActivityReadDriver(session)
+        where, params = "tenant_id = :tenant_id", {"tenant_id": "t"}
+
+        assert await driver.count_runs(where, params, "cached") == 7
+        assert await driver.count_runs(where, params, "cached") == 7
+        assert len(session.statements) == 1
+
+        # Different filter values are cached separately
+        await driver.count_runs(where, {"tenant_id": "u"}, "cached")
+        assert len(session.statements) == 2
+
+        now[0] += activity_read_driver.COUNT_CACHE_TTL_SECONDS + 1
+        await driver.count_runs(where, params, "cached")
+        assert len(session.statements) == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_bounded(self, monkeypatch):
+        monkeypatch.setattr(activity_read_driver, "COUNT_CACHE_MAX_ENTRIES", 3)
+        driver = ActivityReadDriver(RecordingSession(scalar=1))
+
+        for i in range(5):
+            await driver.count_runs("tenant_id = :tenant_id", {"tenant_id": f"t{i}"}, "cached")
+
+        assert len(activity_read_driver._COUNT_CACHE) == 3
+
+    @pytest.mark.asyncio
+    async def test_estimated_uses_planner_rows(self):
+        session = RecordingSession(scalar=[{"Plan": {"Plan Rows": 5_000_000}}])
+
+        total = await ActivityReadDriver(session).count_runs("tenant_id = :tenant_id", {"tenant_id": "t"}, "estimated")
+
+        assert total == 5_000_000
+        assert len(session.statements) == 1
+        assert session.statements[0][0].startswith("EXPLAIN (FORMAT JSON) SELECT 1 FROM v_runs_o2")
+
+    @pytest.mark.asyncio
+    async def test_estimated_small_result_counts_exactly(self):
+        session = RecordingSession(
+            scalar=lambda sql: '[{"Plan": {"Plan Rows": 120}}]' if sql.startswith("EXPLAIN") else 118
+        )
+
+        total = await ActivityReadDriver(session).count_runs("tenant_id = :tenant_id", {"tenant_id": "t"}, "estimated")
+
+        assert total == 118
+        assert [sql.split()[0] for sql, _ in session.statements] == ["EXPLAIN", "SELECT"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_mode_rejected(self):
+        with pytest.raises(ValueError):
+            await ActivityReadDriver(RecordingSession()).count_runs("true", {}, "approximate")
+
+
+class TestFacadeCursorPages:
+    @pytest.mark.asyncio
+    async def test_cursor_pages_chain(self):
+        all_rows = [_run_row(i) for i in range(5)]
+        driver = AsyncMock()
+        driver.count_runs.return_value = 5
+
+        async def fetch_runs(where_sql, params, sort_by, sort_dir, limit, offset, *, keyset, after):
+            assert keyset and offset == 0
+            start = 0 if after is None else next(i for i, r in enumerate(all_rows) if r["run_id"] == after[1]) + 1
+            return all_rows[start:start + limit]
+
+        driver.fetch_runs.side_effect = fetch_runs
+        facade = ActivityFacade()
+
+        with patch.object(facade, "_get_driver", return_value=driver):
+            first = await facade.get_runs(None, "tenant-1", limit=2, pagination="cursor", count_mode="cached")
+            second = await facade.get_runs(None, "tenant-1", limit=2, cursor=first.next_cursor)
+            third = await facade.get_runs(None, "tenant-1", limit=2, cursor=second.next_cursor)
+
+        assert [r.run_id for r in first.items] == ["run-0000", "run-0001"]
+        assert [r.run_id for r in second.items] == ["run-0002", "run-0003"]
+        assert [r.run_id for r in third.items] == ["run-0004"]
+        assert (first.has_more, second.has_more, third.has_more) == (True, True, False)
+        assert third.next_cursor is None
+        assert first.count_mode == "cached"
+        # One extra row is fetched to detect the next page
+        assert driver.fetch_runs.call_args_list[0].args[4] == 3
+        assert driver.count_runs.call_args_list[0].args[2] == "cached"
+
+    @pytest.mark.asyncio
+    async def test_offset_mode_has_no_cursor(self):
+        driver = AsyncMock()
+        driver.fetch_runs.return_value = [_run_row(i) for i in range(3)]
+        driver.count_runs.return_value = 10
+        facade = ActivityFacade()
+
+        with patch.object(facade, "_get_driver", return_value=driver):
+            result = await facade.get_runs(None, "tenant-1", limit=2, offset=4)
+
+        assert result.has_more is True
+        assert result.next_cursor is None
+        call = driver.fetch_runs.call_args
+        assert call.args[4:6] == (3, 4)
+        assert call.kwargs == {"keyset": False, "after": None}
+
+    @pytest.mark.asyncio
+    async def test_cursor_from_other_filters_rejected(self):
+        driver = AsyncMock()
+        driver.fetch_runs_with_policy_context.return_value = [_policy_row(i) for i in range(3)]
+        driver.count_runs.return_value = 3
+        facade = ActivityFacade()
+
+        with patch.object(facade, "_get_driver", return_value=driver):
+            live = await facade.get_live_runs(None, "tenant-1", limit=2, pagination="cursor")
+            with pytest.raises(InvalidCursorError):
+                await facade.get_completed_runs(None, "tenant-1", limit=2, cursor=live.next_cursor)
+
+
+class TestHandlerInvalidCursor:
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_maps_to_error_code(self):
+        from app.hoc.cus.hoc_spine.orchestrator.handlers.activity_handler import ActivityQueryHandler
+
+        facade = MagicMock()
+        facade.get_runs = AsyncMock(side_effect=InvalidCursorError("Malformed cursor"))
+        ctx = SimpleNamespace(session=None, tenant_id="tenant-1", params={"method": "get_runs", "cursor": "x"})
+
+        with patch(
+            "app.hoc.cus.activity.L5_engines.activity_facade.get_activity_facade", return_value=facade
+        ):
+            result = await ActivityQueryHandler().execute(ctx)
+
+        assert result.success is False
+        assert result.error_code == "INVALID_CURSOR"
@@ -0,0 +1,352 @@
+# Layer: Test
+# AUDIENCE: INTERNAL
+# Role: Per-tenant top-K attention queue (attention_ranking.py)
+
+"""
+Attention Queue Tests
+
+- TopKAttentionHeap keeps the highest keys and tracks what it turned away
+- TenantAttentionQueue ranks like brute-force scoring, under feedback
+- Suppressions, expiries and reopens send the queue back to the database
+- AttentionRankingService rebuilds cold queues and refreshes warm ones
+"""
+
+import math
+import random
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.hoc.cus.activity.L5_engines import attention_ranking
+from app.hoc.cus.activity.L5_engines.attention_ranking import (
+    ACK_DAMPENER,
+    AttentionCandidate,
+    AttentionQueueEngine,
+    AttentionRankingService,
+    TenantAttentionQueue,
+    TopKAttentionHeap,
+    rank_sql,
+    severity_weight,
+)
+
+NOW = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+RISK_LEVELS = ("VIOLATED", "AT_RISK", "NEAR_THRESHOLD", "NORMAL")
+
+
+def _candidate(run_id, *, age_hours=0.0, risk_level="AT_RISK", fingerprint="fp-a"):
+    return AttentionCandidate(
+        run_id=run_id,
+        signal_id=f"sig-{run_id[:8]}",
+        fingerprint=fingerprint,
+        signal_type="COST_RISK",
+        dimension="COST",
+        title="COST_RISK",
+        description=f"Run {run_id} has COST_RISK signal",
+        risk_level=risk_level,
+        created_at=NOW - timedelta(hours=age_hours),
+    )
+
+
+def _row(candidate):
+    return {"run_id": candidate.run_id, "candidate": candidate}
+
+
+def _brute_force(candidates, feedback, k):
+    """Score every signal at NOW and take the top k run_ids."""
+    scored = []
+    for c in candidates:
+        state = feedback.get(c.fingerprint)
+        if state == "SUPPRESSED":
+            continue
+        multiplier = ACK_DAMPENER if state == "ACKNOWLEDGED" else 1.0
+        age = (NOW - c.created_at).total_seconds() / 3600
+        scored.append((severity_weight(c.risk_level) * multiplier * 2 ** (-age / 24), c.run_id))
+    scored.sort(key=lambda entry: (-entry[0], entry[1]))
+    return [run_id for _, run_id in scored[:k]]
+
+
+class TestTopKHeap:
+    def test_keeps_highest_and_raises_floor(self):
+        heap = TopKAttentionHeap(capacity=3)
+        assert [heap.offer(sid, key) for sid, key in [("a", 1.0), ("b", 5.0), ("c", 3.0)]] == [None] * 3
+
+        assert heap.offer("d", 0.5) == "d"  # turned away
+        assert heap.floor == 0.5
+        assert heap.offer("e", 4.0) == "a"  # evicts the root
+        assert heap.floor == 1.0
+        assert [sid for _, sid in heap.ranked()] == ["b", "e", "c"]
+
+    def test_random_operations_match_sorted_reference(self):
+        rng = random.Random(7)
+        heap = TopKAttentionHeap(capacity=16)
+        reference: dict[str, float] = {}
+        for _ in range(3000):
+            sid = f"s{rng.randrange(60)}"
+            op = rng.random()
+            if op < 0.6:
+                key = rng.uniform(0, 100)
+                left = heap.offer(sid, key)
+                reference[sid] = key
+                if left is not None:
+                    reference.pop(left)
+            elif op < 0.8:
+                assert heap.remove(sid) == (sid in reference)
+                reference.pop(sid, None)
+            elif sid in reference:
+                reference[sid] = rng.uniform(0, 100)
+                heap.rekey(sid, reference[sid])
+            assert len(heap) == len(reference) <= 16
+        assert heap.ranked() == sorted(((k, s) for s, k in reference.items()), key=lambda e: (-e[0], e[1]))
+
+    def test_exact_while_kth_key_is_above_floor(self):
+        heap = TopKAttentionHeap(capacity=4)
+        for i in range(6):
+            heap.offer(f"s{i}", float(i))
+        assert heap.floor == 1.0
+        assert heap.is_exact(4)
+
+        heap.remove("s5")
+        heap.remove("s4")
+        assert not heap.is_exact(3)  # s1 (evicted) may outrank the third kept signal
+
+
+class TestTenantQueue:
+    def test_ranking_matches_brute_force_under_feedback(self):
+        rng = random.Random(11)
+        candidates = [
+            _candidate(
+                f"run-{i:05d}",
+                age_hours=rng.uniform(0, 100),
+                risk_level=rng.choice(RISK_LEVELS),
+                fingerprint=f"fp-{rng.randrange(8)}",
+            )
+            for i in range(2000)
+        ]
+        queue = TenantAttentionQueue(top_k=20)
+        queue.apply_feedback("fp-1", "ACKNOWLEDGED")
+        for c in candidates:
+            queue.observe(c, NOW)
+        queue.apply_feedback("fp-2", "ACKNOWLEDGED")
+
+        items, total = queue.snapshot(NOW, limit=20)
+
+        assert queue.is_exact()
+        assert total == 20
+        feedback = {"fp-1": "ACKNOWLEDGED", "fp-2": "ACKNOWLEDGED"}
+        assert [item.source_run_id for item in items] == _brute_force(candidates, feedback, 20)
+
+    def test_score_is_severity_times_decay(self):
+        queue = TenantAttentionQueue(top_k=5, half_life_hours=24)
+        queue.observe(_candidate("run-new", risk_level="VIOLATED"), NOW)
+        queue.observe(_candidate("run-old", age_hours=48, risk_level="VIOLATED"), NOW)
+
+        items, _ = queue.snapshot(NOW, limit=5)
+
+        assert [item.attention_score for item in items] == [1.0, 0.25]
+
+    def test_order_does_not_change_as_time_passes(self):
+        queue = TenantAttentionQueue(top_k=5)
+        queue.observe(_candidate("run-a", age_hours=10, risk_level="VIOLATED"), NOW)
+        queue.observe(_candidate("run-b", age_hours=0, risk_level="NEAR_THRESHOLD"), NOW)
+
+        now_items, _ = queue.snapshot(NOW, limit=5)
+        later_items, _ = queue.snapshot(NOW + timedelta(hours=30), limit=5)
+
+        assert [i.source_run_id for i in now_items] == [i.source_run_id for i in later_items]
+        ratio = later_items[0].attention_score / now_items[0].attention_score
+        assert ratio == pytest.approx(2 ** (-30 / 24), rel=1e-4)
+
+    def test_acknowledgement_dampens_once(self):
+        queue = TenantAttentionQueue(top_k=5)
+        queue.observe(_candidate("run-a", risk_level="VIOLATED"), NOW)
+
+        queue.apply_feedback("fp-a", "ACKNOWLEDGED")
+        queue.apply_feedback("fp-a", "ACKNOWLEDGED")
+        items, _ = queue.snapshot(NOW, limit=5)
+
+        assert items[0].attention_score == pytest.approx(ACK_DAMPENER)
+        assert items[0].acknowledged
+        assert items[0].attention_reason == "VIOLATED, acknowledged"
+
+    def test_acknowledged_fingerprint_dampens_later_signals(self):
+        queue = TenantAttentionQueue(top_k=5)
+        queue.apply_feedback("fp-a", "ACKNOWLEDGED")
+
+        queue.observe(_candidate("run-a", risk_level="VIOLATED"), NOW)
+
+        assert queue.snapshot(NOW, limit=5)[0][0].attention_score == pytest.approx(ACK_DAMPENER)
+
+    def test_suppression_removes_fingerprint_until_expiry(self):
+        queue = TenantAttentionQueue(top_k=5)
+        queue.rebuilt_at = NOW
+        queue.observe(_candidate("run-a", fingerprint="fp-a"), NOW)
+        queue.observe(_candidate("run-b", fingerprint="fp-b"), NOW)
+
+        queue.apply_feedback("fp-a", "SUPPRESSED", NOW + timedelta(hours=1))
+        queue.observe(_candidate("run-c", fingerprint="fp-a"), NOW)
+        items, total = queue.snapshot(NOW, limit=5)
+
+        assert [item.source_run_id for item in items] == ["run-b"]
+        assert total == 1
+        assert not queue.needs_rebuild(NOW)
+        assert queue.needs_rebuild(NOW + timedelta(hours=1))
+
+    def test_suppression_below_k_requires_rebuild(self):
+        queue = TenantAttentionQueue(top_k=2)
+        queue.rebuilt_at = NOW
+        for i in range(6):
+            queue.observe(_candidate(f"run-{i}", age_hours=i, fingerprint=f"fp-{i % 3}"), NOW)
+        assert not queue.needs_rebuild(NOW)
+
+        queue.apply_feedback("fp-0", "SUPPRESSED", NOW + timedelta(hours=1))
+        queue.apply_feedback("fp-1", "SUPPRESSED", NOW + timedelta(hours=1))
+
+        assert queue.needs_rebuild(NOW)
+
+    def test_reopen_rebuilds_only_if_a_turned_away_signal_could_rank(self):
+        queue = TenantAttentionQueue(top_k=2)
+        queue.rebuilt_at = NOW
+        queue.apply_feedback("fp-a", "ACKNOWLEDGED")
+        queue.apply_feedback("fp-c", "ACKNOWLEDGED")
+        for i in range(4):
+            queue.observe(_candidate(f"run-b{i}", age_hours=1 + i, fingerprint="fp-b"), NOW)
+        # Dampened below the four fp-b signals: turned away
+        queue.observe(_candidate("run-a", age_hours=0, fingerprint="fp-a"), NOW)
+        queue.observe(_candidate("run-c", age_hours=40, fingerprint="fp-c"), NOW)
+
+        queue.apply_feedback("fp-c", "REOPENED")
+        assert not queue.needs_rebuild(NOW)  # run-c ranks below the top 2 even undampened
+
+        queue.apply_feedback("fp-a", "REOPENED")
+        assert queue.needs_rebuild(NOW)  # run-a would now rank first
+
+    def test_horizon_and_min_score_filter(self):
+        queue = TenantAttentionQueue(top_k=5, horizon_hours=24)
+        queue.observe(_candidate("run-a", risk_level="VIOLATED"), NOW)
+        queue.observe(_candidate("run-b", risk_level="NEAR_THRESHOLD"), NOW)
+        queue.observe(_candidate("run-c", age_hours=30, risk_level="VIOLATED"), NOW)
+
+        items, total = queue.snapshot(NOW, limit=5, min_score=0.5)
+
+        assert [item.source_run_id for item in items] == ["run-a"]
+        assert total == 1
+
+
+class TestRankSql:
+    def test_sql_key_matches_python_key(self):
+        sql, params = rank_sql(half_life_hours=24)
+        queue = TenantAttentionQueue(half_life_hours=24)
+        candidate = _candidate("run-a", risk_level="NEAR_THRESHOLD")
+
+        assert "WHEN 'NEAR_THRESHOLD' THEN 0.4" in sql
+        expected = math.log(0.4) + candidate.created_at.timestamp() * params["decay_rate"]
+        assert queue.base_key(candidate) == pytest.approx(expected)
+
+
+class TestRankingService:
+    def _service(self, engine, rows, feedback=()):
+        read_driver = MagicMock()
+        read_driver.fetch_attention_candidates = AsyncMock(return_value=[_row(c) for c in rows])
+        feedback_driver = MagicMock()
+        feedback_driver.list_latest_feedback = AsyncMock(return_value=list(feedback))
+        service = AttentionRankingService(
+            MagicMock(), to_candidate=lambda row: row["candidate"], engine=engine
+        )
+        return service, read_driver, feedback_driver
+
+    @pytest.mark.asyncio
+    async def test_cold_tenant_is_rebuilt_from_database(self):
+        engine = AttentionQueueEngine()
+        rows = [_candidate(f"run-{i}", age_hours=i, fingerprint=f"fp-{i % 2}") for i in range(5)]
+        feedback = [{"signal_fingerprint": "fp-0", "feedback_state": "SUPPRESSED",
+                     "expires_at": NOW + timedelta(hours=1)}]
+        service, read_driver, feedback_driver = self._service(engine, rows, feedback)
+
+        with patch.object(attention_ranking, "get_activity_read_driver", return_value=read_driver), \
+                patch.object(attention_ranking, "_feedback_driver", feedback_driver), \
+                patch.object(attention_ranking, "utc_now", return_value=NOW):
+            result = await service.get_attention_queue("t1", limit=10)
+
+        assert [item.source_run_id for item in result.items] == ["run-1", "run-3"]
+        where_sql, params, sql, _ = read_driver.fetch_attention_candidates.call_args.args
+        assert "tenant_id = :tenant_id AND created_at >= :since" in where_sql
+        assert params["tenant_id"] == "t1"
+        assert sql.startswith("LN(")
+        assert engine.get("t1") is not None
+
+    @pytest.mark.asyncio
+    async def test_warm_tenant_is_refreshed_not_rebuilt(self):
+        engine = AttentionQueueEngine()
+        queue = TenantAttentionQueue()
+        queue.observe(_candidate("run-old", age_hours=2), NOW)
+        queue.rebuilt_at = NOW - timedelta(minutes=5)
+        queue.refreshed_at = NOW - timedelta(minutes=1)
+        engine.put("t1", queue)
+        service, read_driver, feedback_driver = self._service(engine, [_candidate("run-new", risk_level="VIOLATED")])
+
+        with patch.object(attention_ranking, "get_activity_read_driver", return_value=read_driver), \
+                patch.object(attention_ranking, "_feedback_driver", feedback_driver), \
+                patch.object(attention_ranking, "utc_now", return_value=NOW):
+            result = await service.get_attention_queue("t1", limit=10)
+
+        assert [item.source_run_id for item in result.items] == ["run-new", "run-old"]
+        assert feedback_driver.list_latest_feedback.call_args.kwargs["since"] is not None
+        assert engine.get("t1") is queue
+        assert queue.refreshed_at == NOW
+
+    @pytest.mark.asyncio
+    async def test_without_session_serves_loaded_queue_only(self):
+        engine = AttentionQueueEngine()
+        service = AttentionRankingService(engine=engine)
+
+        result = await service.get_attention_queue("t1")
+
+        assert result.items == []
+        assert result.total == 0
+
+    def test_engine_ignores_tenants_it_has_not_loaded(self):
+        engine = AttentionQueueEngine(max_tenants=1)
+        engine.observe("t1", _candidate("run-a"))
+        engine.apply_feedback("t1", "fp-a", "ACKNOWLEDGED")
+        assert engine.get("t1") is None
+
+        engine.put("t1", TenantAttentionQueue())
+        engine.put("t2", TenantAttentionQueue())
+        assert engine.get("t1") is None  # least recently used tenant evicted
+
+    @pytest.mark.asyncio
+    async def test_refresh_binds_since_in_real_feedback_sql(self):
+        from sqlalchemy.dialects import postgresql
+
+        from app.hoc.cus.activity.L6_drivers.signal_feedback_driver import SignalFeedbackDriver
+
+        compiled = []
+
+        async def execute(statement, params):
+            sql = statement.bindparams(**params).compile(dialect=postgresql.dialect())
+            compiled.append(sql)
+            result = MagicMock()
+            result.mappings.return_value.all.return_value = []
+            return result
+
+        session = MagicMock()
+        session.execute = execute
+        engine = AttentionQueueEngine()
+        queue = TenantAttentionQueue()
+        queue.rebuilt_at = NOW - timedelta(minutes=5)
+        queue.refreshed_at = NOW - timedelta(minutes=1)
+        engine.put("t1", queue)
+        read_driver = MagicMock()
+        read_driver.fetch_attention_candidates = AsyncMock(return_value=[])
+        service = AttentionRankingService(session, to_candidate=lambda row: row["candidate"], engine=engine)
+
+        with patch.object(attention_ranking, "get_activity_read_driver", return_value=read_driver), \
+                patch.object(attention_ranking, "_feedback_driver", SignalFeedbackDriver()), \
+                patch.object(attention_ranking, "utc_now", return_value=NOW):
+            await service.get_attention_queue("t1")
+
+        (sql,) = compiled
+        assert "created_at >= %(since)s" in str(sql)
+        assert ":since" not in str(sql)
+        assert isinstance(sql.params["since"], datetime)
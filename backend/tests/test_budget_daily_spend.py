@@ -0,0 +1,140 @@
+"""
+Tests for counter-based daily spend tracking in BudgetTracker.
+
+The SQL itself is Postgres-specific (see scripts/benchmark_budget_checks.py
+for a run against a real database); these tests swap in a recording
+session to check what the tracker sends and how it reads the results.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from app.utils import budget_tracker
+from app.utils.budget_tracker import PER_DAY_MAX_CENTS, BudgetTracker
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def first(self):
+        return self.row
+
+
+class FakeSession:
+    """Records statements; answers each with the next queued row."""
+
+    statements = []
+    rows = []
+    commits = 0
+
+    def __init__(self, engine):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, statement, params=None):
+        FakeSession.statements.append((str(statement), params or {}))
+        return FakeResult(FakeSession.rows.pop(0) if FakeSession.rows else None)
+
+    def commit(self):
+        FakeSession.commits += 1
+
+
+@pytest.fixture(autouse=True)
+def fake_session(monkeypatch):
+    FakeSession.statements, FakeSession.rows, FakeSession.commits = [], [], 0
+    monkeypatch.setattr(budget_tracker, "Session", FakeSession)
+    monkeypatch.setattr(budget_tracker, "emit_budget_decision", lambda **kwargs: None)
+    monkeypatch.setattr(budget_tracker, "AUTO_PAUSE_ON_BREACH", False)
+    return FakeSession
+
+
+def test_status_is_one_query_reading_the_counter(fake_session):
+    fake_session.rows = [(1000, 400, False, 250)]
+
+    status = BudgetTracker().get_status("agent_1")
+
+    assert len(fake_session.statements) == 1
+    sql, params = fake_session.statements[0]
+    assert "agent_daily_spend" in sql and "SUM" not in sql
+    assert params["today"] == datetime.now(timezone.utc).date()
+    assert (status.remaining_cents, status.today_spent_cents, status.is_paused) == (600, 250, False)
+
+
+def test_status_for_unknown_agent(fake_session):
+    assert BudgetTracker().get_status("missing") is None
+
+
+def test_enforce_budget_uses_the_daily_counter(fake_session):
+    fake_session.rows = [(0, 0, False, PER_DAY_MAX_CENTS - 10)]
+
+    result = BudgetTracker().enforce_budget("agent_1", 20)
+
+    assert not result.allowed
+    assert result.breach_type == "per_day"
+    assert result.current_cents == PER_DAY_MAX_CENTS - 10
+
+
+def test_deduct_records_cost_and_counter_in_one_statement(fake_session):
+    fake_session.rows = [("agent_1", 1000, 420, 300)]
+
+    assert BudgetTracker().deduct("agent_1", 20, tenant_id="t_1", run_id="run_1")
+
+    assert len(fake_session.statements) == 1 and fake_session.commits == 1
+    sql, params = fake_session.statements[0]
+    assert "INSERT INTO llm_costs" in sql and "INSERT INTO agent_daily_spend" in sql and "UPDATE agents" in sql
+    assert "agents.tenant_id = :tenant_id" in sql
+    assert params["cost"] == 20 and params["run_id"] == "run_1"
+    assert params["today"] == params["created_at"].date()
+    # The daily limit is a pre-flight gate; an incurred cost is never rejected for it
+    assert "day_max" not in params and ":day_max" not in sql
+
+
+def test_deduct_binds_every_parameter(fake_session):
+    from sqlalchemy.dialects import postgresql
+    from sqlmodel import text
+
+    BudgetTracker().deduct("agent_1", 20, tenant_id="t_1")
+
+    sql, params = fake_session.statements[0]
+    compiled = text(sql).compile(dialect=postgresql.dialect())
+    assert set(compiled.params) == set(params)
+
+
+def test_deduct_over_budget_still_counts_the_day(fake_session):
+    # Cost row and counter written, lifetime deduction refused
+    fake_session.rows = [(None, None, None, 320)]
+
+    assert not BudgetTracker().deduct("agent_1", 20)
+    assert ":tenant_id" not in fake_session.statements[0][0]
+
+
+def test_deduct_unknown_agent(fake_session):
+    assert not BudgetTracker().deduct("missing", 20)
+
+
+def test_record_cost_bumps_the_counter_in_the_same_statement(fake_session):
+    BudgetTracker().record_cost("run_1", "agent_1", "anthropic", "claude", 10, 20, 7, tenant_id="t_1")
+
+    ((sql, params),) = fake_session.statements
+    assert "INSERT INTO llm_costs" in sql and "INSERT INTO agent_daily_spend" in sql
+    assert params["spend_date"] == params["created_at"].date()
+    assert params["tenant_id"] == "t_1" and fake_session.commits == 1
+
+
+def test_reconcile_reports_corrections(fake_session):
+    before = budget_tracker.BUDGET_SPEND_DRIFT._value.get()
+    fake_session.rows = [None, (3,), None, (0,)]  # LOCK, today; LOCK, yesterday
+
+    assert BudgetTracker().reconcile_daily_spend(days=2) == 3
+
+    locks = [sql for sql, _ in fake_session.statements if sql.startswith("LOCK TABLE")]
+    dates = [params["spend_date"] for sql, params in fake_session.statements if "WITH actual" in sql]
+    assert len(locks) == 2 and (dates[0] - dates[1]).days == 1
+    assert budget_tracker.BUDGET_SPEND_DRIFT._value.get() - before == 3
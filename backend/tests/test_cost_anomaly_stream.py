@@ -0,0 +1,603 @@
+"""
+M29 Streaming Cost Anomaly Detector Tests
+=========================================
+
+Replays a synthetic 60-day cost stream through StreamingCostAnomalyDetector
+and checks that every day's anomalies match the batch CostAnomalyDetector.
+
+The batch detector's SQL is Postgres-only, so _BatchOracle evaluates those
+same queries (windows, DISTINCT-day averages, the consecutive-breach CTE
+and drift tracking updates) over the raw record list, recomputing from full
+history on every tick. scripts/replay_cost_anomalies.py runs the real batch
+detector against Postgres.
+
+The detector lives in the HOC analytics engine; its reads go through
+CostRecordStreamDriver, and AnomalyIncidentCoordinator drives it.
+"""
+
+import math
+import random
+import re
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine import (
+    ABSOLUTE_SPIKE_THRESHOLD,
+    CONSECUTIVE_INTERVALS_REQUIRED,
+    DRIFT_DAYS_REQUIRED,
+    SUSTAINED_DRIFT_THRESHOLD,
+    AnomalyType,
+    DayTotals,
+    DerivedCause,
+    DetectedAnomaly,
+    EntityWindow,
+    StreamingCostAnomalyDetector,
+    check_budget_threshold,
+    classify_severity,
+    format_spike_message,
+    replay_cost_stream,
+)
+from app.hoc.cus.analytics.L6_drivers.cost_record_stream_driver import CostRecordStreamDriver
+
+TENANT = "t_replay"
+START = date(2026, 3, 1)
+DAYS = 60
+
+
+# =============================================================================
+# Batch oracle
+# =============================================================================
+
+
+class _BatchOracle:
+    """CostAnomalyDetector's queries evaluated over an in-memory cost_records list."""
+
+    def __init__(self, records, budgets):
+        self.records = []
+        self.budgets = budgets
+        self.breach_dates = defaultdict(set)
+        self.drift = {}  # key -> [drift_days_count, last_check_date]
+
+    def add(self, records):
+        self.records.extend(records)
+
+    def _select(self, entity_column=None, entity_id=None, since=None, first_day=None, last_day=None, before=None):
+        for r in self.records:
+            if r.tenant_id != TENANT:
+                continue
+            if entity_column and getattr(r, entity_column) != entity_id:
+                continue
+            day = r.created_at.date()
+            if since is not None and r.created_at < since:
+                continue
+            if before is not None and r.created_at >= before:
+                continue
+            if first_day is not None and day < first_day:
+                continue
+            if last_day is not None and day > last_day:
+                continue
+            yield r
+
+    @staticmethod
+    def _daily_avg(rows):
+        rows = list(rows)
+        days = {r.created_at.date() for r in rows}
+        return sum(r.cost_cents for r in rows) / len(days) if days else None
+
+    def _consecutive(self, key, today):
+        # The cost_breach_history CTE: rows in [today - 7d, today], newest first, grp = date + (rn - 1)
+        dates = sorted((d for d in self.breach_dates[key] if today - timedelta(days=7) <= d <= today), reverse=True)
+        groups = [d + timedelta(days=rn) for rn, d in enumerate(dates)]
+        today_group = groups[dates.index(today)]
+        return sum(1 for g in groups if g == today_group)
+
+    def _derive_cause(self, entity_type, entity_id, today):
+        column = {"user": "user_id", "feature": "feature_tag"}.get(entity_type)
+        today_start = datetime.combine(today, datetime.min.time())
+        yesterday_start = today_start - timedelta(days=1)
+        current = list(self._select(column, entity_id, since=today_start))
+        previous = list(self._select(column, entity_id, since=yesterday_start, before=today_start))
+
+        def retry_ratio(rows):
+            return sum(1 for r in rows if r.is_retry) / len(rows) if rows else None
+
+        def avg_input(rows):
+            return sum(r.input_tokens for r in rows) / len(rows) if rows else None
+
+        a, b = retry_ratio(current), retry_ratio(previous)
+        if a and b and b > 0 and a / b > 1.5:
+            return DerivedCause.RETRY_LOOP
+        a, b = avg_input(current), avg_input(previous)
+        if a and b and b > 0 and a / b > 1.3:
+            return DerivedCause.PROMPT_GROWTH
+        if entity_type == "tenant":
+            by_feature = defaultdict(float)
+            for r in current:
+                if r.feature_tag is not None:
+                    by_feature[r.feature_tag] += r.cost_cents
+            total, top = sum(by_feature.values()), max(by_feature.values(), default=0)
+            if total and top and top / total > 0.6:
+                return DerivedCause.FEATURE_SURGE
+        a, b = len(current), len(previous)
+        if a and b and b > 0 and a / b > 1.3:
+            return DerivedCause.TRAFFIC_GROWTH
+        return DerivedCause.UNKNOWN
+
+    def _spike(self, entity_type, entity_id, today_cost, baseline, today):
+        ratio = today_cost / baseline
+        deviation = (ratio - 1) * 100
+        if ratio < ABSOLUTE_SPIKE_THRESHOLD:
+            return None
+        key = (entity_type, entity_id)
+        self.breach_dates[key].add(today)
+        count = self._consecutive(key, today)
+        if count < CONSECUTIVE_INTERVALS_REQUIRED:
+            return None
+        return DetectedAnomaly(
+            anomaly_type=AnomalyType.ABSOLUTE_SPIKE,
+            severity=classify_severity(deviation),
+            entity_type=entity_type,
+            entity_id=entity_id,
+            current_value_cents=today_cost,
+            expected_value_cents=baseline,
+            deviation_pct=deviation,
+            message=format_spike_message(entity_type, entity_id, deviation, count),
+            breach_count=count,
+            derived_cause=self._derive_cause(entity_type, entity_id, today),
+            metadata={"lookback_days": 14, "baseline_daily_avg": baseline, "consecutive_breaches": count},
+        )
+
+    def detect_all(self, today):
+        anomalies = []
+        today_start = datetime.combine(today, datetime.min.time())
+        baseline_start, baseline_end = today - timedelta(days=14), today - timedelta(days=2)
+
+        for entity_type, column in (("user", "user_id"), ("feature", "feature_tag")):
+            ids = {getattr(r, column) for r in self._select(since=today_start)} - {None}
+            for entity_id in ids:
+                baseline = self._daily_avg(
+                    self._select(column, entity_id, first_day=baseline_start, last_day=baseline_end)
+                )
+                if not baseline or baseline <= 0:
+                    continue
+                today_cost = sum(r.cost_cents for r in self._select(column, entity_id, since=today_start))
+                anomaly = self._spike(entity_type, entity_id, today_cost, baseline, today)
+                if anomaly:
+                    anomalies.append(anomaly)
+
+        baseline = self._daily_avg(self._select(first_day=baseline_start, last_day=baseline_end)) or 0
+        if baseline > 0:
+            today_cost = sum(r.cost_cents for r in self._select(since=today_start))
+            anomaly = self._spike("tenant", TENANT, today_cost, baseline, today)
+            if anomaly:
+                anomalies.append(anomaly)
+
+        rolling = sum(r.cost_cents for r in self._select(first_day=today - timedelta(days=6), last_day=today)) / 7.0
+        baseline = (
+            self._daily_avg(self._select(first_day=today - timedelta(days=28), last_day=today - timedelta(days=8))) or 0
+        )
+        if baseline > 0:
+            ratio = rolling / baseline
+            drift = (ratio - 1) * 100
+            key = ("tenant", TENANT)
+            if ratio >= SUSTAINED_DRIFT_THRESHOLD:
+                existing = self.drift.get(key)
+                days = existing[0] + 1 if existing and existing[1] == today - timedelta(days=1) else 1
+                self.drift[key] = [days, today]
+                if days >= DRIFT_DAYS_REQUIRED:
+                    anomalies.append(
+                        DetectedAnomaly(
+                            anomaly_type=AnomalyType.SUSTAINED_DRIFT,
+                            severity=classify_severity(drift),
+                            entity_type="tenant",
+                            entity_id=TENANT,
+                            current_value_cents=rolling,
+                            expected_value_cents=baseline,
+                            deviation_pct=drift,
+                            message=f"Sustained drift detected: {drift:.1f}% above baseline for {days} days",
+                            breach_count=days,
+                            derived_cause=self._derive_cause("tenant", TENANT, today),
+                            metadata={"rolling_7d_avg": rolling, "baseline_avg": baseline, "drift_days": days},
+                        )
+                    )
+            else:
+                self.drift.pop(key, None)
+
+        month_start = datetime.combine(today.replace(day=1), datetime.min.time())
+        for budget in self.budgets:
+            column = {"user": "user_id", "feature": "feature_tag"}.get(budget.budget_type) if budget.entity_id else None
+            for period, limit, since in (
+                ("daily", budget.daily_limit_cents, today_start),
+                ("monthly", budget.monthly_limit_cents, month_start),
+            ):
+                if not limit:
+                    continue
+                spend = sum(r.cost_cents for r in self._select(column, budget.entity_id, since=since))
+                anomaly = check_budget_threshold(
+                    budget.budget_type, budget.entity_id, period, spend, limit, budget.warn_threshold_pct
+                )
+                if anomaly:
+                    anomalies.append(anomaly)
+
+        return anomalies
+
+
+# =============================================================================
+# Synthetic stream
+# =============================================================================
+
+
+def _stream(seed=11):
+    """60 days of traffic with user spikes, a retry burst, prompt growth and a late tenant drift."""
+    rng = random.Random(seed)
+    users = [f"u{i}" for i in range(6)]
+    features = ["chat", "search", "summarize", None]
+    records = []
+    for offset in range(DAYS):
+        day = START + timedelta(days=offset)
+        drift = 1.0 + max(0, offset - 40) * 0.05  # tenant-wide ramp after day 40
+        for user in users:
+            # u1 spikes for 3 days, u2 for 2 days, u3 for 1 day (no anomaly)
+            spike = (
+                (user == "u1" and offset in (20, 21, 22))
+                or (user == "u2" and offset in (30, 31))
+                or (user == "u3" and offset == 35)
+            )
+            calls = rng.randint(3, 6) * (3 if spike else 1)
+            if user == "u4" and offset % 9 == 0:
+                continue  # gaps change the DISTINCT-day baseline
+            for _ in range(calls):
+                retry = user == "u5" and offset in (25, 26) and rng.random() < 0.7
+                tokens = rng.randint(200, 400) * (2 if user == "u0" and offset in (45, 46) else 1)
+                records.append(
+                    SimpleNamespace(
+                        tenant_id=TENANT,
+                        user_id=user if rng.random() > 0.05 else None,
+                        feature_tag=rng.choice(features),
+                        input_tokens=tokens,
+                        cost_cents=round(rng.uniform(5, 15) * drift * (1.5 if spike else 1), 4),
+                        is_retry=retry or (rng.random() < 0.05),
+                        created_at=datetime.combine(day, datetime.min.time())
+                        + timedelta(seconds=rng.randint(0, 86399)),
+                    )
+                )
+    # Another tenant's traffic must not leak into TENANT's state
+    records.append(
+        SimpleNamespace(
+            tenant_id="t_other",
+            user_id="u1",
+            feature_tag="chat",
+            input_tokens=10,
+            cost_cents=1e6,
+            is_retry=False,
+            created_at=datetime.combine(START + timedelta(days=21), datetime.min.time()),
+        )
+    )
+    return records
+
+
+BUDGETS = [
+    SimpleNamespace(
+        tenant_id=TENANT,
+        budget_type="tenant",
+        entity_id=None,
+        daily_limit_cents=400,
+        monthly_limit_cents=6000,
+        warn_threshold_pct=80,
+        is_active=True,
+    ),
+    SimpleNamespace(
+        tenant_id=TENANT,
+        budget_type="feature",
+        entity_id="chat",
+        daily_limit_cents=80,
+        monthly_limit_cents=None,
+        warn_threshold_pct=75,
+        is_active=True,
+    ),
+]
+
+
+def _key(anomaly):
+    metadata = {k: v for k, v in anomaly.metadata.items() if k != "ewma_zscore"}
+    return (
+        anomaly.anomaly_type,
+        anomaly.entity_type,
+        anomaly.entity_id or "",
+        anomaly.severity,
+        anomaly.breach_count,
+        anomaly.derived_cause,
+        anomaly.message,
+        round(anomaly.current_value_cents, 6),
+        round(anomaly.expected_value_cents, 6),
+        round(anomaly.deviation_pct, 6),
+        tuple(sorted((k, round(v, 6) if isinstance(v, float) else v) for k, v in metadata.items())),
+    )
+
+
+# =============================================================================
+# Tests
+# =============================================================================
+
+
+class TestReplayMatchesBatch:
+    @pytest.mark.asyncio
+    async def test_daily_anomalies_match_batch_detector(self):
+        records = _stream()
+        end = START + timedelta(days=DAYS - 1)
+
+        streamed = await replay_cost_stream(records, TENANT, START, end, budgets=BUDGETS)
+
+        oracle = _BatchOracle([], BUDGETS)
+        by_day = defaultdict(list)
+        for r in records:
+            by_day[r.created_at.date()].append(r)
+        seen_types = set()
+        for offset in range(DAYS):
+            day = START + timedelta(days=offset)
+            oracle.add(by_day[day])
+            expected = oracle.detect_all(day)
+            assert sorted(map(_key, streamed[day])) == sorted(map(_key, expected)), day
+            seen_types.update((a.anomaly_type, a.entity_type) for a in expected)
+
+        # The stream exercises every rule, so equality above is not vacuous
+        assert (AnomalyType.ABSOLUTE_SPIKE, "user") in seen_types
+        assert (AnomalyType.SUSTAINED_DRIFT, "tenant") in seen_types
+        assert (AnomalyType.BUDGET_WARNING, "feature") in seen_types
+        assert (AnomalyType.BUDGET_EXCEEDED, "tenant") in seen_types
+        causes = {a.derived_cause for day in streamed.values() for a in day}
+        assert len(causes) > 1
+
+    @pytest.mark.asyncio
+    async def test_spike_run_of_one_day_does_not_fire(self):
+        streamed = await replay_cost_stream(_stream(), TENANT, START, START + timedelta(days=DAYS - 1))
+
+        u3 = [a for day in streamed.values() for a in day if a.entity_id == "u3"]
+        u1 = {day: a.breach_count for day, found in streamed.items() for a in found if a.entity_id == "u1"}
+        assert u3 == []
+        assert [u1.get(START + timedelta(days=offset)) for offset in (20, 21, 22)] == [None, 2, 3]
+
+
+class TestStreamingState:
+    def test_ewma_folds_each_closed_day_once(self):
+        window = EntityWindow()
+        for offset, cost in enumerate([10.0, 12.0, 8.0, 30.0]):
+            window.add(START + timedelta(days=offset), DayTotals(cost_cents=cost, requests=1))
+
+        window.fold(START + timedelta(days=3))
+        window.fold(START + timedelta(days=3))  # same tick again: no double count
+
+        assert window.ewma_days == 3
+        assert window.folded_through == START + timedelta(days=2)
+        z = window.zscore(30.0)
+        assert z is not None and z > 2
+        assert math.isfinite(z)
+
+    @pytest.mark.asyncio
+    async def test_drift_recheck_same_day_keeps_count(self):
+        detector = StreamingCostAnomalyDetector()
+        detector.observe_many(r for r in _stream() if r.created_at.date() <= START + timedelta(days=DAYS - 1))
+        last = START + timedelta(days=DAYS - 1)
+        for offset in range(10, 0, -1):
+            await detector.detect_sustained_drift(TENANT, today=last - timedelta(days=offset))
+
+        first = await detector.detect_sustained_drift(TENANT, today=last)
+        again = await detector.detect_sustained_drift(TENANT, today=last)
+
+        assert first and again
+        assert first[0].breach_count == again[0].breach_count >= DRIFT_DAYS_REQUIRED
+
+    @pytest.mark.asyncio
+    async def test_poll_reads_each_record_once(self):
+        now = datetime.now(timezone.utc) - timedelta(minutes=5)
+        rows = [
+            SimpleNamespace(
+                id=f"cr_{i:03d}",
+                tenant_id=TENANT,
+                user_id="u1",
+                feature_tag=None,
+                input_tokens=10,
+                cost_cents=1.0,
+                created_at=now + timedelta(seconds=i // 2),
+            )
+            for i in range(25)
+        ]
+        params_seen = []
+
+        class _Session:
+            async def execute(self, statement, params):
+                params_seen.append(dict(params))
+                after = (params["after_ts"], params["after_id"])
+                page = [r for r in rows if (r.created_at, r.id) > after][: params["limit"]]
+                return SimpleNamespace(fetchall=lambda: page)
+
+        detector = StreamingCostAnomalyDetector()
+        assert await detector.poll(CostRecordStreamDriver(_Session()), limit=10) == 25
+        assert await detector.poll(CostRecordStreamDriver(_Session()), limit=10) == 0
+
+        window = detector._tenants[TENANT].entities[("user", "u1")]
+        assert sum(b.requests for b in window.days.values()) == 25
+        assert len(params_seen) == 4
+
+    @staticmethod
+    def _selected(statement):
+        """Output names of a SELECT list (alias, else bare column), as the database returns them."""
+        select_list = re.search(r"SELECT(.*?)\bFROM\b", str(statement), re.S).group(1)
+        names = set()
+        for item in re.split(r",(?![^(]*\))", select_list):
+            alias = re.search(r"\bAS\s+(\w+)\s*$", item.strip())
+            names.add(alias.group(1) if alias else item.strip().split(".")[-1])
+        return names
+
+    def _retry_rows(self):
+        """u1: 1 retry in 10 requests two days ago, 6 in 10 yesterday."""
+        yesterday = datetime.now(timezone.utc).date() - timedelta(days=1)
+        rows = []
+        for offset, retries in ((1, 1), (0, 6)):
+            day = yesterday - timedelta(days=offset)
+            for i in range(10):
+                rows.append(
+                    {
+                        "id": f"cr_{offset}_{i:02d}",
+                        "tenant_id": TENANT,
+                        "user_id": "u1",
+                        "feature_tag": None,
+                        "input_tokens": 100,
+                        "cost_cents": 1.0,
+                        "is_retry": i < retries,
+                        "created_at": datetime.combine(day, datetime.min.time(), timezone.utc)
+                        + timedelta(hours=12, seconds=i),
+                    }
+                )
+        return yesterday, rows
+
+    @pytest.mark.asyncio
+    async def test_poll_reads_retries_and_derives_retry_loop(self):
+        yesterday, rows = self._retry_rows()
+        selected = self._selected
+
+        class _Session:
+            async def execute(self, statement, params):
+                columns = selected(statement)
+                after = (params["after_ts"], params["after_id"])
+                page = [r for r in rows if (r["created_at"], r["id"]) > after][: params["limit"]]
+                return SimpleNamespace(
+                    fetchall=lambda: [SimpleNamespace(**{k: v for k, v in r.items() if k in columns}) for r in page]
+                )
+
+        detector = StreamingCostAnomalyDetector()
+        assert await detector.poll(CostRecordStreamDriver(_Session())) == 20
+
+        state = detector._tenants[TENANT]
+        assert state.entities[("user", "u1")].days[yesterday].retries == 6
+        cause = StreamingCostAnomalyDetector._derive_cause(state, TENANT, "user", "u1", yesterday)
+        assert cause == DerivedCause.RETRY_LOOP
+
+    @pytest.mark.asyncio
+    async def test_bootstrap_reads_retries(self):
+        yesterday, rows = self._retry_rows()
+        selected = self._selected
+
+        class _Session:
+            async def execute(self, statement, params):
+                columns = selected(statement)
+                groups = defaultdict(lambda: {"cost_cents": 0.0, "requests": 0, "retries": 0, "input_tokens": 0})
+                for r in rows:
+                    day = r["created_at"].date()
+                    for grouping_set, user_id in ((3, None), (1, r["user_id"])):
+                        g = groups[(grouping_set, user_id, day)]
+                        g.update(
+                            tenant_id=TENANT, grouping_set=grouping_set, user_id=user_id, feature_tag=None, day=day
+                        )
+                        g["cost_cents"] += r["cost_cents"]
+                        g["requests"] += 1
+                        g["retries"] += int(r["is_retry"])
+                        g["input_tokens"] += r["input_tokens"]
+                result = [SimpleNamespace(**{k: v for k, v in g.items() if k in columns}) for g in groups.values()]
+                return SimpleNamespace(fetchall=lambda: result)
+
+        detector = StreamingCostAnomalyDetector()
+        await detector.bootstrap(CostRecordStreamDriver(_Session()), today=yesterday + timedelta(days=1))
+
+        state = detector._tenants[TENANT]
+        assert state.entities[("tenant", TENANT)].days[yesterday].retries == 6
+        assert (
+            StreamingCostAnomalyDetector._derive_cause(state, TENANT, "user", "u1", yesterday)
+            == DerivedCause.RETRY_LOOP
+        )
+
+
+class TestConsecutiveBreachQuery:
+    def test_run_of_days_shares_one_group(self):
+        from app.hoc.cus.analytics.L6_drivers.cost_anomaly_driver import CostAnomalyDriver
+
+        statements = []
+
+        class _Session:
+            def execute(self, statement, params):
+                statements.append(str(statement))
+                return SimpleNamespace(first=lambda: (2,))
+
+        count = CostAnomalyDriver(_Session()).fetch_consecutive_breaches(
+            TENANT, "user", "u1", "ABSOLUTE_SPIKE", START
+        )
+
+        assert count == 2
+        # Newest first: consecutive days only share breach_date + (rn - 1)
+        assert "breach_date + INTERVAL '1 day' * (ROW_NUMBER()" in statements[0]
+
+
+class TestCoordinatorStreaming:
+    @pytest.fixture
+    def wiring(self, monkeypatch):
+        from contextlib import asynccontextmanager
+
+        import app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine as engine
+        import app.hoc.cus.analytics.L6_drivers.cost_record_stream_driver as stream_driver
+        import app.hoc.cus.hoc_spine.orchestrator.operation_registry as operation_registry
+
+        calls = []
+        read_session = object()
+
+        class _Stream:
+            async def fetch_daily_totals(self, start, upper):
+                calls.append("bootstrap")
+                return []
+
+            async def fetch_records_after(self, after_ts, after_id, upper, limit):
+                calls.append("poll")
+                return []
+
+        @asynccontextmanager
+        async def _session_context():
+            yield read_session
+
+        def _get_stream(session):
+            assert session is read_session
+            return stream
+
+        async def _run_streaming(session, tenant_id, detector, stream):
+            calls.append(("detect", session, tenant_id, type(detector).__name__))
+            return []
+
+        stream = _Stream()
+        monkeypatch.setenv("COST_ANOMALY_STREAMING", "true")
+        monkeypatch.setattr(operation_registry, "get_async_session_context", _session_context)
+        monkeypatch.setattr(stream_driver, "get_cost_record_stream_driver", _get_stream)
+        monkeypatch.setattr(engine, "run_streaming_anomaly_detection", _run_streaming)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_bootstraps_once_then_polls(self, wiring):
+        from app.hoc.cus.hoc_spine.orchestrator.coordinators.anomaly_incident_coordinator import (
+            AnomalyIncidentCoordinator,
+        )
+
+        coordinator = AnomalyIncidentCoordinator()
+        session = object()
+
+        assert await coordinator.detect_and_ingest(session, TENANT) == {"detected": [], "incidents_created": []}
+        assert await coordinator.detect_only(session, "t_other") == []
+
+        detect = ("detect", session, TENANT, "StreamingCostAnomalyDetector")
+        assert wiring == ["bootstrap", detect, "poll", ("detect", session, "t_other", detect[3])]
+
+    @pytest.mark.asyncio
+    async def test_disabled_runs_batch_detector(self, wiring, monkeypatch):
+        import app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine as engine
+        from app.hoc.cus.hoc_spine.orchestrator.coordinators.anomaly_incident_coordinator import (
+            AnomalyIncidentCoordinator,
+        )
+
+        async def _run_batch(session, tenant_id):
+            wiring.append(("batch", tenant_id))
+            return []
+
+        monkeypatch.setenv("COST_ANOMALY_STREAMING", "false")
+        monkeypatch.setattr(engine, "run_anomaly_detection", _run_batch)
+
+        assert await AnomalyIncidentCoordinator().detect_only(object(), TENANT) == []
+        assert wiring == [("batch", TENANT)]
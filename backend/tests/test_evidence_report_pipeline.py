@@ -0,0 +1,322 @@
+"""
+Tests for the evidence report render pipeline.
+
+Covers the content-addressed disk cache (hit, cap, eviction), single-flight
+coalescing, the bounded render queue, streaming, per-section timings, and
+one end-to-end render through the spawn process pool.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from app.hoc.cus.logs.L5_engines import evidence_report as hoc_evidence_report
+from app.models.export_bundles import EvidenceBundle, PolicyContext, SOC2Bundle
+from app.services.evidence_report import (
+    EvidenceReportGenerator,
+    RenderQueueFullError,
+    ReportCache,
+    ReportRenderPipeline,
+    build_incident_evidence,
+)
+
+
+def _evidence(incident_id: str = "inc_001", ai_output: str = "Your contract auto-renews.", **overrides):
+    fields = dict(
+        incident_id=incident_id,
+        tenant_id="t_1",
+        tenant_name="Acme",
+        user_id="u_1",
+        product_name="Support Bot",
+        model_id="gpt-4o",
+        timestamp="2025-01-01T00:00:00Z",
+        user_input="Is my contract renewing?",
+        context_data={"contract_status": None},
+        ai_output=ai_output,
+        policy_results=[{"policy": "CONTENT_ACCURACY", "result": "FAIL", "reason": "asserted NULL field"}],
+        timeline_events=[{"time": "00:00:00", "event": "INPUT_RECEIVED", "details": "user message"}],
+    )
+    fields.update(overrides)
+    return build_incident_evidence(**fields)
+
+
+def _bundle() -> EvidenceBundle:
+    return EvidenceBundle(
+        run_id="run_1",
+        incident_id="inc_001",
+        trace_id="tr_1",
+        tenant_id="t_1",
+        policy_context=PolicyContext(policy_snapshot_id="snap_1"),
+        content_hash="ab" * 32,
+    )
+
+
+class _CountingExecutor(ThreadPoolExecutor):
+    """Thread pool that counts submissions and can hold renders until released."""
+
+    def __init__(self, gate: threading.Event = None):
+        super().__init__(max_workers=4)
+        self.submitted = 0
+        self.gate = gate
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted += 1
+        if self.gate is None:
+            return super().submit(fn, *args, **kwargs)
+
+        def held():
+            self.gate.wait(5)
+            return fn(*args, **kwargs)
+
+        return super().submit(held)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ReportCache(root=str(tmp_path / "cache"), max_bytes=50 * 1024 * 1024)
+
+
+class TestCacheKey:
+    def test_key_covers_more_than_the_verification_hash(self):
+        generator = EvidenceReportGenerator(is_demo=True)
+        a = _evidence()
+        b = _evidence(severity="LOW")  # same incident_id/timestamp/ai_output
+
+        assert generator._compute_report_hash(a) == generator._compute_report_hash(b)
+        assert generator.cache_key(a) != generator.cache_key(b)
+        assert generator.cache_key(a) == EvidenceReportGenerator(is_demo=True).cache_key(_evidence())
+        assert generator.cache_key(a) != EvidenceReportGenerator(is_demo=False).cache_key(a)
+
+
+class TestReportCache:
+    def _put(self, cache, key, size):
+        staged = cache.staging_path(key)
+        staged.write_bytes(b"x" * size)
+        return cache.commit(key, staged)
+
+    def test_commit_and_get(self, cache):
+        path = self._put(cache, "aa11", 10)
+        assert cache.get("aa11") == path
+        assert cache.get("bb22") is None
+        assert cache.size_bytes == 10
+
+    def test_evicts_least_recently_used_over_cap(self, tmp_path):
+        cache = ReportCache(root=str(tmp_path / "cache"), max_bytes=25)
+        self._put(cache, "aa01", 10)
+        self._put(cache, "aa02", 10)
+        cache.get("aa01")  # refresh: aa02 is now the oldest
+        self._put(cache, "aa03", 10)
+
+        assert cache.get("aa02") is None
+        assert cache.get("aa01") is not None
+        assert cache.get("aa03") is not None
+        assert cache.size_bytes == 20
+        assert not cache.path_for("aa02").exists()
+
+    def test_reindexes_existing_entries_and_clears_staging(self, tmp_path):
+        root = str(tmp_path / "cache")
+        first = ReportCache(root=root, max_bytes=100)
+        self._put(first, "cc01", 7)
+        first.staging_path("dead").write_bytes(b"partial")
+
+        second = ReportCache(root=root, max_bytes=100)
+        assert second.get("cc01") is not None
+        assert second.size_bytes == 7
+        assert list(second.staging.iterdir()) == []
+
+
+class TestReportRenderPipeline:
+    async def test_renders_once_then_serves_from_cache(self, cache):
+        executor = _CountingExecutor()
+        pipeline = ReportRenderPipeline(cache=cache, executor=executor)
+        evidence = _evidence()
+
+        first = await pipeline.render_incident_report(evidence, is_demo=True)
+        second = await pipeline.render_incident_report(_evidence(), is_demo=True)
+
+        assert executor.submitted == 1
+        assert not first.cache_hit and second.cache_hit
+        assert first.key == second.key
+        pdf = second.read_bytes()
+        assert pdf.startswith(b"%PDF") and len(pdf) == first.size
+
+    async def test_section_timings_cover_every_section(self, cache):
+        pipeline = ReportRenderPipeline(cache=cache, executor=_CountingExecutor())
+        report = await pipeline.render_incident_report(_evidence())
+
+        assert set(report.section_timings) == {
+            "incident_snapshot",
+            "cover",
+            "executive_summary",
+            "factual_reconstruction",
+            "policy_evaluation",
+            "decision_timeline",
+            "replay_verification",
+            "prevention_proof",
+            "remediation",
+            "legal_attestation",
+            "layout",
+        }
+        assert all(seconds >= 0 for seconds in report.section_timings.values())
+
+    async def test_concurrent_identical_requests_share_one_render(self, cache):
+        gate = threading.Event()
+        executor = _CountingExecutor(gate)
+        pipeline = ReportRenderPipeline(cache=cache, executor=executor)
+
+        tasks = [asyncio.ensure_future(pipeline.render_incident_report(_evidence())) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        assert pipeline.pending == 1
+        gate.set()
+        reports = await asyncio.gather(*tasks)
+
+        assert executor.submitted == 1
+        assert len({r.path for r in reports}) == 1
+        assert pipeline.pending == 0
+
+    async def test_bounded_queue_rejects_new_renders(self, cache):
+        gate = threading.Event()
+        pipeline = ReportRenderPipeline(cache=cache, executor=_CountingExecutor(gate), max_pending=2)
+
+        running = [asyncio.ensure_future(pipeline.render_incident_report(_evidence(f"inc_{i}"))) for i in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(RenderQueueFullError):
+            await pipeline.render_incident_report(_evidence("inc_overflow"))
+        # Identical requests still coalesce onto the queued render
+        duplicate = asyncio.ensure_future(pipeline.render_incident_report(_evidence("inc_0")))
+
+        gate.set()
+        await asyncio.gather(*running, duplicate)
+        assert pipeline.pending == 0
+
+    async def test_cancelled_request_still_caches_the_render(self, cache):
+        gate = threading.Event()
+        executor = _CountingExecutor(gate)
+        pipeline = ReportRenderPipeline(cache=cache, executor=executor)
+
+        request = asyncio.ensure_future(pipeline.render_incident_report(_evidence()))
+        await asyncio.sleep(0.05)
+        request.cancel()
+        gate.set()
+        for _ in range(100):
+            if pipeline.pending == 0:
+                break
+            await asyncio.sleep(0.02)
+
+        report = await pipeline.render_incident_report(_evidence())
+        assert report.cache_hit
+        assert executor.submitted == 1
+
+    async def test_stream_yields_the_cached_file(self, cache):
+        pipeline = ReportRenderPipeline(cache=cache, executor=_CountingExecutor())
+        report = await pipeline.render_incident_report(_evidence())
+
+        chunks = [chunk async for chunk in report.stream(chunk_size=1024)]
+        assert len(chunks) > 1
+        assert b"".join(chunks) == report.read_bytes()
+
+    async def test_failed_render_is_not_cached(self, cache, monkeypatch):
+        def broken(*args):
+            raise RuntimeError("reportlab exploded")
+
+        monkeypatch.setattr(hoc_evidence_report, "_render_to_file", broken)
+        pipeline = ReportRenderPipeline(cache=cache, executor=_CountingExecutor())
+
+        with pytest.raises(RuntimeError):
+            await pipeline.render_incident_report(_evidence())
+        assert pipeline.pending == 0
+        assert cache.size_bytes == 0
+
+    async def test_renders_export_bundles(self, cache):
+        pipeline = ReportRenderPipeline(cache=cache, executor=_CountingExecutor())
+        bundle = _bundle()
+        soc2 = SOC2Bundle(**bundle.model_dump(exclude={"bundle_id"}), attestation_statement="attested")
+
+        evidence_pdf = await pipeline.render_bundle("render_evidence_pdf", bundle)
+        soc2_pdf = await pipeline.render_bundle("render_soc2_pdf", soc2)
+        again = await pipeline.render_bundle("render_evidence_pdf", bundle)
+
+        assert evidence_pdf.read_bytes().startswith(b"%PDF")
+        assert soc2_pdf.key != evidence_pdf.key
+        assert "control_mappings" in soc2_pdf.section_timings
+        assert again.cache_hit
+        with pytest.raises(ValueError):
+            await pipeline.render_bundle("render_anything", bundle)
+
+    async def test_process_pool_render(self, cache):
+        pipeline = ReportRenderPipeline(cache=cache, max_workers=1)
+        try:
+            report = await pipeline.render_incident_report(_evidence(), is_demo=False)
+        finally:
+            pipeline.shutdown()
+
+        assert report.read_bytes().startswith(b"%PDF")
+        assert "layout" in report.section_timings
+
+
+class TestRegistryRouting:
+    """logs.pdf / logs.evidence_report render through the shared pipeline."""
+
+    @pytest.fixture
+    def registry(self, cache, monkeypatch):
+        from app.hoc.cus.hoc_spine.orchestrator.handlers.logs_handler import register
+        from app.hoc.cus.hoc_spine.orchestrator.operation_registry import OperationRegistry
+
+        pipeline = ReportRenderPipeline(cache=cache, executor=_CountingExecutor())
+        monkeypatch.setattr(hoc_evidence_report, "_report_render_pipeline", pipeline)
+        registry = OperationRegistry()
+        register(registry)
+        return registry
+
+    @staticmethod
+    def _ctx(**params):
+        from app.hoc.cus.hoc_spine.orchestrator.operation_registry import OperationContext
+
+        return OperationContext(session=None, tenant_id="t_1", params=params)
+
+    async def test_logs_pdf_streams_a_cached_render(self, registry):
+        bundle = _bundle()
+        first = await registry.execute("logs.pdf", self._ctx(method="render_evidence_pdf", bundle=bundle))
+        again = await registry.execute("logs.pdf", self._ctx(method="render_evidence_pdf", bundle=bundle))
+
+        assert first.success and not first.data.cache_hit
+        assert b"".join([chunk async for chunk in first.data.stream()]).startswith(b"%PDF")
+        assert again.success and again.data.cache_hit
+        unknown = await registry.execute("logs.pdf", self._ctx(method="render_anything", bundle=_bundle()))
+        assert unknown.error_code == "UNKNOWN_METHOD"
+
+    async def test_logs_evidence_report_renders_through_pipeline(self, registry):
+        params = dict(
+            incident_id="inc_001",
+            tenant_id="t_1",
+            tenant_name="Acme",
+            user_id="u_1",
+            product_name="Support Bot",
+            model_id="gpt-4o",
+            timestamp="2025-01-01T00:00:00Z",
+            user_input="Is my contract renewing?",
+            context_data={},
+            ai_output="Yes.",
+            policy_results=[],
+            timeline_events=[],
+            is_demo=False,
+        )
+        result = await registry.execute("logs.evidence_report", self._ctx(**params))
+
+        assert result.success
+        assert result.data.read_bytes().startswith(b"%PDF")
+
+    async def test_full_queue_maps_to_503(self, registry, monkeypatch):
+        from fastapi import HTTPException
+
+        from app.hoc.api.cus.incidents.incidents import _pdf_response
+
+        monkeypatch.setattr(hoc_evidence_report._report_render_pipeline, "_max_pending", 0)
+        result = await registry.execute("logs.pdf", self._ctx(method="render_soc2_pdf", bundle=_bundle()))
+
+        assert result.error_code == "RENDER_QUEUE_FULL"
+        with pytest.raises(HTTPException) as exc:
+            _pdf_response(result, "soc2_inc_001.pdf")
+        assert exc.value.status_code == 503
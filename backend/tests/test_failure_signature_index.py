@@ -0,0 +1,252 @@
+"""
+Failure Signature Index Tests
+
+Tests for the lexical (MinHash/LSH) recovery tier:
+1. Canonicalisation and exact-Jaccard verification
+2. Index add/replace/evict/reload
+3. suggest_hybrid layer order and per-layer stats
+
+Run with: pytest tests/test_failure_signature_index.py -v
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.hoc.cus.policies.L6_drivers import failure_signature_index
+from app.hoc.cus.policies.L6_drivers.failure_signature_index import (
+    FailureSignatureIndex,
+    LexicalRecoveryTier,
+    RecoveryLayerStats,
+    canonicalize,
+    get_failure_signature_index,
+    get_recovery_layer_stats,
+    jaccard,
+    shingles,
+)
+from app.hoc.cus.policies.L6_drivers.recovery_matcher import RecoveryMatcher as L6RecoveryMatcher
+from app.services.recovery_matcher import RecoveryMatcher
+
+TIMEOUT_MSG = "upstream request to 10.0.3.17:8443 timed out after 30s (request_id=5f1c2a9e-0b7d-4e21-9c3a-8f2d1e4b6a70)"
+TIMEOUT_RECOVERY = "Retry with exponential backoff"
+
+
+class TestCanonicalisation:
+    def test_volatile_tokens_replaced(self):
+        a = canonicalize(TIMEOUT_MSG)
+        b = canonicalize(
+            "Upstream request to 10.0.9.2:8080   timed out after 45s (request_id=0a9b8c7d-1111-2222-3333-444455556666)"
+        )
+        assert a == b
+        assert "<id>" in a and "<n>" in a
+
+    def test_jaccard_exact(self):
+        s = shingles("connection refused")
+        assert jaccard(s, s) == 1.0
+        assert jaccard(s, shingles("permission denied")) < 0.2
+        assert jaccard(s, frozenset()) == 0.0
+
+
+class TestFailureSignatureIndex:
+    def test_rephrased_failure_matches(self):
+        index = FailureSignatureIndex(threshold=0.6)
+        index.add(TIMEOUT_MSG, error_code="TIMEOUT", recovery_action=TIMEOUT_RECOVERY, catalog_id="7")
+        index.add("permission denied for tool web_search", error_code="PERMISSION_DENIED", recovery_action="Fix ACL")
+
+        match = index.lookup("upstream request to 10.1.1.1:443 timed out after 12s (request_id=abc)")
+
+        assert match is not None
+        assert match.entry.recovery_action == TIMEOUT_RECOVERY
+        assert match.similarity >= 0.6
+        assert match.as_matched_entry()["id"] == "7"
+
+    def test_below_threshold_not_returned(self):
+        index = FailureSignatureIndex(threshold=0.6)
+        index.add(TIMEOUT_MSG, error_code="TIMEOUT", recovery_action=TIMEOUT_RECOVERY)
+
+        assert index.lookup("budget exceeded for tenant acme") is None
+        assert index.lookup("") is None
+
+    def test_threshold_is_tunable(self):
+        strict = FailureSignatureIndex(threshold=0.95)
+        loose = FailureSignatureIndex(threshold=0.3, num_perm=64, bands=32)
+        for index in (strict, loose):
+            index.add("rate limited by provider, retry after 20s", error_code="RATE_LIMITED", recovery_action="Backoff")
+
+        query = "rate limited by upstream provider openai; retry later"
+        assert strict.lookup(query) is None
+        assert loose.lookup(query) is not None
+
+    def test_same_canonical_form_replaces(self):
+        index = FailureSignatureIndex()
+        index.add("connection reset by peer", error_code="HTTP_5XX", recovery_action="Circuit breaker")
+        index.add("connection reset by peer ", error_code="CONNECTION_ERROR", recovery_action="Reconnect")
+
+        # Same canonical form: the second add replaces the first
+        assert len(index) == 1
+        assert index.lookup("connection reset by peer", "HTTP_5XX").entry.recovery_action == "Reconnect"
+
+    def test_eviction_keeps_buckets_consistent(self):
+        index = FailureSignatureIndex(max_entries=2)
+        index.add("disk quota exceeded on volume data", error_code="QUOTA", recovery_action="a")
+        index.add("dns lookup failed for host api", error_code="DNS", recovery_action="b")
+        index.add("tls handshake failed: certificate expired", error_code="TLS", recovery_action="c")
+
+        assert len(index) == 2
+        assert index.lookup("disk quota exceeded on volume data") is None
+        assert index.lookup("tls handshake failed: certificate expired").entry.recovery_action == "c"
+
+    def test_load_replaces_catalog_keeps_learned(self):
+        index = FailureSignatureIndex(reload_seconds=60)
+        assert index.needs_reload(now=0.0)
+        index.add("model returned malformed json", error_code="PARSE_ERROR", recovery_action="Validate", source="llm")
+
+        loaded = index.load(
+            [
+                {"id": 1, "error_code": "TIMEOUT", "error_pattern": TIMEOUT_MSG, "recovery_action": TIMEOUT_RECOVERY},
+                {"id": 2, "error_code": "X", "error_pattern": "", "recovery_action": "skipped"},
+            ],
+            now=0.0,
+        )
+
+        assert loaded == 1
+        assert len(index) == 2
+        assert index.lookup("model returned malformed json").entry.source == "llm"
+        assert not index.needs_reload(now=30.0)
+        assert index.needs_reload(now=60.0)
+
+    def test_invalid_band_layout_rejected(self):
+        with pytest.raises(ValueError):
+            FailureSignatureIndex(num_perm=64, bands=10)
+        with pytest.raises(ValueError):
+            FailureSignatureIndex(threshold=0.0)
+
+
+class TestRecoveryLayerStats:
+    def test_hit_rates(self):
+        stats = RecoveryLayerStats()
+        stats.record("lexical", True, 0.001)
+        stats.record("lexical", False, 0.003)
+        stats.record("embedding", True, 0.2)
+
+        snapshot = stats.snapshot()
+        assert snapshot["lexical"] == {"lookups": 2, "hits": 1, "hit_rate": 0.5, "avg_ms": 2.0}
+        assert snapshot["embedding"]["hit_rate"] == 1.0
+        assert snapshot["llm"]["lookups"] == 0
+
+
+@pytest.fixture
+def fresh_index(monkeypatch):
+    monkeypatch.setattr(failure_signature_index, "_index", FailureSignatureIndex())
+    monkeypatch.setattr(failure_signature_index, "_stats", RecoveryLayerStats())
+    index = get_failure_signature_index()
+    index.load([])
+    return index
+
+
+@pytest.fixture(params=["services", "l6"])
+def matcher(request, fresh_index):
+    """Both RecoveryMatcher copies share the lexical tier."""
+    if request.param == "services":
+        return RecoveryMatcher()
+    return L6RecoveryMatcher(MagicMock())
+
+
+def _request(message, code="TIMEOUT"):
+    return {"failure_match_id": "fm-1", "failure_payload": {"error_type": code, "raw": message}}
+
+
+def _layers(matcher, embedding=None):
+    return (
+        patch.object(matcher, "_get_cached_recovery", return_value=None),
+        patch.object(matcher, "_set_cached_recovery"),
+        patch.object(matcher, "_find_similar_by_embedding", new=AsyncMock(return_value=embedding or [])),
+        patch.object(matcher, "_escalate_to_llm", new=AsyncMock(return_value=None)),
+    )
+
+
+class TestLexicalRecoveryTier:
+    def test_reload_reads_history_then_catalog(self):
+        results = [
+            [("fm-1", "TIMEOUT", "Tool call timed out after 30s", "Retry with backoff")],
+            [(9, "DNS_FAILURE", "DNS resolution failed for host api-3", "Check resolver", 0.5)],
+        ]
+        session = MagicMock()
+        session.execute.side_effect = lambda *args: MagicMock(fetchall=MagicMock(return_value=results.pop(0)))
+        tier = LexicalRecoveryTier(lambda: session, index=FailureSignatureIndex(), stats=RecoveryLayerStats())
+
+        match = tier.resolve("DNS_FAILURE", "DNS resolution failed for host api-12")
+
+        assert match.suggestion == "Check resolver"
+        assert match.explain() == {"method": "lexical", "similarity": 1.0, "catalog_id": "9", "indexed_from": "catalog"}
+        assert match.confidence == 0.5
+        assert tier.index.lookup("tool call timed out after 5s").entry.source == "history"
+        assert session.execute.call_count == 2
+        assert tier.stats.snapshot()["lexical"]["hits"] == 1
+
+    def test_failed_reload_keeps_entries_until_next_interval(self):
+        index = FailureSignatureIndex()
+        index.add(TIMEOUT_MSG, error_code="TIMEOUT", recovery_action=TIMEOUT_RECOVERY, source="llm")
+
+        def no_session():
+            raise RuntimeError("DATABASE_URL environment variable is required")
+
+        tier = LexicalRecoveryTier(no_session, index=index, stats=RecoveryLayerStats())
+
+        assert tier.resolve("TIMEOUT", TIMEOUT_MSG) is not None
+        assert not index.needs_reload()
+
+
+class TestHybridLexicalLayer:
+    @pytest.mark.asyncio
+    async def test_lexical_hit_skips_embedding_and_llm(self, matcher, fresh_index):
+        fresh_index.add(TIMEOUT_MSG, error_code="TIMEOUT", recovery_action=TIMEOUT_RECOVERY, success_rate=0.9)
+        cache, set_cache, embedding, llm = _layers(matcher)
+
+        with cache, set_cache as set_cache, embedding as embedding, llm as llm:
+            result = await matcher.suggest_hybrid(
+                _request(
+                    "Upstream request to 10.2.2.2:443 timed out after 9s (request_id=1d2e3f40-5a6b-4c7d-8e9f-a0b1c2d3e4f5)"
+                )
+            )
+
+        assert result.explain["method"] == "lexical"
+        assert result.suggested_recovery == TIMEOUT_RECOVERY
+        assert 0 < result.confidence <= 0.9
+        embedding.assert_not_called()
+        llm.assert_not_called()
+        set_cache.assert_called_once()
+        stats = get_recovery_layer_stats().snapshot()
+        assert stats["cache"]["lookups"] == 1 and stats["cache"]["hits"] == 0
+        assert stats["lexical"]["hits"] == 1
+        assert stats["embedding"]["lookups"] == 0
+
+    @pytest.mark.asyncio
+    async def test_embedding_resolution_is_learned(self, matcher):
+        embedding_hit = [
+            {
+                "id": "42",
+                "error_code": "HTTP_5XX",
+                "recovery_action": "Fail over shard",
+                "success_rate": 0.9,
+                "similarity": 0.91,
+            }
+        ]
+        cache, set_cache, embedding, llm = _layers(matcher, embedding_hit)
+
+        with cache, set_cache, embedding as embedding, llm:
+            first = await matcher.suggest_hybrid(
+                _request("vector store shard 12 unavailable, retrying in 5s", "HTTP_5XX")
+            )
+            second = await matcher.suggest_hybrid(
+                _request("vector store shard 7 unavailable, retrying in 30s", "HTTP_5XX")
+            )
+
+        assert first.explain["method"] == "embedding"
+        assert second.explain["method"] == "lexical"
+        assert second.explain["indexed_from"] == "embedding"
+        assert second.suggested_recovery == "Fail over shard"
+        assert embedding.await_count == 1
+        stats = get_recovery_layer_stats().snapshot()
+        assert stats["lexical"]["hit_rate"] == 0.5
+        assert stats["embedding"]["hit_rate"] == 1.0
@@ -0,0 +1,404 @@
+"""
+Tests for the Guard Console cache.
+
+Uses an in-memory stand-in for the Redis commands GuardCache issues (MGET,
+SET NX/PX/EX, INCR, EVAL of the lease release script, PUBLISH/SUBSCRIBE), so
+several GuardCache instances can share it the way API processes share Redis.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from app.utils.guard_cache import GUARD_INVALIDATE_CHANNEL, RELEASE_LOCK_LUA, GuardCache
+
+
+class FakeRedis:
+    def __init__(self, clock):
+        self.clock = clock
+        self.data = {}  # key -> (value, expires_at or None)
+        self.subscribers = []
+
+    def _live(self, key):
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= self.clock():
+            del self.data[key]
+            return None
+        return value
+
+    async def get(self, key):
+        return self._live(key)
+
+    async def mget(self, *keys):
+        return [self._live(key) for key in keys]
+
+    async def set(self, key, value, nx=False, px=None, ex=None):
+        if nx and self._live(key) is not None:
+            return None
+        ttl = px / 1000 if px else ex
+        self.data[key] = (str(value), self.clock() + ttl if ttl else None)
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def incr(self, key):
+        value = int(self._live(key) or 0) + 1
+        self.data[key] = (str(value), None)
+        return value
+
+    async def eval(self, script, numkeys, key, token):
+        assert script == RELEASE_LOCK_LUA
+        if self._live(key) == token:
+            return await self.delete(key)
+        return 0
+
+    async def publish(self, channel, message):
+        for queue in self.subscribers:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(self.subscribers)
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+
+class FakeSyncRedis:
+    """The sync client's view of the same FakeRedis (INCR, PUBLISH)."""
+
+    def __init__(self, redis):
+        self.redis = redis
+
+    def incr(self, key):
+        value = int(self.redis._live(key) or 0) + 1
+        self.redis.data[key] = (str(value), None)
+        return value
+
+    def publish(self, channel, message):
+        for queue in self.redis.subscribers:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(self.redis.subscribers)
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.queue = asyncio.Queue()
+
+    async def subscribe(self, channel):
+        assert channel == GUARD_INVALIDATE_CHANNEL
+        self.redis.subscribers.append(self.queue)
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self):
+        self.redis.subscribers.remove(self.queue)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Source:
+    """A slow DB read that counts how often it runs."""
+
+    def __init__(self, delay=0.05):
+        self.calls = 0
+        self.version = 0
+        self.delay = delay
+        self.fail = False
+
+    async def __call__(self):
+        self.calls += 1
+        version = self.version  # the row state this read sees
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("db down")
+        return {"version": version}
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def redis(clock):
+    return FakeRedis(clock)
+
+
+@pytest.fixture
+async def make_cache(redis, clock):
+    caches = []
+
+    def make(**kwargs):
+        kwargs.setdefault("l1_ttl", 1.0)
+        kwargs.setdefault("stale_ttl", 30)
+        cache = GuardCache(redis_client=redis, clock=clock, **kwargs)
+        cache._enabled = True
+        caches.append(cache)
+        return cache
+
+    yield make
+    for cache in caches:
+        await cache.close()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestReadThrough:
+    async def test_concurrent_misses_compute_once(self, make_cache):
+        cache = make_cache()
+        source = Source()
+
+        results = await asyncio.gather(*(cache.get_or_compute("status", "t1", source, 5) for _ in range(50)))
+
+        assert source.calls == 1
+        assert all(r == {"version": 0} for r in results)
+
+    async def test_single_flight_across_processes(self, make_cache):
+        source = Source(delay=0.2)
+        caches = [make_cache() for _ in range(4)]
+
+        results = await asyncio.gather(
+            *(cache.get_or_compute("status", "t1", source, 5) for cache in caches for _ in range(10))
+        )
+
+        assert source.calls == 1
+        assert len(results) == 40 and all(r == {"version": 0} for r in results)
+
+    async def test_waiters_compute_when_the_lease_holder_fails(self, make_cache):
+        failing, healthy = Source(delay=0.1), Source()
+        failing.fail = True
+        first, second = make_cache(), make_cache()
+
+        holder = asyncio.ensure_future(first.get_or_compute("status", "t1", failing, 5))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(second.get_or_compute("status", "t1", healthy, 5))
+
+        with pytest.raises(RuntimeError):
+            await holder
+        assert await waiter == {"version": 0}
+        assert healthy.calls == 1
+
+    async def test_l1_serves_without_redis_round_trips(self, make_cache, redis):
+        cache = make_cache()
+        source = Source(delay=0)
+        await cache.get_or_compute("snapshot", "t1", source, 10)
+
+        redis.data.clear()  # anything still answered must come from L1
+        assert await cache.get_or_compute("snapshot", "t1", source, 10) == {"version": 0}
+        assert source.calls == 1
+
+    async def test_values_normalised_across_tiers(self, make_cache):
+        from datetime import datetime, timezone
+
+        first, second = make_cache(), make_cache()
+        started = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        async def compute():
+            return {"started_at": started}
+
+        from_compute = await first.get_or_compute("incidents", "t1", compute, 5, extra="50:0")
+        from_redis = await second.get_or_compute("incidents", "t1", compute, 5, extra="50:0")
+
+        assert from_compute == from_redis == {"started_at": str(started)}
+
+
+class TestStaleWhileRevalidate:
+    async def test_stale_value_served_while_one_refresh_runs(self, make_cache, clock):
+        cache = make_cache()
+        source = Source()
+        await cache.get_or_compute("status", "t1", source, 5)
+
+        clock.now += 6  # past fresh_until and the L1 TTL, inside the stale window
+        source.version = 1
+        results = await asyncio.gather(*(cache.get_or_compute("status", "t1", source, 5) for _ in range(20)))
+
+        assert all(r == {"version": 0} for r in results)
+        await asyncio.sleep(0.1)
+        assert source.calls == 2
+        assert await cache.get_or_compute("status", "t1", source, 5) == {"version": 1}
+
+    async def test_refresh_uses_the_refresh_callable(self, make_cache, clock):
+        cache = make_cache()
+        request_scoped, background = Source(delay=0), Source(delay=0)
+        background.version = 7
+        await cache.get_or_compute("status", "t1", request_scoped, 5, refresh=background)
+
+        clock.now += 6
+        await cache.get_or_compute("status", "t1", request_scoped, 5, refresh=background)
+        await _settle()
+
+        assert (request_scoped.calls, background.calls) == (1, 1)
+        assert await cache.get_or_compute("status", "t1", request_scoped, 5) == {"version": 7}
+
+    async def test_one_refresh_across_processes(self, make_cache, clock):
+        source = Source(delay=0.1)
+        caches = [make_cache() for _ in range(4)]
+        await caches[0].get_or_compute("status", "t1", source, 5)
+
+        clock.now += 6
+        await asyncio.gather(*(cache.get_or_compute("status", "t1", source, 5) for cache in caches))
+        await asyncio.sleep(0.2)
+
+        assert source.calls == 2
+
+    async def test_failed_refresh_keeps_serving_stale(self, make_cache, clock):
+        cache = make_cache()
+        source = Source(delay=0)
+        await cache.get_or_compute("status", "t1", source, 5)
+
+        clock.now += 6
+        source.fail = True
+        assert await cache.get_or_compute("status", "t1", source, 5) == {"version": 0}
+        await _settle()
+        assert await cache.get_or_compute("status", "t1", source, 5) == {"version": 0}
+
+    async def test_expired_past_stale_window_recomputes(self, make_cache, clock):
+        cache = make_cache()
+        source = Source(delay=0)
+        await cache.get_or_compute("status", "t1", source, 5)
+
+        clock.now += 5 + 30 + 1
+        source.version = 2
+        assert await cache.get_or_compute("status", "t1", source, 5) == {"version": 2}
+
+
+class TestInvalidation:
+    async def test_invalidation_is_never_served_stale(self, make_cache, clock):
+        cache = make_cache()
+        source = Source(delay=0)
+        await cache.get_or_compute("status", "t1", source, 5)
+
+        source.version = 1
+        await cache.invalidate_tenant("t1")
+        assert await cache.get_or_compute("status", "t1", source, 5) == {"version": 1}
+
+    async def test_only_the_invalidated_tenant_recomputes(self, make_cache):
+        cache = make_cache()
+        source = Source(delay=0)
+        await cache.get_or_compute("status", "t1", source, 5)
+        await cache.get_or_compute("status", "t2", source, 5)
+
+        await cache.invalidate_tenant("t1")
+        await cache.get_or_compute("status", "t1", source, 5)
+        await cache.get_or_compute("status", "t2", source, 5)
+
+        assert source.calls == 3
+
+    async def test_other_processes_drop_their_l1(self, make_cache):
+        reader, writer = make_cache(), make_cache()
+        source = Source(delay=0)
+        await reader.get_or_compute("status", "t1", source, 5)
+        await writer.get_or_compute("status", "t1", source, 5)  # starts writer's listener too
+        await _settle()
+
+        source.version = 1
+        await writer.invalidate_tenant("t1")
+        await _settle()
+
+        assert await reader.get_or_compute("status", "t1", source, 5) == {"version": 1}
+
+    async def test_compute_racing_an_invalidation_is_not_published(self, make_cache):
+        cache, other = make_cache(), make_cache()
+        source = Source(delay=0.1)
+
+        pending = asyncio.ensure_future(cache.get_or_compute("status", "t1", source, 5))
+        await asyncio.sleep(0.01)
+        source.version = 1  # the mutation lands while the read is in flight
+        await cache.invalidate_tenant("t1")
+        assert await pending == {"version": 0}  # the in-flight caller gets its own read
+
+        assert await other.get_or_compute("status", "t1", source, 5) == {"version": 1}
+        assert await cache.get_or_compute("status", "t1", source, 5) == {"version": 1}
+
+    async def test_direct_get_and_set_share_the_envelope(self, make_cache, redis):
+        cache = make_cache()
+        assert await cache.set_status("t1", {"is_frozen": True})
+        assert await cache.get_status("t1") == {"is_frozen": True}
+        assert json.loads(redis.data["guard:status:t1"][0])["v"] == {"is_frozen": True}
+
+        await cache.invalidate_tenant("t1")
+        assert await cache.get_status("t1") is None
+
+    async def test_sync_invalidation_reaches_async_readers(self, make_cache, redis, clock):
+        reader = make_cache()
+        worker = GuardCache(sync_redis_client=FakeSyncRedis(redis), clock=clock)
+        source = Source(delay=0)
+        await reader.get_or_compute("status", "t1", source, 5)
+        await _settle()
+
+        source.version = 1
+        assert worker.invalidate_tenant_sync("t1") == 1
+        await _settle()
+
+        assert await reader.get_or_compute("status", "t1", source, 5) == {"version": 1}
+
+
+class TestIncidentCreation:
+    async def test_anomaly_incidents_commit_then_invalidate(self, make_cache, monkeypatch):
+        from types import SimpleNamespace
+
+        import app.hoc.cus.analytics.L5_engines.cost_anomaly_detector_engine as detector_engine
+        import app.hoc.cus.incidents.L5_engines.anomaly_bridge as anomaly_bridge
+        from app.hoc.cus.hoc_spine.orchestrator.coordinators.anomaly_incident_coordinator import (
+            AnomalyIncidentCoordinator,
+        )
+
+        cache = make_cache()
+        source = Source(delay=0)
+        await cache.get_or_compute("incidents", "t1", source, 5)
+        monkeypatch.setattr(GuardCache, "_instance", cache)
+
+        async def detect(session, tenant_id):
+            return {"detected": ["a-1"], "facts": [SimpleNamespace(anomaly_id="a-1")]}
+
+        events = []
+
+        class Session:
+            def commit(self):
+                events.append("commit")
+
+        monkeypatch.setenv("COST_ANOMALY_STREAMING", "false")
+        monkeypatch.setattr(detector_engine, "_run_anomaly_detection_with_facts", detect)
+        monkeypatch.setattr(
+            anomaly_bridge,
+            "get_anomaly_incident_bridge",
+            lambda session: SimpleNamespace(ingest=lambda fact: "inc-1"),
+        )
+
+        source.version = 1
+        result = await AnomalyIncidentCoordinator().detect_and_ingest(Session(), "t1")
+
+        assert result["incidents_created"] == [{"anomaly_id": "a-1", "incident_id": "inc-1"}]
+        assert events == ["commit"]
+        assert await cache.get_or_compute("incidents", "t1", source, 5) == {"version": 1}
+
+
+class TestWithoutRedis:
+    async def test_coalesces_and_uses_l1(self, clock, monkeypatch):
+        monkeypatch.delenv("REDIS_URL", raising=False)
+        cache = GuardCache(clock=clock)
+        cache._enabled = True
+        source = Source()
+
+        await asyncio.gather(*(cache.get_or_compute("status", "t1", source, 5) for _ in range(10)))
+        await cache.get_or_compute("status", "t1", source, 5)
+        assert source.calls == 1
+
+        assert await cache.invalidate_tenant("t1") == 0
+        await cache.get_or_compute("status", "t1", source, 5)
+        assert source.calls == 2
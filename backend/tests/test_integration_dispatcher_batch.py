@@ -0,0 +1,355 @@
+"""
+Integration Dispatcher Batch Pipeline Tests
+
+dispatch_many() runs a burst of loop events stage by stage in batches.
+Over a synthetic incident burst (strong/weak/novel matches, failing and
+raising handlers, duplicate incidents, events already in the database)
+it must give the same results, rows and publishes as dispatching the
+events one at a time, with fewer database round trips.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+
+import pytest
+
+from app.integrations.dispatcher import DispatchCoalescer, DispatcherConfig, IntegrationDispatcher
+from app.integrations.events import (
+    ConfidenceBand,
+    LoopEvent,
+    LoopFailureState,
+    LoopStage,
+)
+
+
+class FakeLoopDB:
+    """In-memory loop_events / loop_traces / human_checkpoints, keyed by the dispatcher's SQL."""
+
+    def __init__(self):
+        self.events: dict[str, dict] = {}
+        self.traces: dict[str, dict] = {}
+        self.checkpoints: dict[str, dict] = {}
+        self.round_trips = 0
+
+    @asynccontextmanager
+    async def session(self):
+        yield self
+
+    async def execute(self, statement, params=None):
+        self.round_trips += 1
+        sql = " ".join(str(statement).split())
+        rows = params if isinstance(params, list) else [params or {}]
+        result = []
+        if sql.startswith("INSERT INTO loop_events"):
+            for row in rows:
+                self.events.setdefault(row["id"], dict(row))["details"] = row["details"]
+        elif sql.startswith("INSERT INTO loop_traces"):
+            for row in rows:
+                self.traces.setdefault(row["id"], dict(row)).update(row)
+        elif sql.startswith("INSERT INTO human_checkpoints"):
+            for row in rows:
+                self.checkpoints.setdefault(row["id"], dict(row))
+        elif "FROM loop_events" in sql:
+            ids, stages = set(rows[0]["incident_ids"]), set(rows[0]["stages"])
+            result = [
+                SimpleNamespace(incident_id=e["incident_id"], stage=e["stage"])
+                for e in self.events.values()
+                if e["incident_id"] in ids and e["stage"] in stages
+            ]
+        elif "FROM loop_traces" in sql:
+            latest = {}
+            for trace in self.traces.values():
+                if trace["incident_id"] in rows[0]["incident_ids"]:
+                    if (
+                        trace["incident_id"] not in latest
+                        or trace["started_at"] > latest[trace["incident_id"]]["started_at"]
+                    ):
+                        latest[trace["incident_id"]] = trace
+            result = [SimpleNamespace(**trace) for trace in latest.values()]
+        return SimpleNamespace(fetchall=lambda: result, fetchone=lambda: result[0] if result else None)
+
+    async def commit(self):
+        pass
+
+    def seed_event(self, incident_id, stage):
+        self.events[f"evt_seed_{incident_id}"] = {
+            "id": f"evt_seed_{incident_id}",
+            "incident_id": incident_id,
+            "tenant_id": "t1",
+            "stage": stage.value,
+            "details": "{}",
+        }
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published: list[tuple[str, str]] = []
+
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+def _make_dispatcher():
+    db, redis = FakeLoopDB(), FakeRedis()
+    dispatcher = IntegrationDispatcher(redis, db.session, config=DispatcherConfig())
+    catalog: list[str] = []
+
+    async def match_pattern(event: LoopEvent):
+        n = event.details["n"]
+        # Shared catalog: results depend on the order incidents reach this stage
+        if n % 4 == 0:
+            catalog.append(event.incident_id)
+        event.details["catalog_size"] = len(catalog)
+        event.details["confidence"] = 0.7 if n % 6 == 1 else 0.95
+        event.confidence_band = (
+            ConfidenceBand.WEAK_MATCH
+            if n % 6 == 1
+            else ConfidenceBand.NOVEL
+            if n % 9 == 2
+            else ConfidenceBand.STRONG_MATCH
+        )
+        return event
+
+    async def suggest_recovery(event: LoopEvent):
+        if event.details["n"] % 5 == 3:
+            event.failure_state = LoopFailureState.MATCH_FAILED
+        event.details["recovery"] = {"template": f"r{event.details['n'] % 3}"}
+        return event
+
+    async def generate_policy(event: LoopEvent):
+        if event.details["n"] % 11 == 8:
+            raise RuntimeError("policy store unavailable")
+        return None
+
+    dispatcher.register_handler(LoopStage.INCIDENT_CREATED, match_pattern)
+    dispatcher.register_handler(LoopStage.PATTERN_MATCHED, suggest_recovery)
+    dispatcher.register_handler(LoopStage.RECOVERY_SUGGESTED, generate_policy)
+    return dispatcher, db, redis
+
+
+def _burst(count=40):
+    events = []
+    for n in range(count):
+        events.append(
+            LoopEvent.create(
+                incident_id=f"inc_{n:03d}",
+                tenant_id=f"t{n % 3}",
+                stage=LoopStage.INCIDENT_CREATED,
+                details={"n": n},
+            )
+        )
+    # Repeated incidents later in the burst, and an unrelated stage entry
+    for n in (4, 8, 13):
+        events.append(
+            LoopEvent.create(
+                incident_id=f"inc_{n:03d}",
+                tenant_id=f"t{n % 3}",
+                stage=LoopStage.INCIDENT_CREATED,
+                details={"n": n},
+            )
+        )
+    events.append(
+        LoopEvent.create(
+            incident_id="inc_005",
+            tenant_id="t2",
+            stage=LoopStage.POLICY_GENERATED,
+            details={"n": 5},
+        )
+    )
+    # inc_003's chain ends (fails) at pattern_matched: a retry of that stage is a duplicate
+    events.append(
+        LoopEvent.create(
+            incident_id="inc_003",
+            tenant_id="t0",
+            stage=LoopStage.PATTERN_MATCHED,
+            details={"n": 3},
+        )
+    )
+    return events
+
+
+def _clone(events):
+    return [
+        LoopEvent.create(
+            incident_id=e.incident_id,
+            tenant_id=e.tenant_id,
+            stage=e.stage,
+            details=json.loads(json.dumps(e.details)),
+        )
+        for e in events
+    ]
+
+
+def _snapshot(dispatcher, db, redis, results):
+    """Everything observable, with generated ids and timestamps removed."""
+    loop_incident = {status.loop_id: incident for incident, status in dispatcher._active_loops.items()}
+
+    def details(d):
+        d = dict(d)
+        if "existing_loop_id" in d:
+            d["existing_loop_id"] = loop_incident[d["existing_loop_id"]]
+        return d
+
+    def stored(row):
+        d = json.loads(row["details"])
+        d.pop("event_id")
+        d.pop("timestamp")
+        d["details"] = details(d["details"])
+        return d
+
+    return {
+        "results": [
+            (e.incident_id, e.stage.value, e.failure_state, e.confidence_band, details(e.details)) for e in results
+        ],
+        "events": sorted(
+            json.dumps([row["incident_id"], stored(row)], sort_keys=True)
+            for row in db.events.values()
+            if not row["id"].startswith("evt_seed_")
+        ),
+        "traces": sorted((t["incident_id"], t["stages"], t["is_complete"]) for t in db.traces.values()),
+        "checkpoints": sorted(
+            (c["incident_id"], c["type"], c["stage"], c["description"]) for c in db.checkpoints.values()
+        ),
+        "published": sorted(
+            json.dumps(
+                [
+                    channel,
+                    {k: v for k, v in json.loads(msg).items() if k not in ("event_id", "timestamp", "checkpoint_id")},
+                ],
+                sort_keys=True,
+                default=str,
+            )
+            for channel, msg in redis.published
+        ),
+        "processed": sorted(dispatcher._processed_events),
+        "blocked": sorted((i, s.is_blocked, len(s.pending_checkpoints)) for i, s in dispatcher._active_loops.items()),
+    }
+
+
+class TestBatchEquivalence:
+    @pytest.mark.asyncio
+    async def test_burst_matches_per_event_dispatch(self):
+        burst = _burst()
+
+        sequential, seq_db, seq_redis = _make_dispatcher()
+        seq_db.seed_event("inc_010", LoopStage.INCIDENT_CREATED)
+        seq_results = [await sequential.dispatch(event) for event in _clone(burst)]
+
+        batched, batch_db, batch_redis = _make_dispatcher()
+        batch_db.seed_event("inc_010", LoopStage.INCIDENT_CREATED)
+        batch_results = await batched.dispatch_many(_clone(burst))
+
+        expected = _snapshot(sequential, seq_db, seq_redis, seq_results)
+        assert _snapshot(batched, batch_db, batch_redis, batch_results) == expected
+
+        # The burst exercised every outcome
+        outcomes = {r[2] for r in expected["results"]}
+        assert {None, LoopFailureState.HUMAN_CHECKPOINT_PENDING, LoopFailureState.MATCH_FAILED} <= outcomes
+        assert LoopFailureState.ERROR in outcomes
+        assert any(r[4].get("idempotency_blocked") for r in expected["results"])
+        assert expected["results"][-1][4]["existing_loop_id"] == "inc_003"
+        assert batch_db.round_trips * 5 < seq_db.round_trips
+
+    @pytest.mark.asyncio
+    async def test_dispatch_runs_the_chain_iteratively(self):
+        dispatcher, db, redis = _make_dispatcher()
+
+        result = await dispatcher.dispatch(
+            LoopEvent.create(incident_id="inc_900", tenant_id="t0", stage=LoopStage.INCIDENT_CREATED, details={"n": 0})
+        )
+
+        assert result.stage == LoopStage.ROUTING_ADJUSTED and result.is_success
+        status = await dispatcher.get_loop_status("inc_900")
+        assert status.is_complete
+        assert dispatcher._processed_events == {"inc_900:routing_adjusted"}
+        assert len(redis.published) == 5
+
+
+class TestBatchSteps:
+    @pytest.mark.asyncio
+    async def test_db_idempotency_fails_open(self):
+        dispatcher = IntegrationDispatcher(FakeRedis(), None, config=DispatcherConfig())
+
+        assert await dispatcher._check_db_idempotency_many([("inc_1", LoopStage.INCIDENT_CREATED)]) == set()
+
+    @pytest.mark.asyncio
+    async def test_unserializable_event_fails_alone(self):
+        dispatcher, db, _ = _make_dispatcher()
+        bad = LoopEvent.create(
+            incident_id="inc_1", tenant_id="t0", stage=LoopStage.POLICY_GENERATED, details={"x": object()}
+        )
+        good = LoopEvent.create(incident_id="inc_2", tenant_id="t0", stage=LoopStage.POLICY_GENERATED, details={"n": 0})
+
+        bad_result, good_result = await dispatcher.dispatch_many([bad, good])
+
+        assert bad_result.failure_state == LoopFailureState.ERROR
+        assert good_result.is_success and good_result.stage == LoopStage.ROUTING_ADJUSTED
+        assert {row["incident_id"] for row in db.events.values()} == {"inc_2"}
+        with pytest.raises(TypeError):
+            await dispatcher._persist_event(bad)
+
+    @pytest.mark.asyncio
+    async def test_disabled_dispatcher_returns_events(self):
+        dispatcher = IntegrationDispatcher(FakeRedis(), None, config=DispatcherConfig(enabled=False))
+        events = _burst(3)
+
+        assert await dispatcher.dispatch_many(events) == events
+
+
+class TestDispatchCoalescer:
+    @pytest.mark.asyncio
+    async def test_concurrent_dispatches_share_one_batch(self):
+        burst = _burst(12)
+
+        sequential, seq_db, seq_redis = _make_dispatcher()
+        seq_results = [await sequential.dispatch(event) for event in _clone(burst)]
+
+        coalesced, db, redis = _make_dispatcher()
+        batches = []
+        dispatch_many = coalesced.dispatch_many
+
+        async def recording_dispatch_many(events):
+            batches.append(len(events))
+            return await dispatch_many(events)
+
+        coalesced.dispatch_many = recording_dispatch_many
+        coalescer = DispatchCoalescer(coalesced)
+        results = await asyncio.gather(*(coalescer.dispatch(event) for event in _clone(burst)))
+
+        assert batches == [len(burst)]
+        assert _snapshot(coalesced, db, redis, results) == _snapshot(sequential, seq_db, seq_redis, seq_results)
+
+    @pytest.mark.asyncio
+    async def test_max_batch_splits_a_burst(self):
+        dispatcher, _, _ = _make_dispatcher()
+        dispatcher.config.coalesce_max_batch = 5
+        batches = []
+        dispatch_many = dispatcher.dispatch_many
+
+        async def recording_dispatch_many(events):
+            batches.append(len(events))
+            return await dispatch_many(events)
+
+        dispatcher.dispatch_many = recording_dispatch_many
+        coalescer = DispatchCoalescer(dispatcher)
+        await asyncio.gather(*(coalescer.dispatch(event) for event in _burst(7)))  # 12 events
+
+        assert batches == [5, 5, 2]
+
+    @pytest.mark.asyncio
+    async def test_batch_failure_reaches_every_caller(self):
+        dispatcher, _, _ = _make_dispatcher()
+
+        async def failing_dispatch_many(events):
+            raise RuntimeError("database unavailable")
+
+        dispatcher.dispatch_many = failing_dispatch_many
+        coalescer = DispatchCoalescer(dispatcher)
+        outcomes = await asyncio.gather(
+            *(coalescer.dispatch(event) for event in _burst(3)),
+            return_exceptions=True,
+        )
+
+        assert [str(outcome) for outcome in outcomes] == ["database unavailable"] * len(outcomes)
@@ -0,0 +1,428 @@
+"""
+M27 Cost Snapshot Computation Tests
+===================================
+
+Snapshot computation on the HOC path (cost_snapshots_driver L6,
+cost_snapshots_engine L5, SnapshotScheduler L4):
+- One GROUPING SETS scan per hourly window, mapped back to entities
+- Daily windows and baselines read cost_hourly_rollups
+- Baselines are loaded once per snapshot; aggregates and baselines are
+  written with one batched statement each
+- The scheduler runs tenants concurrently, bounded, with a session each
+- Anomaly evaluation matches the per-row path, written in bulk
+
+Uses a scripted fake AsyncSession (GROUPING SETS needs Postgres).
+"""
+
+import asyncio
+import hashlib
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.hoc.cus.analytics.L5_engines.cost_snapshots_engine import (
+    BaselineComputer,
+    SnapshotAnomalyDetector,
+    SnapshotComputer,
+    run_hourly_snapshot_job,
+)
+from app.hoc.cus.analytics.L5_schemas.cost_snapshot_schemas import (
+    SEVERITY_THRESHOLDS,
+    AnomalyEvaluation,
+    EntityType,
+    SnapshotStatus,
+)
+from app.hoc.cus.analytics.L6_drivers.cost_snapshots_driver import get_cost_snapshots_driver
+from app.hoc.cus.hoc_spine.orchestrator import operation_registry
+from app.hoc.cus.hoc_spine.orchestrator.coordinators.snapshot_scheduler import SnapshotScheduler
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return list(self._rows)
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakeSession:
+    """Records statements; answers SELECTs from (sql fragment -> rows) routes."""
+
+    def __init__(self, routes=None):
+        self.routes = routes or {}
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.statements.append((sql, params))
+        for fragment, rows in self.routes.items():
+            if fragment in sql:
+                return _Result(rows)
+        return _Result([])
+
+    async def commit(self):
+        self.commits += 1
+
+    def matching(self, fragment):
+        return [(sql, params) for sql, params in self.statements if fragment in sql]
+
+
+def _computer(session):
+    return SnapshotComputer(get_cost_snapshots_driver(session))
+
+
+def _detector(session):
+    return SnapshotAnomalyDetector(get_cost_snapshots_driver(session))
+
+
+def _grouping_row(grouping_set, cost, count, user_id=None, feature_tag=None, model=None):
+    return SimpleNamespace(
+        grouping_set=grouping_set,
+        user_id=user_id,
+        feature_tag=feature_tag,
+        model=model,
+        total_cost=cost,
+        request_count=count,
+        input_tokens=count * 10,
+        output_tokens=count * 5,
+    )
+
+
+GROUPING_ROWS = [
+    _grouping_row(7, 100.0, 10),
+    _grouping_row(3, 60.0, 6, user_id="u1"),
+    _grouping_row(3, 40.0, 4, user_id=None),  # NULL-user group: dropped
+    _grouping_row(5, 70.0, 7, feature_tag="chat"),
+    _grouping_row(5, 30.0, 3, feature_tag=None),  # NULL-feature group: dropped
+    _grouping_row(6, 100.0, 10, model="gpt-4o"),
+]
+
+
+def _baseline_row(entity_type, entity_id, avg):
+    return SimpleNamespace(
+        id=f"base_{entity_type}",
+        tenant_id="t1",
+        entity_type=entity_type,
+        entity_id=entity_id,
+        avg_daily_cost_cents=avg,
+        stddev_daily_cost_cents=None,
+        avg_daily_requests=10.0,
+        max_daily_cost_cents=None,
+        min_daily_cost_cents=None,
+        window_days=7,
+        samples_count=7,
+        computed_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        valid_until=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        is_current=True,
+        last_snapshot_id=None,
+    )
+
+
+class TestSnapshotComputer:
+    @pytest.mark.asyncio
+    async def test_hourly_snapshot_single_grouping_sets_scan(self):
+        session = _FakeSession({"GROUPING SETS": GROUPING_ROWS})
+
+        snapshot = await _computer(session).compute_hourly_snapshot(
+            "t1", hour=datetime(2026, 1, 1, 10, tzinfo=timezone.utc)
+        )
+
+        assert snapshot.status == SnapshotStatus.COMPLETE
+        assert len(session.matching("FROM cost_records")) == 1
+        assert session.matching("cost_hourly_rollups") == []
+        assert len(session.matching("FROM cost_snapshot_baselines")) == 1
+
+        inserts = session.matching("INSERT INTO cost_snapshot_aggregates")
+        assert len(inserts) == 1
+        rows = inserts[0][1]
+        assert [(r["entity_type"], r["entity_id"]) for r in rows] == [
+            ("tenant", None),
+            ("user", "u1"),
+            ("feature", "chat"),
+            ("model", "gpt-4o"),
+        ]
+        assert snapshot.records_processed == 10 + 6 + 7 + 10
+        # L6 does not commit; the L4 caller owns the transaction
+        assert session.commits == 0
+
+    @pytest.mark.asyncio
+    async def test_empty_window_has_no_tenant_row(self):
+        session = _FakeSession({"GROUPING SETS": [_grouping_row(7, 0, 0)]})
+
+        aggregates = await get_cost_snapshots_driver(session).aggregate_cost_records(
+            "t1", "snap", datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 2, tzinfo=timezone.utc)
+        )
+
+        assert aggregates == []
+
+    @pytest.mark.asyncio
+    async def test_daily_snapshot_reads_rollups_and_bulk_baselines(self, monkeypatch):
+        monkeypatch.setenv("COST_SNAPSHOT_USE_ROLLUPS", "true")
+        rollup_rows = [
+            SimpleNamespace(
+                entity_type="tenant", entity_id=None, total_cost=500.0, request_count=50, input_tokens=500, output_tokens=250
+            ),
+            SimpleNamespace(
+                entity_type="user", entity_id="u1", total_cost=200.0, request_count=20, input_tokens=1, output_tokens=1
+            ),
+            # NULL-model records: entity_key '' in the rollup reads back as NULL
+            SimpleNamespace(
+                entity_type="model", entity_id=None, total_cost=50.0, request_count=5, input_tokens=1, output_tokens=1
+            ),
+        ]
+        session = _FakeSession(
+            {
+                "FROM cost_hourly_rollups": rollup_rows,
+                "FROM cost_snapshot_baselines": [
+                    _baseline_row("tenant", None, 100.0),
+                    _baseline_row("model", None, 25.0),
+                ],
+            }
+        )
+
+        snapshot = await _computer(session).compute_daily_snapshot("t1", date=datetime(2026, 1, 1))
+
+        assert snapshot.status == SnapshotStatus.COMPLETE
+        assert session.matching("FROM cost_records") == []
+        ((rollup_sql, _),) = session.matching("FROM cost_hourly_rollups")
+        assert "NULLIF(entity_key, '')" in rollup_sql
+        assert len(session.matching("FROM cost_snapshot_baselines")) == 1
+
+        ((_, rows),) = session.matching("INSERT INTO cost_snapshot_aggregates")
+        deviations = {(r["entity_type"], r["entity_id"]): r["deviation_from_7d_pct"] for r in rows}
+        assert deviations[("tenant", None)] == pytest.approx(400.0)
+        assert deviations[("model", None)] == pytest.approx(100.0)
+        assert deviations[("user", "u1")] is None
+
+    @pytest.mark.asyncio
+    async def test_daily_snapshot_raw_scan_when_rollups_disabled(self, monkeypatch):
+        monkeypatch.setenv("COST_SNAPSHOT_USE_ROLLUPS", "false")
+        session = _FakeSession({"GROUPING SETS": GROUPING_ROWS})
+
+        snapshot = await _computer(session).compute_daily_snapshot("t1", date=datetime(2026, 1, 1))
+
+        assert snapshot.status == SnapshotStatus.COMPLETE
+        assert len(session.matching("GROUPING SETS")) == 1
+        assert session.matching("cost_hourly_rollups") == []
+
+
+class TestBaselineComputer:
+    @pytest.mark.asyncio
+    async def test_baselines_from_rollups_batched(self, monkeypatch):
+        monkeypatch.setenv("COST_SNAPSHOT_USE_ROLLUPS", "true")
+        stats = [
+            SimpleNamespace(
+                entity_type=t,
+                entity_id=e,
+                avg_cost=10.0,
+                stddev_cost=1.0,
+                avg_requests=2.0,
+                max_cost=12.0,
+                min_cost=8.0,
+                samples=7,
+                last_snapshot="snap_last",
+            )
+            for t, e in [("tenant", None), ("user", "u1"), ("model", "gpt-4o")]
+        ]
+        session = _FakeSession({"WITH daily AS": stats})
+
+        baselines = await BaselineComputer(get_cost_snapshots_driver(session)).compute_baselines("t1")
+
+        assert [b.entity_type for b in baselines] == [EntityType.TENANT, EntityType.USER, EntityType.MODEL]
+        assert all(b.last_snapshot_id == "snap_last" for b in baselines)
+        assert session.matching("cost_snapshot_aggregates") == []
+        ((_, rows),) = session.matching("INSERT INTO cost_snapshot_baselines")
+        assert len(rows) == 3
+        ((_, updates),) = session.matching("UPDATE cost_snapshot_baselines")
+        assert len(updates) == 3
+
+
+class TestSnapshotJobs:
+    @pytest.mark.asyncio
+    async def test_serial_on_callers_driver(self):
+        session = _FakeSession({"GROUPING SETS": GROUPING_ROWS})
+
+        results = await SnapshotScheduler().run_hourly(get_cost_snapshots_driver(session), ["t1", "t2"])
+
+        assert results == {"success": ["t1", "t2"], "failed": []}
+        assert len(session.matching("GROUPING SETS")) == 2
+
+    @pytest.mark.asyncio
+    async def test_engine_job_takes_a_driver(self):
+        session = _FakeSession({"GROUPING SETS": GROUPING_ROWS})
+
+        results = await run_hourly_snapshot_job(get_cost_snapshots_driver(session), ["t1"])
+
+        assert results == {"success": ["t1"], "failed": []}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_tenants_bounded_and_committed(self, monkeypatch):
+        active = 0
+        peak = 0
+        sessions = []
+
+        class _SlowSession(_FakeSession):
+            async def execute(self, statement, params=None):
+                nonlocal active, peak
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+                return await super().execute(statement, params)
+
+        @asynccontextmanager
+        async def session_context():
+            s = _SlowSession({"GROUPING SETS": GROUPING_ROWS})
+            sessions.append(s)
+            yield s
+
+        monkeypatch.setattr(operation_registry, "get_async_session_context", session_context)
+        tenants = [f"t{i}" for i in range(10)]
+
+        results = await SnapshotScheduler().run_hourly(None, tenants, max_concurrency=3)
+
+        assert results == {"success": tenants, "failed": []}
+        assert len(sessions) == 10
+        assert all(s.commits == 1 for s in sessions)
+        assert 1 < peak <= 3
+
+    @pytest.mark.asyncio
+    async def test_tenant_session_failure_is_reported(self, monkeypatch):
+        @asynccontextmanager
+        async def session_context():
+            raise ConnectionError("database unavailable")
+            yield
+
+        monkeypatch.setattr(operation_registry, "get_async_session_context", session_context)
+
+        results = await SnapshotScheduler().run_daily(None, ["t1"])
+
+        assert results["snapshots"] == []
+        assert results["failed"] == [{"tenant_id": "t1", "error": "database unavailable"}]
+
+
+def _per_row_evaluations(snapshot_id, rows, threshold_pct):
+    """Reference: the original row-at-a-time evaluation loop."""
+    evaluations = []
+    for row in rows:
+        deviation = row.deviation_from_7d_pct or 0
+        triggered = deviation >= threshold_pct
+        severity = None
+        if triggered:
+            if deviation >= SEVERITY_THRESHOLDS["critical"]:
+                severity = "critical"
+            elif deviation >= SEVERITY_THRESHOLDS["high"]:
+                severity = "high"
+            elif deviation >= SEVERITY_THRESHOLDS["medium"]:
+                severity = "medium"
+            else:
+                severity = "low"
+        eval_id = f"eval_{hashlib.sha256(f'{snapshot_id}:{row.entity_type}:{row.entity_id}'.encode()).hexdigest()[:16]}"
+        evaluation = AnomalyEvaluation(
+            id=eval_id,
+            tenant_id=row.tenant_id,
+            snapshot_id=snapshot_id,
+            entity_type=EntityType(row.entity_type),
+            entity_id=row.entity_id,
+            current_value_cents=row.total_cost_cents,
+            baseline_value_cents=row.baseline_7d_avg_cents,
+            threshold_pct=threshold_pct,
+            deviation_pct=deviation,
+            triggered=triggered,
+            severity_computed=severity,
+            evaluation_reason=f"{'TRIGGERED' if triggered else 'OK'}: {deviation:.1f}% deviation (threshold: {threshold_pct}%)",
+        )
+        if triggered:
+            evaluation.anomaly_id = f"anom_{hashlib.sha256(f'{evaluation.id}'.encode()).hexdigest()[:16]}"
+        evaluations.append(evaluation)
+    return evaluations
+
+
+def _aggregate_rows(count, seed):
+    rng = random.Random(seed)
+    entities = ["tenant", "user", "feature", "model"]
+    rows = []
+    for i in range(count):
+        entity_type = entities[i % 4]
+        deviation = (
+            rng.choice([None, 0, 199.99, 200, 300, 400, 500, 1e4, -50.0]) if i % 5 == 0 else rng.uniform(-90, 900)
+        )
+        rows.append(
+            SimpleNamespace(
+                tenant_id="t1",
+                entity_type=entity_type,
+                entity_id=None if entity_type == "tenant" else f"{entity_type}_{i}",
+                total_cost_cents=rng.uniform(1, 1e5),
+                baseline_7d_avg_cents=rng.uniform(1, 1e4),
+                deviation_from_7d_pct=deviation,
+            )
+        )
+    return rows
+
+
+def _comparable(evaluation):
+    fields = dict(vars(evaluation))
+    fields.pop("evaluated_at")
+    return fields
+
+
+class TestSnapshotAnomalyDetector:
+    def _session(self, rows):
+        snapshot_row = SimpleNamespace(
+            id="snap_1",
+            tenant_id="t1",
+            snapshot_type="daily",
+            period_start=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            period_end=datetime(2026, 1, 2, tzinfo=timezone.utc),
+            status="complete",
+            version=1,
+            records_processed=10,
+            computation_ms=5,
+            completed_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        )
+        return _FakeSession({"FROM cost_snapshots": [snapshot_row], "FROM cost_snapshot_aggregates": rows})
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("threshold_pct", [200, 150.5, 600])
+    async def test_matches_per_row_path(self, threshold_pct):
+        rows = _aggregate_rows(2000, seed=int(threshold_pct))
+        session = self._session(rows)
+
+        evaluations = await _detector(session).evaluate_snapshot("snap_1", threshold_pct=threshold_pct)
+
+        expected = _per_row_evaluations("snap_1", rows, threshold_pct)
+        assert [_comparable(e) for e in evaluations] == [_comparable(e) for e in expected]
+        assert all(type(e.triggered) is bool for e in evaluations)
+
+    @pytest.mark.asyncio
+    async def test_writes_are_batched(self):
+        rows = _aggregate_rows(500, seed=7)
+        session = self._session(rows)
+
+        evaluations = await _detector(session).evaluate_snapshot("snap_1")
+
+        ((_, evaluation_params),) = session.matching("INSERT INTO cost_anomaly_evaluations")
+        ((_, anomaly_params),) = session.matching("INSERT INTO cost_anomalies")
+        triggered = [e for e in evaluations if e.triggered]
+        assert len(evaluation_params) == 500
+        assert [p["id"] for p in anomaly_params] == [e.anomaly_id for e in triggered]
+        # Audit rows reference the anomaly they raised
+        assert [p["anomaly_id"] for p in evaluation_params] == [e.anomaly_id for e in evaluations]
+        # Anomalies are written before the evaluations that reference them
+        inserts = [sql for sql, _ in session.statements if "INSERT" in sql]
+        assert "cost_anomalies" in inserts[0] and "cost_anomaly_evaluations" in inserts[1]
+        assert session.commits == 0
+
+    @pytest.mark.asyncio
+    async def test_incomplete_snapshot_not_evaluated(self):
+        session = _FakeSession({"FROM cost_snapshots": []})
+
+        assert await _detector(session).evaluate_snapshot("missing") == []
+        assert session.matching("cost_snapshot_aggregates") == []
@@ -0,0 +1,294 @@
+# Layer: Test
+# AUDIENCE: INTERNAL
+# Role: Concurrent channel fan-out, notification outbox and delivery worker
+
+"""
+Notification Outbox Tests
+
+- send() fans channels out concurrently under per-channel limits and timeouts
+- enqueue() writes one outbox row per target channel, without committing
+- NotifyOutboxWorker coalesces bursts, retries with backoff, dead-letters
+"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.hoc.cus.integrations.L5_notifications.engines.channel_engine import (
+    NotifyChannel,
+    NotifyChannelService,
+    NotifyDeliveryResult,
+    NotifyEventType,
+    NotifyOutboxWorker,
+)
+
+T0 = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+class RecordingSession:
+    """AsyncSession stand-in that records statements and returns canned claim rows."""
+
+    def __init__(self, log, claim_rows=(), pending=0):
+        self.log = log
+        self._claim_rows = list(claim_rows)
+        self._pending = pending
+
+    async def execute(self, statement, params=None):
+        self.log.append((" ".join(str(statement).split()), params))
+        result = MagicMock()
+        result.mappings.return_value.all.return_value = self._claim_rows
+        result.scalar.return_value = self._pending
+        return result
+
+    async def commit(self):
+        self.log.append(("COMMIT", None))
+
+
+def session_factory(log, claim_rows=(), pending=0):
+    @asynccontextmanager
+    async def factory():
+        yield RecordingSession(log, claim_rows, pending)
+
+    return factory
+
+
+def _row(row_id, channel="webhook", tenant_id="t1", attempts=0, seconds=0, event="incident_created", config=None):
+    return {
+        "id": row_id,
+        "tenant_id": tenant_id,
+        "channel": channel,
+        "event_type": event,
+        "payload": {"incident_id": f"inc-{row_id}"},
+        "channel_config": config,
+        "attempts": attempts,
+        "created_at": T0 + timedelta(seconds=seconds),
+    }
+
+
+def _service():
+    service = NotifyChannelService()
+    service.configure_channel("t1", NotifyChannel.WEBHOOK, webhook_url="https://example.com/hook")
+    service.configure_channel("t1", NotifyChannel.SLACK, slack_webhook_url="https://hooks.slack.com/x")
+    service.configure_channel("t1", NotifyChannel.UI)
+    return service
+
+
+def _updates(log, verb):
+    return [(sql, params) for sql, params in log if sql.startswith("UPDATE") and verb in sql]
+
+
+class TestConcurrentSend:
+    @pytest.mark.asyncio
+    async def test_slow_channel_does_not_delay_others(self, monkeypatch):
+        service = _service()
+        finished = {}
+
+        async def slow_webhook(config, event_type, payload, start_time):
+            await asyncio.sleep(0.3)
+            finished["webhook"] = time.perf_counter()
+            return NotifyDeliveryResult(NotifyChannel.WEBHOOK, event_type, True, datetime.now(timezone.utc))
+
+        async def slack(config, event_type, payload, start_time):
+            finished["slack"] = time.perf_counter()
+            return NotifyDeliveryResult(NotifyChannel.SLACK, event_type, True, datetime.now(timezone.utc))
+
+        monkeypatch.setattr(service, "_send_webhook_notification", slow_webhook)
+        monkeypatch.setattr(service, "_send_slack_notification", slack)
+
+        started = time.perf_counter()
+        results = await service.send("t1", NotifyEventType.INCIDENT_CREATED, {"incident_id": "inc-1"})
+
+        assert [r.channel for r in results] == [NotifyChannel.WEBHOOK, NotifyChannel.SLACK, NotifyChannel.UI]
+        assert all(r.success for r in results)
+        assert finished["slack"] - started < 0.1
+        assert len(service.get_delivery_history("t1")) == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_fails_only_that_channel(self, monkeypatch):
+        service = _service()
+        service.get_channel_config("t1", NotifyChannel.WEBHOOK).timeout_seconds = 0.05
+
+        async def hung_webhook(config, event_type, payload, start_time):
+            await asyncio.sleep(10)
+
+        monkeypatch.setattr(service, "_send_webhook_notification", hung_webhook)
+
+        results = await service.send("t1", NotifyEventType.INCIDENT_CREATED, {})
+
+        by_channel = {r.channel: r for r in results}
+        assert not by_channel[NotifyChannel.WEBHOOK].success
+        assert "Timed out" in by_channel[NotifyChannel.WEBHOOK].error_message
+        assert by_channel[NotifyChannel.SLACK].success
+        assert service.get_channel_config("t1", NotifyChannel.WEBHOOK).failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_per_channel_concurrency_limit(self, monkeypatch):
+        service = NotifyChannelService(channel_concurrency=2)
+        service.configure_channel("t1", NotifyChannel.WEBHOOK, webhook_url="https://example.com/hook")
+        in_flight = peak = 0
+
+        async def webhook(config, event_type, payload, start_time):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return NotifyDeliveryResult(NotifyChannel.WEBHOOK, event_type, True, datetime.now(timezone.utc))
+
+        monkeypatch.setattr(service, "_send_webhook_notification", webhook)
+
+        await asyncio.gather(
+            *(service.send("t1", NotifyEventType.ALERT_BREACH, {}, [NotifyChannel.WEBHOOK]) for _ in range(6))
+        )
+
+        assert peak == 2
+
+
+class TestEnqueue:
+    @pytest.mark.asyncio
+    async def test_one_row_per_target_channel_without_commit(self):
+        service = _service()
+        service.disable_channel("t1", NotifyChannel.SLACK)
+        log = []
+
+        written = await service.enqueue(
+            RecordingSession(log), "t1", NotifyEventType.INCIDENT_CREATED, {"incident_id": "inc-1"}
+        )
+
+        assert written == 2
+        sql, params = log[0]
+        assert sql.startswith("INSERT INTO notification_outbox")
+        assert [p["channel"] for p in params] == ["webhook", "ui"]
+        assert json.loads(params[0]["payload"]) == {"incident_id": "inc-1"}
+        assert json.loads(params[0]["channel_config"])["webhook_url"] == "https://example.com/hook"
+        assert ("COMMIT", None) not in log
+
+    @pytest.mark.asyncio
+    async def test_no_targets_writes_nothing(self):
+        service = _service()
+        log = []
+
+        written = await service.enqueue(
+            RecordingSession(log), "t1", NotifyEventType.INCIDENT_CREATED, {}, [NotifyChannel.EMAIL]
+        )
+
+        assert written == 0
+        assert log == []
+
+
+class TestOutboxWorker:
+    @pytest.mark.asyncio
+    async def test_burst_is_coalesced_into_one_digest(self, monkeypatch):
+        service = _service()
+        sent = []
+
+        async def webhook(config, event_type, payload, start_time):
+            sent.append(payload)
+            return NotifyDeliveryResult(NotifyChannel.WEBHOOK, event_type, True, datetime.now(timezone.utc))
+
+        monkeypatch.setattr(service, "_send_webhook_notification", webhook)
+        log = []
+        rows = [_row(3, seconds=2), _row(1), _row(2, seconds=1), _row(4, channel="slack")]
+        worker = NotifyOutboxWorker(service, session_factory(log, rows, pending=0))
+
+        counts = await worker.run_once(now=T0 + timedelta(seconds=5))
+
+        assert counts == {"claimed": 4, "delivered": 4, "retried": 0, "dead": 0, "deferred": 0}
+        assert len(sent) == 1
+        assert sent[0]["digest"] is True and sent[0]["count"] == 3
+        assert [n["payload"]["incident_id"] for n in sent[0]["notifications"]] == ["inc-1", "inc-2", "inc-3"]
+        ((sql, params),) = _updates(log, "status = 'delivered'")
+        assert sorted(params["ids"]) == [1, 2, 3, 4]
+        # Claim is committed before delivery, outcomes after
+        assert [entry for entry in log if entry[0] == "COMMIT"] == [("COMMIT", None)] * 2
+
+    @pytest.mark.asyncio
+    async def test_rows_within_window_are_deferred(self):
+        service = _service()
+        log = []
+        worker = NotifyOutboxWorker(service, session_factory(log, [_row(1)]), coalesce_window_seconds=30)
+        await worker.run_once(now=T0)
+
+        log.clear()
+        worker._session_factory = session_factory(log, [_row(2, seconds=5), _row(3, seconds=6)])
+        counts = await worker.run_once(now=T0 + timedelta(seconds=10))
+
+        assert counts["deferred"] == 2 and counts["delivered"] == 0
+        ((sql, params),) = _updates(log, "SET next_attempt_at = :next_attempt_at")
+        assert "attempts" not in sql
+        assert params["next_attempt_at"] == T0 + timedelta(seconds=30)
+
+    @pytest.mark.asyncio
+    async def test_failure_backs_off_then_dead_letters(self, monkeypatch):
+        service = _service()
+        config = service.get_channel_config("t1", NotifyChannel.WEBHOOK)
+        config.retry_count = 2
+
+        async def failing(config, event_type, payload, start_time):
+            raise ConnectionError("connection refused")
+
+        monkeypatch.setattr(service, "_send_webhook_notification", failing)
+        now = T0 + timedelta(minutes=5)
+
+        log = []
+        counts = await NotifyOutboxWorker(service, session_factory(log, [_row(1, attempts=1)])).run_once(now=now)
+        assert counts["retried"] == 1
+        ((sql, params),) = _updates(log, "attempts = attempts + 1, next_attempt_at")
+        assert params["next_attempt_at"] == now + timedelta(seconds=config.retry_delay_seconds * 2)
+        assert params["error"] == "connection refused"
+
+        log = []
+        counts = await NotifyOutboxWorker(service, session_factory(log, [_row(1, attempts=2)])).run_once(now=now)
+        assert counts["dead"] == 1
+        ((sql, params),) = _updates(log, "status = 'dead'")
+        assert params["ids"] == [1]
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_channel_is_dead_lettered(self):
+        log = []
+        worker = NotifyOutboxWorker(_service(), session_factory(log, [_row(1, channel="pagerduty")]))
+
+        counts = await worker.run_once(now=T0)
+
+        assert counts["dead"] == 1
+        ((sql, params),) = _updates(log, "status = 'dead'")
+        assert "not configured" in params["error"]
+
+    @pytest.mark.asyncio
+    async def test_row_delivered_by_process_without_the_config(self, monkeypatch):
+        enqueuer, log = _service(), []
+        await enqueuer.enqueue(
+            RecordingSession(log), "t1", NotifyEventType.INCIDENT_CREATED, {}, [NotifyChannel.WEBHOOK]
+        )
+        stored = json.loads(log[0][1][0]["channel_config"])
+
+        # Another pod (or this one after a restart) holds no channel configs
+        worker_service, urls = NotifyChannelService(), []
+
+        async def webhook(config, event_type, payload, start_time):
+            urls.append(config.webhook_url)
+            return NotifyDeliveryResult(NotifyChannel.WEBHOOK, event_type, True, datetime.now(timezone.utc))
+
+        monkeypatch.setattr(worker_service, "_send_webhook_notification", webhook)
+        log = []
+        worker = NotifyOutboxWorker(worker_service, session_factory(log, [_row(1, config=stored)]))
+
+        counts = await worker.run_once(now=T0)
+
+        assert counts["delivered"] == 1
+        assert urls == ["https://example.com/hook"]
+
+    @pytest.mark.asyncio
+    async def test_depth_gauge_updated(self):
+        from app.hoc.cus.integrations.L5_notifications.engines.channel_engine import NOTIFY_OUTBOX_DEPTH
+
+        log = []
+        await NotifyOutboxWorker(_service(), session_factory(log, [], pending=17)).run_once(now=T0)
+
+        assert NOTIFY_OUTBOX_DEPTH._value.get() == 17
+        assert any(sql.startswith("SELECT COUNT(*) FROM notification_outbox") for sql, _ in log)
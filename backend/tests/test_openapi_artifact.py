@@ -0,0 +1,140 @@
+# Layer: L8 — Catalyst / Meta
+# Product: system-wide
+# Temporal:
+#   Trigger: CI / pytest
+#   Execution: sync
+# Role: Parity check between the prebuilt OpenAPI artifact and live routes
+# Reference: PIN-443, PIN-444
+
+"""
+Prebuilt OpenAPI artifact tests.
+
+The committed app/openapi_schema.json must match what the live app would
+generate; if these fail, rebuild it:
+
+    python scripts/build_openapi_artifact.py
+
+Also covers the fallback rules in load_artifact() and the startup profiler.
+"""
+
+import json
+import sys
+
+import pytest
+from fastapi import FastAPI
+
+from app.startup import openapi_artifact, profiler
+
+
+@pytest.fixture(scope="module")
+def live_app():
+    from app.main import app
+
+    return app
+
+
+@pytest.fixture(scope="module")
+def committed():
+    return json.loads(openapi_artifact.ARTIFACT_PATH.read_text())
+
+
+class TestArtifactParity:
+    def test_route_fingerprint_matches_live_routes(self, live_app, committed):
+        assert committed["route_fingerprint"] == openapi_artifact.route_fingerprint(
+            live_app
+        ), "Routes changed since the OpenAPI artifact was built. Run: python scripts/build_openapi_artifact.py"
+        assert committed["app_version"] == live_app.version
+
+    def test_schema_matches_live_generation(self, live_app, committed):
+        live = openapi_artifact.generate_schema(live_app)
+
+        assert sorted(committed["schema"]["paths"]) == sorted(live["paths"])
+        assert committed["schema"] == live, (
+            "Response models changed since the OpenAPI artifact was built. "
+            "Run: python scripts/build_openapi_artifact.py"
+        )
+
+    def test_app_serves_the_artifact(self, live_app, committed):
+        from app.main import custom_openapi
+
+        live_app.openapi_schema = None
+        try:
+            assert custom_openapi() == committed["schema"]
+        finally:
+            live_app.openapi_schema = None
+
+
+def _toy_app(*paths) -> FastAPI:
+    app = FastAPI(title="toy", version="1.0")
+    for path in paths:
+        app.add_api_route(path, lambda: {}, methods=["GET"], name=path.strip("/") or "root")
+    return app
+
+
+class TestLoadArtifact:
+    def test_round_trip(self, tmp_path):
+        app = _toy_app("/a", "/b")
+        path = tmp_path / "schema.json"
+        built = openapi_artifact.build_artifact(app, path)
+
+        assert openapi_artifact.load_artifact(app, path) == built["schema"]
+
+    def test_fingerprint_ignores_route_order(self):
+        assert openapi_artifact.route_fingerprint(_toy_app("/a", "/b")) == openapi_artifact.route_fingerprint(
+            _toy_app("/b", "/a")
+        )
+
+    def test_stale_artifact_is_rejected(self, tmp_path):
+        path = tmp_path / "schema.json"
+        openapi_artifact.build_artifact(_toy_app("/a"), path)
+
+        assert openapi_artifact.load_artifact(_toy_app("/a", "/b"), path) is None
+
+    def test_version_mismatch_is_rejected(self, tmp_path):
+        path = tmp_path / "schema.json"
+        openapi_artifact.build_artifact(_toy_app("/a"), path)
+        app = _toy_app("/a")
+        app.version = "2.0"
+
+        assert openapi_artifact.load_artifact(app, path) is None
+
+    def test_missing_or_corrupt_artifact_falls_back(self, tmp_path):
+        app = _toy_app("/a")
+        assert openapi_artifact.load_artifact(app, tmp_path / "missing.json") is None
+
+        corrupt = tmp_path / "corrupt.json"
+        corrupt.write_text("{not json")
+        assert openapi_artifact.load_artifact(app, corrupt) is None
+
+
+class TestStartupProfiler:
+    def test_records_imports_and_phases(self, tmp_path, monkeypatch):
+        (tmp_path / "prof_outer.py").write_text("import prof_inner\nx = sum(range(10000))\n")
+        (tmp_path / "prof_inner.py").write_text("y = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        p = profiler.StartupProfiler()
+        p.install()
+        try:
+            import prof_outer  # noqa: F401
+        finally:
+            p.uninstall()
+            sys.modules.pop("prof_outer", None)
+            sys.modules.pop("prof_inner", None)
+        p.mark("imports")
+        p.mark("lifespan")
+
+        outer_cumulative, outer_self = p.imports["prof_outer"]
+        inner_cumulative, _ = p.imports["prof_inner"]
+        assert outer_cumulative >= inner_cumulative
+        assert outer_self == pytest.approx(outer_cumulative - inner_cumulative)
+
+        report = p.report()
+        assert [phase["phase"] for phase in report["phases"]] == ["imports", "lifespan"]
+        assert report["modules_imported"] == 2
+        assert report["slowest_cumulative"][0]["module"] == "prof_outer"
+        assert profiler._ImportTimer not in map(type, sys.meta_path)
+
+    def test_disabled_by_default(self):
+        assert profiler.emit_startup_report() is None
+        profiler.mark_startup_phase("noop")
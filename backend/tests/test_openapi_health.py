@@ -65,8 +65,11 @@ class TestOpenAPIGeneration:
         3. Binary search routers → endpoints → models
         4. Fix the recursive/union/default_factory pattern
         """
+        from app.main import custom_openapi
+
+        # Live generation, not the prebuilt artifact
         start = time.perf_counter()
-        schema = self.app.openapi()
+        schema = custom_openapi(use_artifact=False)
         duration = time.perf_counter() - start
 
         assert schema is not None, "OpenAPI schema generation returned None"
@@ -0,0 +1,169 @@
+# Layer: Test
+# AUDIENCE: INTERNAL
+# Role: Activity summaries from run_summary_buckets, and bucket check/repair
+
+"""
+Run Summary Bucket Tests
+
+- Migration 136 and RunSummaryDriver agree on the bucket key
+- ActivityReadDriver summaries sum run_summary_buckets, never v_runs_o2
+- RunSummaryDriver checks and repairs a day range, under a lock for repair
+"""
+
+import importlib.util
+from datetime import date, datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.hoc.cus.activity.L6_drivers.activity_read_driver import ActivityReadDriver
+from app.hoc.cus.activity.L6_drivers.run_summary_driver import (
+    BUCKET_DIMENSIONS,
+    RunSummaryDriver,
+)
+
+MIGRATION = Path(__file__).parent.parent / "alembic" / "versions" / "136_run_summary_buckets.py"
+
+
+def _load_migration():
+    spec = importlib.util.spec_from_file_location("run_summary_buckets_migration", MIGRATION)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class RecordingSession:
+    """AsyncSession stand-in that records statements and returns canned values."""
+
+    def __init__(self, scalar=0, rows=(), first=None):
+        self.statements: list[tuple[str, dict]] = []
+        self._scalar = scalar
+        self._rows = list(rows)
+        self._first = first
+
+    async def execute(self, statement, params=None):
+        self.statements.append((" ".join(str(statement).split()), dict(params or {})))
+        result = MagicMock()
+        result.scalar.return_value = self._scalar
+        result.mappings.return_value.all.return_value = self._rows
+        result.mappings.return_value.first.return_value = self._first
+        return result
+
+
+class TestBucketKey:
+    def test_migration_and_driver_share_dimensions(self):
+        migration = _load_migration()
+        assert migration.DIMENSIONS == BUCKET_DIMENSIONS
+
+    def test_update_trigger_moves_runs_between_buckets(self):
+        migration = _load_migration()
+        update_branch = migration.APPLY_FUNCTION_SQL.split("ELSE", 1)[1]
+        assert "1 AS delta FROM new_rows" in update_branch
+        assert "-1 AS delta FROM old_rows" in update_branch
+        # Net-zero updates (heartbeats) write nothing
+        assert "HAVING SUM(delta) <> 0" in update_branch
+
+    def test_every_summary_dimension_is_bucketed(self):
+        allowed = {
+            "risk_level", "latency_bucket", "evidence_health",
+            "integrity_status", "source", "provider_type", "status", "state",
+        }
+        assert allowed <= set(BUCKET_DIMENSIONS)
+
+
+class TestSummaryReads:
+    @pytest.mark.asyncio
+    async def test_status_summary_sums_buckets(self):
+        session = RecordingSession(rows=[{"status": "succeeded", "count": 7}])
+        rows = await ActivityReadDriver(session).fetch_status_summary(
+            "tenant_id = :tenant_id AND state = :state", {"tenant_id": "t1", "state": "LIVE"}
+        )
+
+        assert rows == [{"status": "succeeded", "count": 7}]
+        sql, params = session.statements[0]
+        assert "FROM run_summary_buckets" in sql
+        assert "v_runs_o2" not in sql
+        assert "SUM(run_count)" in sql
+        assert "HAVING SUM(run_count) > 0" in sql
+        assert params == {"tenant_id": "t1", "state": "LIVE"}
+
+    @pytest.mark.asyncio
+    async def test_metrics_attribute_runs_to_tenant_risk_type(self):
+        session = RecordingSession(first={"live_count": 3})
+        row = await ActivityReadDriver(session).fetch_metrics("tenant_id = :tenant_id", {"tenant_id": "t1"})
+
+        assert row == {"live_count": 3}
+        sql, _ = session.statements[0]
+        assert "FROM run_summary_buckets" in sql
+        assert "v_runs_o2" not in sql
+        assert "FROM limits WHERE tenant_id = :tenant_id" in sql
+        assert "(SELECT risk_type FROM tenant_risk) = 'COST'" in sql
+        assert "FILTER (WHERE state = 'LIVE')" in sql
+
+    @pytest.mark.asyncio
+    async def test_dimension_breakdown_sums_buckets(self):
+        session = RecordingSession(rows=[{"value": "NORMAL", "count": 4}])
+        rows = await ActivityReadDriver(session).fetch_dimension_breakdown(
+            "risk_level", "tenant_id = :tenant_id", {"tenant_id": "t1"}, 5
+        )
+
+        assert rows == [{"value": "NORMAL", "count": 4}]
+        sql, params = session.statements[0]
+        assert "FROM run_summary_buckets" in sql
+        assert "GROUP BY risk_level" in sql
+        assert params["limit"] == 5
+
+    @pytest.mark.asyncio
+    async def test_dimension_outside_allowlist_is_not_queried(self):
+        session = RecordingSession()
+        rows = await ActivityReadDriver(session).fetch_dimension_breakdown(
+            "run_count", "tenant_id = :tenant_id", {"tenant_id": "t1"}, 5
+        )
+
+        assert rows == []
+        assert session.statements == []
+
+
+class TestCheckAndRepair:
+    @pytest.mark.asyncio
+    async def test_check_compares_day_range_for_one_tenant(self):
+        drifted = {"tenant_id": "t1", "bucket_date": date(2026, 10, 17), "live_count": 3, "bucket_count": 2}
+        session = RecordingSession(rows=[drifted])
+
+        rows = await RunSummaryDriver(session).check_buckets(date(2026, 10, 17), "t1")
+
+        assert rows == [drifted]
+        assert len(session.statements) == 1
+        sql, params = session.statements[0]
+        assert "FULL OUTER JOIN stored" in sql
+        assert sql.count("AND tenant_id = :tenant_id") == 2
+        assert params == {
+            "since": date(2026, 10, 17),
+            "since_start": datetime(2026, 10, 17, tzinfo=timezone.utc),
+            "tenant_id": "t1",
+        }
+
+    @pytest.mark.asyncio
+    async def test_check_all_tenants(self):
+        session = RecordingSession()
+
+        await RunSummaryDriver(session).check_buckets(date(2026, 10, 17))
+
+        sql, params = session.statements[0]
+        assert ":tenant_id" not in sql
+        assert "tenant_id" not in params
+
+    @pytest.mark.asyncio
+    async def test_repair_locks_rewrites_and_prunes(self):
+        session = RecordingSession(scalar=4)
+
+        corrected = await RunSummaryDriver(session).repair_buckets(date(2026, 10, 17), "t1")
+
+        assert corrected == 4
+        lock, repair, prune = (sql for sql, _ in session.statements)
+        assert lock == "LOCK TABLE run_summary_buckets IN SHARE ROW EXCLUSIVE MODE"
+        assert "run_count = EXCLUDED.run_count" in repair
+        assert prune.startswith("DELETE FROM run_summary_buckets")
+        assert "run_count = 0" in prune
+        assert "tenant_id = :tenant_id" in prune